@@ -0,0 +1,104 @@
+''' A persistent on-disk cache for the tables built by WordGenerator.
+
+Each entry is a single uncompressed .npz file holding flattened int32 arrays so that a warm start
+only has to memory copy a handful of arrays rather than rediscover relators and rebuild machines. '''
+
+import hashlib
+import os
+
+import numpy as np
+
+from .extensions import FSM
+
+CACHE_VERSION = 2  # Bump this whenever the construction of any of the cached tables changes.
+
+def cache_key(*parts):
+    ''' Return a short, filename safe digest of parts. '''
+    return hashlib.sha1(repr((CACHE_VERSION,) + parts).encode()).hexdigest()
+
+def pack_FSM(name, machine):
+    ''' Return a dictionary of flat arrays describing the given FSM. '''
+    yield_state, yield_length, yield_letters = [], [], []
+    for state, yields in machine.yield_states.items():
+        for word in yields:  # Keep the order of yields since FirstInClass explores in this order.
+            yield_state.append(state)
+            yield_length.append(len(word))
+            yield_letters.extend(word)
+    
+    distance = np.full(len(machine.machine) // len(machine.alphabet), -1, dtype=np.int32)
+    for state, dist in machine.distance_to_yield.items():
+        distance[state] = dist
+    
+    return {
+        name + '.alphabet': np.array(machine.alphabet, dtype=np.int32),
+        name + '.machine': np.asarray(machine.machine, dtype=np.int32),
+        name + '.yield_state': np.array(yield_state, dtype=np.int32),
+        name + '.yield_length': np.array(yield_length, dtype=np.int32),
+        name + '.yield_letters': np.array(yield_letters, dtype=np.int32),
+        name + '.distance': distance,
+        }
+
+def unpack_FSM(name, arrays):
+    ''' Rebuild the FSM stored under name by pack_FSM. '''
+    yield_states = dict()
+    letters = arrays[name + '.yield_letters'].tolist()
+    start = 0
+    for state, length in zip(arrays[name + '.yield_state'].tolist(), arrays[name + '.yield_length'].tolist()):
+        yield_states.setdefault(state, []).append(tuple(letters[start:start+length]))
+        start += length
+    
+    distance_to_yield = dict((state, dist) for state, dist in enumerate(arrays[name + '.distance'].tolist()) if dist >= 0)
+    
+    return FSM(arrays[name + '.alphabet'].tolist(), arrays[name + '.machine'].tolist(), yield_states, distance_to_yield)
+
+def pack_suffix_tables(suffix_depth, first_child, sibling, last_children):
+    ''' Return a dictionary of flat arrays describing the suffix tree tables.
+    
+    Nodes (and siblings) are stored as rows of length suffix_depth padded with -1. '''
+    nodes = sorted(set(first_child).union(sibling), key=lambda node: (len(node), node))
+    
+    def pad(word):
+        return list(word) + [-1] * (suffix_depth - len(word))
+    
+    return {
+        'suffix.nodes': np.array([pad(node) for node in nodes], dtype=np.int32).reshape(-1, suffix_depth),
+        'suffix.first_child': np.array([first_child[node][0] if node in first_child else -1 for node in nodes], dtype=np.int32),
+        'suffix.sibling': np.array([pad(sibling.get(node, ())) for node in nodes], dtype=np.int32).reshape(-1, suffix_depth),
+        'suffix.has_sibling': np.array([node in sibling for node in nodes], dtype=np.int8),
+        'suffix.last_child': np.array([node in last_children for node in nodes], dtype=np.int8),
+        }
+
+def unpack_suffix_tables(arrays):
+    ''' Rebuild the first_child, sibling and last_children tables stored by pack_suffix_tables. '''
+    unpad = lambda row: tuple(letter for letter in row if letter >= 0)
+    
+    first_child, sibling, last_children = dict(), dict(), set()
+    rows = zip(arrays['suffix.nodes'].tolist(), arrays['suffix.first_child'].tolist(), arrays['suffix.sibling'].tolist(), arrays['suffix.has_sibling'].tolist(), arrays['suffix.last_child'].tolist())
+    for node, child, next_node, has_sibling, last_child in rows:
+        node = unpad(node)
+        if child >= 0: first_child[node] = (child,)
+        if has_sibling: sibling[node] = unpad(next_node)
+        if last_child: last_children.add(node)
+    
+    return first_child, sibling, last_children
+
+def load(path, key):
+    ''' Return the dictionary of arrays stored at path or None if it is missing or was stored under a different key. '''
+    if not os.path.isfile(path):
+        return None
+    
+    try:
+        with np.load(path) as data:
+            if str(data['key']) != key:
+                return None
+            return dict(data.items())
+    except (OSError, ValueError, KeyError):  # A partially written or otherwise corrupt file.
+        return None
+
+def save(path, key, arrays):
+    ''' Atomically store the dictionary of arrays at path under key. '''
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as handle:
+        np.savez(handle, key=np.array(key), **arrays)
+    os.replace(tmp_path, path)  # So concurrent runs never see a half written entry.
@@ -1,30 +1,123 @@
 
-from collections import namedtuple
+from collections import Counter, deque, namedtuple
+from contextlib import contextmanager, nullcontext
+from functools import reduce
 from glob import glob
-from multiprocessing import Pool, cpu_count
+from multiprocessing import Pipe, Pool, cpu_count
+from operator import mul
+from queue import Queue
 from types import SimpleNamespace
+import csv
+import json
 import os
-import shutil
+import signal
+import sys
+import time
+import traceback
 
 from contexttimer import Timer
 import curver
 import flipper
+import numpy as np
 import pandas as pd
 import snappy
 
+from . import storage
+from .census_index import CensusIndex
+from .store import PropertiesStore
 from .word_generator import WordGenerator
 
+Properties = namedtuple('Properties', ('hyperbolic', 'loadable', 'acceptable', 'volume', 'homology', 'tri_isosig', 'isom_sig', 'num_sym', 'ab_sym'))
+# How each column of the properties table is stored. Unknown hyperbolicity and symmetry groups not yet found are NaN.
+UNKNOWN = Properties(None, False, False, 0.0, 0, '', '', 0, 0)  # Of the words that ran out of time on the retry pass.
+PROPERTIES_DTYPES = dict(word='S', hyperbolic='float64', loadable='bool', acceptable='bool', volume='float64', homology='S', tri_isosig='S', isom_sig='S', num_sym='float64', ab_sym='S')
+
+# The invariants of a manifold that CensusGenerator.find is looking for. Torsion is the order of the torsion of its homology, or 0 if it has rank more than one.
+Target = namedtuple('Target', ('name', 'volume', 'homology', 'torsion', 'isom_sig'))
+
 def basic_filter(self, x): return True
 
-def count_lines(path):
-    with open(path) as handle:
-        return sum(1 for line in handle)
+def find_target(name):
+    ''' Return the Target of the SnapPy manifold with the given name. '''
+    M = snappy.Manifold(name)
+    homology = M.homology()
+    return Target(name, float(M.volume()), str(homology), reduce(mul, homology.coefficients[:-1], 1), str(M.isometry_signature()))
+
+class WordTimeout(Exception):
+    pass
+
+@contextmanager
+def time_limit(seconds):
+    ''' Raise a WordTimeout if the block takes more than seconds of wall-clock time, 0 for no limit.
+    
+    This uses SIGALRM so it only works in the main thread (as Pool workers are) and can only interrupt
+    SnapPy between calls into its kernel, such as in the randomize loop of load_bundle. It is the soft
+    limit: determine_properties_map kills the process of a word that is stuck inside a single call. '''
+    if seconds <= 0:
+        yield
+        return
+    
+    def handler(signum, frame):
+        raise WordTimeout()
+    
+    previous = signal.signal(signal.SIGALRM, handler)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+@contextmanager
+def timed(statistics, key):
+    ''' Add the number of seconds spent in the block to statistics[key]. '''
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        statistics[key] += time.perf_counter() - start
+
+def stage_statistics(stage, statistics):
+    ''' Return statistics with each key prefixed by the stage of the run that it comes from. '''
+    return dict((f'{stage}.{key}', value) for key, value in statistics.items())
+
+class Progress():
+    ''' Report how much of an estimated total amount of work is done, with an ETA, on a single line.
+    
+    The line is overwritten, rather than a new one printed, and at most once every interval seconds, since
+    there can be thousands of tasks. '''
+    def __init__(self, label, total, show=True, interval=1.0):
+        self.label = label
+        self.total = total
+        self.show = show and bool(total)
+        self.interval = interval
+        self.start = self.reported = time.time()
+        self.done = 0
+    
+    def add(self, work):
+        self.done += work
+        now = time.time()
+        if self.show and now - self.reported >= self.interval:
+            self.reported = now
+            eta = max(self.total - self.done, 0) * (now - self.start) / self.done if self.done else float('inf')
+            print(f'\r{self.label} ~{min(self.done / self.total, 1):.1%} of ~{self.total:.0f} nodes, ETA {eta:.0f}s          ', end='', flush=True)
+
+def block_starts(path, chunksize):
+    ''' Return the index of the first row of each block of chunksize rows of the word list at path. '''
+    return list(range(0, len(storage.load_words(path)), chunksize))
 
 class Options():
     def __init__(self, **kwargs):
         self.cores = 1
-        self.prefix_depth = 6
+        self.prefix_depth = 6  # 0 to choose automatically from an estimate of the word tree.
+        self.prefixes_per_core = 32  # How many prefixes to aim for when choosing prefix_depth automatically.
+        self.estimate_samples = 1000  # Number of random probes used to estimate the word tree.
+        self.prefix_samples = 0  # Number of random probes used to estimate the subtree below each prefix, so the largest can go first, 0 to disable. Only used when there are at most prefixes_per_core prefixes per core.
         self.chunksize = 5000  # Max number of manifolds to load at once.
+        self.thin_partitions = 64  # Number of partitions that duplicates are removed from independently.
+        self.pipeline = False  # Load the words while they are being found, rather than after.
+        self.pipeline_buffer = 16  # Max number of blocks of words waiting to be loaded before the pipeline stops growing.
+        self.split_size = 1000000  # Max number of words a grow task visits before splitting off the rest of its subtree, 0 to disable.
         self.suffix_depth = 3
         self.loop_invariant_fsm_depth = 4
 
@@ -34,15 +127,33 @@ class Options():
         self.show_timings = True
 
         # File structure.
-        self.word_parts = './output/parts/word_{}.csv'
+        self.word_parts = './output/parts/word_{}.npy'
+        self.prefix_parts = './output/parts/prefixes_{}.csv'
         self.properties_parts = './output/parts/properties_{}.csv'
-        self.word = './output/words.csv'
-        self.properties = './output/properties.csv'
+        self.thin_parts = './output/parts/thin_{}.bin'
+        self.word = './output/words.npy'
+        self.new_word = './output/new_words.npy'  # The words whose properties are not in previous_properties.
+        self.retry_word = './output/retry_words.npy'  # The words that ran out of time on the first pass.
+        self.unique_word = './output/unique_words.npy'  # The words left to load once those conjugate to another are removed.
+        self.properties = './output/properties'  # A directory of columns.
         self.census = './output/census.csv'
+        self.census_index = ''  # A CensusIndex (see scripts/lookup.py) to add the census to, '' to disable.
+        self.report = './output/report.json'  # A machine readable summary of the run, including the statistics of each stage. Set to '' to disable.
+        self.cache = './cache/word_generator_{}.npz'  # Set to '' to disable.
+        self.relators = ''  # Relators mined by scripts/mine_relators.py to build the pruning FSMs from, '' to find them (to length 5) when building.
+        self.properties_store = ''  # An SQLite file, such as './cache/properties.sqlite', to share properties between runs through, '' to disable.
+        self.properties_store_size = 10000000  # Max number of entries kept in the properties store, 0 for unlimited.
+        self.previous_properties = ''  # The properties of an earlier (shallower) run to reuse, '' to disable.
 
         # The affect what the script computes.
         self.master_prefix = ''
+        self.loader = 'twister'  # How bundles are built: 'twister', or 'flipper' to try its veering triangulation first and only fall back to twister.
         self.max_randomize = 50
+        self.word_timeout = 10.0  # Max seconds spent on a word before it is set aside for the retry pass, 0 for no limit.
+        self.retry_timeout = 300.0  # Max seconds spent on a word in the retry pass, 0 for no limit.
+        self.kill_after = 2.0  # A word still running after this many times its time limit, say stuck inside SnapPy, has its process killed.
+        self.volume_tolerance = 1e-6  # Bundles whose volumes differ by more than this are assumed not to be isometric.
+        self.conjugacy_buckets = False  # Whether to use flipper to find words conjugate to another before loading (batch mode only). Flipper is usually slower than SnapPy.
         self.largest_class = 100
         self.largest_class_prefix = 200
         self.basic_search_range = 50
@@ -54,7 +165,7 @@ class Options():
         return '\n'.join(f'{key}: {value}' for key, value in vars(self).items())
 
 class CensusGenerator():
-    def __init__(self, surface_name, generators, automorph, MCG_must_contain, word_filter=basic_filter, manifold_filter=basic_filter, options=None):
+    def __init__(self, surface_name, generators, automorph, MCG_must_contain, word_filter=None, manifold_filter=basic_filter, options=None):
         self.surface_name = surface_name
         self.generators = generators
         self.automorph = automorph
@@ -67,90 +178,420 @@ class CensusGenerator():
             twister=snappy.twister.Surface(self.surface_name),
             flipper=flipper.load(self.surface_name),
             curver=curver.load(self.surface_name),
+            name=self.surface_name,
             )
         self.word_generator = WordGenerator(self.generators, self.automorph, self.MCG_must_contain, self.word_filter, self.surfaces, self.options)
+        self.properties_store = PropertiesStore(self.options.properties_store, self.options.properties_store_size) if self.options.properties_store else None
+        self.word_generator.word_tree.timing = bool(self.options.report)  # Timing the tests of the grow stage is not free, so only do it when it is reported.
+        self.statistics = Counter()  # Keys are stage.name, values are counts or seconds.
         
-        for path in [self.options.word_parts, self.options.properties_parts, self.options.word, self.options.properties, self.options.census]:
+        for path in [self.options.word_parts, self.options.prefix_parts, self.options.properties_parts, self.options.thin_parts, self.options.word, self.options.new_word, self.options.retry_word, self.options.unique_word, self.options.properties, self.options.census]:
             os.makedirs(os.path.dirname(path), exist_ok=True)
     
+    @property
+    def num_cores(self):
+        return self.options.cores if self.options.cores else cpu_count()
+    
+    def record(self, statistics):
+        ''' Add statistics, as returned by a worker, to those of this run. '''
+        self.statistics.update(statistics)
+    
     def map(self, function, generator):
+        ''' Return the list of function(self, *item) for each item of generator.
+        
+        Worker processes are given self once, when they start, so items should be small. '''
+        if self.options.cores == 1:
+            return [function(self, *item) for item in generator]
+        else:
+            with Pool(processes=self.num_cores, initializer=initialise_worker, initargs=(self,)) as P:
+                return P.starmap(run_in_worker, ((function, item) for item in generator))  # Consider adding chunksize=
+    
+    def schedule(self, function, tasks, total_work=None):
+        ''' Run function(self, *task) for each task, where function returns a list of further tasks to run, the amount of work it did and its statistics.
+        
+        New tasks go back onto the same queue so idle workers pick them up as soon as they appear.
+        If an estimate of the total_work is given then progress is reported with an ETA. '''
+        progress = Progress('Done', total_work, self.options.show_progress)
+        
         if self.options.cores == 1:
-            for item in generator:
-                function(*item)
+            to_do = deque(tasks)
+            while to_do:
+                new_tasks, work, statistics = function(self, *to_do.popleft())
+                to_do.extend(new_tasks)
+                self.record(statistics)
+                progress.add(work)
         else:
-            with Pool(processes=self.options.cores if self.options.cores else cpu_count()) as P:
-                P.starmap(function, generator)  # Consider adding chunksize=
+            results = Queue()
+            with Pool(processes=self.num_cores, initializer=initialise_worker, initargs=(self,)) as P:
+                def submit(task):
+                    P.apply_async(run_in_worker, (function, task), callback=results.put, error_callback=results.put)
+                
+                running = 0
+                for task in tasks:
+                    submit(task)
+                    running += 1
+                
+                while running:
+                    result = results.get()
+                    running -= 1
+                    if isinstance(result, BaseException):
+                        raise result
+                    new_tasks, work, statistics = result
+                    for task in new_tasks:
+                        submit(task)
+                        running += 1
+                    self.record(statistics)
+                    progress.add(work)
+    
+    def map_blocks(self, function, *columns):
+        ''' Return the concatenation of function(self, *block) over blocks of chunksize rows of the given columns.
+        
+        The function returns the list of results for its block and its statistics. '''
+        columns = [list(column) for column in columns]
+        blocks = [[column[start:start+self.options.chunksize] for column in columns] for start in range(0, len(columns[0]), self.options.chunksize)]
+        results = []
+        for block_results, statistics in self.map(function, blocks):
+            results.extend(block_results)
+            self.record(statistics)
+        return results
+    
+    def collisions(self, table):
+        ''' Return a mask of the acceptable rows of table whose homology and volume (up to volume_tolerance) match those of another acceptable row.
+        
+        Volumes are chained, so a, b and c collide if |a - b| and |b - c| are within volume_tolerance. '''
+        acceptable = table[table.acceptable].sort_values(['homology', 'volume'])
+        linked = acceptable.homology.eq(acceptable.homology.shift()) & (acceptable.volume.diff().abs() <= self.options.volume_tolerance)  # To the previous row.
+        cluster = (~linked).cumsum()
+        collided = cluster.map(cluster.value_counts()) > 1
+        return table.index.isin(acceptable.index[collided])
+    
+    def choose_prefix_depth(self, depth, estimate=None):
+        ''' Return the shortest prefix depth that is estimated to give at least prefixes_per_core prefixes per core.
+        
+        The estimate of the word tree, as returned by WordGenerator.estimate, is made if it is not given. '''
+        nodes, prefixes = estimate if estimate is not None else self.word_generator.estimate(self.options.master_prefix, depth, self.options.estimate_samples)
+        target = self.options.prefixes_per_core * self.num_cores
+        prefix_depth = next((d for d in range(len(self.options.master_prefix) + 1, depth) if prefixes[d] >= target), depth)
+        
+        if self.options.show_progress: print(f'Estimated {sum(nodes):.0f} nodes, using prefix depth {prefix_depth} for ~{prefixes[prefix_depth]:.0f} prefixes')
+        return prefix_depth
     
     @staticmethod
     def clean(basepath):
-        for path in glob(basepath.format('*')):
+        for path in glob(basepath.format('*') + '*'):  # Including any journals.
             os.remove(path)
     
-    def build_words(self, depth):
-        if self.options.show_progress: print('Generating words.')
+    def grow_tasks(self, depth):
+        ''' Return the tasks still needed to find all valid words of length at most depth and an estimate of the work they will do (or None).
         
-        if not os.path.isfile(self.options.word_parts.format('prefixes')):
-            prefixes = valid_suffixes_map(self, '0', self.options.master_prefix, self.options.prefix_depth, depth)
+        The prefixes are found first, if that has not been done already. '''
+        if not os.path.isfile(self.options.prefix_parts.format('0')):
+            # One estimate of the whole tree is cheap next to the grow, so it is always made for the ETA.
+            estimate = self.word_generator.estimate(self.options.master_prefix, depth, self.options.estimate_samples)
+            prefix_depth = self.options.prefix_depth if self.options.prefix_depth > 0 else self.choose_prefix_depth(depth, estimate)
+            prefixes, statistics = valid_suffixes_map(self, '0', self.options.master_prefix, prefix_depth, depth)
+            self.record(statistics)
             if self.options.show_progress: print('\rTraversing prefix tree: DONE' + ' ' * depth)
             if self.options.show_progress: print(f'{len(prefixes)} prefixes to explore')
-            pd.DataFrame({'word': prefixes}).to_csv(self.options.word_parts.format('prefixes'), index=False)
+            prefix_table = pd.DataFrame({'word': prefixes})
+            if self.options.prefix_samples > 0 and 0 < len(prefixes) <= self.options.prefixes_per_core * self.num_cores:
+                # Put the largest subtrees first so that they do not end up running alone at the end. With many
+                # prefixes per core the packing is good anyway and this pass would cost about as much as the grow.
+                prefix_table['estimate'] = self.map(estimate_map, ((prefix, depth) for prefix in prefixes))
+                prefix_table.sort_values('estimate', ascending=False, inplace=True, kind='stable')
+            elif prefixes:
+                nodes, _ = estimate
+                prefix_table['estimate'] = sum(nodes[prefix_depth + 1:]) / len(prefixes)
+            prefix_table.to_csv(self.options.prefix_parts.format('0'), index=False)
         
-        load_inputs = (
-            (self, str(index+1), row.word, depth, depth)
-            for index, row in pd.read_csv(self.options.word_parts.format('prefixes')).iterrows()
-            if not os.path.isfile(self.options.word_parts.format(index+1))
-            )
-        self.map(valid_suffixes_map, load_inputs)
-        
-        if self.options.show_progress: print('\rTraversing word tree: DONE          ')
+        def unfinished(label, prefix):
+            ''' Yield the tasks still needed to find all words below prefix, including those of subtrees split off from it. '''
+            if not os.path.isfile(self.options.word_parts.format(label)):
+                yield (label, prefix, depth)
+            elif os.path.isfile(self.options.prefix_parts.format(label)):
+                for child_label, child in pd.read_csv(self.options.prefix_parts.format(label), dtype=str, keep_default_na=False).itertuples(index=False):
+                    yield from unfinished(child_label, child)
         
+        prefix_table = pd.read_csv(self.options.prefix_parts.format('0'), dtype={'word': str}, keep_default_na=False)
+        tasks = (
+            task
+            for index, row in prefix_table.iterrows()
+            for task in unfinished(str(index+1), row.word)
+            )
+        # Only count the prefixes that have not been started, so the ETA is a little optimistic when resuming.
+        total_work = sum(row.estimate for index, row in prefix_table.iterrows() if not os.path.isfile(self.options.word_parts.format(index+1))) if 'estimate' in prefix_table else None
+        return tasks, total_work
+    
+    def word_part_paths(self):
+        return sorted(glob(self.options.word_parts.format('*')))
+    
+    def combine_words(self):
         if self.options.show_progress: print('Combining files.')
-        # word_table = pd.concat([pd.read_csv(path) for path in glob(self.options.word_parts.format('*')) if not path.endswith('prefixes.csv')], ignore_index=True, sort=False)
-        # word_table.to_csv(self.options.word, index=False)
-
-        with open(self.options.word, 'w') as output_file:
-            for index, path in enumerate(glob(self.options.word_parts.format('*'))):
-                if not path.endswith('prefixes.csv'):
-                    with open(path) as input_file:
-                        if index: next(input_file)  # Skip the header row.
-                        shutil.copyfileobj(input_file, output_file)
+        num_words = storage.concatenate_words(self.options.word, self.word_part_paths())
         
         if self.options.show_progress:
-            print(f'\tWords {count_lines(self.options.word) - 1}')
+            print(f'\tWords {num_words}')
+    
+    def read_words(self, path, start=0, count=None):
+        ''' Return the list of (at most count) str words of the word list at path, starting from the given row. '''
+        words = storage.load_words(path)
+        return storage.unpack_words(words[start:start + count if count is not None else len(words)], self.word_generator.letter_generators)
+    
+    def build_words(self, depth):
+        if self.options.show_progress: print('Generating words.')
+        
+        tasks, total_work = self.grow_tasks(depth)
+        self.schedule(valid_words_map, tasks, total_work)
+        
+        if self.options.show_progress: print('\rTraversing word tree: DONE          ')
+        
+        self.combine_words()
     
     def build_properties(self):
         if self.options.show_progress: print('Collecting properties.')
         
+        word_path = self.options.word
+        previous_table = None
+        if self.options.previous_properties:
+            # Only load the words that the previous run did not.
+            words = pd.Series(self.read_words(self.options.word))
+            previous_table = storage.load_table(self.options.previous_properties)
+            previous_table = previous_table[previous_table.word.isin(words)]
+            storage.save_words(self.options.new_word, list(words[~words.isin(previous_table.word)]), self.word_generator.letter_lookup)
+            word_path = self.options.new_word
+            if self.options.show_progress: print(f'\tReusing the properties of {len(previous_table)} words')
+        
+        duplicates = dict()
+        if self.options.conjugacy_buckets:
+            word_path, duplicates = self.remove_conjugates(word_path)
+        
         load_inputs = (
-            (self, str(index), df)
-            for index, df in enumerate(pd.read_csv(self.options.word, chunksize=self.options.chunksize))
+            (str(index), word_path, start, self.options.word_timeout)
+            for index, start in enumerate(block_starts(word_path, self.options.chunksize))
             if not os.path.isfile(self.options.properties_parts.format(index))
             )
-        self.map(determine_properties_map, load_inputs)
+        for statistics in self.map(determine_properties_map, load_inputs):
+            self.record(statistics)
+        
+        if duplicates:
+            self.copy_conjugates(duplicates)
+        
+        self.combine_properties(previous_table)
+    
+    def remove_conjugates(self, word_path):
+        ''' Return the path of a word list of the words at word_path less those that are conjugate to (the inverse of) another, and a dictionary mapping each of these to that other word.
+        
+        Conjugate words have the same mapping torus, so only one of each needs loading. Words are first bucketed by
+        the characteristic polynomial of their action on homology, which is cheap, and flipper only tests the words
+        of buckets with more than one word. '''
+        if self.options.show_progress: print('Bucketing words by conjugacy invariants.')
+        words = self.read_words(word_path)
+        buckets = dict()
+        for word, key in zip(words, self.map_blocks(conjugacy_invariants_map, words)):
+            buckets.setdefault(key, []).append(word)
+        buckets = [bucket for bucket in buckets.values() if len(bucket) > 1]
+        
+        duplicates = dict()
+        for bucket_duplicates, statistics in self.map(conjugates_map, ((bucket,) for bucket in buckets)):
+            duplicates.update(bucket_duplicates)
+            self.record(statistics)
+        self.record({'conjugacy.buckets': len(buckets), 'conjugacy.duplicates': len(duplicates)})
+        storage.save_words(self.options.unique_word, [word for word in words if word not in duplicates], self.word_generator.letter_lookup)
+        if self.options.show_progress: print(f'\tSkipping {len(duplicates)} words conjugate to another')
+        
+        return self.options.unique_word, duplicates
+    
+    def copy_conjugates(self, duplicates):
+        ''' Write a properties part for the words of duplicates, copying the properties of the word that each is conjugate to.
+        
+        The parts are read one at a time and only the rows of these conjugates are kept, so memory stays bounded by
+        the size of a part. Words whose conjugate could not be loaded are set aside for the retry pass, since they
+        may load themselves. '''
+        part_path = self.options.properties_parts.format('conjugates')
+        if os.path.isfile(part_path): return
+        
+        copies = dict()  # word |--> the words conjugate to it that copy its properties.
+        for word, conjugate in duplicates.items():
+            copies.setdefault(conjugate, []).append(word)
+        
+        journal_path = part_path + '.partial'
+        copied = set()
+        with open(journal_path, 'w', newline='') as journal:
+            csv.writer(journal).writerow(('word',) + Properties._fields)
+            for path in sorted(glob(self.options.properties_parts.format('*'))):
+                part = pd.read_csv(path, dtype={'word': str}, keep_default_na=False)
+                part = part[part.loadable & part.word.isin(copies)]
+                rows = part.loc[part.index.repeat([len(copies[word]) for word in part.word]), list(Properties._fields)]
+                rows.insert(0, 'word', [copy for word in part.word for copy in copies[word]])
+                rows.to_csv(journal, header=False, index=False)
+                copied.update(rows.word)
+        
+        retry = pd.DataFrame({'word': [word for word in duplicates if word not in copied]})
+        retry.to_csv(part_path + '.retry', index=False)
+        os.replace(journal_path, part_path)
+        self.record({'conjugacy.copied': len(copied), 'conjugacy.retried': len(retry)})
+    
+    def build_pipelined(self, depth):
+        ''' Find the words and their properties at the same time.
+        
+        As soon as a grow task has written its part of the words, the blocks of that part are queued to be loaded.
+        Load tasks take priority and no new grow tasks start while pipeline_buffer blocks are waiting, so that
+        the words found never get too far ahead of the SnapPy work. Like the batch mode this resumes from the parts. '''
+        if self.options.show_progress: print('Generating words and collecting properties.')
+        
+        word_prefix, word_suffix = self.options.word_parts.split('{}')
+        
+        def load_tasks(path):
+            label = path[len(word_prefix):len(path) - len(word_suffix)]
+            for index, start in enumerate(block_starts(path, self.options.chunksize)):
+                if not os.path.isfile(self.options.properties_parts.format(f'{label}-{index}')):
+                    yield (f'{label}-{index}', path, start, self.options.word_timeout)
+        
+        grow_tasks, total_work = self.grow_tasks(depth)
+        grow = deque(grow_tasks)
+        load = deque(task for path in self.word_part_paths() for task in load_tasks(path))
+        
+        progress = Progress('Grown', total_work, self.options.show_progress)
+        results = Queue()
+        cores = self.num_cores
+        with Pool(processes=cores, initializer=initialise_worker, initargs=(self,)) if cores > 1 else nullcontext() as P:
+            def submit(function, task):
+                if P is None:
+                    results.put((function, task, function(self, *task)))
+                else:
+                    P.apply_async(run_in_worker, (function, task), callback=lambda result: results.put((function, task, result)), error_callback=results.put)
+            
+            running = waiting = 0  # The number of tasks running and of blocks waiting to be loaded.
+            while True:
+                while running < cores:
+                    if load:
+                        submit(determine_properties_map, load.popleft())
+                    elif grow and waiting < self.options.pipeline_buffer:
+                        submit(valid_words_map, grow.popleft())
+                    else:
+                        break
+                    running += 1
+                
+                if not running: break
+                result = results.get()
+                running -= 1
+                if isinstance(result, BaseException):
+                    raise result
+                
+                function, task, value = result
+                if function is valid_words_map:
+                    new_tasks, work, statistics = value
+                    grow.extend(new_tasks)
+                    new_loads = list(load_tasks(self.options.word_parts.format(task[0])))
+                    load.extend(new_loads)
+                    waiting += len(new_loads)
+                    
+                    progress.add(work)
+                else:
+                    statistics = value
+                    waiting = max(waiting - 1, 0)  # Blocks found on resuming were never counted.
+                self.record(statistics)
+        
+        if self.options.show_progress: print('\rTraversing word tree: DONE          ')
+        
+        self.combine_words()
+        self.combine_properties()
+    
+    def combine_properties(self, previous_table=None):
+        ''' Retry the words that ran out of time and then combine the properties parts (and previous_table) into a single table. '''
+        # Give the words that ran out of time a second go, with a larger budget.
+        retry_paths = sorted(glob(self.options.properties_parts.format('*') + '.retry'))
+        retry_words = [word for path in retry_paths for word in pd.read_csv(path, dtype={'word': str}, keep_default_na=False).word]
+        storage.save_words(self.options.retry_word, retry_words, self.word_generator.letter_lookup)
+        if self.options.show_progress and retry_words: print(f'\rRetrying {len(retry_words)} words')
+        load_inputs = (
+            (f'retry{index}', self.options.retry_word, start, self.options.retry_timeout, True)
+            for index, start in enumerate(block_starts(self.options.retry_word, self.options.chunksize))
+            if not os.path.isfile(self.options.properties_parts.format(f'retry{index}'))
+            )
+        for statistics in self.map(determine_properties_map, load_inputs):
+            self.record(statistics)
         
         if self.options.show_progress: print('\rCollecting properties: DONE          ')
         
         if self.options.show_progress: print('Combining files.')
-        properties_table = pd.concat([pd.read_csv(path) for path in glob(self.options.properties_parts.format('*'))], ignore_index=True, sort=False)
-        properties_table.sort_values('volume', inplace=True)
-        properties_table.to_csv(self.options.properties, index=False)
+        paths = sorted(glob(self.options.properties_parts.format('*')))
+        def blocks():
+            for path in paths:
+                yield pd.read_csv(path)
+            if previous_table is not None:
+                yield previous_table
         
-        if self.options.show_progress: print(f'\tHyperbolic {properties_table.hyperbolic.sum()}')
-        if self.options.show_progress: print(f'\tLoadable {properties_table.loadable.sum()}')
+        # A first pass to find the number of rows and how wide the strings are, then write the table a block at a time.
+        dtypes = dict((name, dtype) for name, dtype in PROPERTIES_DTYPES.items() if dtype != 'S')
+        rows, widths = 0, dict((name, 1) for name, dtype in PROPERTIES_DTYPES.items() if dtype == 'S')
+        for block in blocks():
+            rows += len(block)
+            for name in widths:
+                if name in block: widths[name] = max(widths[name], storage.string_width(block[name]))
+        writer = storage.TableWriter(self.options.properties, dict((name, dtypes.get(name, f'S{widths.get(name)}')) for name in PROPERTIES_DTYPES), rows)
+        for block in blocks():
+            writer.write(block.reindex(columns=list(PROPERTIES_DTYPES)))
+        writer.close()
+        
+        # Only tell apart the bundles that the cheap invariants cannot.
+        properties_table = storage.load_table(self.options.properties, ['acceptable', 'volume', 'homology', 'isom_sig'])
+        missing = self.collisions(properties_table) & properties_table.isom_sig.isna()
+        if missing.any():
+            isom_sigs = properties_table.isom_sig.astype(object)
+            tri_isosigs = storage.load_table(self.options.properties, ['word', 'tri_isosig'])[missing]
+            isom_sigs[missing] = self.map_blocks(find_isometry_signatures_map, tri_isosigs.word, tri_isosigs.tri_isosig)
+            storage.save_column(self.options.properties, 'isom_sig', isom_sigs)
+        if self.options.show_progress: print(f'\tFound the isometry signatures of {missing.sum()} bundles')
+        
+        if self.options.show_progress: print(f'\tHyperbolic {(storage.load_column(self.options.properties, "hyperbolic") == 1).sum()}')
+        if self.options.show_progress: print(f'\tLoadable {storage.load_column(self.options.properties, "loadable").sum()}')
         if self.options.show_progress: print(f'\tAcceptable {properties_table.acceptable.sum()}')
     
     def thin_properties(self):
+        ''' Write the census: one acceptable word of each bundle, sorted by volume, with its symmetries.
+        
+        The isom_sig column is only filled in for the bundles whose volume and homology collide with those of another
+        bundle, since only those needed it to tell them apart, and is empty for the rest. An empty isom_sig does not
+        mean that the bundle has none. CensusIndex uses the ones that are there to tell these bundles apart. '''
         if self.options.show_progress: print('Removing duplicates.')
         
-        census_table = pd.read_csv(self.options.properties)
-        census_table = census_table[census_table.acceptable]
+        # Only bundles whose cheap invariants collide have an isom_sig, the rest are already known to be distinct.
+        # So split the rows with an isom_sig into partitions by its hash, a block at a time, and thin each partition separately.
+        self.clean(self.options.thin_parts)
+        acceptable = storage.load_column(self.options.properties, 'acceptable')
+        isom_sigs = storage.load_column(self.options.properties, 'isom_sig')
+        distinct = []
+        for start in range(0, len(acceptable), self.options.chunksize):
+            rows = np.arange(start, min(start + self.options.chunksize, len(acceptable)))
+            rows = rows[acceptable[rows]]
+            block = isom_sigs[rows]
+            distinct.append(rows[block == b''])
+            
+            rows, block = rows[block != b''], block[block != b'']
+            partitions = pd.util.hash_array(block.astype(object)) % self.options.thin_partitions
+            for partition in np.unique(partitions):
+                with open(self.options.thin_parts.format(partition), 'ab') as handle:
+                    rows[partitions == partition].tofile(handle)
+        
+        paths = sorted(glob(self.options.thin_parts.format('*')))
+        representatives = self.map(thin_partition_map, ((path,) for path in paths))
+        rows = np.sort(np.concatenate(distinct + representatives + [np.zeros(0, dtype=np.int64)]))
+        self.record({'thin.partitions': len(paths), 'thin.partitioned': int(sum(os.path.getsize(path) for path in paths) // np.dtype(np.int64).itemsize), 'thin.distinct': len(rows)})
+        self.clean(self.options.thin_parts)
         
-        census_table['length'] = census_table.word.str.len()
-        census_table['canonical'] = census_table.word.apply(self.word_generator.repr_word)
-        census_table = census_table.sort_values(['isom_sig', 'length', 'canonical']).groupby('isom_sig').first()
-        census_table.drop(['length', 'canonical'], axis=1, inplace=True)  # Remove unneeded columns.
-        census_table.reset_index(inplace=True, drop=True)
-        census_table.sort_values('volume', inplace=True)
+        census_table = storage.load_table(self.options.properties, rows=rows)
+        census_table.sort_values('volume', inplace=True)  # The isom_sig is kept, where known, for census_index.
+        
+        # The deferred pass, now that only one word of each manifold remains.
+        missing = census_table.num_sym.isna()
+        symmetries = self.map_blocks(find_symmetries_map, census_table.word[missing], census_table.tri_isosig[missing])
+        census_table['ab_sym'] = census_table.ab_sym.astype(object)
+        census_table.loc[missing, 'num_sym'] = [num_sym for num_sym, _ in symmetries]
+        census_table.loc[missing, 'ab_sym'] = [ab_sym for _, ab_sym in symmetries]
+        census_table.drop('tri_isosig', axis=1, inplace=True)
+        census_table['hyperbolic'] = census_table.hyperbolic.astype(bool)
+        census_table['num_sym'] = census_table.num_sym.astype(int)
         census_table.to_csv(self.options.census, index=False)
         
         if self.options.show_progress: print('Thinning: DONE          ')
@@ -165,84 +606,543 @@ class CensusGenerator():
             'prebuilt' == 2 ==> Assumes word list is complete,
             'prebuilt' == 3 ==> Assumes any existing volume blocks are correct,
             'prebuilt' == 4 ==> Assumes volume list is complete,
+        In pipeline mode the words and volumes are found together, so
+        'prebuilt' == 1 assumes any existing word and volume blocks are correct
+        and both lists are complete afterwards.
         '''
         
         assert depth > 0 and prebuilt >= 0
         
+        pipelined = self.options.pipeline and prebuilt < 2
+        self.statistics.clear()
         with Timer() as time_words:
-            if prebuilt < 1: self.clean(self.options.word_parts)
-            if prebuilt < 2: self.build_words(depth)
+            if prebuilt < 1:
+                self.clean(self.options.word_parts)
+                self.clean(self.options.prefix_parts)
+            if pipelined:
+                if prebuilt < 1: self.clean(self.options.properties_parts)
+                self.build_pipelined(depth)
+            elif prebuilt < 2:
+                self.build_words(depth)
             if self.options.show_timings: print('Grow time: %fs' % time_words.elapsed)
         with Timer() as time_properties:
-            if prebuilt < 3: self.clean(self.options.properties_parts)
-            if prebuilt < 4: self.build_properties()
+            if prebuilt < 3 and not pipelined: self.clean(self.options.properties_parts)
+            if prebuilt < 4 and not pipelined: self.build_properties()
             if self.options.show_timings: print('Load time: %fs' % time_properties.elapsed)
         with Timer() as time_census:
             if prebuilt < 5: self.thin_properties()
             if self.options.show_timings: print('Thin time: %fs' % time_census.elapsed)
         
+        if self.options.census_index:
+            CensusIndex(self.options.census_index, self.options.volume_tolerance).add(self.options.census, self.surface_name)
+        
+        if self.options.show_timings or self.options.report:
+            properties = storage.load_table(self.options.properties, ['hyperbolic', 'loadable', 'acceptable'])
+            counts = dict(
+                words=len(storage.load_words(self.options.word)),
+                hyperbolic=int((properties.hyperbolic == 1).sum()),
+                loadable=int(properties.loadable.sum()),
+                acceptable=int(properties.acceptable.sum()),
+                distinct=len(pd.read_csv(self.options.census)),
+                )
+            timings = dict(grow=time_words.elapsed, load=time_properties.elapsed, thin=time_census.elapsed)
+        
         if self.options.show_timings:
-            words = pd.read_csv(self.options.word)
-            properties = pd.read_csv(self.options.properties)
-            census = pd.read_csv(self.options.census)
             print('\nSummary:')
             print('\tStatistics:')
-            print(f'\t\tWords:\t{len(words)}')
-            print(f'\t\tHyperbolic:\t{properties.hyperbolic.sum()}')
-            print(f'\t\tLoadable:\t{properties.loadable.sum()}')
-            print(f'\t\tAcceptable:\t{properties.acceptable.sum()}')
+            print(f'\t\tWords:\t{counts["words"]}')
+            print(f'\t\tHyperbolic:\t{counts["hyperbolic"]}')
+            print(f'\t\tLoadable:\t{counts["loadable"]}')
+            print(f'\t\tAcceptable:\t{counts["acceptable"]}')
             print('\t\t------------------------------')
-            print(f'\t\tDistinct:\t{len(census)}')
+            print(f'\t\tDistinct:\t{counts["distinct"]}')
             print('\t\t------------------------------')
             print('\tTimings:')
             print(f'\t\tGrow time:\t{time_words.elapsed:0.2f}s')
             print(f'\t\tLoad time:\t{time_properties.elapsed:0.2f}s')
             print(f'\t\tThin time:\t{time_census.elapsed:0.2f}s')
+        
+        if self.options.report:
+            self.write_report(depth, prebuilt, counts, timings)
+    
+    def write_report(self, depth, prebuilt, counts, timings):
+        ''' Write a machine readable summary of this run to the report path.
+        
+        Statistics are grouped by stage and only cover the work done by this run, so a resumed run reports less. '''
+        statistics = dict()
+        for key, value in sorted(self.statistics.items()):
+            stage, name = key.split('.', 1)
+            statistics.setdefault(stage, dict())[name] = value
+        report = dict(
+            surface=self.surface_name,
+            depth=depth,
+            prebuilt=prebuilt,
+            options=vars(self.options),
+            counts=counts,
+            timings=timings,
+            statistics=statistics,
+            )
+        
+        os.makedirs(os.path.dirname(self.options.report) or '.', exist_ok=True)
+        tmp_path = f'{self.options.report}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w') as handle:
+            json.dump(report, handle, indent=4)
+        os.replace(tmp_path, self.options.report)
+    
+    def find(self, targets, depth):
+        ''' Return a dictionary mapping the name of each of the target SnapPy manifolds to a monodromy of it of length at most depth, or None if there is not one.
+        
+        Unlike build_census, the words are grown and loaded one length at a time, so the monodromies found are as short
+        as possible, and this stops (terminating any workers) as soon as every target has been found. A word is only
+        loaded if the torsion of its homology matches that of a target that is still to be found, and only bundles
+        whose volume (up to volume_tolerance) and homology also match have their isometry signature computed. '''
+        targets = [find_target(name) for name in targets]
+        found = dict()  # name |--> word.
+        
+        self.statistics.clear()
+        cores = self.num_cores
+        results = Queue()
+        with Pool(processes=cores, initializer=initialise_worker, initargs=(self,)) if cores > 1 else nullcontext() as P:
+            def submit(task):
+                task = task + ([target for target in targets if target.name not in found],)
+                if P is None:
+                    results.put(find_map(self, *task))
+                else:
+                    P.apply_async(run_in_worker, (find_map, task), callback=results.put, error_callback=results.put)
+            
+            for length in range(len(self.options.master_prefix) + 1, depth + 1):
+                if len(found) == len(targets): break
+                if self.options.show_progress: print(f'Searching the words of length {length} for {len(targets) - len(found)} manifolds')
+                
+                prefix_depth = self.options.prefix_depth if self.options.prefix_depth > 0 else self.choose_prefix_depth(length)
+                if length <= prefix_depth:
+                    tasks = deque([(self.options.master_prefix, length)])
+                else:
+                    _, prefixes = self.word_generator.valid_suffixes(self.options.master_prefix, prefix_depth, length)
+                    tasks = deque((prefix, length) for prefix in prefixes)
+                
+                running = 0
+                while True:
+                    while running < cores and tasks and len(found) < len(targets):
+                        submit(tasks.popleft())
+                        running += 1
+                    
+                    if not running: break
+                    result = results.get()
+                    running -= 1
+                    if isinstance(result, BaseException):
+                        raise result
+                    
+                    matches, statistics = result
+                    for name, word in matches:
+                        # Of the words of this length that are found, keep the first in the order of the word tree.
+                        if name not in found or self.word_generator.repr_word(word) < self.word_generator.repr_word(found[name]):
+                            found[name] = word
+                    self.record(statistics)
+                    if len(found) == len(targets): break  # Leaving the Pool terminates the tasks still running.
+        
+        if self.options.show_progress:
+            print(f'Found {len(found)} of {len(targets)} manifolds after loading {self.statistics["find.loaded"]} of {self.statistics["find.words"]} words')
+        
+        return dict((target.name, found.get(target.name)) for target in targets)
 
 
 # In order to be able to multiprocess these we need to be able to refer
 # to various functions globally. Otherwise it would just be
 # an instance copy of the function and so lost when the objects are passed
 # around by pickling.
+#
+# Similarly, rather than pickling the CensusGenerator (with all of its FSMs
+# and surfaces) for every task, each worker receives it once, via
+# initialise_worker, and tasks only carry their arguments.
+
+WORKER_GENERATOR = None
+
+def initialise_worker(generator):
+    global WORKER_GENERATOR
+    WORKER_GENERATOR = generator
+
+def run_in_worker(function, args):
+    return function(WORKER_GENERATOR, *args)
 
 def valid_suffixes_map(self, label, prefix, prefix_depth, word_depth):
     if self.options.show_progress: print(f'\rFinding suffixes of {prefix} ({label})')
     
+    self.word_generator.word_tree.reset_statistics()
     words, prefixes = self.word_generator.valid_suffixes(prefix, prefix_depth, word_depth)
-    pd.DataFrame({'word': words}).to_csv(self.options.word_parts.format(label), index=False)
+    storage.save_words(self.options.word_parts.format(label), words, self.word_generator.letter_lookup)
     
-    return prefixes
+    return prefixes, stage_statistics('grow', self.word_generator.word_tree.statistics())
 
-def determine_properties_map(self, label, table):
-    if self.options.show_progress: print('\rCollecting properties from block: %s' % label)
+def estimate_map(self, prefix, depth):
+    ''' Return the estimated number of words visited when finding all valid words below prefix. '''
+    nodes, _ = self.word_generator.estimate(prefix, depth, self.options.prefix_samples)
+    return sum(nodes)
+
+def valid_words_map(self, label, prefix, depth):
+    ''' Find all valid words below prefix.
     
-    Properties = namedtuple('Properties', ('hyperbolic', 'loadable', 'acceptable', 'volume', 'isom_sig', 'homology', 'num_sym', 'ab_sym'))
-    Unloadable = lambda is_hyperbolic: Properties(is_hyperbolic, False, False, 0.0, '', 0, 0, 0)
+    Returns the tasks for any parts of the subtree that were split off, the number of words visited and the statistics of the search. '''
+    if self.options.show_progress: print(f'\rFinding suffixes of {prefix} ({label})')
     
-    def properties(row):
-        ''' Return the properties associated with the mapping class `word`. '''
-        word = row.word
+    self.word_generator.word_tree.reset_statistics()
+    words, prefixes = self.word_generator.valid_suffixes(prefix, depth, depth, self.options.split_size if self.options.split_size > 0 else -1)
+    tasks = [(f'{label}.{index}', child, depth) for index, child in enumerate(child for child in prefixes if len(child) < depth)]
+    
+    # Record the split off subtrees before the words so that a restart always finds them.
+    if tasks: pd.DataFrame({'label': [task[0] for task in tasks], 'word': [task[1] for task in tasks]}).to_csv(self.options.prefix_parts.format(label), index=False)
+    storage.save_words(self.options.word_parts.format(label), words, self.word_generator.letter_lookup)
+    
+    return tasks, self.word_generator.word_tree.visited, stage_statistics('grow', self.word_generator.word_tree.statistics())
+
+def find_map(self, prefix, depth, targets):
+    ''' Return the (name, word) pairs for the words of length depth below prefix that are monodromies of the given targets, and the statistics of the search.
+    
+    Each target is matched at most once and this stops as soon as all of them have been. '''
+    if self.options.show_progress: print(f'\rSearching suffixes of {prefix}')
+    statistics = Counter()
+    remaining = dict((target.name, target) for target in targets)
+    
+    with timed(statistics, 'time.grow'):
+        self.word_generator.word_tree.reset_statistics()
+        words, _ = self.word_generator.valid_suffixes(prefix, depth, depth)
+        words = [word for word in words if len(word) == depth]  # The shorter ones were searched by earlier lengths.
+    statistics.update(self.word_generator.word_tree.statistics())
+    statistics['words'] += len(words)
+    with timed(statistics, 'time.torsion'):
+        torsions = self.word_generator.homology.torsions([self.word_generator.repr_word(word) for word in words])
+    
+    matches = []
+    for word, torsion in zip(words, torsions):
+        candidates = [target for target in remaining.values() if target.torsion == torsion]
+        if not candidates: continue
+        
+        statistics['loaded'] += 1
+        try:
+            with time_limit(self.options.word_timeout):
+                M = load_bundle(self, word, statistics)
+                if M is None:
+                    statistics['unloadable'] += 1
+                    continue
+                
+                with timed(statistics, 'time.volume'):
+                    volume = float(M.volume())
+                candidates = [target for target in candidates if abs(target.volume - volume) <= self.options.volume_tolerance]
+                if not candidates: continue
+                with timed(statistics, 'time.homology'):
+                    homology = str(M.homology())
+                candidates = [target for target in candidates if target.homology == homology]
+                if not candidates: continue
+                
+                statistics['isometry_signatures'] += 1
+                with timed(statistics, 'time.isometry_signature'):
+                    isom_sig = str(M.isometry_signature())
+        except Exception as error:  # Including WordTimeout. Like determine_properties_map, this word cannot stall the search.
+            statistics['timeouts' if isinstance(error, WordTimeout) else 'failures'] += 1
+            continue
+        
+        for target in candidates:
+            if target.isom_sig == isom_sig:
+                matches.append((target.name, word))
+                del remaining[target.name]
+        if not remaining: break
+    
+    return matches, stage_statistics('find', statistics)
+
+def conjugacy_invariants_map(self, words):
+    ''' Return, for each word, a key that its conjugates and their inverses share, and the statistics of the block.
+    
+    This is the characteristic polynomial of the action of the word on homology, or that of its inverse (the
+    reversed polynomial, up to the sign of the determinant), whichever is smaller. '''
+    statistics = Counter(words=len(words))
+    keys = []
+    with timed(statistics, 'time.invariants'):
+        for word in words:
+            polynomial = self.word_generator.homology.characteristic_polynomial(self.word_generator.repr_word(word))
+            keys.append(min(polynomial, tuple(coefficient * polynomial[-1] for coefficient in reversed(polynomial))))
+    return keys, stage_statistics('conjugacy', statistics)
+
+def conjugates_map(self, bucket):
+    ''' Return a dictionary mapping each word of bucket that flipper shows is conjugate to an earlier word, or its inverse, to that word, and the statistics of the tests.
+    
+    Words are taken in the order that thin_partition_map prefers, so the word loaded is the one the census keeps.
+    Only pseudo-Anosov words are tested and each word gets at most word_timeout seconds. '''
+    if self.options.show_progress: print(f'\rTesting {len(bucket)} words for conjugacy')
+    statistics = Counter()
+    representatives = []  # (word, mapping class, inverse mapping class).
+    duplicates = dict()
+    for word in sorted(bucket, key=lambda word: (len(word), self.word_generator.repr_word(word))):
+        try:
+            with time_limit(self.options.word_timeout):
+                with timed(statistics, 'time.pseudo_anosov'):
+                    h = self.surfaces.flipper(word)
+                    if not h.is_pseudo_anosov():
+                        statistics['not_pseudo_anosov'] += 1
+                        continue
+                for representative, g, g_inverse in representatives:
+                    statistics['tests'] += 1
+                    with timed(statistics, 'time.conjugate'):
+                        if h.is_conjugate_to(g) or h.is_conjugate_to(g_inverse):
+                            duplicates[word] = representative
+                            break
+                else:
+                    representatives.append((word, h, h.inverse()))
+        except Exception as error:  # Including WordTimeout. This word is just loaded as usual.
+            statistics['timeouts' if isinstance(error, WordTimeout) else 'failures'] += 1
+    
+    return duplicates, stage_statistics('conjugacy', statistics)
+
+def thin_partition_map(self, path):
+    ''' Return the rows of the properties table listed at path that are the first of their isom_sig.
+    
+    Words are ordered by length and then by their letters, which matches sorting by (len(word), repr_word(word)). '''
+    rows = np.fromfile(path, dtype=np.int64)
+    keys = storage.load_column(self.options.properties, 'isom_sig')[rows]
+    words = [word.decode('utf-8') for word in storage.load_column(self.options.properties, 'word')[rows]]
+    lengths = np.array([len(word) for word in words], dtype=np.int64)
+    letters = storage.pack_words(words, self.word_generator.letter_lookup)  # Padding sorts last, but only words of the same length are compared.
+    
+    order = np.lexsort([letters[:, column] for column in reversed(range(letters.shape[1]))] + [lengths, keys])
+    keys = keys[order]
+    first = np.ones(len(keys), dtype=bool)
+    first[1:] = keys[1:] != keys[:-1]
+    return rows[order][first]
+
+def load_bundle(self, word, statistics):
+    ''' Return the bundle with monodromy `word`, with a positively oriented triangulation, or None if one could not be found.
+    
+    How often each loader succeeds, and the time it takes, is counted under its name in statistics. '''
+    if self.options.loader == 'flipper':
+        M = load_veering_bundle(self, word, statistics)
+        if M is not None: return M
+    elif self.options.loader != 'twister':
+        raise ValueError(f'Unknown loader {self.options.loader}')
+    
+    return load_twister_bundle(self, word, statistics)
+
+def load_twister_bundle(self, word, statistics):
+    ''' Return the bundle with monodromy `word` built by twister, randomizing it until it is positively oriented, or None if it never is. '''
+    with timed(statistics, 'time.bundle'):
         M = self.surfaces.twister.bundle(monodromy='*'.join(word))
-        # M = snappy.Manifold(self.surfaces.flipper('.'.join(word)).bundle(veering=False))
+    with timed(statistics, 'time.randomize'):
         for _ in range(self.options.max_randomize):  # Try, at most MAX_RANDOMIZE times, to find a solution for M.
-            if M.solution_type() == 'all tetrahedra positively oriented': break
+            if M.solution_type() == 'all tetrahedra positively oriented':
+                statistics['twister.loaded'] += 1
+                return M
+            statistics['randomize'] += 1
             M.randomize()  # There needs to be a better way to do this.
-        else:  # Couldn't find positive structure.
-            return pd.Series(Unloadable(self.surfaces.flipper(word).is_pseudo_anosov()))
-        
-        G = M.symmetry_group()
-        return pd.Series(Properties(
-            True,
-            True,
-            self.manifold_filter(self, M),
-            float(M.volume()),
-            str(M.isometry_signature()),
-            str(M.homology()),
-            int(G.order()),
-            str(G.abelianization()),
-            ))
-    
-    table[list(Properties._fields)] = table.apply(properties, axis=1)
+    
+    statistics['twister.failed'] += 1
+    return None  # Couldn't find positive structure.
+
+def load_veering_bundle(self, word, statistics):
+    ''' Return the bundle with monodromy `word` built from flipper's layered veering triangulation, or None if it is not positively oriented.
+    
+    Flipper drills extra (fake) cusps to make the triangulation veering, so these are filled along their fibre
+    slopes and the filled triangulation is returned, so that its triangulation_isosig describes the bundle. This
+    fails, with a flipper.AssumptionError, if word is not pseudo-Anosov. '''
+    with timed(statistics, 'time.flipper'):
+        try:
+            bundle = self.surfaces.flipper('.'.join(word)).bundle(veering=True)
+            M = snappy.Manifold(bundle.snappy_string()).filled_triangulation()
+        except WordTimeout:
+            raise
+        except Exception:
+            statistics['flipper.errors'] += 1
+            return None
+        if M.solution_type() != 'all tetrahedra positively oriented':
+            statistics['flipper.failed'] += 1
+            return None
+    
+    statistics['flipper.loaded'] += 1
+    return M
+
+def determine_properties_map(self, label, path, start, timeout, retry=False):
+    ''' Find the cheap properties of the words in the block of the word list at path that starts at the given row.
+    
+    The block is loaded by load_properties_map in a forked child process, which reports each word as it starts.
+    SIGALRM cannot interrupt a word that is stuck inside a call into SnapPy, so if a word is still running after
+    kill_after times its time limit (or its process dies) the child is killed, the word is set aside for the retry
+    pass (or, on the retry pass, recorded as having unknown properties) and a new child resumes the block from
+    its journal. Between words, such as while waiting for the properties store, the child is never killed. Returns the statistics of the block, less those of any child that was killed. '''
+    if timeout <= 0 or self.options.kill_after <= 0:
+        return load_properties_map(self, label, path, start, timeout, retry)
+    
+    part_path = self.options.properties_parts.format(label)
+    stage = 'retry' if retry else 'load'
+    statistics = Counter()
+    while True:
+        receiver, sender = Pipe(duplex=False)
+        pid = os.fork()  # Rather than a Process, since Pool workers are not allowed children.
+        if pid == 0:
+            receiver.close()
+            status = 1
+            try:
+                if self.properties_store is not None: self.properties_store._connection = None  # SQLite connections must not cross a fork.
+                sender.send(('done', load_properties_map(self, label, path, start, timeout, retry, sender)))
+                status = 0
+            except BaseException:
+                traceback.print_exc()
+            finally:
+                sys.stdout.flush()
+                sys.stderr.flush()
+                os._exit(status)
+        
+        sender.close()
+        word, result = None, None
+        while True:
+            if not receiver.poll(timeout * self.options.kill_after if word is not None else None):  # Only a word is timed, not the reads and store calls around it.
+                statistics[f'{stage}.killed'] += 1
+                os.kill(pid, signal.SIGKILL)
+                break
+            try:
+                kind, value = receiver.recv()
+            except EOFError:  # The child died, possibly inside SnapPy.
+                statistics[f'{stage}.crashed'] += 1
+                break
+            if kind == 'word':
+                word = value
+            else:
+                result = value
+                break
+        os.waitpid(pid, 0)
+        receiver.close()
+        
+        if result is not None:
+            statistics.update(result)
+            return dict(statistics)
+        if word is None:
+            raise RuntimeError(f'The process loading block {label} of {path} died outside of any word')
+        
+        # The journal and the list of retries exist, with their headers, since the child opened them before starting any word.
+        with open(part_path + '.partial' if retry else part_path + '.retry', 'a', newline='') as handle:
+            csv.writer(handle).writerow((word,) + UNKNOWN if retry else (word,))
+
+def load_properties_map(self, label, path, start, timeout, retry=False, progress=None):
+    ''' Find the cheap properties of the words in the block of the word list at path that starts at the given row.
+    
+    If given, the start of each word is sent through the progress connection, for determine_properties_map.
+    
+    The expensive ones (isom_sig, num_sym and ab_sym) are left empty for find_isometry_signatures_map and
+    find_symmetries_map to fill in, but only for the bundles that need them.
+    
+    Each word gets at most timeout seconds. Rows are journalled as they are found, so a restarted block
+    resumes where it stopped, and words that run out of time (or fail) are set aside for a retry pass.
+    On the retry pass they are recorded as having unknown properties instead.
+    
+    Returns the statistics of the block: how each word was decided and the time spent in each SnapPy call. '''
+    if self.options.show_progress: print('\rCollecting properties from block: %s' % label)
+    statistics = Counter()
+    
+    part_path = self.options.properties_parts.format(label)
+    journal_path = part_path + '.partial'
+    retry_path = part_path + '.retry'
+    
+    words = self.read_words(path, start, self.options.chunksize)
+    done = set()
+    for done_path in [journal_path, retry_path]:
+        if os.path.isfile(done_path) and os.path.getsize(done_path):
+            done.update(pd.read_csv(done_path, usecols=['word'], dtype={'word': str}, keep_default_na=False).word)
+    
+    Unloadable = lambda is_hyperbolic: Properties(is_hyperbolic, False, False, 0.0, 0, '', '', 0, 0)
+    
+    # Bundles that have been loaded before, possibly by another experiment on the same surface.
+    stored = dict()
+    if self.properties_store is not None:
+        with timed(statistics, 'time.store'):
+            stored = self.properties_store.get(self.surface_name, [word for word in words if word not in done])
+    new = []
+    
+    def properties(word):
+        ''' Return the properties associated with the mapping class `word`. '''
+        if word in stored:
+            statistics['stored'] += 1
+            known = stored[word]
+            if not known['loadable']:
+                acceptable = False
+            elif self.manifold_filter is basic_filter:
+                acceptable = True
+            else:  # Rebuild the manifold from its triangulation, which is much faster than loading it again.
+                with timed(statistics, 'time.reload'):
+                    acceptable = self.manifold_filter(self, snappy.Manifold(known['tri_isosig']))
+            return Properties(acceptable=acceptable, **known)
+        
+        M = load_bundle(self, word, statistics)
+        if M is None:
+            statistics['unloadable'] += 1
+            with timed(statistics, 'time.pseudo_anosov'):
+                result = Unloadable(bool(self.surfaces.flipper(word).is_pseudo_anosov()))
+            if not result.hyperbolic: new.append((word, result._asdict()))  # Another attempt might load a hyperbolic one.
+            return result
+        
+        with timed(statistics, 'time.filter'):
+            acceptable = self.manifold_filter(self, M)
+        with timed(statistics, 'time.volume'):
+            volume = float(M.volume())
+        with timed(statistics, 'time.homology'):
+            homology = str(M.homology())
+        with timed(statistics, 'time.tri_isosig'):
+            tri_isosig = M.triangulation_isosig(decorated=False)  # A positively oriented triangulation to reload M from.
+        
+        result = Properties(True, True, acceptable, volume, homology, tri_isosig, None, None, None)
+        new.append((word, result._asdict()))
+        return result
+    
+    with open(journal_path, 'a', newline='') as journal, open(retry_path, 'a', newline='') as retries:
+        journal_writer, retry_writer = csv.writer(journal), csv.writer(retries)
+        if not journal.tell(): journal_writer.writerow(('word',) + Properties._fields)
+        if not retries.tell(): retry_writer.writerow(('word',))
+        journal.flush()
+        retries.flush()
+        
+        for word in words:
+            if word in done: continue
+            if progress is not None: progress.send(('word', word))
+            statistics['words'] += 1
+            try:
+                with time_limit(timeout):
+                    result = properties(word)
+            except Exception as error:  # Including WordTimeout. Isolate this word so that it cannot stall or kill the block.
+                statistics['timeouts' if isinstance(error, WordTimeout) else 'failures'] += 1
+                if not retry:
+                    retry_writer.writerow((word,))
+                    retries.flush()
+                    continue
+                result = UNKNOWN
+            
+            journal_writer.writerow((word,) + result)
+            journal.flush()
+        if progress is not None: progress.send(('word', None))
+    
+    table = pd.read_csv(journal_path)
     table.sort_values('volume', inplace=True)
-    table.to_csv(self.options.properties_parts.format(label), index=False)
+    table.to_csv(part_path, index=False)
+    os.remove(journal_path)
+    if self.properties_store is not None and new:
+        with timed(statistics, 'time.store'):
+            self.properties_store.put(self.surface_name, new)
+    
+    return stage_statistics('retry' if retry else 'load', statistics)
+
+def find_isometry_signatures_map(self, words, tri_isosigs):
+    ''' Return the isometry signatures of the manifolds with the given triangulations. '''
+    if self.options.show_progress: print(f'\rFinding isometry signatures of {len(words)} manifolds')
+    
+    statistics = Counter(isometry_signatures=len(words))
+    with timed(statistics, 'time.isometry_signature'):
+        isom_sigs = [str(snappy.Manifold(tri_isosig).isometry_signature()) for tri_isosig in tri_isosigs]
+    if self.properties_store is not None: self.properties_store.put(self.surface_name, [(word, {'isom_sig': isom_sig}) for word, isom_sig in zip(words, isom_sigs)])
+    return isom_sigs, stage_statistics('load', statistics)
 
+def find_symmetries_map(self, words, tri_isosigs):
+    ''' Return the order and abelianisation of the symmetry groups of the manifolds with the given triangulations. '''
+    if self.options.show_progress: print(f'\rFinding symmetry groups of {len(words)} manifolds')
+    
+    statistics = Counter(symmetry_groups=len(words))
+    symmetries = []
+    with timed(statistics, 'time.symmetry_group'):
+        for tri_isosig in tri_isosigs:
+            G = snappy.Manifold(tri_isosig).symmetry_group()
+            symmetries.append((int(G.order()), str(G.abelianization())))
+    if self.properties_store is not None: self.properties_store.put(self.surface_name, [(word, {'num_sym': num_sym, 'ab_sym': ab_sym}) for word, (num_sym, ab_sym) in zip(words, symmetries)])
+    return symmetries, stage_statistics('thin', statistics)
@@ -0,0 +1,198 @@
+''' An index of published censuses, for finding which census word gives a SnapPy manifold.
+
+Each source (a census .txt of word, volume and homology, a matches.txt of name, volume, homology, word and maybe
+genus, or a census.csv written by CensusGenerator) is read once into its own part: a table in the format of storage,
+sorted by volume, plus a sorted array of the hashes of any isometry signatures. Parts are memory-mapped, so a volume
+query is a binary search per part and an isometry signature query is a binary search of its hashes.
+
+The manifest records the size and modification time of each source, so update only rereads the sources that
+have changed since their part was built. '''
+
+from collections import namedtuple
+import hashlib
+import json
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+from . import storage
+
+COLUMNS = ['word', 'surface', 'name', 'volume', 'homology', 'isom_sig']
+
+Part = namedtuple('Part', ('source', 'volume', 'isom_hash', 'isom_row'))
+
+def isom_hash(isom_sig):
+    ''' Return a 64-bit hash of the given isometry signature. '''
+    return int.from_bytes(hashlib.blake2b(isom_sig.encode('ascii'), digest_size=8).digest(), 'little')
+
+def surface_of(path):
+    ''' Return the name of the surface of the census at path, which is the name of the file or, for matches, of its directory. '''
+    if path.endswith('matches.txt'):
+        return os.path.basename(os.path.dirname(os.path.abspath(path)))
+    return os.path.splitext(os.path.basename(path))[0]
+
+def read_source(path, surface=None):
+    ''' Return a DataFrame of the COLUMNS of the census or matches at path, of the given surface (default from its path).
+    
+    Rows without a word or volume, such as the manifolds that were never matched and any header, are dropped. Matches
+    that give the genus of each (one cusped) fibre, such as knot_matches.txt, are of the surface S_<genus>_1. '''
+    if path.endswith('.csv'):
+        table = pd.read_csv(path, dtype={'word': str, 'homology': str, 'isom_sig': str}, keep_default_na=False)
+        if 'acceptable' in table: table = table[table.acceptable]
+    else:
+        names = ['name', 'volume', 'homology', 'word', 'genus'] if path.endswith('matches.txt') else ['word', 'volume', 'homology']
+        table = pd.read_csv(path, sep='\t', header=None, names=names, dtype=str, keep_default_na=False)
+    
+    if surface is not None:
+        table['surface'] = surface
+    else:
+        table['surface'] = surface_of(path)
+        if 'genus' in table:
+            genus = table.genus.fillna('')
+            table.loc[genus != '', 'surface'] = 'S_' + genus + '_1'
+    table = table.reindex(columns=COLUMNS)
+    table['volume'] = pd.to_numeric(table.volume, errors='coerce')
+    table = table[table.word.notna() & (table.word != '') & table.volume.notna()]
+    return table.sort_values('volume', kind='stable').reset_index(drop=True)
+
+def census_sources(root):
+    ''' Return the paths of the censuses and matches below root. '''
+    paths = []
+    for directory, _, names in os.walk(root):
+        paths.extend(os.path.join(directory, name) for name in names if name.endswith('.txt') and name != 'to_find.txt')
+    return sorted(paths)
+
+class CensusIndex():
+    ''' A memory-mapped index of censuses, stored in directory. '''
+    def __init__(self, directory, volume_tolerance=1e-6):
+        self.directory = directory
+        self.volume_tolerance = volume_tolerance
+        self.manifest_path = os.path.join(directory, 'manifest.json')
+        if os.path.isfile(self.manifest_path):
+            with open(self.manifest_path) as handle:
+                self.manifest = json.load(handle)  # Absolute path of source |--> dict(surface, size, mtime, rows, part), where surface is None if it comes from the source.
+        else:
+            self.manifest = dict()
+        self.parts = None  # The loaded Parts, None until they are first needed.
+    
+    def save_manifest(self):
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = f'{self.manifest_path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w') as handle:
+            json.dump(self.manifest, handle, indent=4)
+        os.replace(tmp_path, self.manifest_path)
+    
+    def part_directory(self, source):
+        return os.path.join(self.directory, hashlib.sha1(source.encode()).hexdigest()[:16])
+    
+    def build_part(self, source, surface):
+        ''' (Re)read the source into its part and record it in the manifest. '''
+        stat = os.stat(source)
+        table = read_source(source, surface)
+        directory = self.part_directory(source)
+        dtypes = dict((name, 'float64' if name == 'volume' else f'S{storage.string_width(table[name])}') for name in COLUMNS)
+        writer = storage.TableWriter(directory, dtypes, len(table))
+        writer.write(table)
+        writer.close()
+        
+        signed = np.flatnonzero(table.isom_sig.notna().to_numpy() & (table.isom_sig != '').to_numpy())
+        hashes = np.array([isom_hash(table.isom_sig[row]) for row in signed], dtype=np.uint64)
+        order = np.argsort(hashes, kind='stable')
+        storage.save_array(os.path.join(directory, 'isom_hash.npy'), hashes[order])
+        storage.save_array(os.path.join(directory, 'isom_row.npy'), signed[order].astype(np.int64))
+        
+        self.manifest[source] = dict(surface=surface, size=stat.st_size, mtime=stat.st_mtime_ns, rows=len(table), part=os.path.basename(directory))
+        self.parts = None
+    
+    def add(self, path, surface=None):
+        ''' Add the census at path, of the given surface (default from its path or rows), to the index.
+        
+        Returns whether its part had to be (re)built. '''
+        source = os.path.abspath(path)
+        stat = os.stat(source)
+        entry = self.manifest.get(source)
+        if entry is not None and (entry['surface'], entry['size'], entry['mtime']) == (surface, stat.st_size, stat.st_mtime_ns) and os.path.isdir(self.part_directory(source)):
+            return False
+        
+        self.build_part(source, surface)
+        self.save_manifest()
+        return True
+    
+    def update(self):
+        ''' Rebuild the parts of the sources that have changed and drop those of the sources that no longer exist.
+        
+        Returns the number of parts rebuilt. '''
+        rebuilt = 0
+        for source, entry in list(self.manifest.items()):
+            if os.path.isfile(source):
+                stat = os.stat(source)
+                if (entry['size'], entry['mtime']) != (stat.st_size, stat.st_mtime_ns) or not os.path.isdir(self.part_directory(source)):
+                    self.build_part(source, entry['surface'])
+                    rebuilt += 1
+            else:
+                shutil.rmtree(self.part_directory(source), ignore_errors=True)
+                del self.manifest[source]
+                self.parts = None
+        self.save_manifest()
+        return rebuilt
+    
+    def load_parts(self):
+        if self.parts is None:
+            self.parts = []
+            for source, entry in sorted(self.manifest.items()):
+                directory = os.path.join(self.directory, entry['part'])
+                self.parts.append(Part(
+                    source,
+                    storage.load_column(directory, 'volume'),
+                    np.load(os.path.join(directory, 'isom_hash.npy'), mmap_mode='r'),
+                    np.load(os.path.join(directory, 'isom_row.npy'), mmap_mode='r'),
+                    ))
+        return self.parts
+    
+    def rows(self, part, rows):
+        ''' Return a DataFrame of the given rows of part, with its source. '''
+        table = storage.load_table(os.path.join(self.directory, self.manifest[part.source]['part']), COLUMNS, rows=np.asarray(rows, dtype=np.int64))
+        table['source'] = part.source
+        return table
+    
+    def concatenate(self, tables):
+        tables = [table for table in tables if len(table)]
+        return pd.concat(tables, ignore_index=True) if tables else pd.DataFrame(columns=COLUMNS + ['source'])
+    
+    def by_volume(self, volume, homology=None):
+        ''' Return a DataFrame of the rows whose volume is within volume_tolerance of volume and, if given, whose homology is homology. '''
+        tables = []
+        for part in self.load_parts():
+            start, stop = np.searchsorted(part.volume, volume - self.volume_tolerance, side='left'), np.searchsorted(part.volume, volume + self.volume_tolerance, side='right')
+            if start < stop:
+                tables.append(self.rows(part, range(start, stop)))
+        table = self.concatenate(tables)
+        if homology is not None:
+            table = table[table.homology == homology].reset_index(drop=True)
+        return table
+    
+    def by_isom_sig(self, isom_sig):
+        ''' Return a DataFrame of the rows with the given isometry signature. '''
+        key = np.uint64(isom_hash(isom_sig))
+        tables = []
+        for part in self.load_parts():
+            start, stop = np.searchsorted(part.isom_hash, key, side='left'), np.searchsorted(part.isom_hash, key, side='right')
+            if start < stop:
+                tables.append(self.rows(part, np.sort(part.isom_row[start:stop])))
+        table = self.concatenate(tables)
+        return table[table.isom_sig == isom_sig].reset_index(drop=True)  # In case of a collision of hashes.
+    
+    def identify(self, M):
+        ''' Return a DataFrame of the census rows that could give the SnapPy manifold M.
+        
+        These are the rows whose volume and homology match those of M, except that rows whose isometry signature is
+        known must also match that of M. That of M is only computed if there are such rows, since it is the slow part,
+        and is then looked up in the isometry signature index. CensusGenerator records it for the bundles of its
+        census whose volume and homology collide with another's, which are exactly the ones that need it. '''
+        table = self.by_volume(float(M.volume()), str(M.homology()))
+        signed = table.isom_sig.notna() & (table.isom_sig != '')
+        if signed.any():
+            table = self.concatenate([table[~signed], self.by_isom_sig(str(M.isometry_signature()))]).drop_duplicates(['source', 'word']).reset_index(drop=True)
+        return table
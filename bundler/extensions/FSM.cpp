@@ -1003,8 +1003,8 @@ static const char *__pyx_filename;
 
 static const char *__pyx_f[] = {
   "bundler/extensions/FSM.pyx",
-  "array.pxd",
   "stringsource",
+  "array.pxd",
   "type.pxd",
   "bool.pxd",
   "complex.pxd",
@@ -1016,10 +1016,16 @@ struct arrayobject;
 typedef struct arrayobject arrayobject;
 #endif
 struct __pyx_obj_7bundler_10extensions_3FSM_FSM;
-struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts;
+struct __pyx_obj_7bundler_10extensions_3FSM_StatePath;
+struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap;
+struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct____init__;
 struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr;
-struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_2_genexpr;
-struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_3_hits;
+struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield;
+struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_3_genexpr;
+struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts;
+struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_5_genexpr;
+struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_6_genexpr;
+struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_7_hits;
 struct __pyx_opt_args_7bundler_10extensions_3FSM_3FSM_c_hit;
 struct __pyx_opt_args_7bundler_10extensions_3FSM_3FSM_c_hits;
 
@@ -1032,23 +1038,25 @@ struct __pyx_opt_args_7bundler_10extensions_3FSM_3FSM_c_hits;
  */
 typedef std::vector<int>  __pyx_t_7bundler_10extensions_3FSM_IWord;
 
-/* "bundler/extensions/FSM.pxd":23
+/* "bundler/extensions/FSM.pxd":27
  *     cdef vector[int] yield_states2_starts
  * 
- *     cdef bint c_hit(self, IWord& word, int run=*)             # <<<<<<<<<<<<<<
+ *     cdef bint c_hit(self, IWord& word, int run=*, int longest=*)             # <<<<<<<<<<<<<<
  *     cdef vector[pair[int, IWord]] c_hits(self, IWord& word, int run=*)
- * 
+ *     cdef int c_distance(self, IWord& word)
  */
 struct __pyx_opt_args_7bundler_10extensions_3FSM_3FSM_c_hit {
   int __pyx_n;
   int run;
+  int longest;
 };
 
-/* "bundler/extensions/FSM.pxd":24
+/* "bundler/extensions/FSM.pxd":28
  * 
- *     cdef bint c_hit(self, IWord& word, int run=*)
+ *     cdef bint c_hit(self, IWord& word, int run=*, int longest=*)
  *     cdef vector[pair[int, IWord]] c_hits(self, IWord& word, int run=*)             # <<<<<<<<<<<<<<
- * 
+ *     cdef int c_distance(self, IWord& word)
+ *     cdef bint c_has_cycle(self, IWord& word, int depth)
  */
 struct __pyx_opt_args_7bundler_10extensions_3FSM_3FSM_c_hits {
   int __pyx_n;
@@ -1059,7 +1067,7 @@ struct __pyx_opt_args_7bundler_10extensions_3FSM_3FSM_c_hits {
  * ctypedef vector[int] IWord
  * 
  * cdef class FSM:             # <<<<<<<<<<<<<<
- *     cdef list alphabet
+ *     cdef readonly list alphabet
  *     cdef int alphabet_len
  */
 struct __pyx_obj_7bundler_10extensions_3FSM_FSM {
@@ -1068,23 +1076,118 @@ struct __pyx_obj_7bundler_10extensions_3FSM_FSM {
   PyObject *alphabet;
   int alphabet_len;
   arrayobject *machine;
+  void *table;
+  int itemsize;
   int machine_len;
   PyObject *yield_states;
   PyObject *distance_to_yield;
+  arrayobject *distances;
   arrayobject *has_yield;
+  arrayobject *shortest_yield;
   std::vector<__pyx_t_7bundler_10extensions_3FSM_IWord>  yield_states2;
   std::vector<int>  yield_states2_starts;
 };
 
 
-/* "bundler/extensions/FSM.pyx":59
+/* "bundler/extensions/FSM.pxd":33
+ * 
+ * 
+ * cdef class StatePath:             # <<<<<<<<<<<<<<
+ *     cdef FSM machine
+ *     cdef vector[int] states
+ */
+struct __pyx_obj_7bundler_10extensions_3FSM_StatePath {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_7bundler_10extensions_3FSM_StatePath *__pyx_vtab;
+  struct __pyx_obj_7bundler_10extensions_3FSM_FSM *machine;
+  std::vector<int>  states;
+  std::vector<int>  hits;
+};
+
+
+/* "bundler/extensions/FSM.pxd":45
+ *     cdef int c_distance(self)
+ * 
+ * cdef class TransitionMap:             # <<<<<<<<<<<<<<
+ *     cdef FSM machine
+ *     cdef int width
+ */
+struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_7bundler_10extensions_3FSM_TransitionMap *__pyx_vtab;
+  struct __pyx_obj_7bundler_10extensions_3FSM_FSM *machine;
+  int width;
+  std::vector<int>  maps;
+};
+
+
+/* "bundler/extensions/FSM.pyx":52
+ * 
+ * cdef class FSM:
+ *     def __init__(self, alphabet, machine, yield_states, distance_to_yield=None):             # <<<<<<<<<<<<<<
+ *         cdef int start
+ *         cdef IWord x
+ */
+struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct____init__ {
+  PyObject_HEAD
+  struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self;
+  int __pyx_8genexpr1__pyx_v_state;
+};
+
+
+/* "bundler/extensions/FSM.pyx":76
+ * 
+ *         # The length of the shortest word that each state yields, states that do not yield are given a length larger than any word.
+ *         self.shortest_yield = array.array('i', [min((len(x) for x in self.yield_states.get(state, [])), default=UNREACHABLE) for state in range(self.machine_len)])             # <<<<<<<<<<<<<<
+ * 
+ *         if distance_to_yield is not None:  # Already known, for example when loading from a cache.
+ */
+struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr {
+  PyObject_HEAD
+  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct____init__ *__pyx_outer_scope;
+  PyObject *__pyx_v_x;
+  PyObject *__pyx_t_0;
+  Py_ssize_t __pyx_t_1;
+  PyObject *(*__pyx_t_2)(PyObject *);
+};
+
+
+/* "bundler/extensions/FSM.pyx":86
+ *         self.distances = array.array('i', [self.distance_to_yield.get(state, UNREACHABLE) for state in range(self.machine_len)])
+ * 
+ *     def find_distance_to_yield(self):             # <<<<<<<<<<<<<<
+ *         ''' Return a dictionary mapping each state to the length of the shortest word that takes it to a yield state. '''
+ *         cdef int state, new_state, i, j
+ */
+struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield {
+  PyObject_HEAD
+  std::vector<int>  __pyx_v_distances;
+  struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self;
+};
+
+
+/* "bundler/extensions/FSM.pyx":125
+ *                     to_check.push_back(reverse_arrows[j])
+ * 
+ *         return dict((state, distances[state]) for state in range(self.machine_len) if distances[state] >= 0)             # <<<<<<<<<<<<<<
+ * 
+ *     @classmethod
+ */
+struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_3_genexpr {
+  PyObject_HEAD
+  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield *__pyx_outer_scope;
+  int __pyx_v_state;
+};
+
+
+/* "bundler/extensions/FSM.pyx":128
  * 
  *     @classmethod
  *     def from_dicts(cls, list alphabet, object machine, dict hits):             # <<<<<<<<<<<<<<
  *         ''' Build a cFSM from an ordered dictionary of dictionaries and a dictionary mapping states to hits. '''
  * 
  */
-struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts {
+struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts {
   PyObject_HEAD
   PyObject *__pyx_v_hits;
   PyObject *__pyx_v_state_names;
@@ -1092,43 +1195,43 @@ struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts {
 };
 
 
-/* "bundler/extensions/FSM.pyx":65
+/* "bundler/extensions/FSM.pyx":134
  * 
  *         state_names = list(machine)
  *         state_names_index = dict((name, place) for place, name in enumerate(state_names))             # <<<<<<<<<<<<<<
  *         flattened_machine = [state_names_index.get(machine[state_name][letter], -1) for state_name in state_names for letter in alphabet]
  * 
  */
-struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr {
+struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_5_genexpr {
   PyObject_HEAD
-  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts *__pyx_outer_scope;
+  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts *__pyx_outer_scope;
   PyObject *__pyx_v_name;
   PyObject *__pyx_v_place;
 };
 
 
-/* "bundler/extensions/FSM.pyx":68
+/* "bundler/extensions/FSM.pyx":137
  *         flattened_machine = [state_names_index.get(machine[state_name][letter], -1) for state_name in state_names for letter in alphabet]
  * 
  *         return cls(alphabet, flattened_machine, dict((state_names_index[state], hits[state]) for state in hits))             # <<<<<<<<<<<<<<
  * 
  *     def __reduce__(self):
  */
-struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_2_genexpr {
+struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_6_genexpr {
   PyObject_HEAD
-  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts *__pyx_outer_scope;
+  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts *__pyx_outer_scope;
   PyObject *__pyx_v_state;
 };
 
 
-/* "bundler/extensions/FSM.pyx":122
+/* "bundler/extensions/FSM.pyx":211
  *         return returns
  * 
  *     def hits(self, tuple word, int run=-1):             # <<<<<<<<<<<<<<
  *         ''' Process word and yield (index, x) for all states that word hits that have things to yield. '''
  *         cdef int index = 0, letter
  */
-struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_3_hits {
+struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_7_hits {
   PyObject_HEAD
   int __pyx_v__;
   int __pyx_v_i;
@@ -1150,20 +1253,58 @@ struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_3_hits {
 
 
 
-/* "bundler/extensions/FSM.pyx":17
- * from queue import Queue
+/* "bundler/extensions/FSM.pyx":51
+ *         maps.push_back(state)
  * 
  * cdef class FSM:             # <<<<<<<<<<<<<<
- *     def __init__(self, alphabet, machine, yield_states):
+ *     def __init__(self, alphabet, machine, yield_states, distance_to_yield=None):
  *         cdef int start
  */
 
 struct __pyx_vtabstruct_7bundler_10extensions_3FSM_FSM {
   int (*c_hit)(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *, __pyx_t_7bundler_10extensions_3FSM_IWord &, struct __pyx_opt_args_7bundler_10extensions_3FSM_3FSM_c_hit *__pyx_optional_args);
   std::vector<std::pair<int,__pyx_t_7bundler_10extensions_3FSM_IWord> >  (*c_hits)(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *, __pyx_t_7bundler_10extensions_3FSM_IWord &, struct __pyx_opt_args_7bundler_10extensions_3FSM_3FSM_c_hits *__pyx_optional_args);
+  int (*c_distance)(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *, __pyx_t_7bundler_10extensions_3FSM_IWord &);
+  int (*c_has_cycle)(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *, __pyx_t_7bundler_10extensions_3FSM_IWord &, int);
 };
 static struct __pyx_vtabstruct_7bundler_10extensions_3FSM_FSM *__pyx_vtabptr_7bundler_10extensions_3FSM_FSM;
 
+
+/* "bundler/extensions/FSM.pyx":264
+ * 
+ * 
+ * cdef class StatePath:             # <<<<<<<<<<<<<<
+ *     ''' A stack of the states that an FSM passes through as it reads a word.
+ * 
+ */
+
+struct __pyx_vtabstruct_7bundler_10extensions_3FSM_StatePath {
+  void (*c_push)(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *, int);
+  void (*c_truncate)(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *, int);
+  void (*c_sync)(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *, __pyx_t_7bundler_10extensions_3FSM_IWord &, int);
+  int (*c_state)(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *);
+  int (*c_hit)(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *);
+  int (*c_distance)(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *);
+};
+static struct __pyx_vtabstruct_7bundler_10extensions_3FSM_StatePath *__pyx_vtabptr_7bundler_10extensions_3FSM_StatePath;
+
+
+/* "bundler/extensions/FSM.pyx":326
+ *         return self.c_distance()
+ * 
+ * cdef class TransitionMap:             # <<<<<<<<<<<<<<
+ *     ''' A stack of the maps that a word induces on the first width states of an FSM.
+ * 
+ */
+
+struct __pyx_vtabstruct_7bundler_10extensions_3FSM_TransitionMap {
+  void (*c_push)(struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *, int);
+  void (*c_truncate)(struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *, int);
+  void (*c_sync)(struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *, __pyx_t_7bundler_10extensions_3FSM_IWord &, int);
+  int (*c_has_fixed_point)(struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *);
+};
+static struct __pyx_vtabstruct_7bundler_10extensions_3FSM_TransitionMap *__pyx_vtabptr_7bundler_10extensions_3FSM_TransitionMap;
+
 /* --- Runtime support code (head) --- */
 /* Refnanny.proto */
 #ifndef CYTHON_REFNANNY
@@ -1238,6 +1379,47 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject
 /* GetBuiltinName.proto */
 static PyObject *__Pyx_GetBuiltinName(PyObject *name);
 
+/* PyThreadStateGet.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
+#define __Pyx_PyThreadState_assign  __pyx_tstate = __Pyx_PyThreadState_Current;
+#define __Pyx_PyErr_Occurred()  __pyx_tstate->curexc_type
+#else
+#define __Pyx_PyThreadState_declare
+#define __Pyx_PyThreadState_assign
+#define __Pyx_PyErr_Occurred()  PyErr_Occurred()
+#endif
+
+/* PyErrFetchRestore.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  __Pyx_ErrRestoreInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)    __Pyx_ErrFetchInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  __Pyx_ErrRestoreInState(__pyx_tstate, type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)    __Pyx_ErrFetchInState(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_PyErr_SetNone(exc) (Py_INCREF(exc), __Pyx_ErrRestore((exc), NULL, NULL))
+#else
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#endif
+#else
+#define __Pyx_PyErr_Clear() PyErr_Clear()
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestoreInState(tstate, type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchInState(tstate, type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
+#endif
+
+/* WriteUnraisableException.proto */
+static void __Pyx_WriteUnraisable(const char *name, int clineno,
+                                  int lineno, const char *filename,
+                                  int full_traceback, int nogil);
+
 /* RaiseArgTupleInvalid.proto */
 static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
     Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
@@ -1250,6 +1432,9 @@ static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],\
     PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,\
     const char* function_name);
 
+/* dict_getitem_default.proto */
+static PyObject* __Pyx_PyDict_GetItemDefault(PyObject* d, PyObject* key, PyObject* default_value);
+
 /* PyObjectCall.proto */
 #if CYTHON_COMPILING_IN_CPYTHON
 static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
@@ -1257,33 +1442,6 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg
 #define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
 #endif
 
-/* DivInt[Py_ssize_t].proto */
-static CYTHON_INLINE Py_ssize_t __Pyx_div_Py_ssize_t(Py_ssize_t, Py_ssize_t);
-
-/* UnaryNegOverflows.proto */
-#define UNARY_NEG_WOULD_OVERFLOW(x)\
-        (((x) < 0) & ((unsigned long)(x) == 0-(unsigned long)(x)))
-
-/* ListCompAppend.proto */
-#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
-static CYTHON_INLINE int __Pyx_ListComp_Append(PyObject* list, PyObject* x) {
-    PyListObject* L = (PyListObject*) list;
-    Py_ssize_t len = Py_SIZE(list);
-    if (likely(L->allocated > len)) {
-        Py_INCREF(x);
-        PyList_SET_ITEM(list, len, x);
-        __Pyx_SET_SIZE(list, len + 1);
-        return 0;
-    }
-    return PyList_Append(list, x);
-}
-#else
-#define __Pyx_ListComp_Append(L,x) PyList_Append(L,x)
-#endif
-
-/* dict_getitem_default.proto */
-static PyObject* __Pyx_PyDict_GetItemDefault(PyObject* d, PyObject* key, PyObject* default_value);
-
 /* UnpackUnboundCMethod.proto */
 typedef struct {
     PyObject *type;
@@ -1309,51 +1467,32 @@ static CYTHON_INLINE PyObject *__Pyx_CallUnboundCMethod2(__Pyx_CachedCFunction *
 #define __Pyx_CallUnboundCMethod2(cfunc, self, arg1, arg2)  __Pyx__CallUnboundCMethod2(cfunc, self, arg1, arg2)
 #endif
 
-/* PyCFunctionFastCall.proto */
-#if CYTHON_FAST_PYCCALL
-static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObject **args, Py_ssize_t nargs);
-#else
-#define __Pyx_PyCFunction_FastCall(func, args, nargs)  (assert(0), NULL)
-#endif
+/* None.proto */
+static CYTHON_INLINE void __Pyx_RaiseClosureNameError(const char *varname);
 
-/* PyFunctionFastCall.proto */
-#if CYTHON_FAST_PYCALL
-#define __Pyx_PyFunction_FastCall(func, args, nargs)\
-    __Pyx_PyFunction_FastCallDict((func), (args), (nargs), NULL)
-#if 1 || PY_VERSION_HEX < 0x030600B1
-static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs);
-#else
-#define __Pyx_PyFunction_FastCallDict(func, args, nargs, kwargs) _PyFunction_FastCallDict(func, args, nargs, kwargs)
-#endif
-#define __Pyx_BUILD_ASSERT_EXPR(cond)\
-    (sizeof(char [1 - 2*!(cond)]) - 1)
-#ifndef Py_MEMBER_SIZE
-#define Py_MEMBER_SIZE(type, member) sizeof(((type *)0)->member)
-#endif
-#if CYTHON_FAST_PYCALL
-  static size_t __pyx_pyframe_localsplus_offset = 0;
-  #include "frameobject.h"
-#if PY_VERSION_HEX >= 0x030b00a6
-  #ifndef Py_BUILD_CORE
-    #define Py_BUILD_CORE 1
-  #endif
-  #include "internal/pycore_frame.h"
-#endif
-  #define __Pxy_PyFrame_Initialize_Offsets()\
-    ((void)__Pyx_BUILD_ASSERT_EXPR(sizeof(PyFrameObject) == offsetof(PyFrameObject, f_localsplus) + Py_MEMBER_SIZE(PyFrameObject, f_localsplus)),\
-     (void)(__pyx_pyframe_localsplus_offset = ((size_t)PyFrame_Type.tp_basicsize) - Py_MEMBER_SIZE(PyFrameObject, f_localsplus)))
-  #define __Pyx_PyFrame_GetLocalsplus(frame)\
-    (assert(__pyx_pyframe_localsplus_offset), (PyObject **)(((char *)(frame)) + __pyx_pyframe_localsplus_offset))
-#endif // CYTHON_FAST_PYCALL
-#endif
+/* DivInt[Py_ssize_t].proto */
+static CYTHON_INLINE Py_ssize_t __Pyx_div_Py_ssize_t(Py_ssize_t, Py_ssize_t);
 
-/* PyObjectCallMethO.proto */
-#if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
-#endif
+/* UnaryNegOverflows.proto */
+#define UNARY_NEG_WOULD_OVERFLOW(x)\
+        (((x) < 0) & ((unsigned long)(x) == 0-(unsigned long)(x)))
 
-/* PyObjectCallOneArg.proto */
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
+/* ListCompAppend.proto */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
+static CYTHON_INLINE int __Pyx_ListComp_Append(PyObject* list, PyObject* x) {
+    PyListObject* L = (PyListObject*) list;
+    Py_ssize_t len = Py_SIZE(list);
+    if (likely(L->allocated > len)) {
+        Py_INCREF(x);
+        PyList_SET_ITEM(list, len, x);
+        __Pyx_SET_SIZE(list, len + 1);
+        return 0;
+    }
+    return PyList_Append(list, x);
+}
+#else
+#define __Pyx_ListComp_Append(L,x) PyList_Append(L,x)
+#endif
 
 /* PyDictVersioning.proto */
 #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
@@ -1402,64 +1541,52 @@ static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_ve
 static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
 #endif
 
-/* PyObjectCall2Args.proto */
-static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2);
+/* PyCFunctionFastCall.proto */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObject **args, Py_ssize_t nargs);
+#else
+#define __Pyx_PyCFunction_FastCall(func, args, nargs)  (assert(0), NULL)
+#endif
 
-/* ListAppend.proto */
-#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
-static CYTHON_INLINE int __Pyx_PyList_Append(PyObject* list, PyObject* x) {
-    PyListObject* L = (PyListObject*) list;
-    Py_ssize_t len = Py_SIZE(list);
-    if (likely(L->allocated > len) & likely(len > (L->allocated >> 1))) {
-        Py_INCREF(x);
-        PyList_SET_ITEM(list, len, x);
-        __Pyx_SET_SIZE(list, len + 1);
-        return 0;
-    }
-    return PyList_Append(list, x);
-}
+/* PyFunctionFastCall.proto */
+#if CYTHON_FAST_PYCALL
+#define __Pyx_PyFunction_FastCall(func, args, nargs)\
+    __Pyx_PyFunction_FastCallDict((func), (args), (nargs), NULL)
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs);
 #else
-#define __Pyx_PyList_Append(L,x) PyList_Append(L,x)
+#define __Pyx_PyFunction_FastCallDict(func, args, nargs, kwargs) _PyFunction_FastCallDict(func, args, nargs, kwargs)
+#endif
+#define __Pyx_BUILD_ASSERT_EXPR(cond)\
+    (sizeof(char [1 - 2*!(cond)]) - 1)
+#ifndef Py_MEMBER_SIZE
+#define Py_MEMBER_SIZE(type, member) sizeof(((type *)0)->member)
+#endif
+#if CYTHON_FAST_PYCALL
+  static size_t __pyx_pyframe_localsplus_offset = 0;
+  #include "frameobject.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+  #define __Pxy_PyFrame_Initialize_Offsets()\
+    ((void)__Pyx_BUILD_ASSERT_EXPR(sizeof(PyFrameObject) == offsetof(PyFrameObject, f_localsplus) + Py_MEMBER_SIZE(PyFrameObject, f_localsplus)),\
+     (void)(__pyx_pyframe_localsplus_offset = ((size_t)PyFrame_Type.tp_basicsize) - Py_MEMBER_SIZE(PyFrameObject, f_localsplus)))
+  #define __Pyx_PyFrame_GetLocalsplus(frame)\
+    (assert(__pyx_pyframe_localsplus_offset), (PyObject **)(((char *)(frame)) + __pyx_pyframe_localsplus_offset))
+#endif // CYTHON_FAST_PYCALL
 #endif
 
-/* PyObjectGetMethod.proto */
-static int __Pyx_PyObject_GetMethod(PyObject *obj, PyObject *name, PyObject **method);
-
-/* PyObjectCallMethod1.proto */
-static PyObject* __Pyx_PyObject_CallMethod1(PyObject* obj, PyObject* method_name, PyObject* arg);
-
-/* append.proto */
-static CYTHON_INLINE int __Pyx_PyObject_Append(PyObject* L, PyObject* x);
-
-/* GetItemInt.proto */
-#define __Pyx_GetItemInt(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
-    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
-    __Pyx_GetItemInt_Fast(o, (Py_ssize_t)i, is_list, wraparound, boundscheck) :\
-    (is_list ? (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL) :\
-               __Pyx_GetItemInt_Generic(o, to_py_func(i))))
-#define __Pyx_GetItemInt_List(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
-    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
-    __Pyx_GetItemInt_List_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
-    (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
-                                                              int wraparound, int boundscheck);
-#define __Pyx_GetItemInt_Tuple(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
-    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
-    __Pyx_GetItemInt_Tuple_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
-    (PyErr_SetString(PyExc_IndexError, "tuple index out of range"), (PyObject*)NULL))
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
-                                                              int wraparound, int boundscheck);
-static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j);
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
-                                                     int is_list, int wraparound, int boundscheck);
-
-/* ObjectGetItem.proto */
-#if CYTHON_USE_TYPE_SLOTS
-static CYTHON_INLINE PyObject *__Pyx_PyObject_GetItem(PyObject *obj, PyObject* key);
-#else
-#define __Pyx_PyObject_GetItem(obj, key)  PyObject_GetItem(obj, key)
+/* PyObjectCallMethO.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
 #endif
 
+/* PyObjectCallOneArg.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
+
 /* PyObjectCallNoArg.proto */
 #if CYTHON_COMPILING_IN_CPYTHON
 static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
@@ -1467,11 +1594,11 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
 #define __Pyx_PyObject_CallNoArg(func) __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL)
 #endif
 
-/* PyDictContains.proto */
-static CYTHON_INLINE int __Pyx_PyDict_ContainsTF(PyObject* item, PyObject* dict, int eq) {
-    int result = PyDict_Contains(dict, item);
-    return unlikely(result < 0) ? result : (result == (eq == Py_EQ));
-}
+/* ArgTypeTest.proto */
+#define __Pyx_ArgTypeTest(obj, type, none_allowed, name, exact)\
+    ((likely((Py_TYPE(obj) == type) | (none_allowed && (obj == Py_None)))) ? 1 :\
+        __Pyx__ArgTypeTest(obj, type, name, exact))
+static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact);
 
 /* PyIntBinop.proto */
 #if !CYTHON_COMPILING_IN_PYPY
@@ -1481,29 +1608,12 @@ static PyObject* __Pyx_PyInt_AddObjC(PyObject *op1, PyObject *op2, long intval,
     (inplace ? PyNumber_InPlaceAdd(op1, op2) : PyNumber_Add(op1, op2))
 #endif
 
-/* DictGetItem.proto */
-#if PY_MAJOR_VERSION >= 3 && !CYTHON_COMPILING_IN_PYPY
-static PyObject *__Pyx_PyDict_GetItem(PyObject *d, PyObject* key);
-#define __Pyx_PyObject_Dict_GetItem(obj, name)\
-    (likely(PyDict_CheckExact(obj)) ?\
-     __Pyx_PyDict_GetItem(obj, name) : PyObject_GetItem(obj, name))
-#else
-#define __Pyx_PyDict_GetItem(d, key) PyObject_GetItem(d, key)
-#define __Pyx_PyObject_Dict_GetItem(obj, name)  PyObject_GetItem(obj, name)
-#endif
-
-/* ArgTypeTest.proto */
-#define __Pyx_ArgTypeTest(obj, type, none_allowed, name, exact)\
-    ((likely((Py_TYPE(obj) == type) | (none_allowed && (obj == Py_None)))) ? 1 :\
-        __Pyx__ArgTypeTest(obj, type, name, exact))
-static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact);
-
-/* None.proto */
-static CYTHON_INLINE void __Pyx_RaiseClosureNameError(const char *varname);
-
 /* IterFinish.proto */
 static CYTHON_INLINE int __Pyx_IterFinish(void);
 
+/* PyObjectGetMethod.proto */
+static int __Pyx_PyObject_GetMethod(PyObject *obj, PyObject *name, PyObject **method);
+
 /* PyObjectCallMethod0.proto */
 static PyObject* __Pyx_PyObject_CallMethod0(PyObject* obj, PyObject* method_name);
 
@@ -1540,49 +1650,115 @@ static CYTHON_INLINE PyObject* __Pyx_dict_iterator(PyObject* dict, int is_dict,
 static CYTHON_INLINE int __Pyx_dict_iter_next(PyObject* dict_or_iter, Py_ssize_t orig_length, Py_ssize_t* ppos,
                                               PyObject** pkey, PyObject** pvalue, PyObject** pitem, int is_dict);
 
-/* PyThreadStateGet.proto */
-#if CYTHON_FAST_THREAD_STATE
-#define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
-#define __Pyx_PyThreadState_assign  __pyx_tstate = __Pyx_PyThreadState_Current;
-#define __Pyx_PyErr_Occurred()  __pyx_tstate->curexc_type
+/* DictGetItem.proto */
+#if PY_MAJOR_VERSION >= 3 && !CYTHON_COMPILING_IN_PYPY
+static PyObject *__Pyx_PyDict_GetItem(PyObject *d, PyObject* key);
+#define __Pyx_PyObject_Dict_GetItem(obj, name)\
+    (likely(PyDict_CheckExact(obj)) ?\
+     __Pyx_PyDict_GetItem(obj, name) : PyObject_GetItem(obj, name))
 #else
-#define __Pyx_PyThreadState_declare
-#define __Pyx_PyThreadState_assign
-#define __Pyx_PyErr_Occurred()  PyErr_Occurred()
+#define __Pyx_PyDict_GetItem(d, key) PyObject_GetItem(d, key)
+#define __Pyx_PyObject_Dict_GetItem(obj, name)  PyObject_GetItem(obj, name)
 #endif
 
-/* PyErrFetchRestore.proto */
+/* GetItemInt.proto */
+#define __Pyx_GetItemInt(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Fast(o, (Py_ssize_t)i, is_list, wraparound, boundscheck) :\
+    (is_list ? (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL) :\
+               __Pyx_GetItemInt_Generic(o, to_py_func(i))))
+#define __Pyx_GetItemInt_List(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_List_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+#define __Pyx_GetItemInt_Tuple(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Tuple_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "tuple index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j);
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
+                                                     int is_list, int wraparound, int boundscheck);
+
+/* ObjectGetItem.proto */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject *__Pyx_PyObject_GetItem(PyObject *obj, PyObject* key);
+#else
+#define __Pyx_PyObject_GetItem(obj, key)  PyObject_GetItem(obj, key)
+#endif
+
+/* PyObjectCall2Args.proto */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2);
+
+/* RaiseException.proto */
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
+
+/* PyErrExceptionMatches.proto */
 #if CYTHON_FAST_THREAD_STATE
-#define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
-#define __Pyx_ErrRestoreWithState(type, value, tb)  __Pyx_ErrRestoreInState(PyThreadState_GET(), type, value, tb)
-#define __Pyx_ErrFetchWithState(type, value, tb)    __Pyx_ErrFetchInState(PyThreadState_GET(), type, value, tb)
-#define __Pyx_ErrRestore(type, value, tb)  __Pyx_ErrRestoreInState(__pyx_tstate, type, value, tb)
-#define __Pyx_ErrFetch(type, value, tb)    __Pyx_ErrFetchInState(__pyx_tstate, type, value, tb)
-static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
-static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
-#if CYTHON_COMPILING_IN_CPYTHON
-#define __Pyx_PyErr_SetNone(exc) (Py_INCREF(exc), __Pyx_ErrRestore((exc), NULL, NULL))
+#define __Pyx_PyErr_ExceptionMatches(err) __Pyx_PyErr_ExceptionMatchesInState(__pyx_tstate, err)
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err);
 #else
-#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#define __Pyx_PyErr_ExceptionMatches(err)  PyErr_ExceptionMatches(err)
 #endif
+
+/* GetAttr.proto */
+static CYTHON_INLINE PyObject *__Pyx_GetAttr(PyObject *, PyObject *);
+
+/* GetAttr3.proto */
+static CYTHON_INLINE PyObject *__Pyx_GetAttr3(PyObject *, PyObject *, PyObject *);
+
+/* DivInt[int].proto */
+static CYTHON_INLINE int __Pyx_div_int(int, int);
+
+/* ListAppend.proto */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
+static CYTHON_INLINE int __Pyx_PyList_Append(PyObject* list, PyObject* x) {
+    PyListObject* L = (PyListObject*) list;
+    Py_ssize_t len = Py_SIZE(list);
+    if (likely(L->allocated > len) & likely(len > (L->allocated >> 1))) {
+        Py_INCREF(x);
+        PyList_SET_ITEM(list, len, x);
+        __Pyx_SET_SIZE(list, len + 1);
+        return 0;
+    }
+    return PyList_Append(list, x);
+}
 #else
-#define __Pyx_PyErr_Clear() PyErr_Clear()
-#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
-#define __Pyx_ErrRestoreWithState(type, value, tb)  PyErr_Restore(type, value, tb)
-#define __Pyx_ErrFetchWithState(type, value, tb)  PyErr_Fetch(type, value, tb)
-#define __Pyx_ErrRestoreInState(tstate, type, value, tb)  PyErr_Restore(type, value, tb)
-#define __Pyx_ErrFetchInState(tstate, type, value, tb)  PyErr_Fetch(type, value, tb)
-#define __Pyx_ErrRestore(type, value, tb)  PyErr_Restore(type, value, tb)
-#define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_PyList_Append(L,x) PyList_Append(L,x)
 #endif
 
-/* RaiseException.proto */
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
+/* PyObjectCallMethod1.proto */
+static PyObject* __Pyx_PyObject_CallMethod1(PyObject* obj, PyObject* method_name, PyObject* arg);
 
-/* WriteUnraisableException.proto */
-static void __Pyx_WriteUnraisable(const char *name, int clineno,
-                                  int lineno, const char *filename,
-                                  int full_traceback, int nogil);
+/* append.proto */
+static CYTHON_INLINE int __Pyx_PyObject_Append(PyObject* L, PyObject* x);
+
+/* dict_setdefault.proto */
+static CYTHON_INLINE PyObject *__Pyx_PyDict_SetDefault(PyObject *d, PyObject *key, PyObject *default_value, int is_safe_type);
+
+/* ModInt[int].proto */
+static CYTHON_INLINE int __Pyx_mod_int(int, int);
+
+/* PySequenceContains.proto */
+static CYTHON_INLINE int __Pyx_PySequence_ContainsTF(PyObject* item, PyObject* seq, int eq) {
+    int result = PySequence_Contains(seq, item);
+    return unlikely(result < 0) ? result : (result == (eq == Py_EQ));
+}
+
+/* Import.proto */
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level);
+
+/* ImportFrom.proto */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name);
+
+/* ExtTypeTest.proto */
+static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type);
+
+/* HasAttr.proto */
+static CYTHON_INLINE int __Pyx_HasAttr(PyObject *, PyObject *);
 
 /* IncludeStringH.proto */
 #include <string.h>
@@ -1604,6 +1780,12 @@ static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_nam
 /* SetVTable.proto */
 static int __Pyx_SetVtable(PyObject *dict, void *vtable);
 
+/* PyObjectGetAttrStrNoError.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name);
+
+/* SetupReduce.proto */
+static int __Pyx_setup_reduce(PyObject* type_obj);
+
 /* TypeImport.proto */
 #ifndef __PYX_HAVE_RT_ImportType_proto
 #define __PYX_HAVE_RT_ImportType_proto
@@ -1623,24 +1805,10 @@ enum __Pyx_ImportType_CheckSize {
 static PyTypeObject *__Pyx_ImportType(PyObject* module, const char *module_name, const char *class_name, size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize check_size);
 #endif
 
-/* Import.proto */
-static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level);
-
-/* ImportFrom.proto */
-static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name);
-
 /* ClassMethod.proto */
 #include "descrobject.h"
 static CYTHON_UNUSED PyObject* __Pyx_Method_ClassMethod(PyObject *method);
 
-/* PyErrExceptionMatches.proto */
-#if CYTHON_FAST_THREAD_STATE
-#define __Pyx_PyErr_ExceptionMatches(err) __Pyx_PyErr_ExceptionMatchesInState(__pyx_tstate, err)
-static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err);
-#else
-#define __Pyx_PyErr_ExceptionMatches(err)  PyErr_ExceptionMatches(err)
-#endif
-
 /* GetNameInClass.proto */
 #define __Pyx_GetNameInClass(var, nmspace, name)  (var) = __Pyx__GetNameInClass(nmspace, name)
 static PyObject *__Pyx__GetNameInClass(PyObject *nmspace, PyObject *name);
@@ -1836,17 +2004,23 @@ static void __Pyx_CppExn2PyErr() {
 }
 #endif
 
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
+
 /* CIntFromPy.proto */
 static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
 
-/* CIntToPy.proto */
-static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
+/* CIntFromPy.proto */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
 
 /* CIntToPy.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
 
 /* CIntFromPy.proto */
-static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
+static CYTHON_INLINE size_t __Pyx_PyInt_As_size_t(PyObject *);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_char(char value);
 
 /* FastTypeChecks.proto */
 #if CYTHON_COMPILING_IN_CPYTHON
@@ -1970,8 +2144,20 @@ static int __Pyx_check_binary_version(void);
 /* InitStrings.proto */
 static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
 
+static int __pyx_f_7bundler_10extensions_3FSM_3FSM_c_distance(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self, __pyx_t_7bundler_10extensions_3FSM_IWord &__pyx_v_word); /* proto*/
 static int __pyx_f_7bundler_10extensions_3FSM_3FSM_c_hit(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self, __pyx_t_7bundler_10extensions_3FSM_IWord &__pyx_v_word, struct __pyx_opt_args_7bundler_10extensions_3FSM_3FSM_c_hit *__pyx_optional_args); /* proto*/
 static std::vector<std::pair<int,__pyx_t_7bundler_10extensions_3FSM_IWord> >  __pyx_f_7bundler_10extensions_3FSM_3FSM_c_hits(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self, __pyx_t_7bundler_10extensions_3FSM_IWord &__pyx_v_word, struct __pyx_opt_args_7bundler_10extensions_3FSM_3FSM_c_hits *__pyx_optional_args); /* proto*/
+static int __pyx_f_7bundler_10extensions_3FSM_3FSM_c_has_cycle(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self, __pyx_t_7bundler_10extensions_3FSM_IWord &__pyx_v_word, int __pyx_v_depth); /* proto*/
+static void __pyx_f_7bundler_10extensions_3FSM_9StatePath_c_push(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *__pyx_v_self, int __pyx_v_letter); /* proto*/
+static void __pyx_f_7bundler_10extensions_3FSM_9StatePath_c_truncate(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *__pyx_v_self, int __pyx_v_depth); /* proto*/
+static void __pyx_f_7bundler_10extensions_3FSM_9StatePath_c_sync(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *__pyx_v_self, __pyx_t_7bundler_10extensions_3FSM_IWord &__pyx_v_word, int __pyx_v_depth); /* proto*/
+static int __pyx_f_7bundler_10extensions_3FSM_9StatePath_c_state(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *__pyx_v_self); /* proto*/
+static int __pyx_f_7bundler_10extensions_3FSM_9StatePath_c_hit(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *__pyx_v_self); /* proto*/
+static int __pyx_f_7bundler_10extensions_3FSM_9StatePath_c_distance(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *__pyx_v_self); /* proto*/
+static void __pyx_f_7bundler_10extensions_3FSM_13TransitionMap_c_push(struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *__pyx_v_self, int __pyx_v_letter); /* proto*/
+static void __pyx_f_7bundler_10extensions_3FSM_13TransitionMap_c_truncate(struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *__pyx_v_self, int __pyx_v_depth); /* proto*/
+static void __pyx_f_7bundler_10extensions_3FSM_13TransitionMap_c_sync(struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *__pyx_v_self, __pyx_t_7bundler_10extensions_3FSM_IWord &__pyx_v_word, int __pyx_v_depth); /* proto*/
+static int __pyx_f_7bundler_10extensions_3FSM_13TransitionMap_c_has_fixed_point(struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *__pyx_v_self); /* proto*/
 
 /* Module declarations from 'cpython.version' */
 
@@ -2076,10 +2262,26 @@ static CYTHON_INLINE int __pyx_f_7cpython_5array_extend_buffer(arrayobject *, ch
 
 /* Module declarations from 'bundler.extensions.FSM' */
 static PyTypeObject *__pyx_ptype_7bundler_10extensions_3FSM_FSM = 0;
-static PyTypeObject *__pyx_ptype_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts = 0;
+static PyTypeObject *__pyx_ptype_7bundler_10extensions_3FSM_StatePath = 0;
+static PyTypeObject *__pyx_ptype_7bundler_10extensions_3FSM_TransitionMap = 0;
+static PyTypeObject *__pyx_ptype_7bundler_10extensions_3FSM___pyx_scope_struct____init__ = 0;
 static PyTypeObject *__pyx_ptype_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr = 0;
-static PyTypeObject *__pyx_ptype_7bundler_10extensions_3FSM___pyx_scope_struct_2_genexpr = 0;
-static PyTypeObject *__pyx_ptype_7bundler_10extensions_3FSM___pyx_scope_struct_3_hits = 0;
+static PyTypeObject *__pyx_ptype_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield = 0;
+static PyTypeObject *__pyx_ptype_7bundler_10extensions_3FSM___pyx_scope_struct_3_genexpr = 0;
+static PyTypeObject *__pyx_ptype_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts = 0;
+static PyTypeObject *__pyx_ptype_7bundler_10extensions_3FSM___pyx_scope_struct_5_genexpr = 0;
+static PyTypeObject *__pyx_ptype_7bundler_10extensions_3FSM___pyx_scope_struct_6_genexpr = 0;
+static PyTypeObject *__pyx_ptype_7bundler_10extensions_3FSM___pyx_scope_struct_7_hits = 0;
+static CYTHON_INLINE int __pyx_f_7bundler_10extensions_3FSM_step(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *, int, int); /*proto*/
+static CYTHON_INLINE int __pyx_fuse_0__pyx_f_7bundler_10extensions_3FSM_follow(signed char *, int, int, __pyx_t_7bundler_10extensions_3FSM_IWord &); /*proto*/
+static CYTHON_INLINE int __pyx_fuse_1__pyx_f_7bundler_10extensions_3FSM_follow(short *, int, int, __pyx_t_7bundler_10extensions_3FSM_IWord &); /*proto*/
+static CYTHON_INLINE int __pyx_fuse_2__pyx_f_7bundler_10extensions_3FSM_follow(int *, int, int, __pyx_t_7bundler_10extensions_3FSM_IWord &); /*proto*/
+static CYTHON_INLINE void __pyx_fuse_0__pyx_f_7bundler_10extensions_3FSM_compose(signed char *, int, std::vector<int>  &, int, int); /*proto*/
+static CYTHON_INLINE void __pyx_fuse_1__pyx_f_7bundler_10extensions_3FSM_compose(short *, int, std::vector<int>  &, int, int); /*proto*/
+static CYTHON_INLINE void __pyx_fuse_2__pyx_f_7bundler_10extensions_3FSM_compose(int *, int, std::vector<int>  &, int, int); /*proto*/
+static PyObject *__pyx_f_7bundler_10extensions_3FSM___pyx_unpickle_StatePath__set_state(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *, PyObject *); /*proto*/
+static PyObject *__pyx_f_7bundler_10extensions_3FSM___pyx_unpickle_TransitionMap__set_state(struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *, PyObject *); /*proto*/
+static PyObject *__pyx_convert_vector_to_py_int(const std::vector<int>  &); /*proto*/
 static std::vector<int>  __pyx_convert_vector_from_py_int(PyObject *); /*proto*/
 #define __Pyx_MODULE_NAME "bundler.extensions.FSM"
 extern int __pyx_module_is_main_bundler__extensions__FSM;
@@ -2087,1213 +2289,986 @@ int __pyx_module_is_main_bundler__extensions__FSM = 0;
 
 /* Implementation of 'bundler.extensions.FSM' */
 static PyObject *__pyx_builtin_range;
+static PyObject *__pyx_builtin_min;
 static PyObject *__pyx_builtin_enumerate;
 static PyObject *__pyx_builtin_ValueError;
 static PyObject *__pyx_builtin_MemoryError;
+static const char __pyx_k_N[] = "N";
+static const char __pyx_k_b[] = "b";
+static const char __pyx_k_h[] = "h";
 static const char __pyx_k_i[] = "i";
+static const char __pyx_k_j[] = "j";
+static const char __pyx_k_n[] = "n";
+static const char __pyx_k_np[] = "np";
 static const char __pyx_k_FSM[] = "FSM";
+static const char __pyx_k_any[] = "any";
 static const char __pyx_k_get[] = "get";
-static const char __pyx_k_put[] = "put";
+static const char __pyx_k_min[] = "min";
+static const char __pyx_k_new[] = "__new__";
 static const char __pyx_k_run[] = "run";
 static const char __pyx_k_args[] = "args";
+static const char __pyx_k_axis[] = "axis";
+static const char __pyx_k_dict[] = "__dict__";
+static const char __pyx_k_fail[] = "fail";
+static const char __pyx_k_flat[] = "flat";
+static const char __pyx_k_full[] = "full";
+static const char __pyx_k_head[] = "head";
 static const char __pyx_k_hits[] = "hits";
+static const char __pyx_k_intc[] = "intc";
+static const char __pyx_k_intp[] = "intp";
+static const char __pyx_k_last[] = "last";
 static const char __pyx_k_main[] = "__main__";
 static const char __pyx_k_name[] = "__name__";
 static const char __pyx_k_send[] = "send";
 static const char __pyx_k_test[] = "__test__";
+static const char __pyx_k_tile[] = "tile";
 static const char __pyx_k_word[] = "word";
-static const char __pyx_k_Queue[] = "Queue";
 static const char __pyx_k_array[] = "array";
+static const char __pyx_k_block[] = "block";
+static const char __pyx_k_child[] = "child";
 static const char __pyx_k_class[] = "__class__";
 static const char __pyx_k_close[] = "close";
 static const char __pyx_k_depth[] = "depth";
-static const char __pyx_k_empty[] = "empty";
-static const char __pyx_k_queue[] = "queue";
+static const char __pyx_k_dtype[] = "dtype";
+static const char __pyx_k_numpy[] = "numpy";
+static const char __pyx_k_order[] = "order";
 static const char __pyx_k_range[] = "range";
+static const char __pyx_k_shape[] = "shape";
+static const char __pyx_k_start[] = "start";
 static const char __pyx_k_state[] = "state";
 static const char __pyx_k_throw[] = "throw";
+static const char __pyx_k_words[] = "words";
 static const char __pyx_k_append[] = "append";
+static const char __pyx_k_arange[] = "arange";
+static const char __pyx_k_blocks[] = "blocks";
 static const char __pyx_k_format[] = "format";
 static const char __pyx_k_import[] = "__import__";
+static const char __pyx_k_labels[] = "labels";
+static const char __pyx_k_letter[] = "letter";
+static const char __pyx_k_marked[] = "marked";
+static const char __pyx_k_middle[] = "middle";
+static const char __pyx_k_parent[] = "parent";
+static const char __pyx_k_pickle[] = "pickle";
+static const char __pyx_k_reduce[] = "__reduce__";
+static const char __pyx_k_target[] = "target";
+static const char __pyx_k_update[] = "update";
+static const char __pyx_k_vstack[] = "vstack";
+static const char __pyx_k_asarray[] = "asarray";
+static const char __pyx_k_default[] = "default";
 static const char __pyx_k_genexpr[] = "genexpr";
 static const char __pyx_k_machine[] = "machine";
+static const char __pyx_k_reshape[] = "reshape";
+static const char __pyx_k_touched[] = "touched";
+static const char __pyx_k_waiting[] = "waiting";
 static const char __pyx_k_FSM_hits[] = "FSM.hits";
 static const char __pyx_k_alphabet[] = "alphabet";
+static const char __pyx_k_block_of[] = "block_of";
+static const char __pyx_k_elements[] = "elements";
+static const char __pyx_k_getstate[] = "__getstate__";
+static const char __pyx_k_itemsize[] = "itemsize";
+static const char __pyx_k_location[] = "location";
+static const char __pyx_k_minimise[] = "minimise";
+static const char __pyx_k_preimage[] = "preimage";
+static const char __pyx_k_pyx_type[] = "__pyx_type";
+static const char __pyx_k_setstate[] = "__setstate__";
+static const char __pyx_k_terminal[] = "terminal";
+static const char __pyx_k_StatePath[] = "StatePath";
+static const char __pyx_k_accepting[] = "accepting";
+static const char __pyx_k_block_end[] = "block_end";
 static const char __pyx_k_enumerate[] = "enumerate";
+static const char __pyx_k_new_block[] = "new_block";
+static const char __pyx_k_new_index[] = "new_index";
+static const char __pyx_k_pyx_state[] = "__pyx_state";
+static const char __pyx_k_reduce_ex[] = "__reduce_ex__";
+static const char __pyx_k_splitters[] = "splitters";
 static const char __pyx_k_ValueError[] = "ValueError";
 static const char __pyx_k_from_dicts[] = "from_dicts";
+static const char __pyx_k_pyx_result[] = "__pyx_result";
 static const char __pyx_k_pyx_vtable[] = "__pyx_vtable__";
+static const char __pyx_k_setdefault[] = "setdefault";
 static const char __pyx_k_MemoryError[] = "MemoryError";
 static const char __pyx_k_OrderedDict[] = "OrderedDict";
+static const char __pyx_k_PickleError[] = "PickleError";
+static const char __pyx_k_UNREACHABLE[] = "UNREACHABLE";
+static const char __pyx_k_block_start[] = "block_start";
 static const char __pyx_k_collections[] = "collections";
-static const char __pyx_k_defaultdict[] = "defaultdict";
+static const char __pyx_k_new_machine[] = "new_machine";
+static const char __pyx_k_transitions[] = "transitions";
+static const char __pyx_k_aho_corasick[] = "aho_corasick";
+static const char __pyx_k_alphabet_len[] = "alphabet_len";
+static const char __pyx_k_label_blocks[] = "label_blocks";
+static const char __pyx_k_pyx_checksum[] = "__pyx_checksum";
+static const char __pyx_k_stringsource[] = "stringsource";
 static const char __pyx_k_yield_states[] = "yield_states";
+static const char __pyx_k_TransitionMap[] = "TransitionMap";
+static const char __pyx_k_reduce_cython[] = "__reduce_cython__";
+static const char __pyx_k_Invalid_letter[] = "Invalid letter {}";
+static const char __pyx_k_reverse_arrows[] = "reverse_arrows";
+static const char __pyx_k_reverse_starts[] = "reverse_starts";
+static const char __pyx_k_accepting_words[] = "accepting_words";
+static const char __pyx_k_pyx_PickleError[] = "__pyx_PickleError";
+static const char __pyx_k_representatives[] = "representatives";
+static const char __pyx_k_setstate_cython[] = "__setstate_cython__";
+static const char __pyx_k_distance_to_yield[] = "distance_to_yield";
 static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
+static const char __pyx_k_init___locals_genexpr[] = "__init__.<locals>.genexpr";
 static const char __pyx_k_bundler_extensions_FSM[] = "bundler.extensions.FSM";
+static const char __pyx_k_find_distance_to_yield[] = "find_distance_to_yield";
+static const char __pyx_k_pyx_unpickle_StatePath[] = "__pyx_unpickle_StatePath";
 static const char __pyx_k_from_dicts_locals_genexpr[] = "from_dicts.<locals>.genexpr";
+static const char __pyx_k_bundler_extensions_FSM_pyx[] = "bundler/extensions/FSM.pyx";
+static const char __pyx_k_pyx_unpickle_TransitionMap[] = "__pyx_unpickle_TransitionMap";
 static const char __pyx_k_Invalid_transition_to_state[] = "Invalid transition to state {}";
+static const char __pyx_k_Incompatible_checksums_0x_x_vs_0[] = "Incompatible checksums (0x%x vs (0x189366f, 0x709b8f0, 0x49815e4) = (hits, machine, states))";
+static const char __pyx_k_find_distance_to_yield_locals_ge[] = "find_distance_to_yield.<locals>.genexpr";
+static const char __pyx_k_Incompatible_checksums_0x_x_vs_0_2[] = "Incompatible checksums (0x%x vs (0x502d9fe, 0x0fe453e, 0x1395c54) = (machine, maps, width))";
 static PyObject *__pyx_n_s_FSM;
 static PyObject *__pyx_n_s_FSM_hits;
+static PyObject *__pyx_kp_s_Incompatible_checksums_0x_x_vs_0;
+static PyObject *__pyx_kp_s_Incompatible_checksums_0x_x_vs_0_2;
+static PyObject *__pyx_kp_u_Invalid_letter;
 static PyObject *__pyx_kp_u_Invalid_transition_to_state;
 static PyObject *__pyx_n_s_MemoryError;
+static PyObject *__pyx_n_s_N;
 static PyObject *__pyx_n_s_OrderedDict;
-static PyObject *__pyx_n_s_Queue;
+static PyObject *__pyx_n_s_PickleError;
+static PyObject *__pyx_n_s_StatePath;
+static PyObject *__pyx_n_s_TransitionMap;
+static PyObject *__pyx_n_s_UNREACHABLE;
 static PyObject *__pyx_n_s_ValueError;
+static PyObject *__pyx_n_s_accepting;
+static PyObject *__pyx_n_s_accepting_words;
+static PyObject *__pyx_n_s_aho_corasick;
 static PyObject *__pyx_n_s_alphabet;
+static PyObject *__pyx_n_s_alphabet_len;
+static PyObject *__pyx_n_s_any;
 static PyObject *__pyx_n_s_append;
+static PyObject *__pyx_n_s_arange;
 static PyObject *__pyx_n_s_args;
 static PyObject *__pyx_n_s_array;
+static PyObject *__pyx_n_s_asarray;
+static PyObject *__pyx_n_s_axis;
+static PyObject *__pyx_n_u_b;
+static PyObject *__pyx_n_s_block;
+static PyObject *__pyx_n_s_block_end;
+static PyObject *__pyx_n_s_block_of;
+static PyObject *__pyx_n_s_block_start;
+static PyObject *__pyx_n_s_blocks;
 static PyObject *__pyx_n_s_bundler_extensions_FSM;
+static PyObject *__pyx_kp_s_bundler_extensions_FSM_pyx;
+static PyObject *__pyx_n_s_child;
 static PyObject *__pyx_n_s_class;
 static PyObject *__pyx_n_s_cline_in_traceback;
 static PyObject *__pyx_n_s_close;
 static PyObject *__pyx_n_s_collections;
-static PyObject *__pyx_n_s_defaultdict;
+static PyObject *__pyx_n_s_default;
 static PyObject *__pyx_n_s_depth;
-static PyObject *__pyx_n_s_empty;
+static PyObject *__pyx_n_s_dict;
+static PyObject *__pyx_n_s_distance_to_yield;
+static PyObject *__pyx_n_s_dtype;
+static PyObject *__pyx_n_s_elements;
 static PyObject *__pyx_n_s_enumerate;
+static PyObject *__pyx_n_s_fail;
+static PyObject *__pyx_n_s_find_distance_to_yield;
+static PyObject *__pyx_n_s_find_distance_to_yield_locals_ge;
+static PyObject *__pyx_n_s_flat;
 static PyObject *__pyx_n_s_format;
 static PyObject *__pyx_n_s_from_dicts;
 static PyObject *__pyx_n_s_from_dicts_locals_genexpr;
+static PyObject *__pyx_n_s_full;
 static PyObject *__pyx_n_s_genexpr;
 static PyObject *__pyx_n_s_get;
+static PyObject *__pyx_n_s_getstate;
+static PyObject *__pyx_n_u_h;
+static PyObject *__pyx_n_s_head;
 static PyObject *__pyx_n_s_hits;
+static PyObject *__pyx_n_s_i;
 static PyObject *__pyx_n_u_i;
 static PyObject *__pyx_n_s_import;
+static PyObject *__pyx_n_s_init___locals_genexpr;
+static PyObject *__pyx_n_s_intc;
+static PyObject *__pyx_n_s_intp;
+static PyObject *__pyx_n_s_itemsize;
+static PyObject *__pyx_n_s_j;
+static PyObject *__pyx_n_s_label_blocks;
+static PyObject *__pyx_n_s_labels;
+static PyObject *__pyx_n_s_last;
+static PyObject *__pyx_n_s_letter;
+static PyObject *__pyx_n_s_location;
 static PyObject *__pyx_n_s_machine;
 static PyObject *__pyx_n_s_main;
+static PyObject *__pyx_n_s_marked;
+static PyObject *__pyx_n_s_middle;
+static PyObject *__pyx_n_s_min;
+static PyObject *__pyx_n_s_minimise;
+static PyObject *__pyx_n_s_n;
 static PyObject *__pyx_n_s_name;
-static PyObject *__pyx_n_s_put;
+static PyObject *__pyx_n_s_new;
+static PyObject *__pyx_n_s_new_block;
+static PyObject *__pyx_n_s_new_index;
+static PyObject *__pyx_n_s_new_machine;
+static PyObject *__pyx_n_s_np;
+static PyObject *__pyx_n_s_numpy;
+static PyObject *__pyx_n_s_order;
+static PyObject *__pyx_n_s_parent;
+static PyObject *__pyx_n_s_pickle;
+static PyObject *__pyx_n_s_preimage;
+static PyObject *__pyx_n_s_pyx_PickleError;
+static PyObject *__pyx_n_s_pyx_checksum;
+static PyObject *__pyx_n_s_pyx_result;
+static PyObject *__pyx_n_s_pyx_state;
+static PyObject *__pyx_n_s_pyx_type;
+static PyObject *__pyx_n_s_pyx_unpickle_StatePath;
+static PyObject *__pyx_n_s_pyx_unpickle_TransitionMap;
 static PyObject *__pyx_n_s_pyx_vtable;
-static PyObject *__pyx_n_s_queue;
 static PyObject *__pyx_n_s_range;
+static PyObject *__pyx_n_s_reduce;
+static PyObject *__pyx_n_s_reduce_cython;
+static PyObject *__pyx_n_s_reduce_ex;
+static PyObject *__pyx_n_s_representatives;
+static PyObject *__pyx_n_s_reshape;
+static PyObject *__pyx_n_s_reverse_arrows;
+static PyObject *__pyx_n_s_reverse_starts;
 static PyObject *__pyx_n_s_run;
 static PyObject *__pyx_n_s_send;
+static PyObject *__pyx_n_s_setdefault;
+static PyObject *__pyx_n_s_setstate;
+static PyObject *__pyx_n_s_setstate_cython;
+static PyObject *__pyx_n_s_shape;
+static PyObject *__pyx_n_s_splitters;
+static PyObject *__pyx_n_s_start;
 static PyObject *__pyx_n_s_state;
+static PyObject *__pyx_kp_s_stringsource;
+static PyObject *__pyx_n_s_target;
+static PyObject *__pyx_n_s_terminal;
 static PyObject *__pyx_n_s_test;
 static PyObject *__pyx_n_s_throw;
+static PyObject *__pyx_n_s_tile;
+static PyObject *__pyx_n_s_touched;
+static PyObject *__pyx_n_s_transitions;
+static PyObject *__pyx_n_s_update;
+static PyObject *__pyx_n_s_vstack;
+static PyObject *__pyx_n_s_waiting;
 static PyObject *__pyx_n_s_word;
+static PyObject *__pyx_n_s_words;
 static PyObject *__pyx_n_s_yield_states;
-static int __pyx_pf_7bundler_10extensions_3FSM_3FSM___init__(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self, PyObject *__pyx_v_alphabet, PyObject *__pyx_v_machine, PyObject *__pyx_v_yield_states); /* proto */
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_8__init___8genexpr1_genexpr(PyObject *__pyx_self); /* proto */
+static int __pyx_pf_7bundler_10extensions_3FSM_3FSM___init__(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self, PyObject *__pyx_v_alphabet, PyObject *__pyx_v_machine, PyObject *__pyx_v_yield_states, PyObject *__pyx_v_distance_to_yield); /* proto */
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_22find_distance_to_yield_genexpr(PyObject *__pyx_self); /* proto */
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_2find_distance_to_yield(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_10from_dicts_genexpr(PyObject *__pyx_self); /* proto */
 static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_10from_dicts_3genexpr(PyObject *__pyx_self); /* proto */
-static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_2from_dicts(PyTypeObject *__pyx_v_cls, PyObject *__pyx_v_alphabet, PyObject *__pyx_v_machine, PyObject *__pyx_v_hits); /* proto */
-static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_4__reduce__(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_6__call__(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self, PyObject *__pyx_v_word, int __pyx_v_state); /* proto */
-static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_8distance(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self, PyObject *__pyx_v_word); /* proto */
-static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_10hit(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self, PyObject *__pyx_v_word); /* proto */
-static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_12hits(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self, PyObject *__pyx_v_word, int __pyx_v_run); /* proto */
-static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_15has_cycle(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self, PyObject *__pyx_v_word, int __pyx_v_depth); /* proto */
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_4from_dicts(PyTypeObject *__pyx_v_cls, PyObject *__pyx_v_alphabet, PyObject *__pyx_v_machine, PyObject *__pyx_v_hits); /* proto */
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_6__reduce__(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_8__call__(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self, PyObject *__pyx_v_word, int __pyx_v_state); /* proto */
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_10distance(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self, PyObject *__pyx_v_word); /* proto */
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_12path(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_14transition_map(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self, int __pyx_v_depth); /* proto */
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_16hit(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self, PyObject *__pyx_v_word); /* proto */
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_18hits(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self, PyObject *__pyx_v_word, int __pyx_v_run); /* proto */
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_21has_cycle(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self, PyObject *__pyx_v_word, int __pyx_v_depth); /* proto */
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_23has_cycles(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self, PyObject *__pyx_v_words, int __pyx_v_depth); /* proto */
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_8alphabet___get__(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_7machine___get__(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_12yield_states___get__(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_17distance_to_yield___get__(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self); /* proto */
+static int __pyx_pf_7bundler_10extensions_3FSM_9StatePath___init__(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *__pyx_v_self, struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_machine); /* proto */
+static Py_ssize_t __pyx_pf_7bundler_10extensions_3FSM_9StatePath_2__len__(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_9StatePath_4push(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *__pyx_v_self, int __pyx_v_letter); /* proto */
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_9StatePath_6truncate(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *__pyx_v_self, int __pyx_v_depth); /* proto */
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_9StatePath_8state(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_9StatePath_10hit(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_9StatePath_12distance(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_9StatePath_14__reduce_cython__(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_9StatePath_16__setstate_cython__(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *__pyx_v_self, PyObject *__pyx_v___pyx_state); /* proto */
+static int __pyx_pf_7bundler_10extensions_3FSM_13TransitionMap___init__(struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *__pyx_v_self, struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_machine, int __pyx_v_depth); /* proto */
+static Py_ssize_t __pyx_pf_7bundler_10extensions_3FSM_13TransitionMap_2__len__(struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_13TransitionMap_4push(struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *__pyx_v_self, int __pyx_v_letter); /* proto */
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_13TransitionMap_6truncate(struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *__pyx_v_self, int __pyx_v_depth); /* proto */
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_13TransitionMap_8has_fixed_point(struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_13TransitionMap_10image(struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_13TransitionMap_12__reduce_cython__(struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_13TransitionMap_14__setstate_cython__(struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *__pyx_v_self, PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_aho_corasick(CYTHON_UNUSED PyObject *__pyx_self, int __pyx_v_alphabet_len, PyObject *__pyx_v_words); /* proto */
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_2minimise(CYTHON_UNUSED PyObject *__pyx_self, int __pyx_v_alphabet_len, PyObject *__pyx_v_machine, PyObject *__pyx_v_labels); /* proto */
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_4__pyx_unpickle_StatePath(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_6__pyx_unpickle_TransitionMap(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state); /* proto */
 static int __pyx_pf_7cpython_5array_5array___getbuffer__(arrayobject *__pyx_v_self, Py_buffer *__pyx_v_info, CYTHON_UNUSED int __pyx_v_flags); /* proto */
 static void __pyx_pf_7cpython_5array_5array_2__releasebuffer__(CYTHON_UNUSED arrayobject *__pyx_v_self, Py_buffer *__pyx_v_info); /* proto */
 static PyObject *__pyx_tp_new_7bundler_10extensions_3FSM_FSM(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
-static PyObject *__pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_7bundler_10extensions_3FSM_StatePath(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_7bundler_10extensions_3FSM_TransitionMap(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct____init__(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
-static PyObject *__pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct_2_genexpr(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
-static PyObject *__pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct_3_hits(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct_3_genexpr(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct_5_genexpr(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct_6_genexpr(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct_7_hits(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_get = {0, &__pyx_n_s_get, 0, 0, 0};
+static __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_setdefault = {0, &__pyx_n_s_setdefault, 0, 0, 0};
 static PyObject *__pyx_int_0;
 static PyObject *__pyx_int_1;
+static PyObject *__pyx_int_16663870;
+static PyObject *__pyx_int_20536404;
+static PyObject *__pyx_int_25769583;
+static PyObject *__pyx_int_77075940;
+static PyObject *__pyx_int_84072958;
+static PyObject *__pyx_int_118077680;
+static PyObject *__pyx_int_1073741824;
 static PyObject *__pyx_int_neg_1;
+static PyObject *__pyx_slice_;
+static PyObject *__pyx_slice__2;
+static PyObject *__pyx_tuple__3;
+static PyObject *__pyx_tuple__4;
+static PyObject *__pyx_tuple__5;
+static PyObject *__pyx_tuple__7;
+static PyObject *__pyx_tuple__9;
+static PyObject *__pyx_tuple__11;
+static PyObject *__pyx_codeobj__6;
+static PyObject *__pyx_codeobj__8;
+static PyObject *__pyx_codeobj__10;
+static PyObject *__pyx_codeobj__12;
 /* Late includes */
 
-/* "bundler/extensions/FSM.pyx":18
+/* "bundler/extensions/FSM.pyx":20
+ * UNREACHABLE = 2**30
  * 
- * cdef class FSM:
- *     def __init__(self, alphabet, machine, yield_states):             # <<<<<<<<<<<<<<
- *         cdef int start
- *         cdef IWord x
+ * cdef inline int step(FSM machine, int state, int letter):             # <<<<<<<<<<<<<<
+ *     ''' Return the state that machine moves to from state on reading letter. '''
+ *     cdef Py_ssize_t index = state * machine.alphabet_len + letter
  */
 
-/* Python wrapper */
-static int __pyx_pw_7bundler_10extensions_3FSM_3FSM_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pw_7bundler_10extensions_3FSM_3FSM_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_alphabet = 0;
-  PyObject *__pyx_v_machine = 0;
-  PyObject *__pyx_v_yield_states = 0;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
+static CYTHON_INLINE int __pyx_f_7bundler_10extensions_3FSM_step(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_machine, int __pyx_v_state, int __pyx_v_letter) {
+  Py_ssize_t __pyx_v_index;
   int __pyx_r;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
-  {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_alphabet,&__pyx_n_s_machine,&__pyx_n_s_yield_states,0};
-    PyObject* values[3] = {0,0,0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
-      switch (pos_args) {
-        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-        CYTHON_FALLTHROUGH;
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (pos_args) {
-        case  0:
-        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_alphabet)) != 0)) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        CYTHON_FALLTHROUGH;
-        case  1:
-        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_machine)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 3, 3, 1); __PYX_ERR(0, 18, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  2:
-        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_yield_states)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 3, 3, 2); __PYX_ERR(0, 18, __pyx_L3_error)
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 18, __pyx_L3_error)
-      }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-    }
-    __pyx_v_alphabet = values[0];
-    __pyx_v_machine = values[1];
-    __pyx_v_yield_states = values[2];
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("step", 0);
+
+  /* "bundler/extensions/FSM.pyx":22
+ * cdef inline int step(FSM machine, int state, int letter):
+ *     ''' Return the state that machine moves to from state on reading letter. '''
+ *     cdef Py_ssize_t index = state * machine.alphabet_len + letter             # <<<<<<<<<<<<<<
+ *     if machine.itemsize == 1: return (<signed char*>machine.table)[index]
+ *     if machine.itemsize == 2: return (<short*>machine.table)[index]
+ */
+  __pyx_v_index = ((__pyx_v_state * __pyx_v_machine->alphabet_len) + __pyx_v_letter);
+
+  /* "bundler/extensions/FSM.pyx":23
+ *     ''' Return the state that machine moves to from state on reading letter. '''
+ *     cdef Py_ssize_t index = state * machine.alphabet_len + letter
+ *     if machine.itemsize == 1: return (<signed char*>machine.table)[index]             # <<<<<<<<<<<<<<
+ *     if machine.itemsize == 2: return (<short*>machine.table)[index]
+ *     return (<int*>machine.table)[index]
+ */
+  __pyx_t_1 = ((__pyx_v_machine->itemsize == 1) != 0);
+  if (__pyx_t_1) {
+    __pyx_r = (((signed char *)__pyx_v_machine->table)[__pyx_v_index]);
+    goto __pyx_L0;
   }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 18, __pyx_L3_error)
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("bundler.extensions.FSM.FSM.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return -1;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_3FSM___init__(((struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)__pyx_v_self), __pyx_v_alphabet, __pyx_v_machine, __pyx_v_yield_states);
+
+  /* "bundler/extensions/FSM.pyx":24
+ *     cdef Py_ssize_t index = state * machine.alphabet_len + letter
+ *     if machine.itemsize == 1: return (<signed char*>machine.table)[index]
+ *     if machine.itemsize == 2: return (<short*>machine.table)[index]             # <<<<<<<<<<<<<<
+ *     return (<int*>machine.table)[index]
+ * 
+ */
+  __pyx_t_1 = ((__pyx_v_machine->itemsize == 2) != 0);
+  if (__pyx_t_1) {
+    __pyx_r = (((short *)__pyx_v_machine->table)[__pyx_v_index]);
+    goto __pyx_L0;
+  }
+
+  /* "bundler/extensions/FSM.pyx":25
+ *     if machine.itemsize == 1: return (<signed char*>machine.table)[index]
+ *     if machine.itemsize == 2: return (<short*>machine.table)[index]
+ *     return (<int*>machine.table)[index]             # <<<<<<<<<<<<<<
+ * 
+ * # The loops that make the most transitions are specialised to each type of table, rather than calling step.
+ */
+  __pyx_r = (((int *)__pyx_v_machine->table)[__pyx_v_index]);
+  goto __pyx_L0;
+
+  /* "bundler/extensions/FSM.pyx":20
+ * UNREACHABLE = 2**30
+ * 
+ * cdef inline int step(FSM machine, int state, int letter):             # <<<<<<<<<<<<<<
+ *     ''' Return the state that machine moves to from state on reading letter. '''
+ *     cdef Py_ssize_t index = state * machine.alphabet_len + letter
+ */
 
   /* function exit code */
+  __pyx_L0:;
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static int __pyx_pf_7bundler_10extensions_3FSM_3FSM___init__(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self, PyObject *__pyx_v_alphabet, PyObject *__pyx_v_machine, PyObject *__pyx_v_yield_states) {
-  int __pyx_v_start;
-  __pyx_t_7bundler_10extensions_3FSM_IWord __pyx_v_x;
-  PyObject *__pyx_v_i = NULL;
-  PyObject *__pyx_v_yields = NULL;
-  PyObject *__pyx_v_reverse_arrows = NULL;
-  PyObject *__pyx_v_state = NULL;
-  PyObject *__pyx_v_new_state = NULL;
-  PyObject *__pyx_v_to_check = NULL;
-  PyObject *__pyx_v_current = NULL;
-  PyObject *__pyx_v_adjacent = NULL;
-  int __pyx_7genexpr__pyx_v_state;
+/* "bundler/extensions/FSM.pyx":33
+ *     int
+ * 
+ * cdef inline int follow(entry* table, int alphabet_len, int state, IWord& word):             # <<<<<<<<<<<<<<
+ *     ''' Return the state reached by reading word from state, or -1 if this walks off of the machine. '''
+ *     cdef int i
+ */
+
+static CYTHON_INLINE int __pyx_fuse_0__pyx_f_7bundler_10extensions_3FSM_follow(signed char *__pyx_v_table, int __pyx_v_alphabet_len, int __pyx_v_state, __pyx_t_7bundler_10extensions_3FSM_IWord &__pyx_v_word) {
+  int __pyx_v_i;
   int __pyx_r;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  Py_ssize_t __pyx_t_2;
-  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
   int __pyx_t_4;
-  int __pyx_t_5;
-  int __pyx_t_6;
-  PyObject *__pyx_t_7 = NULL;
-  PyObject *__pyx_t_8 = NULL;
-  PyObject *__pyx_t_9 = NULL;
-  int __pyx_t_10;
-  PyObject *(*__pyx_t_11)(PyObject *);
-  Py_ssize_t __pyx_t_12;
-  PyObject *(*__pyx_t_13)(PyObject *);
-  __pyx_t_7bundler_10extensions_3FSM_IWord __pyx_t_14;
-  Py_ssize_t __pyx_t_15;
-  int __pyx_t_16;
-  int __pyx_t_17;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__init__", 0);
-
-  /* "bundler/extensions/FSM.pyx":22
- *         cdef IWord x
- * 
- *         self.alphabet = alphabet             # <<<<<<<<<<<<<<
- *         self.alphabet_len = len(self.alphabet)
- *         self.machine = array.array('i', machine)
+  __Pyx_RefNannySetupContext("__pyx_fuse_0follow", 0);
+
+  /* "bundler/extensions/FSM.pyx":36
+ *     ''' Return the state reached by reading word from state, or -1 if this walks off of the machine. '''
+ *     cdef int i
+ *     for i in range(<int>word.size()):             # <<<<<<<<<<<<<<
+ *         state = table[state * alphabet_len + word[i]]
+ *         if state < 0: break
  */
-  if (!(likely(PyList_CheckExact(__pyx_v_alphabet))||((__pyx_v_alphabet) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "list", Py_TYPE(__pyx_v_alphabet)->tp_name), 0))) __PYX_ERR(0, 22, __pyx_L1_error)
-  __pyx_t_1 = __pyx_v_alphabet;
-  __Pyx_INCREF(__pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_1);
-  __Pyx_GOTREF(__pyx_v_self->alphabet);
-  __Pyx_DECREF(__pyx_v_self->alphabet);
-  __pyx_v_self->alphabet = ((PyObject*)__pyx_t_1);
-  __pyx_t_1 = 0;
+  __pyx_t_1 = ((int)__pyx_v_word.size());
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_i = __pyx_t_3;
+
+    /* "bundler/extensions/FSM.pyx":37
+ *     cdef int i
+ *     for i in range(<int>word.size()):
+ *         state = table[state * alphabet_len + word[i]]             # <<<<<<<<<<<<<<
+ *         if state < 0: break
+ *     return state
+ */
+    __pyx_v_state = (__pyx_v_table[((__pyx_v_state * __pyx_v_alphabet_len) + (__pyx_v_word[__pyx_v_i]))]);
 
-  /* "bundler/extensions/FSM.pyx":23
+    /* "bundler/extensions/FSM.pyx":38
+ *     for i in range(<int>word.size()):
+ *         state = table[state * alphabet_len + word[i]]
+ *         if state < 0: break             # <<<<<<<<<<<<<<
+ *     return state
  * 
- *         self.alphabet = alphabet
- *         self.alphabet_len = len(self.alphabet)             # <<<<<<<<<<<<<<
- *         self.machine = array.array('i', machine)
- *         self.machine_len = len(self.machine) // self.alphabet_len
  */
-  __pyx_t_1 = __pyx_v_self->alphabet;
-  __Pyx_INCREF(__pyx_t_1);
-  if (unlikely(__pyx_t_1 == Py_None)) {
-    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
-    __PYX_ERR(0, 23, __pyx_L1_error)
+    __pyx_t_4 = ((__pyx_v_state < 0) != 0);
+    if (__pyx_t_4) {
+      goto __pyx_L4_break;
+    }
   }
-  __pyx_t_2 = PyList_GET_SIZE(__pyx_t_1); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 23, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v_self->alphabet_len = __pyx_t_2;
+  __pyx_L4_break:;
 
-  /* "bundler/extensions/FSM.pyx":24
- *         self.alphabet = alphabet
- *         self.alphabet_len = len(self.alphabet)
- *         self.machine = array.array('i', machine)             # <<<<<<<<<<<<<<
- *         self.machine_len = len(self.machine) // self.alphabet_len
- *         self.yield_states = yield_states
+  /* "bundler/extensions/FSM.pyx":39
+ *         state = table[state * alphabet_len + word[i]]
+ *         if state < 0: break
+ *     return state             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void compose(entry* table, int alphabet_len, vector[int]& maps, int width, int letter):
  */
-  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 24, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(__pyx_n_u_i);
-  __Pyx_GIVEREF(__pyx_n_u_i);
-  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_n_u_i);
-  __Pyx_INCREF(__pyx_v_machine);
-  __Pyx_GIVEREF(__pyx_v_machine);
-  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_v_machine);
-  __pyx_t_3 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_7cpython_5array_array), __pyx_t_1, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 24, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_GIVEREF(__pyx_t_3);
-  __Pyx_GOTREF(__pyx_v_self->machine);
-  __Pyx_DECREF(((PyObject *)__pyx_v_self->machine));
-  __pyx_v_self->machine = ((arrayobject *)__pyx_t_3);
-  __pyx_t_3 = 0;
+  __pyx_r = __pyx_v_state;
+  goto __pyx_L0;
 
-  /* "bundler/extensions/FSM.pyx":25
- *         self.alphabet_len = len(self.alphabet)
- *         self.machine = array.array('i', machine)
- *         self.machine_len = len(self.machine) // self.alphabet_len             # <<<<<<<<<<<<<<
- *         self.yield_states = yield_states
- *         self.has_yield = array.array('i', [1 if self.yield_states.get(state, []) else 0 for state in range(self.machine_len)])
+  /* "bundler/extensions/FSM.pyx":33
+ *     int
+ * 
+ * cdef inline int follow(entry* table, int alphabet_len, int state, IWord& word):             # <<<<<<<<<<<<<<
+ *     ''' Return the state reached by reading word from state, or -1 if this walks off of the machine. '''
+ *     cdef int i
  */
-  __pyx_t_3 = ((PyObject *)__pyx_v_self->machine);
-  __Pyx_INCREF(__pyx_t_3);
-  if (unlikely(__pyx_t_3 == Py_None)) {
-    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
-    __PYX_ERR(0, 25, __pyx_L1_error)
-  }
-  __pyx_t_2 = Py_SIZE(__pyx_t_3); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 25, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(__pyx_v_self->alphabet_len == 0)) {
-    PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
-    __PYX_ERR(0, 25, __pyx_L1_error)
-  }
-  else if (sizeof(Py_ssize_t) == sizeof(long) && (!(((int)-1) > 0)) && unlikely(__pyx_v_self->alphabet_len == (int)-1)  && unlikely(UNARY_NEG_WOULD_OVERFLOW(__pyx_t_2))) {
-    PyErr_SetString(PyExc_OverflowError, "value too large to perform division");
-    __PYX_ERR(0, 25, __pyx_L1_error)
-  }
-  __pyx_v_self->machine_len = __Pyx_div_Py_ssize_t(__pyx_t_2, __pyx_v_self->alphabet_len);
 
-  /* "bundler/extensions/FSM.pyx":26
- *         self.machine = array.array('i', machine)
- *         self.machine_len = len(self.machine) // self.alphabet_len
- *         self.yield_states = yield_states             # <<<<<<<<<<<<<<
- *         self.has_yield = array.array('i', [1 if self.yield_states.get(state, []) else 0 for state in range(self.machine_len)])
- * 
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static CYTHON_INLINE int __pyx_fuse_1__pyx_f_7bundler_10extensions_3FSM_follow(short *__pyx_v_table, int __pyx_v_alphabet_len, int __pyx_v_state, __pyx_t_7bundler_10extensions_3FSM_IWord &__pyx_v_word) {
+  int __pyx_v_i;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  __Pyx_RefNannySetupContext("__pyx_fuse_1follow", 0);
+
+  /* "bundler/extensions/FSM.pyx":36
+ *     ''' Return the state reached by reading word from state, or -1 if this walks off of the machine. '''
+ *     cdef int i
+ *     for i in range(<int>word.size()):             # <<<<<<<<<<<<<<
+ *         state = table[state * alphabet_len + word[i]]
+ *         if state < 0: break
  */
-  if (!(likely(PyDict_CheckExact(__pyx_v_yield_states))||((__pyx_v_yield_states) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "dict", Py_TYPE(__pyx_v_yield_states)->tp_name), 0))) __PYX_ERR(0, 26, __pyx_L1_error)
-  __pyx_t_3 = __pyx_v_yield_states;
-  __Pyx_INCREF(__pyx_t_3);
-  __Pyx_GIVEREF(__pyx_t_3);
-  __Pyx_GOTREF(__pyx_v_self->yield_states);
-  __Pyx_DECREF(__pyx_v_self->yield_states);
-  __pyx_v_self->yield_states = ((PyObject*)__pyx_t_3);
-  __pyx_t_3 = 0;
+  __pyx_t_1 = ((int)__pyx_v_word.size());
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_i = __pyx_t_3;
+
+    /* "bundler/extensions/FSM.pyx":37
+ *     cdef int i
+ *     for i in range(<int>word.size()):
+ *         state = table[state * alphabet_len + word[i]]             # <<<<<<<<<<<<<<
+ *         if state < 0: break
+ *     return state
+ */
+    __pyx_v_state = (__pyx_v_table[((__pyx_v_state * __pyx_v_alphabet_len) + (__pyx_v_word[__pyx_v_i]))]);
 
-  /* "bundler/extensions/FSM.pyx":27
- *         self.machine_len = len(self.machine) // self.alphabet_len
- *         self.yield_states = yield_states
- *         self.has_yield = array.array('i', [1 if self.yield_states.get(state, []) else 0 for state in range(self.machine_len)])             # <<<<<<<<<<<<<<
+    /* "bundler/extensions/FSM.pyx":38
+ *     for i in range(<int>word.size()):
+ *         state = table[state * alphabet_len + word[i]]
+ *         if state < 0: break             # <<<<<<<<<<<<<<
+ *     return state
  * 
- *         start = 0
  */
-  { /* enter inner scope */
-    __pyx_t_3 = PyList_New(0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 27, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = __pyx_v_self->machine_len;
-    __pyx_t_5 = __pyx_t_4;
-    for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
-      __pyx_7genexpr__pyx_v_state = __pyx_t_6;
-      if (unlikely(__pyx_v_self->yield_states == Py_None)) {
-        PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "get");
-        __PYX_ERR(0, 27, __pyx_L1_error)
-      }
-      __pyx_t_7 = __Pyx_PyInt_From_int(__pyx_7genexpr__pyx_v_state); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 27, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_7);
-      __pyx_t_8 = PyList_New(0); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 27, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_8);
-      __pyx_t_9 = __Pyx_PyDict_GetItemDefault(__pyx_v_self->yield_states, __pyx_t_7, __pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 27, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_9);
-      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-      __pyx_t_10 = __Pyx_PyObject_IsTrue(__pyx_t_9); if (unlikely(__pyx_t_10 < 0)) __PYX_ERR(0, 27, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-      if (__pyx_t_10) {
-        __Pyx_INCREF(__pyx_int_1);
-        __pyx_t_1 = __pyx_int_1;
-      } else {
-        __Pyx_INCREF(__pyx_int_0);
-        __pyx_t_1 = __pyx_int_0;
-      }
-      if (unlikely(__Pyx_ListComp_Append(__pyx_t_3, (PyObject*)__pyx_t_1))) __PYX_ERR(0, 27, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_4 = ((__pyx_v_state < 0) != 0);
+    if (__pyx_t_4) {
+      goto __pyx_L4_break;
     }
-  } /* exit inner scope */
-  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 27, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(__pyx_n_u_i);
-  __Pyx_GIVEREF(__pyx_n_u_i);
-  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_n_u_i);
-  __Pyx_GIVEREF(__pyx_t_3);
-  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_3);
-  __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_7cpython_5array_array), __pyx_t_1, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 27, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_GIVEREF(__pyx_t_3);
-  __Pyx_GOTREF(__pyx_v_self->has_yield);
-  __Pyx_DECREF(((PyObject *)__pyx_v_self->has_yield));
-  __pyx_v_self->has_yield = ((arrayobject *)__pyx_t_3);
-  __pyx_t_3 = 0;
+  }
+  __pyx_L4_break:;
 
-  /* "bundler/extensions/FSM.pyx":29
- *         self.has_yield = array.array('i', [1 if self.yield_states.get(state, []) else 0 for state in range(self.machine_len)])
+  /* "bundler/extensions/FSM.pyx":39
+ *         state = table[state * alphabet_len + word[i]]
+ *         if state < 0: break
+ *     return state             # <<<<<<<<<<<<<<
  * 
- *         start = 0             # <<<<<<<<<<<<<<
- *         self.yield_states2_starts.push_back(0)
- *         for i in range(self.machine_len):
+ * cdef inline void compose(entry* table, int alphabet_len, vector[int]& maps, int width, int letter):
  */
-  __pyx_v_start = 0;
+  __pyx_r = __pyx_v_state;
+  goto __pyx_L0;
 
-  /* "bundler/extensions/FSM.pyx":30
+  /* "bundler/extensions/FSM.pyx":33
+ *     int
  * 
- *         start = 0
- *         self.yield_states2_starts.push_back(0)             # <<<<<<<<<<<<<<
- *         for i in range(self.machine_len):
- *             yields = self.yield_states.get(i, [])
+ * cdef inline int follow(entry* table, int alphabet_len, int state, IWord& word):             # <<<<<<<<<<<<<<
+ *     ''' Return the state reached by reading word from state, or -1 if this walks off of the machine. '''
+ *     cdef int i
  */
-  try {
-    __pyx_v_self->yield_states2_starts.push_back(0);
-  } catch(...) {
-    __Pyx_CppExn2PyErr();
-    __PYX_ERR(0, 30, __pyx_L1_error)
-  }
 
-  /* "bundler/extensions/FSM.pyx":31
- *         start = 0
- *         self.yield_states2_starts.push_back(0)
- *         for i in range(self.machine_len):             # <<<<<<<<<<<<<<
- *             yields = self.yield_states.get(i, [])
- *             for x in yields:
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static CYTHON_INLINE int __pyx_fuse_2__pyx_f_7bundler_10extensions_3FSM_follow(int *__pyx_v_table, int __pyx_v_alphabet_len, int __pyx_v_state, __pyx_t_7bundler_10extensions_3FSM_IWord &__pyx_v_word) {
+  int __pyx_v_i;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  __Pyx_RefNannySetupContext("__pyx_fuse_2follow", 0);
+
+  /* "bundler/extensions/FSM.pyx":36
+ *     ''' Return the state reached by reading word from state, or -1 if this walks off of the machine. '''
+ *     cdef int i
+ *     for i in range(<int>word.size()):             # <<<<<<<<<<<<<<
+ *         state = table[state * alphabet_len + word[i]]
+ *         if state < 0: break
  */
-  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_self->machine_len); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 31, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_builtin_range, __pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 31, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (likely(PyList_CheckExact(__pyx_t_1)) || PyTuple_CheckExact(__pyx_t_1)) {
-    __pyx_t_3 = __pyx_t_1; __Pyx_INCREF(__pyx_t_3); __pyx_t_2 = 0;
-    __pyx_t_11 = NULL;
-  } else {
-    __pyx_t_2 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 31, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_11 = Py_TYPE(__pyx_t_3)->tp_iternext; if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 31, __pyx_L1_error)
-  }
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  for (;;) {
-    if (likely(!__pyx_t_11)) {
-      if (likely(PyList_CheckExact(__pyx_t_3))) {
-        if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_3)) break;
-        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_1 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_2); __Pyx_INCREF(__pyx_t_1); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 31, __pyx_L1_error)
-        #else
-        __pyx_t_1 = PySequence_ITEM(__pyx_t_3, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 31, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_1);
-        #endif
-      } else {
-        if (__pyx_t_2 >= PyTuple_GET_SIZE(__pyx_t_3)) break;
-        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_2); __Pyx_INCREF(__pyx_t_1); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 31, __pyx_L1_error)
-        #else
-        __pyx_t_1 = PySequence_ITEM(__pyx_t_3, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 31, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_1);
-        #endif
-      }
-    } else {
-      __pyx_t_1 = __pyx_t_11(__pyx_t_3);
-      if (unlikely(!__pyx_t_1)) {
-        PyObject* exc_type = PyErr_Occurred();
-        if (exc_type) {
-          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-          else __PYX_ERR(0, 31, __pyx_L1_error)
-        }
-        break;
-      }
-      __Pyx_GOTREF(__pyx_t_1);
-    }
-    __Pyx_XDECREF_SET(__pyx_v_i, __pyx_t_1);
-    __pyx_t_1 = 0;
+  __pyx_t_1 = ((int)__pyx_v_word.size());
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_i = __pyx_t_3;
+
+    /* "bundler/extensions/FSM.pyx":37
+ *     cdef int i
+ *     for i in range(<int>word.size()):
+ *         state = table[state * alphabet_len + word[i]]             # <<<<<<<<<<<<<<
+ *         if state < 0: break
+ *     return state
+ */
+    __pyx_v_state = (__pyx_v_table[((__pyx_v_state * __pyx_v_alphabet_len) + (__pyx_v_word[__pyx_v_i]))]);
 
-    /* "bundler/extensions/FSM.pyx":32
- *         self.yield_states2_starts.push_back(0)
- *         for i in range(self.machine_len):
- *             yields = self.yield_states.get(i, [])             # <<<<<<<<<<<<<<
- *             for x in yields:
- *                 self.yield_states2.push_back(x)
+    /* "bundler/extensions/FSM.pyx":38
+ *     for i in range(<int>word.size()):
+ *         state = table[state * alphabet_len + word[i]]
+ *         if state < 0: break             # <<<<<<<<<<<<<<
+ *     return state
+ * 
  */
-    if (unlikely(__pyx_v_self->yield_states == Py_None)) {
-      PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "get");
-      __PYX_ERR(0, 32, __pyx_L1_error)
+    __pyx_t_4 = ((__pyx_v_state < 0) != 0);
+    if (__pyx_t_4) {
+      goto __pyx_L4_break;
     }
-    __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 32, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_9 = __Pyx_PyDict_GetItemDefault(__pyx_v_self->yield_states, __pyx_v_i, __pyx_t_1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 32, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_9);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __Pyx_XDECREF_SET(__pyx_v_yields, __pyx_t_9);
-    __pyx_t_9 = 0;
+  }
+  __pyx_L4_break:;
 
-    /* "bundler/extensions/FSM.pyx":33
- *         for i in range(self.machine_len):
- *             yields = self.yield_states.get(i, [])
- *             for x in yields:             # <<<<<<<<<<<<<<
- *                 self.yield_states2.push_back(x)
- *             start += len(yields)
+  /* "bundler/extensions/FSM.pyx":39
+ *         state = table[state * alphabet_len + word[i]]
+ *         if state < 0: break
+ *     return state             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void compose(entry* table, int alphabet_len, vector[int]& maps, int width, int letter):
  */
-    if (likely(PyList_CheckExact(__pyx_v_yields)) || PyTuple_CheckExact(__pyx_v_yields)) {
-      __pyx_t_9 = __pyx_v_yields; __Pyx_INCREF(__pyx_t_9); __pyx_t_12 = 0;
-      __pyx_t_13 = NULL;
-    } else {
-      __pyx_t_12 = -1; __pyx_t_9 = PyObject_GetIter(__pyx_v_yields); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 33, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_9);
-      __pyx_t_13 = Py_TYPE(__pyx_t_9)->tp_iternext; if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 33, __pyx_L1_error)
-    }
-    for (;;) {
-      if (likely(!__pyx_t_13)) {
-        if (likely(PyList_CheckExact(__pyx_t_9))) {
-          if (__pyx_t_12 >= PyList_GET_SIZE(__pyx_t_9)) break;
-          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-          __pyx_t_1 = PyList_GET_ITEM(__pyx_t_9, __pyx_t_12); __Pyx_INCREF(__pyx_t_1); __pyx_t_12++; if (unlikely(0 < 0)) __PYX_ERR(0, 33, __pyx_L1_error)
-          #else
-          __pyx_t_1 = PySequence_ITEM(__pyx_t_9, __pyx_t_12); __pyx_t_12++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 33, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_1);
-          #endif
-        } else {
-          if (__pyx_t_12 >= PyTuple_GET_SIZE(__pyx_t_9)) break;
-          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-          __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_9, __pyx_t_12); __Pyx_INCREF(__pyx_t_1); __pyx_t_12++; if (unlikely(0 < 0)) __PYX_ERR(0, 33, __pyx_L1_error)
-          #else
-          __pyx_t_1 = PySequence_ITEM(__pyx_t_9, __pyx_t_12); __pyx_t_12++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 33, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_1);
-          #endif
-        }
-      } else {
-        __pyx_t_1 = __pyx_t_13(__pyx_t_9);
-        if (unlikely(!__pyx_t_1)) {
-          PyObject* exc_type = PyErr_Occurred();
-          if (exc_type) {
-            if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-            else __PYX_ERR(0, 33, __pyx_L1_error)
-          }
-          break;
-        }
-        __Pyx_GOTREF(__pyx_t_1);
-      }
-      __pyx_t_14 = __pyx_convert_vector_from_py_int(__pyx_t_1); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 33, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __pyx_v_x = __pyx_t_14;
+  __pyx_r = __pyx_v_state;
+  goto __pyx_L0;
 
-      /* "bundler/extensions/FSM.pyx":34
- *             yields = self.yield_states.get(i, [])
- *             for x in yields:
- *                 self.yield_states2.push_back(x)             # <<<<<<<<<<<<<<
- *             start += len(yields)
- *             self.yield_states2_starts.push_back(start)
+  /* "bundler/extensions/FSM.pyx":33
+ *     int
+ * 
+ * cdef inline int follow(entry* table, int alphabet_len, int state, IWord& word):             # <<<<<<<<<<<<<<
+ *     ''' Return the state reached by reading word from state, or -1 if this walks off of the machine. '''
+ *     cdef int i
  */
-      try {
-        __pyx_v_self->yield_states2.push_back(__pyx_v_x);
-      } catch(...) {
-        __Pyx_CppExn2PyErr();
-        __PYX_ERR(0, 34, __pyx_L1_error)
-      }
 
-      /* "bundler/extensions/FSM.pyx":33
- *         for i in range(self.machine_len):
- *             yields = self.yield_states.get(i, [])
- *             for x in yields:             # <<<<<<<<<<<<<<
- *                 self.yield_states2.push_back(x)
- *             start += len(yields)
- */
-    }
-    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-    /* "bundler/extensions/FSM.pyx":35
- *             for x in yields:
- *                 self.yield_states2.push_back(x)
- *             start += len(yields)             # <<<<<<<<<<<<<<
- *             self.yield_states2_starts.push_back(start)
+/* "bundler/extensions/FSM.pyx":41
+ *     return state
  * 
+ * cdef inline void compose(entry* table, int alphabet_len, vector[int]& maps, int width, int letter):             # <<<<<<<<<<<<<<
+ *     ''' Push the composition of the top width entries of maps with letter onto maps. '''
+ *     cdef int start = maps.size() - width
  */
-    __pyx_t_12 = PyObject_Length(__pyx_v_yields); if (unlikely(__pyx_t_12 == ((Py_ssize_t)-1))) __PYX_ERR(0, 35, __pyx_L1_error)
-    __pyx_v_start = (__pyx_v_start + __pyx_t_12);
 
-    /* "bundler/extensions/FSM.pyx":36
- *                 self.yield_states2.push_back(x)
- *             start += len(yields)
- *             self.yield_states2_starts.push_back(start)             # <<<<<<<<<<<<<<
+static CYTHON_INLINE void __pyx_fuse_0__pyx_f_7bundler_10extensions_3FSM_compose(signed char *__pyx_v_table, int __pyx_v_alphabet_len, std::vector<int>  &__pyx_v_maps, int __pyx_v_width, int __pyx_v_letter) {
+  int __pyx_v_start;
+  int __pyx_v_c;
+  int __pyx_v_state;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_fuse_0compose", 0);
+
+  /* "bundler/extensions/FSM.pyx":43
+ * cdef inline void compose(entry* table, int alphabet_len, vector[int]& maps, int width, int letter):
+ *     ''' Push the composition of the top width entries of maps with letter onto maps. '''
+ *     cdef int start = maps.size() - width             # <<<<<<<<<<<<<<
+ *     cdef int c, state
+ *     for c in range(width):
+ */
+  __pyx_v_start = (__pyx_v_maps.size() - __pyx_v_width);
+
+  /* "bundler/extensions/FSM.pyx":45
+ *     cdef int start = maps.size() - width
+ *     cdef int c, state
+ *     for c in range(width):             # <<<<<<<<<<<<<<
+ *         state = maps[start + c]
+ *         if state >= 0:
+ */
+  __pyx_t_1 = __pyx_v_width;
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_c = __pyx_t_3;
+
+    /* "bundler/extensions/FSM.pyx":46
+ *     cdef int c, state
+ *     for c in range(width):
+ *         state = maps[start + c]             # <<<<<<<<<<<<<<
+ *         if state >= 0:
+ *             state = table[state * alphabet_len + letter]
+ */
+    __pyx_v_state = (__pyx_v_maps[(__pyx_v_start + __pyx_v_c)]);
+
+    /* "bundler/extensions/FSM.pyx":47
+ *     for c in range(width):
+ *         state = maps[start + c]
+ *         if state >= 0:             # <<<<<<<<<<<<<<
+ *             state = table[state * alphabet_len + letter]
+ *         maps.push_back(state)
+ */
+    __pyx_t_4 = ((__pyx_v_state >= 0) != 0);
+    if (__pyx_t_4) {
+
+      /* "bundler/extensions/FSM.pyx":48
+ *         state = maps[start + c]
+ *         if state >= 0:
+ *             state = table[state * alphabet_len + letter]             # <<<<<<<<<<<<<<
+ *         maps.push_back(state)
  * 
- *         reverse_arrows = defaultdict(list)
  */
-    try {
-      __pyx_v_self->yield_states2_starts.push_back(__pyx_v_start);
-    } catch(...) {
-      __Pyx_CppExn2PyErr();
-      __PYX_ERR(0, 36, __pyx_L1_error)
-    }
+      __pyx_v_state = (__pyx_v_table[((__pyx_v_state * __pyx_v_alphabet_len) + __pyx_v_letter)]);
 
-    /* "bundler/extensions/FSM.pyx":31
- *         start = 0
- *         self.yield_states2_starts.push_back(0)
- *         for i in range(self.machine_len):             # <<<<<<<<<<<<<<
- *             yields = self.yield_states.get(i, [])
- *             for x in yields:
+      /* "bundler/extensions/FSM.pyx":47
+ *     for c in range(width):
+ *         state = maps[start + c]
+ *         if state >= 0:             # <<<<<<<<<<<<<<
+ *             state = table[state * alphabet_len + letter]
+ *         maps.push_back(state)
  */
-  }
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    }
 
-  /* "bundler/extensions/FSM.pyx":38
- *             self.yield_states2_starts.push_back(start)
+    /* "bundler/extensions/FSM.pyx":49
+ *         if state >= 0:
+ *             state = table[state * alphabet_len + letter]
+ *         maps.push_back(state)             # <<<<<<<<<<<<<<
  * 
- *         reverse_arrows = defaultdict(list)             # <<<<<<<<<<<<<<
- *         for state in range(self.machine_len):
- *             for i in range(self.alphabet_len):
+ * cdef class FSM:
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_9, __pyx_n_s_defaultdict); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 38, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_9);
-  __pyx_t_1 = NULL;
-  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_9))) {
-    __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_9);
-    if (likely(__pyx_t_1)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
-      __Pyx_INCREF(__pyx_t_1);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_9, function);
+    try {
+      __pyx_v_maps.push_back(__pyx_v_state);
+    } catch(...) {
+      __Pyx_CppExn2PyErr();
+      __PYX_ERR(0, 49, __pyx_L1_error)
     }
   }
-  __pyx_t_3 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_9, __pyx_t_1, ((PyObject *)(&PyList_Type))) : __Pyx_PyObject_CallOneArg(__pyx_t_9, ((PyObject *)(&PyList_Type)));
-  __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 38, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-  __pyx_v_reverse_arrows = __pyx_t_3;
-  __pyx_t_3 = 0;
 
-  /* "bundler/extensions/FSM.pyx":39
+  /* "bundler/extensions/FSM.pyx":41
+ *     return state
  * 
- *         reverse_arrows = defaultdict(list)
- *         for state in range(self.machine_len):             # <<<<<<<<<<<<<<
- *             for i in range(self.alphabet_len):
- *                 new_state = self.machine.data.as_ints[state * self.alphabet_len + i]
+ * cdef inline void compose(entry* table, int alphabet_len, vector[int]& maps, int width, int letter):             # <<<<<<<<<<<<<<
+ *     ''' Push the composition of the top width entries of maps with letter onto maps. '''
+ *     cdef int start = maps.size() - width
  */
-  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_self->machine_len); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 39, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_9 = __Pyx_PyObject_CallOneArg(__pyx_builtin_range, __pyx_t_3); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 39, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_9);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (likely(PyList_CheckExact(__pyx_t_9)) || PyTuple_CheckExact(__pyx_t_9)) {
-    __pyx_t_3 = __pyx_t_9; __Pyx_INCREF(__pyx_t_3); __pyx_t_2 = 0;
-    __pyx_t_11 = NULL;
-  } else {
-    __pyx_t_2 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_t_9); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 39, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_11 = Py_TYPE(__pyx_t_3)->tp_iternext; if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 39, __pyx_L1_error)
-  }
-  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-  for (;;) {
-    if (likely(!__pyx_t_11)) {
-      if (likely(PyList_CheckExact(__pyx_t_3))) {
-        if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_3)) break;
-        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_9 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_2); __Pyx_INCREF(__pyx_t_9); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 39, __pyx_L1_error)
-        #else
-        __pyx_t_9 = PySequence_ITEM(__pyx_t_3, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 39, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_9);
-        #endif
-      } else {
-        if (__pyx_t_2 >= PyTuple_GET_SIZE(__pyx_t_3)) break;
-        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_9 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_2); __Pyx_INCREF(__pyx_t_9); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 39, __pyx_L1_error)
-        #else
-        __pyx_t_9 = PySequence_ITEM(__pyx_t_3, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 39, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_9);
-        #endif
-      }
-    } else {
-      __pyx_t_9 = __pyx_t_11(__pyx_t_3);
-      if (unlikely(!__pyx_t_9)) {
-        PyObject* exc_type = PyErr_Occurred();
-        if (exc_type) {
-          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-          else __PYX_ERR(0, 39, __pyx_L1_error)
-        }
-        break;
-      }
-      __Pyx_GOTREF(__pyx_t_9);
-    }
-    __Pyx_XDECREF_SET(__pyx_v_state, __pyx_t_9);
-    __pyx_t_9 = 0;
 
-    /* "bundler/extensions/FSM.pyx":40
- *         reverse_arrows = defaultdict(list)
- *         for state in range(self.machine_len):
- *             for i in range(self.alphabet_len):             # <<<<<<<<<<<<<<
- *                 new_state = self.machine.data.as_ints[state * self.alphabet_len + i]
- *                 reverse_arrows[new_state].append(state)
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_WriteUnraisable("bundler.extensions.FSM.compose", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+}
+
+static CYTHON_INLINE void __pyx_fuse_1__pyx_f_7bundler_10extensions_3FSM_compose(short *__pyx_v_table, int __pyx_v_alphabet_len, std::vector<int>  &__pyx_v_maps, int __pyx_v_width, int __pyx_v_letter) {
+  int __pyx_v_start;
+  int __pyx_v_c;
+  int __pyx_v_state;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_fuse_1compose", 0);
+
+  /* "bundler/extensions/FSM.pyx":43
+ * cdef inline void compose(entry* table, int alphabet_len, vector[int]& maps, int width, int letter):
+ *     ''' Push the composition of the top width entries of maps with letter onto maps. '''
+ *     cdef int start = maps.size() - width             # <<<<<<<<<<<<<<
+ *     cdef int c, state
+ *     for c in range(width):
  */
-    __pyx_t_9 = __Pyx_PyInt_From_int(__pyx_v_self->alphabet_len); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 40, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_9);
-    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_builtin_range, __pyx_t_9); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 40, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-    if (likely(PyList_CheckExact(__pyx_t_1)) || PyTuple_CheckExact(__pyx_t_1)) {
-      __pyx_t_9 = __pyx_t_1; __Pyx_INCREF(__pyx_t_9); __pyx_t_12 = 0;
-      __pyx_t_13 = NULL;
-    } else {
-      __pyx_t_12 = -1; __pyx_t_9 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 40, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_9);
-      __pyx_t_13 = Py_TYPE(__pyx_t_9)->tp_iternext; if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 40, __pyx_L1_error)
-    }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    for (;;) {
-      if (likely(!__pyx_t_13)) {
-        if (likely(PyList_CheckExact(__pyx_t_9))) {
-          if (__pyx_t_12 >= PyList_GET_SIZE(__pyx_t_9)) break;
-          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-          __pyx_t_1 = PyList_GET_ITEM(__pyx_t_9, __pyx_t_12); __Pyx_INCREF(__pyx_t_1); __pyx_t_12++; if (unlikely(0 < 0)) __PYX_ERR(0, 40, __pyx_L1_error)
-          #else
-          __pyx_t_1 = PySequence_ITEM(__pyx_t_9, __pyx_t_12); __pyx_t_12++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 40, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_1);
-          #endif
-        } else {
-          if (__pyx_t_12 >= PyTuple_GET_SIZE(__pyx_t_9)) break;
-          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-          __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_9, __pyx_t_12); __Pyx_INCREF(__pyx_t_1); __pyx_t_12++; if (unlikely(0 < 0)) __PYX_ERR(0, 40, __pyx_L1_error)
-          #else
-          __pyx_t_1 = PySequence_ITEM(__pyx_t_9, __pyx_t_12); __pyx_t_12++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 40, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_1);
-          #endif
-        }
-      } else {
-        __pyx_t_1 = __pyx_t_13(__pyx_t_9);
-        if (unlikely(!__pyx_t_1)) {
-          PyObject* exc_type = PyErr_Occurred();
-          if (exc_type) {
-            if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-            else __PYX_ERR(0, 40, __pyx_L1_error)
-          }
-          break;
-        }
-        __Pyx_GOTREF(__pyx_t_1);
-      }
-      __Pyx_XDECREF_SET(__pyx_v_i, __pyx_t_1);
-      __pyx_t_1 = 0;
+  __pyx_v_start = (__pyx_v_maps.size() - __pyx_v_width);
 
-      /* "bundler/extensions/FSM.pyx":41
- *         for state in range(self.machine_len):
- *             for i in range(self.alphabet_len):
- *                 new_state = self.machine.data.as_ints[state * self.alphabet_len + i]             # <<<<<<<<<<<<<<
- *                 reverse_arrows[new_state].append(state)
- * 
+  /* "bundler/extensions/FSM.pyx":45
+ *     cdef int start = maps.size() - width
+ *     cdef int c, state
+ *     for c in range(width):             # <<<<<<<<<<<<<<
+ *         state = maps[start + c]
+ *         if state >= 0:
  */
-      __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->alphabet_len); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 41, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_8 = PyNumber_Multiply(__pyx_v_state, __pyx_t_1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 41, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_8);
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __pyx_t_1 = PyNumber_Add(__pyx_t_8, __pyx_v_i); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 41, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-      __pyx_t_15 = __Pyx_PyIndex_AsSsize_t(__pyx_t_1); if (unlikely((__pyx_t_15 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 41, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __pyx_t_1 = __Pyx_PyInt_From_int((__pyx_v_self->machine->data.as_ints[__pyx_t_15])); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 41, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_XDECREF_SET(__pyx_v_new_state, __pyx_t_1);
-      __pyx_t_1 = 0;
+  __pyx_t_1 = __pyx_v_width;
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_c = __pyx_t_3;
 
-      /* "bundler/extensions/FSM.pyx":42
- *             for i in range(self.alphabet_len):
- *                 new_state = self.machine.data.as_ints[state * self.alphabet_len + i]
- *                 reverse_arrows[new_state].append(state)             # <<<<<<<<<<<<<<
- * 
- *         to_check = Queue()
+    /* "bundler/extensions/FSM.pyx":46
+ *     cdef int c, state
+ *     for c in range(width):
+ *         state = maps[start + c]             # <<<<<<<<<<<<<<
+ *         if state >= 0:
+ *             state = table[state * alphabet_len + letter]
  */
-      __pyx_t_1 = __Pyx_PyObject_GetItem(__pyx_v_reverse_arrows, __pyx_v_new_state); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 42, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_16 = __Pyx_PyObject_Append(__pyx_t_1, __pyx_v_state); if (unlikely(__pyx_t_16 == ((int)-1))) __PYX_ERR(0, 42, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_v_state = (__pyx_v_maps[(__pyx_v_start + __pyx_v_c)]);
 
-      /* "bundler/extensions/FSM.pyx":40
- *         reverse_arrows = defaultdict(list)
- *         for state in range(self.machine_len):
- *             for i in range(self.alphabet_len):             # <<<<<<<<<<<<<<
- *                 new_state = self.machine.data.as_ints[state * self.alphabet_len + i]
- *                 reverse_arrows[new_state].append(state)
+    /* "bundler/extensions/FSM.pyx":47
+ *     for c in range(width):
+ *         state = maps[start + c]
+ *         if state >= 0:             # <<<<<<<<<<<<<<
+ *             state = table[state * alphabet_len + letter]
+ *         maps.push_back(state)
  */
-    }
-    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __pyx_t_4 = ((__pyx_v_state >= 0) != 0);
+    if (__pyx_t_4) {
 
-    /* "bundler/extensions/FSM.pyx":39
+      /* "bundler/extensions/FSM.pyx":48
+ *         state = maps[start + c]
+ *         if state >= 0:
+ *             state = table[state * alphabet_len + letter]             # <<<<<<<<<<<<<<
+ *         maps.push_back(state)
  * 
- *         reverse_arrows = defaultdict(list)
- *         for state in range(self.machine_len):             # <<<<<<<<<<<<<<
- *             for i in range(self.alphabet_len):
- *                 new_state = self.machine.data.as_ints[state * self.alphabet_len + i]
  */
-  }
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_v_state = (__pyx_v_table[((__pyx_v_state * __pyx_v_alphabet_len) + __pyx_v_letter)]);
+
+      /* "bundler/extensions/FSM.pyx":47
+ *     for c in range(width):
+ *         state = maps[start + c]
+ *         if state >= 0:             # <<<<<<<<<<<<<<
+ *             state = table[state * alphabet_len + letter]
+ *         maps.push_back(state)
+ */
+    }
 
-  /* "bundler/extensions/FSM.pyx":44
- *                 reverse_arrows[new_state].append(state)
+    /* "bundler/extensions/FSM.pyx":49
+ *         if state >= 0:
+ *             state = table[state * alphabet_len + letter]
+ *         maps.push_back(state)             # <<<<<<<<<<<<<<
  * 
- *         to_check = Queue()             # <<<<<<<<<<<<<<
- *         self.distance_to_yield = dict()
- *         for state in range(self.machine_len):
+ * cdef class FSM:
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_9, __pyx_n_s_Queue); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 44, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_9);
-  __pyx_t_1 = NULL;
-  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_9))) {
-    __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_9);
-    if (likely(__pyx_t_1)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
-      __Pyx_INCREF(__pyx_t_1);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_9, function);
+    try {
+      __pyx_v_maps.push_back(__pyx_v_state);
+    } catch(...) {
+      __Pyx_CppExn2PyErr();
+      __PYX_ERR(0, 49, __pyx_L1_error)
     }
   }
-  __pyx_t_3 = (__pyx_t_1) ? __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_t_1) : __Pyx_PyObject_CallNoArg(__pyx_t_9);
-  __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 44, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-  __pyx_v_to_check = __pyx_t_3;
-  __pyx_t_3 = 0;
 
-  /* "bundler/extensions/FSM.pyx":45
+  /* "bundler/extensions/FSM.pyx":41
+ *     return state
  * 
- *         to_check = Queue()
- *         self.distance_to_yield = dict()             # <<<<<<<<<<<<<<
- *         for state in range(self.machine_len):
- *             if self.yield_states.get(state, []):
+ * cdef inline void compose(entry* table, int alphabet_len, vector[int]& maps, int width, int letter):             # <<<<<<<<<<<<<<
+ *     ''' Push the composition of the top width entries of maps with letter onto maps. '''
+ *     cdef int start = maps.size() - width
  */
-  __pyx_t_3 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 45, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_GIVEREF(__pyx_t_3);
-  __Pyx_GOTREF(__pyx_v_self->distance_to_yield);
-  __Pyx_DECREF(__pyx_v_self->distance_to_yield);
-  __pyx_v_self->distance_to_yield = ((PyObject*)__pyx_t_3);
-  __pyx_t_3 = 0;
 
-  /* "bundler/extensions/FSM.pyx":46
- *         to_check = Queue()
- *         self.distance_to_yield = dict()
- *         for state in range(self.machine_len):             # <<<<<<<<<<<<<<
- *             if self.yield_states.get(state, []):
- *                 self.distance_to_yield[state] = 0
- */
-  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_self->machine_len); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 46, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_9 = __Pyx_PyObject_CallOneArg(__pyx_builtin_range, __pyx_t_3); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 46, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_9);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (likely(PyList_CheckExact(__pyx_t_9)) || PyTuple_CheckExact(__pyx_t_9)) {
-    __pyx_t_3 = __pyx_t_9; __Pyx_INCREF(__pyx_t_3); __pyx_t_2 = 0;
-    __pyx_t_11 = NULL;
-  } else {
-    __pyx_t_2 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_t_9); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 46, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_11 = Py_TYPE(__pyx_t_3)->tp_iternext; if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 46, __pyx_L1_error)
-  }
-  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-  for (;;) {
-    if (likely(!__pyx_t_11)) {
-      if (likely(PyList_CheckExact(__pyx_t_3))) {
-        if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_3)) break;
-        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_9 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_2); __Pyx_INCREF(__pyx_t_9); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 46, __pyx_L1_error)
-        #else
-        __pyx_t_9 = PySequence_ITEM(__pyx_t_3, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 46, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_9);
-        #endif
-      } else {
-        if (__pyx_t_2 >= PyTuple_GET_SIZE(__pyx_t_3)) break;
-        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_9 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_2); __Pyx_INCREF(__pyx_t_9); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 46, __pyx_L1_error)
-        #else
-        __pyx_t_9 = PySequence_ITEM(__pyx_t_3, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 46, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_9);
-        #endif
-      }
-    } else {
-      __pyx_t_9 = __pyx_t_11(__pyx_t_3);
-      if (unlikely(!__pyx_t_9)) {
-        PyObject* exc_type = PyErr_Occurred();
-        if (exc_type) {
-          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-          else __PYX_ERR(0, 46, __pyx_L1_error)
-        }
-        break;
-      }
-      __Pyx_GOTREF(__pyx_t_9);
-    }
-    __Pyx_XDECREF_SET(__pyx_v_state, __pyx_t_9);
-    __pyx_t_9 = 0;
-
-    /* "bundler/extensions/FSM.pyx":47
- *         self.distance_to_yield = dict()
- *         for state in range(self.machine_len):
- *             if self.yield_states.get(state, []):             # <<<<<<<<<<<<<<
- *                 self.distance_to_yield[state] = 0
- *                 to_check.put(state)
- */
-    if (unlikely(__pyx_v_self->yield_states == Py_None)) {
-      PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "get");
-      __PYX_ERR(0, 47, __pyx_L1_error)
-    }
-    __pyx_t_9 = PyList_New(0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 47, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_9);
-    __pyx_t_1 = __Pyx_PyDict_GetItemDefault(__pyx_v_self->yield_states, __pyx_v_state, __pyx_t_9); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 47, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-    __pyx_t_10 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_10 < 0)) __PYX_ERR(0, 47, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    if (__pyx_t_10) {
-
-      /* "bundler/extensions/FSM.pyx":48
- *         for state in range(self.machine_len):
- *             if self.yield_states.get(state, []):
- *                 self.distance_to_yield[state] = 0             # <<<<<<<<<<<<<<
- *                 to_check.put(state)
- * 
- */
-      if (unlikely(__pyx_v_self->distance_to_yield == Py_None)) {
-        PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-        __PYX_ERR(0, 48, __pyx_L1_error)
-      }
-      if (unlikely(PyDict_SetItem(__pyx_v_self->distance_to_yield, __pyx_v_state, __pyx_int_0) < 0)) __PYX_ERR(0, 48, __pyx_L1_error)
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_WriteUnraisable("bundler.extensions.FSM.compose", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+}
 
-      /* "bundler/extensions/FSM.pyx":49
- *             if self.yield_states.get(state, []):
- *                 self.distance_to_yield[state] = 0
- *                 to_check.put(state)             # <<<<<<<<<<<<<<
- * 
- *         while not to_check.empty():
+static CYTHON_INLINE void __pyx_fuse_2__pyx_f_7bundler_10extensions_3FSM_compose(int *__pyx_v_table, int __pyx_v_alphabet_len, std::vector<int>  &__pyx_v_maps, int __pyx_v_width, int __pyx_v_letter) {
+  int __pyx_v_start;
+  int __pyx_v_c;
+  int __pyx_v_state;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_fuse_2compose", 0);
+
+  /* "bundler/extensions/FSM.pyx":43
+ * cdef inline void compose(entry* table, int alphabet_len, vector[int]& maps, int width, int letter):
+ *     ''' Push the composition of the top width entries of maps with letter onto maps. '''
+ *     cdef int start = maps.size() - width             # <<<<<<<<<<<<<<
+ *     cdef int c, state
+ *     for c in range(width):
  */
-      __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_v_to_check, __pyx_n_s_put); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 49, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_9);
-      __pyx_t_8 = NULL;
-      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
-        __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_9);
-        if (likely(__pyx_t_8)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
-          __Pyx_INCREF(__pyx_t_8);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_9, function);
-        }
-      }
-      __pyx_t_1 = (__pyx_t_8) ? __Pyx_PyObject_Call2Args(__pyx_t_9, __pyx_t_8, __pyx_v_state) : __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_v_state);
-      __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 49, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_start = (__pyx_v_maps.size() - __pyx_v_width);
 
-      /* "bundler/extensions/FSM.pyx":47
- *         self.distance_to_yield = dict()
- *         for state in range(self.machine_len):
- *             if self.yield_states.get(state, []):             # <<<<<<<<<<<<<<
- *                 self.distance_to_yield[state] = 0
- *                 to_check.put(state)
+  /* "bundler/extensions/FSM.pyx":45
+ *     cdef int start = maps.size() - width
+ *     cdef int c, state
+ *     for c in range(width):             # <<<<<<<<<<<<<<
+ *         state = maps[start + c]
+ *         if state >= 0:
  */
-    }
+  __pyx_t_1 = __pyx_v_width;
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_c = __pyx_t_3;
 
     /* "bundler/extensions/FSM.pyx":46
- *         to_check = Queue()
- *         self.distance_to_yield = dict()
- *         for state in range(self.machine_len):             # <<<<<<<<<<<<<<
- *             if self.yield_states.get(state, []):
- *                 self.distance_to_yield[state] = 0
+ *     cdef int c, state
+ *     for c in range(width):
+ *         state = maps[start + c]             # <<<<<<<<<<<<<<
+ *         if state >= 0:
+ *             state = table[state * alphabet_len + letter]
  */
-  }
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_v_state = (__pyx_v_maps[(__pyx_v_start + __pyx_v_c)]);
 
-  /* "bundler/extensions/FSM.pyx":51
- *                 to_check.put(state)
- * 
- *         while not to_check.empty():             # <<<<<<<<<<<<<<
- *             current = to_check.get()
- *             for adjacent in reverse_arrows[current]:
+    /* "bundler/extensions/FSM.pyx":47
+ *     for c in range(width):
+ *         state = maps[start + c]
+ *         if state >= 0:             # <<<<<<<<<<<<<<
+ *             state = table[state * alphabet_len + letter]
+ *         maps.push_back(state)
  */
-  while (1) {
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_to_check, __pyx_n_s_empty); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 51, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_9 = NULL;
-    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
-      __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_1);
-      if (likely(__pyx_t_9)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
-        __Pyx_INCREF(__pyx_t_9);
-        __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_1, function);
-      }
-    }
-    __pyx_t_3 = (__pyx_t_9) ? __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_9) : __Pyx_PyObject_CallNoArg(__pyx_t_1);
-    __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
-    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 51, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_10 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_10 < 0)) __PYX_ERR(0, 51, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_17 = ((!__pyx_t_10) != 0);
-    if (!__pyx_t_17) break;
+    __pyx_t_4 = ((__pyx_v_state >= 0) != 0);
+    if (__pyx_t_4) {
 
-    /* "bundler/extensions/FSM.pyx":52
+      /* "bundler/extensions/FSM.pyx":48
+ *         state = maps[start + c]
+ *         if state >= 0:
+ *             state = table[state * alphabet_len + letter]             # <<<<<<<<<<<<<<
+ *         maps.push_back(state)
  * 
- *         while not to_check.empty():
- *             current = to_check.get()             # <<<<<<<<<<<<<<
- *             for adjacent in reverse_arrows[current]:
- *                 if adjacent not in self.distance_to_yield:
  */
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_to_check, __pyx_n_s_get); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 52, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_9 = NULL;
-    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
-      __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_1);
-      if (likely(__pyx_t_9)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
-        __Pyx_INCREF(__pyx_t_9);
-        __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_1, function);
-      }
-    }
-    __pyx_t_3 = (__pyx_t_9) ? __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_9) : __Pyx_PyObject_CallNoArg(__pyx_t_1);
-    __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
-    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 52, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __Pyx_XDECREF_SET(__pyx_v_current, __pyx_t_3);
-    __pyx_t_3 = 0;
+      __pyx_v_state = (__pyx_v_table[((__pyx_v_state * __pyx_v_alphabet_len) + __pyx_v_letter)]);
 
-    /* "bundler/extensions/FSM.pyx":53
- *         while not to_check.empty():
- *             current = to_check.get()
- *             for adjacent in reverse_arrows[current]:             # <<<<<<<<<<<<<<
- *                 if adjacent not in self.distance_to_yield:
- *                     self.distance_to_yield[adjacent] = self.distance_to_yield[current] + 1
+      /* "bundler/extensions/FSM.pyx":47
+ *     for c in range(width):
+ *         state = maps[start + c]
+ *         if state >= 0:             # <<<<<<<<<<<<<<
+ *             state = table[state * alphabet_len + letter]
+ *         maps.push_back(state)
  */
-    __pyx_t_3 = __Pyx_PyObject_GetItem(__pyx_v_reverse_arrows, __pyx_v_current); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 53, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    if (likely(PyList_CheckExact(__pyx_t_3)) || PyTuple_CheckExact(__pyx_t_3)) {
-      __pyx_t_1 = __pyx_t_3; __Pyx_INCREF(__pyx_t_1); __pyx_t_2 = 0;
-      __pyx_t_11 = NULL;
-    } else {
-      __pyx_t_2 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 53, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_11 = Py_TYPE(__pyx_t_1)->tp_iternext; if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 53, __pyx_L1_error)
     }
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    for (;;) {
-      if (likely(!__pyx_t_11)) {
-        if (likely(PyList_CheckExact(__pyx_t_1))) {
-          if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_1)) break;
-          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-          __pyx_t_3 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_3); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 53, __pyx_L1_error)
-          #else
-          __pyx_t_3 = PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 53, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_3);
-          #endif
-        } else {
-          if (__pyx_t_2 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
-          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-          __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_3); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 53, __pyx_L1_error)
-          #else
-          __pyx_t_3 = PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 53, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_3);
-          #endif
-        }
-      } else {
-        __pyx_t_3 = __pyx_t_11(__pyx_t_1);
-        if (unlikely(!__pyx_t_3)) {
-          PyObject* exc_type = PyErr_Occurred();
-          if (exc_type) {
-            if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-            else __PYX_ERR(0, 53, __pyx_L1_error)
-          }
-          break;
-        }
-        __Pyx_GOTREF(__pyx_t_3);
-      }
-      __Pyx_XDECREF_SET(__pyx_v_adjacent, __pyx_t_3);
-      __pyx_t_3 = 0;
-
-      /* "bundler/extensions/FSM.pyx":54
- *             current = to_check.get()
- *             for adjacent in reverse_arrows[current]:
- *                 if adjacent not in self.distance_to_yield:             # <<<<<<<<<<<<<<
- *                     self.distance_to_yield[adjacent] = self.distance_to_yield[current] + 1
- *                     to_check.put(adjacent)
- */
-      if (unlikely(__pyx_v_self->distance_to_yield == Py_None)) {
-        PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
-        __PYX_ERR(0, 54, __pyx_L1_error)
-      }
-      __pyx_t_17 = (__Pyx_PyDict_ContainsTF(__pyx_v_adjacent, __pyx_v_self->distance_to_yield, Py_NE)); if (unlikely(__pyx_t_17 < 0)) __PYX_ERR(0, 54, __pyx_L1_error)
-      __pyx_t_10 = (__pyx_t_17 != 0);
-      if (__pyx_t_10) {
-
-        /* "bundler/extensions/FSM.pyx":55
- *             for adjacent in reverse_arrows[current]:
- *                 if adjacent not in self.distance_to_yield:
- *                     self.distance_to_yield[adjacent] = self.distance_to_yield[current] + 1             # <<<<<<<<<<<<<<
- *                     to_check.put(adjacent)
- * 
- */
-        if (unlikely(__pyx_v_self->distance_to_yield == Py_None)) {
-          PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-          __PYX_ERR(0, 55, __pyx_L1_error)
-        }
-        __pyx_t_3 = __Pyx_PyDict_GetItem(__pyx_v_self->distance_to_yield, __pyx_v_current); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 55, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_3);
-        __pyx_t_9 = __Pyx_PyInt_AddObjC(__pyx_t_3, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 55, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_9);
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-        if (unlikely(__pyx_v_self->distance_to_yield == Py_None)) {
-          PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-          __PYX_ERR(0, 55, __pyx_L1_error)
-        }
-        if (unlikely(PyDict_SetItem(__pyx_v_self->distance_to_yield, __pyx_v_adjacent, __pyx_t_9) < 0)) __PYX_ERR(0, 55, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
 
-        /* "bundler/extensions/FSM.pyx":56
- *                 if adjacent not in self.distance_to_yield:
- *                     self.distance_to_yield[adjacent] = self.distance_to_yield[current] + 1
- *                     to_check.put(adjacent)             # <<<<<<<<<<<<<<
+    /* "bundler/extensions/FSM.pyx":49
+ *         if state >= 0:
+ *             state = table[state * alphabet_len + letter]
+ *         maps.push_back(state)             # <<<<<<<<<<<<<<
  * 
- *     @classmethod
- */
-        __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_to_check, __pyx_n_s_put); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 56, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_3);
-        __pyx_t_8 = NULL;
-        if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
-          __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_3);
-          if (likely(__pyx_t_8)) {
-            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-            __Pyx_INCREF(__pyx_t_8);
-            __Pyx_INCREF(function);
-            __Pyx_DECREF_SET(__pyx_t_3, function);
-          }
-        }
-        __pyx_t_9 = (__pyx_t_8) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_8, __pyx_v_adjacent) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_adjacent);
-        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-        if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 56, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_9);
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-
-        /* "bundler/extensions/FSM.pyx":54
- *             current = to_check.get()
- *             for adjacent in reverse_arrows[current]:
- *                 if adjacent not in self.distance_to_yield:             # <<<<<<<<<<<<<<
- *                     self.distance_to_yield[adjacent] = self.distance_to_yield[current] + 1
- *                     to_check.put(adjacent)
- */
-      }
-
-      /* "bundler/extensions/FSM.pyx":53
- *         while not to_check.empty():
- *             current = to_check.get()
- *             for adjacent in reverse_arrows[current]:             # <<<<<<<<<<<<<<
- *                 if adjacent not in self.distance_to_yield:
- *                     self.distance_to_yield[adjacent] = self.distance_to_yield[current] + 1
+ * cdef class FSM:
  */
+    try {
+      __pyx_v_maps.push_back(__pyx_v_state);
+    } catch(...) {
+      __Pyx_CppExn2PyErr();
+      __PYX_ERR(0, 49, __pyx_L1_error)
     }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   }
 
-  /* "bundler/extensions/FSM.pyx":18
+  /* "bundler/extensions/FSM.pyx":41
+ *     return state
  * 
- * cdef class FSM:
- *     def __init__(self, alphabet, machine, yield_states):             # <<<<<<<<<<<<<<
- *         cdef int start
- *         cdef IWord x
+ * cdef inline void compose(entry* table, int alphabet_len, vector[int]& maps, int width, int letter):             # <<<<<<<<<<<<<<
+ *     ''' Push the composition of the top width entries of maps with letter onto maps. '''
+ *     cdef int start = maps.size() - width
  */
 
   /* function exit code */
-  __pyx_r = 0;
   goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_XDECREF(__pyx_t_9);
-  __Pyx_AddTraceback("bundler.extensions.FSM.FSM.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = -1;
+  __Pyx_WriteUnraisable("bundler.extensions.FSM.compose", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
   __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_i);
-  __Pyx_XDECREF(__pyx_v_yields);
-  __Pyx_XDECREF(__pyx_v_reverse_arrows);
-  __Pyx_XDECREF(__pyx_v_state);
-  __Pyx_XDECREF(__pyx_v_new_state);
-  __Pyx_XDECREF(__pyx_v_to_check);
-  __Pyx_XDECREF(__pyx_v_current);
-  __Pyx_XDECREF(__pyx_v_adjacent);
   __Pyx_RefNannyFinishContext();
-  return __pyx_r;
 }
 
-/* "bundler/extensions/FSM.pyx":59
- * 
- *     @classmethod
- *     def from_dicts(cls, list alphabet, object machine, dict hits):             # <<<<<<<<<<<<<<
- *         ''' Build a cFSM from an ordered dictionary of dictionaries and a dictionary mapping states to hits. '''
+/* "bundler/extensions/FSM.pyx":52
  * 
+ * cdef class FSM:
+ *     def __init__(self, alphabet, machine, yield_states, distance_to_yield=None):             # <<<<<<<<<<<<<<
+ *         cdef int start
+ *         cdef IWord x
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_3from_dicts(PyObject *__pyx_v_cls, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_7bundler_10extensions_3FSM_3FSM_2from_dicts[] = " Build a cFSM from an ordered dictionary of dictionaries and a dictionary mapping states to hits. ";
-static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_3from_dicts(PyObject *__pyx_v_cls, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static int __pyx_pw_7bundler_10extensions_3FSM_3FSM_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_7bundler_10extensions_3FSM_3FSM_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_alphabet = 0;
   PyObject *__pyx_v_machine = 0;
-  PyObject *__pyx_v_hits = 0;
+  PyObject *__pyx_v_yield_states = 0;
+  PyObject *__pyx_v_distance_to_yield = 0;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  PyObject *__pyx_r = 0;
+  int __pyx_r;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("from_dicts (wrapper)", 0);
+  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
   {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_alphabet,&__pyx_n_s_machine,&__pyx_n_s_hits,0};
-    PyObject* values[3] = {0,0,0};
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_alphabet,&__pyx_n_s_machine,&__pyx_n_s_yield_states,&__pyx_n_s_distance_to_yield,0};
+    PyObject* values[4] = {0,0,0,0};
+    values[3] = ((PyObject *)Py_None);
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
       switch (pos_args) {
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
         case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
         CYTHON_FALLTHROUGH;
         case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
@@ -3312,60 +3287,65 @@ static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_3from_dicts(PyObject *
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_machine)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("from_dicts", 1, 3, 3, 1); __PYX_ERR(0, 59, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("__init__", 0, 3, 4, 1); __PYX_ERR(0, 52, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
-        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_hits)) != 0)) kw_args--;
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_yield_states)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("from_dicts", 1, 3, 3, 2); __PYX_ERR(0, 59, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("__init__", 0, 3, 4, 2); __PYX_ERR(0, 52, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_distance_to_yield);
+          if (value) { values[3] = value; kw_args--; }
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "from_dicts") < 0)) __PYX_ERR(0, 59, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 52, __pyx_L3_error)
       }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
-      goto __pyx_L5_argtuple_error;
     } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
     }
-    __pyx_v_alphabet = ((PyObject*)values[0]);
+    __pyx_v_alphabet = values[0];
     __pyx_v_machine = values[1];
-    __pyx_v_hits = ((PyObject*)values[2]);
+    __pyx_v_yield_states = values[2];
+    __pyx_v_distance_to_yield = values[3];
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("from_dicts", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 59, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__init__", 0, 3, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 52, __pyx_L3_error)
   __pyx_L3_error:;
-  __Pyx_AddTraceback("bundler.extensions.FSM.FSM.from_dicts", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("bundler.extensions.FSM.FSM.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
-  return NULL;
+  return -1;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_alphabet), (&PyList_Type), 1, "alphabet", 1))) __PYX_ERR(0, 59, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_hits), (&PyDict_Type), 1, "hits", 1))) __PYX_ERR(0, 59, __pyx_L1_error)
-  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_3FSM_2from_dicts(((PyTypeObject*)__pyx_v_cls), __pyx_v_alphabet, __pyx_v_machine, __pyx_v_hits);
+  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_3FSM___init__(((struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)__pyx_v_self), __pyx_v_alphabet, __pyx_v_machine, __pyx_v_yield_states, __pyx_v_distance_to_yield);
 
   /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __pyx_r = NULL;
-  __pyx_L0:;
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
-static PyObject *__pyx_gb_7bundler_10extensions_3FSM_3FSM_10from_dicts_2generator1(__pyx_CoroutineObject *__pyx_generator, CYTHON_UNUSED PyThreadState *__pyx_tstate, PyObject *__pyx_sent_value); /* proto */
+static PyObject *__pyx_gb_7bundler_10extensions_3FSM_3FSM_8__init___8genexpr1_2generator1(__pyx_CoroutineObject *__pyx_generator, CYTHON_UNUSED PyThreadState *__pyx_tstate, PyObject *__pyx_sent_value); /* proto */
 
-/* "bundler/extensions/FSM.pyx":65
+/* "bundler/extensions/FSM.pyx":76
  * 
- *         state_names = list(machine)
- *         state_names_index = dict((name, place) for place, name in enumerate(state_names))             # <<<<<<<<<<<<<<
- *         flattened_machine = [state_names_index.get(machine[state_name][letter], -1) for state_name in state_names for letter in alphabet]
+ *         # The length of the shortest word that each state yields, states that do not yield are given a length larger than any word.
+ *         self.shortest_yield = array.array('i', [min((len(x) for x in self.yield_states.get(state, [])), default=UNREACHABLE) for state in range(self.machine_len)])             # <<<<<<<<<<<<<<
  * 
+ *         if distance_to_yield is not None:  # Already known, for example when loading from a cache.
  */
 
-static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_10from_dicts_genexpr(PyObject *__pyx_self) {
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_8__init___8genexpr1_genexpr(PyObject *__pyx_self) {
   struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr *__pyx_cur_scope;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -3377,15 +3357,15 @@ static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_10from_dicts_genexpr(P
   if (unlikely(!__pyx_cur_scope)) {
     __pyx_cur_scope = ((struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr *)Py_None);
     __Pyx_INCREF(Py_None);
-    __PYX_ERR(0, 65, __pyx_L1_error)
+    __PYX_ERR(0, 76, __pyx_L1_error)
   } else {
     __Pyx_GOTREF(__pyx_cur_scope);
   }
-  __pyx_cur_scope->__pyx_outer_scope = (struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts *) __pyx_self;
+  __pyx_cur_scope->__pyx_outer_scope = (struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct____init__ *) __pyx_self;
   __Pyx_INCREF(((PyObject *)__pyx_cur_scope->__pyx_outer_scope));
   __Pyx_GIVEREF(__pyx_cur_scope->__pyx_outer_scope);
   {
-    __pyx_CoroutineObject *gen = __Pyx_Generator_New((__pyx_coroutine_body_t) __pyx_gb_7bundler_10extensions_3FSM_3FSM_10from_dicts_2generator1, NULL, (PyObject *) __pyx_cur_scope, __pyx_n_s_genexpr, __pyx_n_s_from_dicts_locals_genexpr, __pyx_n_s_bundler_extensions_FSM); if (unlikely(!gen)) __PYX_ERR(0, 65, __pyx_L1_error)
+    __pyx_CoroutineObject *gen = __Pyx_Generator_New((__pyx_coroutine_body_t) __pyx_gb_7bundler_10extensions_3FSM_3FSM_8__init___8genexpr1_2generator1, NULL, (PyObject *) __pyx_cur_scope, __pyx_n_s_genexpr, __pyx_n_s_init___locals_genexpr, __pyx_n_s_bundler_extensions_FSM); if (unlikely(!gen)) __PYX_ERR(0, 76, __pyx_L1_error)
     __Pyx_DECREF(__pyx_cur_scope);
     __Pyx_RefNannyFinishContext();
     return (PyObject *) gen;
@@ -3393,7 +3373,7 @@ static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_10from_dicts_genexpr(P
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_AddTraceback("bundler.extensions.FSM.FSM.from_dicts.genexpr", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("bundler.extensions.FSM.FSM.__init__.genexpr", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __Pyx_DECREF(((PyObject *)__pyx_cur_scope));
   __Pyx_XGIVEREF(__pyx_r);
@@ -3401,14 +3381,16 @@ static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_10from_dicts_genexpr(P
   return __pyx_r;
 }
 
-static PyObject *__pyx_gb_7bundler_10extensions_3FSM_3FSM_10from_dicts_2generator1(__pyx_CoroutineObject *__pyx_generator, CYTHON_UNUSED PyThreadState *__pyx_tstate, PyObject *__pyx_sent_value) /* generator body */
+static PyObject *__pyx_gb_7bundler_10extensions_3FSM_3FSM_8__init___8genexpr1_2generator1(__pyx_CoroutineObject *__pyx_generator, CYTHON_UNUSED PyThreadState *__pyx_tstate, PyObject *__pyx_sent_value) /* generator body */
 {
   struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr *__pyx_cur_scope = ((struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr *)__pyx_generator->closure);
   PyObject *__pyx_r = NULL;
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
-  Py_ssize_t __pyx_t_3;
-  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  Py_ssize_t __pyx_t_4;
+  PyObject *(*__pyx_t_5)(PyObject *);
+  Py_ssize_t __pyx_t_6;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -3416,186 +3398,106 @@ static PyObject *__pyx_gb_7bundler_10extensions_3FSM_3FSM_10from_dicts_2generato
   __Pyx_RefNannySetupContext("genexpr", 0);
   switch (__pyx_generator->resume_label) {
     case 0: goto __pyx_L3_first_run;
+    case 1: goto __pyx_L6_resume_from_yield;
     default: /* CPython raises the right error here */
     __Pyx_RefNannyFinishContext();
     return NULL;
   }
   __pyx_L3_first_run:;
-  if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 65, __pyx_L1_error)
-  __pyx_r = PyDict_New(); if (unlikely(!__pyx_r)) __PYX_ERR(0, 65, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_r);
-  __Pyx_INCREF(__pyx_int_0);
-  __pyx_t_1 = __pyx_int_0;
-  if (unlikely(!__pyx_cur_scope->__pyx_outer_scope->__pyx_v_state_names)) { __Pyx_RaiseClosureNameError("state_names"); __PYX_ERR(0, 65, __pyx_L1_error) }
-  __pyx_t_2 = __pyx_cur_scope->__pyx_outer_scope->__pyx_v_state_names; __Pyx_INCREF(__pyx_t_2); __pyx_t_3 = 0;
-  for (;;) {
-    if (__pyx_t_3 >= PyList_GET_SIZE(__pyx_t_2)) break;
-    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-    __pyx_t_4 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_3); __Pyx_INCREF(__pyx_t_4); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 65, __pyx_L1_error)
-    #else
-    __pyx_t_4 = PySequence_ITEM(__pyx_t_2, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 65, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    #endif
-    __Pyx_XGOTREF(__pyx_cur_scope->__pyx_v_name);
-    __Pyx_XDECREF_SET(__pyx_cur_scope->__pyx_v_name, __pyx_t_4);
-    __Pyx_GIVEREF(__pyx_t_4);
-    __pyx_t_4 = 0;
-    __Pyx_INCREF(__pyx_t_1);
-    __Pyx_XGOTREF(__pyx_cur_scope->__pyx_v_place);
-    __Pyx_XDECREF_SET(__pyx_cur_scope->__pyx_v_place, __pyx_t_1);
-    __Pyx_GIVEREF(__pyx_t_1);
-    __pyx_t_4 = __Pyx_PyInt_AddObjC(__pyx_t_1, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 65, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_1);
-    __pyx_t_1 = __pyx_t_4;
-    __pyx_t_4 = 0;
-    if (unlikely(PyDict_SetItem(__pyx_r, (PyObject*)__pyx_cur_scope->__pyx_v_name, (PyObject*)__pyx_cur_scope->__pyx_v_place))) __PYX_ERR(0, 65, __pyx_L1_error)
+  if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 76, __pyx_L1_error)
+  if (unlikely(!__pyx_cur_scope->__pyx_outer_scope->__pyx_v_self)) { __Pyx_RaiseClosureNameError("self"); __PYX_ERR(0, 76, __pyx_L1_error) }
+  if (unlikely(__pyx_cur_scope->__pyx_outer_scope->__pyx_v_self->yield_states == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "get");
+    __PYX_ERR(0, 76, __pyx_L1_error)
   }
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_cur_scope->__pyx_outer_scope->__pyx_8genexpr1__pyx_v_state); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 76, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyList_New(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 76, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyDict_GetItemDefault(__pyx_cur_scope->__pyx_outer_scope->__pyx_v_self->yield_states, __pyx_t_1, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 76, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  CYTHON_MAYBE_UNUSED_VAR(__pyx_cur_scope);
-
-  /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_r); __pyx_r = 0;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("genexpr", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  #if !CYTHON_USE_EXC_INFO_STACK
-  __Pyx_Coroutine_ResetAndClearException(__pyx_generator);
-  #endif
-  __pyx_generator->resume_label = -1;
-  __Pyx_Coroutine_clear((PyObject*)__pyx_generator);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-static PyObject *__pyx_gb_7bundler_10extensions_3FSM_3FSM_10from_dicts_5generator2(__pyx_CoroutineObject *__pyx_generator, CYTHON_UNUSED PyThreadState *__pyx_tstate, PyObject *__pyx_sent_value); /* proto */
-
-/* "bundler/extensions/FSM.pyx":68
- *         flattened_machine = [state_names_index.get(machine[state_name][letter], -1) for state_name in state_names for letter in alphabet]
- * 
- *         return cls(alphabet, flattened_machine, dict((state_names_index[state], hits[state]) for state in hits))             # <<<<<<<<<<<<<<
- * 
- *     def __reduce__(self):
- */
-
-static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_10from_dicts_3genexpr(PyObject *__pyx_self) {
-  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_2_genexpr *__pyx_cur_scope;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("genexpr", 0);
-  __pyx_cur_scope = (struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_2_genexpr *)__pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct_2_genexpr(__pyx_ptype_7bundler_10extensions_3FSM___pyx_scope_struct_2_genexpr, __pyx_empty_tuple, NULL);
-  if (unlikely(!__pyx_cur_scope)) {
-    __pyx_cur_scope = ((struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_2_genexpr *)Py_None);
-    __Pyx_INCREF(Py_None);
-    __PYX_ERR(0, 68, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (likely(PyList_CheckExact(__pyx_t_3)) || PyTuple_CheckExact(__pyx_t_3)) {
+    __pyx_t_2 = __pyx_t_3; __Pyx_INCREF(__pyx_t_2); __pyx_t_4 = 0;
+    __pyx_t_5 = NULL;
   } else {
-    __Pyx_GOTREF(__pyx_cur_scope);
-  }
-  __pyx_cur_scope->__pyx_outer_scope = (struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts *) __pyx_self;
-  __Pyx_INCREF(((PyObject *)__pyx_cur_scope->__pyx_outer_scope));
-  __Pyx_GIVEREF(__pyx_cur_scope->__pyx_outer_scope);
-  {
-    __pyx_CoroutineObject *gen = __Pyx_Generator_New((__pyx_coroutine_body_t) __pyx_gb_7bundler_10extensions_3FSM_3FSM_10from_dicts_5generator2, NULL, (PyObject *) __pyx_cur_scope, __pyx_n_s_genexpr, __pyx_n_s_from_dicts_locals_genexpr, __pyx_n_s_bundler_extensions_FSM); if (unlikely(!gen)) __PYX_ERR(0, 68, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_cur_scope);
-    __Pyx_RefNannyFinishContext();
-    return (PyObject *) gen;
-  }
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_AddTraceback("bundler.extensions.FSM.FSM.from_dicts.genexpr", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __Pyx_DECREF(((PyObject *)__pyx_cur_scope));
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_gb_7bundler_10extensions_3FSM_3FSM_10from_dicts_5generator2(__pyx_CoroutineObject *__pyx_generator, CYTHON_UNUSED PyThreadState *__pyx_tstate, PyObject *__pyx_sent_value) /* generator body */
-{
-  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_2_genexpr *__pyx_cur_scope = ((struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_2_genexpr *)__pyx_generator->closure);
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  Py_ssize_t __pyx_t_2;
-  Py_ssize_t __pyx_t_3;
-  int __pyx_t_4;
-  PyObject *__pyx_t_5 = NULL;
-  int __pyx_t_6;
-  PyObject *__pyx_t_7 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("genexpr", 0);
-  switch (__pyx_generator->resume_label) {
-    case 0: goto __pyx_L3_first_run;
-    default: /* CPython raises the right error here */
-    __Pyx_RefNannyFinishContext();
-    return NULL;
+    __pyx_t_4 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 76, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_5 = Py_TYPE(__pyx_t_2)->tp_iternext; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 76, __pyx_L1_error)
   }
-  __pyx_L3_first_run:;
-  if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 68, __pyx_L1_error)
-  __pyx_r = PyDict_New(); if (unlikely(!__pyx_r)) __PYX_ERR(0, 68, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_r);
-  __pyx_t_2 = 0;
-  if (unlikely(!__pyx_cur_scope->__pyx_outer_scope->__pyx_v_hits)) { __Pyx_RaiseClosureNameError("hits"); __PYX_ERR(0, 68, __pyx_L1_error) }
-  if (unlikely(__pyx_cur_scope->__pyx_outer_scope->__pyx_v_hits == Py_None)) {
-    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
-    __PYX_ERR(0, 68, __pyx_L1_error)
-  }
-  __pyx_t_5 = __Pyx_dict_iterator(__pyx_cur_scope->__pyx_outer_scope->__pyx_v_hits, 1, ((PyObject *)NULL), (&__pyx_t_3), (&__pyx_t_4)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 68, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_1);
-  __pyx_t_1 = __pyx_t_5;
-  __pyx_t_5 = 0;
-  while (1) {
-    __pyx_t_6 = __Pyx_dict_iter_next(__pyx_t_1, __pyx_t_3, &__pyx_t_2, &__pyx_t_5, NULL, NULL, __pyx_t_4);
-    if (unlikely(__pyx_t_6 == 0)) break;
-    if (unlikely(__pyx_t_6 == -1)) __PYX_ERR(0, 68, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_XGOTREF(__pyx_cur_scope->__pyx_v_state);
-    __Pyx_XDECREF_SET(__pyx_cur_scope->__pyx_v_state, __pyx_t_5);
-    __Pyx_GIVEREF(__pyx_t_5);
-    __pyx_t_5 = 0;
-    if (unlikely(!__pyx_cur_scope->__pyx_outer_scope->__pyx_v_state_names_index)) { __Pyx_RaiseClosureNameError("state_names_index"); __PYX_ERR(0, 68, __pyx_L1_error) }
-    if (unlikely(__pyx_cur_scope->__pyx_outer_scope->__pyx_v_state_names_index == Py_None)) {
-      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-      __PYX_ERR(0, 68, __pyx_L1_error)
-    }
-    __pyx_t_5 = __Pyx_PyDict_GetItem(__pyx_cur_scope->__pyx_outer_scope->__pyx_v_state_names_index, __pyx_cur_scope->__pyx_v_state); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 68, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    if (unlikely(!__pyx_cur_scope->__pyx_outer_scope->__pyx_v_hits)) { __Pyx_RaiseClosureNameError("hits"); __PYX_ERR(0, 68, __pyx_L1_error) }
-    if (unlikely(__pyx_cur_scope->__pyx_outer_scope->__pyx_v_hits == Py_None)) {
-      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-      __PYX_ERR(0, 68, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  for (;;) {
+    if (likely(!__pyx_t_5)) {
+      if (likely(PyList_CheckExact(__pyx_t_2))) {
+        if (__pyx_t_4 >= PyList_GET_SIZE(__pyx_t_2)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_3 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_4); __Pyx_INCREF(__pyx_t_3); __pyx_t_4++; if (unlikely(0 < 0)) __PYX_ERR(0, 76, __pyx_L1_error)
+        #else
+        __pyx_t_3 = PySequence_ITEM(__pyx_t_2, __pyx_t_4); __pyx_t_4++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 76, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        #endif
+      } else {
+        if (__pyx_t_4 >= PyTuple_GET_SIZE(__pyx_t_2)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_4); __Pyx_INCREF(__pyx_t_3); __pyx_t_4++; if (unlikely(0 < 0)) __PYX_ERR(0, 76, __pyx_L1_error)
+        #else
+        __pyx_t_3 = PySequence_ITEM(__pyx_t_2, __pyx_t_4); __pyx_t_4++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 76, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        #endif
+      }
+    } else {
+      __pyx_t_3 = __pyx_t_5(__pyx_t_2);
+      if (unlikely(!__pyx_t_3)) {
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+          else __PYX_ERR(0, 76, __pyx_L1_error)
+        }
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_3);
     }
-    __pyx_t_7 = __Pyx_PyDict_GetItem(__pyx_cur_scope->__pyx_outer_scope->__pyx_v_hits, __pyx_cur_scope->__pyx_v_state); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 68, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
-    if (unlikely(PyDict_SetItem(__pyx_r, (PyObject*)__pyx_t_5, (PyObject*)__pyx_t_7))) __PYX_ERR(0, 68, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_XGOTREF(__pyx_cur_scope->__pyx_v_x);
+    __Pyx_XDECREF_SET(__pyx_cur_scope->__pyx_v_x, __pyx_t_3);
+    __Pyx_GIVEREF(__pyx_t_3);
+    __pyx_t_3 = 0;
+    __pyx_t_6 = PyObject_Length(__pyx_cur_scope->__pyx_v_x); if (unlikely(__pyx_t_6 == ((Py_ssize_t)-1))) __PYX_ERR(0, 76, __pyx_L1_error)
+    __pyx_t_3 = PyInt_FromSsize_t(__pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 76, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    __Pyx_XGIVEREF(__pyx_t_2);
+    __pyx_cur_scope->__pyx_t_0 = __pyx_t_2;
+    __pyx_cur_scope->__pyx_t_1 = __pyx_t_4;
+    __pyx_cur_scope->__pyx_t_2 = __pyx_t_5;
+    __Pyx_XGIVEREF(__pyx_r);
+    __Pyx_RefNannyFinishContext();
+    __Pyx_Coroutine_ResetAndClearException(__pyx_generator);
+    /* return from generator, yielding value */
+    __pyx_generator->resume_label = 1;
+    return __pyx_r;
+    __pyx_L6_resume_from_yield:;
+    __pyx_t_2 = __pyx_cur_scope->__pyx_t_0;
+    __pyx_cur_scope->__pyx_t_0 = 0;
+    __Pyx_XGOTREF(__pyx_t_2);
+    __pyx_t_4 = __pyx_cur_scope->__pyx_t_1;
+    __pyx_t_5 = __pyx_cur_scope->__pyx_t_2;
+    if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 76, __pyx_L1_error)
   }
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   CYTHON_MAYBE_UNUSED_VAR(__pyx_cur_scope);
 
   /* function exit code */
+  PyErr_SetNone(PyExc_StopIteration);
   goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_r); __pyx_r = 0;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
   __Pyx_AddTraceback("genexpr", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_XDECREF(__pyx_r); __pyx_r = 0;
   #if !CYTHON_USE_EXC_INFO_STACK
   __Pyx_Coroutine_ResetAndClearException(__pyx_generator);
   #endif
@@ -3605,1150 +3507,1201 @@ static PyObject *__pyx_gb_7bundler_10extensions_3FSM_3FSM_10from_dicts_5generato
   return __pyx_r;
 }
 
-/* "bundler/extensions/FSM.pyx":59
- * 
- *     @classmethod
- *     def from_dicts(cls, list alphabet, object machine, dict hits):             # <<<<<<<<<<<<<<
- *         ''' Build a cFSM from an ordered dictionary of dictionaries and a dictionary mapping states to hits. '''
+/* "bundler/extensions/FSM.pyx":52
  * 
+ * cdef class FSM:
+ *     def __init__(self, alphabet, machine, yield_states, distance_to_yield=None):             # <<<<<<<<<<<<<<
+ *         cdef int start
+ *         cdef IWord x
  */
 
-static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_2from_dicts(PyTypeObject *__pyx_v_cls, PyObject *__pyx_v_alphabet, PyObject *__pyx_v_machine, PyObject *__pyx_v_hits) {
-  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts *__pyx_cur_scope;
-  PyObject *__pyx_v_flattened_machine = NULL;
-  PyObject *__pyx_gb_7bundler_10extensions_3FSM_3FSM_10from_dicts_2generator1 = 0;
-  PyObject *__pyx_8genexpr2__pyx_v_state_name = NULL;
-  PyObject *__pyx_8genexpr2__pyx_v_letter = NULL;
-  PyObject *__pyx_gb_7bundler_10extensions_3FSM_3FSM_10from_dicts_5generator2 = 0;
-  PyObject *__pyx_r = NULL;
+static int __pyx_pf_7bundler_10extensions_3FSM_3FSM___init__(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self, PyObject *__pyx_v_alphabet, PyObject *__pyx_v_machine, PyObject *__pyx_v_yield_states, PyObject *__pyx_v_distance_to_yield) {
+  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct____init__ *__pyx_cur_scope;
+  int __pyx_v_start;
+  __pyx_t_7bundler_10extensions_3FSM_IWord __pyx_v_x;
+  int __pyx_v_i;
+  PyObject *__pyx_v_yields = NULL;
+  int __pyx_7genexpr__pyx_v_state;
+  PyObject *__pyx_8genexpr1__pyx_v_0 = NULL;
+  int __pyx_8genexpr3__pyx_v_state;
+  int __pyx_r;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  int __pyx_t_2;
+  Py_ssize_t __pyx_t_2;
   PyObject *__pyx_t_3 = NULL;
-  Py_ssize_t __pyx_t_4;
-  PyObject *__pyx_t_5 = NULL;
-  Py_ssize_t __pyx_t_6;
-  PyObject *__pyx_t_7 = NULL;
+  void *__pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
   PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  int __pyx_t_11;
+  PyObject *(*__pyx_t_12)(PyObject *);
+  __pyx_t_7bundler_10extensions_3FSM_IWord __pyx_t_13;
+  int __pyx_t_14;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("from_dicts", 0);
-  __pyx_cur_scope = (struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts *)__pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts(__pyx_ptype_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts, __pyx_empty_tuple, NULL);
+  __Pyx_RefNannySetupContext("__init__", 0);
+  __pyx_cur_scope = (struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct____init__ *)__pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct____init__(__pyx_ptype_7bundler_10extensions_3FSM___pyx_scope_struct____init__, __pyx_empty_tuple, NULL);
   if (unlikely(!__pyx_cur_scope)) {
-    __pyx_cur_scope = ((struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts *)Py_None);
+    __pyx_cur_scope = ((struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct____init__ *)Py_None);
     __Pyx_INCREF(Py_None);
-    __PYX_ERR(0, 59, __pyx_L1_error)
+    __PYX_ERR(0, 52, __pyx_L1_error)
   } else {
     __Pyx_GOTREF(__pyx_cur_scope);
   }
-  __pyx_cur_scope->__pyx_v_hits = __pyx_v_hits;
-  __Pyx_INCREF(__pyx_cur_scope->__pyx_v_hits);
-  __Pyx_GIVEREF(__pyx_cur_scope->__pyx_v_hits);
+  __pyx_cur_scope->__pyx_v_self = __pyx_v_self;
+  __Pyx_INCREF((PyObject *)__pyx_cur_scope->__pyx_v_self);
+  __Pyx_GIVEREF((PyObject *)__pyx_cur_scope->__pyx_v_self);
 
-  /* "bundler/extensions/FSM.pyx":62
- *         ''' Build a cFSM from an ordered dictionary of dictionaries and a dictionary mapping states to hits. '''
+  /* "bundler/extensions/FSM.pyx":56
+ *         cdef IWord x
  * 
- *         assert isinstance(machine, OrderedDict)             # <<<<<<<<<<<<<<
+ *         self.alphabet = alphabet             # <<<<<<<<<<<<<<
+ *         self.alphabet_len = len(self.alphabet)
+ *         self.machine_len = len(machine) // self.alphabet_len
+ */
+  if (!(likely(PyList_CheckExact(__pyx_v_alphabet))||((__pyx_v_alphabet) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "list", Py_TYPE(__pyx_v_alphabet)->tp_name), 0))) __PYX_ERR(0, 56, __pyx_L1_error)
+  __pyx_t_1 = __pyx_v_alphabet;
+  __Pyx_INCREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_cur_scope->__pyx_v_self->alphabet);
+  __Pyx_DECREF(__pyx_cur_scope->__pyx_v_self->alphabet);
+  __pyx_cur_scope->__pyx_v_self->alphabet = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "bundler/extensions/FSM.pyx":57
  * 
- *         state_names = list(machine)
+ *         self.alphabet = alphabet
+ *         self.alphabet_len = len(self.alphabet)             # <<<<<<<<<<<<<<
+ *         self.machine_len = len(machine) // self.alphabet_len
+ *         # The transitions are stored in the narrowest signed type that holds every state (and -1) so that more of the table stays in cache.
  */
-  #ifndef CYTHON_WITHOUT_ASSERTIONS
-  if (unlikely(!Py_OptimizeFlag)) {
-    __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_OrderedDict); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 62, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_2 = PyObject_IsInstance(__pyx_v_machine, __pyx_t_1); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 62, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    if (unlikely(!(__pyx_t_2 != 0))) {
-      PyErr_SetNone(PyExc_AssertionError);
-      __PYX_ERR(0, 62, __pyx_L1_error)
-    }
+  __pyx_t_1 = __pyx_cur_scope->__pyx_v_self->alphabet;
+  __Pyx_INCREF(__pyx_t_1);
+  if (unlikely(__pyx_t_1 == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 57, __pyx_L1_error)
   }
-  #endif
+  __pyx_t_2 = PyList_GET_SIZE(__pyx_t_1); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 57, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_cur_scope->__pyx_v_self->alphabet_len = __pyx_t_2;
 
-  /* "bundler/extensions/FSM.pyx":64
- *         assert isinstance(machine, OrderedDict)
- * 
- *         state_names = list(machine)             # <<<<<<<<<<<<<<
- *         state_names_index = dict((name, place) for place, name in enumerate(state_names))
- *         flattened_machine = [state_names_index.get(machine[state_name][letter], -1) for state_name in state_names for letter in alphabet]
+  /* "bundler/extensions/FSM.pyx":58
+ *         self.alphabet = alphabet
+ *         self.alphabet_len = len(self.alphabet)
+ *         self.machine_len = len(machine) // self.alphabet_len             # <<<<<<<<<<<<<<
+ *         # The transitions are stored in the narrowest signed type that holds every state (and -1) so that more of the table stays in cache.
+ *         self.machine = array.array('b' if self.machine_len <= 2**7 else 'h' if self.machine_len <= 2**15 else 'i', machine)
+ */
+  __pyx_t_2 = PyObject_Length(__pyx_v_machine); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 58, __pyx_L1_error)
+  if (unlikely(__pyx_cur_scope->__pyx_v_self->alphabet_len == 0)) {
+    PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
+    __PYX_ERR(0, 58, __pyx_L1_error)
+  }
+  else if (sizeof(Py_ssize_t) == sizeof(long) && (!(((int)-1) > 0)) && unlikely(__pyx_cur_scope->__pyx_v_self->alphabet_len == (int)-1)  && unlikely(UNARY_NEG_WOULD_OVERFLOW(__pyx_t_2))) {
+    PyErr_SetString(PyExc_OverflowError, "value too large to perform division");
+    __PYX_ERR(0, 58, __pyx_L1_error)
+  }
+  __pyx_cur_scope->__pyx_v_self->machine_len = __Pyx_div_Py_ssize_t(__pyx_t_2, __pyx_cur_scope->__pyx_v_self->alphabet_len);
+
+  /* "bundler/extensions/FSM.pyx":60
+ *         self.machine_len = len(machine) // self.alphabet_len
+ *         # The transitions are stored in the narrowest signed type that holds every state (and -1) so that more of the table stays in cache.
+ *         self.machine = array.array('b' if self.machine_len <= 2**7 else 'h' if self.machine_len <= 2**15 else 'i', machine)             # <<<<<<<<<<<<<<
+ *         self.table = self.machine.data.as_voidptr
+ *         self.itemsize = self.machine.itemsize
  */
-  __pyx_t_1 = PySequence_List(__pyx_v_machine); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 64, __pyx_L1_error)
+  if (((__pyx_cur_scope->__pyx_v_self->machine_len <= 0x80) != 0)) {
+    __Pyx_INCREF(__pyx_n_u_b);
+    __pyx_t_1 = __pyx_n_u_b;
+  } else {
+    if (((__pyx_cur_scope->__pyx_v_self->machine_len <= 0x8000) != 0)) {
+      __Pyx_INCREF(__pyx_n_u_h);
+      __pyx_t_3 = __pyx_n_u_h;
+    } else {
+      __Pyx_INCREF(__pyx_n_u_i);
+      __pyx_t_3 = __pyx_n_u_i;
+    }
+    __pyx_t_1 = __pyx_t_3;
+    __pyx_t_3 = 0;
+  }
+  __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 60, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1);
+  __Pyx_INCREF(__pyx_v_machine);
+  __Pyx_GIVEREF(__pyx_v_machine);
+  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_v_machine);
+  __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_7cpython_5array_array), __pyx_t_3, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 60, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_GIVEREF(__pyx_t_1);
-  __pyx_cur_scope->__pyx_v_state_names = ((PyObject*)__pyx_t_1);
+  __Pyx_GOTREF(__pyx_cur_scope->__pyx_v_self->machine);
+  __Pyx_DECREF(((PyObject *)__pyx_cur_scope->__pyx_v_self->machine));
+  __pyx_cur_scope->__pyx_v_self->machine = ((arrayobject *)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "bundler/extensions/FSM.pyx":65
- * 
- *         state_names = list(machine)
- *         state_names_index = dict((name, place) for place, name in enumerate(state_names))             # <<<<<<<<<<<<<<
- *         flattened_machine = [state_names_index.get(machine[state_name][letter], -1) for state_name in state_names for letter in alphabet]
- * 
+  /* "bundler/extensions/FSM.pyx":61
+ *         # The transitions are stored in the narrowest signed type that holds every state (and -1) so that more of the table stays in cache.
+ *         self.machine = array.array('b' if self.machine_len <= 2**7 else 'h' if self.machine_len <= 2**15 else 'i', machine)
+ *         self.table = self.machine.data.as_voidptr             # <<<<<<<<<<<<<<
+ *         self.itemsize = self.machine.itemsize
+ *         self.yield_states = yield_states
+ */
+  __pyx_t_4 = __pyx_cur_scope->__pyx_v_self->machine->data.as_voidptr;
+  __pyx_cur_scope->__pyx_v_self->table = __pyx_t_4;
+
+  /* "bundler/extensions/FSM.pyx":62
+ *         self.machine = array.array('b' if self.machine_len <= 2**7 else 'h' if self.machine_len <= 2**15 else 'i', machine)
+ *         self.table = self.machine.data.as_voidptr
+ *         self.itemsize = self.machine.itemsize             # <<<<<<<<<<<<<<
+ *         self.yield_states = yield_states
+ *         self.has_yield = array.array('i', [1 if self.yield_states.get(state, []) else 0 for state in range(self.machine_len)])
  */
-  __pyx_t_1 = __pyx_pf_7bundler_10extensions_3FSM_3FSM_10from_dicts_genexpr(((PyObject*)__pyx_cur_scope)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 65, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_cur_scope->__pyx_v_self->machine), __pyx_n_s_itemsize); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 62, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = __Pyx_Generator_Next(__pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 65, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 62, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_GIVEREF(__pyx_t_3);
-  __pyx_cur_scope->__pyx_v_state_names_index = ((PyObject*)__pyx_t_3);
-  __pyx_t_3 = 0;
+  __pyx_cur_scope->__pyx_v_self->itemsize = __pyx_t_5;
 
-  /* "bundler/extensions/FSM.pyx":66
- *         state_names = list(machine)
- *         state_names_index = dict((name, place) for place, name in enumerate(state_names))
- *         flattened_machine = [state_names_index.get(machine[state_name][letter], -1) for state_name in state_names for letter in alphabet]             # <<<<<<<<<<<<<<
+  /* "bundler/extensions/FSM.pyx":63
+ *         self.table = self.machine.data.as_voidptr
+ *         self.itemsize = self.machine.itemsize
+ *         self.yield_states = yield_states             # <<<<<<<<<<<<<<
+ *         self.has_yield = array.array('i', [1 if self.yield_states.get(state, []) else 0 for state in range(self.machine_len)])
  * 
- *         return cls(alphabet, flattened_machine, dict((state_names_index[state], hits[state]) for state in hits))
  */
-  { /* enter inner scope */
-    __pyx_t_3 = PyList_New(0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 66, __pyx_L5_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_1 = __pyx_cur_scope->__pyx_v_state_names; __Pyx_INCREF(__pyx_t_1); __pyx_t_4 = 0;
-    for (;;) {
-      if (__pyx_t_4 >= PyList_GET_SIZE(__pyx_t_1)) break;
-      #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-      __pyx_t_5 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_4); __Pyx_INCREF(__pyx_t_5); __pyx_t_4++; if (unlikely(0 < 0)) __PYX_ERR(0, 66, __pyx_L5_error)
-      #else
-      __pyx_t_5 = PySequence_ITEM(__pyx_t_1, __pyx_t_4); __pyx_t_4++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 66, __pyx_L5_error)
-      __Pyx_GOTREF(__pyx_t_5);
-      #endif
-      __Pyx_XDECREF_SET(__pyx_8genexpr2__pyx_v_state_name, __pyx_t_5);
-      __pyx_t_5 = 0;
-      if (unlikely(__pyx_v_alphabet == Py_None)) {
-        PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
-        __PYX_ERR(0, 66, __pyx_L5_error)
+  if (!(likely(PyDict_CheckExact(__pyx_v_yield_states))||((__pyx_v_yield_states) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "dict", Py_TYPE(__pyx_v_yield_states)->tp_name), 0))) __PYX_ERR(0, 63, __pyx_L1_error)
+  __pyx_t_1 = __pyx_v_yield_states;
+  __Pyx_INCREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_cur_scope->__pyx_v_self->yield_states);
+  __Pyx_DECREF(__pyx_cur_scope->__pyx_v_self->yield_states);
+  __pyx_cur_scope->__pyx_v_self->yield_states = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "bundler/extensions/FSM.pyx":64
+ *         self.itemsize = self.machine.itemsize
+ *         self.yield_states = yield_states
+ *         self.has_yield = array.array('i', [1 if self.yield_states.get(state, []) else 0 for state in range(self.machine_len)])             # <<<<<<<<<<<<<<
+ * 
+ *         start = 0
+ */
+  { /* enter inner scope */
+    __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 64, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = __pyx_cur_scope->__pyx_v_self->machine_len;
+    __pyx_t_6 = __pyx_t_5;
+    for (__pyx_t_7 = 0; __pyx_t_7 < __pyx_t_6; __pyx_t_7+=1) {
+      __pyx_7genexpr__pyx_v_state = __pyx_t_7;
+      if (unlikely(__pyx_cur_scope->__pyx_v_self->yield_states == Py_None)) {
+        PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "get");
+        __PYX_ERR(0, 64, __pyx_L1_error)
       }
-      __pyx_t_5 = __pyx_v_alphabet; __Pyx_INCREF(__pyx_t_5); __pyx_t_6 = 0;
-      for (;;) {
-        if (__pyx_t_6 >= PyList_GET_SIZE(__pyx_t_5)) break;
-        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_7 = PyList_GET_ITEM(__pyx_t_5, __pyx_t_6); __Pyx_INCREF(__pyx_t_7); __pyx_t_6++; if (unlikely(0 < 0)) __PYX_ERR(0, 66, __pyx_L5_error)
-        #else
-        __pyx_t_7 = PySequence_ITEM(__pyx_t_5, __pyx_t_6); __pyx_t_6++; if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 66, __pyx_L5_error)
-        __Pyx_GOTREF(__pyx_t_7);
-        #endif
-        __Pyx_XDECREF_SET(__pyx_8genexpr2__pyx_v_letter, __pyx_t_7);
-        __pyx_t_7 = 0;
-        if (unlikely(__pyx_cur_scope->__pyx_v_state_names_index == Py_None)) {
-          PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "get");
-          __PYX_ERR(0, 66, __pyx_L5_error)
-        }
-        __pyx_t_7 = __Pyx_PyObject_GetItem(__pyx_v_machine, __pyx_8genexpr2__pyx_v_state_name); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 66, __pyx_L5_error)
-        __Pyx_GOTREF(__pyx_t_7);
-        __pyx_t_8 = __Pyx_PyObject_GetItem(__pyx_t_7, __pyx_8genexpr2__pyx_v_letter); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 66, __pyx_L5_error)
-        __Pyx_GOTREF(__pyx_t_8);
-        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-        __pyx_t_7 = __Pyx_PyDict_GetItemDefault(__pyx_cur_scope->__pyx_v_state_names_index, __pyx_t_8, __pyx_int_neg_1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 66, __pyx_L5_error)
-        __Pyx_GOTREF(__pyx_t_7);
-        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-        if (unlikely(__Pyx_ListComp_Append(__pyx_t_3, (PyObject*)__pyx_t_7))) __PYX_ERR(0, 66, __pyx_L5_error)
-        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __pyx_t_8 = __Pyx_PyInt_From_int(__pyx_7genexpr__pyx_v_state); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 64, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __pyx_t_9 = PyList_New(0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 64, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __pyx_t_10 = __Pyx_PyDict_GetItemDefault(__pyx_cur_scope->__pyx_v_self->yield_states, __pyx_t_8, __pyx_t_9); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 64, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_10);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __pyx_t_11 = __Pyx_PyObject_IsTrue(__pyx_t_10); if (unlikely(__pyx_t_11 < 0)) __PYX_ERR(0, 64, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+      if (__pyx_t_11) {
+        __Pyx_INCREF(__pyx_int_1);
+        __pyx_t_3 = __pyx_int_1;
+      } else {
+        __Pyx_INCREF(__pyx_int_0);
+        __pyx_t_3 = __pyx_int_0;
       }
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (unlikely(__Pyx_ListComp_Append(__pyx_t_1, (PyObject*)__pyx_t_3))) __PYX_ERR(0, 64, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __Pyx_XDECREF(__pyx_8genexpr2__pyx_v_letter); __pyx_8genexpr2__pyx_v_letter = 0;
-    __Pyx_XDECREF(__pyx_8genexpr2__pyx_v_state_name); __pyx_8genexpr2__pyx_v_state_name = 0;
-    goto __pyx_L10_exit_scope;
-    __pyx_L5_error:;
-    __Pyx_XDECREF(__pyx_8genexpr2__pyx_v_letter); __pyx_8genexpr2__pyx_v_letter = 0;
-    __Pyx_XDECREF(__pyx_8genexpr2__pyx_v_state_name); __pyx_8genexpr2__pyx_v_state_name = 0;
-    goto __pyx_L1_error;
-    __pyx_L10_exit_scope:;
   } /* exit inner scope */
-  __pyx_v_flattened_machine = ((PyObject*)__pyx_t_3);
-  __pyx_t_3 = 0;
-
-  /* "bundler/extensions/FSM.pyx":68
- *         flattened_machine = [state_names_index.get(machine[state_name][letter], -1) for state_name in state_names for letter in alphabet]
- * 
- *         return cls(alphabet, flattened_machine, dict((state_names_index[state], hits[state]) for state in hits))             # <<<<<<<<<<<<<<
- * 
- *     def __reduce__(self):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_3 = __pyx_pf_7bundler_10extensions_3FSM_3FSM_10from_dicts_3genexpr(((PyObject*)__pyx_cur_scope)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 68, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_1 = __Pyx_Generator_Next(__pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 68, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 68, __pyx_L1_error)
+  __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 64, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_INCREF(__pyx_v_alphabet);
-  __Pyx_GIVEREF(__pyx_v_alphabet);
-  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_alphabet);
-  __Pyx_INCREF(__pyx_v_flattened_machine);
-  __Pyx_GIVEREF(__pyx_v_flattened_machine);
-  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_v_flattened_machine);
+  __Pyx_INCREF(__pyx_n_u_i);
+  __Pyx_GIVEREF(__pyx_n_u_i);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_n_u_i);
   __Pyx_GIVEREF(__pyx_t_1);
-  PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_1);
   __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_v_cls), __pyx_t_3, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 68, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_7cpython_5array_array), __pyx_t_3, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 64, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_r = __pyx_t_1;
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_cur_scope->__pyx_v_self->has_yield);
+  __Pyx_DECREF(((PyObject *)__pyx_cur_scope->__pyx_v_self->has_yield));
+  __pyx_cur_scope->__pyx_v_self->has_yield = ((arrayobject *)__pyx_t_1);
   __pyx_t_1 = 0;
-  goto __pyx_L0;
 
-  /* "bundler/extensions/FSM.pyx":59
+  /* "bundler/extensions/FSM.pyx":66
+ *         self.has_yield = array.array('i', [1 if self.yield_states.get(state, []) else 0 for state in range(self.machine_len)])
  * 
- *     @classmethod
- *     def from_dicts(cls, list alphabet, object machine, dict hits):             # <<<<<<<<<<<<<<
- *         ''' Build a cFSM from an ordered dictionary of dictionaries and a dictionary mapping states to hits. '''
+ *         start = 0             # <<<<<<<<<<<<<<
+ *         self.yield_states2_starts.push_back(0)
+ *         for i in range(self.machine_len):
+ */
+  __pyx_v_start = 0;
+
+  /* "bundler/extensions/FSM.pyx":67
  * 
+ *         start = 0
+ *         self.yield_states2_starts.push_back(0)             # <<<<<<<<<<<<<<
+ *         for i in range(self.machine_len):
+ *             yields = self.yield_states.get(i, [])
  */
+  try {
+    __pyx_cur_scope->__pyx_v_self->yield_states2_starts.push_back(0);
+  } catch(...) {
+    __Pyx_CppExn2PyErr();
+    __PYX_ERR(0, 67, __pyx_L1_error)
+  }
 
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_AddTraceback("bundler.extensions.FSM.FSM.from_dicts", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_flattened_machine);
-  __Pyx_XDECREF(__pyx_gb_7bundler_10extensions_3FSM_3FSM_10from_dicts_2generator1);
-  __Pyx_XDECREF(__pyx_8genexpr2__pyx_v_state_name);
-  __Pyx_XDECREF(__pyx_8genexpr2__pyx_v_letter);
-  __Pyx_XDECREF(__pyx_gb_7bundler_10extensions_3FSM_3FSM_10from_dicts_5generator2);
-  __Pyx_DECREF(((PyObject *)__pyx_cur_scope));
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
+  /* "bundler/extensions/FSM.pyx":68
+ *         start = 0
+ *         self.yield_states2_starts.push_back(0)
+ *         for i in range(self.machine_len):             # <<<<<<<<<<<<<<
+ *             yields = self.yield_states.get(i, [])
+ *             for x in yields:
+ */
+  __pyx_t_5 = __pyx_cur_scope->__pyx_v_self->machine_len;
+  __pyx_t_6 = __pyx_t_5;
+  for (__pyx_t_7 = 0; __pyx_t_7 < __pyx_t_6; __pyx_t_7+=1) {
+    __pyx_v_i = __pyx_t_7;
 
-/* "bundler/extensions/FSM.pyx":70
- *         return cls(alphabet, flattened_machine, dict((state_names_index[state], hits[state]) for state in hits))
- * 
- *     def __reduce__(self):             # <<<<<<<<<<<<<<
- *         return (self.__class__, (self.alphabet, self.machine, self.yield_states))
- * 
+    /* "bundler/extensions/FSM.pyx":69
+ *         self.yield_states2_starts.push_back(0)
+ *         for i in range(self.machine_len):
+ *             yields = self.yield_states.get(i, [])             # <<<<<<<<<<<<<<
+ *             for x in yields:
+ *                 self.yield_states2.push_back(x)
  */
+    if (unlikely(__pyx_cur_scope->__pyx_v_self->yield_states == Py_None)) {
+      PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "get");
+      __PYX_ERR(0, 69, __pyx_L1_error)
+    }
+    __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_i); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 69, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_3 = PyList_New(0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 69, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_10 = __Pyx_PyDict_GetItemDefault(__pyx_cur_scope->__pyx_v_self->yield_states, __pyx_t_1, __pyx_t_3); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 69, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_10);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_XDECREF_SET(__pyx_v_yields, __pyx_t_10);
+    __pyx_t_10 = 0;
 
-/* Python wrapper */
-static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_5__reduce__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_5__reduce__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__reduce__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_3FSM_4__reduce__(((struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)__pyx_v_self));
+    /* "bundler/extensions/FSM.pyx":70
+ *         for i in range(self.machine_len):
+ *             yields = self.yield_states.get(i, [])
+ *             for x in yields:             # <<<<<<<<<<<<<<
+ *                 self.yield_states2.push_back(x)
+ *             start += len(yields)
+ */
+    if (likely(PyList_CheckExact(__pyx_v_yields)) || PyTuple_CheckExact(__pyx_v_yields)) {
+      __pyx_t_10 = __pyx_v_yields; __Pyx_INCREF(__pyx_t_10); __pyx_t_2 = 0;
+      __pyx_t_12 = NULL;
+    } else {
+      __pyx_t_2 = -1; __pyx_t_10 = PyObject_GetIter(__pyx_v_yields); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 70, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_10);
+      __pyx_t_12 = Py_TYPE(__pyx_t_10)->tp_iternext; if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 70, __pyx_L1_error)
+    }
+    for (;;) {
+      if (likely(!__pyx_t_12)) {
+        if (likely(PyList_CheckExact(__pyx_t_10))) {
+          if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_10)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_3 = PyList_GET_ITEM(__pyx_t_10, __pyx_t_2); __Pyx_INCREF(__pyx_t_3); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 70, __pyx_L1_error)
+          #else
+          __pyx_t_3 = PySequence_ITEM(__pyx_t_10, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 70, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          #endif
+        } else {
+          if (__pyx_t_2 >= PyTuple_GET_SIZE(__pyx_t_10)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_10, __pyx_t_2); __Pyx_INCREF(__pyx_t_3); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 70, __pyx_L1_error)
+          #else
+          __pyx_t_3 = PySequence_ITEM(__pyx_t_10, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 70, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          #endif
+        }
+      } else {
+        __pyx_t_3 = __pyx_t_12(__pyx_t_10);
+        if (unlikely(!__pyx_t_3)) {
+          PyObject* exc_type = PyErr_Occurred();
+          if (exc_type) {
+            if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+            else __PYX_ERR(0, 70, __pyx_L1_error)
+          }
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_3);
+      }
+      __pyx_t_13 = __pyx_convert_vector_from_py_int(__pyx_t_3); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 70, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_v_x = __pyx_t_13;
 
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
+      /* "bundler/extensions/FSM.pyx":71
+ *             yields = self.yield_states.get(i, [])
+ *             for x in yields:
+ *                 self.yield_states2.push_back(x)             # <<<<<<<<<<<<<<
+ *             start += len(yields)
+ *             self.yield_states2_starts.push_back(start)
+ */
+      try {
+        __pyx_cur_scope->__pyx_v_self->yield_states2.push_back(__pyx_v_x);
+      } catch(...) {
+        __Pyx_CppExn2PyErr();
+        __PYX_ERR(0, 71, __pyx_L1_error)
+      }
 
-static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_4__reduce__(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__reduce__", 0);
+      /* "bundler/extensions/FSM.pyx":70
+ *         for i in range(self.machine_len):
+ *             yields = self.yield_states.get(i, [])
+ *             for x in yields:             # <<<<<<<<<<<<<<
+ *                 self.yield_states2.push_back(x)
+ *             start += len(yields)
+ */
+    }
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
 
-  /* "bundler/extensions/FSM.pyx":71
- * 
- *     def __reduce__(self):
- *         return (self.__class__, (self.alphabet, self.machine, self.yield_states))             # <<<<<<<<<<<<<<
+    /* "bundler/extensions/FSM.pyx":72
+ *             for x in yields:
+ *                 self.yield_states2.push_back(x)
+ *             start += len(yields)             # <<<<<<<<<<<<<<
+ *             self.yield_states2_starts.push_back(start)
  * 
- *     def __call__(self, tuple word, int state=0):
  */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_class); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 71, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyTuple_New(3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 71, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_INCREF(__pyx_v_self->alphabet);
-  __Pyx_GIVEREF(__pyx_v_self->alphabet);
-  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_self->alphabet);
-  __Pyx_INCREF(((PyObject *)__pyx_v_self->machine));
-  __Pyx_GIVEREF(((PyObject *)__pyx_v_self->machine));
-  PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_v_self->machine));
-  __Pyx_INCREF(__pyx_v_self->yield_states);
-  __Pyx_GIVEREF(__pyx_v_self->yield_states);
-  PyTuple_SET_ITEM(__pyx_t_2, 2, __pyx_v_self->yield_states);
-  __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 71, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_GIVEREF(__pyx_t_1);
-  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_2);
-  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_2);
-  __pyx_t_1 = 0;
-  __pyx_t_2 = 0;
-  __pyx_r = __pyx_t_3;
-  __pyx_t_3 = 0;
-  goto __pyx_L0;
+    __pyx_t_2 = PyObject_Length(__pyx_v_yields); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 72, __pyx_L1_error)
+    __pyx_v_start = (__pyx_v_start + __pyx_t_2);
 
-  /* "bundler/extensions/FSM.pyx":70
- *         return cls(alphabet, flattened_machine, dict((state_names_index[state], hits[state]) for state in hits))
- * 
- *     def __reduce__(self):             # <<<<<<<<<<<<<<
- *         return (self.__class__, (self.alphabet, self.machine, self.yield_states))
+    /* "bundler/extensions/FSM.pyx":73
+ *                 self.yield_states2.push_back(x)
+ *             start += len(yields)
+ *             self.yield_states2_starts.push_back(start)             # <<<<<<<<<<<<<<
  * 
+ *         # The length of the shortest word that each state yields, states that do not yield are given a length larger than any word.
  */
+    try {
+      __pyx_cur_scope->__pyx_v_self->yield_states2_starts.push_back(__pyx_v_start);
+    } catch(...) {
+      __Pyx_CppExn2PyErr();
+      __PYX_ERR(0, 73, __pyx_L1_error)
+    }
+  }
 
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("bundler.extensions.FSM.FSM.__reduce__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "bundler/extensions/FSM.pyx":73
- *         return (self.__class__, (self.alphabet, self.machine, self.yield_states))
+  /* "bundler/extensions/FSM.pyx":76
  * 
- *     def __call__(self, tuple word, int state=0):             # <<<<<<<<<<<<<<
- *         cdef int letter
- *         for letter in word:
+ *         # The length of the shortest word that each state yields, states that do not yield are given a length larger than any word.
+ *         self.shortest_yield = array.array('i', [min((len(x) for x in self.yield_states.get(state, [])), default=UNREACHABLE) for state in range(self.machine_len)])             # <<<<<<<<<<<<<<
+ * 
+ *         if distance_to_yield is not None:  # Already known, for example when loading from a cache.
  */
-
-/* Python wrapper */
-static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_7__call__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_7__call__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_word = 0;
-  int __pyx_v_state;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__call__ (wrapper)", 0);
-  {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_word,&__pyx_n_s_state,0};
-    PyObject* values[2] = {0,0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
-      switch (pos_args) {
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (pos_args) {
-        case  0:
-        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_word)) != 0)) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        CYTHON_FALLTHROUGH;
-        case  1:
-        if (kw_args > 0) {
-          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_state);
-          if (value) { values[1] = value; kw_args--; }
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__call__") < 0)) __PYX_ERR(0, 73, __pyx_L3_error)
-      }
-    } else {
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-    }
-    __pyx_v_word = ((PyObject*)values[0]);
-    if (values[1]) {
-      __pyx_v_state = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_state == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 73, __pyx_L3_error)
-    } else {
-      __pyx_v_state = ((int)0);
+  { /* enter inner scope */
+    __pyx_t_10 = PyList_New(0); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 76, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_10);
+    __pyx_t_5 = __pyx_cur_scope->__pyx_v_self->machine_len;
+    __pyx_t_6 = __pyx_t_5;
+    for (__pyx_t_7 = 0; __pyx_t_7 < __pyx_t_6; __pyx_t_7+=1) {
+      __pyx_cur_scope->__pyx_8genexpr1__pyx_v_state = __pyx_t_7;
+      __pyx_t_3 = __pyx_pf_7bundler_10extensions_3FSM_3FSM_8__init___8genexpr1_genexpr(((PyObject*)__pyx_cur_scope)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 76, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 76, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_GIVEREF(__pyx_t_3);
+      PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_3);
+      __pyx_t_3 = 0;
+      __pyx_t_3 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 76, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_GetModuleGlobalName(__pyx_t_9, __pyx_n_s_UNREACHABLE); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 76, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_default, __pyx_t_9) < 0) __PYX_ERR(0, 76, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __pyx_t_9 = __Pyx_PyObject_Call(__pyx_builtin_min, __pyx_t_1, __pyx_t_3); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 76, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      if (unlikely(__Pyx_ListComp_Append(__pyx_t_10, (PyObject*)__pyx_t_9))) __PYX_ERR(0, 76, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
     }
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__call__", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 73, __pyx_L3_error)
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("bundler.extensions.FSM.FSM.__call__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_word), (&PyTuple_Type), 1, "word", 1))) __PYX_ERR(0, 73, __pyx_L1_error)
-  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_3FSM_6__call__(((struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)__pyx_v_self), __pyx_v_word, __pyx_v_state);
-
-  /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_6__call__(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self, PyObject *__pyx_v_word, int __pyx_v_state) {
-  int __pyx_v_letter;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  Py_ssize_t __pyx_t_2;
-  PyObject *__pyx_t_3 = NULL;
-  int __pyx_t_4;
-  int __pyx_t_5;
-  PyObject *__pyx_t_6 = NULL;
-  PyObject *__pyx_t_7 = NULL;
-  PyObject *__pyx_t_8 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__call__", 0);
-
-  /* "bundler/extensions/FSM.pyx":75
- *     def __call__(self, tuple word, int state=0):
- *         cdef int letter
- *         for letter in word:             # <<<<<<<<<<<<<<
- *             state = self.machine.data.as_ints[state * self.alphabet_len + letter]
- *             if state < 0:
- */
-  if (unlikely(__pyx_v_word == Py_None)) {
-    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
-    __PYX_ERR(0, 75, __pyx_L1_error)
-  }
-  __pyx_t_1 = __pyx_v_word; __Pyx_INCREF(__pyx_t_1); __pyx_t_2 = 0;
-  for (;;) {
-    if (__pyx_t_2 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
-    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-    __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_3); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 75, __pyx_L1_error)
-    #else
-    __pyx_t_3 = PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 75, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    #endif
-    __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_t_3); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 75, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_v_letter = __pyx_t_4;
-
-    /* "bundler/extensions/FSM.pyx":76
- *         cdef int letter
- *         for letter in word:
- *             state = self.machine.data.as_ints[state * self.alphabet_len + letter]             # <<<<<<<<<<<<<<
- *             if state < 0:
- *                 raise ValueError('Invalid transition to state {}'.format(state))
+  } /* exit inner scope */
+  __pyx_t_9 = PyTuple_New(2); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 76, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __Pyx_INCREF(__pyx_n_u_i);
+  __Pyx_GIVEREF(__pyx_n_u_i);
+  PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_n_u_i);
+  __Pyx_GIVEREF(__pyx_t_10);
+  PyTuple_SET_ITEM(__pyx_t_9, 1, __pyx_t_10);
+  __pyx_t_10 = 0;
+  __pyx_t_10 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_7cpython_5array_array), __pyx_t_9, NULL); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 76, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_10);
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __Pyx_GIVEREF(__pyx_t_10);
+  __Pyx_GOTREF(__pyx_cur_scope->__pyx_v_self->shortest_yield);
+  __Pyx_DECREF(((PyObject *)__pyx_cur_scope->__pyx_v_self->shortest_yield));
+  __pyx_cur_scope->__pyx_v_self->shortest_yield = ((arrayobject *)__pyx_t_10);
+  __pyx_t_10 = 0;
+
+  /* "bundler/extensions/FSM.pyx":78
+ *         self.shortest_yield = array.array('i', [min((len(x) for x in self.yield_states.get(state, [])), default=UNREACHABLE) for state in range(self.machine_len)])
+ * 
+ *         if distance_to_yield is not None:  # Already known, for example when loading from a cache.             # <<<<<<<<<<<<<<
+ *             self.distance_to_yield = dict(distance_to_yield)
+ *         else:
  */
-    __pyx_v_state = (__pyx_v_self->machine->data.as_ints[((__pyx_v_state * __pyx_v_self->alphabet_len) + __pyx_v_letter)]);
+  __pyx_t_11 = (__pyx_v_distance_to_yield != Py_None);
+  __pyx_t_14 = (__pyx_t_11 != 0);
+  if (__pyx_t_14) {
 
-    /* "bundler/extensions/FSM.pyx":77
- *         for letter in word:
- *             state = self.machine.data.as_ints[state * self.alphabet_len + letter]
- *             if state < 0:             # <<<<<<<<<<<<<<
- *                 raise ValueError('Invalid transition to state {}'.format(state))
+    /* "bundler/extensions/FSM.pyx":79
  * 
+ *         if distance_to_yield is not None:  # Already known, for example when loading from a cache.
+ *             self.distance_to_yield = dict(distance_to_yield)             # <<<<<<<<<<<<<<
+ *         else:
+ *             self.distance_to_yield = self.find_distance_to_yield()
  */
-    __pyx_t_5 = ((__pyx_v_state < 0) != 0);
-    if (unlikely(__pyx_t_5)) {
-
-      /* "bundler/extensions/FSM.pyx":78
- *             state = self.machine.data.as_ints[state * self.alphabet_len + letter]
- *             if state < 0:
- *                 raise ValueError('Invalid transition to state {}'.format(state))             # <<<<<<<<<<<<<<
+    __pyx_t_10 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyDict_Type)), __pyx_v_distance_to_yield); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 79, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_10);
+    __Pyx_GIVEREF(__pyx_t_10);
+    __Pyx_GOTREF(__pyx_cur_scope->__pyx_v_self->distance_to_yield);
+    __Pyx_DECREF(__pyx_cur_scope->__pyx_v_self->distance_to_yield);
+    __pyx_cur_scope->__pyx_v_self->distance_to_yield = ((PyObject*)__pyx_t_10);
+    __pyx_t_10 = 0;
+
+    /* "bundler/extensions/FSM.pyx":78
+ *         self.shortest_yield = array.array('i', [min((len(x) for x in self.yield_states.get(state, [])), default=UNREACHABLE) for state in range(self.machine_len)])
  * 
- *         return state
+ *         if distance_to_yield is not None:  # Already known, for example when loading from a cache.             # <<<<<<<<<<<<<<
+ *             self.distance_to_yield = dict(distance_to_yield)
+ *         else:
  */
-      __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_Invalid_transition_to_state, __pyx_n_s_format); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 78, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_6);
-      __pyx_t_7 = __Pyx_PyInt_From_int(__pyx_v_state); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 78, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_7);
-      __pyx_t_8 = NULL;
-      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
-        __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_6);
-        if (likely(__pyx_t_8)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
-          __Pyx_INCREF(__pyx_t_8);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_6, function);
-        }
-      }
-      __pyx_t_3 = (__pyx_t_8) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_8, __pyx_t_7) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_t_7);
-      __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-      if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 78, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __pyx_t_6 = __Pyx_PyObject_CallOneArg(__pyx_builtin_ValueError, __pyx_t_3); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 78, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_6);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_Raise(__pyx_t_6, 0, 0, 0);
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __PYX_ERR(0, 78, __pyx_L1_error)
+    goto __pyx_L11;
+  }
 
-      /* "bundler/extensions/FSM.pyx":77
- *         for letter in word:
- *             state = self.machine.data.as_ints[state * self.alphabet_len + letter]
- *             if state < 0:             # <<<<<<<<<<<<<<
- *                 raise ValueError('Invalid transition to state {}'.format(state))
+  /* "bundler/extensions/FSM.pyx":81
+ *             self.distance_to_yield = dict(distance_to_yield)
+ *         else:
+ *             self.distance_to_yield = self.find_distance_to_yield()             # <<<<<<<<<<<<<<
  * 
+ *         # States that cannot reach a yield are given a distance larger than any word.
  */
+  /*else*/ {
+    __pyx_t_9 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_cur_scope->__pyx_v_self), __pyx_n_s_find_distance_to_yield); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 81, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __pyx_t_3 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_9);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_9, function);
+      }
     }
-
-    /* "bundler/extensions/FSM.pyx":75
- *     def __call__(self, tuple word, int state=0):
- *         cdef int letter
- *         for letter in word:             # <<<<<<<<<<<<<<
- *             state = self.machine.data.as_ints[state * self.alphabet_len + letter]
- *             if state < 0:
- */
+    __pyx_t_10 = (__pyx_t_3) ? __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_t_3) : __Pyx_PyObject_CallNoArg(__pyx_t_9);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 81, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_10);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    if (!(likely(PyDict_CheckExact(__pyx_t_10))||((__pyx_t_10) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "dict", Py_TYPE(__pyx_t_10)->tp_name), 0))) __PYX_ERR(0, 81, __pyx_L1_error)
+    __Pyx_GIVEREF(__pyx_t_10);
+    __Pyx_GOTREF(__pyx_cur_scope->__pyx_v_self->distance_to_yield);
+    __Pyx_DECREF(__pyx_cur_scope->__pyx_v_self->distance_to_yield);
+    __pyx_cur_scope->__pyx_v_self->distance_to_yield = ((PyObject*)__pyx_t_10);
+    __pyx_t_10 = 0;
   }
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_L11:;
 
-  /* "bundler/extensions/FSM.pyx":80
- *                 raise ValueError('Invalid transition to state {}'.format(state))
+  /* "bundler/extensions/FSM.pyx":84
  * 
- *         return state             # <<<<<<<<<<<<<<
+ *         # States that cannot reach a yield are given a distance larger than any word.
+ *         self.distances = array.array('i', [self.distance_to_yield.get(state, UNREACHABLE) for state in range(self.machine_len)])             # <<<<<<<<<<<<<<
  * 
- *     def distance(self, tuple word):
+ *     def find_distance_to_yield(self):
  */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_state); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 80, __pyx_L1_error)
+  { /* enter inner scope */
+    __pyx_t_10 = PyList_New(0); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 84, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_10);
+    __pyx_t_5 = __pyx_cur_scope->__pyx_v_self->machine_len;
+    __pyx_t_6 = __pyx_t_5;
+    for (__pyx_t_7 = 0; __pyx_t_7 < __pyx_t_6; __pyx_t_7+=1) {
+      __pyx_8genexpr3__pyx_v_state = __pyx_t_7;
+      if (unlikely(__pyx_cur_scope->__pyx_v_self->distance_to_yield == Py_None)) {
+        PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "get");
+        __PYX_ERR(0, 84, __pyx_L1_error)
+      }
+      __pyx_t_9 = __Pyx_PyInt_From_int(__pyx_8genexpr3__pyx_v_state); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 84, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_UNREACHABLE); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 84, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_1 = __Pyx_PyDict_GetItemDefault(__pyx_cur_scope->__pyx_v_self->distance_to_yield, __pyx_t_9, __pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 84, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      if (unlikely(__Pyx_ListComp_Append(__pyx_t_10, (PyObject*)__pyx_t_1))) __PYX_ERR(0, 84, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    }
+  } /* exit inner scope */
+  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 84, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
+  __Pyx_INCREF(__pyx_n_u_i);
+  __Pyx_GIVEREF(__pyx_n_u_i);
+  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_n_u_i);
+  __Pyx_GIVEREF(__pyx_t_10);
+  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_10);
+  __pyx_t_10 = 0;
+  __pyx_t_10 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_7cpython_5array_array), __pyx_t_1, NULL); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 84, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_10);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_GIVEREF(__pyx_t_10);
+  __Pyx_GOTREF(__pyx_cur_scope->__pyx_v_self->distances);
+  __Pyx_DECREF(((PyObject *)__pyx_cur_scope->__pyx_v_self->distances));
+  __pyx_cur_scope->__pyx_v_self->distances = ((arrayobject *)__pyx_t_10);
+  __pyx_t_10 = 0;
 
-  /* "bundler/extensions/FSM.pyx":73
- *         return (self.__class__, (self.alphabet, self.machine, self.yield_states))
+  /* "bundler/extensions/FSM.pyx":52
  * 
- *     def __call__(self, tuple word, int state=0):             # <<<<<<<<<<<<<<
- *         cdef int letter
- *         for letter in word:
+ * cdef class FSM:
+ *     def __init__(self, alphabet, machine, yield_states, distance_to_yield=None):             # <<<<<<<<<<<<<<
+ *         cdef int start
+ *         cdef IWord x
  */
 
   /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_7);
   __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_AddTraceback("bundler.extensions.FSM.FSM.__call__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_AddTraceback("bundler.extensions.FSM.FSM.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
   __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_XDECREF(__pyx_v_yields);
+  __Pyx_XDECREF(__pyx_8genexpr1__pyx_v_0);
+  __Pyx_DECREF(((PyObject *)__pyx_cur_scope));
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "bundler/extensions/FSM.pyx":82
- *         return state
- * 
- *     def distance(self, tuple word):             # <<<<<<<<<<<<<<
- *         return self.distance_to_yield[self(word)]
+/* "bundler/extensions/FSM.pyx":86
+ *         self.distances = array.array('i', [self.distance_to_yield.get(state, UNREACHABLE) for state in range(self.machine_len)])
  * 
+ *     def find_distance_to_yield(self):             # <<<<<<<<<<<<<<
+ *         ''' Return a dictionary mapping each state to the length of the shortest word that takes it to a yield state. '''
+ *         cdef int state, new_state, i, j
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_9distance(PyObject *__pyx_v_self, PyObject *__pyx_v_word); /*proto*/
-static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_9distance(PyObject *__pyx_v_self, PyObject *__pyx_v_word) {
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_3find_distance_to_yield(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_7bundler_10extensions_3FSM_3FSM_2find_distance_to_yield[] = " Return a dictionary mapping each state to the length of the shortest word that takes it to a yield state. ";
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_3find_distance_to_yield(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("distance (wrapper)", 0);
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_word), (&PyTuple_Type), 1, "word", 1))) __PYX_ERR(0, 82, __pyx_L1_error)
-  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_3FSM_8distance(((struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)__pyx_v_self), ((PyObject*)__pyx_v_word));
+  __Pyx_RefNannySetupContext("find_distance_to_yield (wrapper)", 0);
+  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_3FSM_2find_distance_to_yield(((struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)__pyx_v_self));
 
   /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __pyx_r = NULL;
-  __pyx_L0:;
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
+static PyObject *__pyx_gb_7bundler_10extensions_3FSM_3FSM_22find_distance_to_yield_2generator2(__pyx_CoroutineObject *__pyx_generator, CYTHON_UNUSED PyThreadState *__pyx_tstate, PyObject *__pyx_sent_value); /* proto */
 
-static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_8distance(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self, PyObject *__pyx_v_word) {
+/* "bundler/extensions/FSM.pyx":125
+ *                     to_check.push_back(reverse_arrows[j])
+ * 
+ *         return dict((state, distances[state]) for state in range(self.machine_len) if distances[state] >= 0)             # <<<<<<<<<<<<<<
+ * 
+ *     @classmethod
+ */
+
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_22find_distance_to_yield_genexpr(PyObject *__pyx_self) {
+  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_3_genexpr *__pyx_cur_scope;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("distance", 0);
-
-  /* "bundler/extensions/FSM.pyx":83
- * 
- *     def distance(self, tuple word):
- *         return self.distance_to_yield[self(word)]             # <<<<<<<<<<<<<<
- * 
- *     cdef bint c_hit(self, IWord& word, int run=-1):
- */
-  __Pyx_XDECREF(__pyx_r);
-  if (unlikely(__pyx_v_self->distance_to_yield == Py_None)) {
-    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-    __PYX_ERR(0, 83, __pyx_L1_error)
+  __Pyx_RefNannySetupContext("genexpr", 0);
+  __pyx_cur_scope = (struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_3_genexpr *)__pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct_3_genexpr(__pyx_ptype_7bundler_10extensions_3FSM___pyx_scope_struct_3_genexpr, __pyx_empty_tuple, NULL);
+  if (unlikely(!__pyx_cur_scope)) {
+    __pyx_cur_scope = ((struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_3_genexpr *)Py_None);
+    __Pyx_INCREF(Py_None);
+    __PYX_ERR(0, 125, __pyx_L1_error)
+  } else {
+    __Pyx_GOTREF(__pyx_cur_scope);
   }
-  __Pyx_INCREF(((PyObject *)__pyx_v_self));
-  __pyx_t_2 = ((PyObject *)__pyx_v_self); __pyx_t_3 = NULL;
-  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_2))) {
-    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
-    if (likely(__pyx_t_3)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-      __Pyx_INCREF(__pyx_t_3);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_2, function);
-    }
+  __pyx_cur_scope->__pyx_outer_scope = (struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield *) __pyx_self;
+  __Pyx_INCREF(((PyObject *)__pyx_cur_scope->__pyx_outer_scope));
+  __Pyx_GIVEREF(__pyx_cur_scope->__pyx_outer_scope);
+  {
+    __pyx_CoroutineObject *gen = __Pyx_Generator_New((__pyx_coroutine_body_t) __pyx_gb_7bundler_10extensions_3FSM_3FSM_22find_distance_to_yield_2generator2, NULL, (PyObject *) __pyx_cur_scope, __pyx_n_s_genexpr, __pyx_n_s_find_distance_to_yield_locals_ge, __pyx_n_s_bundler_extensions_FSM); if (unlikely(!gen)) __PYX_ERR(0, 125, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_cur_scope);
+    __Pyx_RefNannyFinishContext();
+    return (PyObject *) gen;
   }
-  __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_v_word) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_v_word);
-  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 83, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyDict_GetItem(__pyx_v_self->distance_to_yield, __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 83, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_r = __pyx_t_2;
-  __pyx_t_2 = 0;
-  goto __pyx_L0;
-
-  /* "bundler/extensions/FSM.pyx":82
- *         return state
- * 
- *     def distance(self, tuple word):             # <<<<<<<<<<<<<<
- *         return self.distance_to_yield[self(word)]
- * 
- */
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("bundler.extensions.FSM.FSM.distance", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("bundler.extensions.FSM.FSM.find_distance_to_yield.genexpr", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
+  __Pyx_DECREF(((PyObject *)__pyx_cur_scope));
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_gb_7bundler_10extensions_3FSM_3FSM_22find_distance_to_yield_2generator2(__pyx_CoroutineObject *__pyx_generator, CYTHON_UNUSED PyThreadState *__pyx_tstate, PyObject *__pyx_sent_value) /* generator body */
+{
+  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_3_genexpr *__pyx_cur_scope = ((struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_3_genexpr *)__pyx_generator->closure);
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("genexpr", 0);
+  switch (__pyx_generator->resume_label) {
+    case 0: goto __pyx_L3_first_run;
+    default: /* CPython raises the right error here */
+    __Pyx_RefNannyFinishContext();
+    return NULL;
+  }
+  __pyx_L3_first_run:;
+  if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 125, __pyx_L1_error)
+  __pyx_r = PyDict_New(); if (unlikely(!__pyx_r)) __PYX_ERR(0, 125, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_r);
+  if (unlikely(!__pyx_cur_scope->__pyx_outer_scope->__pyx_v_self)) { __Pyx_RaiseClosureNameError("self"); __PYX_ERR(0, 125, __pyx_L1_error) }
+  __pyx_t_1 = __pyx_cur_scope->__pyx_outer_scope->__pyx_v_self->machine_len;
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_cur_scope->__pyx_v_state = __pyx_t_3;
+    __pyx_t_4 = (((__pyx_cur_scope->__pyx_outer_scope->__pyx_v_distances[__pyx_cur_scope->__pyx_v_state]) >= 0) != 0);
+    if (__pyx_t_4) {
+      __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_cur_scope->__pyx_v_state); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 125, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_6 = __Pyx_PyInt_From_int((__pyx_cur_scope->__pyx_outer_scope->__pyx_v_distances[__pyx_cur_scope->__pyx_v_state])); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 125, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      if (unlikely(PyDict_SetItem(__pyx_r, (PyObject*)__pyx_t_5, (PyObject*)__pyx_t_6))) __PYX_ERR(0, 125, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    }
+  }
+  CYTHON_MAYBE_UNUSED_VAR(__pyx_cur_scope);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_r); __pyx_r = 0;
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("genexpr", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
+  #if !CYTHON_USE_EXC_INFO_STACK
+  __Pyx_Coroutine_ResetAndClearException(__pyx_generator);
+  #endif
+  __pyx_generator->resume_label = -1;
+  __Pyx_Coroutine_clear((PyObject*)__pyx_generator);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "bundler/extensions/FSM.pyx":85
- *         return self.distance_to_yield[self(word)]
+/* "bundler/extensions/FSM.pyx":86
+ *         self.distances = array.array('i', [self.distance_to_yield.get(state, UNREACHABLE) for state in range(self.machine_len)])
  * 
- *     cdef bint c_hit(self, IWord& word, int run=-1):             # <<<<<<<<<<<<<<
- *         cdef int index = 0
- *         cdef int state = 0
+ *     def find_distance_to_yield(self):             # <<<<<<<<<<<<<<
+ *         ''' Return a dictionary mapping each state to the length of the shortest word that takes it to a yield state. '''
+ *         cdef int state, new_state, i, j
  */
 
-static int __pyx_f_7bundler_10extensions_3FSM_3FSM_c_hit(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self, __pyx_t_7bundler_10extensions_3FSM_IWord &__pyx_v_word, struct __pyx_opt_args_7bundler_10extensions_3FSM_3FSM_c_hit *__pyx_optional_args) {
-  int __pyx_v_run = ((int)-1);
-  int __pyx_v_index;
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_2find_distance_to_yield(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self) {
+  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield *__pyx_cur_scope;
   int __pyx_v_state;
-  int __pyx_v_length;
-  CYTHON_UNUSED int __pyx_v__;
-  int __pyx_r;
+  int __pyx_v_new_state;
+  int __pyx_v_i;
+  int __pyx_v_j;
+  size_t __pyx_v_head;
+  std::vector<int>  __pyx_v_reverse_starts;
+  std::vector<int>  __pyx_v_reverse_arrows;
+  std::vector<int>  __pyx_v_to_check;
+  PyObject *__pyx_gb_7bundler_10extensions_3FSM_3FSM_22find_distance_to_yield_2generator2 = 0;
+  PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
   int __pyx_t_2;
   int __pyx_t_3;
   int __pyx_t_4;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
+  int __pyx_t_5;
+  int __pyx_t_6;
   PyObject *__pyx_t_7 = NULL;
-  PyObject *__pyx_t_8 = NULL;
+  int __pyx_t_8;
+  long __pyx_t_9;
+  int __pyx_t_10;
+  PyObject *__pyx_t_11 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("c_hit", 0);
-  if (__pyx_optional_args) {
-    if (__pyx_optional_args->__pyx_n > 0) {
-      __pyx_v_run = __pyx_optional_args->run;
-    }
+  __Pyx_RefNannySetupContext("find_distance_to_yield", 0);
+  __pyx_cur_scope = (struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield *)__pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield(__pyx_ptype_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield, __pyx_empty_tuple, NULL);
+  if (unlikely(!__pyx_cur_scope)) {
+    __pyx_cur_scope = ((struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield *)Py_None);
+    __Pyx_INCREF(Py_None);
+    __PYX_ERR(0, 86, __pyx_L1_error)
+  } else {
+    __Pyx_GOTREF(__pyx_cur_scope);
   }
+  __pyx_cur_scope->__pyx_v_self = __pyx_v_self;
+  __Pyx_INCREF((PyObject *)__pyx_cur_scope->__pyx_v_self);
+  __Pyx_GIVEREF((PyObject *)__pyx_cur_scope->__pyx_v_self);
 
-  /* "bundler/extensions/FSM.pyx":86
+  /* "bundler/extensions/FSM.pyx":89
+ *         ''' Return a dictionary mapping each state to the length of the shortest word that takes it to a yield state. '''
+ *         cdef int state, new_state, i, j
+ *         cdef size_t head = 0             # <<<<<<<<<<<<<<
+ *         cdef vector[int] reverse_starts, reverse_arrows, distances, to_check
  * 
- *     cdef bint c_hit(self, IWord& word, int run=-1):
- *         cdef int index = 0             # <<<<<<<<<<<<<<
- *         cdef int state = 0
- *         cdef int length = word.size()
- */
-  __pyx_v_index = 0;
-
-  /* "bundler/extensions/FSM.pyx":87
- *     cdef bint c_hit(self, IWord& word, int run=-1):
- *         cdef int index = 0
- *         cdef int state = 0             # <<<<<<<<<<<<<<
- *         cdef int length = word.size()
- *         for _ in range(length if run < 0 else run):
  */
-  __pyx_v_state = 0;
+  __pyx_v_head = 0;
 
-  /* "bundler/extensions/FSM.pyx":88
- *         cdef int index = 0
- *         cdef int state = 0
- *         cdef int length = word.size()             # <<<<<<<<<<<<<<
- *         for _ in range(length if run < 0 else run):
- *             state = self.machine.data.as_ints[state * self.alphabet_len + word[index]]
+  /* "bundler/extensions/FSM.pyx":93
+ * 
+ *         # The reverse arrows, with those into state in reverse_arrows[reverse_starts[state]:reverse_starts[state+1]].
+ *         reverse_starts.assign(self.machine_len + 1, 0)             # <<<<<<<<<<<<<<
+ *         for state in range(self.machine_len):
+ *             for i in range(self.alphabet_len):
  */
-  __pyx_v_length = __pyx_v_word.size();
+  try {
+    __pyx_v_reverse_starts.assign((__pyx_cur_scope->__pyx_v_self->machine_len + 1), 0);
+  } catch(...) {
+    __Pyx_CppExn2PyErr();
+    __PYX_ERR(0, 93, __pyx_L1_error)
+  }
 
-  /* "bundler/extensions/FSM.pyx":89
- *         cdef int state = 0
- *         cdef int length = word.size()
- *         for _ in range(length if run < 0 else run):             # <<<<<<<<<<<<<<
- *             state = self.machine.data.as_ints[state * self.alphabet_len + word[index]]
- *             if state < 0:
+  /* "bundler/extensions/FSM.pyx":94
+ *         # The reverse arrows, with those into state in reverse_arrows[reverse_starts[state]:reverse_starts[state+1]].
+ *         reverse_starts.assign(self.machine_len + 1, 0)
+ *         for state in range(self.machine_len):             # <<<<<<<<<<<<<<
+ *             for i in range(self.alphabet_len):
+ *                 new_state = step(self, state, i)
  */
-  if (((__pyx_v_run < 0) != 0)) {
-    __pyx_t_1 = __pyx_v_length;
-  } else {
-    __pyx_t_1 = __pyx_v_run;
-  }
+  __pyx_t_1 = __pyx_cur_scope->__pyx_v_self->machine_len;
   __pyx_t_2 = __pyx_t_1;
   for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
-    __pyx_v__ = __pyx_t_3;
+    __pyx_v_state = __pyx_t_3;
 
-    /* "bundler/extensions/FSM.pyx":90
- *         cdef int length = word.size()
- *         for _ in range(length if run < 0 else run):
- *             state = self.machine.data.as_ints[state * self.alphabet_len + word[index]]             # <<<<<<<<<<<<<<
- *             if state < 0:
- *                 raise ValueError('Invalid transition to state {}'.format(state))
+    /* "bundler/extensions/FSM.pyx":95
+ *         reverse_starts.assign(self.machine_len + 1, 0)
+ *         for state in range(self.machine_len):
+ *             for i in range(self.alphabet_len):             # <<<<<<<<<<<<<<
+ *                 new_state = step(self, state, i)
+ *                 if new_state >= 0: reverse_starts[new_state + 1] += 1
  */
-    __pyx_v_state = (__pyx_v_self->machine->data.as_ints[((__pyx_v_state * __pyx_v_self->alphabet_len) + (__pyx_v_word[__pyx_v_index]))]);
+    __pyx_t_4 = __pyx_cur_scope->__pyx_v_self->alphabet_len;
+    __pyx_t_5 = __pyx_t_4;
+    for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+      __pyx_v_i = __pyx_t_6;
 
-    /* "bundler/extensions/FSM.pyx":91
- *         for _ in range(length if run < 0 else run):
- *             state = self.machine.data.as_ints[state * self.alphabet_len + word[index]]
- *             if state < 0:             # <<<<<<<<<<<<<<
- *                 raise ValueError('Invalid transition to state {}'.format(state))
- *             if self.has_yield.data.as_ints[state]:
+      /* "bundler/extensions/FSM.pyx":96
+ *         for state in range(self.machine_len):
+ *             for i in range(self.alphabet_len):
+ *                 new_state = step(self, state, i)             # <<<<<<<<<<<<<<
+ *                 if new_state >= 0: reverse_starts[new_state + 1] += 1
+ *         for state in range(self.machine_len):
  */
-    __pyx_t_4 = ((__pyx_v_state < 0) != 0);
-    if (unlikely(__pyx_t_4)) {
+      __pyx_t_7 = ((PyObject *)__pyx_cur_scope->__pyx_v_self);
+      __Pyx_INCREF(__pyx_t_7);
+      __pyx_v_new_state = __pyx_f_7bundler_10extensions_3FSM_step(((struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)__pyx_t_7), __pyx_v_state, __pyx_v_i);
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
 
-      /* "bundler/extensions/FSM.pyx":92
- *             state = self.machine.data.as_ints[state * self.alphabet_len + word[index]]
- *             if state < 0:
- *                 raise ValueError('Invalid transition to state {}'.format(state))             # <<<<<<<<<<<<<<
- *             if self.has_yield.data.as_ints[state]:
- *                 return True
+      /* "bundler/extensions/FSM.pyx":97
+ *             for i in range(self.alphabet_len):
+ *                 new_state = step(self, state, i)
+ *                 if new_state >= 0: reverse_starts[new_state + 1] += 1             # <<<<<<<<<<<<<<
+ *         for state in range(self.machine_len):
+ *             reverse_starts[state + 1] += reverse_starts[state]
  */
-      __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_Invalid_transition_to_state, __pyx_n_s_format); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 92, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_6);
-      __pyx_t_7 = __Pyx_PyInt_From_int(__pyx_v_state); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 92, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_7);
-      __pyx_t_8 = NULL;
-      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
-        __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_6);
-        if (likely(__pyx_t_8)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
-          __Pyx_INCREF(__pyx_t_8);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_6, function);
-        }
+      __pyx_t_8 = ((__pyx_v_new_state >= 0) != 0);
+      if (__pyx_t_8) {
+        __pyx_t_9 = (__pyx_v_new_state + 1);
+        (__pyx_v_reverse_starts[__pyx_t_9]) = ((__pyx_v_reverse_starts[__pyx_t_9]) + 1);
       }
-      __pyx_t_5 = (__pyx_t_8) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_8, __pyx_t_7) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_t_7);
-      __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-      if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 92, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_5);
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __pyx_t_6 = __Pyx_PyObject_CallOneArg(__pyx_builtin_ValueError, __pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 92, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_6);
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __Pyx_Raise(__pyx_t_6, 0, 0, 0);
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __PYX_ERR(0, 92, __pyx_L1_error)
+    }
+  }
 
-      /* "bundler/extensions/FSM.pyx":91
- *         for _ in range(length if run < 0 else run):
- *             state = self.machine.data.as_ints[state * self.alphabet_len + word[index]]
- *             if state < 0:             # <<<<<<<<<<<<<<
- *                 raise ValueError('Invalid transition to state {}'.format(state))
- *             if self.has_yield.data.as_ints[state]:
+  /* "bundler/extensions/FSM.pyx":98
+ *                 new_state = step(self, state, i)
+ *                 if new_state >= 0: reverse_starts[new_state + 1] += 1
+ *         for state in range(self.machine_len):             # <<<<<<<<<<<<<<
+ *             reverse_starts[state + 1] += reverse_starts[state]
+ *         reverse_arrows.resize(reverse_starts[self.machine_len])
  */
-    }
+  __pyx_t_1 = __pyx_cur_scope->__pyx_v_self->machine_len;
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_state = __pyx_t_3;
 
-    /* "bundler/extensions/FSM.pyx":93
- *             if state < 0:
- *                 raise ValueError('Invalid transition to state {}'.format(state))
- *             if self.has_yield.data.as_ints[state]:             # <<<<<<<<<<<<<<
- *                 return True
- *             index += 1
+    /* "bundler/extensions/FSM.pyx":99
+ *                 if new_state >= 0: reverse_starts[new_state + 1] += 1
+ *         for state in range(self.machine_len):
+ *             reverse_starts[state + 1] += reverse_starts[state]             # <<<<<<<<<<<<<<
+ *         reverse_arrows.resize(reverse_starts[self.machine_len])
+ *         for state in range(self.machine_len):
  */
-    __pyx_t_4 = ((__pyx_v_self->has_yield->data.as_ints[__pyx_v_state]) != 0);
-    if (__pyx_t_4) {
+    __pyx_t_9 = (__pyx_v_state + 1);
+    (__pyx_v_reverse_starts[__pyx_t_9]) = ((__pyx_v_reverse_starts[__pyx_t_9]) + (__pyx_v_reverse_starts[__pyx_v_state]));
+  }
 
-      /* "bundler/extensions/FSM.pyx":94
- *                 raise ValueError('Invalid transition to state {}'.format(state))
- *             if self.has_yield.data.as_ints[state]:
- *                 return True             # <<<<<<<<<<<<<<
- *             index += 1
- *             if index == length: index = 0
+  /* "bundler/extensions/FSM.pyx":100
+ *         for state in range(self.machine_len):
+ *             reverse_starts[state + 1] += reverse_starts[state]
+ *         reverse_arrows.resize(reverse_starts[self.machine_len])             # <<<<<<<<<<<<<<
+ *         for state in range(self.machine_len):
+ *             for i in range(self.alphabet_len):
  */
-      __pyx_r = 1;
-      goto __pyx_L0;
+  try {
+    __pyx_v_reverse_arrows.resize((__pyx_v_reverse_starts[__pyx_cur_scope->__pyx_v_self->machine_len]));
+  } catch(...) {
+    __Pyx_CppExn2PyErr();
+    __PYX_ERR(0, 100, __pyx_L1_error)
+  }
 
-      /* "bundler/extensions/FSM.pyx":93
- *             if state < 0:
- *                 raise ValueError('Invalid transition to state {}'.format(state))
- *             if self.has_yield.data.as_ints[state]:             # <<<<<<<<<<<<<<
- *                 return True
- *             index += 1
+  /* "bundler/extensions/FSM.pyx":101
+ *             reverse_starts[state + 1] += reverse_starts[state]
+ *         reverse_arrows.resize(reverse_starts[self.machine_len])
+ *         for state in range(self.machine_len):             # <<<<<<<<<<<<<<
+ *             for i in range(self.alphabet_len):
+ *                 new_state = step(self, state, i)
  */
-    }
+  __pyx_t_1 = __pyx_cur_scope->__pyx_v_self->machine_len;
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_state = __pyx_t_3;
 
-    /* "bundler/extensions/FSM.pyx":95
- *             if self.has_yield.data.as_ints[state]:
- *                 return True
- *             index += 1             # <<<<<<<<<<<<<<
- *             if index == length: index = 0
- * 
+    /* "bundler/extensions/FSM.pyx":102
+ *         reverse_arrows.resize(reverse_starts[self.machine_len])
+ *         for state in range(self.machine_len):
+ *             for i in range(self.alphabet_len):             # <<<<<<<<<<<<<<
+ *                 new_state = step(self, state, i)
+ *                 if new_state >= 0:
  */
-    __pyx_v_index = (__pyx_v_index + 1);
+    __pyx_t_4 = __pyx_cur_scope->__pyx_v_self->alphabet_len;
+    __pyx_t_5 = __pyx_t_4;
+    for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+      __pyx_v_i = __pyx_t_6;
 
-    /* "bundler/extensions/FSM.pyx":96
- *                 return True
- *             index += 1
- *             if index == length: index = 0             # <<<<<<<<<<<<<<
- * 
- *         return False
+      /* "bundler/extensions/FSM.pyx":103
+ *         for state in range(self.machine_len):
+ *             for i in range(self.alphabet_len):
+ *                 new_state = step(self, state, i)             # <<<<<<<<<<<<<<
+ *                 if new_state >= 0:
+ *                     reverse_arrows[reverse_starts[new_state]] = state
  */
-    __pyx_t_4 = ((__pyx_v_index == __pyx_v_length) != 0);
-    if (__pyx_t_4) {
-      __pyx_v_index = 0;
-    }
-  }
-
-  /* "bundler/extensions/FSM.pyx":98
- *             if index == length: index = 0
- * 
- *         return False             # <<<<<<<<<<<<<<
- * 
- *     def hit(self, tuple word):
- */
-  __pyx_r = 0;
-  goto __pyx_L0;
-
-  /* "bundler/extensions/FSM.pyx":85
- *         return self.distance_to_yield[self(word)]
- * 
- *     cdef bint c_hit(self, IWord& word, int run=-1):             # <<<<<<<<<<<<<<
- *         cdef int index = 0
- *         cdef int state = 0
- */
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_WriteUnraisable("bundler.extensions.FSM.FSM.c_hit", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
+      __pyx_t_7 = ((PyObject *)__pyx_cur_scope->__pyx_v_self);
+      __Pyx_INCREF(__pyx_t_7);
+      __pyx_v_new_state = __pyx_f_7bundler_10extensions_3FSM_step(((struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)__pyx_t_7), __pyx_v_state, __pyx_v_i);
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
 
-/* "bundler/extensions/FSM.pyx":100
- *         return False
- * 
- *     def hit(self, tuple word):             # <<<<<<<<<<<<<<
- *         ''' Return whether word meets any state that yields. '''
- *         # return any(self.hits(word))
+      /* "bundler/extensions/FSM.pyx":104
+ *             for i in range(self.alphabet_len):
+ *                 new_state = step(self, state, i)
+ *                 if new_state >= 0:             # <<<<<<<<<<<<<<
+ *                     reverse_arrows[reverse_starts[new_state]] = state
+ *                     reverse_starts[new_state] += 1
  */
-
-/* Python wrapper */
-static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_11hit(PyObject *__pyx_v_self, PyObject *__pyx_v_word); /*proto*/
-static char __pyx_doc_7bundler_10extensions_3FSM_3FSM_10hit[] = " Return whether word meets any state that yields. ";
-static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_11hit(PyObject *__pyx_v_self, PyObject *__pyx_v_word) {
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("hit (wrapper)", 0);
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_word), (&PyTuple_Type), 1, "word", 1))) __PYX_ERR(0, 100, __pyx_L1_error)
-  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_3FSM_10hit(((struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)__pyx_v_self), ((PyObject*)__pyx_v_word));
-
-  /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_10hit(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self, PyObject *__pyx_v_word) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  __pyx_t_7bundler_10extensions_3FSM_IWord __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("hit", 0);
-
-  /* "bundler/extensions/FSM.pyx":103
- *         ''' Return whether word meets any state that yields. '''
- *         # return any(self.hits(word))
- *         return self.c_hit(word)             # <<<<<<<<<<<<<<
- * 
- *     cdef vector[pair[int, IWord]] c_hits(self, IWord& word, int run=-1):
+      __pyx_t_8 = ((__pyx_v_new_state >= 0) != 0);
+      if (__pyx_t_8) {
+
+        /* "bundler/extensions/FSM.pyx":105
+ *                 new_state = step(self, state, i)
+ *                 if new_state >= 0:
+ *                     reverse_arrows[reverse_starts[new_state]] = state             # <<<<<<<<<<<<<<
+ *                     reverse_starts[new_state] += 1
+ *         for state in range(self.machine_len, 0, -1):  # Undo the shift caused by filling.
  */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_convert_vector_from_py_int(__pyx_v_word); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 103, __pyx_L1_error)
-  __pyx_t_2 = __Pyx_PyBool_FromLong(((struct __pyx_vtabstruct_7bundler_10extensions_3FSM_FSM *)__pyx_v_self->__pyx_vtab)->c_hit(__pyx_v_self, __pyx_t_1, NULL)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 103, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_r = __pyx_t_2;
-  __pyx_t_2 = 0;
-  goto __pyx_L0;
-
-  /* "bundler/extensions/FSM.pyx":100
- *         return False
- * 
- *     def hit(self, tuple word):             # <<<<<<<<<<<<<<
- *         ''' Return whether word meets any state that yields. '''
- *         # return any(self.hits(word))
+        (__pyx_v_reverse_arrows[(__pyx_v_reverse_starts[__pyx_v_new_state])]) = __pyx_v_state;
+
+        /* "bundler/extensions/FSM.pyx":106
+ *                 if new_state >= 0:
+ *                     reverse_arrows[reverse_starts[new_state]] = state
+ *                     reverse_starts[new_state] += 1             # <<<<<<<<<<<<<<
+ *         for state in range(self.machine_len, 0, -1):  # Undo the shift caused by filling.
+ *             reverse_starts[state] = reverse_starts[state - 1]
  */
+        __pyx_t_10 = __pyx_v_new_state;
+        (__pyx_v_reverse_starts[__pyx_t_10]) = ((__pyx_v_reverse_starts[__pyx_t_10]) + 1);
 
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("bundler.extensions.FSM.FSM.hit", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "bundler/extensions/FSM.pyx":105
- *         return self.c_hit(word)
- * 
- *     cdef vector[pair[int, IWord]] c_hits(self, IWord& word, int run=-1):             # <<<<<<<<<<<<<<
- *         ''' Process word and yield (index, x) for all states that word hits that have things to yield. '''
- *         cdef int index = 0
+        /* "bundler/extensions/FSM.pyx":104
+ *             for i in range(self.alphabet_len):
+ *                 new_state = step(self, state, i)
+ *                 if new_state >= 0:             # <<<<<<<<<<<<<<
+ *                     reverse_arrows[reverse_starts[new_state]] = state
+ *                     reverse_starts[new_state] += 1
  */
-
-static std::vector<std::pair<int,__pyx_t_7bundler_10extensions_3FSM_IWord> >  __pyx_f_7bundler_10extensions_3FSM_3FSM_c_hits(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self, __pyx_t_7bundler_10extensions_3FSM_IWord &__pyx_v_word, struct __pyx_opt_args_7bundler_10extensions_3FSM_3FSM_c_hits *__pyx_optional_args) {
-  int __pyx_v_run = ((int)-1);
-  int __pyx_v_index;
-  int __pyx_v_state;
-  int __pyx_v_length;
-  int __pyx_v_i;
-  int __pyx_v_j;
-  std::vector<std::pair<int,__pyx_t_7bundler_10extensions_3FSM_IWord> >  __pyx_v_returns;
-  CYTHON_UNUSED int __pyx_v__;
-  std::vector<std::pair<int,__pyx_t_7bundler_10extensions_3FSM_IWord> >  __pyx_r;
-  __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  int __pyx_t_2;
-  int __pyx_t_3;
-  int __pyx_t_4;
-  int __pyx_t_5;
-  int __pyx_t_6;
-  std::pair<int,__pyx_t_7bundler_10extensions_3FSM_IWord>  __pyx_t_7;
-  int __pyx_t_8;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("c_hits", 0);
-  if (__pyx_optional_args) {
-    if (__pyx_optional_args->__pyx_n > 0) {
-      __pyx_v_run = __pyx_optional_args->run;
+      }
     }
   }
 
   /* "bundler/extensions/FSM.pyx":107
- *     cdef vector[pair[int, IWord]] c_hits(self, IWord& word, int run=-1):
- *         ''' Process word and yield (index, x) for all states that word hits that have things to yield. '''
- *         cdef int index = 0             # <<<<<<<<<<<<<<
- *         cdef int state = 0
- *         cdef int length = word.size()
+ *                     reverse_arrows[reverse_starts[new_state]] = state
+ *                     reverse_starts[new_state] += 1
+ *         for state in range(self.machine_len, 0, -1):  # Undo the shift caused by filling.             # <<<<<<<<<<<<<<
+ *             reverse_starts[state] = reverse_starts[state - 1]
+ *         reverse_starts[0] = 0
  */
-  __pyx_v_index = 0;
-
-  /* "bundler/extensions/FSM.pyx":108
- *         ''' Process word and yield (index, x) for all states that word hits that have things to yield. '''
- *         cdef int index = 0
- *         cdef int state = 0             # <<<<<<<<<<<<<<
- *         cdef int length = word.size()
- *         cdef int i = 0, j
+  for (__pyx_t_1 = __pyx_cur_scope->__pyx_v_self->machine_len; __pyx_t_1 > 0; __pyx_t_1-=1) {
+    __pyx_v_state = __pyx_t_1;
+
+    /* "bundler/extensions/FSM.pyx":108
+ *                     reverse_starts[new_state] += 1
+ *         for state in range(self.machine_len, 0, -1):  # Undo the shift caused by filling.
+ *             reverse_starts[state] = reverse_starts[state - 1]             # <<<<<<<<<<<<<<
+ *         reverse_starts[0] = 0
+ * 
  */
-  __pyx_v_state = 0;
+    (__pyx_v_reverse_starts[__pyx_v_state]) = (__pyx_v_reverse_starts[(__pyx_v_state - 1)]);
+  }
 
   /* "bundler/extensions/FSM.pyx":109
- *         cdef int index = 0
- *         cdef int state = 0
- *         cdef int length = word.size()             # <<<<<<<<<<<<<<
- *         cdef int i = 0, j
- *         cdef vector[pair[int, IWord]] returns
+ *         for state in range(self.machine_len, 0, -1):  # Undo the shift caused by filling.
+ *             reverse_starts[state] = reverse_starts[state - 1]
+ *         reverse_starts[0] = 0             # <<<<<<<<<<<<<<
+ * 
+ *         distances.assign(self.machine_len, -1)
  */
-  __pyx_v_length = __pyx_v_word.size();
+  (__pyx_v_reverse_starts[0]) = 0;
 
-  /* "bundler/extensions/FSM.pyx":110
- *         cdef int state = 0
- *         cdef int length = word.size()
- *         cdef int i = 0, j             # <<<<<<<<<<<<<<
- *         cdef vector[pair[int, IWord]] returns
- *         for _ in range(length if run < 0 else run):
+  /* "bundler/extensions/FSM.pyx":111
+ *         reverse_starts[0] = 0
+ * 
+ *         distances.assign(self.machine_len, -1)             # <<<<<<<<<<<<<<
+ *         for state in range(self.machine_len):
+ *             if self.has_yield.data.as_ints[state]:
  */
-  __pyx_v_i = 0;
+  __pyx_cur_scope->__pyx_v_distances.assign(__pyx_cur_scope->__pyx_v_self->machine_len, -1);
 
   /* "bundler/extensions/FSM.pyx":112
- *         cdef int i = 0, j
- *         cdef vector[pair[int, IWord]] returns
- *         for _ in range(length if run < 0 else run):             # <<<<<<<<<<<<<<
- *             state = self.machine.data.as_ints[state * self.alphabet_len + word[index]]
- *             i += 1
+ * 
+ *         distances.assign(self.machine_len, -1)
+ *         for state in range(self.machine_len):             # <<<<<<<<<<<<<<
+ *             if self.has_yield.data.as_ints[state]:
+ *                 distances[state] = 0
  */
-  if (((__pyx_v_run < 0) != 0)) {
-    __pyx_t_1 = __pyx_v_length;
-  } else {
-    __pyx_t_1 = __pyx_v_run;
-  }
+  __pyx_t_1 = __pyx_cur_scope->__pyx_v_self->machine_len;
   __pyx_t_2 = __pyx_t_1;
   for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
-    __pyx_v__ = __pyx_t_3;
+    __pyx_v_state = __pyx_t_3;
 
     /* "bundler/extensions/FSM.pyx":113
- *         cdef vector[pair[int, IWord]] returns
- *         for _ in range(length if run < 0 else run):
- *             state = self.machine.data.as_ints[state * self.alphabet_len + word[index]]             # <<<<<<<<<<<<<<
- *             i += 1
- *             for j in range(self.yield_states2_starts[state], self.yield_states2_starts[state+1]):
- */
-    __pyx_v_state = (__pyx_v_self->machine->data.as_ints[((__pyx_v_state * __pyx_v_self->alphabet_len) + (__pyx_v_word[__pyx_v_index]))]);
-
-    /* "bundler/extensions/FSM.pyx":114
- *         for _ in range(length if run < 0 else run):
- *             state = self.machine.data.as_ints[state * self.alphabet_len + word[index]]
- *             i += 1             # <<<<<<<<<<<<<<
- *             for j in range(self.yield_states2_starts[state], self.yield_states2_starts[state+1]):
- *                 returns.push_back(pair[int, IWord](i, self.yield_states2[j]))
+ *         distances.assign(self.machine_len, -1)
+ *         for state in range(self.machine_len):
+ *             if self.has_yield.data.as_ints[state]:             # <<<<<<<<<<<<<<
+ *                 distances[state] = 0
+ *                 to_check.push_back(state)
  */
-    __pyx_v_i = (__pyx_v_i + 1);
+    __pyx_t_8 = ((__pyx_cur_scope->__pyx_v_self->has_yield->data.as_ints[__pyx_v_state]) != 0);
+    if (__pyx_t_8) {
 
-    /* "bundler/extensions/FSM.pyx":115
- *             state = self.machine.data.as_ints[state * self.alphabet_len + word[index]]
- *             i += 1
- *             for j in range(self.yield_states2_starts[state], self.yield_states2_starts[state+1]):             # <<<<<<<<<<<<<<
- *                 returns.push_back(pair[int, IWord](i, self.yield_states2[j]))
- *             index += 1
+      /* "bundler/extensions/FSM.pyx":114
+ *         for state in range(self.machine_len):
+ *             if self.has_yield.data.as_ints[state]:
+ *                 distances[state] = 0             # <<<<<<<<<<<<<<
+ *                 to_check.push_back(state)
+ * 
  */
-    __pyx_t_4 = (__pyx_v_self->yield_states2_starts[(__pyx_v_state + 1)]);
-    __pyx_t_5 = __pyx_t_4;
-    for (__pyx_t_6 = (__pyx_v_self->yield_states2_starts[__pyx_v_state]); __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
-      __pyx_v_j = __pyx_t_6;
+      (__pyx_cur_scope->__pyx_v_distances[__pyx_v_state]) = 0;
 
-      /* "bundler/extensions/FSM.pyx":116
- *             i += 1
- *             for j in range(self.yield_states2_starts[state], self.yield_states2_starts[state+1]):
- *                 returns.push_back(pair[int, IWord](i, self.yield_states2[j]))             # <<<<<<<<<<<<<<
- *             index += 1
- *             if index == length: index = 0
+      /* "bundler/extensions/FSM.pyx":115
+ *             if self.has_yield.data.as_ints[state]:
+ *                 distances[state] = 0
+ *                 to_check.push_back(state)             # <<<<<<<<<<<<<<
+ * 
+ *         while head < to_check.size():
  */
       try {
-        __pyx_t_7 = std::pair<int,__pyx_t_7bundler_10extensions_3FSM_IWord> (__pyx_v_i, (__pyx_v_self->yield_states2[__pyx_v_j]));
-      } catch(...) {
-        __Pyx_CppExn2PyErr();
-        __PYX_ERR(0, 116, __pyx_L1_error)
-      }
-      try {
-        __pyx_v_returns.push_back(__pyx_t_7);
+        __pyx_v_to_check.push_back(__pyx_v_state);
       } catch(...) {
         __Pyx_CppExn2PyErr();
-        __PYX_ERR(0, 116, __pyx_L1_error)
+        __PYX_ERR(0, 115, __pyx_L1_error)
       }
+
+      /* "bundler/extensions/FSM.pyx":113
+ *         distances.assign(self.machine_len, -1)
+ *         for state in range(self.machine_len):
+ *             if self.has_yield.data.as_ints[state]:             # <<<<<<<<<<<<<<
+ *                 distances[state] = 0
+ *                 to_check.push_back(state)
+ */
     }
+  }
 
-    /* "bundler/extensions/FSM.pyx":117
- *             for j in range(self.yield_states2_starts[state], self.yield_states2_starts[state+1]):
- *                 returns.push_back(pair[int, IWord](i, self.yield_states2[j]))
- *             index += 1             # <<<<<<<<<<<<<<
- *             if index == length: index = 0
+  /* "bundler/extensions/FSM.pyx":117
+ *                 to_check.push_back(state)
  * 
+ *         while head < to_check.size():             # <<<<<<<<<<<<<<
+ *             state = to_check[head]
+ *             head += 1
  */
-    __pyx_v_index = (__pyx_v_index + 1);
+  while (1) {
+    __pyx_t_8 = ((__pyx_v_head < __pyx_v_to_check.size()) != 0);
+    if (!__pyx_t_8) break;
 
     /* "bundler/extensions/FSM.pyx":118
- *                 returns.push_back(pair[int, IWord](i, self.yield_states2[j]))
- *             index += 1
- *             if index == length: index = 0             # <<<<<<<<<<<<<<
  * 
- *         return returns
+ *         while head < to_check.size():
+ *             state = to_check[head]             # <<<<<<<<<<<<<<
+ *             head += 1
+ *             for j in range(reverse_starts[state], reverse_starts[state + 1]):
  */
-    __pyx_t_8 = ((__pyx_v_index == __pyx_v_length) != 0);
-    if (__pyx_t_8) {
-      __pyx_v_index = 0;
+    __pyx_v_state = (__pyx_v_to_check[__pyx_v_head]);
+
+    /* "bundler/extensions/FSM.pyx":119
+ *         while head < to_check.size():
+ *             state = to_check[head]
+ *             head += 1             # <<<<<<<<<<<<<<
+ *             for j in range(reverse_starts[state], reverse_starts[state + 1]):
+ *                 if distances[reverse_arrows[j]] < 0:
+ */
+    __pyx_v_head = (__pyx_v_head + 1);
+
+    /* "bundler/extensions/FSM.pyx":120
+ *             state = to_check[head]
+ *             head += 1
+ *             for j in range(reverse_starts[state], reverse_starts[state + 1]):             # <<<<<<<<<<<<<<
+ *                 if distances[reverse_arrows[j]] < 0:
+ *                     distances[reverse_arrows[j]] = distances[state] + 1
+ */
+    __pyx_t_1 = (__pyx_v_reverse_starts[(__pyx_v_state + 1)]);
+    __pyx_t_2 = __pyx_t_1;
+    for (__pyx_t_3 = (__pyx_v_reverse_starts[__pyx_v_state]); __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+      __pyx_v_j = __pyx_t_3;
+
+      /* "bundler/extensions/FSM.pyx":121
+ *             head += 1
+ *             for j in range(reverse_starts[state], reverse_starts[state + 1]):
+ *                 if distances[reverse_arrows[j]] < 0:             # <<<<<<<<<<<<<<
+ *                     distances[reverse_arrows[j]] = distances[state] + 1
+ *                     to_check.push_back(reverse_arrows[j])
+ */
+      __pyx_t_8 = (((__pyx_cur_scope->__pyx_v_distances[(__pyx_v_reverse_arrows[__pyx_v_j])]) < 0) != 0);
+      if (__pyx_t_8) {
+
+        /* "bundler/extensions/FSM.pyx":122
+ *             for j in range(reverse_starts[state], reverse_starts[state + 1]):
+ *                 if distances[reverse_arrows[j]] < 0:
+ *                     distances[reverse_arrows[j]] = distances[state] + 1             # <<<<<<<<<<<<<<
+ *                     to_check.push_back(reverse_arrows[j])
+ * 
+ */
+        (__pyx_cur_scope->__pyx_v_distances[(__pyx_v_reverse_arrows[__pyx_v_j])]) = ((__pyx_cur_scope->__pyx_v_distances[__pyx_v_state]) + 1);
+
+        /* "bundler/extensions/FSM.pyx":123
+ *                 if distances[reverse_arrows[j]] < 0:
+ *                     distances[reverse_arrows[j]] = distances[state] + 1
+ *                     to_check.push_back(reverse_arrows[j])             # <<<<<<<<<<<<<<
+ * 
+ *         return dict((state, distances[state]) for state in range(self.machine_len) if distances[state] >= 0)
+ */
+        try {
+          __pyx_v_to_check.push_back((__pyx_v_reverse_arrows[__pyx_v_j]));
+        } catch(...) {
+          __Pyx_CppExn2PyErr();
+          __PYX_ERR(0, 123, __pyx_L1_error)
+        }
+
+        /* "bundler/extensions/FSM.pyx":121
+ *             head += 1
+ *             for j in range(reverse_starts[state], reverse_starts[state + 1]):
+ *                 if distances[reverse_arrows[j]] < 0:             # <<<<<<<<<<<<<<
+ *                     distances[reverse_arrows[j]] = distances[state] + 1
+ *                     to_check.push_back(reverse_arrows[j])
+ */
+      }
     }
   }
 
-  /* "bundler/extensions/FSM.pyx":120
- *             if index == length: index = 0
+  /* "bundler/extensions/FSM.pyx":125
+ *                     to_check.push_back(reverse_arrows[j])
  * 
- *         return returns             # <<<<<<<<<<<<<<
+ *         return dict((state, distances[state]) for state in range(self.machine_len) if distances[state] >= 0)             # <<<<<<<<<<<<<<
  * 
- *     def hits(self, tuple word, int run=-1):
+ *     @classmethod
  */
-  __pyx_r = __pyx_v_returns;
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_7 = __pyx_pf_7bundler_10extensions_3FSM_3FSM_22find_distance_to_yield_genexpr(((PyObject*)__pyx_cur_scope)); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 125, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_11 = __Pyx_Generator_Next(__pyx_t_7); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 125, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_11);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_r = __pyx_t_11;
+  __pyx_t_11 = 0;
   goto __pyx_L0;
 
-  /* "bundler/extensions/FSM.pyx":105
- *         return self.c_hit(word)
+  /* "bundler/extensions/FSM.pyx":86
+ *         self.distances = array.array('i', [self.distance_to_yield.get(state, UNREACHABLE) for state in range(self.machine_len)])
  * 
- *     cdef vector[pair[int, IWord]] c_hits(self, IWord& word, int run=-1):             # <<<<<<<<<<<<<<
- *         ''' Process word and yield (index, x) for all states that word hits that have things to yield. '''
- *         cdef int index = 0
+ *     def find_distance_to_yield(self):             # <<<<<<<<<<<<<<
+ *         ''' Return a dictionary mapping each state to the length of the shortest word that takes it to a yield state. '''
+ *         cdef int state, new_state, i, j
  */
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_WriteUnraisable("bundler.extensions.FSM.FSM.c_hits", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
-  __Pyx_pretend_to_initialize(&__pyx_r);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_AddTraceback("bundler.extensions.FSM.FSM.find_distance_to_yield", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
   __pyx_L0:;
+  __Pyx_XDECREF(__pyx_gb_7bundler_10extensions_3FSM_3FSM_22find_distance_to_yield_2generator2);
+  __Pyx_DECREF(((PyObject *)__pyx_cur_scope));
+  __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
-static PyObject *__pyx_gb_7bundler_10extensions_3FSM_3FSM_14generator(__pyx_CoroutineObject *__pyx_generator, CYTHON_UNUSED PyThreadState *__pyx_tstate, PyObject *__pyx_sent_value); /* proto */
 
-/* "bundler/extensions/FSM.pyx":122
- *         return returns
+/* "bundler/extensions/FSM.pyx":128
+ * 
+ *     @classmethod
+ *     def from_dicts(cls, list alphabet, object machine, dict hits):             # <<<<<<<<<<<<<<
+ *         ''' Build a cFSM from an ordered dictionary of dictionaries and a dictionary mapping states to hits. '''
  * 
- *     def hits(self, tuple word, int run=-1):             # <<<<<<<<<<<<<<
- *         ''' Process word and yield (index, x) for all states that word hits that have things to yield. '''
- *         cdef int index = 0, letter
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_13hits(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_7bundler_10extensions_3FSM_3FSM_12hits[] = " Process word and yield (index, x) for all states that word hits that have things to yield. ";
-static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_13hits(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_word = 0;
-  int __pyx_v_run;
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_5from_dicts(PyObject *__pyx_v_cls, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_7bundler_10extensions_3FSM_3FSM_4from_dicts[] = " Build a cFSM from an ordered dictionary of dictionaries and a dictionary mapping states to hits. ";
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_5from_dicts(PyObject *__pyx_v_cls, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_alphabet = 0;
+  PyObject *__pyx_v_machine = 0;
+  PyObject *__pyx_v_hits = 0;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("hits (wrapper)", 0);
+  __Pyx_RefNannySetupContext("from_dicts (wrapper)", 0);
   {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_word,&__pyx_n_s_run,0};
-    PyObject* values[2] = {0,0};
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_alphabet,&__pyx_n_s_machine,&__pyx_n_s_hits,0};
+    PyObject* values[3] = {0,0,0};
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
       switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
         case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
         CYTHON_FALLTHROUGH;
         case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
@@ -4759,44 +4712,46 @@ static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_13hits(PyObject *__pyx
       kw_args = PyDict_Size(__pyx_kwds);
       switch (pos_args) {
         case  0:
-        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_word)) != 0)) kw_args--;
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_alphabet)) != 0)) kw_args--;
         else goto __pyx_L5_argtuple_error;
         CYTHON_FALLTHROUGH;
         case  1:
-        if (kw_args > 0) {
-          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_run);
-          if (value) { values[1] = value; kw_args--; }
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_machine)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("from_dicts", 1, 3, 3, 1); __PYX_ERR(0, 128, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_hits)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("from_dicts", 1, 3, 3, 2); __PYX_ERR(0, 128, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "hits") < 0)) __PYX_ERR(0, 122, __pyx_L3_error)
-      }
-    } else {
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        break;
-        default: goto __pyx_L5_argtuple_error;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "from_dicts") < 0)) __PYX_ERR(0, 128, __pyx_L3_error)
       }
-    }
-    __pyx_v_word = ((PyObject*)values[0]);
-    if (values[1]) {
-      __pyx_v_run = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_run == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 122, __pyx_L3_error)
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
+      goto __pyx_L5_argtuple_error;
     } else {
-      __pyx_v_run = ((int)-1);
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
     }
+    __pyx_v_alphabet = ((PyObject*)values[0]);
+    __pyx_v_machine = values[1];
+    __pyx_v_hits = ((PyObject*)values[2]);
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("hits", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 122, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("from_dicts", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 128, __pyx_L3_error)
   __pyx_L3_error:;
-  __Pyx_AddTraceback("bundler.extensions.FSM.FSM.hits", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("bundler.extensions.FSM.FSM.from_dicts", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_word), (&PyTuple_Type), 1, "word", 1))) __PYX_ERR(0, 122, __pyx_L1_error)
-  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_3FSM_12hits(((struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)__pyx_v_self), __pyx_v_word, __pyx_v_run);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_alphabet), (&PyList_Type), 1, "alphabet", 1))) __PYX_ERR(0, 128, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_hits), (&PyDict_Type), 1, "hits", 1))) __PYX_ERR(0, 128, __pyx_L1_error)
+  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_3FSM_4from_dicts(((PyTypeObject*)__pyx_v_cls), __pyx_v_alphabet, __pyx_v_machine, __pyx_v_hits);
 
   /* function exit code */
   goto __pyx_L0;
@@ -4806,32 +4761,37 @@ static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_13hits(PyObject *__pyx
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
+static PyObject *__pyx_gb_7bundler_10extensions_3FSM_3FSM_10from_dicts_2generator3(__pyx_CoroutineObject *__pyx_generator, CYTHON_UNUSED PyThreadState *__pyx_tstate, PyObject *__pyx_sent_value); /* proto */
+
+/* "bundler/extensions/FSM.pyx":134
+ * 
+ *         state_names = list(machine)
+ *         state_names_index = dict((name, place) for place, name in enumerate(state_names))             # <<<<<<<<<<<<<<
+ *         flattened_machine = [state_names_index.get(machine[state_name][letter], -1) for state_name in state_names for letter in alphabet]
+ * 
+ */
 
-static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_12hits(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self, PyObject *__pyx_v_word, int __pyx_v_run) {
-  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_3_hits *__pyx_cur_scope;
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_10from_dicts_genexpr(PyObject *__pyx_self) {
+  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_5_genexpr *__pyx_cur_scope;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("hits", 0);
-  __pyx_cur_scope = (struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_3_hits *)__pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct_3_hits(__pyx_ptype_7bundler_10extensions_3FSM___pyx_scope_struct_3_hits, __pyx_empty_tuple, NULL);
+  __Pyx_RefNannySetupContext("genexpr", 0);
+  __pyx_cur_scope = (struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_5_genexpr *)__pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct_5_genexpr(__pyx_ptype_7bundler_10extensions_3FSM___pyx_scope_struct_5_genexpr, __pyx_empty_tuple, NULL);
   if (unlikely(!__pyx_cur_scope)) {
-    __pyx_cur_scope = ((struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_3_hits *)Py_None);
+    __pyx_cur_scope = ((struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_5_genexpr *)Py_None);
     __Pyx_INCREF(Py_None);
-    __PYX_ERR(0, 122, __pyx_L1_error)
+    __PYX_ERR(0, 134, __pyx_L1_error)
   } else {
     __Pyx_GOTREF(__pyx_cur_scope);
   }
-  __pyx_cur_scope->__pyx_v_self = __pyx_v_self;
-  __Pyx_INCREF((PyObject *)__pyx_cur_scope->__pyx_v_self);
-  __Pyx_GIVEREF((PyObject *)__pyx_cur_scope->__pyx_v_self);
-  __pyx_cur_scope->__pyx_v_word = __pyx_v_word;
-  __Pyx_INCREF(__pyx_cur_scope->__pyx_v_word);
-  __Pyx_GIVEREF(__pyx_cur_scope->__pyx_v_word);
-  __pyx_cur_scope->__pyx_v_run = __pyx_v_run;
+  __pyx_cur_scope->__pyx_outer_scope = (struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts *) __pyx_self;
+  __Pyx_INCREF(((PyObject *)__pyx_cur_scope->__pyx_outer_scope));
+  __Pyx_GIVEREF(__pyx_cur_scope->__pyx_outer_scope);
   {
-    __pyx_CoroutineObject *gen = __Pyx_Generator_New((__pyx_coroutine_body_t) __pyx_gb_7bundler_10extensions_3FSM_3FSM_14generator, NULL, (PyObject *) __pyx_cur_scope, __pyx_n_s_hits, __pyx_n_s_FSM_hits, __pyx_n_s_bundler_extensions_FSM); if (unlikely(!gen)) __PYX_ERR(0, 122, __pyx_L1_error)
+    __pyx_CoroutineObject *gen = __Pyx_Generator_New((__pyx_coroutine_body_t) __pyx_gb_7bundler_10extensions_3FSM_3FSM_10from_dicts_2generator3, NULL, (PyObject *) __pyx_cur_scope, __pyx_n_s_genexpr, __pyx_n_s_from_dicts_locals_genexpr, __pyx_n_s_bundler_extensions_FSM); if (unlikely(!gen)) __PYX_ERR(0, 134, __pyx_L1_error)
     __Pyx_DECREF(__pyx_cur_scope);
     __Pyx_RefNannyFinishContext();
     return (PyObject *) gen;
@@ -4839,7 +4799,7 @@ static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_12hits(struct __pyx_ob
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_AddTraceback("bundler.extensions.FSM.FSM.hits", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("bundler.extensions.FSM.FSM.from_dicts.genexpr", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __Pyx_DECREF(((PyObject *)__pyx_cur_scope));
   __Pyx_XGIVEREF(__pyx_r);
@@ -4847,336 +4807,201 @@ static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_12hits(struct __pyx_ob
   return __pyx_r;
 }
 
-static PyObject *__pyx_gb_7bundler_10extensions_3FSM_3FSM_14generator(__pyx_CoroutineObject *__pyx_generator, CYTHON_UNUSED PyThreadState *__pyx_tstate, PyObject *__pyx_sent_value) /* generator body */
+static PyObject *__pyx_gb_7bundler_10extensions_3FSM_3FSM_10from_dicts_2generator3(__pyx_CoroutineObject *__pyx_generator, CYTHON_UNUSED PyThreadState *__pyx_tstate, PyObject *__pyx_sent_value) /* generator body */
 {
-  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_3_hits *__pyx_cur_scope = ((struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_3_hits *)__pyx_generator->closure);
+  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_5_genexpr *__pyx_cur_scope = ((struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_5_genexpr *)__pyx_generator->closure);
   PyObject *__pyx_r = NULL;
-  Py_ssize_t __pyx_t_1;
-  int __pyx_t_2;
-  int __pyx_t_3;
-  int __pyx_t_4;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  PyObject *__pyx_t_7 = NULL;
-  int __pyx_t_8;
-  PyObject *__pyx_t_9 = NULL;
-  PyObject *(*__pyx_t_10)(PyObject *);
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  Py_ssize_t __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("hits", 0);
+  __Pyx_RefNannySetupContext("genexpr", 0);
   switch (__pyx_generator->resume_label) {
     case 0: goto __pyx_L3_first_run;
-    case 1: goto __pyx_L9_resume_from_yield;
     default: /* CPython raises the right error here */
     __Pyx_RefNannyFinishContext();
     return NULL;
   }
   __pyx_L3_first_run:;
-  if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 122, __pyx_L1_error)
-
-  /* "bundler/extensions/FSM.pyx":124
- *     def hits(self, tuple word, int run=-1):
- *         ''' Process word and yield (index, x) for all states that word hits that have things to yield. '''
- *         cdef int index = 0, letter             # <<<<<<<<<<<<<<
- *         cdef int state = 0
- *         cdef int length = len(word)
- */
-  __pyx_cur_scope->__pyx_v_index = 0;
-
-  /* "bundler/extensions/FSM.pyx":125
- *         ''' Process word and yield (index, x) for all states that word hits that have things to yield. '''
- *         cdef int index = 0, letter
- *         cdef int state = 0             # <<<<<<<<<<<<<<
- *         cdef int length = len(word)
- *         cdef int i = 0
- */
-  __pyx_cur_scope->__pyx_v_state = 0;
-
-  /* "bundler/extensions/FSM.pyx":126
- *         cdef int index = 0, letter
- *         cdef int state = 0
- *         cdef int length = len(word)             # <<<<<<<<<<<<<<
- *         cdef int i = 0
- *         for _ in range(length if run < 0 else run):
- */
-  if (unlikely(__pyx_cur_scope->__pyx_v_word == Py_None)) {
-    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
-    __PYX_ERR(0, 126, __pyx_L1_error)
+  if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 134, __pyx_L1_error)
+  __pyx_r = PyDict_New(); if (unlikely(!__pyx_r)) __PYX_ERR(0, 134, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_r);
+  __Pyx_INCREF(__pyx_int_0);
+  __pyx_t_1 = __pyx_int_0;
+  if (unlikely(!__pyx_cur_scope->__pyx_outer_scope->__pyx_v_state_names)) { __Pyx_RaiseClosureNameError("state_names"); __PYX_ERR(0, 134, __pyx_L1_error) }
+  __pyx_t_2 = __pyx_cur_scope->__pyx_outer_scope->__pyx_v_state_names; __Pyx_INCREF(__pyx_t_2); __pyx_t_3 = 0;
+  for (;;) {
+    if (__pyx_t_3 >= PyList_GET_SIZE(__pyx_t_2)) break;
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    __pyx_t_4 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_3); __Pyx_INCREF(__pyx_t_4); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 134, __pyx_L1_error)
+    #else
+    __pyx_t_4 = PySequence_ITEM(__pyx_t_2, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 134, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    #endif
+    __Pyx_XGOTREF(__pyx_cur_scope->__pyx_v_name);
+    __Pyx_XDECREF_SET(__pyx_cur_scope->__pyx_v_name, __pyx_t_4);
+    __Pyx_GIVEREF(__pyx_t_4);
+    __pyx_t_4 = 0;
+    __Pyx_INCREF(__pyx_t_1);
+    __Pyx_XGOTREF(__pyx_cur_scope->__pyx_v_place);
+    __Pyx_XDECREF_SET(__pyx_cur_scope->__pyx_v_place, __pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_1);
+    __pyx_t_4 = __Pyx_PyInt_AddObjC(__pyx_t_1, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 134, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1);
+    __pyx_t_1 = __pyx_t_4;
+    __pyx_t_4 = 0;
+    if (unlikely(PyDict_SetItem(__pyx_r, (PyObject*)__pyx_cur_scope->__pyx_v_name, (PyObject*)__pyx_cur_scope->__pyx_v_place))) __PYX_ERR(0, 134, __pyx_L1_error)
   }
-  __pyx_t_1 = PyTuple_GET_SIZE(__pyx_cur_scope->__pyx_v_word); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 126, __pyx_L1_error)
-  __pyx_cur_scope->__pyx_v_length = __pyx_t_1;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  CYTHON_MAYBE_UNUSED_VAR(__pyx_cur_scope);
 
-  /* "bundler/extensions/FSM.pyx":127
- *         cdef int state = 0
- *         cdef int length = len(word)
- *         cdef int i = 0             # <<<<<<<<<<<<<<
- *         for _ in range(length if run < 0 else run):
- *             i += 1
- */
-  __pyx_cur_scope->__pyx_v_i = 0;
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_r); __pyx_r = 0;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("genexpr", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  #if !CYTHON_USE_EXC_INFO_STACK
+  __Pyx_Coroutine_ResetAndClearException(__pyx_generator);
+  #endif
+  __pyx_generator->resume_label = -1;
+  __Pyx_Coroutine_clear((PyObject*)__pyx_generator);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+static PyObject *__pyx_gb_7bundler_10extensions_3FSM_3FSM_10from_dicts_5generator4(__pyx_CoroutineObject *__pyx_generator, CYTHON_UNUSED PyThreadState *__pyx_tstate, PyObject *__pyx_sent_value); /* proto */
 
-  /* "bundler/extensions/FSM.pyx":128
- *         cdef int length = len(word)
- *         cdef int i = 0
- *         for _ in range(length if run < 0 else run):             # <<<<<<<<<<<<<<
- *             i += 1
- *             state = self.machine.data.as_ints[state * self.alphabet_len + word[index]]
+/* "bundler/extensions/FSM.pyx":137
+ *         flattened_machine = [state_names_index.get(machine[state_name][letter], -1) for state_name in state_names for letter in alphabet]
+ * 
+ *         return cls(alphabet, flattened_machine, dict((state_names_index[state], hits[state]) for state in hits))             # <<<<<<<<<<<<<<
+ * 
+ *     def __reduce__(self):
  */
-  if (((__pyx_cur_scope->__pyx_v_run < 0) != 0)) {
-    __pyx_t_2 = __pyx_cur_scope->__pyx_v_length;
+
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_10from_dicts_3genexpr(PyObject *__pyx_self) {
+  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_6_genexpr *__pyx_cur_scope;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("genexpr", 0);
+  __pyx_cur_scope = (struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_6_genexpr *)__pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct_6_genexpr(__pyx_ptype_7bundler_10extensions_3FSM___pyx_scope_struct_6_genexpr, __pyx_empty_tuple, NULL);
+  if (unlikely(!__pyx_cur_scope)) {
+    __pyx_cur_scope = ((struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_6_genexpr *)Py_None);
+    __Pyx_INCREF(Py_None);
+    __PYX_ERR(0, 137, __pyx_L1_error)
   } else {
-    __pyx_t_2 = __pyx_cur_scope->__pyx_v_run;
+    __Pyx_GOTREF(__pyx_cur_scope);
+  }
+  __pyx_cur_scope->__pyx_outer_scope = (struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts *) __pyx_self;
+  __Pyx_INCREF(((PyObject *)__pyx_cur_scope->__pyx_outer_scope));
+  __Pyx_GIVEREF(__pyx_cur_scope->__pyx_outer_scope);
+  {
+    __pyx_CoroutineObject *gen = __Pyx_Generator_New((__pyx_coroutine_body_t) __pyx_gb_7bundler_10extensions_3FSM_3FSM_10from_dicts_5generator4, NULL, (PyObject *) __pyx_cur_scope, __pyx_n_s_genexpr, __pyx_n_s_from_dicts_locals_genexpr, __pyx_n_s_bundler_extensions_FSM); if (unlikely(!gen)) __PYX_ERR(0, 137, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_cur_scope);
+    __Pyx_RefNannyFinishContext();
+    return (PyObject *) gen;
   }
-  __pyx_t_3 = __pyx_t_2;
-  for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
-    __pyx_cur_scope->__pyx_v__ = __pyx_t_4;
-
-    /* "bundler/extensions/FSM.pyx":129
- *         cdef int i = 0
- *         for _ in range(length if run < 0 else run):
- *             i += 1             # <<<<<<<<<<<<<<
- *             state = self.machine.data.as_ints[state * self.alphabet_len + word[index]]
- *             if state < 0:
- */
-    __pyx_cur_scope->__pyx_v_i = (__pyx_cur_scope->__pyx_v_i + 1);
-
-    /* "bundler/extensions/FSM.pyx":130
- *         for _ in range(length if run < 0 else run):
- *             i += 1
- *             state = self.machine.data.as_ints[state * self.alphabet_len + word[index]]             # <<<<<<<<<<<<<<
- *             if state < 0:
- *                 raise ValueError('Invalid transition to state {}'.format(state))
- */
-    __pyx_t_5 = __Pyx_PyInt_From_int((__pyx_cur_scope->__pyx_v_state * __pyx_cur_scope->__pyx_v_self->alphabet_len)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 130, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    if (unlikely(__pyx_cur_scope->__pyx_v_word == Py_None)) {
-      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-      __PYX_ERR(0, 130, __pyx_L1_error)
-    }
-    __pyx_t_6 = __Pyx_GetItemInt_Tuple(__pyx_cur_scope->__pyx_v_word, __pyx_cur_scope->__pyx_v_index, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 130, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_7 = PyNumber_Add(__pyx_t_5, __pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 130, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __pyx_t_1 = __Pyx_PyIndex_AsSsize_t(__pyx_t_7); if (unlikely((__pyx_t_1 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 130, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    __pyx_cur_scope->__pyx_v_state = (__pyx_cur_scope->__pyx_v_self->machine->data.as_ints[__pyx_t_1]);
 
-    /* "bundler/extensions/FSM.pyx":131
- *             i += 1
- *             state = self.machine.data.as_ints[state * self.alphabet_len + word[index]]
- *             if state < 0:             # <<<<<<<<<<<<<<
- *                 raise ValueError('Invalid transition to state {}'.format(state))
- *             for x in self.yield_states.get(state, []):
- */
-    __pyx_t_8 = ((__pyx_cur_scope->__pyx_v_state < 0) != 0);
-    if (unlikely(__pyx_t_8)) {
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("bundler.extensions.FSM.FSM.from_dicts.genexpr", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_DECREF(((PyObject *)__pyx_cur_scope));
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-      /* "bundler/extensions/FSM.pyx":132
- *             state = self.machine.data.as_ints[state * self.alphabet_len + word[index]]
- *             if state < 0:
- *                 raise ValueError('Invalid transition to state {}'.format(state))             # <<<<<<<<<<<<<<
- *             for x in self.yield_states.get(state, []):
- *                 yield (i, x)
- */
-      __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_Invalid_transition_to_state, __pyx_n_s_format); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 132, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_6);
-      __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_cur_scope->__pyx_v_state); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 132, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_5);
-      __pyx_t_9 = NULL;
-      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
-        __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_6);
-        if (likely(__pyx_t_9)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
-          __Pyx_INCREF(__pyx_t_9);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_6, function);
-        }
-      }
-      __pyx_t_7 = (__pyx_t_9) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_9, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_t_5);
-      __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 132, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_7);
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __pyx_t_6 = __Pyx_PyObject_CallOneArg(__pyx_builtin_ValueError, __pyx_t_7); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 132, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_6);
-      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-      __Pyx_Raise(__pyx_t_6, 0, 0, 0);
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __PYX_ERR(0, 132, __pyx_L1_error)
-
-      /* "bundler/extensions/FSM.pyx":131
- *             i += 1
- *             state = self.machine.data.as_ints[state * self.alphabet_len + word[index]]
- *             if state < 0:             # <<<<<<<<<<<<<<
- *                 raise ValueError('Invalid transition to state {}'.format(state))
- *             for x in self.yield_states.get(state, []):
- */
-    }
-
-    /* "bundler/extensions/FSM.pyx":133
- *             if state < 0:
- *                 raise ValueError('Invalid transition to state {}'.format(state))
- *             for x in self.yield_states.get(state, []):             # <<<<<<<<<<<<<<
- *                 yield (i, x)
- *             index += 1
- */
-    if (unlikely(__pyx_cur_scope->__pyx_v_self->yield_states == Py_None)) {
-      PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "get");
-      __PYX_ERR(0, 133, __pyx_L1_error)
+static PyObject *__pyx_gb_7bundler_10extensions_3FSM_3FSM_10from_dicts_5generator4(__pyx_CoroutineObject *__pyx_generator, CYTHON_UNUSED PyThreadState *__pyx_tstate, PyObject *__pyx_sent_value) /* generator body */
+{
+  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_6_genexpr *__pyx_cur_scope = ((struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_6_genexpr *)__pyx_generator->closure);
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  Py_ssize_t __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("genexpr", 0);
+  switch (__pyx_generator->resume_label) {
+    case 0: goto __pyx_L3_first_run;
+    default: /* CPython raises the right error here */
+    __Pyx_RefNannyFinishContext();
+    return NULL;
+  }
+  __pyx_L3_first_run:;
+  if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 137, __pyx_L1_error)
+  __pyx_r = PyDict_New(); if (unlikely(!__pyx_r)) __PYX_ERR(0, 137, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_r);
+  __pyx_t_2 = 0;
+  if (unlikely(!__pyx_cur_scope->__pyx_outer_scope->__pyx_v_hits)) { __Pyx_RaiseClosureNameError("hits"); __PYX_ERR(0, 137, __pyx_L1_error) }
+  if (unlikely(__pyx_cur_scope->__pyx_outer_scope->__pyx_v_hits == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
+    __PYX_ERR(0, 137, __pyx_L1_error)
+  }
+  __pyx_t_5 = __Pyx_dict_iterator(__pyx_cur_scope->__pyx_outer_scope->__pyx_v_hits, 1, ((PyObject *)NULL), (&__pyx_t_3), (&__pyx_t_4)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 137, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_1);
+  __pyx_t_1 = __pyx_t_5;
+  __pyx_t_5 = 0;
+  while (1) {
+    __pyx_t_6 = __Pyx_dict_iter_next(__pyx_t_1, __pyx_t_3, &__pyx_t_2, &__pyx_t_5, NULL, NULL, __pyx_t_4);
+    if (unlikely(__pyx_t_6 == 0)) break;
+    if (unlikely(__pyx_t_6 == -1)) __PYX_ERR(0, 137, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_XGOTREF(__pyx_cur_scope->__pyx_v_state);
+    __Pyx_XDECREF_SET(__pyx_cur_scope->__pyx_v_state, __pyx_t_5);
+    __Pyx_GIVEREF(__pyx_t_5);
+    __pyx_t_5 = 0;
+    if (unlikely(!__pyx_cur_scope->__pyx_outer_scope->__pyx_v_state_names_index)) { __Pyx_RaiseClosureNameError("state_names_index"); __PYX_ERR(0, 137, __pyx_L1_error) }
+    if (unlikely(__pyx_cur_scope->__pyx_outer_scope->__pyx_v_state_names_index == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(0, 137, __pyx_L1_error)
     }
-    __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_cur_scope->__pyx_v_state); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 133, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_7 = PyList_New(0); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 133, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
-    __pyx_t_5 = __Pyx_PyDict_GetItemDefault(__pyx_cur_scope->__pyx_v_self->yield_states, __pyx_t_6, __pyx_t_7); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 133, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyDict_GetItem(__pyx_cur_scope->__pyx_outer_scope->__pyx_v_state_names_index, __pyx_cur_scope->__pyx_v_state); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 137, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    if (likely(PyList_CheckExact(__pyx_t_5)) || PyTuple_CheckExact(__pyx_t_5)) {
-      __pyx_t_7 = __pyx_t_5; __Pyx_INCREF(__pyx_t_7); __pyx_t_1 = 0;
-      __pyx_t_10 = NULL;
-    } else {
-      __pyx_t_1 = -1; __pyx_t_7 = PyObject_GetIter(__pyx_t_5); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 133, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_7);
-      __pyx_t_10 = Py_TYPE(__pyx_t_7)->tp_iternext; if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 133, __pyx_L1_error)
+    if (unlikely(!__pyx_cur_scope->__pyx_outer_scope->__pyx_v_hits)) { __Pyx_RaiseClosureNameError("hits"); __PYX_ERR(0, 137, __pyx_L1_error) }
+    if (unlikely(__pyx_cur_scope->__pyx_outer_scope->__pyx_v_hits == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(0, 137, __pyx_L1_error)
     }
+    __pyx_t_7 = __Pyx_PyDict_GetItem(__pyx_cur_scope->__pyx_outer_scope->__pyx_v_hits, __pyx_cur_scope->__pyx_v_state); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 137, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    if (unlikely(PyDict_SetItem(__pyx_r, (PyObject*)__pyx_t_5, (PyObject*)__pyx_t_7))) __PYX_ERR(0, 137, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    for (;;) {
-      if (likely(!__pyx_t_10)) {
-        if (likely(PyList_CheckExact(__pyx_t_7))) {
-          if (__pyx_t_1 >= PyList_GET_SIZE(__pyx_t_7)) break;
-          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-          __pyx_t_5 = PyList_GET_ITEM(__pyx_t_7, __pyx_t_1); __Pyx_INCREF(__pyx_t_5); __pyx_t_1++; if (unlikely(0 < 0)) __PYX_ERR(0, 133, __pyx_L1_error)
-          #else
-          __pyx_t_5 = PySequence_ITEM(__pyx_t_7, __pyx_t_1); __pyx_t_1++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 133, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_5);
-          #endif
-        } else {
-          if (__pyx_t_1 >= PyTuple_GET_SIZE(__pyx_t_7)) break;
-          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-          __pyx_t_5 = PyTuple_GET_ITEM(__pyx_t_7, __pyx_t_1); __Pyx_INCREF(__pyx_t_5); __pyx_t_1++; if (unlikely(0 < 0)) __PYX_ERR(0, 133, __pyx_L1_error)
-          #else
-          __pyx_t_5 = PySequence_ITEM(__pyx_t_7, __pyx_t_1); __pyx_t_1++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 133, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_5);
-          #endif
-        }
-      } else {
-        __pyx_t_5 = __pyx_t_10(__pyx_t_7);
-        if (unlikely(!__pyx_t_5)) {
-          PyObject* exc_type = PyErr_Occurred();
-          if (exc_type) {
-            if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-            else __PYX_ERR(0, 133, __pyx_L1_error)
-          }
-          break;
-        }
-        __Pyx_GOTREF(__pyx_t_5);
-      }
-      __Pyx_XGOTREF(__pyx_cur_scope->__pyx_v_x);
-      __Pyx_XDECREF_SET(__pyx_cur_scope->__pyx_v_x, __pyx_t_5);
-      __Pyx_GIVEREF(__pyx_t_5);
-      __pyx_t_5 = 0;
-
-      /* "bundler/extensions/FSM.pyx":134
- *                 raise ValueError('Invalid transition to state {}'.format(state))
- *             for x in self.yield_states.get(state, []):
- *                 yield (i, x)             # <<<<<<<<<<<<<<
- *             index += 1
- *             if index == length: index = 0
- */
-      __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_cur_scope->__pyx_v_i); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 134, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_5);
-      __pyx_t_6 = PyTuple_New(2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 134, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_6);
-      __Pyx_GIVEREF(__pyx_t_5);
-      PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_5);
-      __Pyx_INCREF(__pyx_cur_scope->__pyx_v_x);
-      __Pyx_GIVEREF(__pyx_cur_scope->__pyx_v_x);
-      PyTuple_SET_ITEM(__pyx_t_6, 1, __pyx_cur_scope->__pyx_v_x);
-      __pyx_t_5 = 0;
-      __pyx_r = __pyx_t_6;
-      __pyx_t_6 = 0;
-      __pyx_cur_scope->__pyx_t_0 = __pyx_t_1;
-      __pyx_cur_scope->__pyx_t_1 = __pyx_t_2;
-      __pyx_cur_scope->__pyx_t_2 = __pyx_t_3;
-      __pyx_cur_scope->__pyx_t_3 = __pyx_t_4;
-      __Pyx_XGIVEREF(__pyx_t_7);
-      __pyx_cur_scope->__pyx_t_4 = __pyx_t_7;
-      __pyx_cur_scope->__pyx_t_5 = __pyx_t_10;
-      __Pyx_XGIVEREF(__pyx_r);
-      __Pyx_RefNannyFinishContext();
-      __Pyx_Coroutine_ResetAndClearException(__pyx_generator);
-      /* return from generator, yielding value */
-      __pyx_generator->resume_label = 1;
-      return __pyx_r;
-      __pyx_L9_resume_from_yield:;
-      __pyx_t_1 = __pyx_cur_scope->__pyx_t_0;
-      __pyx_t_2 = __pyx_cur_scope->__pyx_t_1;
-      __pyx_t_3 = __pyx_cur_scope->__pyx_t_2;
-      __pyx_t_4 = __pyx_cur_scope->__pyx_t_3;
-      __pyx_t_7 = __pyx_cur_scope->__pyx_t_4;
-      __pyx_cur_scope->__pyx_t_4 = 0;
-      __Pyx_XGOTREF(__pyx_t_7);
-      __pyx_t_10 = __pyx_cur_scope->__pyx_t_5;
-      if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 134, __pyx_L1_error)
-
-      /* "bundler/extensions/FSM.pyx":133
- *             if state < 0:
- *                 raise ValueError('Invalid transition to state {}'.format(state))
- *             for x in self.yield_states.get(state, []):             # <<<<<<<<<<<<<<
- *                 yield (i, x)
- *             index += 1
- */
-    }
     __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-
-    /* "bundler/extensions/FSM.pyx":135
- *             for x in self.yield_states.get(state, []):
- *                 yield (i, x)
- *             index += 1             # <<<<<<<<<<<<<<
- *             if index == length: index = 0
- * 
- */
-    __pyx_cur_scope->__pyx_v_index = (__pyx_cur_scope->__pyx_v_index + 1);
-
-    /* "bundler/extensions/FSM.pyx":136
- *                 yield (i, x)
- *             index += 1
- *             if index == length: index = 0             # <<<<<<<<<<<<<<
- * 
- *     def has_cycle(self, tuple word, int depth=-1):
- */
-    __pyx_t_8 = ((__pyx_cur_scope->__pyx_v_index == __pyx_cur_scope->__pyx_v_length) != 0);
-    if (__pyx_t_8) {
-      __pyx_cur_scope->__pyx_v_index = 0;
-    }
   }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   CYTHON_MAYBE_UNUSED_VAR(__pyx_cur_scope);
 
-  /* "bundler/extensions/FSM.pyx":122
- *         return returns
- * 
- *     def hits(self, tuple word, int run=-1):             # <<<<<<<<<<<<<<
- *         ''' Process word and yield (index, x) for all states that word hits that have things to yield. '''
- *         cdef int index = 0, letter
- */
-
   /* function exit code */
-  PyErr_SetNone(PyExc_StopIteration);
   goto __pyx_L0;
   __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_r); __pyx_r = 0;
+  __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
   __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_XDECREF(__pyx_t_9);
-  __Pyx_AddTraceback("hits", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("genexpr", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_L0:;
-  __Pyx_XDECREF(__pyx_r); __pyx_r = 0;
+  __Pyx_XGIVEREF(__pyx_r);
   #if !CYTHON_USE_EXC_INFO_STACK
   __Pyx_Coroutine_ResetAndClearException(__pyx_generator);
   #endif
@@ -5186,1164 +5011,10148 @@ static PyObject *__pyx_gb_7bundler_10extensions_3FSM_3FSM_14generator(__pyx_Coro
   return __pyx_r;
 }
 
-/* "bundler/extensions/FSM.pyx":138
- *             if index == length: index = 0
+/* "bundler/extensions/FSM.pyx":128
+ * 
+ *     @classmethod
+ *     def from_dicts(cls, list alphabet, object machine, dict hits):             # <<<<<<<<<<<<<<
+ *         ''' Build a cFSM from an ordered dictionary of dictionaries and a dictionary mapping states to hits. '''
  * 
- *     def has_cycle(self, tuple word, int depth=-1):             # <<<<<<<<<<<<<<
- *         ''' Return whether there is a state such that self(word, state) == state. '''
- *         cdef array.array converted_word = array.array('i', word)
  */
 
-/* Python wrapper */
-static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_16has_cycle(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_7bundler_10extensions_3FSM_3FSM_15has_cycle[] = " Return whether there is a state such that self(word, state) == state. ";
-static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_16has_cycle(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_word = 0;
-  int __pyx_v_depth;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("has_cycle (wrapper)", 0);
-  {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_word,&__pyx_n_s_depth,0};
-    PyObject* values[2] = {0,0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
-      switch (pos_args) {
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (pos_args) {
-        case  0:
-        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_word)) != 0)) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        CYTHON_FALLTHROUGH;
-        case  1:
-        if (kw_args > 0) {
-          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_depth);
-          if (value) { values[1] = value; kw_args--; }
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "has_cycle") < 0)) __PYX_ERR(0, 138, __pyx_L3_error)
-      }
-    } else {
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-    }
-    __pyx_v_word = ((PyObject*)values[0]);
-    if (values[1]) {
-      __pyx_v_depth = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_depth == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 138, __pyx_L3_error)
-    } else {
-      __pyx_v_depth = ((int)-1);
-    }
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("has_cycle", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 138, __pyx_L3_error)
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("bundler.extensions.FSM.FSM.has_cycle", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_word), (&PyTuple_Type), 1, "word", 1))) __PYX_ERR(0, 138, __pyx_L1_error)
-  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_3FSM_15has_cycle(((struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)__pyx_v_self), __pyx_v_word, __pyx_v_depth);
-
-  /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_15has_cycle(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self, PyObject *__pyx_v_word, int __pyx_v_depth) {
-  arrayobject *__pyx_v_converted_word = 0;
-  int __pyx_v_l;
-  int __pyx_v_c;
-  int __pyx_v_state;
-  int __pyx_v_letter;
-  int __pyx_v_i;
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_4from_dicts(PyTypeObject *__pyx_v_cls, PyObject *__pyx_v_alphabet, PyObject *__pyx_v_machine, PyObject *__pyx_v_hits) {
+  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts *__pyx_cur_scope;
+  PyObject *__pyx_v_flattened_machine = NULL;
+  PyObject *__pyx_gb_7bundler_10extensions_3FSM_3FSM_10from_dicts_2generator3 = 0;
+  PyObject *__pyx_8genexpr6__pyx_v_state_name = NULL;
+  PyObject *__pyx_8genexpr6__pyx_v_letter = NULL;
+  PyObject *__pyx_gb_7bundler_10extensions_3FSM_3FSM_10from_dicts_5generator4 = 0;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  Py_ssize_t __pyx_t_3;
-  int __pyx_t_4;
-  int __pyx_t_5;
-  int __pyx_t_6;
-  int __pyx_t_7;
-  int __pyx_t_8;
-  int __pyx_t_9;
-  int __pyx_t_10;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  Py_ssize_t __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  Py_ssize_t __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("has_cycle", 0);
-
-  /* "bundler/extensions/FSM.pyx":140
- *     def has_cycle(self, tuple word, int depth=-1):
- *         ''' Return whether there is a state such that self(word, state) == state. '''
- *         cdef array.array converted_word = array.array('i', word)             # <<<<<<<<<<<<<<
- *         cdef int l = len(word)
- *         cdef int c, state, letter, i
- */
-  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 140, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(__pyx_n_u_i);
-  __Pyx_GIVEREF(__pyx_n_u_i);
-  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_n_u_i);
-  __Pyx_INCREF(__pyx_v_word);
-  __Pyx_GIVEREF(__pyx_v_word);
-  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_v_word);
-  __pyx_t_2 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_7cpython_5array_array), __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 140, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v_converted_word = ((arrayobject *)__pyx_t_2);
-  __pyx_t_2 = 0;
-
-  /* "bundler/extensions/FSM.pyx":141
- *         ''' Return whether there is a state such that self(word, state) == state. '''
- *         cdef array.array converted_word = array.array('i', word)
- *         cdef int l = len(word)             # <<<<<<<<<<<<<<
- *         cdef int c, state, letter, i
- * 
- */
-  if (unlikely(__pyx_v_word == Py_None)) {
-    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
-    __PYX_ERR(0, 141, __pyx_L1_error)
+  __Pyx_RefNannySetupContext("from_dicts", 0);
+  __pyx_cur_scope = (struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts *)__pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts(__pyx_ptype_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts, __pyx_empty_tuple, NULL);
+  if (unlikely(!__pyx_cur_scope)) {
+    __pyx_cur_scope = ((struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts *)Py_None);
+    __Pyx_INCREF(Py_None);
+    __PYX_ERR(0, 128, __pyx_L1_error)
+  } else {
+    __Pyx_GOTREF(__pyx_cur_scope);
   }
-  __pyx_t_3 = PyTuple_GET_SIZE(__pyx_v_word); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 141, __pyx_L1_error)
-  __pyx_v_l = __pyx_t_3;
+  __pyx_cur_scope->__pyx_v_hits = __pyx_v_hits;
+  __Pyx_INCREF(__pyx_cur_scope->__pyx_v_hits);
+  __Pyx_GIVEREF(__pyx_cur_scope->__pyx_v_hits);
 
-  /* "bundler/extensions/FSM.pyx":144
- *         cdef int c, state, letter, i
+  /* "bundler/extensions/FSM.pyx":131
+ *         ''' Build a cFSM from an ordered dictionary of dictionaries and a dictionary mapping states to hits. '''
  * 
- *         if depth < 0: depth = self.machine_len             # <<<<<<<<<<<<<<
+ *         assert isinstance(machine, OrderedDict)             # <<<<<<<<<<<<<<
  * 
- *         for c in range(depth):
+ *         state_names = list(machine)
  */
-  __pyx_t_4 = ((__pyx_v_depth < 0) != 0);
-  if (__pyx_t_4) {
-    __pyx_t_5 = __pyx_v_self->machine_len;
-    __pyx_v_depth = __pyx_t_5;
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(!Py_OptimizeFlag)) {
+    __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_OrderedDict); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 131, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = PyObject_IsInstance(__pyx_v_machine, __pyx_t_1); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 131, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    if (unlikely(!(__pyx_t_2 != 0))) {
+      PyErr_SetNone(PyExc_AssertionError);
+      __PYX_ERR(0, 131, __pyx_L1_error)
+    }
   }
+  #endif
 
-  /* "bundler/extensions/FSM.pyx":146
- *         if depth < 0: depth = self.machine_len
+  /* "bundler/extensions/FSM.pyx":133
+ *         assert isinstance(machine, OrderedDict)
  * 
- *         for c in range(depth):             # <<<<<<<<<<<<<<
- *             state = c
- *             for i in range(l):
+ *         state_names = list(machine)             # <<<<<<<<<<<<<<
+ *         state_names_index = dict((name, place) for place, name in enumerate(state_names))
+ *         flattened_machine = [state_names_index.get(machine[state_name][letter], -1) for state_name in state_names for letter in alphabet]
  */
-  __pyx_t_5 = __pyx_v_depth;
-  __pyx_t_6 = __pyx_t_5;
-  for (__pyx_t_7 = 0; __pyx_t_7 < __pyx_t_6; __pyx_t_7+=1) {
-    __pyx_v_c = __pyx_t_7;
+  __pyx_t_1 = PySequence_List(__pyx_v_machine); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 133, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __pyx_cur_scope->__pyx_v_state_names = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
 
-    /* "bundler/extensions/FSM.pyx":147
+  /* "bundler/extensions/FSM.pyx":134
  * 
- *         for c in range(depth):
- *             state = c             # <<<<<<<<<<<<<<
- *             for i in range(l):
- *                 letter = converted_word.data.as_ints[i]
- */
-    __pyx_v_state = __pyx_v_c;
-
-    /* "bundler/extensions/FSM.pyx":148
- *         for c in range(depth):
- *             state = c
- *             for i in range(l):             # <<<<<<<<<<<<<<
- *                 letter = converted_word.data.as_ints[i]
- *                 state = self.machine.data.as_ints[state * self.alphabet_len + letter]
- */
-    __pyx_t_8 = __pyx_v_l;
-    __pyx_t_9 = __pyx_t_8;
-    for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
-      __pyx_v_i = __pyx_t_10;
-
-      /* "bundler/extensions/FSM.pyx":149
- *             state = c
- *             for i in range(l):
- *                 letter = converted_word.data.as_ints[i]             # <<<<<<<<<<<<<<
- *                 state = self.machine.data.as_ints[state * self.alphabet_len + letter]
- *                 if state < 0: break
- */
-      __pyx_v_letter = (__pyx_v_converted_word->data.as_ints[__pyx_v_i]);
-
-      /* "bundler/extensions/FSM.pyx":150
- *             for i in range(l):
- *                 letter = converted_word.data.as_ints[i]
- *                 state = self.machine.data.as_ints[state * self.alphabet_len + letter]             # <<<<<<<<<<<<<<
- *                 if state < 0: break
+ *         state_names = list(machine)
+ *         state_names_index = dict((name, place) for place, name in enumerate(state_names))             # <<<<<<<<<<<<<<
+ *         flattened_machine = [state_names_index.get(machine[state_name][letter], -1) for state_name in state_names for letter in alphabet]
  * 
  */
-      __pyx_v_state = (__pyx_v_self->machine->data.as_ints[((__pyx_v_state * __pyx_v_self->alphabet_len) + __pyx_v_letter)]);
+  __pyx_t_1 = __pyx_pf_7bundler_10extensions_3FSM_3FSM_10from_dicts_genexpr(((PyObject*)__pyx_cur_scope)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 134, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = __Pyx_Generator_Next(__pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 134, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_GIVEREF(__pyx_t_3);
+  __pyx_cur_scope->__pyx_v_state_names_index = ((PyObject*)__pyx_t_3);
+  __pyx_t_3 = 0;
 
-      /* "bundler/extensions/FSM.pyx":151
- *                 letter = converted_word.data.as_ints[i]
- *                 state = self.machine.data.as_ints[state * self.alphabet_len + letter]
- *                 if state < 0: break             # <<<<<<<<<<<<<<
+  /* "bundler/extensions/FSM.pyx":135
+ *         state_names = list(machine)
+ *         state_names_index = dict((name, place) for place, name in enumerate(state_names))
+ *         flattened_machine = [state_names_index.get(machine[state_name][letter], -1) for state_name in state_names for letter in alphabet]             # <<<<<<<<<<<<<<
  * 
- *             if state == c:
+ *         return cls(alphabet, flattened_machine, dict((state_names_index[state], hits[state]) for state in hits))
  */
-      __pyx_t_4 = ((__pyx_v_state < 0) != 0);
-      if (__pyx_t_4) {
-        goto __pyx_L7_break;
+  { /* enter inner scope */
+    __pyx_t_3 = PyList_New(0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 135, __pyx_L5_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_1 = __pyx_cur_scope->__pyx_v_state_names; __Pyx_INCREF(__pyx_t_1); __pyx_t_4 = 0;
+    for (;;) {
+      if (__pyx_t_4 >= PyList_GET_SIZE(__pyx_t_1)) break;
+      #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+      __pyx_t_5 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_4); __Pyx_INCREF(__pyx_t_5); __pyx_t_4++; if (unlikely(0 < 0)) __PYX_ERR(0, 135, __pyx_L5_error)
+      #else
+      __pyx_t_5 = PySequence_ITEM(__pyx_t_1, __pyx_t_4); __pyx_t_4++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 135, __pyx_L5_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      #endif
+      __Pyx_XDECREF_SET(__pyx_8genexpr6__pyx_v_state_name, __pyx_t_5);
+      __pyx_t_5 = 0;
+      if (unlikely(__pyx_v_alphabet == Py_None)) {
+        PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
+        __PYX_ERR(0, 135, __pyx_L5_error)
       }
+      __pyx_t_5 = __pyx_v_alphabet; __Pyx_INCREF(__pyx_t_5); __pyx_t_6 = 0;
+      for (;;) {
+        if (__pyx_t_6 >= PyList_GET_SIZE(__pyx_t_5)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_7 = PyList_GET_ITEM(__pyx_t_5, __pyx_t_6); __Pyx_INCREF(__pyx_t_7); __pyx_t_6++; if (unlikely(0 < 0)) __PYX_ERR(0, 135, __pyx_L5_error)
+        #else
+        __pyx_t_7 = PySequence_ITEM(__pyx_t_5, __pyx_t_6); __pyx_t_6++; if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 135, __pyx_L5_error)
+        __Pyx_GOTREF(__pyx_t_7);
+        #endif
+        __Pyx_XDECREF_SET(__pyx_8genexpr6__pyx_v_letter, __pyx_t_7);
+        __pyx_t_7 = 0;
+        if (unlikely(__pyx_cur_scope->__pyx_v_state_names_index == Py_None)) {
+          PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "get");
+          __PYX_ERR(0, 135, __pyx_L5_error)
+        }
+        __pyx_t_7 = __Pyx_PyObject_GetItem(__pyx_v_machine, __pyx_8genexpr6__pyx_v_state_name); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 135, __pyx_L5_error)
+        __Pyx_GOTREF(__pyx_t_7);
+        __pyx_t_8 = __Pyx_PyObject_GetItem(__pyx_t_7, __pyx_8genexpr6__pyx_v_letter); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 135, __pyx_L5_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+        __pyx_t_7 = __Pyx_PyDict_GetItemDefault(__pyx_cur_scope->__pyx_v_state_names_index, __pyx_t_8, __pyx_int_neg_1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 135, __pyx_L5_error)
+        __Pyx_GOTREF(__pyx_t_7);
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        if (unlikely(__Pyx_ListComp_Append(__pyx_t_3, (PyObject*)__pyx_t_7))) __PYX_ERR(0, 135, __pyx_L5_error)
+        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      }
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     }
-    __pyx_L7_break:;
-
-    /* "bundler/extensions/FSM.pyx":153
- *                 if state < 0: break
- * 
- *             if state == c:             # <<<<<<<<<<<<<<
- *                 return True
- * 
- */
-    __pyx_t_4 = ((__pyx_v_state == __pyx_v_c) != 0);
-    if (__pyx_t_4) {
-
-      /* "bundler/extensions/FSM.pyx":154
- * 
- *             if state == c:
- *                 return True             # <<<<<<<<<<<<<<
- * 
- *         return False
- */
-      __Pyx_XDECREF(__pyx_r);
-      __Pyx_INCREF(Py_True);
-      __pyx_r = Py_True;
-      goto __pyx_L0;
-
-      /* "bundler/extensions/FSM.pyx":153
- *                 if state < 0: break
- * 
- *             if state == c:             # <<<<<<<<<<<<<<
- *                 return True
- * 
- */
-    }
-  }
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_XDECREF(__pyx_8genexpr6__pyx_v_letter); __pyx_8genexpr6__pyx_v_letter = 0;
+    __Pyx_XDECREF(__pyx_8genexpr6__pyx_v_state_name); __pyx_8genexpr6__pyx_v_state_name = 0;
+    goto __pyx_L10_exit_scope;
+    __pyx_L5_error:;
+    __Pyx_XDECREF(__pyx_8genexpr6__pyx_v_letter); __pyx_8genexpr6__pyx_v_letter = 0;
+    __Pyx_XDECREF(__pyx_8genexpr6__pyx_v_state_name); __pyx_8genexpr6__pyx_v_state_name = 0;
+    goto __pyx_L1_error;
+    __pyx_L10_exit_scope:;
+  } /* exit inner scope */
+  __pyx_v_flattened_machine = ((PyObject*)__pyx_t_3);
+  __pyx_t_3 = 0;
 
-  /* "bundler/extensions/FSM.pyx":156
- *                 return True
+  /* "bundler/extensions/FSM.pyx":137
+ *         flattened_machine = [state_names_index.get(machine[state_name][letter], -1) for state_name in state_names for letter in alphabet]
  * 
- *         return False             # <<<<<<<<<<<<<<
+ *         return cls(alphabet, flattened_machine, dict((state_names_index[state], hits[state]) for state in hits))             # <<<<<<<<<<<<<<
  * 
+ *     def __reduce__(self):
  */
   __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(Py_False);
-  __pyx_r = Py_False;
+  __pyx_t_3 = __pyx_pf_7bundler_10extensions_3FSM_3FSM_10from_dicts_3genexpr(((PyObject*)__pyx_cur_scope)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 137, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_1 = __Pyx_Generator_Next(__pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 137, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 137, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_INCREF(__pyx_v_alphabet);
+  __Pyx_GIVEREF(__pyx_v_alphabet);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_alphabet);
+  __Pyx_INCREF(__pyx_v_flattened_machine);
+  __Pyx_GIVEREF(__pyx_v_flattened_machine);
+  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_v_flattened_machine);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_t_1);
+  __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_v_cls), __pyx_t_3, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 137, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "bundler/extensions/FSM.pyx":138
- *             if index == length: index = 0
+  /* "bundler/extensions/FSM.pyx":128
+ * 
+ *     @classmethod
+ *     def from_dicts(cls, list alphabet, object machine, dict hits):             # <<<<<<<<<<<<<<
+ *         ''' Build a cFSM from an ordered dictionary of dictionaries and a dictionary mapping states to hits. '''
  * 
- *     def has_cycle(self, tuple word, int depth=-1):             # <<<<<<<<<<<<<<
- *         ''' Return whether there is a state such that self(word, state) == state. '''
- *         cdef array.array converted_word = array.array('i', word)
  */
 
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("bundler.extensions.FSM.FSM.has_cycle", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("bundler.extensions.FSM.FSM.from_dicts", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
-  __Pyx_XDECREF((PyObject *)__pyx_v_converted_word);
+  __Pyx_XDECREF(__pyx_v_flattened_machine);
+  __Pyx_XDECREF(__pyx_gb_7bundler_10extensions_3FSM_3FSM_10from_dicts_2generator3);
+  __Pyx_XDECREF(__pyx_8genexpr6__pyx_v_state_name);
+  __Pyx_XDECREF(__pyx_8genexpr6__pyx_v_letter);
+  __Pyx_XDECREF(__pyx_gb_7bundler_10extensions_3FSM_3FSM_10from_dicts_5generator4);
+  __Pyx_DECREF(((PyObject *)__pyx_cur_scope));
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "array.pxd":93
- *             __data_union data
+/* "bundler/extensions/FSM.pyx":139
+ *         return cls(alphabet, flattened_machine, dict((state_names_index[state], hits[state]) for state in hits))
+ * 
+ *     def __reduce__(self):             # <<<<<<<<<<<<<<
+ *         return (self.__class__, (self.alphabet, self.machine, self.yield_states, self.distance_to_yield))
  * 
- *         def __getbuffer__(self, Py_buffer* info, int flags):             # <<<<<<<<<<<<<<
- *             # This implementation of getbuffer is geared towards Cython
- *             # requirements, and does not yet fulfill the PEP.
  */
 
 /* Python wrapper */
-static CYTHON_UNUSED int __pyx_pw_7cpython_5array_5array_1__getbuffer__(PyObject *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags); /*proto*/
-static CYTHON_UNUSED int __pyx_pw_7cpython_5array_5array_1__getbuffer__(PyObject *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags) {
-  int __pyx_r;
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_7__reduce__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_7__reduce__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__getbuffer__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_7cpython_5array_5array___getbuffer__(((arrayobject *)__pyx_v_self), ((Py_buffer *)__pyx_v_info), ((int)__pyx_v_flags));
+  __Pyx_RefNannySetupContext("__reduce__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_3FSM_6__reduce__(((struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static int __pyx_pf_7cpython_5array_5array___getbuffer__(arrayobject *__pyx_v_self, Py_buffer *__pyx_v_info, CYTHON_UNUSED int __pyx_v_flags) {
-  PyObject *__pyx_v_item_count = NULL;
-  int __pyx_r;
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_6__reduce__(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  char *__pyx_t_2;
-  int __pyx_t_3;
-  PyObject *__pyx_t_4 = NULL;
-  Py_ssize_t __pyx_t_5;
-  int __pyx_t_6;
-  char __pyx_t_7;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  if (__pyx_v_info == NULL) {
-    PyErr_SetString(PyExc_BufferError, "PyObject_GetBuffer: view==NULL argument is obsolete");
-    return -1;
-  }
-  __Pyx_RefNannySetupContext("__getbuffer__", 0);
-  __pyx_v_info->obj = Py_None; __Pyx_INCREF(Py_None);
-  __Pyx_GIVEREF(__pyx_v_info->obj);
+  __Pyx_RefNannySetupContext("__reduce__", 0);
 
-  /* "array.pxd":98
- *             # In particular strided access is always provided regardless
- *             # of flags
- *             item_count = Py_SIZE(self)             # <<<<<<<<<<<<<<
+  /* "bundler/extensions/FSM.pyx":140
  * 
- *             info.suboffsets = NULL
+ *     def __reduce__(self):
+ *         return (self.__class__, (self.alphabet, self.machine, self.yield_states, self.distance_to_yield))             # <<<<<<<<<<<<<<
+ * 
+ *     def __call__(self, tuple word, int state=0):
  */
-  __pyx_t_1 = PyInt_FromSsize_t(Py_SIZE(((PyObject *)__pyx_v_self))); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 98, __pyx_L1_error)
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_class); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 140, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_item_count = __pyx_t_1;
+  __pyx_t_2 = PyTuple_New(4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 140, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_v_self->alphabet);
+  __Pyx_GIVEREF(__pyx_v_self->alphabet);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_self->alphabet);
+  __Pyx_INCREF(((PyObject *)__pyx_v_self->machine));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_self->machine));
+  PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_v_self->machine));
+  __Pyx_INCREF(__pyx_v_self->yield_states);
+  __Pyx_GIVEREF(__pyx_v_self->yield_states);
+  PyTuple_SET_ITEM(__pyx_t_2, 2, __pyx_v_self->yield_states);
+  __Pyx_INCREF(__pyx_v_self->distance_to_yield);
+  __Pyx_GIVEREF(__pyx_v_self->distance_to_yield);
+  PyTuple_SET_ITEM(__pyx_t_2, 3, __pyx_v_self->distance_to_yield);
+  __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 140, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_2);
   __pyx_t_1 = 0;
+  __pyx_t_2 = 0;
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
 
-  /* "array.pxd":100
- *             item_count = Py_SIZE(self)
+  /* "bundler/extensions/FSM.pyx":139
+ *         return cls(alphabet, flattened_machine, dict((state_names_index[state], hits[state]) for state in hits))
  * 
- *             info.suboffsets = NULL             # <<<<<<<<<<<<<<
- *             info.buf = self.data.as_chars
- *             info.readonly = 0
- */
-  __pyx_v_info->suboffsets = NULL;
-
-  /* "array.pxd":101
+ *     def __reduce__(self):             # <<<<<<<<<<<<<<
+ *         return (self.__class__, (self.alphabet, self.machine, self.yield_states, self.distance_to_yield))
  * 
- *             info.suboffsets = NULL
- *             info.buf = self.data.as_chars             # <<<<<<<<<<<<<<
- *             info.readonly = 0
- *             info.ndim = 1
  */
-  __pyx_t_2 = __pyx_v_self->data.as_chars;
-  __pyx_v_info->buf = __pyx_t_2;
 
-  /* "array.pxd":102
- *             info.suboffsets = NULL
- *             info.buf = self.data.as_chars
- *             info.readonly = 0             # <<<<<<<<<<<<<<
- *             info.ndim = 1
- *             info.itemsize = self.ob_descr.itemsize   # e.g. sizeof(float)
- */
-  __pyx_v_info->readonly = 0;
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("bundler.extensions.FSM.FSM.__reduce__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-  /* "array.pxd":103
- *             info.buf = self.data.as_chars
- *             info.readonly = 0
- *             info.ndim = 1             # <<<<<<<<<<<<<<
- *             info.itemsize = self.ob_descr.itemsize   # e.g. sizeof(float)
- *             info.len = info.itemsize * item_count
+/* "bundler/extensions/FSM.pyx":142
+ *         return (self.__class__, (self.alphabet, self.machine, self.yield_states, self.distance_to_yield))
+ * 
+ *     def __call__(self, tuple word, int state=0):             # <<<<<<<<<<<<<<
+ *         cdef int letter
+ *         for letter in word:
  */
-  __pyx_v_info->ndim = 1;
 
-  /* "array.pxd":104
- *             info.readonly = 0
- *             info.ndim = 1
- *             info.itemsize = self.ob_descr.itemsize   # e.g. sizeof(float)             # <<<<<<<<<<<<<<
- *             info.len = info.itemsize * item_count
- * 
+/* Python wrapper */
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_9__call__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_9__call__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_word = 0;
+  int __pyx_v_state;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__call__ (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_word,&__pyx_n_s_state,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_word)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_state);
+          if (value) { values[1] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__call__") < 0)) __PYX_ERR(0, 142, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_word = ((PyObject*)values[0]);
+    if (values[1]) {
+      __pyx_v_state = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_state == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 142, __pyx_L3_error)
+    } else {
+      __pyx_v_state = ((int)0);
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__call__", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 142, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("bundler.extensions.FSM.FSM.__call__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_word), (&PyTuple_Type), 1, "word", 1))) __PYX_ERR(0, 142, __pyx_L1_error)
+  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_3FSM_8__call__(((struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)__pyx_v_self), __pyx_v_word, __pyx_v_state);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_8__call__(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self, PyObject *__pyx_v_word, int __pyx_v_state) {
+  int __pyx_v_letter;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  Py_ssize_t __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__call__", 0);
+
+  /* "bundler/extensions/FSM.pyx":144
+ *     def __call__(self, tuple word, int state=0):
+ *         cdef int letter
+ *         for letter in word:             # <<<<<<<<<<<<<<
+ *             state = step(self, state, letter)
+ *             if state < 0:
  */
-  __pyx_t_3 = __pyx_v_self->ob_descr->itemsize;
-  __pyx_v_info->itemsize = __pyx_t_3;
+  if (unlikely(__pyx_v_word == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
+    __PYX_ERR(0, 144, __pyx_L1_error)
+  }
+  __pyx_t_1 = __pyx_v_word; __Pyx_INCREF(__pyx_t_1); __pyx_t_2 = 0;
+  for (;;) {
+    if (__pyx_t_2 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_3); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 144, __pyx_L1_error)
+    #else
+    __pyx_t_3 = PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 144, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    #endif
+    __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_t_3); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 144, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_v_letter = __pyx_t_4;
 
-  /* "array.pxd":105
- *             info.ndim = 1
- *             info.itemsize = self.ob_descr.itemsize   # e.g. sizeof(float)
- *             info.len = info.itemsize * item_count             # <<<<<<<<<<<<<<
- * 
- *             info.shape = <Py_ssize_t*> PyObject_Malloc(sizeof(Py_ssize_t) + 2)
+    /* "bundler/extensions/FSM.pyx":145
+ *         cdef int letter
+ *         for letter in word:
+ *             state = step(self, state, letter)             # <<<<<<<<<<<<<<
+ *             if state < 0:
+ *                 raise ValueError('Invalid transition to state {}'.format(state))
  */
-  __pyx_t_1 = PyInt_FromSsize_t(__pyx_v_info->itemsize); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 105, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_4 = PyNumber_Multiply(__pyx_t_1, __pyx_v_item_count); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 105, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_5 = __Pyx_PyIndex_AsSsize_t(__pyx_t_4); if (unlikely((__pyx_t_5 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(1, 105, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_v_info->len = __pyx_t_5;
+    __pyx_v_state = __pyx_f_7bundler_10extensions_3FSM_step(__pyx_v_self, __pyx_v_state, __pyx_v_letter);
 
-  /* "array.pxd":107
- *             info.len = info.itemsize * item_count
+    /* "bundler/extensions/FSM.pyx":146
+ *         for letter in word:
+ *             state = step(self, state, letter)
+ *             if state < 0:             # <<<<<<<<<<<<<<
+ *                 raise ValueError('Invalid transition to state {}'.format(state))
  * 
- *             info.shape = <Py_ssize_t*> PyObject_Malloc(sizeof(Py_ssize_t) + 2)             # <<<<<<<<<<<<<<
- *             if not info.shape:
- *                 raise MemoryError()
  */
-  __pyx_v_info->shape = ((Py_ssize_t *)PyObject_Malloc(((sizeof(Py_ssize_t)) + 2)));
+    __pyx_t_5 = ((__pyx_v_state < 0) != 0);
+    if (unlikely(__pyx_t_5)) {
 
-  /* "array.pxd":108
+      /* "bundler/extensions/FSM.pyx":147
+ *             state = step(self, state, letter)
+ *             if state < 0:
+ *                 raise ValueError('Invalid transition to state {}'.format(state))             # <<<<<<<<<<<<<<
  * 
- *             info.shape = <Py_ssize_t*> PyObject_Malloc(sizeof(Py_ssize_t) + 2)
- *             if not info.shape:             # <<<<<<<<<<<<<<
- *                 raise MemoryError()
- *             info.shape[0] = item_count      # constant regardless of resizing
+ *         return state
  */
-  __pyx_t_6 = ((!(__pyx_v_info->shape != 0)) != 0);
-  if (unlikely(__pyx_t_6)) {
+      __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_Invalid_transition_to_state, __pyx_n_s_format); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 147, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_t_7 = __Pyx_PyInt_From_int(__pyx_v_state); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 147, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      __pyx_t_8 = NULL;
+      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
+        __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_6);
+        if (likely(__pyx_t_8)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+          __Pyx_INCREF(__pyx_t_8);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_6, function);
+        }
+      }
+      __pyx_t_3 = (__pyx_t_8) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_8, __pyx_t_7) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_t_7);
+      __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 147, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __pyx_t_6 = __Pyx_PyObject_CallOneArg(__pyx_builtin_ValueError, __pyx_t_3); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 147, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_Raise(__pyx_t_6, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __PYX_ERR(0, 147, __pyx_L1_error)
 
-    /* "array.pxd":109
- *             info.shape = <Py_ssize_t*> PyObject_Malloc(sizeof(Py_ssize_t) + 2)
- *             if not info.shape:
- *                 raise MemoryError()             # <<<<<<<<<<<<<<
- *             info.shape[0] = item_count      # constant regardless of resizing
- *             info.strides = &info.itemsize
+      /* "bundler/extensions/FSM.pyx":146
+ *         for letter in word:
+ *             state = step(self, state, letter)
+ *             if state < 0:             # <<<<<<<<<<<<<<
+ *                 raise ValueError('Invalid transition to state {}'.format(state))
+ * 
  */
-    PyErr_NoMemory(); __PYX_ERR(1, 109, __pyx_L1_error)
+    }
 
-    /* "array.pxd":108
- * 
- *             info.shape = <Py_ssize_t*> PyObject_Malloc(sizeof(Py_ssize_t) + 2)
- *             if not info.shape:             # <<<<<<<<<<<<<<
- *                 raise MemoryError()
- *             info.shape[0] = item_count      # constant regardless of resizing
+    /* "bundler/extensions/FSM.pyx":144
+ *     def __call__(self, tuple word, int state=0):
+ *         cdef int letter
+ *         for letter in word:             # <<<<<<<<<<<<<<
+ *             state = step(self, state, letter)
+ *             if state < 0:
  */
   }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "array.pxd":110
- *             if not info.shape:
- *                 raise MemoryError()
- *             info.shape[0] = item_count      # constant regardless of resizing             # <<<<<<<<<<<<<<
- *             info.strides = &info.itemsize
+  /* "bundler/extensions/FSM.pyx":149
+ *                 raise ValueError('Invalid transition to state {}'.format(state))
  * 
- */
-  __pyx_t_5 = __Pyx_PyIndex_AsSsize_t(__pyx_v_item_count); if (unlikely((__pyx_t_5 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(1, 110, __pyx_L1_error)
-  (__pyx_v_info->shape[0]) = __pyx_t_5;
-
-  /* "array.pxd":111
- *                 raise MemoryError()
- *             info.shape[0] = item_count      # constant regardless of resizing
- *             info.strides = &info.itemsize             # <<<<<<<<<<<<<<
+ *         return state             # <<<<<<<<<<<<<<
  * 
- *             info.format = <char*> (info.shape + 1)
+ *     def distance(self, tuple word):
  */
-  __pyx_v_info->strides = (&__pyx_v_info->itemsize);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_state); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 149, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
 
-  /* "array.pxd":113
- *             info.strides = &info.itemsize
+  /* "bundler/extensions/FSM.pyx":142
+ *         return (self.__class__, (self.alphabet, self.machine, self.yield_states, self.distance_to_yield))
  * 
- *             info.format = <char*> (info.shape + 1)             # <<<<<<<<<<<<<<
- *             info.format[0] = self.ob_descr.typecode
- *             info.format[1] = 0
- */
-  __pyx_v_info->format = ((char *)(__pyx_v_info->shape + 1));
-
-  /* "array.pxd":114
- * 
- *             info.format = <char*> (info.shape + 1)
- *             info.format[0] = self.ob_descr.typecode             # <<<<<<<<<<<<<<
- *             info.format[1] = 0
- *             info.obj = self
- */
-  __pyx_t_7 = __pyx_v_self->ob_descr->typecode;
-  (__pyx_v_info->format[0]) = __pyx_t_7;
-
-  /* "array.pxd":115
- *             info.format = <char*> (info.shape + 1)
- *             info.format[0] = self.ob_descr.typecode
- *             info.format[1] = 0             # <<<<<<<<<<<<<<
- *             info.obj = self
- * 
- */
-  (__pyx_v_info->format[1]) = 0;
-
-  /* "array.pxd":116
- *             info.format[0] = self.ob_descr.typecode
- *             info.format[1] = 0
- *             info.obj = self             # <<<<<<<<<<<<<<
- * 
- *         def __releasebuffer__(self, Py_buffer* info):
- */
-  __Pyx_INCREF(((PyObject *)__pyx_v_self));
-  __Pyx_GIVEREF(((PyObject *)__pyx_v_self));
-  __Pyx_GOTREF(__pyx_v_info->obj);
-  __Pyx_DECREF(__pyx_v_info->obj);
-  __pyx_v_info->obj = ((PyObject *)__pyx_v_self);
-
-  /* "array.pxd":93
- *             __data_union data
- * 
- *         def __getbuffer__(self, Py_buffer* info, int flags):             # <<<<<<<<<<<<<<
- *             # This implementation of getbuffer is geared towards Cython
- *             # requirements, and does not yet fulfill the PEP.
+ *     def __call__(self, tuple word, int state=0):             # <<<<<<<<<<<<<<
+ *         cdef int letter
+ *         for letter in word:
  */
 
   /* function exit code */
-  __pyx_r = 0;
-  goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("cpython.array.array.__getbuffer__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = -1;
-  if (__pyx_v_info->obj != NULL) {
-    __Pyx_GOTREF(__pyx_v_info->obj);
-    __Pyx_DECREF(__pyx_v_info->obj); __pyx_v_info->obj = 0;
-  }
-  goto __pyx_L2;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("bundler.extensions.FSM.FSM.__call__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
   __pyx_L0:;
-  if (__pyx_v_info->obj == Py_None) {
-    __Pyx_GOTREF(__pyx_v_info->obj);
-    __Pyx_DECREF(__pyx_v_info->obj); __pyx_v_info->obj = 0;
-  }
-  __pyx_L2:;
-  __Pyx_XDECREF(__pyx_v_item_count);
+  __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "array.pxd":118
- *             info.obj = self
+/* "bundler/extensions/FSM.pyx":151
+ *         return state
  * 
- *         def __releasebuffer__(self, Py_buffer* info):             # <<<<<<<<<<<<<<
- *             PyObject_Free(info.shape)
+ *     def distance(self, tuple word):             # <<<<<<<<<<<<<<
+ *         return self.distance_to_yield[self(word)]
  * 
  */
 
 /* Python wrapper */
-static CYTHON_UNUSED void __pyx_pw_7cpython_5array_5array_3__releasebuffer__(PyObject *__pyx_v_self, Py_buffer *__pyx_v_info); /*proto*/
-static CYTHON_UNUSED void __pyx_pw_7cpython_5array_5array_3__releasebuffer__(PyObject *__pyx_v_self, Py_buffer *__pyx_v_info) {
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_11distance(PyObject *__pyx_v_self, PyObject *__pyx_v_word); /*proto*/
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_11distance(PyObject *__pyx_v_self, PyObject *__pyx_v_word) {
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__releasebuffer__ (wrapper)", 0);
-  __pyx_pf_7cpython_5array_5array_2__releasebuffer__(((arrayobject *)__pyx_v_self), ((Py_buffer *)__pyx_v_info));
+  __Pyx_RefNannySetupContext("distance (wrapper)", 0);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_word), (&PyTuple_Type), 1, "word", 1))) __PYX_ERR(0, 151, __pyx_L1_error)
+  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_3FSM_10distance(((struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)__pyx_v_self), ((PyObject*)__pyx_v_word));
 
   /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
   __Pyx_RefNannyFinishContext();
+  return __pyx_r;
 }
 
-static void __pyx_pf_7cpython_5array_5array_2__releasebuffer__(CYTHON_UNUSED arrayobject *__pyx_v_self, Py_buffer *__pyx_v_info) {
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_10distance(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self, PyObject *__pyx_v_word) {
+  PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__releasebuffer__", 0);
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("distance", 0);
 
-  /* "array.pxd":119
+  /* "bundler/extensions/FSM.pyx":152
  * 
- *         def __releasebuffer__(self, Py_buffer* info):
- *             PyObject_Free(info.shape)             # <<<<<<<<<<<<<<
+ *     def distance(self, tuple word):
+ *         return self.distance_to_yield[self(word)]             # <<<<<<<<<<<<<<
  * 
- *     array newarrayobject(PyTypeObject* type, Py_ssize_t size, arraydescr *descr)
+ *     def path(self):
  */
-  PyObject_Free(__pyx_v_info->shape);
+  __Pyx_XDECREF(__pyx_r);
+  if (unlikely(__pyx_v_self->distance_to_yield == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(0, 152, __pyx_L1_error)
+  }
+  __Pyx_INCREF(((PyObject *)__pyx_v_self));
+  __pyx_t_2 = ((PyObject *)__pyx_v_self); __pyx_t_3 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_v_word) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_v_word);
+  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 152, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyDict_GetItem(__pyx_v_self->distance_to_yield, __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 152, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
 
-  /* "array.pxd":118
- *             info.obj = self
+  /* "bundler/extensions/FSM.pyx":151
+ *         return state
  * 
- *         def __releasebuffer__(self, Py_buffer* info):             # <<<<<<<<<<<<<<
- *             PyObject_Free(info.shape)
+ *     def distance(self, tuple word):             # <<<<<<<<<<<<<<
+ *         return self.distance_to_yield[self(word)]
  * 
  */
 
   /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("bundler.extensions.FSM.FSM.distance", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
+  return __pyx_r;
 }
 
-/* "array.pxd":130
- * 
+/* "bundler/extensions/FSM.pyx":154
+ *         return self.distance_to_yield[self(word)]
  * 
- * cdef inline array clone(array template, Py_ssize_t length, bint zero):             # <<<<<<<<<<<<<<
- *     """ fast creation of a new array, given a template array.
- *     type will be same as template.
+ *     def path(self):             # <<<<<<<<<<<<<<
+ *         ''' Return a new StatePath for tracking the states of this machine one letter at a time. '''
+ *         return StatePath(self)
  */
 
-static CYTHON_INLINE arrayobject *__pyx_f_7cpython_5array_clone(arrayobject *__pyx_v_template, Py_ssize_t __pyx_v_length, int __pyx_v_zero) {
-  arrayobject *__pyx_v_op = 0;
-  arrayobject *__pyx_r = NULL;
+/* Python wrapper */
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_13path(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_7bundler_10extensions_3FSM_3FSM_12path[] = " Return a new StatePath for tracking the states of this machine one letter at a time. ";
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_13path(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("path (wrapper)", 0);
+  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_3FSM_12path(((struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_12path(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  int __pyx_t_2;
-  int __pyx_t_3;
-  int __pyx_t_4;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("clone", 0);
+  __Pyx_RefNannySetupContext("path", 0);
 
-  /* "array.pxd":134
- *     type will be same as template.
- *     if zero is true, new array will be initialized with zeroes."""
- *     cdef array op = newarrayobject(Py_TYPE(template), length, template.ob_descr)             # <<<<<<<<<<<<<<
- *     if zero and op is not None:
- *         memset(op.data.as_chars, 0, length * op.ob_descr.itemsize)
+  /* "bundler/extensions/FSM.pyx":156
+ *     def path(self):
+ *         ''' Return a new StatePath for tracking the states of this machine one letter at a time. '''
+ *         return StatePath(self)             # <<<<<<<<<<<<<<
+ * 
+ *     def transition_map(self, int depth=-1):
  */
-  __pyx_t_1 = ((PyObject *)newarrayobject(Py_TYPE(((PyObject *)__pyx_v_template)), __pyx_v_length, __pyx_v_template->ob_descr)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 134, __pyx_L1_error)
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyObject_CallOneArg(((PyObject *)__pyx_ptype_7bundler_10extensions_3FSM_StatePath), ((PyObject *)__pyx_v_self)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 156, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_op = ((arrayobject *)__pyx_t_1);
+  __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
-
-  /* "array.pxd":135
- *     if zero is true, new array will be initialized with zeroes."""
- *     cdef array op = newarrayobject(Py_TYPE(template), length, template.ob_descr)
- *     if zero and op is not None:             # <<<<<<<<<<<<<<
- *         memset(op.data.as_chars, 0, length * op.ob_descr.itemsize)
- *     return op
- */
-  __pyx_t_3 = (__pyx_v_zero != 0);
-  if (__pyx_t_3) {
-  } else {
-    __pyx_t_2 = __pyx_t_3;
-    goto __pyx_L4_bool_binop_done;
-  }
-  __pyx_t_3 = (((PyObject *)__pyx_v_op) != Py_None);
-  __pyx_t_4 = (__pyx_t_3 != 0);
-  __pyx_t_2 = __pyx_t_4;
-  __pyx_L4_bool_binop_done:;
-  if (__pyx_t_2) {
-
-    /* "array.pxd":136
- *     cdef array op = newarrayobject(Py_TYPE(template), length, template.ob_descr)
- *     if zero and op is not None:
- *         memset(op.data.as_chars, 0, length * op.ob_descr.itemsize)             # <<<<<<<<<<<<<<
- *     return op
- * 
- */
-    (void)(memset(__pyx_v_op->data.as_chars, 0, (__pyx_v_length * __pyx_v_op->ob_descr->itemsize)));
-
-    /* "array.pxd":135
- *     if zero is true, new array will be initialized with zeroes."""
- *     cdef array op = newarrayobject(Py_TYPE(template), length, template.ob_descr)
- *     if zero and op is not None:             # <<<<<<<<<<<<<<
- *         memset(op.data.as_chars, 0, length * op.ob_descr.itemsize)
- *     return op
- */
-  }
-
-  /* "array.pxd":137
- *     if zero and op is not None:
- *         memset(op.data.as_chars, 0, length * op.ob_descr.itemsize)
- *     return op             # <<<<<<<<<<<<<<
- * 
- * cdef inline array copy(array self):
- */
-  __Pyx_XDECREF(((PyObject *)__pyx_r));
-  __Pyx_INCREF(((PyObject *)__pyx_v_op));
-  __pyx_r = __pyx_v_op;
   goto __pyx_L0;
 
-  /* "array.pxd":130
- * 
+  /* "bundler/extensions/FSM.pyx":154
+ *         return self.distance_to_yield[self(word)]
  * 
- * cdef inline array clone(array template, Py_ssize_t length, bint zero):             # <<<<<<<<<<<<<<
- *     """ fast creation of a new array, given a template array.
- *     type will be same as template.
+ *     def path(self):             # <<<<<<<<<<<<<<
+ *         ''' Return a new StatePath for tracking the states of this machine one letter at a time. '''
+ *         return StatePath(self)
  */
 
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("cpython.array.clone", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = 0;
+  __Pyx_AddTraceback("bundler.extensions.FSM.FSM.path", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
   __pyx_L0:;
-  __Pyx_XDECREF((PyObject *)__pyx_v_op);
-  __Pyx_XGIVEREF((PyObject *)__pyx_r);
+  __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "array.pxd":139
- *     return op
+/* "bundler/extensions/FSM.pyx":158
+ *         return StatePath(self)
  * 
- * cdef inline array copy(array self):             # <<<<<<<<<<<<<<
- *     """ make a copy of an array. """
- *     cdef array op = newarrayobject(Py_TYPE(self), Py_SIZE(self), self.ob_descr)
+ *     def transition_map(self, int depth=-1):             # <<<<<<<<<<<<<<
+ *         ''' Return a new TransitionMap for tracking the action of a word on the first depth states. '''
+ *         return TransitionMap(self, depth)
  */
 
-static CYTHON_INLINE arrayobject *__pyx_f_7cpython_5array_copy(arrayobject *__pyx_v_self) {
-  arrayobject *__pyx_v_op = 0;
-  arrayobject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
+/* Python wrapper */
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_15transition_map(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_7bundler_10extensions_3FSM_3FSM_14transition_map[] = " Return a new TransitionMap for tracking the action of a word on the first depth states. ";
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_15transition_map(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  int __pyx_v_depth;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("copy", 0);
-
-  /* "array.pxd":141
- * cdef inline array copy(array self):
- *     """ make a copy of an array. """
- *     cdef array op = newarrayobject(Py_TYPE(self), Py_SIZE(self), self.ob_descr)             # <<<<<<<<<<<<<<
- *     memcpy(op.data.as_chars, self.data.as_chars, Py_SIZE(op) * op.ob_descr.itemsize)
- *     return op
- */
-  __pyx_t_1 = ((PyObject *)newarrayobject(Py_TYPE(((PyObject *)__pyx_v_self)), Py_SIZE(((PyObject *)__pyx_v_self)), __pyx_v_self->ob_descr)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 141, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_op = ((arrayobject *)__pyx_t_1);
-  __pyx_t_1 = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("transition_map (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_depth,0};
+    PyObject* values[1] = {0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_depth);
+          if (value) { values[0] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "transition_map") < 0)) __PYX_ERR(0, 158, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    if (values[0]) {
+      __pyx_v_depth = __Pyx_PyInt_As_int(values[0]); if (unlikely((__pyx_v_depth == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 158, __pyx_L3_error)
+    } else {
+      __pyx_v_depth = ((int)-1);
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("transition_map", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 158, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("bundler.extensions.FSM.FSM.transition_map", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_3FSM_14transition_map(((struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)__pyx_v_self), __pyx_v_depth);
 
-  /* "array.pxd":142
- *     """ make a copy of an array. """
- *     cdef array op = newarrayobject(Py_TYPE(self), Py_SIZE(self), self.ob_descr)
- *     memcpy(op.data.as_chars, self.data.as_chars, Py_SIZE(op) * op.ob_descr.itemsize)             # <<<<<<<<<<<<<<
- *     return op
- * 
- */
-  (void)(memcpy(__pyx_v_op->data.as_chars, __pyx_v_self->data.as_chars, (Py_SIZE(((PyObject *)__pyx_v_op)) * __pyx_v_op->ob_descr->itemsize)));
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-  /* "array.pxd":143
- *     cdef array op = newarrayobject(Py_TYPE(self), Py_SIZE(self), self.ob_descr)
- *     memcpy(op.data.as_chars, self.data.as_chars, Py_SIZE(op) * op.ob_descr.itemsize)
- *     return op             # <<<<<<<<<<<<<<
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_14transition_map(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self, int __pyx_v_depth) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("transition_map", 0);
+
+  /* "bundler/extensions/FSM.pyx":160
+ *     def transition_map(self, int depth=-1):
+ *         ''' Return a new TransitionMap for tracking the action of a word on the first depth states. '''
+ *         return TransitionMap(self, depth)             # <<<<<<<<<<<<<<
  * 
- * cdef inline int extend_buffer(array self, char* stuff, Py_ssize_t n) except -1:
+ *     cdef int c_distance(self, IWord& word):
  */
-  __Pyx_XDECREF(((PyObject *)__pyx_r));
-  __Pyx_INCREF(((PyObject *)__pyx_v_op));
-  __pyx_r = __pyx_v_op;
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_depth); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 160, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 160, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(((PyObject *)__pyx_v_self));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_self));
+  PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_v_self));
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_1);
+  __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_7bundler_10extensions_3FSM_TransitionMap), __pyx_t_2, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 160, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "array.pxd":139
- *     return op
+  /* "bundler/extensions/FSM.pyx":158
+ *         return StatePath(self)
  * 
- * cdef inline array copy(array self):             # <<<<<<<<<<<<<<
- *     """ make a copy of an array. """
- *     cdef array op = newarrayobject(Py_TYPE(self), Py_SIZE(self), self.ob_descr)
+ *     def transition_map(self, int depth=-1):             # <<<<<<<<<<<<<<
+ *         ''' Return a new TransitionMap for tracking the action of a word on the first depth states. '''
+ *         return TransitionMap(self, depth)
  */
 
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("cpython.array.copy", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = 0;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("bundler.extensions.FSM.FSM.transition_map", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
   __pyx_L0:;
-  __Pyx_XDECREF((PyObject *)__pyx_v_op);
-  __Pyx_XGIVEREF((PyObject *)__pyx_r);
+  __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "array.pxd":145
- *     return op
+/* "bundler/extensions/FSM.pyx":162
+ *         return TransitionMap(self, depth)
  * 
- * cdef inline int extend_buffer(array self, char* stuff, Py_ssize_t n) except -1:             # <<<<<<<<<<<<<<
- *     """ efficient appending of new stuff of same type
- *     (e.g. of same array type)
+ *     cdef int c_distance(self, IWord& word):             # <<<<<<<<<<<<<<
+ *         ''' Return the length of the shortest word that extends word to reach a yield state. '''
+ *         cdef int state = 0
  */
 
-static CYTHON_INLINE int __pyx_f_7cpython_5array_extend_buffer(arrayobject *__pyx_v_self, char *__pyx_v_stuff, Py_ssize_t __pyx_v_n) {
-  Py_ssize_t __pyx_v_itemsize;
-  Py_ssize_t __pyx_v_origsize;
+static int __pyx_f_7bundler_10extensions_3FSM_3FSM_c_distance(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self, __pyx_t_7bundler_10extensions_3FSM_IWord &__pyx_v_word) {
+  int __pyx_v_state;
+  int __pyx_v_i;
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("extend_buffer", 0);
+  __Pyx_RefNannySetupContext("c_distance", 0);
 
-  /* "array.pxd":149
- *     (e.g. of same array type)
- *     n: number of elements (not number of bytes!) """
- *     cdef Py_ssize_t itemsize = self.ob_descr.itemsize             # <<<<<<<<<<<<<<
- *     cdef Py_ssize_t origsize = Py_SIZE(self)
- *     resize_smart(self, origsize + n)
+  /* "bundler/extensions/FSM.pyx":164
+ *     cdef int c_distance(self, IWord& word):
+ *         ''' Return the length of the shortest word that extends word to reach a yield state. '''
+ *         cdef int state = 0             # <<<<<<<<<<<<<<
+ *         cdef int i
+ *         for i in range(<int>word.size()):
  */
-  __pyx_t_1 = __pyx_v_self->ob_descr->itemsize;
-  __pyx_v_itemsize = __pyx_t_1;
+  __pyx_v_state = 0;
 
-  /* "array.pxd":150
- *     n: number of elements (not number of bytes!) """
- *     cdef Py_ssize_t itemsize = self.ob_descr.itemsize
- *     cdef Py_ssize_t origsize = Py_SIZE(self)             # <<<<<<<<<<<<<<
- *     resize_smart(self, origsize + n)
- *     memcpy(self.data.as_chars + origsize * itemsize, stuff, n * itemsize)
+  /* "bundler/extensions/FSM.pyx":166
+ *         cdef int state = 0
+ *         cdef int i
+ *         for i in range(<int>word.size()):             # <<<<<<<<<<<<<<
+ *             state = step(self, state, word[i])
+ *             if state < 0:
  */
-  __pyx_v_origsize = Py_SIZE(((PyObject *)__pyx_v_self));
+  __pyx_t_1 = ((int)__pyx_v_word.size());
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_i = __pyx_t_3;
 
-  /* "array.pxd":151
- *     cdef Py_ssize_t itemsize = self.ob_descr.itemsize
- *     cdef Py_ssize_t origsize = Py_SIZE(self)
- *     resize_smart(self, origsize + n)             # <<<<<<<<<<<<<<
- *     memcpy(self.data.as_chars + origsize * itemsize, stuff, n * itemsize)
- *     return 0
+    /* "bundler/extensions/FSM.pyx":167
+ *         cdef int i
+ *         for i in range(<int>word.size()):
+ *             state = step(self, state, word[i])             # <<<<<<<<<<<<<<
+ *             if state < 0:
+ *                 raise ValueError('Invalid transition to state {}'.format(state))
  */
-  __pyx_t_1 = resize_smart(__pyx_v_self, (__pyx_v_origsize + __pyx_v_n)); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(1, 151, __pyx_L1_error)
+    __pyx_v_state = __pyx_f_7bundler_10extensions_3FSM_step(__pyx_v_self, __pyx_v_state, (__pyx_v_word[__pyx_v_i]));
 
-  /* "array.pxd":152
- *     cdef Py_ssize_t origsize = Py_SIZE(self)
- *     resize_smart(self, origsize + n)
- *     memcpy(self.data.as_chars + origsize * itemsize, stuff, n * itemsize)             # <<<<<<<<<<<<<<
- *     return 0
+    /* "bundler/extensions/FSM.pyx":168
+ *         for i in range(<int>word.size()):
+ *             state = step(self, state, word[i])
+ *             if state < 0:             # <<<<<<<<<<<<<<
+ *                 raise ValueError('Invalid transition to state {}'.format(state))
  * 
  */
-  (void)(memcpy((__pyx_v_self->data.as_chars + (__pyx_v_origsize * __pyx_v_itemsize)), __pyx_v_stuff, (__pyx_v_n * __pyx_v_itemsize)));
+    __pyx_t_4 = ((__pyx_v_state < 0) != 0);
+    if (unlikely(__pyx_t_4)) {
 
-  /* "array.pxd":153
- *     resize_smart(self, origsize + n)
- *     memcpy(self.data.as_chars + origsize * itemsize, stuff, n * itemsize)
- *     return 0             # <<<<<<<<<<<<<<
+      /* "bundler/extensions/FSM.pyx":169
+ *             state = step(self, state, word[i])
+ *             if state < 0:
+ *                 raise ValueError('Invalid transition to state {}'.format(state))             # <<<<<<<<<<<<<<
  * 
- * cdef inline int extend(array self, array other) except -1:
+ *         return self.distances.data.as_ints[state]
  */
-  __pyx_r = 0;
+      __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_Invalid_transition_to_state, __pyx_n_s_format); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 169, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_t_7 = __Pyx_PyInt_From_int(__pyx_v_state); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 169, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      __pyx_t_8 = NULL;
+      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
+        __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_6);
+        if (likely(__pyx_t_8)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+          __Pyx_INCREF(__pyx_t_8);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_6, function);
+        }
+      }
+      __pyx_t_5 = (__pyx_t_8) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_8, __pyx_t_7) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_t_7);
+      __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 169, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __pyx_t_6 = __Pyx_PyObject_CallOneArg(__pyx_builtin_ValueError, __pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 169, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_Raise(__pyx_t_6, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __PYX_ERR(0, 169, __pyx_L1_error)
+
+      /* "bundler/extensions/FSM.pyx":168
+ *         for i in range(<int>word.size()):
+ *             state = step(self, state, word[i])
+ *             if state < 0:             # <<<<<<<<<<<<<<
+ *                 raise ValueError('Invalid transition to state {}'.format(state))
+ * 
+ */
+    }
+  }
+
+  /* "bundler/extensions/FSM.pyx":171
+ *                 raise ValueError('Invalid transition to state {}'.format(state))
+ * 
+ *         return self.distances.data.as_ints[state]             # <<<<<<<<<<<<<<
+ * 
+ *     cdef bint c_hit(self, IWord& word, int run=-1, int longest=-1):
+ */
+  __pyx_r = (__pyx_v_self->distances->data.as_ints[__pyx_v_state]);
   goto __pyx_L0;
 
-  /* "array.pxd":145
- *     return op
+  /* "bundler/extensions/FSM.pyx":162
+ *         return TransitionMap(self, depth)
  * 
- * cdef inline int extend_buffer(array self, char* stuff, Py_ssize_t n) except -1:             # <<<<<<<<<<<<<<
- *     """ efficient appending of new stuff of same type
- *     (e.g. of same array type)
+ *     cdef int c_distance(self, IWord& word):             # <<<<<<<<<<<<<<
+ *         ''' Return the length of the shortest word that extends word to reach a yield state. '''
+ *         cdef int state = 0
  */
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_AddTraceback("cpython.array.extend_buffer", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = -1;
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_WriteUnraisable("bundler.extensions.FSM.FSM.c_distance", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __pyx_r = 0;
   __pyx_L0:;
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "array.pxd":155
- *     return 0
+/* "bundler/extensions/FSM.pyx":173
+ *         return self.distances.data.as_ints[state]
  * 
- * cdef inline int extend(array self, array other) except -1:             # <<<<<<<<<<<<<<
- *     """ extend array with data from another array; types must match. """
- *     if self.ob_descr.typecode != other.ob_descr.typecode:
+ *     cdef bint c_hit(self, IWord& word, int run=-1, int longest=-1):             # <<<<<<<<<<<<<<
+ *         ''' Return whether the first run letters of word (read cyclically) meet a state that yields, or one that yields a word of length at most longest if given. '''
+ *         cdef int index = 0
  */
 
-static CYTHON_INLINE int __pyx_f_7cpython_5array_extend(arrayobject *__pyx_v_self, arrayobject *__pyx_v_other) {
+static int __pyx_f_7bundler_10extensions_3FSM_3FSM_c_hit(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self, __pyx_t_7bundler_10extensions_3FSM_IWord &__pyx_v_word, struct __pyx_opt_args_7bundler_10extensions_3FSM_3FSM_c_hit *__pyx_optional_args) {
+  int __pyx_v_run = ((int)-1);
+  int __pyx_v_longest = ((int)-1);
+  int __pyx_v_index;
+  int __pyx_v_state;
+  int __pyx_v_length;
+  CYTHON_UNUSED int __pyx_v__;
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
   int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_t_9;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("extend", 0);
+  __Pyx_RefNannySetupContext("c_hit", 0);
+  if (__pyx_optional_args) {
+    if (__pyx_optional_args->__pyx_n > 0) {
+      __pyx_v_run = __pyx_optional_args->run;
+      if (__pyx_optional_args->__pyx_n > 1) {
+        __pyx_v_longest = __pyx_optional_args->longest;
+      }
+    }
+  }
 
-  /* "array.pxd":157
- * cdef inline int extend(array self, array other) except -1:
- *     """ extend array with data from another array; types must match. """
- *     if self.ob_descr.typecode != other.ob_descr.typecode:             # <<<<<<<<<<<<<<
- *         PyErr_BadArgument()
- *     return extend_buffer(self, other.data.as_chars, Py_SIZE(other))
+  /* "bundler/extensions/FSM.pyx":175
+ *     cdef bint c_hit(self, IWord& word, int run=-1, int longest=-1):
+ *         ''' Return whether the first run letters of word (read cyclically) meet a state that yields, or one that yields a word of length at most longest if given. '''
+ *         cdef int index = 0             # <<<<<<<<<<<<<<
+ *         cdef int state = 0
+ *         cdef int length = word.size()
  */
-  __pyx_t_1 = ((__pyx_v_self->ob_descr->typecode != __pyx_v_other->ob_descr->typecode) != 0);
-  if (__pyx_t_1) {
+  __pyx_v_index = 0;
 
-    /* "array.pxd":158
- *     """ extend array with data from another array; types must match. """
- *     if self.ob_descr.typecode != other.ob_descr.typecode:
- *         PyErr_BadArgument()             # <<<<<<<<<<<<<<
- *     return extend_buffer(self, other.data.as_chars, Py_SIZE(other))
- * 
+  /* "bundler/extensions/FSM.pyx":176
+ *         ''' Return whether the first run letters of word (read cyclically) meet a state that yields, or one that yields a word of length at most longest if given. '''
+ *         cdef int index = 0
+ *         cdef int state = 0             # <<<<<<<<<<<<<<
+ *         cdef int length = word.size()
+ *         for _ in range(length if run < 0 else run):
  */
-    __pyx_t_2 = PyErr_BadArgument(); if (unlikely(__pyx_t_2 == ((int)0))) __PYX_ERR(1, 158, __pyx_L1_error)
+  __pyx_v_state = 0;
 
-    /* "array.pxd":157
- * cdef inline int extend(array self, array other) except -1:
- *     """ extend array with data from another array; types must match. """
- *     if self.ob_descr.typecode != other.ob_descr.typecode:             # <<<<<<<<<<<<<<
- *         PyErr_BadArgument()
- *     return extend_buffer(self, other.data.as_chars, Py_SIZE(other))
+  /* "bundler/extensions/FSM.pyx":177
+ *         cdef int index = 0
+ *         cdef int state = 0
+ *         cdef int length = word.size()             # <<<<<<<<<<<<<<
+ *         for _ in range(length if run < 0 else run):
+ *             state = step(self, state, word[index])
+ */
+  __pyx_v_length = __pyx_v_word.size();
+
+  /* "bundler/extensions/FSM.pyx":178
+ *         cdef int state = 0
+ *         cdef int length = word.size()
+ *         for _ in range(length if run < 0 else run):             # <<<<<<<<<<<<<<
+ *             state = step(self, state, word[index])
+ *             if state < 0:
  */
+  if (((__pyx_v_run < 0) != 0)) {
+    __pyx_t_1 = __pyx_v_length;
+  } else {
+    __pyx_t_1 = __pyx_v_run;
   }
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v__ = __pyx_t_3;
 
-  /* "array.pxd":159
- *     if self.ob_descr.typecode != other.ob_descr.typecode:
- *         PyErr_BadArgument()
- *     return extend_buffer(self, other.data.as_chars, Py_SIZE(other))             # <<<<<<<<<<<<<<
+    /* "bundler/extensions/FSM.pyx":179
+ *         cdef int length = word.size()
+ *         for _ in range(length if run < 0 else run):
+ *             state = step(self, state, word[index])             # <<<<<<<<<<<<<<
+ *             if state < 0:
+ *                 raise ValueError('Invalid transition to state {}'.format(state))
+ */
+    __pyx_v_state = __pyx_f_7bundler_10extensions_3FSM_step(__pyx_v_self, __pyx_v_state, (__pyx_v_word[__pyx_v_index]));
+
+    /* "bundler/extensions/FSM.pyx":180
+ *         for _ in range(length if run < 0 else run):
+ *             state = step(self, state, word[index])
+ *             if state < 0:             # <<<<<<<<<<<<<<
+ *                 raise ValueError('Invalid transition to state {}'.format(state))
+ *             if self.has_yield.data.as_ints[state] and (longest < 0 or self.shortest_yield.data.as_ints[state] <= longest):
+ */
+    __pyx_t_4 = ((__pyx_v_state < 0) != 0);
+    if (unlikely(__pyx_t_4)) {
+
+      /* "bundler/extensions/FSM.pyx":181
+ *             state = step(self, state, word[index])
+ *             if state < 0:
+ *                 raise ValueError('Invalid transition to state {}'.format(state))             # <<<<<<<<<<<<<<
+ *             if self.has_yield.data.as_ints[state] and (longest < 0 or self.shortest_yield.data.as_ints[state] <= longest):
+ *                 return True
+ */
+      __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_Invalid_transition_to_state, __pyx_n_s_format); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 181, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_t_7 = __Pyx_PyInt_From_int(__pyx_v_state); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 181, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      __pyx_t_8 = NULL;
+      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
+        __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_6);
+        if (likely(__pyx_t_8)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+          __Pyx_INCREF(__pyx_t_8);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_6, function);
+        }
+      }
+      __pyx_t_5 = (__pyx_t_8) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_8, __pyx_t_7) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_t_7);
+      __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 181, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __pyx_t_6 = __Pyx_PyObject_CallOneArg(__pyx_builtin_ValueError, __pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 181, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_Raise(__pyx_t_6, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __PYX_ERR(0, 181, __pyx_L1_error)
+
+      /* "bundler/extensions/FSM.pyx":180
+ *         for _ in range(length if run < 0 else run):
+ *             state = step(self, state, word[index])
+ *             if state < 0:             # <<<<<<<<<<<<<<
+ *                 raise ValueError('Invalid transition to state {}'.format(state))
+ *             if self.has_yield.data.as_ints[state] and (longest < 0 or self.shortest_yield.data.as_ints[state] <= longest):
+ */
+    }
+
+    /* "bundler/extensions/FSM.pyx":182
+ *             if state < 0:
+ *                 raise ValueError('Invalid transition to state {}'.format(state))
+ *             if self.has_yield.data.as_ints[state] and (longest < 0 or self.shortest_yield.data.as_ints[state] <= longest):             # <<<<<<<<<<<<<<
+ *                 return True
+ *             index += 1
+ */
+    __pyx_t_9 = ((__pyx_v_self->has_yield->data.as_ints[__pyx_v_state]) != 0);
+    if (__pyx_t_9) {
+    } else {
+      __pyx_t_4 = __pyx_t_9;
+      goto __pyx_L7_bool_binop_done;
+    }
+    __pyx_t_9 = ((__pyx_v_longest < 0) != 0);
+    if (!__pyx_t_9) {
+    } else {
+      __pyx_t_4 = __pyx_t_9;
+      goto __pyx_L7_bool_binop_done;
+    }
+    __pyx_t_9 = (((__pyx_v_self->shortest_yield->data.as_ints[__pyx_v_state]) <= __pyx_v_longest) != 0);
+    __pyx_t_4 = __pyx_t_9;
+    __pyx_L7_bool_binop_done:;
+    if (__pyx_t_4) {
+
+      /* "bundler/extensions/FSM.pyx":183
+ *                 raise ValueError('Invalid transition to state {}'.format(state))
+ *             if self.has_yield.data.as_ints[state] and (longest < 0 or self.shortest_yield.data.as_ints[state] <= longest):
+ *                 return True             # <<<<<<<<<<<<<<
+ *             index += 1
+ *             if index == length: index = 0
+ */
+      __pyx_r = 1;
+      goto __pyx_L0;
+
+      /* "bundler/extensions/FSM.pyx":182
+ *             if state < 0:
+ *                 raise ValueError('Invalid transition to state {}'.format(state))
+ *             if self.has_yield.data.as_ints[state] and (longest < 0 or self.shortest_yield.data.as_ints[state] <= longest):             # <<<<<<<<<<<<<<
+ *                 return True
+ *             index += 1
+ */
+    }
+
+    /* "bundler/extensions/FSM.pyx":184
+ *             if self.has_yield.data.as_ints[state] and (longest < 0 or self.shortest_yield.data.as_ints[state] <= longest):
+ *                 return True
+ *             index += 1             # <<<<<<<<<<<<<<
+ *             if index == length: index = 0
  * 
- * cdef inline void zero(array self):
  */
-  __pyx_t_2 = __pyx_f_7cpython_5array_extend_buffer(__pyx_v_self, __pyx_v_other->data.as_chars, Py_SIZE(((PyObject *)__pyx_v_other))); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(1, 159, __pyx_L1_error)
-  __pyx_r = __pyx_t_2;
+    __pyx_v_index = (__pyx_v_index + 1);
+
+    /* "bundler/extensions/FSM.pyx":185
+ *                 return True
+ *             index += 1
+ *             if index == length: index = 0             # <<<<<<<<<<<<<<
+ * 
+ *         return False
+ */
+    __pyx_t_4 = ((__pyx_v_index == __pyx_v_length) != 0);
+    if (__pyx_t_4) {
+      __pyx_v_index = 0;
+    }
+  }
+
+  /* "bundler/extensions/FSM.pyx":187
+ *             if index == length: index = 0
+ * 
+ *         return False             # <<<<<<<<<<<<<<
+ * 
+ *     def hit(self, tuple word):
+ */
+  __pyx_r = 0;
   goto __pyx_L0;
 
-  /* "array.pxd":155
- *     return 0
+  /* "bundler/extensions/FSM.pyx":173
+ *         return self.distances.data.as_ints[state]
  * 
- * cdef inline int extend(array self, array other) except -1:             # <<<<<<<<<<<<<<
- *     """ extend array with data from another array; types must match. """
- *     if self.ob_descr.typecode != other.ob_descr.typecode:
+ *     cdef bint c_hit(self, IWord& word, int run=-1, int longest=-1):             # <<<<<<<<<<<<<<
+ *         ''' Return whether the first run letters of word (read cyclically) meet a state that yields, or one that yields a word of length at most longest if given. '''
+ *         cdef int index = 0
  */
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_AddTraceback("cpython.array.extend", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = -1;
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_WriteUnraisable("bundler.extensions.FSM.FSM.c_hit", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __pyx_r = 0;
   __pyx_L0:;
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "array.pxd":161
- *     return extend_buffer(self, other.data.as_chars, Py_SIZE(other))
+/* "bundler/extensions/FSM.pyx":189
+ *         return False
  * 
- * cdef inline void zero(array self):             # <<<<<<<<<<<<<<
- *     """ set all elements of array to zero. """
- *     memset(self.data.as_chars, 0, Py_SIZE(self) * self.ob_descr.itemsize)
+ *     def hit(self, tuple word):             # <<<<<<<<<<<<<<
+ *         ''' Return whether word meets any state that yields. '''
+ *         # return any(self.hits(word))
  */
 
-static CYTHON_INLINE void __pyx_f_7cpython_5array_zero(arrayobject *__pyx_v_self) {
+/* Python wrapper */
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_17hit(PyObject *__pyx_v_self, PyObject *__pyx_v_word); /*proto*/
+static char __pyx_doc_7bundler_10extensions_3FSM_3FSM_16hit[] = " Return whether word meets any state that yields. ";
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_17hit(PyObject *__pyx_v_self, PyObject *__pyx_v_word) {
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("zero", 0);
+  __Pyx_RefNannySetupContext("hit (wrapper)", 0);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_word), (&PyTuple_Type), 1, "word", 1))) __PYX_ERR(0, 189, __pyx_L1_error)
+  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_3FSM_16hit(((struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)__pyx_v_self), ((PyObject*)__pyx_v_word));
 
-  /* "array.pxd":163
- * cdef inline void zero(array self):
- *     """ set all elements of array to zero. """
- *     memset(self.data.as_chars, 0, Py_SIZE(self) * self.ob_descr.itemsize)             # <<<<<<<<<<<<<<
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_16hit(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self, PyObject *__pyx_v_word) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __pyx_t_7bundler_10extensions_3FSM_IWord __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("hit", 0);
+
+  /* "bundler/extensions/FSM.pyx":192
+ *         ''' Return whether word meets any state that yields. '''
+ *         # return any(self.hits(word))
+ *         return self.c_hit(word)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef vector[pair[int, IWord]] c_hits(self, IWord& word, int run=-1):
  */
-  (void)(memset(__pyx_v_self->data.as_chars, 0, (Py_SIZE(((PyObject *)__pyx_v_self)) * __pyx_v_self->ob_descr->itemsize)));
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_convert_vector_from_py_int(__pyx_v_word); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 192, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyBool_FromLong(((struct __pyx_vtabstruct_7bundler_10extensions_3FSM_FSM *)__pyx_v_self->__pyx_vtab)->c_hit(__pyx_v_self, __pyx_t_1, NULL)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 192, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
 
-  /* "array.pxd":161
- *     return extend_buffer(self, other.data.as_chars, Py_SIZE(other))
+  /* "bundler/extensions/FSM.pyx":189
+ *         return False
  * 
- * cdef inline void zero(array self):             # <<<<<<<<<<<<<<
- *     """ set all elements of array to zero. """
- *     memset(self.data.as_chars, 0, Py_SIZE(self) * self.ob_descr.itemsize)
+ *     def hit(self, tuple word):             # <<<<<<<<<<<<<<
+ *         ''' Return whether word meets any state that yields. '''
+ *         # return any(self.hits(word))
  */
 
   /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("bundler.extensions.FSM.FSM.hit", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
+  return __pyx_r;
 }
 
-/* "vector.from_py":45
+/* "bundler/extensions/FSM.pyx":194
+ *         return self.c_hit(word)
  * 
- * @cname("__pyx_convert_vector_from_py_int")
- * cdef vector[X] __pyx_convert_vector_from_py_int(object o) except *:             # <<<<<<<<<<<<<<
- *     cdef vector[X] v
- *     for item in o:
+ *     cdef vector[pair[int, IWord]] c_hits(self, IWord& word, int run=-1):             # <<<<<<<<<<<<<<
+ *         ''' Process word and yield (index, x) for all states that word hits that have things to yield. '''
+ *         cdef int index = 0
  */
 
-static std::vector<int>  __pyx_convert_vector_from_py_int(PyObject *__pyx_v_o) {
-  std::vector<int>  __pyx_v_v;
-  PyObject *__pyx_v_item = NULL;
-  std::vector<int>  __pyx_r;
+static std::vector<std::pair<int,__pyx_t_7bundler_10extensions_3FSM_IWord> >  __pyx_f_7bundler_10extensions_3FSM_3FSM_c_hits(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self, __pyx_t_7bundler_10extensions_3FSM_IWord &__pyx_v_word, struct __pyx_opt_args_7bundler_10extensions_3FSM_3FSM_c_hits *__pyx_optional_args) {
+  int __pyx_v_run = ((int)-1);
+  int __pyx_v_index;
+  int __pyx_v_state;
+  int __pyx_v_length;
+  int __pyx_v_i;
+  int __pyx_v_j;
+  std::vector<std::pair<int,__pyx_t_7bundler_10extensions_3FSM_IWord> >  __pyx_v_returns;
+  CYTHON_UNUSED int __pyx_v__;
+  std::vector<std::pair<int,__pyx_t_7bundler_10extensions_3FSM_IWord> >  __pyx_r;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  Py_ssize_t __pyx_t_2;
-  PyObject *(*__pyx_t_3)(PyObject *);
-  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
   int __pyx_t_5;
+  int __pyx_t_6;
+  std::pair<int,__pyx_t_7bundler_10extensions_3FSM_IWord>  __pyx_t_7;
+  int __pyx_t_8;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__pyx_convert_vector_from_py_int", 0);
+  __Pyx_RefNannySetupContext("c_hits", 0);
+  if (__pyx_optional_args) {
+    if (__pyx_optional_args->__pyx_n > 0) {
+      __pyx_v_run = __pyx_optional_args->run;
+    }
+  }
 
-  /* "vector.from_py":47
- * cdef vector[X] __pyx_convert_vector_from_py_int(object o) except *:
- *     cdef vector[X] v
- *     for item in o:             # <<<<<<<<<<<<<<
- *         v.push_back(<X>item)
- *     return v
+  /* "bundler/extensions/FSM.pyx":196
+ *     cdef vector[pair[int, IWord]] c_hits(self, IWord& word, int run=-1):
+ *         ''' Process word and yield (index, x) for all states that word hits that have things to yield. '''
+ *         cdef int index = 0             # <<<<<<<<<<<<<<
+ *         cdef int state = 0
+ *         cdef int length = word.size()
  */
-  if (likely(PyList_CheckExact(__pyx_v_o)) || PyTuple_CheckExact(__pyx_v_o)) {
-    __pyx_t_1 = __pyx_v_o; __Pyx_INCREF(__pyx_t_1); __pyx_t_2 = 0;
-    __pyx_t_3 = NULL;
+  __pyx_v_index = 0;
+
+  /* "bundler/extensions/FSM.pyx":197
+ *         ''' Process word and yield (index, x) for all states that word hits that have things to yield. '''
+ *         cdef int index = 0
+ *         cdef int state = 0             # <<<<<<<<<<<<<<
+ *         cdef int length = word.size()
+ *         cdef int i = 0, j
+ */
+  __pyx_v_state = 0;
+
+  /* "bundler/extensions/FSM.pyx":198
+ *         cdef int index = 0
+ *         cdef int state = 0
+ *         cdef int length = word.size()             # <<<<<<<<<<<<<<
+ *         cdef int i = 0, j
+ *         cdef vector[pair[int, IWord]] returns
+ */
+  __pyx_v_length = __pyx_v_word.size();
+
+  /* "bundler/extensions/FSM.pyx":199
+ *         cdef int state = 0
+ *         cdef int length = word.size()
+ *         cdef int i = 0, j             # <<<<<<<<<<<<<<
+ *         cdef vector[pair[int, IWord]] returns
+ *         for _ in range(length if run < 0 else run):
+ */
+  __pyx_v_i = 0;
+
+  /* "bundler/extensions/FSM.pyx":201
+ *         cdef int i = 0, j
+ *         cdef vector[pair[int, IWord]] returns
+ *         for _ in range(length if run < 0 else run):             # <<<<<<<<<<<<<<
+ *             state = step(self, state, word[index])
+ *             i += 1
+ */
+  if (((__pyx_v_run < 0) != 0)) {
+    __pyx_t_1 = __pyx_v_length;
   } else {
-    __pyx_t_2 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_o); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 47, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_3 = Py_TYPE(__pyx_t_1)->tp_iternext; if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 47, __pyx_L1_error)
+    __pyx_t_1 = __pyx_v_run;
   }
-  for (;;) {
-    if (likely(!__pyx_t_3)) {
-      if (likely(PyList_CheckExact(__pyx_t_1))) {
-        if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_1)) break;
-        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_4 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_4); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(2, 47, __pyx_L1_error)
-        #else
-        __pyx_t_4 = PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_4)) __PYX_ERR(2, 47, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_4);
-        #endif
-      } else {
-        if (__pyx_t_2 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
-        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_4 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_4); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(2, 47, __pyx_L1_error)
-        #else
-        __pyx_t_4 = PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_4)) __PYX_ERR(2, 47, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_4);
-        #endif
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v__ = __pyx_t_3;
+
+    /* "bundler/extensions/FSM.pyx":202
+ *         cdef vector[pair[int, IWord]] returns
+ *         for _ in range(length if run < 0 else run):
+ *             state = step(self, state, word[index])             # <<<<<<<<<<<<<<
+ *             i += 1
+ *             for j in range(self.yield_states2_starts[state], self.yield_states2_starts[state+1]):
+ */
+    __pyx_v_state = __pyx_f_7bundler_10extensions_3FSM_step(__pyx_v_self, __pyx_v_state, (__pyx_v_word[__pyx_v_index]));
+
+    /* "bundler/extensions/FSM.pyx":203
+ *         for _ in range(length if run < 0 else run):
+ *             state = step(self, state, word[index])
+ *             i += 1             # <<<<<<<<<<<<<<
+ *             for j in range(self.yield_states2_starts[state], self.yield_states2_starts[state+1]):
+ *                 returns.push_back(pair[int, IWord](i, self.yield_states2[j]))
+ */
+    __pyx_v_i = (__pyx_v_i + 1);
+
+    /* "bundler/extensions/FSM.pyx":204
+ *             state = step(self, state, word[index])
+ *             i += 1
+ *             for j in range(self.yield_states2_starts[state], self.yield_states2_starts[state+1]):             # <<<<<<<<<<<<<<
+ *                 returns.push_back(pair[int, IWord](i, self.yield_states2[j]))
+ *             index += 1
+ */
+    __pyx_t_4 = (__pyx_v_self->yield_states2_starts[(__pyx_v_state + 1)]);
+    __pyx_t_5 = __pyx_t_4;
+    for (__pyx_t_6 = (__pyx_v_self->yield_states2_starts[__pyx_v_state]); __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+      __pyx_v_j = __pyx_t_6;
+
+      /* "bundler/extensions/FSM.pyx":205
+ *             i += 1
+ *             for j in range(self.yield_states2_starts[state], self.yield_states2_starts[state+1]):
+ *                 returns.push_back(pair[int, IWord](i, self.yield_states2[j]))             # <<<<<<<<<<<<<<
+ *             index += 1
+ *             if index == length: index = 0
+ */
+      try {
+        __pyx_t_7 = std::pair<int,__pyx_t_7bundler_10extensions_3FSM_IWord> (__pyx_v_i, (__pyx_v_self->yield_states2[__pyx_v_j]));
+      } catch(...) {
+        __Pyx_CppExn2PyErr();
+        __PYX_ERR(0, 205, __pyx_L1_error)
       }
-    } else {
-      __pyx_t_4 = __pyx_t_3(__pyx_t_1);
-      if (unlikely(!__pyx_t_4)) {
-        PyObject* exc_type = PyErr_Occurred();
-        if (exc_type) {
-          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-          else __PYX_ERR(2, 47, __pyx_L1_error)
-        }
-        break;
+      try {
+        __pyx_v_returns.push_back(__pyx_t_7);
+      } catch(...) {
+        __Pyx_CppExn2PyErr();
+        __PYX_ERR(0, 205, __pyx_L1_error)
       }
-      __Pyx_GOTREF(__pyx_t_4);
     }
-    __Pyx_XDECREF_SET(__pyx_v_item, __pyx_t_4);
-    __pyx_t_4 = 0;
 
-    /* "vector.from_py":48
- *     cdef vector[X] v
- *     for item in o:
- *         v.push_back(<X>item)             # <<<<<<<<<<<<<<
- *     return v
+    /* "bundler/extensions/FSM.pyx":206
+ *             for j in range(self.yield_states2_starts[state], self.yield_states2_starts[state+1]):
+ *                 returns.push_back(pair[int, IWord](i, self.yield_states2[j]))
+ *             index += 1             # <<<<<<<<<<<<<<
+ *             if index == length: index = 0
  * 
  */
-    __pyx_t_5 = __Pyx_PyInt_As_int(__pyx_v_item); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) __PYX_ERR(2, 48, __pyx_L1_error)
-    __pyx_v_v.push_back(((int)__pyx_t_5));
+    __pyx_v_index = (__pyx_v_index + 1);
 
-    /* "vector.from_py":47
- * cdef vector[X] __pyx_convert_vector_from_py_int(object o) except *:
- *     cdef vector[X] v
- *     for item in o:             # <<<<<<<<<<<<<<
- *         v.push_back(<X>item)
- *     return v
+    /* "bundler/extensions/FSM.pyx":207
+ *                 returns.push_back(pair[int, IWord](i, self.yield_states2[j]))
+ *             index += 1
+ *             if index == length: index = 0             # <<<<<<<<<<<<<<
+ * 
+ *         return returns
  */
+    __pyx_t_8 = ((__pyx_v_index == __pyx_v_length) != 0);
+    if (__pyx_t_8) {
+      __pyx_v_index = 0;
+    }
   }
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "vector.from_py":49
- *     for item in o:
- *         v.push_back(<X>item)
- *     return v             # <<<<<<<<<<<<<<
+  /* "bundler/extensions/FSM.pyx":209
+ *             if index == length: index = 0
  * 
+ *         return returns             # <<<<<<<<<<<<<<
  * 
+ *     def hits(self, tuple word, int run=-1):
  */
-  __pyx_r = __pyx_v_v;
+  __pyx_r = __pyx_v_returns;
   goto __pyx_L0;
 
-  /* "vector.from_py":45
+  /* "bundler/extensions/FSM.pyx":194
+ *         return self.c_hit(word)
  * 
- * @cname("__pyx_convert_vector_from_py_int")
- * cdef vector[X] __pyx_convert_vector_from_py_int(object o) except *:             # <<<<<<<<<<<<<<
- *     cdef vector[X] v
- *     for item in o:
+ *     cdef vector[pair[int, IWord]] c_hits(self, IWord& word, int run=-1):             # <<<<<<<<<<<<<<
+ *         ''' Process word and yield (index, x) for all states that word hits that have things to yield. '''
+ *         cdef int index = 0
  */
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("vector.from_py.__pyx_convert_vector_from_py_int", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_WriteUnraisable("bundler.extensions.FSM.FSM.c_hits", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
   __Pyx_pretend_to_initialize(&__pyx_r);
   __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_item);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
-static struct __pyx_vtabstruct_7bundler_10extensions_3FSM_FSM __pyx_vtable_7bundler_10extensions_3FSM_FSM;
+static PyObject *__pyx_gb_7bundler_10extensions_3FSM_3FSM_20generator(__pyx_CoroutineObject *__pyx_generator, CYTHON_UNUSED PyThreadState *__pyx_tstate, PyObject *__pyx_sent_value); /* proto */
 
-static PyObject *__pyx_tp_new_7bundler_10extensions_3FSM_FSM(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
-  struct __pyx_obj_7bundler_10extensions_3FSM_FSM *p;
-  PyObject *o;
-  if (likely((t->tp_flags & Py_TPFLAGS_IS_ABSTRACT) == 0)) {
-    o = (*t->tp_alloc)(t, 0);
-  } else {
-    o = (PyObject *) PyBaseObject_Type.tp_new(t, __pyx_empty_tuple, 0);
-  }
-  if (unlikely(!o)) return 0;
-  p = ((struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)o);
-  p->__pyx_vtab = __pyx_vtabptr_7bundler_10extensions_3FSM_FSM;
-  new((void*)&(p->yield_states2)) std::vector<__pyx_t_7bundler_10extensions_3FSM_IWord> ();
-  new((void*)&(p->yield_states2_starts)) std::vector<int> ();
-  p->alphabet = ((PyObject*)Py_None); Py_INCREF(Py_None);
-  p->machine = ((arrayobject *)Py_None); Py_INCREF(Py_None);
-  p->yield_states = ((PyObject*)Py_None); Py_INCREF(Py_None);
-  p->distance_to_yield = ((PyObject*)Py_None); Py_INCREF(Py_None);
-  p->has_yield = ((arrayobject *)Py_None); Py_INCREF(Py_None);
-  return o;
-}
+/* "bundler/extensions/FSM.pyx":211
+ *         return returns
+ * 
+ *     def hits(self, tuple word, int run=-1):             # <<<<<<<<<<<<<<
+ *         ''' Process word and yield (index, x) for all states that word hits that have things to yield. '''
+ *         cdef int index = 0, letter
+ */
 
-static void __pyx_tp_dealloc_7bundler_10extensions_3FSM_FSM(PyObject *o) {
-  struct __pyx_obj_7bundler_10extensions_3FSM_FSM *p = (struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)o;
-  #if CYTHON_USE_TP_FINALIZE
-  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && !_PyGC_FINALIZED(o)) {
-    if (PyObject_CallFinalizerFromDealloc(o)) return;
+/* Python wrapper */
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_19hits(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_7bundler_10extensions_3FSM_3FSM_18hits[] = " Process word and yield (index, x) for all states that word hits that have things to yield. ";
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_19hits(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_word = 0;
+  int __pyx_v_run;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("hits (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_word,&__pyx_n_s_run,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_word)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_run);
+          if (value) { values[1] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "hits") < 0)) __PYX_ERR(0, 211, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_word = ((PyObject*)values[0]);
+    if (values[1]) {
+      __pyx_v_run = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_run == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 211, __pyx_L3_error)
+    } else {
+      __pyx_v_run = ((int)-1);
+    }
   }
-  #endif
-  PyObject_GC_UnTrack(o);
-  __Pyx_call_destructor(p->yield_states2);
-  __Pyx_call_destructor(p->yield_states2_starts);
-  Py_CLEAR(p->alphabet);
-  Py_CLEAR(p->machine);
-  Py_CLEAR(p->yield_states);
-  Py_CLEAR(p->distance_to_yield);
-  Py_CLEAR(p->has_yield);
-  (*Py_TYPE(o)->tp_free)(o);
-}
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("hits", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 211, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("bundler.extensions.FSM.FSM.hits", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_word), (&PyTuple_Type), 1, "word", 1))) __PYX_ERR(0, 211, __pyx_L1_error)
+  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_3FSM_18hits(((struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)__pyx_v_self), __pyx_v_word, __pyx_v_run);
 
-static int __pyx_tp_traverse_7bundler_10extensions_3FSM_FSM(PyObject *o, visitproc v, void *a) {
-  int e;
-  struct __pyx_obj_7bundler_10extensions_3FSM_FSM *p = (struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)o;
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_18hits(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self, PyObject *__pyx_v_word, int __pyx_v_run) {
+  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_7_hits *__pyx_cur_scope;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("hits", 0);
+  __pyx_cur_scope = (struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_7_hits *)__pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct_7_hits(__pyx_ptype_7bundler_10extensions_3FSM___pyx_scope_struct_7_hits, __pyx_empty_tuple, NULL);
+  if (unlikely(!__pyx_cur_scope)) {
+    __pyx_cur_scope = ((struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_7_hits *)Py_None);
+    __Pyx_INCREF(Py_None);
+    __PYX_ERR(0, 211, __pyx_L1_error)
+  } else {
+    __Pyx_GOTREF(__pyx_cur_scope);
+  }
+  __pyx_cur_scope->__pyx_v_self = __pyx_v_self;
+  __Pyx_INCREF((PyObject *)__pyx_cur_scope->__pyx_v_self);
+  __Pyx_GIVEREF((PyObject *)__pyx_cur_scope->__pyx_v_self);
+  __pyx_cur_scope->__pyx_v_word = __pyx_v_word;
+  __Pyx_INCREF(__pyx_cur_scope->__pyx_v_word);
+  __Pyx_GIVEREF(__pyx_cur_scope->__pyx_v_word);
+  __pyx_cur_scope->__pyx_v_run = __pyx_v_run;
+  {
+    __pyx_CoroutineObject *gen = __Pyx_Generator_New((__pyx_coroutine_body_t) __pyx_gb_7bundler_10extensions_3FSM_3FSM_20generator, NULL, (PyObject *) __pyx_cur_scope, __pyx_n_s_hits, __pyx_n_s_FSM_hits, __pyx_n_s_bundler_extensions_FSM); if (unlikely(!gen)) __PYX_ERR(0, 211, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_cur_scope);
+    __Pyx_RefNannyFinishContext();
+    return (PyObject *) gen;
+  }
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("bundler.extensions.FSM.FSM.hits", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_DECREF(((PyObject *)__pyx_cur_scope));
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_gb_7bundler_10extensions_3FSM_3FSM_20generator(__pyx_CoroutineObject *__pyx_generator, CYTHON_UNUSED PyThreadState *__pyx_tstate, PyObject *__pyx_sent_value) /* generator body */
+{
+  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_7_hits *__pyx_cur_scope = ((struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_7_hits *)__pyx_generator->closure);
+  PyObject *__pyx_r = NULL;
+  Py_ssize_t __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *(*__pyx_t_11)(PyObject *);
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("hits", 0);
+  switch (__pyx_generator->resume_label) {
+    case 0: goto __pyx_L3_first_run;
+    case 1: goto __pyx_L9_resume_from_yield;
+    default: /* CPython raises the right error here */
+    __Pyx_RefNannyFinishContext();
+    return NULL;
+  }
+  __pyx_L3_first_run:;
+  if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 211, __pyx_L1_error)
+
+  /* "bundler/extensions/FSM.pyx":213
+ *     def hits(self, tuple word, int run=-1):
+ *         ''' Process word and yield (index, x) for all states that word hits that have things to yield. '''
+ *         cdef int index = 0, letter             # <<<<<<<<<<<<<<
+ *         cdef int state = 0
+ *         cdef int length = len(word)
+ */
+  __pyx_cur_scope->__pyx_v_index = 0;
+
+  /* "bundler/extensions/FSM.pyx":214
+ *         ''' Process word and yield (index, x) for all states that word hits that have things to yield. '''
+ *         cdef int index = 0, letter
+ *         cdef int state = 0             # <<<<<<<<<<<<<<
+ *         cdef int length = len(word)
+ *         cdef int i = 0
+ */
+  __pyx_cur_scope->__pyx_v_state = 0;
+
+  /* "bundler/extensions/FSM.pyx":215
+ *         cdef int index = 0, letter
+ *         cdef int state = 0
+ *         cdef int length = len(word)             # <<<<<<<<<<<<<<
+ *         cdef int i = 0
+ *         for _ in range(length if run < 0 else run):
+ */
+  if (unlikely(__pyx_cur_scope->__pyx_v_word == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 215, __pyx_L1_error)
+  }
+  __pyx_t_1 = PyTuple_GET_SIZE(__pyx_cur_scope->__pyx_v_word); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 215, __pyx_L1_error)
+  __pyx_cur_scope->__pyx_v_length = __pyx_t_1;
+
+  /* "bundler/extensions/FSM.pyx":216
+ *         cdef int state = 0
+ *         cdef int length = len(word)
+ *         cdef int i = 0             # <<<<<<<<<<<<<<
+ *         for _ in range(length if run < 0 else run):
+ *             i += 1
+ */
+  __pyx_cur_scope->__pyx_v_i = 0;
+
+  /* "bundler/extensions/FSM.pyx":217
+ *         cdef int length = len(word)
+ *         cdef int i = 0
+ *         for _ in range(length if run < 0 else run):             # <<<<<<<<<<<<<<
+ *             i += 1
+ *             state = step(self, state, word[index])
+ */
+  if (((__pyx_cur_scope->__pyx_v_run < 0) != 0)) {
+    __pyx_t_2 = __pyx_cur_scope->__pyx_v_length;
+  } else {
+    __pyx_t_2 = __pyx_cur_scope->__pyx_v_run;
+  }
+  __pyx_t_3 = __pyx_t_2;
+  for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+    __pyx_cur_scope->__pyx_v__ = __pyx_t_4;
+
+    /* "bundler/extensions/FSM.pyx":218
+ *         cdef int i = 0
+ *         for _ in range(length if run < 0 else run):
+ *             i += 1             # <<<<<<<<<<<<<<
+ *             state = step(self, state, word[index])
+ *             if state < 0:
+ */
+    __pyx_cur_scope->__pyx_v_i = (__pyx_cur_scope->__pyx_v_i + 1);
+
+    /* "bundler/extensions/FSM.pyx":219
+ *         for _ in range(length if run < 0 else run):
+ *             i += 1
+ *             state = step(self, state, word[index])             # <<<<<<<<<<<<<<
+ *             if state < 0:
+ *                 raise ValueError('Invalid transition to state {}'.format(state))
+ */
+    if (unlikely(__pyx_cur_scope->__pyx_v_word == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(0, 219, __pyx_L1_error)
+    }
+    __pyx_t_5 = __Pyx_GetItemInt_Tuple(__pyx_cur_scope->__pyx_v_word, __pyx_cur_scope->__pyx_v_index, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 219, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_6 = __Pyx_PyInt_As_int(__pyx_t_5); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 219, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_cur_scope->__pyx_v_state = __pyx_f_7bundler_10extensions_3FSM_step(__pyx_cur_scope->__pyx_v_self, __pyx_cur_scope->__pyx_v_state, __pyx_t_6);
+
+    /* "bundler/extensions/FSM.pyx":220
+ *             i += 1
+ *             state = step(self, state, word[index])
+ *             if state < 0:             # <<<<<<<<<<<<<<
+ *                 raise ValueError('Invalid transition to state {}'.format(state))
+ *             for x in self.yield_states.get(state, []):
+ */
+    __pyx_t_7 = ((__pyx_cur_scope->__pyx_v_state < 0) != 0);
+    if (unlikely(__pyx_t_7)) {
+
+      /* "bundler/extensions/FSM.pyx":221
+ *             state = step(self, state, word[index])
+ *             if state < 0:
+ *                 raise ValueError('Invalid transition to state {}'.format(state))             # <<<<<<<<<<<<<<
+ *             for x in self.yield_states.get(state, []):
+ *                 yield (i, x)
+ */
+      __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_Invalid_transition_to_state, __pyx_n_s_format); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 221, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __pyx_t_9 = __Pyx_PyInt_From_int(__pyx_cur_scope->__pyx_v_state); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 221, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __pyx_t_10 = NULL;
+      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_8))) {
+        __pyx_t_10 = PyMethod_GET_SELF(__pyx_t_8);
+        if (likely(__pyx_t_10)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_8);
+          __Pyx_INCREF(__pyx_t_10);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_8, function);
+        }
+      }
+      __pyx_t_5 = (__pyx_t_10) ? __Pyx_PyObject_Call2Args(__pyx_t_8, __pyx_t_10, __pyx_t_9) : __Pyx_PyObject_CallOneArg(__pyx_t_8, __pyx_t_9);
+      __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 221, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __pyx_t_8 = __Pyx_PyObject_CallOneArg(__pyx_builtin_ValueError, __pyx_t_5); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 221, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_Raise(__pyx_t_8, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __PYX_ERR(0, 221, __pyx_L1_error)
+
+      /* "bundler/extensions/FSM.pyx":220
+ *             i += 1
+ *             state = step(self, state, word[index])
+ *             if state < 0:             # <<<<<<<<<<<<<<
+ *                 raise ValueError('Invalid transition to state {}'.format(state))
+ *             for x in self.yield_states.get(state, []):
+ */
+    }
+
+    /* "bundler/extensions/FSM.pyx":222
+ *             if state < 0:
+ *                 raise ValueError('Invalid transition to state {}'.format(state))
+ *             for x in self.yield_states.get(state, []):             # <<<<<<<<<<<<<<
+ *                 yield (i, x)
+ *             index += 1
+ */
+    if (unlikely(__pyx_cur_scope->__pyx_v_self->yield_states == Py_None)) {
+      PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "get");
+      __PYX_ERR(0, 222, __pyx_L1_error)
+    }
+    __pyx_t_8 = __Pyx_PyInt_From_int(__pyx_cur_scope->__pyx_v_state); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 222, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_5 = PyList_New(0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 222, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_9 = __Pyx_PyDict_GetItemDefault(__pyx_cur_scope->__pyx_v_self->yield_states, __pyx_t_8, __pyx_t_5); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 222, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (likely(PyList_CheckExact(__pyx_t_9)) || PyTuple_CheckExact(__pyx_t_9)) {
+      __pyx_t_5 = __pyx_t_9; __Pyx_INCREF(__pyx_t_5); __pyx_t_1 = 0;
+      __pyx_t_11 = NULL;
+    } else {
+      __pyx_t_1 = -1; __pyx_t_5 = PyObject_GetIter(__pyx_t_9); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 222, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_11 = Py_TYPE(__pyx_t_5)->tp_iternext; if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 222, __pyx_L1_error)
+    }
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    for (;;) {
+      if (likely(!__pyx_t_11)) {
+        if (likely(PyList_CheckExact(__pyx_t_5))) {
+          if (__pyx_t_1 >= PyList_GET_SIZE(__pyx_t_5)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_9 = PyList_GET_ITEM(__pyx_t_5, __pyx_t_1); __Pyx_INCREF(__pyx_t_9); __pyx_t_1++; if (unlikely(0 < 0)) __PYX_ERR(0, 222, __pyx_L1_error)
+          #else
+          __pyx_t_9 = PySequence_ITEM(__pyx_t_5, __pyx_t_1); __pyx_t_1++; if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 222, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          #endif
+        } else {
+          if (__pyx_t_1 >= PyTuple_GET_SIZE(__pyx_t_5)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_9 = PyTuple_GET_ITEM(__pyx_t_5, __pyx_t_1); __Pyx_INCREF(__pyx_t_9); __pyx_t_1++; if (unlikely(0 < 0)) __PYX_ERR(0, 222, __pyx_L1_error)
+          #else
+          __pyx_t_9 = PySequence_ITEM(__pyx_t_5, __pyx_t_1); __pyx_t_1++; if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 222, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          #endif
+        }
+      } else {
+        __pyx_t_9 = __pyx_t_11(__pyx_t_5);
+        if (unlikely(!__pyx_t_9)) {
+          PyObject* exc_type = PyErr_Occurred();
+          if (exc_type) {
+            if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+            else __PYX_ERR(0, 222, __pyx_L1_error)
+          }
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_9);
+      }
+      __Pyx_XGOTREF(__pyx_cur_scope->__pyx_v_x);
+      __Pyx_XDECREF_SET(__pyx_cur_scope->__pyx_v_x, __pyx_t_9);
+      __Pyx_GIVEREF(__pyx_t_9);
+      __pyx_t_9 = 0;
+
+      /* "bundler/extensions/FSM.pyx":223
+ *                 raise ValueError('Invalid transition to state {}'.format(state))
+ *             for x in self.yield_states.get(state, []):
+ *                 yield (i, x)             # <<<<<<<<<<<<<<
+ *             index += 1
+ *             if index == length: index = 0
+ */
+      __pyx_t_9 = __Pyx_PyInt_From_int(__pyx_cur_scope->__pyx_v_i); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 223, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __pyx_t_8 = PyTuple_New(2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 223, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_GIVEREF(__pyx_t_9);
+      PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_9);
+      __Pyx_INCREF(__pyx_cur_scope->__pyx_v_x);
+      __Pyx_GIVEREF(__pyx_cur_scope->__pyx_v_x);
+      PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_cur_scope->__pyx_v_x);
+      __pyx_t_9 = 0;
+      __pyx_r = __pyx_t_8;
+      __pyx_t_8 = 0;
+      __pyx_cur_scope->__pyx_t_0 = __pyx_t_1;
+      __pyx_cur_scope->__pyx_t_1 = __pyx_t_2;
+      __pyx_cur_scope->__pyx_t_2 = __pyx_t_3;
+      __pyx_cur_scope->__pyx_t_3 = __pyx_t_4;
+      __Pyx_XGIVEREF(__pyx_t_5);
+      __pyx_cur_scope->__pyx_t_4 = __pyx_t_5;
+      __pyx_cur_scope->__pyx_t_5 = __pyx_t_11;
+      __Pyx_XGIVEREF(__pyx_r);
+      __Pyx_RefNannyFinishContext();
+      __Pyx_Coroutine_ResetAndClearException(__pyx_generator);
+      /* return from generator, yielding value */
+      __pyx_generator->resume_label = 1;
+      return __pyx_r;
+      __pyx_L9_resume_from_yield:;
+      __pyx_t_1 = __pyx_cur_scope->__pyx_t_0;
+      __pyx_t_2 = __pyx_cur_scope->__pyx_t_1;
+      __pyx_t_3 = __pyx_cur_scope->__pyx_t_2;
+      __pyx_t_4 = __pyx_cur_scope->__pyx_t_3;
+      __pyx_t_5 = __pyx_cur_scope->__pyx_t_4;
+      __pyx_cur_scope->__pyx_t_4 = 0;
+      __Pyx_XGOTREF(__pyx_t_5);
+      __pyx_t_11 = __pyx_cur_scope->__pyx_t_5;
+      if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 223, __pyx_L1_error)
+
+      /* "bundler/extensions/FSM.pyx":222
+ *             if state < 0:
+ *                 raise ValueError('Invalid transition to state {}'.format(state))
+ *             for x in self.yield_states.get(state, []):             # <<<<<<<<<<<<<<
+ *                 yield (i, x)
+ *             index += 1
+ */
+    }
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+    /* "bundler/extensions/FSM.pyx":224
+ *             for x in self.yield_states.get(state, []):
+ *                 yield (i, x)
+ *             index += 1             # <<<<<<<<<<<<<<
+ *             if index == length: index = 0
+ * 
+ */
+    __pyx_cur_scope->__pyx_v_index = (__pyx_cur_scope->__pyx_v_index + 1);
+
+    /* "bundler/extensions/FSM.pyx":225
+ *                 yield (i, x)
+ *             index += 1
+ *             if index == length: index = 0             # <<<<<<<<<<<<<<
+ * 
+ *     cdef bint c_has_cycle(self, IWord& word, int depth):
+ */
+    __pyx_t_7 = ((__pyx_cur_scope->__pyx_v_index == __pyx_cur_scope->__pyx_v_length) != 0);
+    if (__pyx_t_7) {
+      __pyx_cur_scope->__pyx_v_index = 0;
+    }
+  }
+  CYTHON_MAYBE_UNUSED_VAR(__pyx_cur_scope);
+
+  /* "bundler/extensions/FSM.pyx":211
+ *         return returns
+ * 
+ *     def hits(self, tuple word, int run=-1):             # <<<<<<<<<<<<<<
+ *         ''' Process word and yield (index, x) for all states that word hits that have things to yield. '''
+ *         cdef int index = 0, letter
+ */
+
+  /* function exit code */
+  PyErr_SetNone(PyExc_StopIteration);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_AddTraceback("hits", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_r); __pyx_r = 0;
+  #if !CYTHON_USE_EXC_INFO_STACK
+  __Pyx_Coroutine_ResetAndClearException(__pyx_generator);
+  #endif
+  __pyx_generator->resume_label = -1;
+  __Pyx_Coroutine_clear((PyObject*)__pyx_generator);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bundler/extensions/FSM.pyx":227
+ *             if index == length: index = 0
+ * 
+ *     cdef bint c_has_cycle(self, IWord& word, int depth):             # <<<<<<<<<<<<<<
+ *         ''' Return whether there is a state < depth such that self(word, state) == state. '''
+ *         cdef int c, state
+ */
+
+static int __pyx_f_7bundler_10extensions_3FSM_3FSM_c_has_cycle(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self, __pyx_t_7bundler_10extensions_3FSM_IWord &__pyx_v_word, int __pyx_v_depth) {
+  int __pyx_v_c;
+  int __pyx_v_state;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  __Pyx_RefNannySetupContext("c_has_cycle", 0);
+
+  /* "bundler/extensions/FSM.pyx":231
+ *         cdef int c, state
+ * 
+ *         if depth < 0 or depth > self.machine_len: depth = self.machine_len             # <<<<<<<<<<<<<<
+ * 
+ *         for c in range(depth):
+ */
+  __pyx_t_2 = ((__pyx_v_depth < 0) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = ((__pyx_v_depth > __pyx_v_self->machine_len) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+    __pyx_t_3 = __pyx_v_self->machine_len;
+    __pyx_v_depth = __pyx_t_3;
+  }
+
+  /* "bundler/extensions/FSM.pyx":233
+ *         if depth < 0 or depth > self.machine_len: depth = self.machine_len
+ * 
+ *         for c in range(depth):             # <<<<<<<<<<<<<<
+ *             if self.itemsize == 1: state = follow(<signed char*>self.table, self.alphabet_len, c, word)
+ *             elif self.itemsize == 2: state = follow(<short*>self.table, self.alphabet_len, c, word)
+ */
+  __pyx_t_3 = __pyx_v_depth;
+  __pyx_t_4 = __pyx_t_3;
+  for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+    __pyx_v_c = __pyx_t_5;
+
+    /* "bundler/extensions/FSM.pyx":234
+ * 
+ *         for c in range(depth):
+ *             if self.itemsize == 1: state = follow(<signed char*>self.table, self.alphabet_len, c, word)             # <<<<<<<<<<<<<<
+ *             elif self.itemsize == 2: state = follow(<short*>self.table, self.alphabet_len, c, word)
+ *             else: state = follow(<int*>self.table, self.alphabet_len, c, word)
+ */
+    switch (__pyx_v_self->itemsize) {
+      case 1:
+      __pyx_v_state = __pyx_fuse_0__pyx_f_7bundler_10extensions_3FSM_follow(((signed char *)__pyx_v_self->table), __pyx_v_self->alphabet_len, __pyx_v_c, __pyx_v_word);
+      break;
+      case 2:
+
+      /* "bundler/extensions/FSM.pyx":235
+ *         for c in range(depth):
+ *             if self.itemsize == 1: state = follow(<signed char*>self.table, self.alphabet_len, c, word)
+ *             elif self.itemsize == 2: state = follow(<short*>self.table, self.alphabet_len, c, word)             # <<<<<<<<<<<<<<
+ *             else: state = follow(<int*>self.table, self.alphabet_len, c, word)
+ * 
+ */
+      __pyx_v_state = __pyx_fuse_1__pyx_f_7bundler_10extensions_3FSM_follow(((short *)__pyx_v_self->table), __pyx_v_self->alphabet_len, __pyx_v_c, __pyx_v_word);
+      break;
+      default:
+
+      /* "bundler/extensions/FSM.pyx":236
+ *             if self.itemsize == 1: state = follow(<signed char*>self.table, self.alphabet_len, c, word)
+ *             elif self.itemsize == 2: state = follow(<short*>self.table, self.alphabet_len, c, word)
+ *             else: state = follow(<int*>self.table, self.alphabet_len, c, word)             # <<<<<<<<<<<<<<
+ * 
+ *             if state == c:
+ */
+      __pyx_v_state = __pyx_fuse_2__pyx_f_7bundler_10extensions_3FSM_follow(((int *)__pyx_v_self->table), __pyx_v_self->alphabet_len, __pyx_v_c, __pyx_v_word);
+      break;
+    }
+
+    /* "bundler/extensions/FSM.pyx":238
+ *             else: state = follow(<int*>self.table, self.alphabet_len, c, word)
+ * 
+ *             if state == c:             # <<<<<<<<<<<<<<
+ *                 return True
+ * 
+ */
+    __pyx_t_1 = ((__pyx_v_state == __pyx_v_c) != 0);
+    if (__pyx_t_1) {
+
+      /* "bundler/extensions/FSM.pyx":239
+ * 
+ *             if state == c:
+ *                 return True             # <<<<<<<<<<<<<<
+ * 
+ *         return False
+ */
+      __pyx_r = 1;
+      goto __pyx_L0;
+
+      /* "bundler/extensions/FSM.pyx":238
+ *             else: state = follow(<int*>self.table, self.alphabet_len, c, word)
+ * 
+ *             if state == c:             # <<<<<<<<<<<<<<
+ *                 return True
+ * 
+ */
+    }
+  }
+
+  /* "bundler/extensions/FSM.pyx":241
+ *                 return True
+ * 
+ *         return False             # <<<<<<<<<<<<<<
+ * 
+ *     def has_cycle(self, tuple word, int depth=-1):
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "bundler/extensions/FSM.pyx":227
+ *             if index == length: index = 0
+ * 
+ *     cdef bint c_has_cycle(self, IWord& word, int depth):             # <<<<<<<<<<<<<<
+ *         ''' Return whether there is a state < depth such that self(word, state) == state. '''
+ *         cdef int c, state
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bundler/extensions/FSM.pyx":243
+ *         return False
+ * 
+ *     def has_cycle(self, tuple word, int depth=-1):             # <<<<<<<<<<<<<<
+ *         ''' Return whether there is a state such that self(word, state) == state. '''
+ *         return self.c_has_cycle(word, depth)
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_22has_cycle(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_7bundler_10extensions_3FSM_3FSM_21has_cycle[] = " Return whether there is a state such that self(word, state) == state. ";
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_22has_cycle(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_word = 0;
+  int __pyx_v_depth;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("has_cycle (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_word,&__pyx_n_s_depth,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_word)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_depth);
+          if (value) { values[1] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "has_cycle") < 0)) __PYX_ERR(0, 243, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_word = ((PyObject*)values[0]);
+    if (values[1]) {
+      __pyx_v_depth = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_depth == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 243, __pyx_L3_error)
+    } else {
+      __pyx_v_depth = ((int)-1);
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("has_cycle", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 243, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("bundler.extensions.FSM.FSM.has_cycle", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_word), (&PyTuple_Type), 1, "word", 1))) __PYX_ERR(0, 243, __pyx_L1_error)
+  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_3FSM_21has_cycle(((struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)__pyx_v_self), __pyx_v_word, __pyx_v_depth);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_21has_cycle(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self, PyObject *__pyx_v_word, int __pyx_v_depth) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __pyx_t_7bundler_10extensions_3FSM_IWord __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("has_cycle", 0);
+
+  /* "bundler/extensions/FSM.pyx":245
+ *     def has_cycle(self, tuple word, int depth=-1):
+ *         ''' Return whether there is a state such that self(word, state) == state. '''
+ *         return self.c_has_cycle(word, depth)             # <<<<<<<<<<<<<<
+ * 
+ *     def has_cycles(self, words, int depth=-1):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_convert_vector_from_py_int(__pyx_v_word); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 245, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyBool_FromLong(((struct __pyx_vtabstruct_7bundler_10extensions_3FSM_FSM *)__pyx_v_self->__pyx_vtab)->c_has_cycle(__pyx_v_self, __pyx_t_1, __pyx_v_depth)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 245, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "bundler/extensions/FSM.pyx":243
+ *         return False
+ * 
+ *     def has_cycle(self, tuple word, int depth=-1):             # <<<<<<<<<<<<<<
+ *         ''' Return whether there is a state such that self(word, state) == state. '''
+ *         return self.c_has_cycle(word, depth)
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("bundler.extensions.FSM.FSM.has_cycle", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bundler/extensions/FSM.pyx":247
+ *         return self.c_has_cycle(word, depth)
+ * 
+ *     def has_cycles(self, words, int depth=-1):             # <<<<<<<<<<<<<<
+ *         ''' Return a boolean array recording whether has_cycle(word, depth) for each row of the 2D array words.
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_24has_cycles(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_7bundler_10extensions_3FSM_3FSM_23has_cycles[] = " Return a boolean array recording whether has_cycle(word, depth) for each row of the 2D array words.\n        \n        All words are processed together, one letter at a time, using numpy. ";
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_24has_cycles(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_words = 0;
+  int __pyx_v_depth;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("has_cycles (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_words,&__pyx_n_s_depth,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_words)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_depth);
+          if (value) { values[1] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "has_cycles") < 0)) __PYX_ERR(0, 247, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_words = values[0];
+    if (values[1]) {
+      __pyx_v_depth = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_depth == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 247, __pyx_L3_error)
+    } else {
+      __pyx_v_depth = ((int)-1);
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("has_cycles", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 247, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("bundler.extensions.FSM.FSM.has_cycles", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_3FSM_23has_cycles(((struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)__pyx_v_self), __pyx_v_words, __pyx_v_depth);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_23has_cycles(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self, PyObject *__pyx_v_words, int __pyx_v_depth) {
+  PyObject *__pyx_v_table = NULL;
+  PyObject *__pyx_v_starts = NULL;
+  PyObject *__pyx_v_states = NULL;
+  PyObject *__pyx_v_i = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  int __pyx_t_8;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  Py_ssize_t __pyx_t_12;
+  PyObject *(*__pyx_t_13)(PyObject *);
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("has_cycles", 0);
+  __Pyx_INCREF(__pyx_v_words);
+
+  /* "bundler/extensions/FSM.pyx":251
+ * 
+ *         All words are processed together, one letter at a time, using numpy. '''
+ *         words = np.asarray(words, dtype=np.intp)             # <<<<<<<<<<<<<<
+ *         if depth < 0 or depth > self.machine_len: depth = self.machine_len
+ * 
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 251, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_asarray); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 251, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 251, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_v_words);
+  __Pyx_GIVEREF(__pyx_v_words);
+  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_words);
+  __pyx_t_3 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 251, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 251, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_intp); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 251, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_dtype, __pyx_t_5) < 0) __PYX_ERR(0, 251, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_1, __pyx_t_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 251, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF_SET(__pyx_v_words, __pyx_t_5);
+  __pyx_t_5 = 0;
+
+  /* "bundler/extensions/FSM.pyx":252
+ *         All words are processed together, one letter at a time, using numpy. '''
+ *         words = np.asarray(words, dtype=np.intp)
+ *         if depth < 0 or depth > self.machine_len: depth = self.machine_len             # <<<<<<<<<<<<<<
+ * 
+ *         # An extra row so that the invalid state -1 maps to itself.
+ */
+  __pyx_t_7 = ((__pyx_v_depth < 0) != 0);
+  if (!__pyx_t_7) {
+  } else {
+    __pyx_t_6 = __pyx_t_7;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_7 = ((__pyx_v_depth > __pyx_v_self->machine_len) != 0);
+  __pyx_t_6 = __pyx_t_7;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_6) {
+    __pyx_t_8 = __pyx_v_self->machine_len;
+    __pyx_v_depth = __pyx_t_8;
+  }
+
+  /* "bundler/extensions/FSM.pyx":255
+ * 
+ *         # An extra row so that the invalid state -1 maps to itself.
+ *         table = np.vstack([np.asarray(self.machine, dtype=np.intc).reshape(self.machine_len, self.alphabet_len), np.full((1, self.alphabet_len), -1, dtype=np.intc)])             # <<<<<<<<<<<<<<
+ *         starts = np.arange(depth)
+ *         states = np.tile(starts, (words.shape[0], 1))
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 255, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_vstack); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 255, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 255, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_asarray); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 255, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 255, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(((PyObject *)__pyx_v_self->machine));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_self->machine));
+  PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_v_self->machine));
+  __pyx_t_9 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 255, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __Pyx_GetModuleGlobalName(__pyx_t_10, __pyx_n_s_np); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 255, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_10);
+  __pyx_t_11 = __Pyx_PyObject_GetAttrStr(__pyx_t_10, __pyx_n_s_intc); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 255, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_11);
+  __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+  if (PyDict_SetItem(__pyx_t_9, __pyx_n_s_dtype, __pyx_t_11) < 0) __PYX_ERR(0, 255, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+  __pyx_t_11 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_2, __pyx_t_9); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 255, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_11);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_11, __pyx_n_s_reshape); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 255, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+  __pyx_t_11 = __Pyx_PyInt_From_int(__pyx_v_self->machine_len); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 255, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_11);
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_self->alphabet_len); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 255, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = NULL;
+  __pyx_t_8 = 0;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_9);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_9, function);
+      __pyx_t_8 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_9)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_t_11, __pyx_t_2};
+    __pyx_t_3 = __Pyx_PyFunction_FastCall(__pyx_t_9, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 255, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_9)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_t_11, __pyx_t_2};
+    __pyx_t_3 = __Pyx_PyCFunction_FastCall(__pyx_t_9, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 255, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  } else
+  #endif
+  {
+    __pyx_t_10 = PyTuple_New(2+__pyx_t_8); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 255, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_10);
+    if (__pyx_t_4) {
+      __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_10, 0, __pyx_t_4); __pyx_t_4 = NULL;
+    }
+    __Pyx_GIVEREF(__pyx_t_11);
+    PyTuple_SET_ITEM(__pyx_t_10, 0+__pyx_t_8, __pyx_t_11);
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_10, 1+__pyx_t_8, __pyx_t_2);
+    __pyx_t_11 = 0;
+    __pyx_t_2 = 0;
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_9, __pyx_t_10, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 255, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __Pyx_GetModuleGlobalName(__pyx_t_9, __pyx_n_s_np); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 255, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __pyx_t_10 = __Pyx_PyObject_GetAttrStr(__pyx_t_9, __pyx_n_s_full); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 255, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_10);
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __pyx_t_9 = __Pyx_PyInt_From_int(__pyx_v_self->alphabet_len); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 255, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 255, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_int_1);
+  __Pyx_GIVEREF(__pyx_int_1);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_int_1);
+  __Pyx_GIVEREF(__pyx_t_9);
+  PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_9);
+  __pyx_t_9 = 0;
+  __pyx_t_9 = PyTuple_New(2); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 255, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_2);
+  __Pyx_INCREF(__pyx_int_neg_1);
+  __Pyx_GIVEREF(__pyx_int_neg_1);
+  PyTuple_SET_ITEM(__pyx_t_9, 1, __pyx_int_neg_1);
+  __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 255, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GetModuleGlobalName(__pyx_t_11, __pyx_n_s_np); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 255, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_11);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_11, __pyx_n_s_intc); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 255, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_dtype, __pyx_t_4) < 0) __PYX_ERR(0, 255, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_10, __pyx_t_9, __pyx_t_2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 255, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = PyList_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 255, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyList_SET_ITEM(__pyx_t_2, 0, __pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyList_SET_ITEM(__pyx_t_2, 1, __pyx_t_4);
+  __pyx_t_3 = 0;
+  __pyx_t_4 = 0;
+  __pyx_t_4 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_1))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_1);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_1, function);
+    }
+  }
+  __pyx_t_5 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_4, __pyx_t_2) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 255, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_table = __pyx_t_5;
+  __pyx_t_5 = 0;
+
+  /* "bundler/extensions/FSM.pyx":256
+ *         # An extra row so that the invalid state -1 maps to itself.
+ *         table = np.vstack([np.asarray(self.machine, dtype=np.intc).reshape(self.machine_len, self.alphabet_len), np.full((1, self.alphabet_len), -1, dtype=np.intc)])
+ *         starts = np.arange(depth)             # <<<<<<<<<<<<<<
+ *         states = np.tile(starts, (words.shape[0], 1))
+ *         for i in range(words.shape[1]):
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 256, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_arange); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 256, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_depth); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 256, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_4 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+    }
+  }
+  __pyx_t_5 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_4, __pyx_t_1) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 256, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_starts = __pyx_t_5;
+  __pyx_t_5 = 0;
+
+  /* "bundler/extensions/FSM.pyx":257
+ *         table = np.vstack([np.asarray(self.machine, dtype=np.intc).reshape(self.machine_len, self.alphabet_len), np.full((1, self.alphabet_len), -1, dtype=np.intc)])
+ *         starts = np.arange(depth)
+ *         states = np.tile(starts, (words.shape[0], 1))             # <<<<<<<<<<<<<<
+ *         for i in range(words.shape[1]):
+ *             states = table[states, words[:, i, None]]
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 257, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_tile); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 257, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_words, __pyx_n_s_shape); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 257, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = __Pyx_GetItemInt(__pyx_t_2, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 257, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 257, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_4);
+  __Pyx_INCREF(__pyx_int_1);
+  __Pyx_GIVEREF(__pyx_int_1);
+  PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_int_1);
+  __pyx_t_4 = 0;
+  __pyx_t_4 = NULL;
+  __pyx_t_8 = 0;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_1))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_1);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_1, function);
+      __pyx_t_8 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_1)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_v_starts, __pyx_t_2};
+    __pyx_t_5 = __Pyx_PyFunction_FastCall(__pyx_t_1, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 257, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_1)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_v_starts, __pyx_t_2};
+    __pyx_t_5 = __Pyx_PyCFunction_FastCall(__pyx_t_1, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 257, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  } else
+  #endif
+  {
+    __pyx_t_3 = PyTuple_New(2+__pyx_t_8); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 257, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    if (__pyx_t_4) {
+      __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_4); __pyx_t_4 = NULL;
+    }
+    __Pyx_INCREF(__pyx_v_starts);
+    __Pyx_GIVEREF(__pyx_v_starts);
+    PyTuple_SET_ITEM(__pyx_t_3, 0+__pyx_t_8, __pyx_v_starts);
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_3, 1+__pyx_t_8, __pyx_t_2);
+    __pyx_t_2 = 0;
+    __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_3, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 257, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_states = __pyx_t_5;
+  __pyx_t_5 = 0;
+
+  /* "bundler/extensions/FSM.pyx":258
+ *         starts = np.arange(depth)
+ *         states = np.tile(starts, (words.shape[0], 1))
+ *         for i in range(words.shape[1]):             # <<<<<<<<<<<<<<
+ *             states = table[states, words[:, i, None]]
+ * 
+ */
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_words, __pyx_n_s_shape); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 258, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_1 = __Pyx_GetItemInt(__pyx_t_5, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 258, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyObject_CallOneArg(__pyx_builtin_range, __pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 258, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (likely(PyList_CheckExact(__pyx_t_5)) || PyTuple_CheckExact(__pyx_t_5)) {
+    __pyx_t_1 = __pyx_t_5; __Pyx_INCREF(__pyx_t_1); __pyx_t_12 = 0;
+    __pyx_t_13 = NULL;
+  } else {
+    __pyx_t_12 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 258, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_13 = Py_TYPE(__pyx_t_1)->tp_iternext; if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 258, __pyx_L1_error)
+  }
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  for (;;) {
+    if (likely(!__pyx_t_13)) {
+      if (likely(PyList_CheckExact(__pyx_t_1))) {
+        if (__pyx_t_12 >= PyList_GET_SIZE(__pyx_t_1)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_5 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_12); __Pyx_INCREF(__pyx_t_5); __pyx_t_12++; if (unlikely(0 < 0)) __PYX_ERR(0, 258, __pyx_L1_error)
+        #else
+        __pyx_t_5 = PySequence_ITEM(__pyx_t_1, __pyx_t_12); __pyx_t_12++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 258, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        #endif
+      } else {
+        if (__pyx_t_12 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_5 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_12); __Pyx_INCREF(__pyx_t_5); __pyx_t_12++; if (unlikely(0 < 0)) __PYX_ERR(0, 258, __pyx_L1_error)
+        #else
+        __pyx_t_5 = PySequence_ITEM(__pyx_t_1, __pyx_t_12); __pyx_t_12++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 258, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        #endif
+      }
+    } else {
+      __pyx_t_5 = __pyx_t_13(__pyx_t_1);
+      if (unlikely(!__pyx_t_5)) {
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+          else __PYX_ERR(0, 258, __pyx_L1_error)
+        }
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_5);
+    }
+    __Pyx_XDECREF_SET(__pyx_v_i, __pyx_t_5);
+    __pyx_t_5 = 0;
+
+    /* "bundler/extensions/FSM.pyx":259
+ *         states = np.tile(starts, (words.shape[0], 1))
+ *         for i in range(words.shape[1]):
+ *             states = table[states, words[:, i, None]]             # <<<<<<<<<<<<<<
+ * 
+ *         return (states == starts).any(axis=1)
+ */
+    __pyx_t_5 = PyTuple_New(3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 259, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_INCREF(__pyx_slice_);
+    __Pyx_GIVEREF(__pyx_slice_);
+    PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_slice_);
+    __Pyx_INCREF(__pyx_v_i);
+    __Pyx_GIVEREF(__pyx_v_i);
+    PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_v_i);
+    __Pyx_INCREF(Py_None);
+    __Pyx_GIVEREF(Py_None);
+    PyTuple_SET_ITEM(__pyx_t_5, 2, Py_None);
+    __pyx_t_3 = __Pyx_PyObject_GetItem(__pyx_v_words, __pyx_t_5); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 259, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 259, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_INCREF(__pyx_v_states);
+    __Pyx_GIVEREF(__pyx_v_states);
+    PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_v_states);
+    __Pyx_GIVEREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_t_3);
+    __pyx_t_3 = 0;
+    __pyx_t_3 = __Pyx_PyObject_GetItem(__pyx_v_table, __pyx_t_5); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 259, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF_SET(__pyx_v_states, __pyx_t_3);
+    __pyx_t_3 = 0;
+
+    /* "bundler/extensions/FSM.pyx":258
+ *         starts = np.arange(depth)
+ *         states = np.tile(starts, (words.shape[0], 1))
+ *         for i in range(words.shape[1]):             # <<<<<<<<<<<<<<
+ *             states = table[states, words[:, i, None]]
+ * 
+ */
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "bundler/extensions/FSM.pyx":261
+ *             states = table[states, words[:, i, None]]
+ * 
+ *         return (states == starts).any(axis=1)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyObject_RichCompare(__pyx_v_states, __pyx_v_starts, Py_EQ); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 261, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_any); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 261, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 261, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_axis, __pyx_int_1) < 0) __PYX_ERR(0, 261, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_empty_tuple, __pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 261, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_r = __pyx_t_5;
+  __pyx_t_5 = 0;
+  goto __pyx_L0;
+
+  /* "bundler/extensions/FSM.pyx":247
+ *         return self.c_has_cycle(word, depth)
+ * 
+ *     def has_cycles(self, words, int depth=-1):             # <<<<<<<<<<<<<<
+ *         ''' Return a boolean array recording whether has_cycle(word, depth) for each row of the 2D array words.
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_AddTraceback("bundler.extensions.FSM.FSM.has_cycles", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_table);
+  __Pyx_XDECREF(__pyx_v_starts);
+  __Pyx_XDECREF(__pyx_v_states);
+  __Pyx_XDECREF(__pyx_v_i);
+  __Pyx_XDECREF(__pyx_v_words);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bundler/extensions/FSM.pxd":12
+ * 
+ * cdef class FSM:
+ *     cdef readonly list alphabet             # <<<<<<<<<<<<<<
+ *     cdef int alphabet_len
+ *     cdef readonly array.array machine
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_8alphabet_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_8alphabet_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_3FSM_8alphabet___get__(((struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_8alphabet___get__(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_self->alphabet);
+  __pyx_r = __pyx_v_self->alphabet;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bundler/extensions/FSM.pxd":14
+ *     cdef readonly list alphabet
+ *     cdef int alphabet_len
+ *     cdef readonly array.array machine             # <<<<<<<<<<<<<<
+ *     cdef void* table
+ *     cdef int itemsize
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_7machine_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_7machine_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_3FSM_7machine___get__(((struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_7machine___get__(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(((PyObject *)__pyx_v_self->machine));
+  __pyx_r = ((PyObject *)__pyx_v_self->machine);
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bundler/extensions/FSM.pxd":18
+ *     cdef int itemsize
+ *     cdef int machine_len
+ *     cdef readonly dict yield_states             # <<<<<<<<<<<<<<
+ *     cdef readonly dict distance_to_yield
+ *     cdef array.array distances
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_12yield_states_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_12yield_states_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_3FSM_12yield_states___get__(((struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_12yield_states___get__(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_self->yield_states);
+  __pyx_r = __pyx_v_self->yield_states;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bundler/extensions/FSM.pxd":19
+ *     cdef int machine_len
+ *     cdef readonly dict yield_states
+ *     cdef readonly dict distance_to_yield             # <<<<<<<<<<<<<<
+ *     cdef array.array distances
+ *     cdef array.array has_yield
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_17distance_to_yield_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3FSM_17distance_to_yield_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_3FSM_17distance_to_yield___get__(((struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_3FSM_17distance_to_yield___get__(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_self->distance_to_yield);
+  __pyx_r = __pyx_v_self->distance_to_yield;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bundler/extensions/FSM.pyx":269
+ *     Extending the word by a letter costs one table lookup and we can roll back to any earlier depth,
+ *     so following a depth-first traversal costs O(1) per vertex rather than O(length). '''
+ *     def __init__(self, FSM machine):             # <<<<<<<<<<<<<<
+ *         self.machine = machine
+ *         self.states.push_back(0)  # states[i] is the state after reading i letters.
+ */
+
+/* Python wrapper */
+static int __pyx_pw_7bundler_10extensions_3FSM_9StatePath_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_7bundler_10extensions_3FSM_9StatePath_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_machine = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_machine,0};
+    PyObject* values[1] = {0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_machine)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 269, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 1) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+    }
+    __pyx_v_machine = ((struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)values[0]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__init__", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 269, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("bundler.extensions.FSM.StatePath.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_machine), __pyx_ptype_7bundler_10extensions_3FSM_FSM, 1, "machine", 0))) __PYX_ERR(0, 269, __pyx_L1_error)
+  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_9StatePath___init__(((struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *)__pyx_v_self), __pyx_v_machine);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_7bundler_10extensions_3FSM_9StatePath___init__(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *__pyx_v_self, struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_machine) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__init__", 0);
+
+  /* "bundler/extensions/FSM.pyx":270
+ *     so following a depth-first traversal costs O(1) per vertex rather than O(length). '''
+ *     def __init__(self, FSM machine):
+ *         self.machine = machine             # <<<<<<<<<<<<<<
+ *         self.states.push_back(0)  # states[i] is the state after reading i letters.
+ *         self.hits.push_back(0)  # hits[i] records whether a yield state was met within the first i letters.
+ */
+  __Pyx_INCREF(((PyObject *)__pyx_v_machine));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_machine));
+  __Pyx_GOTREF(__pyx_v_self->machine);
+  __Pyx_DECREF(((PyObject *)__pyx_v_self->machine));
+  __pyx_v_self->machine = __pyx_v_machine;
+
+  /* "bundler/extensions/FSM.pyx":271
+ *     def __init__(self, FSM machine):
+ *         self.machine = machine
+ *         self.states.push_back(0)  # states[i] is the state after reading i letters.             # <<<<<<<<<<<<<<
+ *         self.hits.push_back(0)  # hits[i] records whether a yield state was met within the first i letters.
+ * 
+ */
+  try {
+    __pyx_v_self->states.push_back(0);
+  } catch(...) {
+    __Pyx_CppExn2PyErr();
+    __PYX_ERR(0, 271, __pyx_L1_error)
+  }
+
+  /* "bundler/extensions/FSM.pyx":272
+ *         self.machine = machine
+ *         self.states.push_back(0)  # states[i] is the state after reading i letters.
+ *         self.hits.push_back(0)  # hits[i] records whether a yield state was met within the first i letters.             # <<<<<<<<<<<<<<
+ * 
+ *     cdef void c_push(self, int letter):
+ */
+  try {
+    __pyx_v_self->hits.push_back(0);
+  } catch(...) {
+    __Pyx_CppExn2PyErr();
+    __PYX_ERR(0, 272, __pyx_L1_error)
+  }
+
+  /* "bundler/extensions/FSM.pyx":269
+ *     Extending the word by a letter costs one table lookup and we can roll back to any earlier depth,
+ *     so following a depth-first traversal costs O(1) per vertex rather than O(length). '''
+ *     def __init__(self, FSM machine):             # <<<<<<<<<<<<<<
+ *         self.machine = machine
+ *         self.states.push_back(0)  # states[i] is the state after reading i letters.
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("bundler.extensions.FSM.StatePath.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bundler/extensions/FSM.pyx":274
+ *         self.hits.push_back(0)  # hits[i] records whether a yield state was met within the first i letters.
+ * 
+ *     cdef void c_push(self, int letter):             # <<<<<<<<<<<<<<
+ *         cdef int state = self.states.back()
+ *         if state >= 0:
+ */
+
+static void __pyx_f_7bundler_10extensions_3FSM_9StatePath_c_push(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *__pyx_v_self, int __pyx_v_letter) {
+  int __pyx_v_state;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("c_push", 0);
+
+  /* "bundler/extensions/FSM.pyx":275
+ * 
+ *     cdef void c_push(self, int letter):
+ *         cdef int state = self.states.back()             # <<<<<<<<<<<<<<
+ *         if state >= 0:
+ *             state = step(self.machine, state, letter)
+ */
+  __pyx_v_state = __pyx_v_self->states.back();
+
+  /* "bundler/extensions/FSM.pyx":276
+ *     cdef void c_push(self, int letter):
+ *         cdef int state = self.states.back()
+ *         if state >= 0:             # <<<<<<<<<<<<<<
+ *             state = step(self.machine, state, letter)
+ *         self.states.push_back(state)
+ */
+  __pyx_t_1 = ((__pyx_v_state >= 0) != 0);
+  if (__pyx_t_1) {
+
+    /* "bundler/extensions/FSM.pyx":277
+ *         cdef int state = self.states.back()
+ *         if state >= 0:
+ *             state = step(self.machine, state, letter)             # <<<<<<<<<<<<<<
+ *         self.states.push_back(state)
+ *         self.hits.push_back(self.hits.back() or (state >= 0 and self.machine.has_yield.data.as_ints[state]))
+ */
+    __pyx_t_2 = ((PyObject *)__pyx_v_self->machine);
+    __Pyx_INCREF(__pyx_t_2);
+    __pyx_v_state = __pyx_f_7bundler_10extensions_3FSM_step(((struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)__pyx_t_2), __pyx_v_state, __pyx_v_letter);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "bundler/extensions/FSM.pyx":276
+ *     cdef void c_push(self, int letter):
+ *         cdef int state = self.states.back()
+ *         if state >= 0:             # <<<<<<<<<<<<<<
+ *             state = step(self.machine, state, letter)
+ *         self.states.push_back(state)
+ */
+  }
+
+  /* "bundler/extensions/FSM.pyx":278
+ *         if state >= 0:
+ *             state = step(self.machine, state, letter)
+ *         self.states.push_back(state)             # <<<<<<<<<<<<<<
+ *         self.hits.push_back(self.hits.back() or (state >= 0 and self.machine.has_yield.data.as_ints[state]))
+ * 
+ */
+  try {
+    __pyx_v_self->states.push_back(__pyx_v_state);
+  } catch(...) {
+    __Pyx_CppExn2PyErr();
+    __PYX_ERR(0, 278, __pyx_L1_error)
+  }
+
+  /* "bundler/extensions/FSM.pyx":279
+ *             state = step(self.machine, state, letter)
+ *         self.states.push_back(state)
+ *         self.hits.push_back(self.hits.back() or (state >= 0 and self.machine.has_yield.data.as_ints[state]))             # <<<<<<<<<<<<<<
+ * 
+ *     cdef void c_truncate(self, int depth):
+ */
+  __pyx_t_4 = __pyx_v_self->hits.back();
+  if (!__pyx_t_4) {
+  } else {
+    __pyx_t_3 = __pyx_t_4;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_1 = (__pyx_v_state >= 0);
+  if (__pyx_t_1) {
+  } else {
+    __pyx_t_3 = __pyx_t_1;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_3 = (__pyx_v_self->machine->has_yield->data.as_ints[__pyx_v_state]);
+  __pyx_L4_bool_binop_done:;
+  try {
+    __pyx_v_self->hits.push_back(__pyx_t_3);
+  } catch(...) {
+    __Pyx_CppExn2PyErr();
+    __PYX_ERR(0, 279, __pyx_L1_error)
+  }
+
+  /* "bundler/extensions/FSM.pyx":274
+ *         self.hits.push_back(0)  # hits[i] records whether a yield state was met within the first i letters.
+ * 
+ *     cdef void c_push(self, int letter):             # <<<<<<<<<<<<<<
+ *         cdef int state = self.states.back()
+ *         if state >= 0:
+ */
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_WriteUnraisable("bundler.extensions.FSM.StatePath.c_push", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "bundler/extensions/FSM.pyx":281
+ *         self.hits.push_back(self.hits.back() or (state >= 0 and self.machine.has_yield.data.as_ints[state]))
+ * 
+ *     cdef void c_truncate(self, int depth):             # <<<<<<<<<<<<<<
+ *         if depth + 1 < <int>self.states.size():
+ *             self.states.resize(depth + 1)
+ */
+
+static void __pyx_f_7bundler_10extensions_3FSM_9StatePath_c_truncate(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *__pyx_v_self, int __pyx_v_depth) {
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("c_truncate", 0);
+
+  /* "bundler/extensions/FSM.pyx":282
+ * 
+ *     cdef void c_truncate(self, int depth):
+ *         if depth + 1 < <int>self.states.size():             # <<<<<<<<<<<<<<
+ *             self.states.resize(depth + 1)
+ *             self.hits.resize(depth + 1)
+ */
+  __pyx_t_1 = (((__pyx_v_depth + 1) < ((int)__pyx_v_self->states.size())) != 0);
+  if (__pyx_t_1) {
+
+    /* "bundler/extensions/FSM.pyx":283
+ *     cdef void c_truncate(self, int depth):
+ *         if depth + 1 < <int>self.states.size():
+ *             self.states.resize(depth + 1)             # <<<<<<<<<<<<<<
+ *             self.hits.resize(depth + 1)
+ * 
+ */
+    try {
+      __pyx_v_self->states.resize((__pyx_v_depth + 1));
+    } catch(...) {
+      __Pyx_CppExn2PyErr();
+      __PYX_ERR(0, 283, __pyx_L1_error)
+    }
+
+    /* "bundler/extensions/FSM.pyx":284
+ *         if depth + 1 < <int>self.states.size():
+ *             self.states.resize(depth + 1)
+ *             self.hits.resize(depth + 1)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef void c_sync(self, IWord& word, int depth):
+ */
+    try {
+      __pyx_v_self->hits.resize((__pyx_v_depth + 1));
+    } catch(...) {
+      __Pyx_CppExn2PyErr();
+      __PYX_ERR(0, 284, __pyx_L1_error)
+    }
+
+    /* "bundler/extensions/FSM.pyx":282
+ * 
+ *     cdef void c_truncate(self, int depth):
+ *         if depth + 1 < <int>self.states.size():             # <<<<<<<<<<<<<<
+ *             self.states.resize(depth + 1)
+ *             self.hits.resize(depth + 1)
+ */
+  }
+
+  /* "bundler/extensions/FSM.pyx":281
+ *         self.hits.push_back(self.hits.back() or (state >= 0 and self.machine.has_yield.data.as_ints[state]))
+ * 
+ *     cdef void c_truncate(self, int depth):             # <<<<<<<<<<<<<<
+ *         if depth + 1 < <int>self.states.size():
+ *             self.states.resize(depth + 1)
+ */
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_WriteUnraisable("bundler.extensions.FSM.StatePath.c_truncate", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "bundler/extensions/FSM.pyx":286
+ *             self.hits.resize(depth + 1)
+ * 
+ *     cdef void c_sync(self, IWord& word, int depth):             # <<<<<<<<<<<<<<
+ *         ''' Update the path to follow word, assuming that only letters after word[:depth] have changed. '''
+ *         cdef int i
+ */
+
+static void __pyx_f_7bundler_10extensions_3FSM_9StatePath_c_sync(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *__pyx_v_self, __pyx_t_7bundler_10extensions_3FSM_IWord &__pyx_v_word, int __pyx_v_depth) {
+  int __pyx_v_i;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  __Pyx_RefNannySetupContext("c_sync", 0);
+
+  /* "bundler/extensions/FSM.pyx":289
+ *         ''' Update the path to follow word, assuming that only letters after word[:depth] have changed. '''
+ *         cdef int i
+ *         self.c_truncate(depth)             # <<<<<<<<<<<<<<
+ *         for i in range(<int>self.states.size() - 1, <int>word.size()):
+ *             self.c_push(word[i])
+ */
+  ((struct __pyx_vtabstruct_7bundler_10extensions_3FSM_StatePath *)__pyx_v_self->__pyx_vtab)->c_truncate(__pyx_v_self, __pyx_v_depth);
+
+  /* "bundler/extensions/FSM.pyx":290
+ *         cdef int i
+ *         self.c_truncate(depth)
+ *         for i in range(<int>self.states.size() - 1, <int>word.size()):             # <<<<<<<<<<<<<<
+ *             self.c_push(word[i])
+ * 
+ */
+  __pyx_t_1 = ((int)__pyx_v_word.size());
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = (((int)__pyx_v_self->states.size()) - 1); __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_i = __pyx_t_3;
+
+    /* "bundler/extensions/FSM.pyx":291
+ *         self.c_truncate(depth)
+ *         for i in range(<int>self.states.size() - 1, <int>word.size()):
+ *             self.c_push(word[i])             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int c_state(self):
+ */
+    ((struct __pyx_vtabstruct_7bundler_10extensions_3FSM_StatePath *)__pyx_v_self->__pyx_vtab)->c_push(__pyx_v_self, (__pyx_v_word[__pyx_v_i]));
+  }
+
+  /* "bundler/extensions/FSM.pyx":286
+ *             self.hits.resize(depth + 1)
+ * 
+ *     cdef void c_sync(self, IWord& word, int depth):             # <<<<<<<<<<<<<<
+ *         ''' Update the path to follow word, assuming that only letters after word[:depth] have changed. '''
+ *         cdef int i
+ */
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "bundler/extensions/FSM.pyx":293
+ *             self.c_push(word[i])
+ * 
+ *     cdef int c_state(self):             # <<<<<<<<<<<<<<
+ *         return self.states.back()
+ * 
+ */
+
+static int __pyx_f_7bundler_10extensions_3FSM_9StatePath_c_state(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("c_state", 0);
+
+  /* "bundler/extensions/FSM.pyx":294
+ * 
+ *     cdef int c_state(self):
+ *         return self.states.back()             # <<<<<<<<<<<<<<
+ * 
+ *     cdef bint c_hit(self):
+ */
+  __pyx_r = __pyx_v_self->states.back();
+  goto __pyx_L0;
+
+  /* "bundler/extensions/FSM.pyx":293
+ *             self.c_push(word[i])
+ * 
+ *     cdef int c_state(self):             # <<<<<<<<<<<<<<
+ *         return self.states.back()
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bundler/extensions/FSM.pyx":296
+ *         return self.states.back()
+ * 
+ *     cdef bint c_hit(self):             # <<<<<<<<<<<<<<
+ *         return self.hits.back()
+ * 
+ */
+
+static int __pyx_f_7bundler_10extensions_3FSM_9StatePath_c_hit(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("c_hit", 0);
+
+  /* "bundler/extensions/FSM.pyx":297
+ * 
+ *     cdef bint c_hit(self):
+ *         return self.hits.back()             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int c_distance(self):
+ */
+  __pyx_r = __pyx_v_self->hits.back();
+  goto __pyx_L0;
+
+  /* "bundler/extensions/FSM.pyx":296
+ *         return self.states.back()
+ * 
+ *     cdef bint c_hit(self):             # <<<<<<<<<<<<<<
+ *         return self.hits.back()
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bundler/extensions/FSM.pyx":299
+ *         return self.hits.back()
+ * 
+ *     cdef int c_distance(self):             # <<<<<<<<<<<<<<
+ *         cdef int state = self.states.back()
+ *         return self.machine.distances.data.as_ints[state] if state >= 0 else UNREACHABLE
+ */
+
+static int __pyx_f_7bundler_10extensions_3FSM_9StatePath_c_distance(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *__pyx_v_self) {
+  int __pyx_v_state;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("c_distance", 0);
+
+  /* "bundler/extensions/FSM.pyx":300
+ * 
+ *     cdef int c_distance(self):
+ *         cdef int state = self.states.back()             # <<<<<<<<<<<<<<
+ *         return self.machine.distances.data.as_ints[state] if state >= 0 else UNREACHABLE
+ * 
+ */
+  __pyx_v_state = __pyx_v_self->states.back();
+
+  /* "bundler/extensions/FSM.pyx":301
+ *     cdef int c_distance(self):
+ *         cdef int state = self.states.back()
+ *         return self.machine.distances.data.as_ints[state] if state >= 0 else UNREACHABLE             # <<<<<<<<<<<<<<
+ * 
+ *     def __len__(self):
+ */
+  if (((__pyx_v_state >= 0) != 0)) {
+    __pyx_t_1 = (__pyx_v_self->machine->distances->data.as_ints[__pyx_v_state]);
+  } else {
+    __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_UNREACHABLE); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 301, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_t_2); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 301, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_1 = __pyx_t_3;
+  }
+  __pyx_r = __pyx_t_1;
+  goto __pyx_L0;
+
+  /* "bundler/extensions/FSM.pyx":299
+ *         return self.hits.back()
+ * 
+ *     cdef int c_distance(self):             # <<<<<<<<<<<<<<
+ *         cdef int state = self.states.back()
+ *         return self.machine.distances.data.as_ints[state] if state >= 0 else UNREACHABLE
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_WriteUnraisable("bundler.extensions.FSM.StatePath.c_distance", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bundler/extensions/FSM.pyx":303
+ *         return self.machine.distances.data.as_ints[state] if state >= 0 else UNREACHABLE
+ * 
+ *     def __len__(self):             # <<<<<<<<<<<<<<
+ *         return self.states.size() - 1
+ * 
+ */
+
+/* Python wrapper */
+static Py_ssize_t __pyx_pw_7bundler_10extensions_3FSM_9StatePath_3__len__(PyObject *__pyx_v_self); /*proto*/
+static Py_ssize_t __pyx_pw_7bundler_10extensions_3FSM_9StatePath_3__len__(PyObject *__pyx_v_self) {
+  Py_ssize_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__len__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_9StatePath_2__len__(((struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static Py_ssize_t __pyx_pf_7bundler_10extensions_3FSM_9StatePath_2__len__(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *__pyx_v_self) {
+  Py_ssize_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__len__", 0);
+
+  /* "bundler/extensions/FSM.pyx":304
+ * 
+ *     def __len__(self):
+ *         return self.states.size() - 1             # <<<<<<<<<<<<<<
+ * 
+ *     def push(self, int letter):
+ */
+  __pyx_r = (__pyx_v_self->states.size() - 1);
+  goto __pyx_L0;
+
+  /* "bundler/extensions/FSM.pyx":303
+ *         return self.machine.distances.data.as_ints[state] if state >= 0 else UNREACHABLE
+ * 
+ *     def __len__(self):             # <<<<<<<<<<<<<<
+ *         return self.states.size() - 1
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bundler/extensions/FSM.pyx":306
+ *         return self.states.size() - 1
+ * 
+ *     def push(self, int letter):             # <<<<<<<<<<<<<<
+ *         ''' Extend the word by letter. '''
+ *         self.c_push(letter)
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_9StatePath_5push(PyObject *__pyx_v_self, PyObject *__pyx_arg_letter); /*proto*/
+static char __pyx_doc_7bundler_10extensions_3FSM_9StatePath_4push[] = " Extend the word by letter. ";
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_9StatePath_5push(PyObject *__pyx_v_self, PyObject *__pyx_arg_letter) {
+  int __pyx_v_letter;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("push (wrapper)", 0);
+  assert(__pyx_arg_letter); {
+    __pyx_v_letter = __Pyx_PyInt_As_int(__pyx_arg_letter); if (unlikely((__pyx_v_letter == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 306, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("bundler.extensions.FSM.StatePath.push", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_9StatePath_4push(((struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *)__pyx_v_self), ((int)__pyx_v_letter));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_9StatePath_4push(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *__pyx_v_self, int __pyx_v_letter) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("push", 0);
+
+  /* "bundler/extensions/FSM.pyx":308
+ *     def push(self, int letter):
+ *         ''' Extend the word by letter. '''
+ *         self.c_push(letter)             # <<<<<<<<<<<<<<
+ * 
+ *     def truncate(self, int depth):
+ */
+  ((struct __pyx_vtabstruct_7bundler_10extensions_3FSM_StatePath *)__pyx_v_self->__pyx_vtab)->c_push(__pyx_v_self, __pyx_v_letter);
+
+  /* "bundler/extensions/FSM.pyx":306
+ *         return self.states.size() - 1
+ * 
+ *     def push(self, int letter):             # <<<<<<<<<<<<<<
+ *         ''' Extend the word by letter. '''
+ *         self.c_push(letter)
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bundler/extensions/FSM.pyx":310
+ *         self.c_push(letter)
+ * 
+ *     def truncate(self, int depth):             # <<<<<<<<<<<<<<
+ *         ''' Roll the word back to its first depth letters. '''
+ *         self.c_truncate(depth)
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_9StatePath_7truncate(PyObject *__pyx_v_self, PyObject *__pyx_arg_depth); /*proto*/
+static char __pyx_doc_7bundler_10extensions_3FSM_9StatePath_6truncate[] = " Roll the word back to its first depth letters. ";
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_9StatePath_7truncate(PyObject *__pyx_v_self, PyObject *__pyx_arg_depth) {
+  int __pyx_v_depth;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("truncate (wrapper)", 0);
+  assert(__pyx_arg_depth); {
+    __pyx_v_depth = __Pyx_PyInt_As_int(__pyx_arg_depth); if (unlikely((__pyx_v_depth == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 310, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("bundler.extensions.FSM.StatePath.truncate", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_9StatePath_6truncate(((struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *)__pyx_v_self), ((int)__pyx_v_depth));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_9StatePath_6truncate(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *__pyx_v_self, int __pyx_v_depth) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("truncate", 0);
+
+  /* "bundler/extensions/FSM.pyx":312
+ *     def truncate(self, int depth):
+ *         ''' Roll the word back to its first depth letters. '''
+ *         self.c_truncate(depth)             # <<<<<<<<<<<<<<
+ * 
+ *     def state(self):
+ */
+  ((struct __pyx_vtabstruct_7bundler_10extensions_3FSM_StatePath *)__pyx_v_self->__pyx_vtab)->c_truncate(__pyx_v_self, __pyx_v_depth);
+
+  /* "bundler/extensions/FSM.pyx":310
+ *         self.c_push(letter)
+ * 
+ *     def truncate(self, int depth):             # <<<<<<<<<<<<<<
+ *         ''' Roll the word back to its first depth letters. '''
+ *         self.c_truncate(depth)
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bundler/extensions/FSM.pyx":314
+ *         self.c_truncate(depth)
+ * 
+ *     def state(self):             # <<<<<<<<<<<<<<
+ *         ''' Return the current state of the machine. '''
+ *         return self.c_state()
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_9StatePath_9state(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_7bundler_10extensions_3FSM_9StatePath_8state[] = " Return the current state of the machine. ";
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_9StatePath_9state(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("state (wrapper)", 0);
+  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_9StatePath_8state(((struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_9StatePath_8state(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("state", 0);
+
+  /* "bundler/extensions/FSM.pyx":316
+ *     def state(self):
+ *         ''' Return the current state of the machine. '''
+ *         return self.c_state()             # <<<<<<<<<<<<<<
+ * 
+ *     def hit(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_int(((struct __pyx_vtabstruct_7bundler_10extensions_3FSM_StatePath *)__pyx_v_self->__pyx_vtab)->c_state(__pyx_v_self)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 316, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "bundler/extensions/FSM.pyx":314
+ *         self.c_truncate(depth)
+ * 
+ *     def state(self):             # <<<<<<<<<<<<<<
+ *         ''' Return the current state of the machine. '''
+ *         return self.c_state()
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("bundler.extensions.FSM.StatePath.state", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bundler/extensions/FSM.pyx":318
+ *         return self.c_state()
+ * 
+ *     def hit(self):             # <<<<<<<<<<<<<<
+ *         ''' Return whether the word read so far meets any state that yields. '''
+ *         return self.c_hit()
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_9StatePath_11hit(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_7bundler_10extensions_3FSM_9StatePath_10hit[] = " Return whether the word read so far meets any state that yields. ";
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_9StatePath_11hit(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("hit (wrapper)", 0);
+  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_9StatePath_10hit(((struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_9StatePath_10hit(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("hit", 0);
+
+  /* "bundler/extensions/FSM.pyx":320
+ *     def hit(self):
+ *         ''' Return whether the word read so far meets any state that yields. '''
+ *         return self.c_hit()             # <<<<<<<<<<<<<<
+ * 
+ *     def distance(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyBool_FromLong(((struct __pyx_vtabstruct_7bundler_10extensions_3FSM_StatePath *)__pyx_v_self->__pyx_vtab)->c_hit(__pyx_v_self)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "bundler/extensions/FSM.pyx":318
+ *         return self.c_state()
+ * 
+ *     def hit(self):             # <<<<<<<<<<<<<<
+ *         ''' Return whether the word read so far meets any state that yields. '''
+ *         return self.c_hit()
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("bundler.extensions.FSM.StatePath.hit", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bundler/extensions/FSM.pyx":322
+ *         return self.c_hit()
+ * 
+ *     def distance(self):             # <<<<<<<<<<<<<<
+ *         ''' Return the length of the shortest extension that reaches a yield state. '''
+ *         return self.c_distance()
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_9StatePath_13distance(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_7bundler_10extensions_3FSM_9StatePath_12distance[] = " Return the length of the shortest extension that reaches a yield state. ";
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_9StatePath_13distance(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("distance (wrapper)", 0);
+  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_9StatePath_12distance(((struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_9StatePath_12distance(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("distance", 0);
+
+  /* "bundler/extensions/FSM.pyx":324
+ *     def distance(self):
+ *         ''' Return the length of the shortest extension that reaches a yield state. '''
+ *         return self.c_distance()             # <<<<<<<<<<<<<<
+ * 
+ * cdef class TransitionMap:
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_int(((struct __pyx_vtabstruct_7bundler_10extensions_3FSM_StatePath *)__pyx_v_self->__pyx_vtab)->c_distance(__pyx_v_self)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 324, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "bundler/extensions/FSM.pyx":322
+ *         return self.c_hit()
+ * 
+ *     def distance(self):             # <<<<<<<<<<<<<<
+ *         ''' Return the length of the shortest extension that reaches a yield state. '''
+ *         return self.c_distance()
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("bundler.extensions.FSM.StatePath.distance", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     cdef tuple state
+ *     cdef object _dict
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_9StatePath_15__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_9StatePath_15__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_9StatePath_14__reduce_cython__(((struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_9StatePath_14__reduce_cython__(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *__pyx_v_self) {
+  PyObject *__pyx_v_state = 0;
+  PyObject *__pyx_v__dict = 0;
+  int __pyx_v_use_setstate;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+
+  /* "(tree fragment)":5
+ *     cdef object _dict
+ *     cdef bint use_setstate
+ *     state = (self.hits, self.machine, self.states)             # <<<<<<<<<<<<<<
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:
+ */
+  __pyx_t_1 = __pyx_convert_vector_to_py_int(__pyx_v_self->hits); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __pyx_convert_vector_to_py_int(__pyx_v_self->states); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1);
+  __Pyx_INCREF(((PyObject *)__pyx_v_self->machine));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_self->machine));
+  PyTuple_SET_ITEM(__pyx_t_3, 1, ((PyObject *)__pyx_v_self->machine));
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_t_2);
+  __pyx_t_1 = 0;
+  __pyx_t_2 = 0;
+  __pyx_v_state = ((PyObject*)__pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "(tree fragment)":6
+ *     cdef bint use_setstate
+ *     state = (self.hits, self.machine, self.states)
+ *     _dict = getattr(self, '__dict__', None)             # <<<<<<<<<<<<<<
+ *     if _dict is not None:
+ *         state += (_dict,)
+ */
+  __pyx_t_3 = __Pyx_GetAttr3(((PyObject *)__pyx_v_self), __pyx_n_s_dict, Py_None); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 6, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_v__dict = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "(tree fragment)":7
+ *     state = (self.hits, self.machine, self.states)
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:             # <<<<<<<<<<<<<<
+ *         state += (_dict,)
+ *         use_setstate = True
+ */
+  __pyx_t_4 = (__pyx_v__dict != Py_None);
+  __pyx_t_5 = (__pyx_t_4 != 0);
+  if (__pyx_t_5) {
+
+    /* "(tree fragment)":8
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:
+ *         state += (_dict,)             # <<<<<<<<<<<<<<
+ *         use_setstate = True
+ *     else:
+ */
+    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 8, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(__pyx_v__dict);
+    __Pyx_GIVEREF(__pyx_v__dict);
+    PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v__dict);
+    __pyx_t_2 = PyNumber_InPlaceAdd(__pyx_v_state, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 8, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF_SET(__pyx_v_state, ((PyObject*)__pyx_t_2));
+    __pyx_t_2 = 0;
+
+    /* "(tree fragment)":9
+ *     if _dict is not None:
+ *         state += (_dict,)
+ *         use_setstate = True             # <<<<<<<<<<<<<<
+ *     else:
+ *         use_setstate = self.machine is not None
+ */
+    __pyx_v_use_setstate = 1;
+
+    /* "(tree fragment)":7
+ *     state = (self.hits, self.machine, self.states)
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:             # <<<<<<<<<<<<<<
+ *         state += (_dict,)
+ *         use_setstate = True
+ */
+    goto __pyx_L3;
+  }
+
+  /* "(tree fragment)":11
+ *         use_setstate = True
+ *     else:
+ *         use_setstate = self.machine is not None             # <<<<<<<<<<<<<<
+ *     if use_setstate:
+ *         return __pyx_unpickle_StatePath, (type(self), 0x189366f, None), state
+ */
+  /*else*/ {
+    __pyx_t_5 = (((PyObject *)__pyx_v_self->machine) != Py_None);
+    __pyx_v_use_setstate = __pyx_t_5;
+  }
+  __pyx_L3:;
+
+  /* "(tree fragment)":12
+ *     else:
+ *         use_setstate = self.machine is not None
+ *     if use_setstate:             # <<<<<<<<<<<<<<
+ *         return __pyx_unpickle_StatePath, (type(self), 0x189366f, None), state
+ *     else:
+ */
+  __pyx_t_5 = (__pyx_v_use_setstate != 0);
+  if (__pyx_t_5) {
+
+    /* "(tree fragment)":13
+ *         use_setstate = self.machine is not None
+ *     if use_setstate:
+ *         return __pyx_unpickle_StatePath, (type(self), 0x189366f, None), state             # <<<<<<<<<<<<<<
+ *     else:
+ *         return __pyx_unpickle_StatePath, (type(self), 0x189366f, state)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_pyx_unpickle_StatePath); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_GIVEREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_INCREF(__pyx_int_25769583);
+    __Pyx_GIVEREF(__pyx_int_25769583);
+    PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_int_25769583);
+    __Pyx_INCREF(Py_None);
+    __Pyx_GIVEREF(Py_None);
+    PyTuple_SET_ITEM(__pyx_t_3, 2, Py_None);
+    __pyx_t_1 = PyTuple_New(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_3);
+    __Pyx_INCREF(__pyx_v_state);
+    __Pyx_GIVEREF(__pyx_v_state);
+    PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_v_state);
+    __pyx_t_2 = 0;
+    __pyx_t_3 = 0;
+    __pyx_r = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
+
+    /* "(tree fragment)":12
+ *     else:
+ *         use_setstate = self.machine is not None
+ *     if use_setstate:             # <<<<<<<<<<<<<<
+ *         return __pyx_unpickle_StatePath, (type(self), 0x189366f, None), state
+ *     else:
+ */
+  }
+
+  /* "(tree fragment)":15
+ *         return __pyx_unpickle_StatePath, (type(self), 0x189366f, None), state
+ *     else:
+ *         return __pyx_unpickle_StatePath, (type(self), 0x189366f, state)             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     __pyx_unpickle_StatePath__set_state(self, __pyx_state)
+ */
+  /*else*/ {
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_pyx_unpickle_StatePath); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_GIVEREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_INCREF(__pyx_int_25769583);
+    __Pyx_GIVEREF(__pyx_int_25769583);
+    PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_int_25769583);
+    __Pyx_INCREF(__pyx_v_state);
+    __Pyx_GIVEREF(__pyx_v_state);
+    PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_v_state);
+    __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_1);
+    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_3);
+    __pyx_t_1 = 0;
+    __pyx_t_3 = 0;
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+  }
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     cdef tuple state
+ *     cdef object _dict
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("bundler.extensions.FSM.StatePath.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_state);
+  __Pyx_XDECREF(__pyx_v__dict);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":16
+ *     else:
+ *         return __pyx_unpickle_StatePath, (type(self), 0x189366f, state)
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_unpickle_StatePath__set_state(self, __pyx_state)
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_9StatePath_17__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_9StatePath_17__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_9StatePath_16__setstate_cython__(((struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_9StatePath_16__setstate_cython__(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":17
+ *         return __pyx_unpickle_StatePath, (type(self), 0x189366f, state)
+ * def __setstate_cython__(self, __pyx_state):
+ *     __pyx_unpickle_StatePath__set_state(self, __pyx_state)             # <<<<<<<<<<<<<<
+ */
+  if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_v___pyx_state)->tp_name), 0))) __PYX_ERR(1, 17, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_7bundler_10extensions_3FSM___pyx_unpickle_StatePath__set_state(__pyx_v_self, ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 17, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "(tree fragment)":16
+ *     else:
+ *         return __pyx_unpickle_StatePath, (type(self), 0x189366f, state)
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_unpickle_StatePath__set_state(self, __pyx_state)
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("bundler.extensions.FSM.StatePath.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bundler/extensions/FSM.pyx":331
+ *     maps[i * width + c] is the state reached from state c after reading i letters or -1 if this
+ *     walks off of the machine. So has_cycle becomes a test for a fixed point of the top map. '''
+ *     def __init__(self, FSM machine, int depth=-1):             # <<<<<<<<<<<<<<
+ *         cdef int c
+ *         self.machine = machine
+ */
+
+/* Python wrapper */
+static int __pyx_pw_7bundler_10extensions_3FSM_13TransitionMap_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_7bundler_10extensions_3FSM_13TransitionMap_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_machine = 0;
+  int __pyx_v_depth;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_machine,&__pyx_n_s_depth,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_machine)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_depth);
+          if (value) { values[1] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 331, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_machine = ((struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)values[0]);
+    if (values[1]) {
+      __pyx_v_depth = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_depth == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 331, __pyx_L3_error)
+    } else {
+      __pyx_v_depth = ((int)-1);
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__init__", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 331, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("bundler.extensions.FSM.TransitionMap.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_machine), __pyx_ptype_7bundler_10extensions_3FSM_FSM, 1, "machine", 0))) __PYX_ERR(0, 331, __pyx_L1_error)
+  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_13TransitionMap___init__(((struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *)__pyx_v_self), __pyx_v_machine, __pyx_v_depth);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_7bundler_10extensions_3FSM_13TransitionMap___init__(struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *__pyx_v_self, struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_machine, int __pyx_v_depth) {
+  int __pyx_v_c;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__init__", 0);
+
+  /* "bundler/extensions/FSM.pyx":333
+ *     def __init__(self, FSM machine, int depth=-1):
+ *         cdef int c
+ *         self.machine = machine             # <<<<<<<<<<<<<<
+ *         self.width = depth if 0 <= depth <= machine.machine_len else machine.machine_len
+ *         for c in range(self.width):
+ */
+  __Pyx_INCREF(((PyObject *)__pyx_v_machine));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_machine));
+  __Pyx_GOTREF(__pyx_v_self->machine);
+  __Pyx_DECREF(((PyObject *)__pyx_v_self->machine));
+  __pyx_v_self->machine = __pyx_v_machine;
+
+  /* "bundler/extensions/FSM.pyx":334
+ *         cdef int c
+ *         self.machine = machine
+ *         self.width = depth if 0 <= depth <= machine.machine_len else machine.machine_len             # <<<<<<<<<<<<<<
+ *         for c in range(self.width):
+ *             self.maps.push_back(c)
+ */
+  __pyx_t_2 = (0 <= __pyx_v_depth);
+  if (__pyx_t_2) {
+    __pyx_t_2 = (__pyx_v_depth <= __pyx_v_machine->machine_len);
+  }
+  if ((__pyx_t_2 != 0)) {
+    __pyx_t_1 = __pyx_v_depth;
+  } else {
+    __pyx_t_1 = __pyx_v_machine->machine_len;
+  }
+  __pyx_v_self->width = __pyx_t_1;
+
+  /* "bundler/extensions/FSM.pyx":335
+ *         self.machine = machine
+ *         self.width = depth if 0 <= depth <= machine.machine_len else machine.machine_len
+ *         for c in range(self.width):             # <<<<<<<<<<<<<<
+ *             self.maps.push_back(c)
+ * 
+ */
+  __pyx_t_1 = __pyx_v_self->width;
+  __pyx_t_3 = __pyx_t_1;
+  for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+    __pyx_v_c = __pyx_t_4;
+
+    /* "bundler/extensions/FSM.pyx":336
+ *         self.width = depth if 0 <= depth <= machine.machine_len else machine.machine_len
+ *         for c in range(self.width):
+ *             self.maps.push_back(c)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef void c_push(self, int letter):
+ */
+    try {
+      __pyx_v_self->maps.push_back(__pyx_v_c);
+    } catch(...) {
+      __Pyx_CppExn2PyErr();
+      __PYX_ERR(0, 336, __pyx_L1_error)
+    }
+  }
+
+  /* "bundler/extensions/FSM.pyx":331
+ *     maps[i * width + c] is the state reached from state c after reading i letters or -1 if this
+ *     walks off of the machine. So has_cycle becomes a test for a fixed point of the top map. '''
+ *     def __init__(self, FSM machine, int depth=-1):             # <<<<<<<<<<<<<<
+ *         cdef int c
+ *         self.machine = machine
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("bundler.extensions.FSM.TransitionMap.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bundler/extensions/FSM.pyx":338
+ *             self.maps.push_back(c)
+ * 
+ *     cdef void c_push(self, int letter):             # <<<<<<<<<<<<<<
+ *         ''' Compose the top map with letter. '''
+ *         if self.machine.itemsize == 1: compose(<signed char*>self.machine.table, self.machine.alphabet_len, self.maps, self.width, letter)
+ */
+
+static void __pyx_f_7bundler_10extensions_3FSM_13TransitionMap_c_push(struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *__pyx_v_self, int __pyx_v_letter) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("c_push", 0);
+
+  /* "bundler/extensions/FSM.pyx":340
+ *     cdef void c_push(self, int letter):
+ *         ''' Compose the top map with letter. '''
+ *         if self.machine.itemsize == 1: compose(<signed char*>self.machine.table, self.machine.alphabet_len, self.maps, self.width, letter)             # <<<<<<<<<<<<<<
+ *         elif self.machine.itemsize == 2: compose(<short*>self.machine.table, self.machine.alphabet_len, self.maps, self.width, letter)
+ *         else: compose(<int*>self.machine.table, self.machine.alphabet_len, self.maps, self.width, letter)
+ */
+  switch (__pyx_v_self->machine->itemsize) {
+    case 1:
+    __pyx_fuse_0__pyx_f_7bundler_10extensions_3FSM_compose(((signed char *)__pyx_v_self->machine->table), __pyx_v_self->machine->alphabet_len, __pyx_v_self->maps, __pyx_v_self->width, __pyx_v_letter);
+    break;
+    case 2:
+
+    /* "bundler/extensions/FSM.pyx":341
+ *         ''' Compose the top map with letter. '''
+ *         if self.machine.itemsize == 1: compose(<signed char*>self.machine.table, self.machine.alphabet_len, self.maps, self.width, letter)
+ *         elif self.machine.itemsize == 2: compose(<short*>self.machine.table, self.machine.alphabet_len, self.maps, self.width, letter)             # <<<<<<<<<<<<<<
+ *         else: compose(<int*>self.machine.table, self.machine.alphabet_len, self.maps, self.width, letter)
+ * 
+ */
+    __pyx_fuse_1__pyx_f_7bundler_10extensions_3FSM_compose(((short *)__pyx_v_self->machine->table), __pyx_v_self->machine->alphabet_len, __pyx_v_self->maps, __pyx_v_self->width, __pyx_v_letter);
+    break;
+    default:
+
+    /* "bundler/extensions/FSM.pyx":342
+ *         if self.machine.itemsize == 1: compose(<signed char*>self.machine.table, self.machine.alphabet_len, self.maps, self.width, letter)
+ *         elif self.machine.itemsize == 2: compose(<short*>self.machine.table, self.machine.alphabet_len, self.maps, self.width, letter)
+ *         else: compose(<int*>self.machine.table, self.machine.alphabet_len, self.maps, self.width, letter)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef void c_truncate(self, int depth):
+ */
+    __pyx_fuse_2__pyx_f_7bundler_10extensions_3FSM_compose(((int *)__pyx_v_self->machine->table), __pyx_v_self->machine->alphabet_len, __pyx_v_self->maps, __pyx_v_self->width, __pyx_v_letter);
+    break;
+  }
+
+  /* "bundler/extensions/FSM.pyx":338
+ *             self.maps.push_back(c)
+ * 
+ *     cdef void c_push(self, int letter):             # <<<<<<<<<<<<<<
+ *         ''' Compose the top map with letter. '''
+ *         if self.machine.itemsize == 1: compose(<signed char*>self.machine.table, self.machine.alphabet_len, self.maps, self.width, letter)
+ */
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "bundler/extensions/FSM.pyx":344
+ *         else: compose(<int*>self.machine.table, self.machine.alphabet_len, self.maps, self.width, letter)
+ * 
+ *     cdef void c_truncate(self, int depth):             # <<<<<<<<<<<<<<
+ *         if (depth + 1) * self.width < <int>self.maps.size():
+ *             self.maps.resize((depth + 1) * self.width)
+ */
+
+static void __pyx_f_7bundler_10extensions_3FSM_13TransitionMap_c_truncate(struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *__pyx_v_self, int __pyx_v_depth) {
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("c_truncate", 0);
+
+  /* "bundler/extensions/FSM.pyx":345
+ * 
+ *     cdef void c_truncate(self, int depth):
+ *         if (depth + 1) * self.width < <int>self.maps.size():             # <<<<<<<<<<<<<<
+ *             self.maps.resize((depth + 1) * self.width)
+ * 
+ */
+  __pyx_t_1 = ((((__pyx_v_depth + 1) * __pyx_v_self->width) < ((int)__pyx_v_self->maps.size())) != 0);
+  if (__pyx_t_1) {
+
+    /* "bundler/extensions/FSM.pyx":346
+ *     cdef void c_truncate(self, int depth):
+ *         if (depth + 1) * self.width < <int>self.maps.size():
+ *             self.maps.resize((depth + 1) * self.width)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef void c_sync(self, IWord& word, int depth):
+ */
+    try {
+      __pyx_v_self->maps.resize(((__pyx_v_depth + 1) * __pyx_v_self->width));
+    } catch(...) {
+      __Pyx_CppExn2PyErr();
+      __PYX_ERR(0, 346, __pyx_L1_error)
+    }
+
+    /* "bundler/extensions/FSM.pyx":345
+ * 
+ *     cdef void c_truncate(self, int depth):
+ *         if (depth + 1) * self.width < <int>self.maps.size():             # <<<<<<<<<<<<<<
+ *             self.maps.resize((depth + 1) * self.width)
+ * 
+ */
+  }
+
+  /* "bundler/extensions/FSM.pyx":344
+ *         else: compose(<int*>self.machine.table, self.machine.alphabet_len, self.maps, self.width, letter)
+ * 
+ *     cdef void c_truncate(self, int depth):             # <<<<<<<<<<<<<<
+ *         if (depth + 1) * self.width < <int>self.maps.size():
+ *             self.maps.resize((depth + 1) * self.width)
+ */
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_WriteUnraisable("bundler.extensions.FSM.TransitionMap.c_truncate", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "bundler/extensions/FSM.pyx":348
+ *             self.maps.resize((depth + 1) * self.width)
+ * 
+ *     cdef void c_sync(self, IWord& word, int depth):             # <<<<<<<<<<<<<<
+ *         ''' Update the maps to follow word, assuming that only letters after word[:depth] have changed. '''
+ *         cdef int i
+ */
+
+static void __pyx_f_7bundler_10extensions_3FSM_13TransitionMap_c_sync(struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *__pyx_v_self, __pyx_t_7bundler_10extensions_3FSM_IWord &__pyx_v_word, int __pyx_v_depth) {
+  int __pyx_v_i;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("c_sync", 0);
+
+  /* "bundler/extensions/FSM.pyx":351
+ *         ''' Update the maps to follow word, assuming that only letters after word[:depth] have changed. '''
+ *         cdef int i
+ *         if self.width == 0: return             # <<<<<<<<<<<<<<
+ *         self.c_truncate(depth)
+ *         for i in range(<int>self.maps.size() // self.width - 1, <int>word.size()):
+ */
+  __pyx_t_1 = ((__pyx_v_self->width == 0) != 0);
+  if (__pyx_t_1) {
+    goto __pyx_L0;
+  }
+
+  /* "bundler/extensions/FSM.pyx":352
+ *         cdef int i
+ *         if self.width == 0: return
+ *         self.c_truncate(depth)             # <<<<<<<<<<<<<<
+ *         for i in range(<int>self.maps.size() // self.width - 1, <int>word.size()):
+ *             self.c_push(word[i])
+ */
+  ((struct __pyx_vtabstruct_7bundler_10extensions_3FSM_TransitionMap *)__pyx_v_self->__pyx_vtab)->c_truncate(__pyx_v_self, __pyx_v_depth);
+
+  /* "bundler/extensions/FSM.pyx":353
+ *         if self.width == 0: return
+ *         self.c_truncate(depth)
+ *         for i in range(<int>self.maps.size() // self.width - 1, <int>word.size()):             # <<<<<<<<<<<<<<
+ *             self.c_push(word[i])
+ * 
+ */
+  __pyx_t_2 = ((int)__pyx_v_word.size());
+  __pyx_t_3 = ((int)__pyx_v_self->maps.size());
+  if (unlikely(__pyx_v_self->width == 0)) {
+    PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
+    __PYX_ERR(0, 353, __pyx_L1_error)
+  }
+  else if (sizeof(int) == sizeof(long) && (!(((int)-1) > 0)) && unlikely(__pyx_v_self->width == (int)-1)  && unlikely(UNARY_NEG_WOULD_OVERFLOW(__pyx_t_3))) {
+    PyErr_SetString(PyExc_OverflowError, "value too large to perform division");
+    __PYX_ERR(0, 353, __pyx_L1_error)
+  }
+  __pyx_t_4 = __pyx_t_2;
+  for (__pyx_t_5 = (__Pyx_div_int(__pyx_t_3, __pyx_v_self->width) - 1); __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+    __pyx_v_i = __pyx_t_5;
+
+    /* "bundler/extensions/FSM.pyx":354
+ *         self.c_truncate(depth)
+ *         for i in range(<int>self.maps.size() // self.width - 1, <int>word.size()):
+ *             self.c_push(word[i])             # <<<<<<<<<<<<<<
+ * 
+ *     cdef bint c_has_fixed_point(self):
+ */
+    ((struct __pyx_vtabstruct_7bundler_10extensions_3FSM_TransitionMap *)__pyx_v_self->__pyx_vtab)->c_push(__pyx_v_self, (__pyx_v_word[__pyx_v_i]));
+  }
+
+  /* "bundler/extensions/FSM.pyx":348
+ *             self.maps.resize((depth + 1) * self.width)
+ * 
+ *     cdef void c_sync(self, IWord& word, int depth):             # <<<<<<<<<<<<<<
+ *         ''' Update the maps to follow word, assuming that only letters after word[:depth] have changed. '''
+ *         cdef int i
+ */
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_WriteUnraisable("bundler.extensions.FSM.TransitionMap.c_sync", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "bundler/extensions/FSM.pyx":356
+ *             self.c_push(word[i])
+ * 
+ *     cdef bint c_has_fixed_point(self):             # <<<<<<<<<<<<<<
+ *         cdef int start = self.maps.size() - self.width
+ *         cdef int c
+ */
+
+static int __pyx_f_7bundler_10extensions_3FSM_13TransitionMap_c_has_fixed_point(struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *__pyx_v_self) {
+  int __pyx_v_start;
+  int __pyx_v_c;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  __Pyx_RefNannySetupContext("c_has_fixed_point", 0);
+
+  /* "bundler/extensions/FSM.pyx":357
+ * 
+ *     cdef bint c_has_fixed_point(self):
+ *         cdef int start = self.maps.size() - self.width             # <<<<<<<<<<<<<<
+ *         cdef int c
+ *         for c in range(self.width):
+ */
+  __pyx_v_start = (__pyx_v_self->maps.size() - __pyx_v_self->width);
+
+  /* "bundler/extensions/FSM.pyx":359
+ *         cdef int start = self.maps.size() - self.width
+ *         cdef int c
+ *         for c in range(self.width):             # <<<<<<<<<<<<<<
+ *             if self.maps[start + c] == c:
+ *                 return True
+ */
+  __pyx_t_1 = __pyx_v_self->width;
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_c = __pyx_t_3;
+
+    /* "bundler/extensions/FSM.pyx":360
+ *         cdef int c
+ *         for c in range(self.width):
+ *             if self.maps[start + c] == c:             # <<<<<<<<<<<<<<
+ *                 return True
+ *         return False
+ */
+    __pyx_t_4 = (((__pyx_v_self->maps[(__pyx_v_start + __pyx_v_c)]) == __pyx_v_c) != 0);
+    if (__pyx_t_4) {
+
+      /* "bundler/extensions/FSM.pyx":361
+ *         for c in range(self.width):
+ *             if self.maps[start + c] == c:
+ *                 return True             # <<<<<<<<<<<<<<
+ *         return False
+ * 
+ */
+      __pyx_r = 1;
+      goto __pyx_L0;
+
+      /* "bundler/extensions/FSM.pyx":360
+ *         cdef int c
+ *         for c in range(self.width):
+ *             if self.maps[start + c] == c:             # <<<<<<<<<<<<<<
+ *                 return True
+ *         return False
+ */
+    }
+  }
+
+  /* "bundler/extensions/FSM.pyx":362
+ *             if self.maps[start + c] == c:
+ *                 return True
+ *         return False             # <<<<<<<<<<<<<<
+ * 
+ *     def __len__(self):
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "bundler/extensions/FSM.pyx":356
+ *             self.c_push(word[i])
+ * 
+ *     cdef bint c_has_fixed_point(self):             # <<<<<<<<<<<<<<
+ *         cdef int start = self.maps.size() - self.width
+ *         cdef int c
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bundler/extensions/FSM.pyx":364
+ *         return False
+ * 
+ *     def __len__(self):             # <<<<<<<<<<<<<<
+ *         return self.maps.size() // self.width - 1 if self.width else 0
+ * 
+ */
+
+/* Python wrapper */
+static Py_ssize_t __pyx_pw_7bundler_10extensions_3FSM_13TransitionMap_3__len__(PyObject *__pyx_v_self); /*proto*/
+static Py_ssize_t __pyx_pw_7bundler_10extensions_3FSM_13TransitionMap_3__len__(PyObject *__pyx_v_self) {
+  Py_ssize_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__len__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_13TransitionMap_2__len__(((struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static Py_ssize_t __pyx_pf_7bundler_10extensions_3FSM_13TransitionMap_2__len__(struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *__pyx_v_self) {
+  Py_ssize_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  std::vector<int> ::size_type __pyx_t_1;
+  std::vector<int> ::size_type __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__len__", 0);
+
+  /* "bundler/extensions/FSM.pyx":365
+ * 
+ *     def __len__(self):
+ *         return self.maps.size() // self.width - 1 if self.width else 0             # <<<<<<<<<<<<<<
+ * 
+ *     def push(self, int letter):
+ */
+  if ((__pyx_v_self->width != 0)) {
+    __pyx_t_2 = __pyx_v_self->maps.size();
+    if (unlikely(__pyx_v_self->width == 0)) {
+      PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
+      __PYX_ERR(0, 365, __pyx_L1_error)
+    }
+    __pyx_t_1 = ((__pyx_t_2 / __pyx_v_self->width) - 1);
+  } else {
+    __pyx_t_1 = 0;
+  }
+  __pyx_r = __pyx_t_1;
+  goto __pyx_L0;
+
+  /* "bundler/extensions/FSM.pyx":364
+ *         return False
+ * 
+ *     def __len__(self):             # <<<<<<<<<<<<<<
+ *         return self.maps.size() // self.width - 1 if self.width else 0
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("bundler.extensions.FSM.TransitionMap.__len__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bundler/extensions/FSM.pyx":367
+ *         return self.maps.size() // self.width - 1 if self.width else 0
+ * 
+ *     def push(self, int letter):             # <<<<<<<<<<<<<<
+ *         ''' Extend the word by letter. '''
+ *         self.c_push(letter)
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_13TransitionMap_5push(PyObject *__pyx_v_self, PyObject *__pyx_arg_letter); /*proto*/
+static char __pyx_doc_7bundler_10extensions_3FSM_13TransitionMap_4push[] = " Extend the word by letter. ";
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_13TransitionMap_5push(PyObject *__pyx_v_self, PyObject *__pyx_arg_letter) {
+  int __pyx_v_letter;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("push (wrapper)", 0);
+  assert(__pyx_arg_letter); {
+    __pyx_v_letter = __Pyx_PyInt_As_int(__pyx_arg_letter); if (unlikely((__pyx_v_letter == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 367, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("bundler.extensions.FSM.TransitionMap.push", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_13TransitionMap_4push(((struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *)__pyx_v_self), ((int)__pyx_v_letter));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_13TransitionMap_4push(struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *__pyx_v_self, int __pyx_v_letter) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("push", 0);
+
+  /* "bundler/extensions/FSM.pyx":369
+ *     def push(self, int letter):
+ *         ''' Extend the word by letter. '''
+ *         self.c_push(letter)             # <<<<<<<<<<<<<<
+ * 
+ *     def truncate(self, int depth):
+ */
+  ((struct __pyx_vtabstruct_7bundler_10extensions_3FSM_TransitionMap *)__pyx_v_self->__pyx_vtab)->c_push(__pyx_v_self, __pyx_v_letter);
+
+  /* "bundler/extensions/FSM.pyx":367
+ *         return self.maps.size() // self.width - 1 if self.width else 0
+ * 
+ *     def push(self, int letter):             # <<<<<<<<<<<<<<
+ *         ''' Extend the word by letter. '''
+ *         self.c_push(letter)
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bundler/extensions/FSM.pyx":371
+ *         self.c_push(letter)
+ * 
+ *     def truncate(self, int depth):             # <<<<<<<<<<<<<<
+ *         ''' Roll the word back to its first depth letters. '''
+ *         self.c_truncate(depth)
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_13TransitionMap_7truncate(PyObject *__pyx_v_self, PyObject *__pyx_arg_depth); /*proto*/
+static char __pyx_doc_7bundler_10extensions_3FSM_13TransitionMap_6truncate[] = " Roll the word back to its first depth letters. ";
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_13TransitionMap_7truncate(PyObject *__pyx_v_self, PyObject *__pyx_arg_depth) {
+  int __pyx_v_depth;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("truncate (wrapper)", 0);
+  assert(__pyx_arg_depth); {
+    __pyx_v_depth = __Pyx_PyInt_As_int(__pyx_arg_depth); if (unlikely((__pyx_v_depth == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 371, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("bundler.extensions.FSM.TransitionMap.truncate", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_13TransitionMap_6truncate(((struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *)__pyx_v_self), ((int)__pyx_v_depth));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_13TransitionMap_6truncate(struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *__pyx_v_self, int __pyx_v_depth) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("truncate", 0);
+
+  /* "bundler/extensions/FSM.pyx":373
+ *     def truncate(self, int depth):
+ *         ''' Roll the word back to its first depth letters. '''
+ *         self.c_truncate(depth)             # <<<<<<<<<<<<<<
+ * 
+ *     def has_fixed_point(self):
+ */
+  ((struct __pyx_vtabstruct_7bundler_10extensions_3FSM_TransitionMap *)__pyx_v_self->__pyx_vtab)->c_truncate(__pyx_v_self, __pyx_v_depth);
+
+  /* "bundler/extensions/FSM.pyx":371
+ *         self.c_push(letter)
+ * 
+ *     def truncate(self, int depth):             # <<<<<<<<<<<<<<
+ *         ''' Roll the word back to its first depth letters. '''
+ *         self.c_truncate(depth)
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bundler/extensions/FSM.pyx":375
+ *         self.c_truncate(depth)
+ * 
+ *     def has_fixed_point(self):             # <<<<<<<<<<<<<<
+ *         ''' Return whether the word read so far fixes any of the states. '''
+ *         return self.c_has_fixed_point()
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_13TransitionMap_9has_fixed_point(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_7bundler_10extensions_3FSM_13TransitionMap_8has_fixed_point[] = " Return whether the word read so far fixes any of the states. ";
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_13TransitionMap_9has_fixed_point(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("has_fixed_point (wrapper)", 0);
+  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_13TransitionMap_8has_fixed_point(((struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_13TransitionMap_8has_fixed_point(struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("has_fixed_point", 0);
+
+  /* "bundler/extensions/FSM.pyx":377
+ *     def has_fixed_point(self):
+ *         ''' Return whether the word read so far fixes any of the states. '''
+ *         return self.c_has_fixed_point()             # <<<<<<<<<<<<<<
+ * 
+ *     def image(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyBool_FromLong(((struct __pyx_vtabstruct_7bundler_10extensions_3FSM_TransitionMap *)__pyx_v_self->__pyx_vtab)->c_has_fixed_point(__pyx_v_self)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 377, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "bundler/extensions/FSM.pyx":375
+ *         self.c_truncate(depth)
+ * 
+ *     def has_fixed_point(self):             # <<<<<<<<<<<<<<
+ *         ''' Return whether the word read so far fixes any of the states. '''
+ *         return self.c_has_fixed_point()
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("bundler.extensions.FSM.TransitionMap.has_fixed_point", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bundler/extensions/FSM.pyx":379
+ *         return self.c_has_fixed_point()
+ * 
+ *     def image(self):             # <<<<<<<<<<<<<<
+ *         ''' Return the list of images of the states under the word read so far. '''
+ *         return [self.maps[i] for i in range(<int>self.maps.size() - self.width, self.maps.size())]
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_13TransitionMap_11image(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_7bundler_10extensions_3FSM_13TransitionMap_10image[] = " Return the list of images of the states under the word read so far. ";
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_13TransitionMap_11image(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("image (wrapper)", 0);
+  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_13TransitionMap_10image(((struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_13TransitionMap_10image(struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *__pyx_v_self) {
+  std::vector<int> ::size_type __pyx_8genexpr8__pyx_v_i;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  std::vector<int> ::size_type __pyx_t_2;
+  std::vector<int> ::size_type __pyx_t_3;
+  std::vector<int> ::size_type __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("image", 0);
+
+  /* "bundler/extensions/FSM.pyx":381
+ *     def image(self):
+ *         ''' Return the list of images of the states under the word read so far. '''
+ *         return [self.maps[i] for i in range(<int>self.maps.size() - self.width, self.maps.size())]             # <<<<<<<<<<<<<<
+ * 
+ * def aho_corasick(int alphabet_len, words):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  { /* enter inner scope */
+    __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 381, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = __pyx_v_self->maps.size();
+    __pyx_t_3 = __pyx_t_2;
+    for (__pyx_t_4 = (((int)__pyx_v_self->maps.size()) - __pyx_v_self->width); __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+      __pyx_8genexpr8__pyx_v_i = __pyx_t_4;
+      __pyx_t_5 = __Pyx_PyInt_From_int((__pyx_v_self->maps[__pyx_8genexpr8__pyx_v_i])); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 381, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      if (unlikely(__Pyx_ListComp_Append(__pyx_t_1, (PyObject*)__pyx_t_5))) __PYX_ERR(0, 381, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    }
+  } /* exit inner scope */
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "bundler/extensions/FSM.pyx":379
+ *         return self.c_has_fixed_point()
+ * 
+ *     def image(self):             # <<<<<<<<<<<<<<
+ *         ''' Return the list of images of the states under the word read so far. '''
+ *         return [self.maps[i] for i in range(<int>self.maps.size() - self.width, self.maps.size())]
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("bundler.extensions.FSM.TransitionMap.image", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     cdef tuple state
+ *     cdef object _dict
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_13TransitionMap_13__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_13TransitionMap_13__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_13TransitionMap_12__reduce_cython__(((struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_13TransitionMap_12__reduce_cython__(struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *__pyx_v_self) {
+  PyObject *__pyx_v_state = 0;
+  PyObject *__pyx_v__dict = 0;
+  int __pyx_v_use_setstate;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+
+  /* "(tree fragment)":5
+ *     cdef object _dict
+ *     cdef bint use_setstate
+ *     state = (self.machine, self.maps, self.width)             # <<<<<<<<<<<<<<
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:
+ */
+  __pyx_t_1 = __pyx_convert_vector_to_py_int(__pyx_v_self->maps); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_self->width); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_INCREF(((PyObject *)__pyx_v_self->machine));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_self->machine));
+  PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_v_self->machine));
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_t_2);
+  __pyx_t_1 = 0;
+  __pyx_t_2 = 0;
+  __pyx_v_state = ((PyObject*)__pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "(tree fragment)":6
+ *     cdef bint use_setstate
+ *     state = (self.machine, self.maps, self.width)
+ *     _dict = getattr(self, '__dict__', None)             # <<<<<<<<<<<<<<
+ *     if _dict is not None:
+ *         state += (_dict,)
+ */
+  __pyx_t_3 = __Pyx_GetAttr3(((PyObject *)__pyx_v_self), __pyx_n_s_dict, Py_None); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 6, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_v__dict = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "(tree fragment)":7
+ *     state = (self.machine, self.maps, self.width)
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:             # <<<<<<<<<<<<<<
+ *         state += (_dict,)
+ *         use_setstate = True
+ */
+  __pyx_t_4 = (__pyx_v__dict != Py_None);
+  __pyx_t_5 = (__pyx_t_4 != 0);
+  if (__pyx_t_5) {
+
+    /* "(tree fragment)":8
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:
+ *         state += (_dict,)             # <<<<<<<<<<<<<<
+ *         use_setstate = True
+ *     else:
+ */
+    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 8, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(__pyx_v__dict);
+    __Pyx_GIVEREF(__pyx_v__dict);
+    PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v__dict);
+    __pyx_t_2 = PyNumber_InPlaceAdd(__pyx_v_state, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 8, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF_SET(__pyx_v_state, ((PyObject*)__pyx_t_2));
+    __pyx_t_2 = 0;
+
+    /* "(tree fragment)":9
+ *     if _dict is not None:
+ *         state += (_dict,)
+ *         use_setstate = True             # <<<<<<<<<<<<<<
+ *     else:
+ *         use_setstate = self.machine is not None
+ */
+    __pyx_v_use_setstate = 1;
+
+    /* "(tree fragment)":7
+ *     state = (self.machine, self.maps, self.width)
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:             # <<<<<<<<<<<<<<
+ *         state += (_dict,)
+ *         use_setstate = True
+ */
+    goto __pyx_L3;
+  }
+
+  /* "(tree fragment)":11
+ *         use_setstate = True
+ *     else:
+ *         use_setstate = self.machine is not None             # <<<<<<<<<<<<<<
+ *     if use_setstate:
+ *         return __pyx_unpickle_TransitionMap, (type(self), 0x502d9fe, None), state
+ */
+  /*else*/ {
+    __pyx_t_5 = (((PyObject *)__pyx_v_self->machine) != Py_None);
+    __pyx_v_use_setstate = __pyx_t_5;
+  }
+  __pyx_L3:;
+
+  /* "(tree fragment)":12
+ *     else:
+ *         use_setstate = self.machine is not None
+ *     if use_setstate:             # <<<<<<<<<<<<<<
+ *         return __pyx_unpickle_TransitionMap, (type(self), 0x502d9fe, None), state
+ *     else:
+ */
+  __pyx_t_5 = (__pyx_v_use_setstate != 0);
+  if (__pyx_t_5) {
+
+    /* "(tree fragment)":13
+ *         use_setstate = self.machine is not None
+ *     if use_setstate:
+ *         return __pyx_unpickle_TransitionMap, (type(self), 0x502d9fe, None), state             # <<<<<<<<<<<<<<
+ *     else:
+ *         return __pyx_unpickle_TransitionMap, (type(self), 0x502d9fe, state)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_pyx_unpickle_TransitionMap); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_GIVEREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_INCREF(__pyx_int_84072958);
+    __Pyx_GIVEREF(__pyx_int_84072958);
+    PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_int_84072958);
+    __Pyx_INCREF(Py_None);
+    __Pyx_GIVEREF(Py_None);
+    PyTuple_SET_ITEM(__pyx_t_3, 2, Py_None);
+    __pyx_t_1 = PyTuple_New(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_3);
+    __Pyx_INCREF(__pyx_v_state);
+    __Pyx_GIVEREF(__pyx_v_state);
+    PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_v_state);
+    __pyx_t_2 = 0;
+    __pyx_t_3 = 0;
+    __pyx_r = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
+
+    /* "(tree fragment)":12
+ *     else:
+ *         use_setstate = self.machine is not None
+ *     if use_setstate:             # <<<<<<<<<<<<<<
+ *         return __pyx_unpickle_TransitionMap, (type(self), 0x502d9fe, None), state
+ *     else:
+ */
+  }
+
+  /* "(tree fragment)":15
+ *         return __pyx_unpickle_TransitionMap, (type(self), 0x502d9fe, None), state
+ *     else:
+ *         return __pyx_unpickle_TransitionMap, (type(self), 0x502d9fe, state)             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     __pyx_unpickle_TransitionMap__set_state(self, __pyx_state)
+ */
+  /*else*/ {
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_pyx_unpickle_TransitionMap); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_GIVEREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_INCREF(__pyx_int_84072958);
+    __Pyx_GIVEREF(__pyx_int_84072958);
+    PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_int_84072958);
+    __Pyx_INCREF(__pyx_v_state);
+    __Pyx_GIVEREF(__pyx_v_state);
+    PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_v_state);
+    __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_1);
+    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_3);
+    __pyx_t_1 = 0;
+    __pyx_t_3 = 0;
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+  }
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     cdef tuple state
+ *     cdef object _dict
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("bundler.extensions.FSM.TransitionMap.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_state);
+  __Pyx_XDECREF(__pyx_v__dict);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":16
+ *     else:
+ *         return __pyx_unpickle_TransitionMap, (type(self), 0x502d9fe, state)
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_unpickle_TransitionMap__set_state(self, __pyx_state)
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_13TransitionMap_15__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_13TransitionMap_15__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_13TransitionMap_14__setstate_cython__(((struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_13TransitionMap_14__setstate_cython__(struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":17
+ *         return __pyx_unpickle_TransitionMap, (type(self), 0x502d9fe, state)
+ * def __setstate_cython__(self, __pyx_state):
+ *     __pyx_unpickle_TransitionMap__set_state(self, __pyx_state)             # <<<<<<<<<<<<<<
+ */
+  if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_v___pyx_state)->tp_name), 0))) __PYX_ERR(1, 17, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_7bundler_10extensions_3FSM___pyx_unpickle_TransitionMap__set_state(__pyx_v_self, ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 17, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "(tree fragment)":16
+ *     else:
+ *         return __pyx_unpickle_TransitionMap, (type(self), 0x502d9fe, state)
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_unpickle_TransitionMap__set_state(self, __pyx_state)
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("bundler.extensions.FSM.TransitionMap.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bundler/extensions/FSM.pyx":383
+ *         return [self.maps[i] for i in range(<int>self.maps.size() - self.width, self.maps.size())]
+ * 
+ * def aho_corasick(int alphabet_len, words):             # <<<<<<<<<<<<<<
+ *     ''' Return the transitions of the Aho-Corasick automaton that detects the given words, whose letters are in range(alphabet_len).
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_1aho_corasick(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_7bundler_10extensions_3FSM_aho_corasick[] = " Return the transitions of the Aho-Corasick automaton that detects the given words, whose letters are in range(alphabet_len).\n    \n    Returns (machine, accepting) where machine is the flat transition table and accepting is a dictionary mapping each\n    state that some word is a suffix of to the word that takes the start state to it. ";
+static PyMethodDef __pyx_mdef_7bundler_10extensions_3FSM_1aho_corasick = {"aho_corasick", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_7bundler_10extensions_3FSM_1aho_corasick, METH_VARARGS|METH_KEYWORDS, __pyx_doc_7bundler_10extensions_3FSM_aho_corasick};
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_1aho_corasick(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  int __pyx_v_alphabet_len;
+  PyObject *__pyx_v_words = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("aho_corasick (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_alphabet_len,&__pyx_n_s_words,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_alphabet_len)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_words)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("aho_corasick", 1, 2, 2, 1); __PYX_ERR(0, 383, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "aho_corasick") < 0)) __PYX_ERR(0, 383, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+    }
+    __pyx_v_alphabet_len = __Pyx_PyInt_As_int(values[0]); if (unlikely((__pyx_v_alphabet_len == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 383, __pyx_L3_error)
+    __pyx_v_words = values[1];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("aho_corasick", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 383, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("bundler.extensions.FSM.aho_corasick", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_aho_corasick(__pyx_self, __pyx_v_alphabet_len, __pyx_v_words);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_aho_corasick(CYTHON_UNUSED PyObject *__pyx_self, int __pyx_v_alphabet_len, PyObject *__pyx_v_words) {
+  std::vector<int>  __pyx_v_machine;
+  std::vector<int>  __pyx_v_parent;
+  std::vector<int>  __pyx_v_last;
+  std::vector<int>  __pyx_v_fail;
+  std::vector<int>  __pyx_v_order;
+  std::vector<char>  __pyx_v_terminal;
+  std::vector<char>  __pyx_v_accepting;
+  int __pyx_v_state;
+  int __pyx_v_child;
+  int __pyx_v_letter;
+  int __pyx_v_i;
+  size_t __pyx_v_head;
+  PyObject *__pyx_v_word = NULL;
+  PyObject *__pyx_v_accepting_words = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  Py_ssize_t __pyx_t_2;
+  PyObject *(*__pyx_t_3)(PyObject *);
+  PyObject *__pyx_t_4 = NULL;
+  Py_ssize_t __pyx_t_5;
+  PyObject *(*__pyx_t_6)(PyObject *);
+  PyObject *__pyx_t_7 = NULL;
+  int __pyx_t_8;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  PyObject *__pyx_t_11 = NULL;
+  PyObject *__pyx_t_12 = NULL;
+  PyObject *__pyx_t_13 = NULL;
+  char __pyx_t_14;
+  char __pyx_t_15;
+  int __pyx_t_16;
+  int __pyx_t_17;
+  __Pyx_FakeReference<int> __pyx_t_18;
+  __Pyx_FakeReference<int> __pyx_t_19;
+  int __pyx_t_20;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("aho_corasick", 0);
+
+  /* "bundler/extensions/FSM.pyx":391
+ *     cdef vector[char] terminal, accepting
+ *     cdef int state, child, letter, i
+ *     cdef size_t head = 0             # <<<<<<<<<<<<<<
+ * 
+ *     # Build the trie of words, in which a missing child is -1.
+ */
+  __pyx_v_head = 0;
+
+  /* "bundler/extensions/FSM.pyx":394
+ * 
+ *     # Build the trie of words, in which a missing child is -1.
+ *     machine.assign(alphabet_len, -1)             # <<<<<<<<<<<<<<
+ *     parent.push_back(-1)
+ *     last.push_back(-1)
+ */
+  __pyx_v_machine.assign(__pyx_v_alphabet_len, -1);
+
+  /* "bundler/extensions/FSM.pyx":395
+ *     # Build the trie of words, in which a missing child is -1.
+ *     machine.assign(alphabet_len, -1)
+ *     parent.push_back(-1)             # <<<<<<<<<<<<<<
+ *     last.push_back(-1)
+ *     terminal.push_back(0)
+ */
+  try {
+    __pyx_v_parent.push_back(-1);
+  } catch(...) {
+    __Pyx_CppExn2PyErr();
+    __PYX_ERR(0, 395, __pyx_L1_error)
+  }
+
+  /* "bundler/extensions/FSM.pyx":396
+ *     machine.assign(alphabet_len, -1)
+ *     parent.push_back(-1)
+ *     last.push_back(-1)             # <<<<<<<<<<<<<<
+ *     terminal.push_back(0)
+ *     for word in words:
+ */
+  try {
+    __pyx_v_last.push_back(-1);
+  } catch(...) {
+    __Pyx_CppExn2PyErr();
+    __PYX_ERR(0, 396, __pyx_L1_error)
+  }
+
+  /* "bundler/extensions/FSM.pyx":397
+ *     parent.push_back(-1)
+ *     last.push_back(-1)
+ *     terminal.push_back(0)             # <<<<<<<<<<<<<<
+ *     for word in words:
+ *         state = 0
+ */
+  try {
+    __pyx_v_terminal.push_back(0);
+  } catch(...) {
+    __Pyx_CppExn2PyErr();
+    __PYX_ERR(0, 397, __pyx_L1_error)
+  }
+
+  /* "bundler/extensions/FSM.pyx":398
+ *     last.push_back(-1)
+ *     terminal.push_back(0)
+ *     for word in words:             # <<<<<<<<<<<<<<
+ *         state = 0
+ *         for letter in word:
+ */
+  if (likely(PyList_CheckExact(__pyx_v_words)) || PyTuple_CheckExact(__pyx_v_words)) {
+    __pyx_t_1 = __pyx_v_words; __Pyx_INCREF(__pyx_t_1); __pyx_t_2 = 0;
+    __pyx_t_3 = NULL;
+  } else {
+    __pyx_t_2 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_words); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 398, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_3 = Py_TYPE(__pyx_t_1)->tp_iternext; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 398, __pyx_L1_error)
+  }
+  for (;;) {
+    if (likely(!__pyx_t_3)) {
+      if (likely(PyList_CheckExact(__pyx_t_1))) {
+        if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_1)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_4 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_4); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 398, __pyx_L1_error)
+        #else
+        __pyx_t_4 = PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 398, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        #endif
+      } else {
+        if (__pyx_t_2 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_4 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_4); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 398, __pyx_L1_error)
+        #else
+        __pyx_t_4 = PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 398, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        #endif
+      }
+    } else {
+      __pyx_t_4 = __pyx_t_3(__pyx_t_1);
+      if (unlikely(!__pyx_t_4)) {
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+          else __PYX_ERR(0, 398, __pyx_L1_error)
+        }
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_4);
+    }
+    __Pyx_XDECREF_SET(__pyx_v_word, __pyx_t_4);
+    __pyx_t_4 = 0;
+
+    /* "bundler/extensions/FSM.pyx":399
+ *     terminal.push_back(0)
+ *     for word in words:
+ *         state = 0             # <<<<<<<<<<<<<<
+ *         for letter in word:
+ *             if not 0 <= letter < alphabet_len:
+ */
+    __pyx_v_state = 0;
+
+    /* "bundler/extensions/FSM.pyx":400
+ *     for word in words:
+ *         state = 0
+ *         for letter in word:             # <<<<<<<<<<<<<<
+ *             if not 0 <= letter < alphabet_len:
+ *                 raise ValueError('Invalid letter {}'.format(letter))
+ */
+    if (likely(PyList_CheckExact(__pyx_v_word)) || PyTuple_CheckExact(__pyx_v_word)) {
+      __pyx_t_4 = __pyx_v_word; __Pyx_INCREF(__pyx_t_4); __pyx_t_5 = 0;
+      __pyx_t_6 = NULL;
+    } else {
+      __pyx_t_5 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_v_word); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 400, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_6 = Py_TYPE(__pyx_t_4)->tp_iternext; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 400, __pyx_L1_error)
+    }
+    for (;;) {
+      if (likely(!__pyx_t_6)) {
+        if (likely(PyList_CheckExact(__pyx_t_4))) {
+          if (__pyx_t_5 >= PyList_GET_SIZE(__pyx_t_4)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_7 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_5); __Pyx_INCREF(__pyx_t_7); __pyx_t_5++; if (unlikely(0 < 0)) __PYX_ERR(0, 400, __pyx_L1_error)
+          #else
+          __pyx_t_7 = PySequence_ITEM(__pyx_t_4, __pyx_t_5); __pyx_t_5++; if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 400, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_7);
+          #endif
+        } else {
+          if (__pyx_t_5 >= PyTuple_GET_SIZE(__pyx_t_4)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_7 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_5); __Pyx_INCREF(__pyx_t_7); __pyx_t_5++; if (unlikely(0 < 0)) __PYX_ERR(0, 400, __pyx_L1_error)
+          #else
+          __pyx_t_7 = PySequence_ITEM(__pyx_t_4, __pyx_t_5); __pyx_t_5++; if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 400, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_7);
+          #endif
+        }
+      } else {
+        __pyx_t_7 = __pyx_t_6(__pyx_t_4);
+        if (unlikely(!__pyx_t_7)) {
+          PyObject* exc_type = PyErr_Occurred();
+          if (exc_type) {
+            if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+            else __PYX_ERR(0, 400, __pyx_L1_error)
+          }
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_7);
+      }
+      __pyx_t_8 = __Pyx_PyInt_As_int(__pyx_t_7); if (unlikely((__pyx_t_8 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 400, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __pyx_v_letter = __pyx_t_8;
+
+      /* "bundler/extensions/FSM.pyx":401
+ *         state = 0
+ *         for letter in word:
+ *             if not 0 <= letter < alphabet_len:             # <<<<<<<<<<<<<<
+ *                 raise ValueError('Invalid letter {}'.format(letter))
+ *             child = machine[state * alphabet_len + letter]
+ */
+      __pyx_t_9 = (0 <= __pyx_v_letter);
+      if (__pyx_t_9) {
+        __pyx_t_9 = (__pyx_v_letter < __pyx_v_alphabet_len);
+      }
+      __pyx_t_10 = ((!(__pyx_t_9 != 0)) != 0);
+      if (unlikely(__pyx_t_10)) {
+
+        /* "bundler/extensions/FSM.pyx":402
+ *         for letter in word:
+ *             if not 0 <= letter < alphabet_len:
+ *                 raise ValueError('Invalid letter {}'.format(letter))             # <<<<<<<<<<<<<<
+ *             child = machine[state * alphabet_len + letter]
+ *             if child < 0:
+ */
+        __pyx_t_11 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_Invalid_letter, __pyx_n_s_format); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 402, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_11);
+        __pyx_t_12 = __Pyx_PyInt_From_int(__pyx_v_letter); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 402, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_12);
+        __pyx_t_13 = NULL;
+        if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_11))) {
+          __pyx_t_13 = PyMethod_GET_SELF(__pyx_t_11);
+          if (likely(__pyx_t_13)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_11);
+            __Pyx_INCREF(__pyx_t_13);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_11, function);
+          }
+        }
+        __pyx_t_7 = (__pyx_t_13) ? __Pyx_PyObject_Call2Args(__pyx_t_11, __pyx_t_13, __pyx_t_12) : __Pyx_PyObject_CallOneArg(__pyx_t_11, __pyx_t_12);
+        __Pyx_XDECREF(__pyx_t_13); __pyx_t_13 = 0;
+        __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+        if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 402, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_7);
+        __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+        __pyx_t_11 = __Pyx_PyObject_CallOneArg(__pyx_builtin_ValueError, __pyx_t_7); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 402, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_11);
+        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+        __Pyx_Raise(__pyx_t_11, 0, 0, 0);
+        __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+        __PYX_ERR(0, 402, __pyx_L1_error)
+
+        /* "bundler/extensions/FSM.pyx":401
+ *         state = 0
+ *         for letter in word:
+ *             if not 0 <= letter < alphabet_len:             # <<<<<<<<<<<<<<
+ *                 raise ValueError('Invalid letter {}'.format(letter))
+ *             child = machine[state * alphabet_len + letter]
+ */
+      }
+
+      /* "bundler/extensions/FSM.pyx":403
+ *             if not 0 <= letter < alphabet_len:
+ *                 raise ValueError('Invalid letter {}'.format(letter))
+ *             child = machine[state * alphabet_len + letter]             # <<<<<<<<<<<<<<
+ *             if child < 0:
+ *                 child = parent.size()
+ */
+      __pyx_v_child = (__pyx_v_machine[((__pyx_v_state * __pyx_v_alphabet_len) + __pyx_v_letter)]);
+
+      /* "bundler/extensions/FSM.pyx":404
+ *                 raise ValueError('Invalid letter {}'.format(letter))
+ *             child = machine[state * alphabet_len + letter]
+ *             if child < 0:             # <<<<<<<<<<<<<<
+ *                 child = parent.size()
+ *                 machine[state * alphabet_len + letter] = child
+ */
+      __pyx_t_10 = ((__pyx_v_child < 0) != 0);
+      if (__pyx_t_10) {
+
+        /* "bundler/extensions/FSM.pyx":405
+ *             child = machine[state * alphabet_len + letter]
+ *             if child < 0:
+ *                 child = parent.size()             # <<<<<<<<<<<<<<
+ *                 machine[state * alphabet_len + letter] = child
+ *                 machine.resize(machine.size() + alphabet_len, -1)
+ */
+        __pyx_v_child = __pyx_v_parent.size();
+
+        /* "bundler/extensions/FSM.pyx":406
+ *             if child < 0:
+ *                 child = parent.size()
+ *                 machine[state * alphabet_len + letter] = child             # <<<<<<<<<<<<<<
+ *                 machine.resize(machine.size() + alphabet_len, -1)
+ *                 parent.push_back(state)
+ */
+        (__pyx_v_machine[((__pyx_v_state * __pyx_v_alphabet_len) + __pyx_v_letter)]) = __pyx_v_child;
+
+        /* "bundler/extensions/FSM.pyx":407
+ *                 child = parent.size()
+ *                 machine[state * alphabet_len + letter] = child
+ *                 machine.resize(machine.size() + alphabet_len, -1)             # <<<<<<<<<<<<<<
+ *                 parent.push_back(state)
+ *                 last.push_back(letter)
+ */
+        try {
+          __pyx_v_machine.resize((__pyx_v_machine.size() + __pyx_v_alphabet_len), -1);
+        } catch(...) {
+          __Pyx_CppExn2PyErr();
+          __PYX_ERR(0, 407, __pyx_L1_error)
+        }
+
+        /* "bundler/extensions/FSM.pyx":408
+ *                 machine[state * alphabet_len + letter] = child
+ *                 machine.resize(machine.size() + alphabet_len, -1)
+ *                 parent.push_back(state)             # <<<<<<<<<<<<<<
+ *                 last.push_back(letter)
+ *                 terminal.push_back(0)
+ */
+        try {
+          __pyx_v_parent.push_back(__pyx_v_state);
+        } catch(...) {
+          __Pyx_CppExn2PyErr();
+          __PYX_ERR(0, 408, __pyx_L1_error)
+        }
+
+        /* "bundler/extensions/FSM.pyx":409
+ *                 machine.resize(machine.size() + alphabet_len, -1)
+ *                 parent.push_back(state)
+ *                 last.push_back(letter)             # <<<<<<<<<<<<<<
+ *                 terminal.push_back(0)
+ *             state = child
+ */
+        try {
+          __pyx_v_last.push_back(__pyx_v_letter);
+        } catch(...) {
+          __Pyx_CppExn2PyErr();
+          __PYX_ERR(0, 409, __pyx_L1_error)
+        }
+
+        /* "bundler/extensions/FSM.pyx":410
+ *                 parent.push_back(state)
+ *                 last.push_back(letter)
+ *                 terminal.push_back(0)             # <<<<<<<<<<<<<<
+ *             state = child
+ *         terminal[state] = 1
+ */
+        try {
+          __pyx_v_terminal.push_back(0);
+        } catch(...) {
+          __Pyx_CppExn2PyErr();
+          __PYX_ERR(0, 410, __pyx_L1_error)
+        }
+
+        /* "bundler/extensions/FSM.pyx":404
+ *                 raise ValueError('Invalid letter {}'.format(letter))
+ *             child = machine[state * alphabet_len + letter]
+ *             if child < 0:             # <<<<<<<<<<<<<<
+ *                 child = parent.size()
+ *                 machine[state * alphabet_len + letter] = child
+ */
+      }
+
+      /* "bundler/extensions/FSM.pyx":411
+ *                 last.push_back(letter)
+ *                 terminal.push_back(0)
+ *             state = child             # <<<<<<<<<<<<<<
+ *         terminal[state] = 1
+ * 
+ */
+      __pyx_v_state = __pyx_v_child;
+
+      /* "bundler/extensions/FSM.pyx":400
+ *     for word in words:
+ *         state = 0
+ *         for letter in word:             # <<<<<<<<<<<<<<
+ *             if not 0 <= letter < alphabet_len:
+ *                 raise ValueError('Invalid letter {}'.format(letter))
+ */
+    }
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "bundler/extensions/FSM.pyx":412
+ *                 terminal.push_back(0)
+ *             state = child
+ *         terminal[state] = 1             # <<<<<<<<<<<<<<
+ * 
+ *     # Fill in the missing children by following failure links, in breadth first order so that the states that
+ */
+    (__pyx_v_terminal[__pyx_v_state]) = 1;
+
+    /* "bundler/extensions/FSM.pyx":398
+ *     last.push_back(-1)
+ *     terminal.push_back(0)
+ *     for word in words:             # <<<<<<<<<<<<<<
+ *         state = 0
+ *         for letter in word:
+ */
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "bundler/extensions/FSM.pyx":416
+ *     # Fill in the missing children by following failure links, in breadth first order so that the states that
+ *     # these lead to are already complete.
+ *     fail.assign(parent.size(), 0)             # <<<<<<<<<<<<<<
+ *     accepting.assign(parent.size(), 0)
+ *     accepting[0] = terminal[0]
+ */
+  __pyx_v_fail.assign(__pyx_v_parent.size(), 0);
+
+  /* "bundler/extensions/FSM.pyx":417
+ *     # these lead to are already complete.
+ *     fail.assign(parent.size(), 0)
+ *     accepting.assign(parent.size(), 0)             # <<<<<<<<<<<<<<
+ *     accepting[0] = terminal[0]
+ *     order.push_back(0)
+ */
+  __pyx_v_accepting.assign(__pyx_v_parent.size(), 0);
+
+  /* "bundler/extensions/FSM.pyx":418
+ *     fail.assign(parent.size(), 0)
+ *     accepting.assign(parent.size(), 0)
+ *     accepting[0] = terminal[0]             # <<<<<<<<<<<<<<
+ *     order.push_back(0)
+ *     while head < order.size():
+ */
+  (__pyx_v_accepting[0]) = (__pyx_v_terminal[0]);
+
+  /* "bundler/extensions/FSM.pyx":419
+ *     accepting.assign(parent.size(), 0)
+ *     accepting[0] = terminal[0]
+ *     order.push_back(0)             # <<<<<<<<<<<<<<
+ *     while head < order.size():
+ *         state = order[head]
+ */
+  try {
+    __pyx_v_order.push_back(0);
+  } catch(...) {
+    __Pyx_CppExn2PyErr();
+    __PYX_ERR(0, 419, __pyx_L1_error)
+  }
+
+  /* "bundler/extensions/FSM.pyx":420
+ *     accepting[0] = terminal[0]
+ *     order.push_back(0)
+ *     while head < order.size():             # <<<<<<<<<<<<<<
+ *         state = order[head]
+ *         head += 1
+ */
+  while (1) {
+    __pyx_t_10 = ((__pyx_v_head < __pyx_v_order.size()) != 0);
+    if (!__pyx_t_10) break;
+
+    /* "bundler/extensions/FSM.pyx":421
+ *     order.push_back(0)
+ *     while head < order.size():
+ *         state = order[head]             # <<<<<<<<<<<<<<
+ *         head += 1
+ *         if state: accepting[state] = terminal[state] or accepting[fail[state]]
+ */
+    __pyx_v_state = (__pyx_v_order[__pyx_v_head]);
+
+    /* "bundler/extensions/FSM.pyx":422
+ *     while head < order.size():
+ *         state = order[head]
+ *         head += 1             # <<<<<<<<<<<<<<
+ *         if state: accepting[state] = terminal[state] or accepting[fail[state]]
+ *         for letter in range(alphabet_len):
+ */
+    __pyx_v_head = (__pyx_v_head + 1);
+
+    /* "bundler/extensions/FSM.pyx":423
+ *         state = order[head]
+ *         head += 1
+ *         if state: accepting[state] = terminal[state] or accepting[fail[state]]             # <<<<<<<<<<<<<<
+ *         for letter in range(alphabet_len):
+ *             child = machine[state * alphabet_len + letter]
+ */
+    __pyx_t_10 = (__pyx_v_state != 0);
+    if (__pyx_t_10) {
+      __pyx_t_15 = (__pyx_v_terminal[__pyx_v_state]);
+      if (!__pyx_t_15) {
+      } else {
+        __pyx_t_14 = __pyx_t_15;
+        goto __pyx_L12_bool_binop_done;
+      }
+      __pyx_t_15 = (__pyx_v_accepting[(__pyx_v_fail[__pyx_v_state])]);
+      __pyx_t_14 = __pyx_t_15;
+      __pyx_L12_bool_binop_done:;
+      (__pyx_v_accepting[__pyx_v_state]) = __pyx_t_14;
+    }
+
+    /* "bundler/extensions/FSM.pyx":424
+ *         head += 1
+ *         if state: accepting[state] = terminal[state] or accepting[fail[state]]
+ *         for letter in range(alphabet_len):             # <<<<<<<<<<<<<<
+ *             child = machine[state * alphabet_len + letter]
+ *             if child < 0:
+ */
+    __pyx_t_8 = __pyx_v_alphabet_len;
+    __pyx_t_16 = __pyx_t_8;
+    for (__pyx_t_17 = 0; __pyx_t_17 < __pyx_t_16; __pyx_t_17+=1) {
+      __pyx_v_letter = __pyx_t_17;
+
+      /* "bundler/extensions/FSM.pyx":425
+ *         if state: accepting[state] = terminal[state] or accepting[fail[state]]
+ *         for letter in range(alphabet_len):
+ *             child = machine[state * alphabet_len + letter]             # <<<<<<<<<<<<<<
+ *             if child < 0:
+ *                 machine[state * alphabet_len + letter] = machine[fail[state] * alphabet_len + letter] if state else 0
+ */
+      __pyx_v_child = (__pyx_v_machine[((__pyx_v_state * __pyx_v_alphabet_len) + __pyx_v_letter)]);
+
+      /* "bundler/extensions/FSM.pyx":426
+ *         for letter in range(alphabet_len):
+ *             child = machine[state * alphabet_len + letter]
+ *             if child < 0:             # <<<<<<<<<<<<<<
+ *                 machine[state * alphabet_len + letter] = machine[fail[state] * alphabet_len + letter] if state else 0
+ *             else:
+ */
+      __pyx_t_10 = ((__pyx_v_child < 0) != 0);
+      if (__pyx_t_10) {
+
+        /* "bundler/extensions/FSM.pyx":427
+ *             child = machine[state * alphabet_len + letter]
+ *             if child < 0:
+ *                 machine[state * alphabet_len + letter] = machine[fail[state] * alphabet_len + letter] if state else 0             # <<<<<<<<<<<<<<
+ *             else:
+ *                 fail[child] = machine[fail[state] * alphabet_len + letter] if state else 0
+ */
+        if ((__pyx_v_state != 0)) {
+          __pyx_t_18 = (__pyx_v_machine[(((__pyx_v_fail[__pyx_v_state]) * __pyx_v_alphabet_len) + __pyx_v_letter)]);
+        } else {
+          __pyx_t_18 = 0;
+        }
+        (__pyx_v_machine[((__pyx_v_state * __pyx_v_alphabet_len) + __pyx_v_letter)]) = __pyx_t_18;
+
+        /* "bundler/extensions/FSM.pyx":426
+ *         for letter in range(alphabet_len):
+ *             child = machine[state * alphabet_len + letter]
+ *             if child < 0:             # <<<<<<<<<<<<<<
+ *                 machine[state * alphabet_len + letter] = machine[fail[state] * alphabet_len + letter] if state else 0
+ *             else:
+ */
+        goto __pyx_L16;
+      }
+
+      /* "bundler/extensions/FSM.pyx":429
+ *                 machine[state * alphabet_len + letter] = machine[fail[state] * alphabet_len + letter] if state else 0
+ *             else:
+ *                 fail[child] = machine[fail[state] * alphabet_len + letter] if state else 0             # <<<<<<<<<<<<<<
+ *                 order.push_back(child)
+ * 
+ */
+      /*else*/ {
+        if ((__pyx_v_state != 0)) {
+          __pyx_t_19 = (__pyx_v_machine[(((__pyx_v_fail[__pyx_v_state]) * __pyx_v_alphabet_len) + __pyx_v_letter)]);
+        } else {
+          __pyx_t_19 = 0;
+        }
+        (__pyx_v_fail[__pyx_v_child]) = __pyx_t_19;
+
+        /* "bundler/extensions/FSM.pyx":430
+ *             else:
+ *                 fail[child] = machine[fail[state] * alphabet_len + letter] if state else 0
+ *                 order.push_back(child)             # <<<<<<<<<<<<<<
+ * 
+ *     accepting_words = dict()
+ */
+        try {
+          __pyx_v_order.push_back(__pyx_v_child);
+        } catch(...) {
+          __Pyx_CppExn2PyErr();
+          __PYX_ERR(0, 430, __pyx_L1_error)
+        }
+      }
+      __pyx_L16:;
+    }
+  }
+
+  /* "bundler/extensions/FSM.pyx":432
+ *                 order.push_back(child)
+ * 
+ *     accepting_words = dict()             # <<<<<<<<<<<<<<
+ *     for i in range(<int>parent.size()):
+ *         if accepting[i]:
+ */
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 432, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_accepting_words = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "bundler/extensions/FSM.pyx":433
+ * 
+ *     accepting_words = dict()
+ *     for i in range(<int>parent.size()):             # <<<<<<<<<<<<<<
+ *         if accepting[i]:
+ *             word = []
+ */
+  __pyx_t_8 = ((int)__pyx_v_parent.size());
+  __pyx_t_16 = __pyx_t_8;
+  for (__pyx_t_17 = 0; __pyx_t_17 < __pyx_t_16; __pyx_t_17+=1) {
+    __pyx_v_i = __pyx_t_17;
+
+    /* "bundler/extensions/FSM.pyx":434
+ *     accepting_words = dict()
+ *     for i in range(<int>parent.size()):
+ *         if accepting[i]:             # <<<<<<<<<<<<<<
+ *             word = []
+ *             state = i
+ */
+    __pyx_t_10 = ((__pyx_v_accepting[__pyx_v_i]) != 0);
+    if (__pyx_t_10) {
+
+      /* "bundler/extensions/FSM.pyx":435
+ *     for i in range(<int>parent.size()):
+ *         if accepting[i]:
+ *             word = []             # <<<<<<<<<<<<<<
+ *             state = i
+ *             while state:
+ */
+      __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 435, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_XDECREF_SET(__pyx_v_word, __pyx_t_1);
+      __pyx_t_1 = 0;
+
+      /* "bundler/extensions/FSM.pyx":436
+ *         if accepting[i]:
+ *             word = []
+ *             state = i             # <<<<<<<<<<<<<<
+ *             while state:
+ *                 word.append(last[state])
+ */
+      __pyx_v_state = __pyx_v_i;
+
+      /* "bundler/extensions/FSM.pyx":437
+ *             word = []
+ *             state = i
+ *             while state:             # <<<<<<<<<<<<<<
+ *                 word.append(last[state])
+ *                 state = parent[state]
+ */
+      while (1) {
+        __pyx_t_10 = (__pyx_v_state != 0);
+        if (!__pyx_t_10) break;
+
+        /* "bundler/extensions/FSM.pyx":438
+ *             state = i
+ *             while state:
+ *                 word.append(last[state])             # <<<<<<<<<<<<<<
+ *                 state = parent[state]
+ *             accepting_words[i] = tuple(word[::-1])
+ */
+        __pyx_t_1 = __Pyx_PyInt_From_int((__pyx_v_last[__pyx_v_state])); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 438, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __pyx_t_20 = __Pyx_PyObject_Append(__pyx_v_word, __pyx_t_1); if (unlikely(__pyx_t_20 == ((int)-1))) __PYX_ERR(0, 438, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+        /* "bundler/extensions/FSM.pyx":439
+ *             while state:
+ *                 word.append(last[state])
+ *                 state = parent[state]             # <<<<<<<<<<<<<<
+ *             accepting_words[i] = tuple(word[::-1])
+ * 
+ */
+        __pyx_v_state = (__pyx_v_parent[__pyx_v_state]);
+      }
+
+      /* "bundler/extensions/FSM.pyx":440
+ *                 word.append(last[state])
+ *                 state = parent[state]
+ *             accepting_words[i] = tuple(word[::-1])             # <<<<<<<<<<<<<<
+ * 
+ *     return array.array('i', machine), accepting_words
+ */
+      __pyx_t_1 = __Pyx_PyObject_GetItem(__pyx_v_word, __pyx_slice__2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 440, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_t_4 = __Pyx_PySequence_Tuple(__pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 440, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_i); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 440, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (unlikely(PyDict_SetItem(__pyx_v_accepting_words, __pyx_t_1, __pyx_t_4) < 0)) __PYX_ERR(0, 440, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+      /* "bundler/extensions/FSM.pyx":434
+ *     accepting_words = dict()
+ *     for i in range(<int>parent.size()):
+ *         if accepting[i]:             # <<<<<<<<<<<<<<
+ *             word = []
+ *             state = i
+ */
+    }
+  }
+
+  /* "bundler/extensions/FSM.pyx":442
+ *             accepting_words[i] = tuple(word[::-1])
+ * 
+ *     return array.array('i', machine), accepting_words             # <<<<<<<<<<<<<<
+ * 
+ * def minimise(int alphabet_len, machine, labels):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_4 = __pyx_convert_vector_to_py_int(__pyx_v_machine); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 442, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 442, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_n_u_i);
+  __Pyx_GIVEREF(__pyx_n_u_i);
+  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_n_u_i);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_4);
+  __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_7cpython_5array_array), __pyx_t_1, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 442, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 442, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_4);
+  __Pyx_INCREF(__pyx_v_accepting_words);
+  __Pyx_GIVEREF(__pyx_v_accepting_words);
+  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_v_accepting_words);
+  __pyx_t_4 = 0;
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "bundler/extensions/FSM.pyx":383
+ *         return [self.maps[i] for i in range(<int>self.maps.size() - self.width, self.maps.size())]
+ * 
+ * def aho_corasick(int alphabet_len, words):             # <<<<<<<<<<<<<<
+ *     ''' Return the transitions of the Aho-Corasick automaton that detects the given words, whose letters are in range(alphabet_len).
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_XDECREF(__pyx_t_12);
+  __Pyx_XDECREF(__pyx_t_13);
+  __Pyx_AddTraceback("bundler.extensions.FSM.aho_corasick", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_word);
+  __Pyx_XDECREF(__pyx_v_accepting_words);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bundler/extensions/FSM.pyx":444
+ *     return array.array('i', machine), accepting_words
+ * 
+ * def minimise(int alphabet_len, machine, labels):             # <<<<<<<<<<<<<<
+ *     ''' Return the minimal machine equivalent to the given flat transition table, using Hopcroft's algorithm.
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3minimise(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_7bundler_10extensions_3FSM_2minimise[] = " Return the minimal machine equivalent to the given flat transition table, using Hopcroft's algorithm.\n    \n    Two states are equivalent if reading any word from them passes through states with equal labels, where a\n    transition to -1 is treated as one to a sink state with a label of its own. Returns (machine, states) where\n    machine only has the states reachable from 0, numbered in breadth first order, and the new state i comes from\n    the state states[i] of the given machine. ";
+static PyMethodDef __pyx_mdef_7bundler_10extensions_3FSM_3minimise = {"minimise", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_7bundler_10extensions_3FSM_3minimise, METH_VARARGS|METH_KEYWORDS, __pyx_doc_7bundler_10extensions_3FSM_2minimise};
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_3minimise(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  int __pyx_v_alphabet_len;
+  PyObject *__pyx_v_machine = 0;
+  PyObject *__pyx_v_labels = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("minimise (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_alphabet_len,&__pyx_n_s_machine,&__pyx_n_s_labels,0};
+    PyObject* values[3] = {0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_alphabet_len)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_machine)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("minimise", 1, 3, 3, 1); __PYX_ERR(0, 444, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_labels)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("minimise", 1, 3, 3, 2); __PYX_ERR(0, 444, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "minimise") < 0)) __PYX_ERR(0, 444, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+    }
+    __pyx_v_alphabet_len = __Pyx_PyInt_As_int(values[0]); if (unlikely((__pyx_v_alphabet_len == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 444, __pyx_L3_error)
+    __pyx_v_machine = values[1];
+    __pyx_v_labels = values[2];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("minimise", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 444, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("bundler.extensions.FSM.minimise", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_2minimise(__pyx_self, __pyx_v_alphabet_len, __pyx_v_machine, __pyx_v_labels);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_2minimise(CYTHON_UNUSED PyObject *__pyx_self, int __pyx_v_alphabet_len, PyObject *__pyx_v_machine, PyObject *__pyx_v_labels) {
+  int __pyx_v_n;
+  int __pyx_v_N;
+  int __pyx_v_state;
+  int __pyx_v_target;
+  int __pyx_v_letter;
+  int __pyx_v_block;
+  int __pyx_v_new_block;
+  int __pyx_v_i;
+  int __pyx_v_j;
+  int __pyx_v_start;
+  int __pyx_v_middle;
+  int __pyx_v_blocks;
+  size_t __pyx_v_head;
+  std::vector<int>  __pyx_v_transitions;
+  std::vector<int>  __pyx_v_reverse_starts;
+  std::vector<int>  __pyx_v_reverse_arrows;
+  std::vector<int>  __pyx_v_elements;
+  std::vector<int>  __pyx_v_location;
+  std::vector<int>  __pyx_v_block_of;
+  std::vector<int>  __pyx_v_block_start;
+  std::vector<int>  __pyx_v_block_end;
+  std::vector<int>  __pyx_v_marked;
+  std::vector<int>  __pyx_v_splitters;
+  std::vector<int>  __pyx_v_preimage;
+  std::vector<int>  __pyx_v_touched;
+  std::vector<int>  __pyx_v_new_machine;
+  std::vector<int>  __pyx_v_new_index;
+  std::vector<int>  __pyx_v_representatives;
+  std::vector<char>  __pyx_v_waiting;
+  arrayobject *__pyx_v_flat = 0;
+  PyObject *__pyx_v_label_blocks = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_t_9;
+  long __pyx_t_10;
+  int __pyx_t_11;
+  PyObject *__pyx_t_12 = NULL;
+  int __pyx_t_13;
+  std::vector<int> ::iterator __pyx_t_14;
+  int __pyx_t_15;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("minimise", 0);
+
+  /* "bundler/extensions/FSM.pyx":451
+ *     machine only has the states reachable from 0, numbered in breadth first order, and the new state i comes from
+ *     the state states[i] of the given machine. '''
+ *     cdef int n = len(machine) // alphabet_len             # <<<<<<<<<<<<<<
+ *     cdef int N = n + 1  # Including the sink.
+ *     cdef int state, target, letter, block, new_block, i, j, start, middle
+ */
+  __pyx_t_1 = PyObject_Length(__pyx_v_machine); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 451, __pyx_L1_error)
+  if (unlikely(__pyx_v_alphabet_len == 0)) {
+    PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
+    __PYX_ERR(0, 451, __pyx_L1_error)
+  }
+  else if (sizeof(Py_ssize_t) == sizeof(long) && (!(((int)-1) > 0)) && unlikely(__pyx_v_alphabet_len == (int)-1)  && unlikely(UNARY_NEG_WOULD_OVERFLOW(__pyx_t_1))) {
+    PyErr_SetString(PyExc_OverflowError, "value too large to perform division");
+    __PYX_ERR(0, 451, __pyx_L1_error)
+  }
+  __pyx_v_n = __Pyx_div_Py_ssize_t(__pyx_t_1, __pyx_v_alphabet_len);
+
+  /* "bundler/extensions/FSM.pyx":452
+ *     the state states[i] of the given machine. '''
+ *     cdef int n = len(machine) // alphabet_len
+ *     cdef int N = n + 1  # Including the sink.             # <<<<<<<<<<<<<<
+ *     cdef int state, target, letter, block, new_block, i, j, start, middle
+ *     cdef int blocks = 0
+ */
+  __pyx_v_N = (__pyx_v_n + 1);
+
+  /* "bundler/extensions/FSM.pyx":454
+ *     cdef int N = n + 1  # Including the sink.
+ *     cdef int state, target, letter, block, new_block, i, j, start, middle
+ *     cdef int blocks = 0             # <<<<<<<<<<<<<<
+ *     cdef size_t head = 0
+ *     cdef vector[int] transitions, reverse_starts, reverse_arrows
+ */
+  __pyx_v_blocks = 0;
+
+  /* "bundler/extensions/FSM.pyx":455
+ *     cdef int state, target, letter, block, new_block, i, j, start, middle
+ *     cdef int blocks = 0
+ *     cdef size_t head = 0             # <<<<<<<<<<<<<<
+ *     cdef vector[int] transitions, reverse_starts, reverse_arrows
+ *     cdef vector[int] elements, location, block_of, block_start, block_end, marked
+ */
+  __pyx_v_head = 0;
+
+  /* "bundler/extensions/FSM.pyx":460
+ *     cdef vector[int] splitters, preimage, touched, new_machine, new_index, representatives
+ *     cdef vector[char] waiting
+ *     cdef array.array flat = array.array('i', machine)             # <<<<<<<<<<<<<<
+ * 
+ *     transitions.resize(N * alphabet_len)
+ */
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 460, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_n_u_i);
+  __Pyx_GIVEREF(__pyx_n_u_i);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_n_u_i);
+  __Pyx_INCREF(__pyx_v_machine);
+  __Pyx_GIVEREF(__pyx_v_machine);
+  PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_v_machine);
+  __pyx_t_3 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_7cpython_5array_array), __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 460, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_flat = ((arrayobject *)__pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "bundler/extensions/FSM.pyx":462
+ *     cdef array.array flat = array.array('i', machine)
+ * 
+ *     transitions.resize(N * alphabet_len)             # <<<<<<<<<<<<<<
+ *     for i in range(n * alphabet_len):
+ *         target = flat.data.as_ints[i]
+ */
+  try {
+    __pyx_v_transitions.resize((__pyx_v_N * __pyx_v_alphabet_len));
+  } catch(...) {
+    __Pyx_CppExn2PyErr();
+    __PYX_ERR(0, 462, __pyx_L1_error)
+  }
+
+  /* "bundler/extensions/FSM.pyx":463
+ * 
+ *     transitions.resize(N * alphabet_len)
+ *     for i in range(n * alphabet_len):             # <<<<<<<<<<<<<<
+ *         target = flat.data.as_ints[i]
+ *         transitions[i] = target if target >= 0 else n
+ */
+  __pyx_t_4 = (__pyx_v_n * __pyx_v_alphabet_len);
+  __pyx_t_5 = __pyx_t_4;
+  for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+    __pyx_v_i = __pyx_t_6;
+
+    /* "bundler/extensions/FSM.pyx":464
+ *     transitions.resize(N * alphabet_len)
+ *     for i in range(n * alphabet_len):
+ *         target = flat.data.as_ints[i]             # <<<<<<<<<<<<<<
+ *         transitions[i] = target if target >= 0 else n
+ *     for letter in range(alphabet_len):
+ */
+    __pyx_v_target = (__pyx_v_flat->data.as_ints[__pyx_v_i]);
+
+    /* "bundler/extensions/FSM.pyx":465
+ *     for i in range(n * alphabet_len):
+ *         target = flat.data.as_ints[i]
+ *         transitions[i] = target if target >= 0 else n             # <<<<<<<<<<<<<<
+ *     for letter in range(alphabet_len):
+ *         transitions[n * alphabet_len + letter] = n
+ */
+    if (((__pyx_v_target >= 0) != 0)) {
+      __pyx_t_7 = __pyx_v_target;
+    } else {
+      __pyx_t_7 = __pyx_v_n;
+    }
+    (__pyx_v_transitions[__pyx_v_i]) = __pyx_t_7;
+  }
+
+  /* "bundler/extensions/FSM.pyx":466
+ *         target = flat.data.as_ints[i]
+ *         transitions[i] = target if target >= 0 else n
+ *     for letter in range(alphabet_len):             # <<<<<<<<<<<<<<
+ *         transitions[n * alphabet_len + letter] = n
+ * 
+ */
+  __pyx_t_4 = __pyx_v_alphabet_len;
+  __pyx_t_5 = __pyx_t_4;
+  for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+    __pyx_v_letter = __pyx_t_6;
+
+    /* "bundler/extensions/FSM.pyx":467
+ *         transitions[i] = target if target >= 0 else n
+ *     for letter in range(alphabet_len):
+ *         transitions[n * alphabet_len + letter] = n             # <<<<<<<<<<<<<<
+ * 
+ *     # The reverse arrows, with those into state along letter in reverse_arrows[reverse_starts[letter * N + state]:reverse_starts[letter * N + state + 1]].
+ */
+    (__pyx_v_transitions[((__pyx_v_n * __pyx_v_alphabet_len) + __pyx_v_letter)]) = __pyx_v_n;
+  }
+
+  /* "bundler/extensions/FSM.pyx":470
+ * 
+ *     # The reverse arrows, with those into state along letter in reverse_arrows[reverse_starts[letter * N + state]:reverse_starts[letter * N + state + 1]].
+ *     reverse_starts.assign(N * alphabet_len + 1, 0)             # <<<<<<<<<<<<<<
+ *     for state in range(N):
+ *         for letter in range(alphabet_len):
+ */
+  try {
+    __pyx_v_reverse_starts.assign(((__pyx_v_N * __pyx_v_alphabet_len) + 1), 0);
+  } catch(...) {
+    __Pyx_CppExn2PyErr();
+    __PYX_ERR(0, 470, __pyx_L1_error)
+  }
+
+  /* "bundler/extensions/FSM.pyx":471
+ *     # The reverse arrows, with those into state along letter in reverse_arrows[reverse_starts[letter * N + state]:reverse_starts[letter * N + state + 1]].
+ *     reverse_starts.assign(N * alphabet_len + 1, 0)
+ *     for state in range(N):             # <<<<<<<<<<<<<<
+ *         for letter in range(alphabet_len):
+ *             reverse_starts[letter * N + transitions[state * alphabet_len + letter] + 1] += 1
+ */
+  __pyx_t_4 = __pyx_v_N;
+  __pyx_t_5 = __pyx_t_4;
+  for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+    __pyx_v_state = __pyx_t_6;
+
+    /* "bundler/extensions/FSM.pyx":472
+ *     reverse_starts.assign(N * alphabet_len + 1, 0)
+ *     for state in range(N):
+ *         for letter in range(alphabet_len):             # <<<<<<<<<<<<<<
+ *             reverse_starts[letter * N + transitions[state * alphabet_len + letter] + 1] += 1
+ *     for i in range(N * alphabet_len):
+ */
+    __pyx_t_7 = __pyx_v_alphabet_len;
+    __pyx_t_8 = __pyx_t_7;
+    for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
+      __pyx_v_letter = __pyx_t_9;
+
+      /* "bundler/extensions/FSM.pyx":473
+ *     for state in range(N):
+ *         for letter in range(alphabet_len):
+ *             reverse_starts[letter * N + transitions[state * alphabet_len + letter] + 1] += 1             # <<<<<<<<<<<<<<
+ *     for i in range(N * alphabet_len):
+ *         reverse_starts[i + 1] += reverse_starts[i]
+ */
+      __pyx_t_10 = (((__pyx_v_letter * __pyx_v_N) + (__pyx_v_transitions[((__pyx_v_state * __pyx_v_alphabet_len) + __pyx_v_letter)])) + 1);
+      (__pyx_v_reverse_starts[__pyx_t_10]) = ((__pyx_v_reverse_starts[__pyx_t_10]) + 1);
+    }
+  }
+
+  /* "bundler/extensions/FSM.pyx":474
+ *         for letter in range(alphabet_len):
+ *             reverse_starts[letter * N + transitions[state * alphabet_len + letter] + 1] += 1
+ *     for i in range(N * alphabet_len):             # <<<<<<<<<<<<<<
+ *         reverse_starts[i + 1] += reverse_starts[i]
+ *     reverse_arrows.resize(N * alphabet_len)
+ */
+  __pyx_t_4 = (__pyx_v_N * __pyx_v_alphabet_len);
+  __pyx_t_5 = __pyx_t_4;
+  for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+    __pyx_v_i = __pyx_t_6;
+
+    /* "bundler/extensions/FSM.pyx":475
+ *             reverse_starts[letter * N + transitions[state * alphabet_len + letter] + 1] += 1
+ *     for i in range(N * alphabet_len):
+ *         reverse_starts[i + 1] += reverse_starts[i]             # <<<<<<<<<<<<<<
+ *     reverse_arrows.resize(N * alphabet_len)
+ *     for state in range(N):
+ */
+    __pyx_t_10 = (__pyx_v_i + 1);
+    (__pyx_v_reverse_starts[__pyx_t_10]) = ((__pyx_v_reverse_starts[__pyx_t_10]) + (__pyx_v_reverse_starts[__pyx_v_i]));
+  }
+
+  /* "bundler/extensions/FSM.pyx":476
+ *     for i in range(N * alphabet_len):
+ *         reverse_starts[i + 1] += reverse_starts[i]
+ *     reverse_arrows.resize(N * alphabet_len)             # <<<<<<<<<<<<<<
+ *     for state in range(N):
+ *         for letter in range(alphabet_len):
+ */
+  try {
+    __pyx_v_reverse_arrows.resize((__pyx_v_N * __pyx_v_alphabet_len));
+  } catch(...) {
+    __Pyx_CppExn2PyErr();
+    __PYX_ERR(0, 476, __pyx_L1_error)
+  }
+
+  /* "bundler/extensions/FSM.pyx":477
+ *         reverse_starts[i + 1] += reverse_starts[i]
+ *     reverse_arrows.resize(N * alphabet_len)
+ *     for state in range(N):             # <<<<<<<<<<<<<<
+ *         for letter in range(alphabet_len):
+ *             i = letter * N + transitions[state * alphabet_len + letter]
+ */
+  __pyx_t_4 = __pyx_v_N;
+  __pyx_t_5 = __pyx_t_4;
+  for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+    __pyx_v_state = __pyx_t_6;
+
+    /* "bundler/extensions/FSM.pyx":478
+ *     reverse_arrows.resize(N * alphabet_len)
+ *     for state in range(N):
+ *         for letter in range(alphabet_len):             # <<<<<<<<<<<<<<
+ *             i = letter * N + transitions[state * alphabet_len + letter]
+ *             reverse_arrows[reverse_starts[i]] = state
+ */
+    __pyx_t_7 = __pyx_v_alphabet_len;
+    __pyx_t_8 = __pyx_t_7;
+    for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
+      __pyx_v_letter = __pyx_t_9;
+
+      /* "bundler/extensions/FSM.pyx":479
+ *     for state in range(N):
+ *         for letter in range(alphabet_len):
+ *             i = letter * N + transitions[state * alphabet_len + letter]             # <<<<<<<<<<<<<<
+ *             reverse_arrows[reverse_starts[i]] = state
+ *             reverse_starts[i] += 1
+ */
+      __pyx_v_i = ((__pyx_v_letter * __pyx_v_N) + (__pyx_v_transitions[((__pyx_v_state * __pyx_v_alphabet_len) + __pyx_v_letter)]));
+
+      /* "bundler/extensions/FSM.pyx":480
+ *         for letter in range(alphabet_len):
+ *             i = letter * N + transitions[state * alphabet_len + letter]
+ *             reverse_arrows[reverse_starts[i]] = state             # <<<<<<<<<<<<<<
+ *             reverse_starts[i] += 1
+ *     for i in range(N * alphabet_len, 0, -1):  # Undo the shift caused by filling.
+ */
+      (__pyx_v_reverse_arrows[(__pyx_v_reverse_starts[__pyx_v_i])]) = __pyx_v_state;
+
+      /* "bundler/extensions/FSM.pyx":481
+ *             i = letter * N + transitions[state * alphabet_len + letter]
+ *             reverse_arrows[reverse_starts[i]] = state
+ *             reverse_starts[i] += 1             # <<<<<<<<<<<<<<
+ *     for i in range(N * alphabet_len, 0, -1):  # Undo the shift caused by filling.
+ *         reverse_starts[i] = reverse_starts[i - 1]
+ */
+      __pyx_t_11 = __pyx_v_i;
+      (__pyx_v_reverse_starts[__pyx_t_11]) = ((__pyx_v_reverse_starts[__pyx_t_11]) + 1);
+    }
+  }
+
+  /* "bundler/extensions/FSM.pyx":482
+ *             reverse_arrows[reverse_starts[i]] = state
+ *             reverse_starts[i] += 1
+ *     for i in range(N * alphabet_len, 0, -1):  # Undo the shift caused by filling.             # <<<<<<<<<<<<<<
+ *         reverse_starts[i] = reverse_starts[i - 1]
+ *     reverse_starts[0] = 0
+ */
+  for (__pyx_t_4 = (__pyx_v_N * __pyx_v_alphabet_len); __pyx_t_4 > 0; __pyx_t_4-=1) {
+    __pyx_v_i = __pyx_t_4;
+
+    /* "bundler/extensions/FSM.pyx":483
+ *             reverse_starts[i] += 1
+ *     for i in range(N * alphabet_len, 0, -1):  # Undo the shift caused by filling.
+ *         reverse_starts[i] = reverse_starts[i - 1]             # <<<<<<<<<<<<<<
+ *     reverse_starts[0] = 0
+ * 
+ */
+    (__pyx_v_reverse_starts[__pyx_v_i]) = (__pyx_v_reverse_starts[(__pyx_v_i - 1)]);
+  }
+
+  /* "bundler/extensions/FSM.pyx":484
+ *     for i in range(N * alphabet_len, 0, -1):  # Undo the shift caused by filling.
+ *         reverse_starts[i] = reverse_starts[i - 1]
+ *     reverse_starts[0] = 0             # <<<<<<<<<<<<<<
+ * 
+ *     # The initial partition, by label. Each block is a contiguous range of elements.
+ */
+  (__pyx_v_reverse_starts[0]) = 0;
+
+  /* "bundler/extensions/FSM.pyx":487
+ * 
+ *     # The initial partition, by label. Each block is a contiguous range of elements.
+ *     label_blocks = dict()             # <<<<<<<<<<<<<<
+ *     block_of.resize(N)
+ *     for state in range(n):
+ */
+  __pyx_t_3 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 487, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_v_label_blocks = ((PyObject*)__pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "bundler/extensions/FSM.pyx":488
+ *     # The initial partition, by label. Each block is a contiguous range of elements.
+ *     label_blocks = dict()
+ *     block_of.resize(N)             # <<<<<<<<<<<<<<
+ *     for state in range(n):
+ *         block_of[state] = label_blocks.setdefault(labels[state], len(label_blocks))
+ */
+  try {
+    __pyx_v_block_of.resize(__pyx_v_N);
+  } catch(...) {
+    __Pyx_CppExn2PyErr();
+    __PYX_ERR(0, 488, __pyx_L1_error)
+  }
+
+  /* "bundler/extensions/FSM.pyx":489
+ *     label_blocks = dict()
+ *     block_of.resize(N)
+ *     for state in range(n):             # <<<<<<<<<<<<<<
+ *         block_of[state] = label_blocks.setdefault(labels[state], len(label_blocks))
+ *     block_of[n] = len(label_blocks)
+ */
+  __pyx_t_4 = __pyx_v_n;
+  __pyx_t_5 = __pyx_t_4;
+  for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+    __pyx_v_state = __pyx_t_6;
+
+    /* "bundler/extensions/FSM.pyx":490
+ *     block_of.resize(N)
+ *     for state in range(n):
+ *         block_of[state] = label_blocks.setdefault(labels[state], len(label_blocks))             # <<<<<<<<<<<<<<
+ *     block_of[n] = len(label_blocks)
+ *     blocks = len(label_blocks) + 1
+ */
+    __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_labels, __pyx_v_state, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 490, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_1 = PyDict_Size(__pyx_v_label_blocks); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 490, __pyx_L1_error)
+    __pyx_t_2 = PyInt_FromSsize_t(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 490, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_12 = __Pyx_PyDict_SetDefault(__pyx_v_label_blocks, __pyx_t_3, __pyx_t_2, -1L); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 490, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_12);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_7 = __Pyx_PyInt_As_int(__pyx_t_12); if (unlikely((__pyx_t_7 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 490, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+    (__pyx_v_block_of[__pyx_v_state]) = __pyx_t_7;
+  }
+
+  /* "bundler/extensions/FSM.pyx":491
+ *     for state in range(n):
+ *         block_of[state] = label_blocks.setdefault(labels[state], len(label_blocks))
+ *     block_of[n] = len(label_blocks)             # <<<<<<<<<<<<<<
+ *     blocks = len(label_blocks) + 1
+ *     block_start.assign(blocks, 0)
+ */
+  __pyx_t_1 = PyDict_Size(__pyx_v_label_blocks); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 491, __pyx_L1_error)
+  (__pyx_v_block_of[__pyx_v_n]) = __pyx_t_1;
+
+  /* "bundler/extensions/FSM.pyx":492
+ *         block_of[state] = label_blocks.setdefault(labels[state], len(label_blocks))
+ *     block_of[n] = len(label_blocks)
+ *     blocks = len(label_blocks) + 1             # <<<<<<<<<<<<<<
+ *     block_start.assign(blocks, 0)
+ *     for state in range(N):
+ */
+  __pyx_t_1 = PyDict_Size(__pyx_v_label_blocks); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 492, __pyx_L1_error)
+  __pyx_v_blocks = (__pyx_t_1 + 1);
+
+  /* "bundler/extensions/FSM.pyx":493
+ *     block_of[n] = len(label_blocks)
+ *     blocks = len(label_blocks) + 1
+ *     block_start.assign(blocks, 0)             # <<<<<<<<<<<<<<
+ *     for state in range(N):
+ *         block_start[block_of[state]] += 1
+ */
+  __pyx_v_block_start.assign(__pyx_v_blocks, 0);
+
+  /* "bundler/extensions/FSM.pyx":494
+ *     blocks = len(label_blocks) + 1
+ *     block_start.assign(blocks, 0)
+ *     for state in range(N):             # <<<<<<<<<<<<<<
+ *         block_start[block_of[state]] += 1
+ *     start = 0
+ */
+  __pyx_t_4 = __pyx_v_N;
+  __pyx_t_5 = __pyx_t_4;
+  for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+    __pyx_v_state = __pyx_t_6;
+
+    /* "bundler/extensions/FSM.pyx":495
+ *     block_start.assign(blocks, 0)
+ *     for state in range(N):
+ *         block_start[block_of[state]] += 1             # <<<<<<<<<<<<<<
+ *     start = 0
+ *     for block in range(blocks):
+ */
+    __pyx_t_7 = (__pyx_v_block_of[__pyx_v_state]);
+    (__pyx_v_block_start[__pyx_t_7]) = ((__pyx_v_block_start[__pyx_t_7]) + 1);
+  }
+
+  /* "bundler/extensions/FSM.pyx":496
+ *     for state in range(N):
+ *         block_start[block_of[state]] += 1
+ *     start = 0             # <<<<<<<<<<<<<<
+ *     for block in range(blocks):
+ *         start, block_start[block] = start + block_start[block], start
+ */
+  __pyx_v_start = 0;
+
+  /* "bundler/extensions/FSM.pyx":497
+ *         block_start[block_of[state]] += 1
+ *     start = 0
+ *     for block in range(blocks):             # <<<<<<<<<<<<<<
+ *         start, block_start[block] = start + block_start[block], start
+ *     block_end = block_start
+ */
+  __pyx_t_4 = __pyx_v_blocks;
+  __pyx_t_5 = __pyx_t_4;
+  for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+    __pyx_v_block = __pyx_t_6;
+
+    /* "bundler/extensions/FSM.pyx":498
+ *     start = 0
+ *     for block in range(blocks):
+ *         start, block_start[block] = start + block_start[block], start             # <<<<<<<<<<<<<<
+ *     block_end = block_start
+ *     elements.resize(N)
+ */
+    __pyx_t_7 = (__pyx_v_start + (__pyx_v_block_start[__pyx_v_block]));
+    __pyx_t_8 = __pyx_v_start;
+    __pyx_v_start = __pyx_t_7;
+    (__pyx_v_block_start[__pyx_v_block]) = __pyx_t_8;
+  }
+
+  /* "bundler/extensions/FSM.pyx":499
+ *     for block in range(blocks):
+ *         start, block_start[block] = start + block_start[block], start
+ *     block_end = block_start             # <<<<<<<<<<<<<<
+ *     elements.resize(N)
+ *     location.resize(N)
+ */
+  __pyx_v_block_end = __pyx_v_block_start;
+
+  /* "bundler/extensions/FSM.pyx":500
+ *         start, block_start[block] = start + block_start[block], start
+ *     block_end = block_start
+ *     elements.resize(N)             # <<<<<<<<<<<<<<
+ *     location.resize(N)
+ *     for state in range(N):
+ */
+  try {
+    __pyx_v_elements.resize(__pyx_v_N);
+  } catch(...) {
+    __Pyx_CppExn2PyErr();
+    __PYX_ERR(0, 500, __pyx_L1_error)
+  }
+
+  /* "bundler/extensions/FSM.pyx":501
+ *     block_end = block_start
+ *     elements.resize(N)
+ *     location.resize(N)             # <<<<<<<<<<<<<<
+ *     for state in range(N):
+ *         location[state] = block_end[block_of[state]]
+ */
+  try {
+    __pyx_v_location.resize(__pyx_v_N);
+  } catch(...) {
+    __Pyx_CppExn2PyErr();
+    __PYX_ERR(0, 501, __pyx_L1_error)
+  }
+
+  /* "bundler/extensions/FSM.pyx":502
+ *     elements.resize(N)
+ *     location.resize(N)
+ *     for state in range(N):             # <<<<<<<<<<<<<<
+ *         location[state] = block_end[block_of[state]]
+ *         elements[location[state]] = state
+ */
+  __pyx_t_4 = __pyx_v_N;
+  __pyx_t_5 = __pyx_t_4;
+  for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+    __pyx_v_state = __pyx_t_6;
+
+    /* "bundler/extensions/FSM.pyx":503
+ *     location.resize(N)
+ *     for state in range(N):
+ *         location[state] = block_end[block_of[state]]             # <<<<<<<<<<<<<<
+ *         elements[location[state]] = state
+ *         block_end[block_of[state]] += 1
+ */
+    (__pyx_v_location[__pyx_v_state]) = (__pyx_v_block_end[(__pyx_v_block_of[__pyx_v_state])]);
+
+    /* "bundler/extensions/FSM.pyx":504
+ *     for state in range(N):
+ *         location[state] = block_end[block_of[state]]
+ *         elements[location[state]] = state             # <<<<<<<<<<<<<<
+ *         block_end[block_of[state]] += 1
+ *     marked.assign(blocks, 0)
+ */
+    (__pyx_v_elements[(__pyx_v_location[__pyx_v_state])]) = __pyx_v_state;
+
+    /* "bundler/extensions/FSM.pyx":505
+ *         location[state] = block_end[block_of[state]]
+ *         elements[location[state]] = state
+ *         block_end[block_of[state]] += 1             # <<<<<<<<<<<<<<
+ *     marked.assign(blocks, 0)
+ * 
+ */
+    __pyx_t_8 = (__pyx_v_block_of[__pyx_v_state]);
+    (__pyx_v_block_end[__pyx_t_8]) = ((__pyx_v_block_end[__pyx_t_8]) + 1);
+  }
+
+  /* "bundler/extensions/FSM.pyx":506
+ *         elements[location[state]] = state
+ *         block_end[block_of[state]] += 1
+ *     marked.assign(blocks, 0)             # <<<<<<<<<<<<<<
+ * 
+ *     waiting.assign(N * alphabet_len, 0)  # waiting[block * alphabet_len + letter] records whether (block, letter) is in splitters.
+ */
+  __pyx_v_marked.assign(__pyx_v_blocks, 0);
+
+  /* "bundler/extensions/FSM.pyx":508
+ *     marked.assign(blocks, 0)
+ * 
+ *     waiting.assign(N * alphabet_len, 0)  # waiting[block * alphabet_len + letter] records whether (block, letter) is in splitters.             # <<<<<<<<<<<<<<
+ *     for block in range(blocks):
+ *         for letter in range(alphabet_len):
+ */
+  __pyx_v_waiting.assign((__pyx_v_N * __pyx_v_alphabet_len), 0);
+
+  /* "bundler/extensions/FSM.pyx":509
+ * 
+ *     waiting.assign(N * alphabet_len, 0)  # waiting[block * alphabet_len + letter] records whether (block, letter) is in splitters.
+ *     for block in range(blocks):             # <<<<<<<<<<<<<<
+ *         for letter in range(alphabet_len):
+ *             splitters.push_back(block * alphabet_len + letter)
+ */
+  __pyx_t_4 = __pyx_v_blocks;
+  __pyx_t_5 = __pyx_t_4;
+  for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+    __pyx_v_block = __pyx_t_6;
+
+    /* "bundler/extensions/FSM.pyx":510
+ *     waiting.assign(N * alphabet_len, 0)  # waiting[block * alphabet_len + letter] records whether (block, letter) is in splitters.
+ *     for block in range(blocks):
+ *         for letter in range(alphabet_len):             # <<<<<<<<<<<<<<
+ *             splitters.push_back(block * alphabet_len + letter)
+ *             waiting[block * alphabet_len + letter] = 1
+ */
+    __pyx_t_8 = __pyx_v_alphabet_len;
+    __pyx_t_7 = __pyx_t_8;
+    for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_7; __pyx_t_9+=1) {
+      __pyx_v_letter = __pyx_t_9;
+
+      /* "bundler/extensions/FSM.pyx":511
+ *     for block in range(blocks):
+ *         for letter in range(alphabet_len):
+ *             splitters.push_back(block * alphabet_len + letter)             # <<<<<<<<<<<<<<
+ *             waiting[block * alphabet_len + letter] = 1
+ * 
+ */
+      try {
+        __pyx_v_splitters.push_back(((__pyx_v_block * __pyx_v_alphabet_len) + __pyx_v_letter));
+      } catch(...) {
+        __Pyx_CppExn2PyErr();
+        __PYX_ERR(0, 511, __pyx_L1_error)
+      }
+
+      /* "bundler/extensions/FSM.pyx":512
+ *         for letter in range(alphabet_len):
+ *             splitters.push_back(block * alphabet_len + letter)
+ *             waiting[block * alphabet_len + letter] = 1             # <<<<<<<<<<<<<<
+ * 
+ *     while not splitters.empty():
+ */
+      (__pyx_v_waiting[((__pyx_v_block * __pyx_v_alphabet_len) + __pyx_v_letter)]) = 1;
+    }
+  }
+
+  /* "bundler/extensions/FSM.pyx":514
+ *             waiting[block * alphabet_len + letter] = 1
+ * 
+ *     while not splitters.empty():             # <<<<<<<<<<<<<<
+ *         block, letter = splitters.back() // alphabet_len, splitters.back() % alphabet_len
+ *         splitters.pop_back()
+ */
+  while (1) {
+    __pyx_t_13 = ((!(__pyx_v_splitters.empty() != 0)) != 0);
+    if (!__pyx_t_13) break;
+
+    /* "bundler/extensions/FSM.pyx":515
+ * 
+ *     while not splitters.empty():
+ *         block, letter = splitters.back() // alphabet_len, splitters.back() % alphabet_len             # <<<<<<<<<<<<<<
+ *         splitters.pop_back()
+ *         waiting[block * alphabet_len + letter] = 0
+ */
+    __pyx_t_4 = __pyx_v_splitters.back();
+    if (unlikely(__pyx_v_alphabet_len == 0)) {
+      PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
+      __PYX_ERR(0, 515, __pyx_L1_error)
+    }
+    else if (sizeof(int) == sizeof(long) && (!(((int)-1) > 0)) && unlikely(__pyx_v_alphabet_len == (int)-1)  && unlikely(UNARY_NEG_WOULD_OVERFLOW(__pyx_t_4))) {
+      PyErr_SetString(PyExc_OverflowError, "value too large to perform division");
+      __PYX_ERR(0, 515, __pyx_L1_error)
+    }
+    __pyx_t_5 = __Pyx_div_int(__pyx_t_4, __pyx_v_alphabet_len);
+    __pyx_t_4 = __pyx_v_splitters.back();
+    if (unlikely(__pyx_v_alphabet_len == 0)) {
+      PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
+      __PYX_ERR(0, 515, __pyx_L1_error)
+    }
+    __pyx_t_6 = __Pyx_mod_int(__pyx_t_4, __pyx_v_alphabet_len);
+    __pyx_v_block = __pyx_t_5;
+    __pyx_v_letter = __pyx_t_6;
+
+    /* "bundler/extensions/FSM.pyx":516
+ *     while not splitters.empty():
+ *         block, letter = splitters.back() // alphabet_len, splitters.back() % alphabet_len
+ *         splitters.pop_back()             # <<<<<<<<<<<<<<
+ *         waiting[block * alphabet_len + letter] = 0
+ * 
+ */
+    __pyx_v_splitters.pop_back();
+
+    /* "bundler/extensions/FSM.pyx":517
+ *         block, letter = splitters.back() // alphabet_len, splitters.back() % alphabet_len
+ *         splitters.pop_back()
+ *         waiting[block * alphabet_len + letter] = 0             # <<<<<<<<<<<<<<
+ * 
+ *         # The states that letter takes into block.
+ */
+    (__pyx_v_waiting[((__pyx_v_block * __pyx_v_alphabet_len) + __pyx_v_letter)]) = 0;
+
+    /* "bundler/extensions/FSM.pyx":520
+ * 
+ *         # The states that letter takes into block.
+ *         preimage.clear()             # <<<<<<<<<<<<<<
+ *         for i in range(block_start[block], block_end[block]):
+ *             target = letter * N + elements[i]
+ */
+    __pyx_v_preimage.clear();
+
+    /* "bundler/extensions/FSM.pyx":521
+ *         # The states that letter takes into block.
+ *         preimage.clear()
+ *         for i in range(block_start[block], block_end[block]):             # <<<<<<<<<<<<<<
+ *             target = letter * N + elements[i]
+ *             for j in range(reverse_starts[target], reverse_starts[target + 1]):
+ */
+    __pyx_t_6 = (__pyx_v_block_end[__pyx_v_block]);
+    __pyx_t_5 = __pyx_t_6;
+    for (__pyx_t_4 = (__pyx_v_block_start[__pyx_v_block]); __pyx_t_4 < __pyx_t_5; __pyx_t_4+=1) {
+      __pyx_v_i = __pyx_t_4;
+
+      /* "bundler/extensions/FSM.pyx":522
+ *         preimage.clear()
+ *         for i in range(block_start[block], block_end[block]):
+ *             target = letter * N + elements[i]             # <<<<<<<<<<<<<<
+ *             for j in range(reverse_starts[target], reverse_starts[target + 1]):
+ *                 preimage.push_back(reverse_arrows[j])
+ */
+      __pyx_v_target = ((__pyx_v_letter * __pyx_v_N) + (__pyx_v_elements[__pyx_v_i]));
+
+      /* "bundler/extensions/FSM.pyx":523
+ *         for i in range(block_start[block], block_end[block]):
+ *             target = letter * N + elements[i]
+ *             for j in range(reverse_starts[target], reverse_starts[target + 1]):             # <<<<<<<<<<<<<<
+ *                 preimage.push_back(reverse_arrows[j])
+ * 
+ */
+      __pyx_t_8 = (__pyx_v_reverse_starts[(__pyx_v_target + 1)]);
+      __pyx_t_7 = __pyx_t_8;
+      for (__pyx_t_9 = (__pyx_v_reverse_starts[__pyx_v_target]); __pyx_t_9 < __pyx_t_7; __pyx_t_9+=1) {
+        __pyx_v_j = __pyx_t_9;
+
+        /* "bundler/extensions/FSM.pyx":524
+ *             target = letter * N + elements[i]
+ *             for j in range(reverse_starts[target], reverse_starts[target + 1]):
+ *                 preimage.push_back(reverse_arrows[j])             # <<<<<<<<<<<<<<
+ * 
+ *         # Move these to the front of their blocks.
+ */
+        try {
+          __pyx_v_preimage.push_back((__pyx_v_reverse_arrows[__pyx_v_j]));
+        } catch(...) {
+          __Pyx_CppExn2PyErr();
+          __PYX_ERR(0, 524, __pyx_L1_error)
+        }
+      }
+    }
+
+    /* "bundler/extensions/FSM.pyx":527
+ * 
+ *         # Move these to the front of their blocks.
+ *         for state in preimage:             # <<<<<<<<<<<<<<
+ *             block = block_of[state]
+ *             middle = block_start[block] + marked[block]
+ */
+    __pyx_t_14 = __pyx_v_preimage.begin();
+    for (;;) {
+      if (!(__pyx_t_14 != __pyx_v_preimage.end())) break;
+      __pyx_t_6 = *__pyx_t_14;
+      ++__pyx_t_14;
+      __pyx_v_state = __pyx_t_6;
+
+      /* "bundler/extensions/FSM.pyx":528
+ *         # Move these to the front of their blocks.
+ *         for state in preimage:
+ *             block = block_of[state]             # <<<<<<<<<<<<<<
+ *             middle = block_start[block] + marked[block]
+ *             if location[state] < middle: continue  # Already moved.
+ */
+      __pyx_v_block = (__pyx_v_block_of[__pyx_v_state]);
+
+      /* "bundler/extensions/FSM.pyx":529
+ *         for state in preimage:
+ *             block = block_of[state]
+ *             middle = block_start[block] + marked[block]             # <<<<<<<<<<<<<<
+ *             if location[state] < middle: continue  # Already moved.
+ *             if marked[block] == 0: touched.push_back(block)
+ */
+      __pyx_v_middle = ((__pyx_v_block_start[__pyx_v_block]) + (__pyx_v_marked[__pyx_v_block]));
+
+      /* "bundler/extensions/FSM.pyx":530
+ *             block = block_of[state]
+ *             middle = block_start[block] + marked[block]
+ *             if location[state] < middle: continue  # Already moved.             # <<<<<<<<<<<<<<
+ *             if marked[block] == 0: touched.push_back(block)
+ *             i = elements[middle]
+ */
+      __pyx_t_13 = (((__pyx_v_location[__pyx_v_state]) < __pyx_v_middle) != 0);
+      if (__pyx_t_13) {
+        goto __pyx_L37_continue;
+      }
+
+      /* "bundler/extensions/FSM.pyx":531
+ *             middle = block_start[block] + marked[block]
+ *             if location[state] < middle: continue  # Already moved.
+ *             if marked[block] == 0: touched.push_back(block)             # <<<<<<<<<<<<<<
+ *             i = elements[middle]
+ *             elements[middle], elements[location[state]] = state, i
+ */
+      __pyx_t_13 = (((__pyx_v_marked[__pyx_v_block]) == 0) != 0);
+      if (__pyx_t_13) {
+        try {
+          __pyx_v_touched.push_back(__pyx_v_block);
+        } catch(...) {
+          __Pyx_CppExn2PyErr();
+          __PYX_ERR(0, 531, __pyx_L1_error)
+        }
+      }
+
+      /* "bundler/extensions/FSM.pyx":532
+ *             if location[state] < middle: continue  # Already moved.
+ *             if marked[block] == 0: touched.push_back(block)
+ *             i = elements[middle]             # <<<<<<<<<<<<<<
+ *             elements[middle], elements[location[state]] = state, i
+ *             location[i], location[state] = location[state], middle
+ */
+      __pyx_v_i = (__pyx_v_elements[__pyx_v_middle]);
+
+      /* "bundler/extensions/FSM.pyx":533
+ *             if marked[block] == 0: touched.push_back(block)
+ *             i = elements[middle]
+ *             elements[middle], elements[location[state]] = state, i             # <<<<<<<<<<<<<<
+ *             location[i], location[state] = location[state], middle
+ *             marked[block] += 1
+ */
+      __pyx_t_6 = __pyx_v_state;
+      __pyx_t_5 = __pyx_v_i;
+      (__pyx_v_elements[__pyx_v_middle]) = __pyx_t_6;
+      (__pyx_v_elements[(__pyx_v_location[__pyx_v_state])]) = __pyx_t_5;
+
+      /* "bundler/extensions/FSM.pyx":534
+ *             i = elements[middle]
+ *             elements[middle], elements[location[state]] = state, i
+ *             location[i], location[state] = location[state], middle             # <<<<<<<<<<<<<<
+ *             marked[block] += 1
+ * 
+ */
+      __pyx_t_5 = (__pyx_v_location[__pyx_v_state]);
+      __pyx_t_6 = __pyx_v_middle;
+      (__pyx_v_location[__pyx_v_i]) = __pyx_t_5;
+      (__pyx_v_location[__pyx_v_state]) = __pyx_t_6;
+
+      /* "bundler/extensions/FSM.pyx":535
+ *             elements[middle], elements[location[state]] = state, i
+ *             location[i], location[state] = location[state], middle
+ *             marked[block] += 1             # <<<<<<<<<<<<<<
+ * 
+ *         # Split each block met into the states moved and the rest.
+ */
+      __pyx_t_6 = __pyx_v_block;
+      (__pyx_v_marked[__pyx_t_6]) = ((__pyx_v_marked[__pyx_t_6]) + 1);
+
+      /* "bundler/extensions/FSM.pyx":527
+ * 
+ *         # Move these to the front of their blocks.
+ *         for state in preimage:             # <<<<<<<<<<<<<<
+ *             block = block_of[state]
+ *             middle = block_start[block] + marked[block]
+ */
+      __pyx_L37_continue:;
+    }
+
+    /* "bundler/extensions/FSM.pyx":538
+ * 
+ *         # Split each block met into the states moved and the rest.
+ *         for block in touched:             # <<<<<<<<<<<<<<
+ *             if marked[block] < block_end[block] - block_start[block]:
+ *                 new_block = blocks
+ */
+    __pyx_t_14 = __pyx_v_touched.begin();
+    for (;;) {
+      if (!(__pyx_t_14 != __pyx_v_touched.end())) break;
+      __pyx_t_6 = *__pyx_t_14;
+      ++__pyx_t_14;
+      __pyx_v_block = __pyx_t_6;
+
+      /* "bundler/extensions/FSM.pyx":539
+ *         # Split each block met into the states moved and the rest.
+ *         for block in touched:
+ *             if marked[block] < block_end[block] - block_start[block]:             # <<<<<<<<<<<<<<
+ *                 new_block = blocks
+ *                 blocks += 1
+ */
+      __pyx_t_13 = (((__pyx_v_marked[__pyx_v_block]) < ((__pyx_v_block_end[__pyx_v_block]) - (__pyx_v_block_start[__pyx_v_block]))) != 0);
+      if (__pyx_t_13) {
+
+        /* "bundler/extensions/FSM.pyx":540
+ *         for block in touched:
+ *             if marked[block] < block_end[block] - block_start[block]:
+ *                 new_block = blocks             # <<<<<<<<<<<<<<
+ *                 blocks += 1
+ *                 block_start.push_back(block_start[block])
+ */
+        __pyx_v_new_block = __pyx_v_blocks;
+
+        /* "bundler/extensions/FSM.pyx":541
+ *             if marked[block] < block_end[block] - block_start[block]:
+ *                 new_block = blocks
+ *                 blocks += 1             # <<<<<<<<<<<<<<
+ *                 block_start.push_back(block_start[block])
+ *                 block_end.push_back(block_start[block] + marked[block])
+ */
+        __pyx_v_blocks = (__pyx_v_blocks + 1);
+
+        /* "bundler/extensions/FSM.pyx":542
+ *                 new_block = blocks
+ *                 blocks += 1
+ *                 block_start.push_back(block_start[block])             # <<<<<<<<<<<<<<
+ *                 block_end.push_back(block_start[block] + marked[block])
+ *                 marked.push_back(0)
+ */
+        try {
+          __pyx_v_block_start.push_back((__pyx_v_block_start[__pyx_v_block]));
+        } catch(...) {
+          __Pyx_CppExn2PyErr();
+          __PYX_ERR(0, 542, __pyx_L1_error)
+        }
+
+        /* "bundler/extensions/FSM.pyx":543
+ *                 blocks += 1
+ *                 block_start.push_back(block_start[block])
+ *                 block_end.push_back(block_start[block] + marked[block])             # <<<<<<<<<<<<<<
+ *                 marked.push_back(0)
+ *                 block_start[block] = block_end[new_block]
+ */
+        try {
+          __pyx_v_block_end.push_back(((__pyx_v_block_start[__pyx_v_block]) + (__pyx_v_marked[__pyx_v_block])));
+        } catch(...) {
+          __Pyx_CppExn2PyErr();
+          __PYX_ERR(0, 543, __pyx_L1_error)
+        }
+
+        /* "bundler/extensions/FSM.pyx":544
+ *                 block_start.push_back(block_start[block])
+ *                 block_end.push_back(block_start[block] + marked[block])
+ *                 marked.push_back(0)             # <<<<<<<<<<<<<<
+ *                 block_start[block] = block_end[new_block]
+ *                 for i in range(block_start[new_block], block_end[new_block]):
+ */
+        try {
+          __pyx_v_marked.push_back(0);
+        } catch(...) {
+          __Pyx_CppExn2PyErr();
+          __PYX_ERR(0, 544, __pyx_L1_error)
+        }
+
+        /* "bundler/extensions/FSM.pyx":545
+ *                 block_end.push_back(block_start[block] + marked[block])
+ *                 marked.push_back(0)
+ *                 block_start[block] = block_end[new_block]             # <<<<<<<<<<<<<<
+ *                 for i in range(block_start[new_block], block_end[new_block]):
+ *                     block_of[elements[i]] = new_block
+ */
+        (__pyx_v_block_start[__pyx_v_block]) = (__pyx_v_block_end[__pyx_v_new_block]);
+
+        /* "bundler/extensions/FSM.pyx":546
+ *                 marked.push_back(0)
+ *                 block_start[block] = block_end[new_block]
+ *                 for i in range(block_start[new_block], block_end[new_block]):             # <<<<<<<<<<<<<<
+ *                     block_of[elements[i]] = new_block
+ * 
+ */
+        __pyx_t_6 = (__pyx_v_block_end[__pyx_v_new_block]);
+        __pyx_t_5 = __pyx_t_6;
+        for (__pyx_t_4 = (__pyx_v_block_start[__pyx_v_new_block]); __pyx_t_4 < __pyx_t_5; __pyx_t_4+=1) {
+          __pyx_v_i = __pyx_t_4;
+
+          /* "bundler/extensions/FSM.pyx":547
+ *                 block_start[block] = block_end[new_block]
+ *                 for i in range(block_start[new_block], block_end[new_block]):
+ *                     block_of[elements[i]] = new_block             # <<<<<<<<<<<<<<
+ * 
+ *                 for letter in range(alphabet_len):
+ */
+          (__pyx_v_block_of[(__pyx_v_elements[__pyx_v_i])]) = __pyx_v_new_block;
+        }
+
+        /* "bundler/extensions/FSM.pyx":549
+ *                     block_of[elements[i]] = new_block
+ * 
+ *                 for letter in range(alphabet_len):             # <<<<<<<<<<<<<<
+ *                     if waiting[block * alphabet_len + letter] or block_end[new_block] - block_start[new_block] <= block_end[block] - block_start[block]:
+ *                         splitters.push_back(new_block * alphabet_len + letter)
+ */
+        __pyx_t_6 = __pyx_v_alphabet_len;
+        __pyx_t_5 = __pyx_t_6;
+        for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_5; __pyx_t_4+=1) {
+          __pyx_v_letter = __pyx_t_4;
+
+          /* "bundler/extensions/FSM.pyx":550
+ * 
+ *                 for letter in range(alphabet_len):
+ *                     if waiting[block * alphabet_len + letter] or block_end[new_block] - block_start[new_block] <= block_end[block] - block_start[block]:             # <<<<<<<<<<<<<<
+ *                         splitters.push_back(new_block * alphabet_len + letter)
+ *                         waiting[new_block * alphabet_len + letter] = 1
+ */
+          __pyx_t_15 = ((__pyx_v_waiting[((__pyx_v_block * __pyx_v_alphabet_len) + __pyx_v_letter)]) != 0);
+          if (!__pyx_t_15) {
+          } else {
+            __pyx_t_13 = __pyx_t_15;
+            goto __pyx_L49_bool_binop_done;
+          }
+          __pyx_t_15 = ((((__pyx_v_block_end[__pyx_v_new_block]) - (__pyx_v_block_start[__pyx_v_new_block])) <= ((__pyx_v_block_end[__pyx_v_block]) - (__pyx_v_block_start[__pyx_v_block]))) != 0);
+          __pyx_t_13 = __pyx_t_15;
+          __pyx_L49_bool_binop_done:;
+          if (__pyx_t_13) {
+
+            /* "bundler/extensions/FSM.pyx":551
+ *                 for letter in range(alphabet_len):
+ *                     if waiting[block * alphabet_len + letter] or block_end[new_block] - block_start[new_block] <= block_end[block] - block_start[block]:
+ *                         splitters.push_back(new_block * alphabet_len + letter)             # <<<<<<<<<<<<<<
+ *                         waiting[new_block * alphabet_len + letter] = 1
+ *                     else:
+ */
+            try {
+              __pyx_v_splitters.push_back(((__pyx_v_new_block * __pyx_v_alphabet_len) + __pyx_v_letter));
+            } catch(...) {
+              __Pyx_CppExn2PyErr();
+              __PYX_ERR(0, 551, __pyx_L1_error)
+            }
+
+            /* "bundler/extensions/FSM.pyx":552
+ *                     if waiting[block * alphabet_len + letter] or block_end[new_block] - block_start[new_block] <= block_end[block] - block_start[block]:
+ *                         splitters.push_back(new_block * alphabet_len + letter)
+ *                         waiting[new_block * alphabet_len + letter] = 1             # <<<<<<<<<<<<<<
+ *                     else:
+ *                         splitters.push_back(block * alphabet_len + letter)
+ */
+            (__pyx_v_waiting[((__pyx_v_new_block * __pyx_v_alphabet_len) + __pyx_v_letter)]) = 1;
+
+            /* "bundler/extensions/FSM.pyx":550
+ * 
+ *                 for letter in range(alphabet_len):
+ *                     if waiting[block * alphabet_len + letter] or block_end[new_block] - block_start[new_block] <= block_end[block] - block_start[block]:             # <<<<<<<<<<<<<<
+ *                         splitters.push_back(new_block * alphabet_len + letter)
+ *                         waiting[new_block * alphabet_len + letter] = 1
+ */
+            goto __pyx_L48;
+          }
+
+          /* "bundler/extensions/FSM.pyx":554
+ *                         waiting[new_block * alphabet_len + letter] = 1
+ *                     else:
+ *                         splitters.push_back(block * alphabet_len + letter)             # <<<<<<<<<<<<<<
+ *                         waiting[block * alphabet_len + letter] = 1
+ *             marked[block] = 0
+ */
+          /*else*/ {
+            try {
+              __pyx_v_splitters.push_back(((__pyx_v_block * __pyx_v_alphabet_len) + __pyx_v_letter));
+            } catch(...) {
+              __Pyx_CppExn2PyErr();
+              __PYX_ERR(0, 554, __pyx_L1_error)
+            }
+
+            /* "bundler/extensions/FSM.pyx":555
+ *                     else:
+ *                         splitters.push_back(block * alphabet_len + letter)
+ *                         waiting[block * alphabet_len + letter] = 1             # <<<<<<<<<<<<<<
+ *             marked[block] = 0
+ *         touched.clear()
+ */
+            (__pyx_v_waiting[((__pyx_v_block * __pyx_v_alphabet_len) + __pyx_v_letter)]) = 1;
+          }
+          __pyx_L48:;
+        }
+
+        /* "bundler/extensions/FSM.pyx":539
+ *         # Split each block met into the states moved and the rest.
+ *         for block in touched:
+ *             if marked[block] < block_end[block] - block_start[block]:             # <<<<<<<<<<<<<<
+ *                 new_block = blocks
+ *                 blocks += 1
+ */
+      }
+
+      /* "bundler/extensions/FSM.pyx":556
+ *                         splitters.push_back(block * alphabet_len + letter)
+ *                         waiting[block * alphabet_len + letter] = 1
+ *             marked[block] = 0             # <<<<<<<<<<<<<<
+ *         touched.clear()
+ * 
+ */
+      (__pyx_v_marked[__pyx_v_block]) = 0;
+
+      /* "bundler/extensions/FSM.pyx":538
+ * 
+ *         # Split each block met into the states moved and the rest.
+ *         for block in touched:             # <<<<<<<<<<<<<<
+ *             if marked[block] < block_end[block] - block_start[block]:
+ *                 new_block = blocks
+ */
+    }
+
+    /* "bundler/extensions/FSM.pyx":557
+ *                         waiting[block * alphabet_len + letter] = 1
+ *             marked[block] = 0
+ *         touched.clear()             # <<<<<<<<<<<<<<
+ * 
+ *     # Number the blocks reachable from the start in breadth first order.
+ */
+    __pyx_v_touched.clear();
+  }
+
+  /* "bundler/extensions/FSM.pyx":560
+ * 
+ *     # Number the blocks reachable from the start in breadth first order.
+ *     new_index.assign(blocks, -1)             # <<<<<<<<<<<<<<
+ *     new_index[block_of[0]] = 0
+ *     representatives.push_back(0)
+ */
+  __pyx_v_new_index.assign(__pyx_v_blocks, -1);
+
+  /* "bundler/extensions/FSM.pyx":561
+ *     # Number the blocks reachable from the start in breadth first order.
+ *     new_index.assign(blocks, -1)
+ *     new_index[block_of[0]] = 0             # <<<<<<<<<<<<<<
+ *     representatives.push_back(0)
+ *     while head < representatives.size():
+ */
+  (__pyx_v_new_index[(__pyx_v_block_of[0])]) = 0;
+
+  /* "bundler/extensions/FSM.pyx":562
+ *     new_index.assign(blocks, -1)
+ *     new_index[block_of[0]] = 0
+ *     representatives.push_back(0)             # <<<<<<<<<<<<<<
+ *     while head < representatives.size():
+ *         state = representatives[head]
+ */
+  try {
+    __pyx_v_representatives.push_back(0);
+  } catch(...) {
+    __Pyx_CppExn2PyErr();
+    __PYX_ERR(0, 562, __pyx_L1_error)
+  }
+
+  /* "bundler/extensions/FSM.pyx":563
+ *     new_index[block_of[0]] = 0
+ *     representatives.push_back(0)
+ *     while head < representatives.size():             # <<<<<<<<<<<<<<
+ *         state = representatives[head]
+ *         head += 1
+ */
+  while (1) {
+    __pyx_t_13 = ((__pyx_v_head < __pyx_v_representatives.size()) != 0);
+    if (!__pyx_t_13) break;
+
+    /* "bundler/extensions/FSM.pyx":564
+ *     representatives.push_back(0)
+ *     while head < representatives.size():
+ *         state = representatives[head]             # <<<<<<<<<<<<<<
+ *         head += 1
+ *         for letter in range(alphabet_len):
+ */
+    __pyx_v_state = (__pyx_v_representatives[__pyx_v_head]);
+
+    /* "bundler/extensions/FSM.pyx":565
+ *     while head < representatives.size():
+ *         state = representatives[head]
+ *         head += 1             # <<<<<<<<<<<<<<
+ *         for letter in range(alphabet_len):
+ *             target = transitions[state * alphabet_len + letter]
+ */
+    __pyx_v_head = (__pyx_v_head + 1);
+
+    /* "bundler/extensions/FSM.pyx":566
+ *         state = representatives[head]
+ *         head += 1
+ *         for letter in range(alphabet_len):             # <<<<<<<<<<<<<<
+ *             target = transitions[state * alphabet_len + letter]
+ *             if target == n:
+ */
+    __pyx_t_6 = __pyx_v_alphabet_len;
+    __pyx_t_5 = __pyx_t_6;
+    for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_5; __pyx_t_4+=1) {
+      __pyx_v_letter = __pyx_t_4;
+
+      /* "bundler/extensions/FSM.pyx":567
+ *         head += 1
+ *         for letter in range(alphabet_len):
+ *             target = transitions[state * alphabet_len + letter]             # <<<<<<<<<<<<<<
+ *             if target == n:
+ *                 new_machine.push_back(-1)
+ */
+      __pyx_v_target = (__pyx_v_transitions[((__pyx_v_state * __pyx_v_alphabet_len) + __pyx_v_letter)]);
+
+      /* "bundler/extensions/FSM.pyx":568
+ *         for letter in range(alphabet_len):
+ *             target = transitions[state * alphabet_len + letter]
+ *             if target == n:             # <<<<<<<<<<<<<<
+ *                 new_machine.push_back(-1)
+ *                 continue
+ */
+      __pyx_t_13 = ((__pyx_v_target == __pyx_v_n) != 0);
+      if (__pyx_t_13) {
+
+        /* "bundler/extensions/FSM.pyx":569
+ *             target = transitions[state * alphabet_len + letter]
+ *             if target == n:
+ *                 new_machine.push_back(-1)             # <<<<<<<<<<<<<<
+ *                 continue
+ *             block = block_of[target]
+ */
+        try {
+          __pyx_v_new_machine.push_back(-1);
+        } catch(...) {
+          __Pyx_CppExn2PyErr();
+          __PYX_ERR(0, 569, __pyx_L1_error)
+        }
+
+        /* "bundler/extensions/FSM.pyx":570
+ *             if target == n:
+ *                 new_machine.push_back(-1)
+ *                 continue             # <<<<<<<<<<<<<<
+ *             block = block_of[target]
+ *             if new_index[block] < 0:
+ */
+        goto __pyx_L53_continue;
+
+        /* "bundler/extensions/FSM.pyx":568
+ *         for letter in range(alphabet_len):
+ *             target = transitions[state * alphabet_len + letter]
+ *             if target == n:             # <<<<<<<<<<<<<<
+ *                 new_machine.push_back(-1)
+ *                 continue
+ */
+      }
+
+      /* "bundler/extensions/FSM.pyx":571
+ *                 new_machine.push_back(-1)
+ *                 continue
+ *             block = block_of[target]             # <<<<<<<<<<<<<<
+ *             if new_index[block] < 0:
+ *                 new_index[block] = representatives.size()
+ */
+      __pyx_v_block = (__pyx_v_block_of[__pyx_v_target]);
+
+      /* "bundler/extensions/FSM.pyx":572
+ *                 continue
+ *             block = block_of[target]
+ *             if new_index[block] < 0:             # <<<<<<<<<<<<<<
+ *                 new_index[block] = representatives.size()
+ *                 representatives.push_back(elements[block_start[block]])
+ */
+      __pyx_t_13 = (((__pyx_v_new_index[__pyx_v_block]) < 0) != 0);
+      if (__pyx_t_13) {
+
+        /* "bundler/extensions/FSM.pyx":573
+ *             block = block_of[target]
+ *             if new_index[block] < 0:
+ *                 new_index[block] = representatives.size()             # <<<<<<<<<<<<<<
+ *                 representatives.push_back(elements[block_start[block]])
+ *             new_machine.push_back(new_index[block])
+ */
+        (__pyx_v_new_index[__pyx_v_block]) = __pyx_v_representatives.size();
+
+        /* "bundler/extensions/FSM.pyx":574
+ *             if new_index[block] < 0:
+ *                 new_index[block] = representatives.size()
+ *                 representatives.push_back(elements[block_start[block]])             # <<<<<<<<<<<<<<
+ *             new_machine.push_back(new_index[block])
+ * 
+ */
+        try {
+          __pyx_v_representatives.push_back((__pyx_v_elements[(__pyx_v_block_start[__pyx_v_block])]));
+        } catch(...) {
+          __Pyx_CppExn2PyErr();
+          __PYX_ERR(0, 574, __pyx_L1_error)
+        }
+
+        /* "bundler/extensions/FSM.pyx":572
+ *                 continue
+ *             block = block_of[target]
+ *             if new_index[block] < 0:             # <<<<<<<<<<<<<<
+ *                 new_index[block] = representatives.size()
+ *                 representatives.push_back(elements[block_start[block]])
+ */
+      }
+
+      /* "bundler/extensions/FSM.pyx":575
+ *                 new_index[block] = representatives.size()
+ *                 representatives.push_back(elements[block_start[block]])
+ *             new_machine.push_back(new_index[block])             # <<<<<<<<<<<<<<
+ * 
+ *     return array.array('i', new_machine), list(representatives)
+ */
+      try {
+        __pyx_v_new_machine.push_back((__pyx_v_new_index[__pyx_v_block]));
+      } catch(...) {
+        __Pyx_CppExn2PyErr();
+        __PYX_ERR(0, 575, __pyx_L1_error)
+      }
+      __pyx_L53_continue:;
+    }
+  }
+
+  /* "bundler/extensions/FSM.pyx":577
+ *             new_machine.push_back(new_index[block])
+ * 
+ *     return array.array('i', new_machine), list(representatives)             # <<<<<<<<<<<<<<
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_12 = __pyx_convert_vector_to_py_int(__pyx_v_new_machine); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 577, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_12);
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 577, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_n_u_i);
+  __Pyx_GIVEREF(__pyx_n_u_i);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_n_u_i);
+  __Pyx_GIVEREF(__pyx_t_12);
+  PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_12);
+  __pyx_t_12 = 0;
+  __pyx_t_12 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_7cpython_5array_array), __pyx_t_2, NULL); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 577, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_12);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __pyx_convert_vector_to_py_int(__pyx_v_representatives); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 577, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PySequence_List(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 577, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 577, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_12);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_12);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_3);
+  __pyx_t_12 = 0;
+  __pyx_t_3 = 0;
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "bundler/extensions/FSM.pyx":444
+ *     return array.array('i', machine), accepting_words
+ * 
+ * def minimise(int alphabet_len, machine, labels):             # <<<<<<<<<<<<<<
+ *     ''' Return the minimal machine equivalent to the given flat transition table, using Hopcroft's algorithm.
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_12);
+  __Pyx_AddTraceback("bundler.extensions.FSM.minimise", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_flat);
+  __Pyx_XDECREF(__pyx_v_label_blocks);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __pyx_unpickle_StatePath(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_5__pyx_unpickle_StatePath(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_7bundler_10extensions_3FSM_5__pyx_unpickle_StatePath = {"__pyx_unpickle_StatePath", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_7bundler_10extensions_3FSM_5__pyx_unpickle_StatePath, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_5__pyx_unpickle_StatePath(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v___pyx_type = 0;
+  long __pyx_v___pyx_checksum;
+  PyObject *__pyx_v___pyx_state = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__pyx_unpickle_StatePath (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_pyx_type,&__pyx_n_s_pyx_checksum,&__pyx_n_s_pyx_state,0};
+    PyObject* values[3] = {0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_type)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_checksum)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_StatePath", 1, 3, 3, 1); __PYX_ERR(1, 1, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_state)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_StatePath", 1, 3, 3, 2); __PYX_ERR(1, 1, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__pyx_unpickle_StatePath") < 0)) __PYX_ERR(1, 1, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+    }
+    __pyx_v___pyx_type = values[0];
+    __pyx_v___pyx_checksum = __Pyx_PyInt_As_long(values[1]); if (unlikely((__pyx_v___pyx_checksum == (long)-1) && PyErr_Occurred())) __PYX_ERR(1, 1, __pyx_L3_error)
+    __pyx_v___pyx_state = values[2];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_StatePath", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 1, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("bundler.extensions.FSM.__pyx_unpickle_StatePath", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_4__pyx_unpickle_StatePath(__pyx_self, __pyx_v___pyx_type, __pyx_v___pyx_checksum, __pyx_v___pyx_state);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_4__pyx_unpickle_StatePath(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_v___pyx_PickleError = 0;
+  PyObject *__pyx_v___pyx_result = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_StatePath", 0);
+
+  /* "(tree fragment)":4
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0x189366f, 0x709b8f0, 0x49815e4):             # <<<<<<<<<<<<<<
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x189366f, 0x709b8f0, 0x49815e4) = (hits, machine, states))" % __pyx_checksum)
+ */
+  __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = (__Pyx_PySequence_ContainsTF(__pyx_t_1, __pyx_tuple__3, Py_NE)); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+
+    /* "(tree fragment)":5
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0x189366f, 0x709b8f0, 0x49815e4):
+ *         from pickle import PickleError as __pyx_PickleError             # <<<<<<<<<<<<<<
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x189366f, 0x709b8f0, 0x49815e4) = (hits, machine, states))" % __pyx_checksum)
+ *     __pyx_result = StatePath.__new__(__pyx_type)
+ */
+    __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_n_s_PickleError);
+    __Pyx_GIVEREF(__pyx_n_s_PickleError);
+    PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_PickleError);
+    __pyx_t_4 = __Pyx_Import(__pyx_n_s_pickle, __pyx_t_1, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_4, __pyx_n_s_PickleError); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_t_1);
+    __pyx_v___pyx_PickleError = __pyx_t_1;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "(tree fragment)":6
+ *     if __pyx_checksum not in (0x189366f, 0x709b8f0, 0x49815e4):
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x189366f, 0x709b8f0, 0x49815e4) = (hits, machine, states))" % __pyx_checksum)             # <<<<<<<<<<<<<<
+ *     __pyx_result = StatePath.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+ */
+    __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = __Pyx_PyString_Format(__pyx_kp_s_Incompatible_checksums_0x_x_vs_0, __pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_INCREF(__pyx_v___pyx_PickleError);
+    __pyx_t_1 = __pyx_v___pyx_PickleError; __pyx_t_6 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_1))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_1);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+        __Pyx_INCREF(__pyx_t_6);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_1, function);
+      }
+    }
+    __pyx_t_4 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_6, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __PYX_ERR(1, 6, __pyx_L1_error)
+
+    /* "(tree fragment)":4
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0x189366f, 0x709b8f0, 0x49815e4):             # <<<<<<<<<<<<<<
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x189366f, 0x709b8f0, 0x49815e4) = (hits, machine, states))" % __pyx_checksum)
+ */
+  }
+
+  /* "(tree fragment)":7
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x189366f, 0x709b8f0, 0x49815e4) = (hits, machine, states))" % __pyx_checksum)
+ *     __pyx_result = StatePath.__new__(__pyx_type)             # <<<<<<<<<<<<<<
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_StatePath__set_state(<StatePath> __pyx_result, __pyx_state)
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_7bundler_10extensions_3FSM_StatePath), __pyx_n_s_new); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_5 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_1);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_1, function);
+    }
+  }
+  __pyx_t_4 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_5, __pyx_v___pyx_type) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_v___pyx_type);
+  __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "(tree fragment)":8
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x189366f, 0x709b8f0, 0x49815e4) = (hits, machine, states))" % __pyx_checksum)
+ *     __pyx_result = StatePath.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_StatePath__set_state(<StatePath> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ */
+  __pyx_t_3 = (__pyx_v___pyx_state != Py_None);
+  __pyx_t_2 = (__pyx_t_3 != 0);
+  if (__pyx_t_2) {
+
+    /* "(tree fragment)":9
+ *     __pyx_result = StatePath.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_StatePath__set_state(<StatePath> __pyx_result, __pyx_state)             # <<<<<<<<<<<<<<
+ *     return __pyx_result
+ * cdef __pyx_unpickle_StatePath__set_state(StatePath __pyx_result, tuple __pyx_state):
+ */
+    if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_v___pyx_state)->tp_name), 0))) __PYX_ERR(1, 9, __pyx_L1_error)
+    __pyx_t_4 = __pyx_f_7bundler_10extensions_3FSM___pyx_unpickle_StatePath__set_state(((struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *)__pyx_v___pyx_result), ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 9, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "(tree fragment)":8
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x189366f, 0x709b8f0, 0x49815e4) = (hits, machine, states))" % __pyx_checksum)
+ *     __pyx_result = StatePath.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_StatePath__set_state(<StatePath> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ */
+  }
+
+  /* "(tree fragment)":10
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_StatePath__set_state(<StatePath> __pyx_result, __pyx_state)
+ *     return __pyx_result             # <<<<<<<<<<<<<<
+ * cdef __pyx_unpickle_StatePath__set_state(StatePath __pyx_result, tuple __pyx_state):
+ *     __pyx_result.hits = __pyx_state[0]; __pyx_result.machine = __pyx_state[1]; __pyx_result.states = __pyx_state[2]
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v___pyx_result);
+  __pyx_r = __pyx_v___pyx_result;
+  goto __pyx_L0;
+
+  /* "(tree fragment)":1
+ * def __pyx_unpickle_StatePath(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("bundler.extensions.FSM.__pyx_unpickle_StatePath", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v___pyx_PickleError);
+  __Pyx_XDECREF(__pyx_v___pyx_result);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":11
+ *         __pyx_unpickle_StatePath__set_state(<StatePath> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_StatePath__set_state(StatePath __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_result.hits = __pyx_state[0]; __pyx_result.machine = __pyx_state[1]; __pyx_result.states = __pyx_state[2]
+ *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):
+ */
+
+static PyObject *__pyx_f_7bundler_10extensions_3FSM___pyx_unpickle_StatePath__set_state(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *__pyx_v___pyx_result, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  std::vector<int>  __pyx_t_2;
+  int __pyx_t_3;
+  Py_ssize_t __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_StatePath__set_state", 0);
+
+  /* "(tree fragment)":12
+ *     return __pyx_result
+ * cdef __pyx_unpickle_StatePath__set_state(StatePath __pyx_result, tuple __pyx_state):
+ *     __pyx_result.hits = __pyx_state[0]; __pyx_result.machine = __pyx_state[1]; __pyx_result.states = __pyx_state[2]             # <<<<<<<<<<<<<<
+ *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[3])
+ */
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __pyx_convert_vector_from_py_int(__pyx_t_1); if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result->hits = __pyx_t_2;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_7bundler_10extensions_3FSM_FSM))))) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v___pyx_result->machine);
+  __Pyx_DECREF(((PyObject *)__pyx_v___pyx_result->machine));
+  __pyx_v___pyx_result->machine = ((struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)__pyx_t_1);
+  __pyx_t_1 = 0;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __pyx_convert_vector_from_py_int(__pyx_t_1); if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result->states = __pyx_t_2;
+
+  /* "(tree fragment)":13
+ * cdef __pyx_unpickle_StatePath__set_state(StatePath __pyx_result, tuple __pyx_state):
+ *     __pyx_result.hits = __pyx_state[0]; __pyx_result.machine = __pyx_state[1]; __pyx_result.states = __pyx_state[2]
+ *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
+ *         __pyx_result.__dict__.update(__pyx_state[3])
+ */
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(1, 13, __pyx_L1_error)
+  }
+  __pyx_t_4 = PyTuple_GET_SIZE(__pyx_v___pyx_state); if (unlikely(__pyx_t_4 == ((Py_ssize_t)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
+  __pyx_t_5 = ((__pyx_t_4 > 3) != 0);
+  if (__pyx_t_5) {
+  } else {
+    __pyx_t_3 = __pyx_t_5;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_5 = __Pyx_HasAttr(((PyObject *)__pyx_v___pyx_result), __pyx_n_s_dict); if (unlikely(__pyx_t_5 == ((int)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
+  __pyx_t_6 = (__pyx_t_5 != 0);
+  __pyx_t_3 = __pyx_t_6;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_3) {
+
+    /* "(tree fragment)":14
+ *     __pyx_result.hits = __pyx_state[0]; __pyx_result.machine = __pyx_state[1]; __pyx_result.states = __pyx_state[2]
+ *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[3])             # <<<<<<<<<<<<<<
+ */
+    __pyx_t_7 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v___pyx_result), __pyx_n_s_dict); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_7, __pyx_n_s_update); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (unlikely(__pyx_v___pyx_state == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(1, 14, __pyx_L1_error)
+    }
+    __pyx_t_7 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 3, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_9 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_8))) {
+      __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_8);
+      if (likely(__pyx_t_9)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_8);
+        __Pyx_INCREF(__pyx_t_9);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_8, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_9) ? __Pyx_PyObject_Call2Args(__pyx_t_8, __pyx_t_9, __pyx_t_7) : __Pyx_PyObject_CallOneArg(__pyx_t_8, __pyx_t_7);
+    __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "(tree fragment)":13
+ * cdef __pyx_unpickle_StatePath__set_state(StatePath __pyx_result, tuple __pyx_state):
+ *     __pyx_result.hits = __pyx_state[0]; __pyx_result.machine = __pyx_state[1]; __pyx_result.states = __pyx_state[2]
+ *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
+ *         __pyx_result.__dict__.update(__pyx_state[3])
+ */
+  }
+
+  /* "(tree fragment)":11
+ *         __pyx_unpickle_StatePath__set_state(<StatePath> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_StatePath__set_state(StatePath __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_result.hits = __pyx_state[0]; __pyx_result.machine = __pyx_state[1]; __pyx_result.states = __pyx_state[2]
+ *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_AddTraceback("bundler.extensions.FSM.__pyx_unpickle_StatePath__set_state", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __pyx_unpickle_TransitionMap(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_7__pyx_unpickle_TransitionMap(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_7bundler_10extensions_3FSM_7__pyx_unpickle_TransitionMap = {"__pyx_unpickle_TransitionMap", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_7bundler_10extensions_3FSM_7__pyx_unpickle_TransitionMap, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_7bundler_10extensions_3FSM_7__pyx_unpickle_TransitionMap(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v___pyx_type = 0;
+  long __pyx_v___pyx_checksum;
+  PyObject *__pyx_v___pyx_state = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__pyx_unpickle_TransitionMap (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_pyx_type,&__pyx_n_s_pyx_checksum,&__pyx_n_s_pyx_state,0};
+    PyObject* values[3] = {0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_type)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_checksum)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_TransitionMap", 1, 3, 3, 1); __PYX_ERR(1, 1, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_state)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_TransitionMap", 1, 3, 3, 2); __PYX_ERR(1, 1, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__pyx_unpickle_TransitionMap") < 0)) __PYX_ERR(1, 1, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+    }
+    __pyx_v___pyx_type = values[0];
+    __pyx_v___pyx_checksum = __Pyx_PyInt_As_long(values[1]); if (unlikely((__pyx_v___pyx_checksum == (long)-1) && PyErr_Occurred())) __PYX_ERR(1, 1, __pyx_L3_error)
+    __pyx_v___pyx_state = values[2];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_TransitionMap", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 1, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("bundler.extensions.FSM.__pyx_unpickle_TransitionMap", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_7bundler_10extensions_3FSM_6__pyx_unpickle_TransitionMap(__pyx_self, __pyx_v___pyx_type, __pyx_v___pyx_checksum, __pyx_v___pyx_state);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7bundler_10extensions_3FSM_6__pyx_unpickle_TransitionMap(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_v___pyx_PickleError = 0;
+  PyObject *__pyx_v___pyx_result = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_TransitionMap", 0);
+
+  /* "(tree fragment)":4
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0x502d9fe, 0x0fe453e, 0x1395c54):             # <<<<<<<<<<<<<<
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x502d9fe, 0x0fe453e, 0x1395c54) = (machine, maps, width))" % __pyx_checksum)
+ */
+  __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = (__Pyx_PySequence_ContainsTF(__pyx_t_1, __pyx_tuple__4, Py_NE)); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+
+    /* "(tree fragment)":5
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0x502d9fe, 0x0fe453e, 0x1395c54):
+ *         from pickle import PickleError as __pyx_PickleError             # <<<<<<<<<<<<<<
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x502d9fe, 0x0fe453e, 0x1395c54) = (machine, maps, width))" % __pyx_checksum)
+ *     __pyx_result = TransitionMap.__new__(__pyx_type)
+ */
+    __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_n_s_PickleError);
+    __Pyx_GIVEREF(__pyx_n_s_PickleError);
+    PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_PickleError);
+    __pyx_t_4 = __Pyx_Import(__pyx_n_s_pickle, __pyx_t_1, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_4, __pyx_n_s_PickleError); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_t_1);
+    __pyx_v___pyx_PickleError = __pyx_t_1;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "(tree fragment)":6
+ *     if __pyx_checksum not in (0x502d9fe, 0x0fe453e, 0x1395c54):
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x502d9fe, 0x0fe453e, 0x1395c54) = (machine, maps, width))" % __pyx_checksum)             # <<<<<<<<<<<<<<
+ *     __pyx_result = TransitionMap.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+ */
+    __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = __Pyx_PyString_Format(__pyx_kp_s_Incompatible_checksums_0x_x_vs_0_2, __pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_INCREF(__pyx_v___pyx_PickleError);
+    __pyx_t_1 = __pyx_v___pyx_PickleError; __pyx_t_6 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_1))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_1);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+        __Pyx_INCREF(__pyx_t_6);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_1, function);
+      }
+    }
+    __pyx_t_4 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_6, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __PYX_ERR(1, 6, __pyx_L1_error)
+
+    /* "(tree fragment)":4
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0x502d9fe, 0x0fe453e, 0x1395c54):             # <<<<<<<<<<<<<<
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x502d9fe, 0x0fe453e, 0x1395c54) = (machine, maps, width))" % __pyx_checksum)
+ */
+  }
+
+  /* "(tree fragment)":7
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x502d9fe, 0x0fe453e, 0x1395c54) = (machine, maps, width))" % __pyx_checksum)
+ *     __pyx_result = TransitionMap.__new__(__pyx_type)             # <<<<<<<<<<<<<<
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_TransitionMap__set_state(<TransitionMap> __pyx_result, __pyx_state)
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_7bundler_10extensions_3FSM_TransitionMap), __pyx_n_s_new); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_5 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_1);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_1, function);
+    }
+  }
+  __pyx_t_4 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_5, __pyx_v___pyx_type) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_v___pyx_type);
+  __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "(tree fragment)":8
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x502d9fe, 0x0fe453e, 0x1395c54) = (machine, maps, width))" % __pyx_checksum)
+ *     __pyx_result = TransitionMap.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_TransitionMap__set_state(<TransitionMap> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ */
+  __pyx_t_3 = (__pyx_v___pyx_state != Py_None);
+  __pyx_t_2 = (__pyx_t_3 != 0);
+  if (__pyx_t_2) {
+
+    /* "(tree fragment)":9
+ *     __pyx_result = TransitionMap.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_TransitionMap__set_state(<TransitionMap> __pyx_result, __pyx_state)             # <<<<<<<<<<<<<<
+ *     return __pyx_result
+ * cdef __pyx_unpickle_TransitionMap__set_state(TransitionMap __pyx_result, tuple __pyx_state):
+ */
+    if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_v___pyx_state)->tp_name), 0))) __PYX_ERR(1, 9, __pyx_L1_error)
+    __pyx_t_4 = __pyx_f_7bundler_10extensions_3FSM___pyx_unpickle_TransitionMap__set_state(((struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *)__pyx_v___pyx_result), ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 9, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "(tree fragment)":8
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x502d9fe, 0x0fe453e, 0x1395c54) = (machine, maps, width))" % __pyx_checksum)
+ *     __pyx_result = TransitionMap.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_TransitionMap__set_state(<TransitionMap> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ */
+  }
+
+  /* "(tree fragment)":10
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_TransitionMap__set_state(<TransitionMap> __pyx_result, __pyx_state)
+ *     return __pyx_result             # <<<<<<<<<<<<<<
+ * cdef __pyx_unpickle_TransitionMap__set_state(TransitionMap __pyx_result, tuple __pyx_state):
+ *     __pyx_result.machine = __pyx_state[0]; __pyx_result.maps = __pyx_state[1]; __pyx_result.width = __pyx_state[2]
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v___pyx_result);
+  __pyx_r = __pyx_v___pyx_result;
+  goto __pyx_L0;
+
+  /* "(tree fragment)":1
+ * def __pyx_unpickle_TransitionMap(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("bundler.extensions.FSM.__pyx_unpickle_TransitionMap", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v___pyx_PickleError);
+  __Pyx_XDECREF(__pyx_v___pyx_result);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":11
+ *         __pyx_unpickle_TransitionMap__set_state(<TransitionMap> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_TransitionMap__set_state(TransitionMap __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_result.machine = __pyx_state[0]; __pyx_result.maps = __pyx_state[1]; __pyx_result.width = __pyx_state[2]
+ *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):
+ */
+
+static PyObject *__pyx_f_7bundler_10extensions_3FSM___pyx_unpickle_TransitionMap__set_state(struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *__pyx_v___pyx_result, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  std::vector<int>  __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  Py_ssize_t __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_TransitionMap__set_state", 0);
+
+  /* "(tree fragment)":12
+ *     return __pyx_result
+ * cdef __pyx_unpickle_TransitionMap__set_state(TransitionMap __pyx_result, tuple __pyx_state):
+ *     __pyx_result.machine = __pyx_state[0]; __pyx_result.maps = __pyx_state[1]; __pyx_result.width = __pyx_state[2]             # <<<<<<<<<<<<<<
+ *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[3])
+ */
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_7bundler_10extensions_3FSM_FSM))))) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v___pyx_result->machine);
+  __Pyx_DECREF(((PyObject *)__pyx_v___pyx_result->machine));
+  __pyx_v___pyx_result->machine = ((struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)__pyx_t_1);
+  __pyx_t_1 = 0;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __pyx_convert_vector_from_py_int(__pyx_t_1); if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result->maps = __pyx_t_2;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result->width = __pyx_t_3;
+
+  /* "(tree fragment)":13
+ * cdef __pyx_unpickle_TransitionMap__set_state(TransitionMap __pyx_result, tuple __pyx_state):
+ *     __pyx_result.machine = __pyx_state[0]; __pyx_result.maps = __pyx_state[1]; __pyx_result.width = __pyx_state[2]
+ *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
+ *         __pyx_result.__dict__.update(__pyx_state[3])
+ */
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(1, 13, __pyx_L1_error)
+  }
+  __pyx_t_5 = PyTuple_GET_SIZE(__pyx_v___pyx_state); if (unlikely(__pyx_t_5 == ((Py_ssize_t)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
+  __pyx_t_6 = ((__pyx_t_5 > 3) != 0);
+  if (__pyx_t_6) {
+  } else {
+    __pyx_t_4 = __pyx_t_6;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_6 = __Pyx_HasAttr(((PyObject *)__pyx_v___pyx_result), __pyx_n_s_dict); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
+  __pyx_t_7 = (__pyx_t_6 != 0);
+  __pyx_t_4 = __pyx_t_7;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_4) {
+
+    /* "(tree fragment)":14
+ *     __pyx_result.machine = __pyx_state[0]; __pyx_result.maps = __pyx_state[1]; __pyx_result.width = __pyx_state[2]
+ *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[3])             # <<<<<<<<<<<<<<
+ */
+    __pyx_t_8 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v___pyx_result), __pyx_n_s_dict); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_n_s_update); if (unlikely(!__pyx_t_9)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    if (unlikely(__pyx_v___pyx_state == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(1, 14, __pyx_L1_error)
+    }
+    __pyx_t_8 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 3, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_10 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
+      __pyx_t_10 = PyMethod_GET_SELF(__pyx_t_9);
+      if (likely(__pyx_t_10)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+        __Pyx_INCREF(__pyx_t_10);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_9, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_10) ? __Pyx_PyObject_Call2Args(__pyx_t_9, __pyx_t_10, __pyx_t_8) : __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_t_8);
+    __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "(tree fragment)":13
+ * cdef __pyx_unpickle_TransitionMap__set_state(TransitionMap __pyx_result, tuple __pyx_state):
+ *     __pyx_result.machine = __pyx_state[0]; __pyx_result.maps = __pyx_state[1]; __pyx_result.width = __pyx_state[2]
+ *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
+ *         __pyx_result.__dict__.update(__pyx_state[3])
+ */
+  }
+
+  /* "(tree fragment)":11
+ *         __pyx_unpickle_TransitionMap__set_state(<TransitionMap> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_TransitionMap__set_state(TransitionMap __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_result.machine = __pyx_state[0]; __pyx_result.maps = __pyx_state[1]; __pyx_result.width = __pyx_state[2]
+ *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_AddTraceback("bundler.extensions.FSM.__pyx_unpickle_TransitionMap__set_state", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "array.pxd":93
+ *             __data_union data
+ * 
+ *         def __getbuffer__(self, Py_buffer* info, int flags):             # <<<<<<<<<<<<<<
+ *             # This implementation of getbuffer is geared towards Cython
+ *             # requirements, and does not yet fulfill the PEP.
+ */
+
+/* Python wrapper */
+static CYTHON_UNUSED int __pyx_pw_7cpython_5array_5array_1__getbuffer__(PyObject *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags); /*proto*/
+static CYTHON_UNUSED int __pyx_pw_7cpython_5array_5array_1__getbuffer__(PyObject *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__getbuffer__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_7cpython_5array_5array___getbuffer__(((arrayobject *)__pyx_v_self), ((Py_buffer *)__pyx_v_info), ((int)__pyx_v_flags));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_7cpython_5array_5array___getbuffer__(arrayobject *__pyx_v_self, Py_buffer *__pyx_v_info, CYTHON_UNUSED int __pyx_v_flags) {
+  PyObject *__pyx_v_item_count = NULL;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  char *__pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  Py_ssize_t __pyx_t_5;
+  int __pyx_t_6;
+  char __pyx_t_7;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  if (__pyx_v_info == NULL) {
+    PyErr_SetString(PyExc_BufferError, "PyObject_GetBuffer: view==NULL argument is obsolete");
+    return -1;
+  }
+  __Pyx_RefNannySetupContext("__getbuffer__", 0);
+  __pyx_v_info->obj = Py_None; __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(__pyx_v_info->obj);
+
+  /* "array.pxd":98
+ *             # In particular strided access is always provided regardless
+ *             # of flags
+ *             item_count = Py_SIZE(self)             # <<<<<<<<<<<<<<
+ * 
+ *             info.suboffsets = NULL
+ */
+  __pyx_t_1 = PyInt_FromSsize_t(Py_SIZE(((PyObject *)__pyx_v_self))); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 98, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_item_count = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "array.pxd":100
+ *             item_count = Py_SIZE(self)
+ * 
+ *             info.suboffsets = NULL             # <<<<<<<<<<<<<<
+ *             info.buf = self.data.as_chars
+ *             info.readonly = 0
+ */
+  __pyx_v_info->suboffsets = NULL;
+
+  /* "array.pxd":101
+ * 
+ *             info.suboffsets = NULL
+ *             info.buf = self.data.as_chars             # <<<<<<<<<<<<<<
+ *             info.readonly = 0
+ *             info.ndim = 1
+ */
+  __pyx_t_2 = __pyx_v_self->data.as_chars;
+  __pyx_v_info->buf = __pyx_t_2;
+
+  /* "array.pxd":102
+ *             info.suboffsets = NULL
+ *             info.buf = self.data.as_chars
+ *             info.readonly = 0             # <<<<<<<<<<<<<<
+ *             info.ndim = 1
+ *             info.itemsize = self.ob_descr.itemsize   # e.g. sizeof(float)
+ */
+  __pyx_v_info->readonly = 0;
+
+  /* "array.pxd":103
+ *             info.buf = self.data.as_chars
+ *             info.readonly = 0
+ *             info.ndim = 1             # <<<<<<<<<<<<<<
+ *             info.itemsize = self.ob_descr.itemsize   # e.g. sizeof(float)
+ *             info.len = info.itemsize * item_count
+ */
+  __pyx_v_info->ndim = 1;
+
+  /* "array.pxd":104
+ *             info.readonly = 0
+ *             info.ndim = 1
+ *             info.itemsize = self.ob_descr.itemsize   # e.g. sizeof(float)             # <<<<<<<<<<<<<<
+ *             info.len = info.itemsize * item_count
+ * 
+ */
+  __pyx_t_3 = __pyx_v_self->ob_descr->itemsize;
+  __pyx_v_info->itemsize = __pyx_t_3;
+
+  /* "array.pxd":105
+ *             info.ndim = 1
+ *             info.itemsize = self.ob_descr.itemsize   # e.g. sizeof(float)
+ *             info.len = info.itemsize * item_count             # <<<<<<<<<<<<<<
+ * 
+ *             info.shape = <Py_ssize_t*> PyObject_Malloc(sizeof(Py_ssize_t) + 2)
+ */
+  __pyx_t_1 = PyInt_FromSsize_t(__pyx_v_info->itemsize); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 105, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_4 = PyNumber_Multiply(__pyx_t_1, __pyx_v_item_count); if (unlikely(!__pyx_t_4)) __PYX_ERR(2, 105, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_5 = __Pyx_PyIndex_AsSsize_t(__pyx_t_4); if (unlikely((__pyx_t_5 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(2, 105, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_v_info->len = __pyx_t_5;
+
+  /* "array.pxd":107
+ *             info.len = info.itemsize * item_count
+ * 
+ *             info.shape = <Py_ssize_t*> PyObject_Malloc(sizeof(Py_ssize_t) + 2)             # <<<<<<<<<<<<<<
+ *             if not info.shape:
+ *                 raise MemoryError()
+ */
+  __pyx_v_info->shape = ((Py_ssize_t *)PyObject_Malloc(((sizeof(Py_ssize_t)) + 2)));
+
+  /* "array.pxd":108
+ * 
+ *             info.shape = <Py_ssize_t*> PyObject_Malloc(sizeof(Py_ssize_t) + 2)
+ *             if not info.shape:             # <<<<<<<<<<<<<<
+ *                 raise MemoryError()
+ *             info.shape[0] = item_count      # constant regardless of resizing
+ */
+  __pyx_t_6 = ((!(__pyx_v_info->shape != 0)) != 0);
+  if (unlikely(__pyx_t_6)) {
+
+    /* "array.pxd":109
+ *             info.shape = <Py_ssize_t*> PyObject_Malloc(sizeof(Py_ssize_t) + 2)
+ *             if not info.shape:
+ *                 raise MemoryError()             # <<<<<<<<<<<<<<
+ *             info.shape[0] = item_count      # constant regardless of resizing
+ *             info.strides = &info.itemsize
+ */
+    PyErr_NoMemory(); __PYX_ERR(2, 109, __pyx_L1_error)
+
+    /* "array.pxd":108
+ * 
+ *             info.shape = <Py_ssize_t*> PyObject_Malloc(sizeof(Py_ssize_t) + 2)
+ *             if not info.shape:             # <<<<<<<<<<<<<<
+ *                 raise MemoryError()
+ *             info.shape[0] = item_count      # constant regardless of resizing
+ */
+  }
+
+  /* "array.pxd":110
+ *             if not info.shape:
+ *                 raise MemoryError()
+ *             info.shape[0] = item_count      # constant regardless of resizing             # <<<<<<<<<<<<<<
+ *             info.strides = &info.itemsize
+ * 
+ */
+  __pyx_t_5 = __Pyx_PyIndex_AsSsize_t(__pyx_v_item_count); if (unlikely((__pyx_t_5 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(2, 110, __pyx_L1_error)
+  (__pyx_v_info->shape[0]) = __pyx_t_5;
+
+  /* "array.pxd":111
+ *                 raise MemoryError()
+ *             info.shape[0] = item_count      # constant regardless of resizing
+ *             info.strides = &info.itemsize             # <<<<<<<<<<<<<<
+ * 
+ *             info.format = <char*> (info.shape + 1)
+ */
+  __pyx_v_info->strides = (&__pyx_v_info->itemsize);
+
+  /* "array.pxd":113
+ *             info.strides = &info.itemsize
+ * 
+ *             info.format = <char*> (info.shape + 1)             # <<<<<<<<<<<<<<
+ *             info.format[0] = self.ob_descr.typecode
+ *             info.format[1] = 0
+ */
+  __pyx_v_info->format = ((char *)(__pyx_v_info->shape + 1));
+
+  /* "array.pxd":114
+ * 
+ *             info.format = <char*> (info.shape + 1)
+ *             info.format[0] = self.ob_descr.typecode             # <<<<<<<<<<<<<<
+ *             info.format[1] = 0
+ *             info.obj = self
+ */
+  __pyx_t_7 = __pyx_v_self->ob_descr->typecode;
+  (__pyx_v_info->format[0]) = __pyx_t_7;
+
+  /* "array.pxd":115
+ *             info.format = <char*> (info.shape + 1)
+ *             info.format[0] = self.ob_descr.typecode
+ *             info.format[1] = 0             # <<<<<<<<<<<<<<
+ *             info.obj = self
+ * 
+ */
+  (__pyx_v_info->format[1]) = 0;
+
+  /* "array.pxd":116
+ *             info.format[0] = self.ob_descr.typecode
+ *             info.format[1] = 0
+ *             info.obj = self             # <<<<<<<<<<<<<<
+ * 
+ *         def __releasebuffer__(self, Py_buffer* info):
+ */
+  __Pyx_INCREF(((PyObject *)__pyx_v_self));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_self));
+  __Pyx_GOTREF(__pyx_v_info->obj);
+  __Pyx_DECREF(__pyx_v_info->obj);
+  __pyx_v_info->obj = ((PyObject *)__pyx_v_self);
+
+  /* "array.pxd":93
+ *             __data_union data
+ * 
+ *         def __getbuffer__(self, Py_buffer* info, int flags):             # <<<<<<<<<<<<<<
+ *             # This implementation of getbuffer is geared towards Cython
+ *             # requirements, and does not yet fulfill the PEP.
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("cpython.array.array.__getbuffer__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  if (__pyx_v_info->obj != NULL) {
+    __Pyx_GOTREF(__pyx_v_info->obj);
+    __Pyx_DECREF(__pyx_v_info->obj); __pyx_v_info->obj = 0;
+  }
+  goto __pyx_L2;
+  __pyx_L0:;
+  if (__pyx_v_info->obj == Py_None) {
+    __Pyx_GOTREF(__pyx_v_info->obj);
+    __Pyx_DECREF(__pyx_v_info->obj); __pyx_v_info->obj = 0;
+  }
+  __pyx_L2:;
+  __Pyx_XDECREF(__pyx_v_item_count);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "array.pxd":118
+ *             info.obj = self
+ * 
+ *         def __releasebuffer__(self, Py_buffer* info):             # <<<<<<<<<<<<<<
+ *             PyObject_Free(info.shape)
+ * 
+ */
+
+/* Python wrapper */
+static CYTHON_UNUSED void __pyx_pw_7cpython_5array_5array_3__releasebuffer__(PyObject *__pyx_v_self, Py_buffer *__pyx_v_info); /*proto*/
+static CYTHON_UNUSED void __pyx_pw_7cpython_5array_5array_3__releasebuffer__(PyObject *__pyx_v_self, Py_buffer *__pyx_v_info) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__releasebuffer__ (wrapper)", 0);
+  __pyx_pf_7cpython_5array_5array_2__releasebuffer__(((arrayobject *)__pyx_v_self), ((Py_buffer *)__pyx_v_info));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+static void __pyx_pf_7cpython_5array_5array_2__releasebuffer__(CYTHON_UNUSED arrayobject *__pyx_v_self, Py_buffer *__pyx_v_info) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__releasebuffer__", 0);
+
+  /* "array.pxd":119
+ * 
+ *         def __releasebuffer__(self, Py_buffer* info):
+ *             PyObject_Free(info.shape)             # <<<<<<<<<<<<<<
+ * 
+ *     array newarrayobject(PyTypeObject* type, Py_ssize_t size, arraydescr *descr)
+ */
+  PyObject_Free(__pyx_v_info->shape);
+
+  /* "array.pxd":118
+ *             info.obj = self
+ * 
+ *         def __releasebuffer__(self, Py_buffer* info):             # <<<<<<<<<<<<<<
+ *             PyObject_Free(info.shape)
+ * 
+ */
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "array.pxd":130
+ * 
+ * 
+ * cdef inline array clone(array template, Py_ssize_t length, bint zero):             # <<<<<<<<<<<<<<
+ *     """ fast creation of a new array, given a template array.
+ *     type will be same as template.
+ */
+
+static CYTHON_INLINE arrayobject *__pyx_f_7cpython_5array_clone(arrayobject *__pyx_v_template, Py_ssize_t __pyx_v_length, int __pyx_v_zero) {
+  arrayobject *__pyx_v_op = 0;
+  arrayobject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("clone", 0);
+
+  /* "array.pxd":134
+ *     type will be same as template.
+ *     if zero is true, new array will be initialized with zeroes."""
+ *     cdef array op = newarrayobject(Py_TYPE(template), length, template.ob_descr)             # <<<<<<<<<<<<<<
+ *     if zero and op is not None:
+ *         memset(op.data.as_chars, 0, length * op.ob_descr.itemsize)
+ */
+  __pyx_t_1 = ((PyObject *)newarrayobject(Py_TYPE(((PyObject *)__pyx_v_template)), __pyx_v_length, __pyx_v_template->ob_descr)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 134, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_op = ((arrayobject *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "array.pxd":135
+ *     if zero is true, new array will be initialized with zeroes."""
+ *     cdef array op = newarrayobject(Py_TYPE(template), length, template.ob_descr)
+ *     if zero and op is not None:             # <<<<<<<<<<<<<<
+ *         memset(op.data.as_chars, 0, length * op.ob_descr.itemsize)
+ *     return op
+ */
+  __pyx_t_3 = (__pyx_v_zero != 0);
+  if (__pyx_t_3) {
+  } else {
+    __pyx_t_2 = __pyx_t_3;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_3 = (((PyObject *)__pyx_v_op) != Py_None);
+  __pyx_t_4 = (__pyx_t_3 != 0);
+  __pyx_t_2 = __pyx_t_4;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_2) {
+
+    /* "array.pxd":136
+ *     cdef array op = newarrayobject(Py_TYPE(template), length, template.ob_descr)
+ *     if zero and op is not None:
+ *         memset(op.data.as_chars, 0, length * op.ob_descr.itemsize)             # <<<<<<<<<<<<<<
+ *     return op
+ * 
+ */
+    (void)(memset(__pyx_v_op->data.as_chars, 0, (__pyx_v_length * __pyx_v_op->ob_descr->itemsize)));
+
+    /* "array.pxd":135
+ *     if zero is true, new array will be initialized with zeroes."""
+ *     cdef array op = newarrayobject(Py_TYPE(template), length, template.ob_descr)
+ *     if zero and op is not None:             # <<<<<<<<<<<<<<
+ *         memset(op.data.as_chars, 0, length * op.ob_descr.itemsize)
+ *     return op
+ */
+  }
+
+  /* "array.pxd":137
+ *     if zero and op is not None:
+ *         memset(op.data.as_chars, 0, length * op.ob_descr.itemsize)
+ *     return op             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline array copy(array self):
+ */
+  __Pyx_XDECREF(((PyObject *)__pyx_r));
+  __Pyx_INCREF(((PyObject *)__pyx_v_op));
+  __pyx_r = __pyx_v_op;
+  goto __pyx_L0;
+
+  /* "array.pxd":130
+ * 
+ * 
+ * cdef inline array clone(array template, Py_ssize_t length, bint zero):             # <<<<<<<<<<<<<<
+ *     """ fast creation of a new array, given a template array.
+ *     type will be same as template.
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("cpython.array.clone", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_op);
+  __Pyx_XGIVEREF((PyObject *)__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "array.pxd":139
+ *     return op
+ * 
+ * cdef inline array copy(array self):             # <<<<<<<<<<<<<<
+ *     """ make a copy of an array. """
+ *     cdef array op = newarrayobject(Py_TYPE(self), Py_SIZE(self), self.ob_descr)
+ */
+
+static CYTHON_INLINE arrayobject *__pyx_f_7cpython_5array_copy(arrayobject *__pyx_v_self) {
+  arrayobject *__pyx_v_op = 0;
+  arrayobject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("copy", 0);
+
+  /* "array.pxd":141
+ * cdef inline array copy(array self):
+ *     """ make a copy of an array. """
+ *     cdef array op = newarrayobject(Py_TYPE(self), Py_SIZE(self), self.ob_descr)             # <<<<<<<<<<<<<<
+ *     memcpy(op.data.as_chars, self.data.as_chars, Py_SIZE(op) * op.ob_descr.itemsize)
+ *     return op
+ */
+  __pyx_t_1 = ((PyObject *)newarrayobject(Py_TYPE(((PyObject *)__pyx_v_self)), Py_SIZE(((PyObject *)__pyx_v_self)), __pyx_v_self->ob_descr)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 141, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_op = ((arrayobject *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "array.pxd":142
+ *     """ make a copy of an array. """
+ *     cdef array op = newarrayobject(Py_TYPE(self), Py_SIZE(self), self.ob_descr)
+ *     memcpy(op.data.as_chars, self.data.as_chars, Py_SIZE(op) * op.ob_descr.itemsize)             # <<<<<<<<<<<<<<
+ *     return op
+ * 
+ */
+  (void)(memcpy(__pyx_v_op->data.as_chars, __pyx_v_self->data.as_chars, (Py_SIZE(((PyObject *)__pyx_v_op)) * __pyx_v_op->ob_descr->itemsize)));
+
+  /* "array.pxd":143
+ *     cdef array op = newarrayobject(Py_TYPE(self), Py_SIZE(self), self.ob_descr)
+ *     memcpy(op.data.as_chars, self.data.as_chars, Py_SIZE(op) * op.ob_descr.itemsize)
+ *     return op             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline int extend_buffer(array self, char* stuff, Py_ssize_t n) except -1:
+ */
+  __Pyx_XDECREF(((PyObject *)__pyx_r));
+  __Pyx_INCREF(((PyObject *)__pyx_v_op));
+  __pyx_r = __pyx_v_op;
+  goto __pyx_L0;
+
+  /* "array.pxd":139
+ *     return op
+ * 
+ * cdef inline array copy(array self):             # <<<<<<<<<<<<<<
+ *     """ make a copy of an array. """
+ *     cdef array op = newarrayobject(Py_TYPE(self), Py_SIZE(self), self.ob_descr)
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("cpython.array.copy", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_op);
+  __Pyx_XGIVEREF((PyObject *)__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "array.pxd":145
+ *     return op
+ * 
+ * cdef inline int extend_buffer(array self, char* stuff, Py_ssize_t n) except -1:             # <<<<<<<<<<<<<<
+ *     """ efficient appending of new stuff of same type
+ *     (e.g. of same array type)
+ */
+
+static CYTHON_INLINE int __pyx_f_7cpython_5array_extend_buffer(arrayobject *__pyx_v_self, char *__pyx_v_stuff, Py_ssize_t __pyx_v_n) {
+  Py_ssize_t __pyx_v_itemsize;
+  Py_ssize_t __pyx_v_origsize;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("extend_buffer", 0);
+
+  /* "array.pxd":149
+ *     (e.g. of same array type)
+ *     n: number of elements (not number of bytes!) """
+ *     cdef Py_ssize_t itemsize = self.ob_descr.itemsize             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t origsize = Py_SIZE(self)
+ *     resize_smart(self, origsize + n)
+ */
+  __pyx_t_1 = __pyx_v_self->ob_descr->itemsize;
+  __pyx_v_itemsize = __pyx_t_1;
+
+  /* "array.pxd":150
+ *     n: number of elements (not number of bytes!) """
+ *     cdef Py_ssize_t itemsize = self.ob_descr.itemsize
+ *     cdef Py_ssize_t origsize = Py_SIZE(self)             # <<<<<<<<<<<<<<
+ *     resize_smart(self, origsize + n)
+ *     memcpy(self.data.as_chars + origsize * itemsize, stuff, n * itemsize)
+ */
+  __pyx_v_origsize = Py_SIZE(((PyObject *)__pyx_v_self));
+
+  /* "array.pxd":151
+ *     cdef Py_ssize_t itemsize = self.ob_descr.itemsize
+ *     cdef Py_ssize_t origsize = Py_SIZE(self)
+ *     resize_smart(self, origsize + n)             # <<<<<<<<<<<<<<
+ *     memcpy(self.data.as_chars + origsize * itemsize, stuff, n * itemsize)
+ *     return 0
+ */
+  __pyx_t_1 = resize_smart(__pyx_v_self, (__pyx_v_origsize + __pyx_v_n)); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(2, 151, __pyx_L1_error)
+
+  /* "array.pxd":152
+ *     cdef Py_ssize_t origsize = Py_SIZE(self)
+ *     resize_smart(self, origsize + n)
+ *     memcpy(self.data.as_chars + origsize * itemsize, stuff, n * itemsize)             # <<<<<<<<<<<<<<
+ *     return 0
+ * 
+ */
+  (void)(memcpy((__pyx_v_self->data.as_chars + (__pyx_v_origsize * __pyx_v_itemsize)), __pyx_v_stuff, (__pyx_v_n * __pyx_v_itemsize)));
+
+  /* "array.pxd":153
+ *     resize_smart(self, origsize + n)
+ *     memcpy(self.data.as_chars + origsize * itemsize, stuff, n * itemsize)
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline int extend(array self, array other) except -1:
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "array.pxd":145
+ *     return op
+ * 
+ * cdef inline int extend_buffer(array self, char* stuff, Py_ssize_t n) except -1:             # <<<<<<<<<<<<<<
+ *     """ efficient appending of new stuff of same type
+ *     (e.g. of same array type)
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("cpython.array.extend_buffer", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "array.pxd":155
+ *     return 0
+ * 
+ * cdef inline int extend(array self, array other) except -1:             # <<<<<<<<<<<<<<
+ *     """ extend array with data from another array; types must match. """
+ *     if self.ob_descr.typecode != other.ob_descr.typecode:
+ */
+
+static CYTHON_INLINE int __pyx_f_7cpython_5array_extend(arrayobject *__pyx_v_self, arrayobject *__pyx_v_other) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("extend", 0);
+
+  /* "array.pxd":157
+ * cdef inline int extend(array self, array other) except -1:
+ *     """ extend array with data from another array; types must match. """
+ *     if self.ob_descr.typecode != other.ob_descr.typecode:             # <<<<<<<<<<<<<<
+ *         PyErr_BadArgument()
+ *     return extend_buffer(self, other.data.as_chars, Py_SIZE(other))
+ */
+  __pyx_t_1 = ((__pyx_v_self->ob_descr->typecode != __pyx_v_other->ob_descr->typecode) != 0);
+  if (__pyx_t_1) {
+
+    /* "array.pxd":158
+ *     """ extend array with data from another array; types must match. """
+ *     if self.ob_descr.typecode != other.ob_descr.typecode:
+ *         PyErr_BadArgument()             # <<<<<<<<<<<<<<
+ *     return extend_buffer(self, other.data.as_chars, Py_SIZE(other))
+ * 
+ */
+    __pyx_t_2 = PyErr_BadArgument(); if (unlikely(__pyx_t_2 == ((int)0))) __PYX_ERR(2, 158, __pyx_L1_error)
+
+    /* "array.pxd":157
+ * cdef inline int extend(array self, array other) except -1:
+ *     """ extend array with data from another array; types must match. """
+ *     if self.ob_descr.typecode != other.ob_descr.typecode:             # <<<<<<<<<<<<<<
+ *         PyErr_BadArgument()
+ *     return extend_buffer(self, other.data.as_chars, Py_SIZE(other))
+ */
+  }
+
+  /* "array.pxd":159
+ *     if self.ob_descr.typecode != other.ob_descr.typecode:
+ *         PyErr_BadArgument()
+ *     return extend_buffer(self, other.data.as_chars, Py_SIZE(other))             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void zero(array self):
+ */
+  __pyx_t_2 = __pyx_f_7cpython_5array_extend_buffer(__pyx_v_self, __pyx_v_other->data.as_chars, Py_SIZE(((PyObject *)__pyx_v_other))); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(2, 159, __pyx_L1_error)
+  __pyx_r = __pyx_t_2;
+  goto __pyx_L0;
+
+  /* "array.pxd":155
+ *     return 0
+ * 
+ * cdef inline int extend(array self, array other) except -1:             # <<<<<<<<<<<<<<
+ *     """ extend array with data from another array; types must match. """
+ *     if self.ob_descr.typecode != other.ob_descr.typecode:
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("cpython.array.extend", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "array.pxd":161
+ *     return extend_buffer(self, other.data.as_chars, Py_SIZE(other))
+ * 
+ * cdef inline void zero(array self):             # <<<<<<<<<<<<<<
+ *     """ set all elements of array to zero. """
+ *     memset(self.data.as_chars, 0, Py_SIZE(self) * self.ob_descr.itemsize)
+ */
+
+static CYTHON_INLINE void __pyx_f_7cpython_5array_zero(arrayobject *__pyx_v_self) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("zero", 0);
+
+  /* "array.pxd":163
+ * cdef inline void zero(array self):
+ *     """ set all elements of array to zero. """
+ *     memset(self.data.as_chars, 0, Py_SIZE(self) * self.ob_descr.itemsize)             # <<<<<<<<<<<<<<
+ */
+  (void)(memset(__pyx_v_self->data.as_chars, 0, (Py_SIZE(((PyObject *)__pyx_v_self)) * __pyx_v_self->ob_descr->itemsize)));
+
+  /* "array.pxd":161
+ *     return extend_buffer(self, other.data.as_chars, Py_SIZE(other))
+ * 
+ * cdef inline void zero(array self):             # <<<<<<<<<<<<<<
+ *     """ set all elements of array to zero. """
+ *     memset(self.data.as_chars, 0, Py_SIZE(self) * self.ob_descr.itemsize)
+ */
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "vector.to_py":60
+ * 
+ * @cname("__pyx_convert_vector_to_py_int")
+ * cdef object __pyx_convert_vector_to_py_int(vector[X]& v):             # <<<<<<<<<<<<<<
+ *     return [v[i] for i in range(v.size())]
+ * 
+ */
+
+static PyObject *__pyx_convert_vector_to_py_int(const std::vector<int>  &__pyx_v_v) {
+  size_t __pyx_v_i;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  size_t __pyx_t_2;
+  size_t __pyx_t_3;
+  size_t __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_convert_vector_to_py_int", 0);
+
+  /* "vector.to_py":61
+ * @cname("__pyx_convert_vector_to_py_int")
+ * cdef object __pyx_convert_vector_to_py_int(vector[X]& v):
+ *     return [v[i] for i in range(v.size())]             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 61, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __pyx_v_v.size();
+  __pyx_t_3 = __pyx_t_2;
+  for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+    __pyx_v_i = __pyx_t_4;
+    __pyx_t_5 = __Pyx_PyInt_From_int((__pyx_v_v[__pyx_v_i])); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 61, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    if (unlikely(__Pyx_ListComp_Append(__pyx_t_1, (PyObject*)__pyx_t_5))) __PYX_ERR(1, 61, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  }
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "vector.to_py":60
+ * 
+ * @cname("__pyx_convert_vector_to_py_int")
+ * cdef object __pyx_convert_vector_to_py_int(vector[X]& v):             # <<<<<<<<<<<<<<
+ *     return [v[i] for i in range(v.size())]
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("vector.to_py.__pyx_convert_vector_to_py_int", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "vector.from_py":45
+ * 
+ * @cname("__pyx_convert_vector_from_py_int")
+ * cdef vector[X] __pyx_convert_vector_from_py_int(object o) except *:             # <<<<<<<<<<<<<<
+ *     cdef vector[X] v
+ *     for item in o:
+ */
+
+static std::vector<int>  __pyx_convert_vector_from_py_int(PyObject *__pyx_v_o) {
+  std::vector<int>  __pyx_v_v;
+  PyObject *__pyx_v_item = NULL;
+  std::vector<int>  __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  Py_ssize_t __pyx_t_2;
+  PyObject *(*__pyx_t_3)(PyObject *);
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_convert_vector_from_py_int", 0);
+
+  /* "vector.from_py":47
+ * cdef vector[X] __pyx_convert_vector_from_py_int(object o) except *:
+ *     cdef vector[X] v
+ *     for item in o:             # <<<<<<<<<<<<<<
+ *         v.push_back(<X>item)
+ *     return v
+ */
+  if (likely(PyList_CheckExact(__pyx_v_o)) || PyTuple_CheckExact(__pyx_v_o)) {
+    __pyx_t_1 = __pyx_v_o; __Pyx_INCREF(__pyx_t_1); __pyx_t_2 = 0;
+    __pyx_t_3 = NULL;
+  } else {
+    __pyx_t_2 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_o); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 47, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_3 = Py_TYPE(__pyx_t_1)->tp_iternext; if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 47, __pyx_L1_error)
+  }
+  for (;;) {
+    if (likely(!__pyx_t_3)) {
+      if (likely(PyList_CheckExact(__pyx_t_1))) {
+        if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_1)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_4 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_4); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(1, 47, __pyx_L1_error)
+        #else
+        __pyx_t_4 = PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 47, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        #endif
+      } else {
+        if (__pyx_t_2 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_4 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_4); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(1, 47, __pyx_L1_error)
+        #else
+        __pyx_t_4 = PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 47, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        #endif
+      }
+    } else {
+      __pyx_t_4 = __pyx_t_3(__pyx_t_1);
+      if (unlikely(!__pyx_t_4)) {
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+          else __PYX_ERR(1, 47, __pyx_L1_error)
+        }
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_4);
+    }
+    __Pyx_XDECREF_SET(__pyx_v_item, __pyx_t_4);
+    __pyx_t_4 = 0;
+
+    /* "vector.from_py":48
+ *     cdef vector[X] v
+ *     for item in o:
+ *         v.push_back(<X>item)             # <<<<<<<<<<<<<<
+ *     return v
+ * 
+ */
+    __pyx_t_5 = __Pyx_PyInt_As_int(__pyx_v_item); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 48, __pyx_L1_error)
+    __pyx_v_v.push_back(((int)__pyx_t_5));
+
+    /* "vector.from_py":47
+ * cdef vector[X] __pyx_convert_vector_from_py_int(object o) except *:
+ *     cdef vector[X] v
+ *     for item in o:             # <<<<<<<<<<<<<<
+ *         v.push_back(<X>item)
+ *     return v
+ */
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "vector.from_py":49
+ *     for item in o:
+ *         v.push_back(<X>item)
+ *     return v             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = __pyx_v_v;
+  goto __pyx_L0;
+
+  /* "vector.from_py":45
+ * 
+ * @cname("__pyx_convert_vector_from_py_int")
+ * cdef vector[X] __pyx_convert_vector_from_py_int(object o) except *:             # <<<<<<<<<<<<<<
+ *     cdef vector[X] v
+ *     for item in o:
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("vector.from_py.__pyx_convert_vector_from_py_int", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_pretend_to_initialize(&__pyx_r);
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_item);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+static struct __pyx_vtabstruct_7bundler_10extensions_3FSM_FSM __pyx_vtable_7bundler_10extensions_3FSM_FSM;
+
+static PyObject *__pyx_tp_new_7bundler_10extensions_3FSM_FSM(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  struct __pyx_obj_7bundler_10extensions_3FSM_FSM *p;
+  PyObject *o;
+  if (likely((t->tp_flags & Py_TPFLAGS_IS_ABSTRACT) == 0)) {
+    o = (*t->tp_alloc)(t, 0);
+  } else {
+    o = (PyObject *) PyBaseObject_Type.tp_new(t, __pyx_empty_tuple, 0);
+  }
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)o);
+  p->__pyx_vtab = __pyx_vtabptr_7bundler_10extensions_3FSM_FSM;
+  new((void*)&(p->yield_states2)) std::vector<__pyx_t_7bundler_10extensions_3FSM_IWord> ();
+  new((void*)&(p->yield_states2_starts)) std::vector<int> ();
+  p->alphabet = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  p->machine = ((arrayobject *)Py_None); Py_INCREF(Py_None);
+  p->yield_states = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  p->distance_to_yield = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  p->distances = ((arrayobject *)Py_None); Py_INCREF(Py_None);
+  p->has_yield = ((arrayobject *)Py_None); Py_INCREF(Py_None);
+  p->shortest_yield = ((arrayobject *)Py_None); Py_INCREF(Py_None);
+  return o;
+}
+
+static void __pyx_tp_dealloc_7bundler_10extensions_3FSM_FSM(PyObject *o) {
+  struct __pyx_obj_7bundler_10extensions_3FSM_FSM *p = (struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)o;
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && !_PyGC_FINALIZED(o)) {
+    if (PyObject_CallFinalizerFromDealloc(o)) return;
+  }
+  #endif
+  PyObject_GC_UnTrack(o);
+  __Pyx_call_destructor(p->yield_states2);
+  __Pyx_call_destructor(p->yield_states2_starts);
+  Py_CLEAR(p->alphabet);
+  Py_CLEAR(p->machine);
+  Py_CLEAR(p->yield_states);
+  Py_CLEAR(p->distance_to_yield);
+  Py_CLEAR(p->distances);
+  Py_CLEAR(p->has_yield);
+  Py_CLEAR(p->shortest_yield);
+  (*Py_TYPE(o)->tp_free)(o);
+}
+
+static int __pyx_tp_traverse_7bundler_10extensions_3FSM_FSM(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_7bundler_10extensions_3FSM_FSM *p = (struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)o;
   if (p->alphabet) {
     e = (*v)(p->alphabet, a); if (e) return e;
   }
-  if (p->machine) {
-    e = (*v)(((PyObject *)p->machine), a); if (e) return e;
+  if (p->machine) {
+    e = (*v)(((PyObject *)p->machine), a); if (e) return e;
+  }
+  if (p->yield_states) {
+    e = (*v)(p->yield_states, a); if (e) return e;
+  }
+  if (p->distance_to_yield) {
+    e = (*v)(p->distance_to_yield, a); if (e) return e;
+  }
+  if (p->distances) {
+    e = (*v)(((PyObject *)p->distances), a); if (e) return e;
+  }
+  if (p->has_yield) {
+    e = (*v)(((PyObject *)p->has_yield), a); if (e) return e;
+  }
+  if (p->shortest_yield) {
+    e = (*v)(((PyObject *)p->shortest_yield), a); if (e) return e;
+  }
+  return 0;
+}
+
+static int __pyx_tp_clear_7bundler_10extensions_3FSM_FSM(PyObject *o) {
+  PyObject* tmp;
+  struct __pyx_obj_7bundler_10extensions_3FSM_FSM *p = (struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)o;
+  tmp = ((PyObject*)p->alphabet);
+  p->alphabet = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->machine);
+  p->machine = ((arrayobject *)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->yield_states);
+  p->yield_states = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->distance_to_yield);
+  p->distance_to_yield = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->distances);
+  p->distances = ((arrayobject *)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->has_yield);
+  p->has_yield = ((arrayobject *)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->shortest_yield);
+  p->shortest_yield = ((arrayobject *)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  return 0;
+}
+
+static PyObject *__pyx_getprop_7bundler_10extensions_3FSM_3FSM_alphabet(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_7bundler_10extensions_3FSM_3FSM_8alphabet_1__get__(o);
+}
+
+static PyObject *__pyx_getprop_7bundler_10extensions_3FSM_3FSM_machine(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_7bundler_10extensions_3FSM_3FSM_7machine_1__get__(o);
+}
+
+static PyObject *__pyx_getprop_7bundler_10extensions_3FSM_3FSM_yield_states(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_7bundler_10extensions_3FSM_3FSM_12yield_states_1__get__(o);
+}
+
+static PyObject *__pyx_getprop_7bundler_10extensions_3FSM_3FSM_distance_to_yield(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_7bundler_10extensions_3FSM_3FSM_17distance_to_yield_1__get__(o);
+}
+
+static PyMethodDef __pyx_methods_7bundler_10extensions_3FSM_FSM[] = {
+  {"find_distance_to_yield", (PyCFunction)__pyx_pw_7bundler_10extensions_3FSM_3FSM_3find_distance_to_yield, METH_NOARGS, __pyx_doc_7bundler_10extensions_3FSM_3FSM_2find_distance_to_yield},
+  {"from_dicts", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_7bundler_10extensions_3FSM_3FSM_5from_dicts, METH_VARARGS|METH_KEYWORDS, __pyx_doc_7bundler_10extensions_3FSM_3FSM_4from_dicts},
+  {"__reduce__", (PyCFunction)__pyx_pw_7bundler_10extensions_3FSM_3FSM_7__reduce__, METH_NOARGS, 0},
+  {"distance", (PyCFunction)__pyx_pw_7bundler_10extensions_3FSM_3FSM_11distance, METH_O, 0},
+  {"path", (PyCFunction)__pyx_pw_7bundler_10extensions_3FSM_3FSM_13path, METH_NOARGS, __pyx_doc_7bundler_10extensions_3FSM_3FSM_12path},
+  {"transition_map", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_7bundler_10extensions_3FSM_3FSM_15transition_map, METH_VARARGS|METH_KEYWORDS, __pyx_doc_7bundler_10extensions_3FSM_3FSM_14transition_map},
+  {"hit", (PyCFunction)__pyx_pw_7bundler_10extensions_3FSM_3FSM_17hit, METH_O, __pyx_doc_7bundler_10extensions_3FSM_3FSM_16hit},
+  {"hits", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_7bundler_10extensions_3FSM_3FSM_19hits, METH_VARARGS|METH_KEYWORDS, __pyx_doc_7bundler_10extensions_3FSM_3FSM_18hits},
+  {"has_cycle", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_7bundler_10extensions_3FSM_3FSM_22has_cycle, METH_VARARGS|METH_KEYWORDS, __pyx_doc_7bundler_10extensions_3FSM_3FSM_21has_cycle},
+  {"has_cycles", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_7bundler_10extensions_3FSM_3FSM_24has_cycles, METH_VARARGS|METH_KEYWORDS, __pyx_doc_7bundler_10extensions_3FSM_3FSM_23has_cycles},
+  {0, 0, 0, 0}
+};
+
+static struct PyGetSetDef __pyx_getsets_7bundler_10extensions_3FSM_FSM[] = {
+  {(char *)"alphabet", __pyx_getprop_7bundler_10extensions_3FSM_3FSM_alphabet, 0, (char *)0, 0},
+  {(char *)"machine", __pyx_getprop_7bundler_10extensions_3FSM_3FSM_machine, 0, (char *)0, 0},
+  {(char *)"yield_states", __pyx_getprop_7bundler_10extensions_3FSM_3FSM_yield_states, 0, (char *)0, 0},
+  {(char *)"distance_to_yield", __pyx_getprop_7bundler_10extensions_3FSM_3FSM_distance_to_yield, 0, (char *)0, 0},
+  {0, 0, 0, 0, 0}
+};
+
+static PyTypeObject __pyx_type_7bundler_10extensions_3FSM_FSM = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "bundler.extensions.FSM.FSM", /*tp_name*/
+  sizeof(struct __pyx_obj_7bundler_10extensions_3FSM_FSM), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_7bundler_10extensions_3FSM_FSM, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  __pyx_pw_7bundler_10extensions_3FSM_3FSM_9__call__, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+  0, /*tp_doc*/
+  __pyx_tp_traverse_7bundler_10extensions_3FSM_FSM, /*tp_traverse*/
+  __pyx_tp_clear_7bundler_10extensions_3FSM_FSM, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_7bundler_10extensions_3FSM_FSM, /*tp_methods*/
+  0, /*tp_members*/
+  __pyx_getsets_7bundler_10extensions_3FSM_FSM, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  __pyx_pw_7bundler_10extensions_3FSM_3FSM_1__init__, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_7bundler_10extensions_3FSM_FSM, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+static struct __pyx_vtabstruct_7bundler_10extensions_3FSM_StatePath __pyx_vtable_7bundler_10extensions_3FSM_StatePath;
+
+static PyObject *__pyx_tp_new_7bundler_10extensions_3FSM_StatePath(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *p;
+  PyObject *o;
+  if (likely((t->tp_flags & Py_TPFLAGS_IS_ABSTRACT) == 0)) {
+    o = (*t->tp_alloc)(t, 0);
+  } else {
+    o = (PyObject *) PyBaseObject_Type.tp_new(t, __pyx_empty_tuple, 0);
+  }
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *)o);
+  p->__pyx_vtab = __pyx_vtabptr_7bundler_10extensions_3FSM_StatePath;
+  new((void*)&(p->states)) std::vector<int> ();
+  new((void*)&(p->hits)) std::vector<int> ();
+  p->machine = ((struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)Py_None); Py_INCREF(Py_None);
+  return o;
+}
+
+static void __pyx_tp_dealloc_7bundler_10extensions_3FSM_StatePath(PyObject *o) {
+  struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *p = (struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *)o;
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && !_PyGC_FINALIZED(o)) {
+    if (PyObject_CallFinalizerFromDealloc(o)) return;
+  }
+  #endif
+  PyObject_GC_UnTrack(o);
+  __Pyx_call_destructor(p->states);
+  __Pyx_call_destructor(p->hits);
+  Py_CLEAR(p->machine);
+  (*Py_TYPE(o)->tp_free)(o);
+}
+
+static int __pyx_tp_traverse_7bundler_10extensions_3FSM_StatePath(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *p = (struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *)o;
+  if (p->machine) {
+    e = (*v)(((PyObject *)p->machine), a); if (e) return e;
+  }
+  return 0;
+}
+
+static int __pyx_tp_clear_7bundler_10extensions_3FSM_StatePath(PyObject *o) {
+  PyObject* tmp;
+  struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *p = (struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *)o;
+  tmp = ((PyObject*)p->machine);
+  p->machine = ((struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  return 0;
+}
+
+static PyMethodDef __pyx_methods_7bundler_10extensions_3FSM_StatePath[] = {
+  {"push", (PyCFunction)__pyx_pw_7bundler_10extensions_3FSM_9StatePath_5push, METH_O, __pyx_doc_7bundler_10extensions_3FSM_9StatePath_4push},
+  {"truncate", (PyCFunction)__pyx_pw_7bundler_10extensions_3FSM_9StatePath_7truncate, METH_O, __pyx_doc_7bundler_10extensions_3FSM_9StatePath_6truncate},
+  {"state", (PyCFunction)__pyx_pw_7bundler_10extensions_3FSM_9StatePath_9state, METH_NOARGS, __pyx_doc_7bundler_10extensions_3FSM_9StatePath_8state},
+  {"hit", (PyCFunction)__pyx_pw_7bundler_10extensions_3FSM_9StatePath_11hit, METH_NOARGS, __pyx_doc_7bundler_10extensions_3FSM_9StatePath_10hit},
+  {"distance", (PyCFunction)__pyx_pw_7bundler_10extensions_3FSM_9StatePath_13distance, METH_NOARGS, __pyx_doc_7bundler_10extensions_3FSM_9StatePath_12distance},
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_7bundler_10extensions_3FSM_9StatePath_15__reduce_cython__, METH_NOARGS, 0},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_7bundler_10extensions_3FSM_9StatePath_17__setstate_cython__, METH_O, 0},
+  {0, 0, 0, 0}
+};
+
+static PySequenceMethods __pyx_tp_as_sequence_StatePath = {
+  __pyx_pw_7bundler_10extensions_3FSM_9StatePath_3__len__, /*sq_length*/
+  0, /*sq_concat*/
+  0, /*sq_repeat*/
+  0, /*sq_item*/
+  0, /*sq_slice*/
+  0, /*sq_ass_item*/
+  0, /*sq_ass_slice*/
+  0, /*sq_contains*/
+  0, /*sq_inplace_concat*/
+  0, /*sq_inplace_repeat*/
+};
+
+static PyMappingMethods __pyx_tp_as_mapping_StatePath = {
+  __pyx_pw_7bundler_10extensions_3FSM_9StatePath_3__len__, /*mp_length*/
+  0, /*mp_subscript*/
+  0, /*mp_ass_subscript*/
+};
+
+static PyTypeObject __pyx_type_7bundler_10extensions_3FSM_StatePath = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "bundler.extensions.FSM.StatePath", /*tp_name*/
+  sizeof(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_7bundler_10extensions_3FSM_StatePath, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  &__pyx_tp_as_sequence_StatePath, /*tp_as_sequence*/
+  &__pyx_tp_as_mapping_StatePath, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+  " A stack of the states that an FSM passes through as it reads a word.\n    \n    Extending the word by a letter costs one table lookup and we can roll back to any earlier depth,\n    so following a depth-first traversal costs O(1) per vertex rather than O(length). ", /*tp_doc*/
+  __pyx_tp_traverse_7bundler_10extensions_3FSM_StatePath, /*tp_traverse*/
+  __pyx_tp_clear_7bundler_10extensions_3FSM_StatePath, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_7bundler_10extensions_3FSM_StatePath, /*tp_methods*/
+  0, /*tp_members*/
+  0, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  __pyx_pw_7bundler_10extensions_3FSM_9StatePath_1__init__, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_7bundler_10extensions_3FSM_StatePath, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+static struct __pyx_vtabstruct_7bundler_10extensions_3FSM_TransitionMap __pyx_vtable_7bundler_10extensions_3FSM_TransitionMap;
+
+static PyObject *__pyx_tp_new_7bundler_10extensions_3FSM_TransitionMap(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *p;
+  PyObject *o;
+  if (likely((t->tp_flags & Py_TPFLAGS_IS_ABSTRACT) == 0)) {
+    o = (*t->tp_alloc)(t, 0);
+  } else {
+    o = (PyObject *) PyBaseObject_Type.tp_new(t, __pyx_empty_tuple, 0);
+  }
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *)o);
+  p->__pyx_vtab = __pyx_vtabptr_7bundler_10extensions_3FSM_TransitionMap;
+  new((void*)&(p->maps)) std::vector<int> ();
+  p->machine = ((struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)Py_None); Py_INCREF(Py_None);
+  return o;
+}
+
+static void __pyx_tp_dealloc_7bundler_10extensions_3FSM_TransitionMap(PyObject *o) {
+  struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *p = (struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *)o;
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && !_PyGC_FINALIZED(o)) {
+    if (PyObject_CallFinalizerFromDealloc(o)) return;
+  }
+  #endif
+  PyObject_GC_UnTrack(o);
+  __Pyx_call_destructor(p->maps);
+  Py_CLEAR(p->machine);
+  (*Py_TYPE(o)->tp_free)(o);
+}
+
+static int __pyx_tp_traverse_7bundler_10extensions_3FSM_TransitionMap(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *p = (struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *)o;
+  if (p->machine) {
+    e = (*v)(((PyObject *)p->machine), a); if (e) return e;
+  }
+  return 0;
+}
+
+static int __pyx_tp_clear_7bundler_10extensions_3FSM_TransitionMap(PyObject *o) {
+  PyObject* tmp;
+  struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *p = (struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *)o;
+  tmp = ((PyObject*)p->machine);
+  p->machine = ((struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  return 0;
+}
+
+static PyMethodDef __pyx_methods_7bundler_10extensions_3FSM_TransitionMap[] = {
+  {"push", (PyCFunction)__pyx_pw_7bundler_10extensions_3FSM_13TransitionMap_5push, METH_O, __pyx_doc_7bundler_10extensions_3FSM_13TransitionMap_4push},
+  {"truncate", (PyCFunction)__pyx_pw_7bundler_10extensions_3FSM_13TransitionMap_7truncate, METH_O, __pyx_doc_7bundler_10extensions_3FSM_13TransitionMap_6truncate},
+  {"has_fixed_point", (PyCFunction)__pyx_pw_7bundler_10extensions_3FSM_13TransitionMap_9has_fixed_point, METH_NOARGS, __pyx_doc_7bundler_10extensions_3FSM_13TransitionMap_8has_fixed_point},
+  {"image", (PyCFunction)__pyx_pw_7bundler_10extensions_3FSM_13TransitionMap_11image, METH_NOARGS, __pyx_doc_7bundler_10extensions_3FSM_13TransitionMap_10image},
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_7bundler_10extensions_3FSM_13TransitionMap_13__reduce_cython__, METH_NOARGS, 0},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_7bundler_10extensions_3FSM_13TransitionMap_15__setstate_cython__, METH_O, 0},
+  {0, 0, 0, 0}
+};
+
+static PySequenceMethods __pyx_tp_as_sequence_TransitionMap = {
+  __pyx_pw_7bundler_10extensions_3FSM_13TransitionMap_3__len__, /*sq_length*/
+  0, /*sq_concat*/
+  0, /*sq_repeat*/
+  0, /*sq_item*/
+  0, /*sq_slice*/
+  0, /*sq_ass_item*/
+  0, /*sq_ass_slice*/
+  0, /*sq_contains*/
+  0, /*sq_inplace_concat*/
+  0, /*sq_inplace_repeat*/
+};
+
+static PyMappingMethods __pyx_tp_as_mapping_TransitionMap = {
+  __pyx_pw_7bundler_10extensions_3FSM_13TransitionMap_3__len__, /*mp_length*/
+  0, /*mp_subscript*/
+  0, /*mp_ass_subscript*/
+};
+
+static PyTypeObject __pyx_type_7bundler_10extensions_3FSM_TransitionMap = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "bundler.extensions.FSM.TransitionMap", /*tp_name*/
+  sizeof(struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_7bundler_10extensions_3FSM_TransitionMap, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  &__pyx_tp_as_sequence_TransitionMap, /*tp_as_sequence*/
+  &__pyx_tp_as_mapping_TransitionMap, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+  " A stack of the maps that a word induces on the first width states of an FSM.\n    \n    maps[i * width + c] is the state reached from state c after reading i letters or -1 if this\n    walks off of the machine. So has_cycle becomes a test for a fixed point of the top map. ", /*tp_doc*/
+  __pyx_tp_traverse_7bundler_10extensions_3FSM_TransitionMap, /*tp_traverse*/
+  __pyx_tp_clear_7bundler_10extensions_3FSM_TransitionMap, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_7bundler_10extensions_3FSM_TransitionMap, /*tp_methods*/
+  0, /*tp_members*/
+  0, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  __pyx_pw_7bundler_10extensions_3FSM_13TransitionMap_1__init__, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_7bundler_10extensions_3FSM_TransitionMap, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+
+static struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct____init__ *__pyx_freelist_7bundler_10extensions_3FSM___pyx_scope_struct____init__[8];
+static int __pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct____init__ = 0;
+
+static PyObject *__pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct____init__(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  PyObject *o;
+  if (CYTHON_COMPILING_IN_CPYTHON && likely((__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct____init__ > 0) & (t->tp_basicsize == sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct____init__)))) {
+    o = (PyObject*)__pyx_freelist_7bundler_10extensions_3FSM___pyx_scope_struct____init__[--__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct____init__];
+    memset(o, 0, sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct____init__));
+    (void) PyObject_INIT(o, t);
+    PyObject_GC_Track(o);
+  } else {
+    o = (*t->tp_alloc)(t, 0);
+    if (unlikely(!o)) return 0;
+  }
+  return o;
+}
+
+static void __pyx_tp_dealloc_7bundler_10extensions_3FSM___pyx_scope_struct____init__(PyObject *o) {
+  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct____init__ *p = (struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct____init__ *)o;
+  PyObject_GC_UnTrack(o);
+  Py_CLEAR(p->__pyx_v_self);
+  if (CYTHON_COMPILING_IN_CPYTHON && ((__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct____init__ < 8) & (Py_TYPE(o)->tp_basicsize == sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct____init__)))) {
+    __pyx_freelist_7bundler_10extensions_3FSM___pyx_scope_struct____init__[__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct____init__++] = ((struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct____init__ *)o);
+  } else {
+    (*Py_TYPE(o)->tp_free)(o);
+  }
+}
+
+static int __pyx_tp_traverse_7bundler_10extensions_3FSM___pyx_scope_struct____init__(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct____init__ *p = (struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct____init__ *)o;
+  if (p->__pyx_v_self) {
+    e = (*v)(((PyObject *)p->__pyx_v_self), a); if (e) return e;
+  }
+  return 0;
+}
+
+static int __pyx_tp_clear_7bundler_10extensions_3FSM___pyx_scope_struct____init__(PyObject *o) {
+  PyObject* tmp;
+  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct____init__ *p = (struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct____init__ *)o;
+  tmp = ((PyObject*)p->__pyx_v_self);
+  p->__pyx_v_self = ((struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  return 0;
+}
+
+static PyTypeObject __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct____init__ = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "bundler.extensions.FSM.__pyx_scope_struct____init__", /*tp_name*/
+  sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct____init__), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_7bundler_10extensions_3FSM___pyx_scope_struct____init__, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+  0, /*tp_doc*/
+  __pyx_tp_traverse_7bundler_10extensions_3FSM___pyx_scope_struct____init__, /*tp_traverse*/
+  __pyx_tp_clear_7bundler_10extensions_3FSM___pyx_scope_struct____init__, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  0, /*tp_methods*/
+  0, /*tp_members*/
+  0, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  0, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct____init__, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+
+static struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr *__pyx_freelist_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr[8];
+static int __pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr = 0;
+
+static PyObject *__pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  PyObject *o;
+  if (CYTHON_COMPILING_IN_CPYTHON && likely((__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr > 0) & (t->tp_basicsize == sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr)))) {
+    o = (PyObject*)__pyx_freelist_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr[--__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr];
+    memset(o, 0, sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr));
+    (void) PyObject_INIT(o, t);
+    PyObject_GC_Track(o);
+  } else {
+    o = (*t->tp_alloc)(t, 0);
+    if (unlikely(!o)) return 0;
+  }
+  return o;
+}
+
+static void __pyx_tp_dealloc_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr(PyObject *o) {
+  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr *p = (struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr *)o;
+  PyObject_GC_UnTrack(o);
+  Py_CLEAR(p->__pyx_outer_scope);
+  Py_CLEAR(p->__pyx_v_x);
+  Py_CLEAR(p->__pyx_t_0);
+  if (CYTHON_COMPILING_IN_CPYTHON && ((__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr < 8) & (Py_TYPE(o)->tp_basicsize == sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr)))) {
+    __pyx_freelist_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr[__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr++] = ((struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr *)o);
+  } else {
+    (*Py_TYPE(o)->tp_free)(o);
   }
-  if (p->yield_states) {
-    e = (*v)(p->yield_states, a); if (e) return e;
+}
+
+static int __pyx_tp_traverse_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr *p = (struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr *)o;
+  if (p->__pyx_outer_scope) {
+    e = (*v)(((PyObject *)p->__pyx_outer_scope), a); if (e) return e;
   }
-  if (p->distance_to_yield) {
-    e = (*v)(p->distance_to_yield, a); if (e) return e;
+  if (p->__pyx_v_x) {
+    e = (*v)(p->__pyx_v_x, a); if (e) return e;
   }
-  if (p->has_yield) {
-    e = (*v)(((PyObject *)p->has_yield), a); if (e) return e;
+  if (p->__pyx_t_0) {
+    e = (*v)(p->__pyx_t_0, a); if (e) return e;
   }
   return 0;
 }
 
-static int __pyx_tp_clear_7bundler_10extensions_3FSM_FSM(PyObject *o) {
+static PyTypeObject __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "bundler.extensions.FSM.__pyx_scope_struct_1_genexpr", /*tp_name*/
+  sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+  0, /*tp_doc*/
+  __pyx_tp_traverse_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr, /*tp_traverse*/
+  0, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  0, /*tp_methods*/
+  0, /*tp_members*/
+  0, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  0, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+
+static struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield *__pyx_freelist_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield[8];
+static int __pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield = 0;
+
+static PyObject *__pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield *p;
+  PyObject *o;
+  if (CYTHON_COMPILING_IN_CPYTHON && likely((__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield > 0) & (t->tp_basicsize == sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield)))) {
+    o = (PyObject*)__pyx_freelist_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield[--__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield];
+    memset(o, 0, sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield));
+    (void) PyObject_INIT(o, t);
+    PyObject_GC_Track(o);
+  } else {
+    o = (*t->tp_alloc)(t, 0);
+    if (unlikely(!o)) return 0;
+  }
+  p = ((struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield *)o);
+  new((void*)&(p->__pyx_v_distances)) std::vector<int> ();
+  return o;
+}
+
+static void __pyx_tp_dealloc_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield(PyObject *o) {
+  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield *p = (struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield *)o;
+  PyObject_GC_UnTrack(o);
+  __Pyx_call_destructor(p->__pyx_v_distances);
+  Py_CLEAR(p->__pyx_v_self);
+  if (CYTHON_COMPILING_IN_CPYTHON && ((__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield < 8) & (Py_TYPE(o)->tp_basicsize == sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield)))) {
+    __pyx_freelist_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield[__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield++] = ((struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield *)o);
+  } else {
+    (*Py_TYPE(o)->tp_free)(o);
+  }
+}
+
+static int __pyx_tp_traverse_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield *p = (struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield *)o;
+  if (p->__pyx_v_self) {
+    e = (*v)(((PyObject *)p->__pyx_v_self), a); if (e) return e;
+  }
+  return 0;
+}
+
+static int __pyx_tp_clear_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield(PyObject *o) {
   PyObject* tmp;
-  struct __pyx_obj_7bundler_10extensions_3FSM_FSM *p = (struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)o;
-  tmp = ((PyObject*)p->alphabet);
-  p->alphabet = ((PyObject*)Py_None); Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  tmp = ((PyObject*)p->machine);
-  p->machine = ((arrayobject *)Py_None); Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  tmp = ((PyObject*)p->yield_states);
-  p->yield_states = ((PyObject*)Py_None); Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  tmp = ((PyObject*)p->distance_to_yield);
-  p->distance_to_yield = ((PyObject*)Py_None); Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  tmp = ((PyObject*)p->has_yield);
-  p->has_yield = ((arrayobject *)Py_None); Py_INCREF(Py_None);
+  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield *p = (struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield *)o;
+  tmp = ((PyObject*)p->__pyx_v_self);
+  p->__pyx_v_self = ((struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)Py_None); Py_INCREF(Py_None);
   Py_XDECREF(tmp);
   return 0;
 }
 
-static PyMethodDef __pyx_methods_7bundler_10extensions_3FSM_FSM[] = {
-  {"from_dicts", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_7bundler_10extensions_3FSM_3FSM_3from_dicts, METH_VARARGS|METH_KEYWORDS, __pyx_doc_7bundler_10extensions_3FSM_3FSM_2from_dicts},
-  {"__reduce__", (PyCFunction)__pyx_pw_7bundler_10extensions_3FSM_3FSM_5__reduce__, METH_NOARGS, 0},
-  {"distance", (PyCFunction)__pyx_pw_7bundler_10extensions_3FSM_3FSM_9distance, METH_O, 0},
-  {"hit", (PyCFunction)__pyx_pw_7bundler_10extensions_3FSM_3FSM_11hit, METH_O, __pyx_doc_7bundler_10extensions_3FSM_3FSM_10hit},
-  {"hits", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_7bundler_10extensions_3FSM_3FSM_13hits, METH_VARARGS|METH_KEYWORDS, __pyx_doc_7bundler_10extensions_3FSM_3FSM_12hits},
-  {"has_cycle", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_7bundler_10extensions_3FSM_3FSM_16has_cycle, METH_VARARGS|METH_KEYWORDS, __pyx_doc_7bundler_10extensions_3FSM_3FSM_15has_cycle},
-  {0, 0, 0, 0}
+static PyTypeObject __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "bundler.extensions.FSM.__pyx_scope_struct_2_find_distance_to_yield", /*tp_name*/
+  sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+  0, /*tp_doc*/
+  __pyx_tp_traverse_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield, /*tp_traverse*/
+  __pyx_tp_clear_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  0, /*tp_methods*/
+  0, /*tp_members*/
+  0, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  0, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000
+  0, /*tp_pypy_flags*/
+  #endif
 };
 
-static PyTypeObject __pyx_type_7bundler_10extensions_3FSM_FSM = {
+static struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_3_genexpr *__pyx_freelist_7bundler_10extensions_3FSM___pyx_scope_struct_3_genexpr[8];
+static int __pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_3_genexpr = 0;
+
+static PyObject *__pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct_3_genexpr(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  PyObject *o;
+  if (CYTHON_COMPILING_IN_CPYTHON && likely((__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_3_genexpr > 0) & (t->tp_basicsize == sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_3_genexpr)))) {
+    o = (PyObject*)__pyx_freelist_7bundler_10extensions_3FSM___pyx_scope_struct_3_genexpr[--__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_3_genexpr];
+    memset(o, 0, sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_3_genexpr));
+    (void) PyObject_INIT(o, t);
+    PyObject_GC_Track(o);
+  } else {
+    o = (*t->tp_alloc)(t, 0);
+    if (unlikely(!o)) return 0;
+  }
+  return o;
+}
+
+static void __pyx_tp_dealloc_7bundler_10extensions_3FSM___pyx_scope_struct_3_genexpr(PyObject *o) {
+  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_3_genexpr *p = (struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_3_genexpr *)o;
+  PyObject_GC_UnTrack(o);
+  Py_CLEAR(p->__pyx_outer_scope);
+  if (CYTHON_COMPILING_IN_CPYTHON && ((__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_3_genexpr < 8) & (Py_TYPE(o)->tp_basicsize == sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_3_genexpr)))) {
+    __pyx_freelist_7bundler_10extensions_3FSM___pyx_scope_struct_3_genexpr[__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_3_genexpr++] = ((struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_3_genexpr *)o);
+  } else {
+    (*Py_TYPE(o)->tp_free)(o);
+  }
+}
+
+static int __pyx_tp_traverse_7bundler_10extensions_3FSM___pyx_scope_struct_3_genexpr(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_3_genexpr *p = (struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_3_genexpr *)o;
+  if (p->__pyx_outer_scope) {
+    e = (*v)(((PyObject *)p->__pyx_outer_scope), a); if (e) return e;
+  }
+  return 0;
+}
+
+static PyTypeObject __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_3_genexpr = {
   PyVarObject_HEAD_INIT(0, 0)
-  "bundler.extensions.FSM.FSM", /*tp_name*/
-  sizeof(struct __pyx_obj_7bundler_10extensions_3FSM_FSM), /*tp_basicsize*/
+  "bundler.extensions.FSM.__pyx_scope_struct_3_genexpr", /*tp_name*/
+  sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_3_genexpr), /*tp_basicsize*/
   0, /*tp_itemsize*/
-  __pyx_tp_dealloc_7bundler_10extensions_3FSM_FSM, /*tp_dealloc*/
+  __pyx_tp_dealloc_7bundler_10extensions_3FSM___pyx_scope_struct_3_genexpr, /*tp_dealloc*/
   #if PY_VERSION_HEX < 0x030800b4
   0, /*tp_print*/
   #endif
@@ -6363,20 +15172,20 @@ static PyTypeObject __pyx_type_7bundler_10extensions_3FSM_FSM = {
   0, /*tp_as_sequence*/
   0, /*tp_as_mapping*/
   0, /*tp_hash*/
-  __pyx_pw_7bundler_10extensions_3FSM_3FSM_7__call__, /*tp_call*/
+  0, /*tp_call*/
   0, /*tp_str*/
   0, /*tp_getattro*/
   0, /*tp_setattro*/
   0, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
   0, /*tp_doc*/
-  __pyx_tp_traverse_7bundler_10extensions_3FSM_FSM, /*tp_traverse*/
-  __pyx_tp_clear_7bundler_10extensions_3FSM_FSM, /*tp_clear*/
+  __pyx_tp_traverse_7bundler_10extensions_3FSM___pyx_scope_struct_3_genexpr, /*tp_traverse*/
+  0, /*tp_clear*/
   0, /*tp_richcompare*/
   0, /*tp_weaklistoffset*/
   0, /*tp_iter*/
   0, /*tp_iternext*/
-  __pyx_methods_7bundler_10extensions_3FSM_FSM, /*tp_methods*/
+  0, /*tp_methods*/
   0, /*tp_members*/
   0, /*tp_getset*/
   0, /*tp_base*/
@@ -6384,9 +15193,9 @@ static PyTypeObject __pyx_type_7bundler_10extensions_3FSM_FSM = {
   0, /*tp_descr_get*/
   0, /*tp_descr_set*/
   0, /*tp_dictoffset*/
-  __pyx_pw_7bundler_10extensions_3FSM_3FSM_1__init__, /*tp_init*/
+  0, /*tp_init*/
   0, /*tp_alloc*/
-  __pyx_tp_new_7bundler_10extensions_3FSM_FSM, /*tp_new*/
+  __pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct_3_genexpr, /*tp_new*/
   0, /*tp_free*/
   0, /*tp_is_gc*/
   0, /*tp_bases*/
@@ -6410,14 +15219,14 @@ static PyTypeObject __pyx_type_7bundler_10extensions_3FSM_FSM = {
   #endif
 };
 
-static struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts *__pyx_freelist_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts[8];
-static int __pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts = 0;
+static struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts *__pyx_freelist_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts[8];
+static int __pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts = 0;
 
-static PyObject *__pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+static PyObject *__pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
   PyObject *o;
-  if (CYTHON_COMPILING_IN_CPYTHON && likely((__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts > 0) & (t->tp_basicsize == sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts)))) {
-    o = (PyObject*)__pyx_freelist_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts[--__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts];
-    memset(o, 0, sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts));
+  if (CYTHON_COMPILING_IN_CPYTHON && likely((__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts > 0) & (t->tp_basicsize == sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts)))) {
+    o = (PyObject*)__pyx_freelist_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts[--__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts];
+    memset(o, 0, sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts));
     (void) PyObject_INIT(o, t);
     PyObject_GC_Track(o);
   } else {
@@ -6427,22 +15236,22 @@ static PyObject *__pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct__fro
   return o;
 }
 
-static void __pyx_tp_dealloc_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts(PyObject *o) {
-  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts *p = (struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts *)o;
+static void __pyx_tp_dealloc_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts(PyObject *o) {
+  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts *p = (struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts *)o;
   PyObject_GC_UnTrack(o);
   Py_CLEAR(p->__pyx_v_hits);
   Py_CLEAR(p->__pyx_v_state_names);
   Py_CLEAR(p->__pyx_v_state_names_index);
-  if (CYTHON_COMPILING_IN_CPYTHON && ((__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts < 8) & (Py_TYPE(o)->tp_basicsize == sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts)))) {
-    __pyx_freelist_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts[__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts++] = ((struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts *)o);
+  if (CYTHON_COMPILING_IN_CPYTHON && ((__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts < 8) & (Py_TYPE(o)->tp_basicsize == sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts)))) {
+    __pyx_freelist_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts[__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts++] = ((struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts *)o);
   } else {
     (*Py_TYPE(o)->tp_free)(o);
   }
 }
 
-static int __pyx_tp_traverse_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts(PyObject *o, visitproc v, void *a) {
+static int __pyx_tp_traverse_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts(PyObject *o, visitproc v, void *a) {
   int e;
-  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts *p = (struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts *)o;
+  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts *p = (struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts *)o;
   if (p->__pyx_v_hits) {
     e = (*v)(p->__pyx_v_hits, a); if (e) return e;
   }
@@ -6455,9 +15264,9 @@ static int __pyx_tp_traverse_7bundler_10extensions_3FSM___pyx_scope_struct__from
   return 0;
 }
 
-static int __pyx_tp_clear_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts(PyObject *o) {
+static int __pyx_tp_clear_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts(PyObject *o) {
   PyObject* tmp;
-  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts *p = (struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts *)o;
+  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts *p = (struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts *)o;
   tmp = ((PyObject*)p->__pyx_v_hits);
   p->__pyx_v_hits = ((PyObject*)Py_None); Py_INCREF(Py_None);
   Py_XDECREF(tmp);
@@ -6470,12 +15279,12 @@ static int __pyx_tp_clear_7bundler_10extensions_3FSM___pyx_scope_struct__from_di
   return 0;
 }
 
-static PyTypeObject __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts = {
+static PyTypeObject __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts = {
   PyVarObject_HEAD_INIT(0, 0)
-  "bundler.extensions.FSM.__pyx_scope_struct__from_dicts", /*tp_name*/
-  sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts), /*tp_basicsize*/
+  "bundler.extensions.FSM.__pyx_scope_struct_4_from_dicts", /*tp_name*/
+  sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts), /*tp_basicsize*/
   0, /*tp_itemsize*/
-  __pyx_tp_dealloc_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts, /*tp_dealloc*/
+  __pyx_tp_dealloc_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts, /*tp_dealloc*/
   #if PY_VERSION_HEX < 0x030800b4
   0, /*tp_print*/
   #endif
@@ -6502,8 +15311,8 @@ static PyTypeObject __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct__fr
   0, /*tp_as_buffer*/
   Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
   0, /*tp_doc*/
-  __pyx_tp_traverse_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts, /*tp_traverse*/
-  __pyx_tp_clear_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts, /*tp_clear*/
+  __pyx_tp_traverse_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts, /*tp_traverse*/
+  __pyx_tp_clear_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts, /*tp_clear*/
   0, /*tp_richcompare*/
   0, /*tp_weaklistoffset*/
   0, /*tp_iter*/
@@ -6518,7 +15327,7 @@ static PyTypeObject __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct__fr
   0, /*tp_dictoffset*/
   0, /*tp_init*/
   0, /*tp_alloc*/
-  __pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts, /*tp_new*/
+  __pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts, /*tp_new*/
   0, /*tp_free*/
   0, /*tp_is_gc*/
   0, /*tp_bases*/
@@ -6542,14 +15351,14 @@ static PyTypeObject __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct__fr
   #endif
 };
 
-static struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr *__pyx_freelist_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr[8];
-static int __pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr = 0;
+static struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_5_genexpr *__pyx_freelist_7bundler_10extensions_3FSM___pyx_scope_struct_5_genexpr[8];
+static int __pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_5_genexpr = 0;
 
-static PyObject *__pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+static PyObject *__pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct_5_genexpr(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
   PyObject *o;
-  if (CYTHON_COMPILING_IN_CPYTHON && likely((__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr > 0) & (t->tp_basicsize == sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr)))) {
-    o = (PyObject*)__pyx_freelist_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr[--__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr];
-    memset(o, 0, sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr));
+  if (CYTHON_COMPILING_IN_CPYTHON && likely((__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_5_genexpr > 0) & (t->tp_basicsize == sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_5_genexpr)))) {
+    o = (PyObject*)__pyx_freelist_7bundler_10extensions_3FSM___pyx_scope_struct_5_genexpr[--__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_5_genexpr];
+    memset(o, 0, sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_5_genexpr));
     (void) PyObject_INIT(o, t);
     PyObject_GC_Track(o);
   } else {
@@ -6559,22 +15368,22 @@ static PyObject *__pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct_1_ge
   return o;
 }
 
-static void __pyx_tp_dealloc_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr(PyObject *o) {
-  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr *p = (struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr *)o;
+static void __pyx_tp_dealloc_7bundler_10extensions_3FSM___pyx_scope_struct_5_genexpr(PyObject *o) {
+  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_5_genexpr *p = (struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_5_genexpr *)o;
   PyObject_GC_UnTrack(o);
   Py_CLEAR(p->__pyx_outer_scope);
   Py_CLEAR(p->__pyx_v_name);
   Py_CLEAR(p->__pyx_v_place);
-  if (CYTHON_COMPILING_IN_CPYTHON && ((__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr < 8) & (Py_TYPE(o)->tp_basicsize == sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr)))) {
-    __pyx_freelist_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr[__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr++] = ((struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr *)o);
+  if (CYTHON_COMPILING_IN_CPYTHON && ((__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_5_genexpr < 8) & (Py_TYPE(o)->tp_basicsize == sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_5_genexpr)))) {
+    __pyx_freelist_7bundler_10extensions_3FSM___pyx_scope_struct_5_genexpr[__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_5_genexpr++] = ((struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_5_genexpr *)o);
   } else {
     (*Py_TYPE(o)->tp_free)(o);
   }
 }
 
-static int __pyx_tp_traverse_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr(PyObject *o, visitproc v, void *a) {
+static int __pyx_tp_traverse_7bundler_10extensions_3FSM___pyx_scope_struct_5_genexpr(PyObject *o, visitproc v, void *a) {
   int e;
-  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr *p = (struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr *)o;
+  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_5_genexpr *p = (struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_5_genexpr *)o;
   if (p->__pyx_outer_scope) {
     e = (*v)(((PyObject *)p->__pyx_outer_scope), a); if (e) return e;
   }
@@ -6587,12 +15396,12 @@ static int __pyx_tp_traverse_7bundler_10extensions_3FSM___pyx_scope_struct_1_gen
   return 0;
 }
 
-static PyTypeObject __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr = {
+static PyTypeObject __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_5_genexpr = {
   PyVarObject_HEAD_INIT(0, 0)
-  "bundler.extensions.FSM.__pyx_scope_struct_1_genexpr", /*tp_name*/
-  sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr), /*tp_basicsize*/
+  "bundler.extensions.FSM.__pyx_scope_struct_5_genexpr", /*tp_name*/
+  sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_5_genexpr), /*tp_basicsize*/
   0, /*tp_itemsize*/
-  __pyx_tp_dealloc_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr, /*tp_dealloc*/
+  __pyx_tp_dealloc_7bundler_10extensions_3FSM___pyx_scope_struct_5_genexpr, /*tp_dealloc*/
   #if PY_VERSION_HEX < 0x030800b4
   0, /*tp_print*/
   #endif
@@ -6619,7 +15428,7 @@ static PyTypeObject __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_1_g
   0, /*tp_as_buffer*/
   Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
   0, /*tp_doc*/
-  __pyx_tp_traverse_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr, /*tp_traverse*/
+  __pyx_tp_traverse_7bundler_10extensions_3FSM___pyx_scope_struct_5_genexpr, /*tp_traverse*/
   0, /*tp_clear*/
   0, /*tp_richcompare*/
   0, /*tp_weaklistoffset*/
@@ -6635,7 +15444,7 @@ static PyTypeObject __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_1_g
   0, /*tp_dictoffset*/
   0, /*tp_init*/
   0, /*tp_alloc*/
-  __pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr, /*tp_new*/
+  __pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct_5_genexpr, /*tp_new*/
   0, /*tp_free*/
   0, /*tp_is_gc*/
   0, /*tp_bases*/
@@ -6659,14 +15468,14 @@ static PyTypeObject __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_1_g
   #endif
 };
 
-static struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_2_genexpr *__pyx_freelist_7bundler_10extensions_3FSM___pyx_scope_struct_2_genexpr[8];
-static int __pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_2_genexpr = 0;
+static struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_6_genexpr *__pyx_freelist_7bundler_10extensions_3FSM___pyx_scope_struct_6_genexpr[8];
+static int __pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_6_genexpr = 0;
 
-static PyObject *__pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct_2_genexpr(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+static PyObject *__pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct_6_genexpr(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
   PyObject *o;
-  if (CYTHON_COMPILING_IN_CPYTHON && likely((__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_2_genexpr > 0) & (t->tp_basicsize == sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_2_genexpr)))) {
-    o = (PyObject*)__pyx_freelist_7bundler_10extensions_3FSM___pyx_scope_struct_2_genexpr[--__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_2_genexpr];
-    memset(o, 0, sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_2_genexpr));
+  if (CYTHON_COMPILING_IN_CPYTHON && likely((__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_6_genexpr > 0) & (t->tp_basicsize == sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_6_genexpr)))) {
+    o = (PyObject*)__pyx_freelist_7bundler_10extensions_3FSM___pyx_scope_struct_6_genexpr[--__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_6_genexpr];
+    memset(o, 0, sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_6_genexpr));
     (void) PyObject_INIT(o, t);
     PyObject_GC_Track(o);
   } else {
@@ -6676,21 +15485,21 @@ static PyObject *__pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct_2_ge
   return o;
 }
 
-static void __pyx_tp_dealloc_7bundler_10extensions_3FSM___pyx_scope_struct_2_genexpr(PyObject *o) {
-  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_2_genexpr *p = (struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_2_genexpr *)o;
+static void __pyx_tp_dealloc_7bundler_10extensions_3FSM___pyx_scope_struct_6_genexpr(PyObject *o) {
+  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_6_genexpr *p = (struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_6_genexpr *)o;
   PyObject_GC_UnTrack(o);
   Py_CLEAR(p->__pyx_outer_scope);
   Py_CLEAR(p->__pyx_v_state);
-  if (CYTHON_COMPILING_IN_CPYTHON && ((__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_2_genexpr < 8) & (Py_TYPE(o)->tp_basicsize == sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_2_genexpr)))) {
-    __pyx_freelist_7bundler_10extensions_3FSM___pyx_scope_struct_2_genexpr[__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_2_genexpr++] = ((struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_2_genexpr *)o);
+  if (CYTHON_COMPILING_IN_CPYTHON && ((__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_6_genexpr < 8) & (Py_TYPE(o)->tp_basicsize == sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_6_genexpr)))) {
+    __pyx_freelist_7bundler_10extensions_3FSM___pyx_scope_struct_6_genexpr[__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_6_genexpr++] = ((struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_6_genexpr *)o);
   } else {
     (*Py_TYPE(o)->tp_free)(o);
   }
 }
 
-static int __pyx_tp_traverse_7bundler_10extensions_3FSM___pyx_scope_struct_2_genexpr(PyObject *o, visitproc v, void *a) {
+static int __pyx_tp_traverse_7bundler_10extensions_3FSM___pyx_scope_struct_6_genexpr(PyObject *o, visitproc v, void *a) {
   int e;
-  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_2_genexpr *p = (struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_2_genexpr *)o;
+  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_6_genexpr *p = (struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_6_genexpr *)o;
   if (p->__pyx_outer_scope) {
     e = (*v)(((PyObject *)p->__pyx_outer_scope), a); if (e) return e;
   }
@@ -6700,12 +15509,12 @@ static int __pyx_tp_traverse_7bundler_10extensions_3FSM___pyx_scope_struct_2_gen
   return 0;
 }
 
-static PyTypeObject __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_2_genexpr = {
+static PyTypeObject __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_6_genexpr = {
   PyVarObject_HEAD_INIT(0, 0)
-  "bundler.extensions.FSM.__pyx_scope_struct_2_genexpr", /*tp_name*/
-  sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_2_genexpr), /*tp_basicsize*/
+  "bundler.extensions.FSM.__pyx_scope_struct_6_genexpr", /*tp_name*/
+  sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_6_genexpr), /*tp_basicsize*/
   0, /*tp_itemsize*/
-  __pyx_tp_dealloc_7bundler_10extensions_3FSM___pyx_scope_struct_2_genexpr, /*tp_dealloc*/
+  __pyx_tp_dealloc_7bundler_10extensions_3FSM___pyx_scope_struct_6_genexpr, /*tp_dealloc*/
   #if PY_VERSION_HEX < 0x030800b4
   0, /*tp_print*/
   #endif
@@ -6732,7 +15541,7 @@ static PyTypeObject __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_2_g
   0, /*tp_as_buffer*/
   Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
   0, /*tp_doc*/
-  __pyx_tp_traverse_7bundler_10extensions_3FSM___pyx_scope_struct_2_genexpr, /*tp_traverse*/
+  __pyx_tp_traverse_7bundler_10extensions_3FSM___pyx_scope_struct_6_genexpr, /*tp_traverse*/
   0, /*tp_clear*/
   0, /*tp_richcompare*/
   0, /*tp_weaklistoffset*/
@@ -6748,7 +15557,7 @@ static PyTypeObject __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_2_g
   0, /*tp_dictoffset*/
   0, /*tp_init*/
   0, /*tp_alloc*/
-  __pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct_2_genexpr, /*tp_new*/
+  __pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct_6_genexpr, /*tp_new*/
   0, /*tp_free*/
   0, /*tp_is_gc*/
   0, /*tp_bases*/
@@ -6772,14 +15581,14 @@ static PyTypeObject __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_2_g
   #endif
 };
 
-static struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_3_hits *__pyx_freelist_7bundler_10extensions_3FSM___pyx_scope_struct_3_hits[8];
-static int __pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_3_hits = 0;
+static struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_7_hits *__pyx_freelist_7bundler_10extensions_3FSM___pyx_scope_struct_7_hits[8];
+static int __pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_7_hits = 0;
 
-static PyObject *__pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct_3_hits(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+static PyObject *__pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct_7_hits(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
   PyObject *o;
-  if (CYTHON_COMPILING_IN_CPYTHON && likely((__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_3_hits > 0) & (t->tp_basicsize == sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_3_hits)))) {
-    o = (PyObject*)__pyx_freelist_7bundler_10extensions_3FSM___pyx_scope_struct_3_hits[--__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_3_hits];
-    memset(o, 0, sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_3_hits));
+  if (CYTHON_COMPILING_IN_CPYTHON && likely((__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_7_hits > 0) & (t->tp_basicsize == sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_7_hits)))) {
+    o = (PyObject*)__pyx_freelist_7bundler_10extensions_3FSM___pyx_scope_struct_7_hits[--__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_7_hits];
+    memset(o, 0, sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_7_hits));
     (void) PyObject_INIT(o, t);
     PyObject_GC_Track(o);
   } else {
@@ -6789,23 +15598,23 @@ static PyObject *__pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct_3_hi
   return o;
 }
 
-static void __pyx_tp_dealloc_7bundler_10extensions_3FSM___pyx_scope_struct_3_hits(PyObject *o) {
-  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_3_hits *p = (struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_3_hits *)o;
+static void __pyx_tp_dealloc_7bundler_10extensions_3FSM___pyx_scope_struct_7_hits(PyObject *o) {
+  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_7_hits *p = (struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_7_hits *)o;
   PyObject_GC_UnTrack(o);
   Py_CLEAR(p->__pyx_v_self);
   Py_CLEAR(p->__pyx_v_word);
   Py_CLEAR(p->__pyx_v_x);
   Py_CLEAR(p->__pyx_t_4);
-  if (CYTHON_COMPILING_IN_CPYTHON && ((__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_3_hits < 8) & (Py_TYPE(o)->tp_basicsize == sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_3_hits)))) {
-    __pyx_freelist_7bundler_10extensions_3FSM___pyx_scope_struct_3_hits[__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_3_hits++] = ((struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_3_hits *)o);
+  if (CYTHON_COMPILING_IN_CPYTHON && ((__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_7_hits < 8) & (Py_TYPE(o)->tp_basicsize == sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_7_hits)))) {
+    __pyx_freelist_7bundler_10extensions_3FSM___pyx_scope_struct_7_hits[__pyx_freecount_7bundler_10extensions_3FSM___pyx_scope_struct_7_hits++] = ((struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_7_hits *)o);
   } else {
     (*Py_TYPE(o)->tp_free)(o);
   }
 }
 
-static int __pyx_tp_traverse_7bundler_10extensions_3FSM___pyx_scope_struct_3_hits(PyObject *o, visitproc v, void *a) {
+static int __pyx_tp_traverse_7bundler_10extensions_3FSM___pyx_scope_struct_7_hits(PyObject *o, visitproc v, void *a) {
   int e;
-  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_3_hits *p = (struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_3_hits *)o;
+  struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_7_hits *p = (struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_7_hits *)o;
   if (p->__pyx_v_self) {
     e = (*v)(((PyObject *)p->__pyx_v_self), a); if (e) return e;
   }
@@ -6821,12 +15630,12 @@ static int __pyx_tp_traverse_7bundler_10extensions_3FSM___pyx_scope_struct_3_hit
   return 0;
 }
 
-static PyTypeObject __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_3_hits = {
+static PyTypeObject __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_7_hits = {
   PyVarObject_HEAD_INIT(0, 0)
-  "bundler.extensions.FSM.__pyx_scope_struct_3_hits", /*tp_name*/
-  sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_3_hits), /*tp_basicsize*/
+  "bundler.extensions.FSM.__pyx_scope_struct_7_hits", /*tp_name*/
+  sizeof(struct __pyx_obj_7bundler_10extensions_3FSM___pyx_scope_struct_7_hits), /*tp_basicsize*/
   0, /*tp_itemsize*/
-  __pyx_tp_dealloc_7bundler_10extensions_3FSM___pyx_scope_struct_3_hits, /*tp_dealloc*/
+  __pyx_tp_dealloc_7bundler_10extensions_3FSM___pyx_scope_struct_7_hits, /*tp_dealloc*/
   #if PY_VERSION_HEX < 0x030800b4
   0, /*tp_print*/
   #endif
@@ -6853,7 +15662,7 @@ static PyTypeObject __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_3_h
   0, /*tp_as_buffer*/
   Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
   0, /*tp_doc*/
-  __pyx_tp_traverse_7bundler_10extensions_3FSM___pyx_scope_struct_3_hits, /*tp_traverse*/
+  __pyx_tp_traverse_7bundler_10extensions_3FSM___pyx_scope_struct_7_hits, /*tp_traverse*/
   0, /*tp_clear*/
   0, /*tp_richcompare*/
   0, /*tp_weaklistoffset*/
@@ -6869,7 +15678,7 @@ static PyTypeObject __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_3_h
   0, /*tp_dictoffset*/
   0, /*tp_init*/
   0, /*tp_alloc*/
-  __pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct_3_hits, /*tp_new*/
+  __pyx_tp_new_7bundler_10extensions_3FSM___pyx_scope_struct_7_hits, /*tp_new*/
   0, /*tp_free*/
   0, /*tp_is_gc*/
   0, /*tp_bases*/
@@ -6941,53 +15750,142 @@ static struct PyModuleDef __pyx_moduledef = {
 static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_FSM, __pyx_k_FSM, sizeof(__pyx_k_FSM), 0, 0, 1, 1},
   {&__pyx_n_s_FSM_hits, __pyx_k_FSM_hits, sizeof(__pyx_k_FSM_hits), 0, 0, 1, 1},
+  {&__pyx_kp_s_Incompatible_checksums_0x_x_vs_0, __pyx_k_Incompatible_checksums_0x_x_vs_0, sizeof(__pyx_k_Incompatible_checksums_0x_x_vs_0), 0, 0, 1, 0},
+  {&__pyx_kp_s_Incompatible_checksums_0x_x_vs_0_2, __pyx_k_Incompatible_checksums_0x_x_vs_0_2, sizeof(__pyx_k_Incompatible_checksums_0x_x_vs_0_2), 0, 0, 1, 0},
+  {&__pyx_kp_u_Invalid_letter, __pyx_k_Invalid_letter, sizeof(__pyx_k_Invalid_letter), 0, 1, 0, 0},
   {&__pyx_kp_u_Invalid_transition_to_state, __pyx_k_Invalid_transition_to_state, sizeof(__pyx_k_Invalid_transition_to_state), 0, 1, 0, 0},
   {&__pyx_n_s_MemoryError, __pyx_k_MemoryError, sizeof(__pyx_k_MemoryError), 0, 0, 1, 1},
+  {&__pyx_n_s_N, __pyx_k_N, sizeof(__pyx_k_N), 0, 0, 1, 1},
   {&__pyx_n_s_OrderedDict, __pyx_k_OrderedDict, sizeof(__pyx_k_OrderedDict), 0, 0, 1, 1},
-  {&__pyx_n_s_Queue, __pyx_k_Queue, sizeof(__pyx_k_Queue), 0, 0, 1, 1},
+  {&__pyx_n_s_PickleError, __pyx_k_PickleError, sizeof(__pyx_k_PickleError), 0, 0, 1, 1},
+  {&__pyx_n_s_StatePath, __pyx_k_StatePath, sizeof(__pyx_k_StatePath), 0, 0, 1, 1},
+  {&__pyx_n_s_TransitionMap, __pyx_k_TransitionMap, sizeof(__pyx_k_TransitionMap), 0, 0, 1, 1},
+  {&__pyx_n_s_UNREACHABLE, __pyx_k_UNREACHABLE, sizeof(__pyx_k_UNREACHABLE), 0, 0, 1, 1},
   {&__pyx_n_s_ValueError, __pyx_k_ValueError, sizeof(__pyx_k_ValueError), 0, 0, 1, 1},
+  {&__pyx_n_s_accepting, __pyx_k_accepting, sizeof(__pyx_k_accepting), 0, 0, 1, 1},
+  {&__pyx_n_s_accepting_words, __pyx_k_accepting_words, sizeof(__pyx_k_accepting_words), 0, 0, 1, 1},
+  {&__pyx_n_s_aho_corasick, __pyx_k_aho_corasick, sizeof(__pyx_k_aho_corasick), 0, 0, 1, 1},
   {&__pyx_n_s_alphabet, __pyx_k_alphabet, sizeof(__pyx_k_alphabet), 0, 0, 1, 1},
+  {&__pyx_n_s_alphabet_len, __pyx_k_alphabet_len, sizeof(__pyx_k_alphabet_len), 0, 0, 1, 1},
+  {&__pyx_n_s_any, __pyx_k_any, sizeof(__pyx_k_any), 0, 0, 1, 1},
   {&__pyx_n_s_append, __pyx_k_append, sizeof(__pyx_k_append), 0, 0, 1, 1},
+  {&__pyx_n_s_arange, __pyx_k_arange, sizeof(__pyx_k_arange), 0, 0, 1, 1},
   {&__pyx_n_s_args, __pyx_k_args, sizeof(__pyx_k_args), 0, 0, 1, 1},
   {&__pyx_n_s_array, __pyx_k_array, sizeof(__pyx_k_array), 0, 0, 1, 1},
+  {&__pyx_n_s_asarray, __pyx_k_asarray, sizeof(__pyx_k_asarray), 0, 0, 1, 1},
+  {&__pyx_n_s_axis, __pyx_k_axis, sizeof(__pyx_k_axis), 0, 0, 1, 1},
+  {&__pyx_n_u_b, __pyx_k_b, sizeof(__pyx_k_b), 0, 1, 0, 1},
+  {&__pyx_n_s_block, __pyx_k_block, sizeof(__pyx_k_block), 0, 0, 1, 1},
+  {&__pyx_n_s_block_end, __pyx_k_block_end, sizeof(__pyx_k_block_end), 0, 0, 1, 1},
+  {&__pyx_n_s_block_of, __pyx_k_block_of, sizeof(__pyx_k_block_of), 0, 0, 1, 1},
+  {&__pyx_n_s_block_start, __pyx_k_block_start, sizeof(__pyx_k_block_start), 0, 0, 1, 1},
+  {&__pyx_n_s_blocks, __pyx_k_blocks, sizeof(__pyx_k_blocks), 0, 0, 1, 1},
   {&__pyx_n_s_bundler_extensions_FSM, __pyx_k_bundler_extensions_FSM, sizeof(__pyx_k_bundler_extensions_FSM), 0, 0, 1, 1},
+  {&__pyx_kp_s_bundler_extensions_FSM_pyx, __pyx_k_bundler_extensions_FSM_pyx, sizeof(__pyx_k_bundler_extensions_FSM_pyx), 0, 0, 1, 0},
+  {&__pyx_n_s_child, __pyx_k_child, sizeof(__pyx_k_child), 0, 0, 1, 1},
   {&__pyx_n_s_class, __pyx_k_class, sizeof(__pyx_k_class), 0, 0, 1, 1},
   {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
   {&__pyx_n_s_close, __pyx_k_close, sizeof(__pyx_k_close), 0, 0, 1, 1},
   {&__pyx_n_s_collections, __pyx_k_collections, sizeof(__pyx_k_collections), 0, 0, 1, 1},
-  {&__pyx_n_s_defaultdict, __pyx_k_defaultdict, sizeof(__pyx_k_defaultdict), 0, 0, 1, 1},
+  {&__pyx_n_s_default, __pyx_k_default, sizeof(__pyx_k_default), 0, 0, 1, 1},
   {&__pyx_n_s_depth, __pyx_k_depth, sizeof(__pyx_k_depth), 0, 0, 1, 1},
-  {&__pyx_n_s_empty, __pyx_k_empty, sizeof(__pyx_k_empty), 0, 0, 1, 1},
+  {&__pyx_n_s_dict, __pyx_k_dict, sizeof(__pyx_k_dict), 0, 0, 1, 1},
+  {&__pyx_n_s_distance_to_yield, __pyx_k_distance_to_yield, sizeof(__pyx_k_distance_to_yield), 0, 0, 1, 1},
+  {&__pyx_n_s_dtype, __pyx_k_dtype, sizeof(__pyx_k_dtype), 0, 0, 1, 1},
+  {&__pyx_n_s_elements, __pyx_k_elements, sizeof(__pyx_k_elements), 0, 0, 1, 1},
   {&__pyx_n_s_enumerate, __pyx_k_enumerate, sizeof(__pyx_k_enumerate), 0, 0, 1, 1},
+  {&__pyx_n_s_fail, __pyx_k_fail, sizeof(__pyx_k_fail), 0, 0, 1, 1},
+  {&__pyx_n_s_find_distance_to_yield, __pyx_k_find_distance_to_yield, sizeof(__pyx_k_find_distance_to_yield), 0, 0, 1, 1},
+  {&__pyx_n_s_find_distance_to_yield_locals_ge, __pyx_k_find_distance_to_yield_locals_ge, sizeof(__pyx_k_find_distance_to_yield_locals_ge), 0, 0, 1, 1},
+  {&__pyx_n_s_flat, __pyx_k_flat, sizeof(__pyx_k_flat), 0, 0, 1, 1},
   {&__pyx_n_s_format, __pyx_k_format, sizeof(__pyx_k_format), 0, 0, 1, 1},
   {&__pyx_n_s_from_dicts, __pyx_k_from_dicts, sizeof(__pyx_k_from_dicts), 0, 0, 1, 1},
   {&__pyx_n_s_from_dicts_locals_genexpr, __pyx_k_from_dicts_locals_genexpr, sizeof(__pyx_k_from_dicts_locals_genexpr), 0, 0, 1, 1},
+  {&__pyx_n_s_full, __pyx_k_full, sizeof(__pyx_k_full), 0, 0, 1, 1},
   {&__pyx_n_s_genexpr, __pyx_k_genexpr, sizeof(__pyx_k_genexpr), 0, 0, 1, 1},
   {&__pyx_n_s_get, __pyx_k_get, sizeof(__pyx_k_get), 0, 0, 1, 1},
+  {&__pyx_n_s_getstate, __pyx_k_getstate, sizeof(__pyx_k_getstate), 0, 0, 1, 1},
+  {&__pyx_n_u_h, __pyx_k_h, sizeof(__pyx_k_h), 0, 1, 0, 1},
+  {&__pyx_n_s_head, __pyx_k_head, sizeof(__pyx_k_head), 0, 0, 1, 1},
   {&__pyx_n_s_hits, __pyx_k_hits, sizeof(__pyx_k_hits), 0, 0, 1, 1},
+  {&__pyx_n_s_i, __pyx_k_i, sizeof(__pyx_k_i), 0, 0, 1, 1},
   {&__pyx_n_u_i, __pyx_k_i, sizeof(__pyx_k_i), 0, 1, 0, 1},
   {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
+  {&__pyx_n_s_init___locals_genexpr, __pyx_k_init___locals_genexpr, sizeof(__pyx_k_init___locals_genexpr), 0, 0, 1, 1},
+  {&__pyx_n_s_intc, __pyx_k_intc, sizeof(__pyx_k_intc), 0, 0, 1, 1},
+  {&__pyx_n_s_intp, __pyx_k_intp, sizeof(__pyx_k_intp), 0, 0, 1, 1},
+  {&__pyx_n_s_itemsize, __pyx_k_itemsize, sizeof(__pyx_k_itemsize), 0, 0, 1, 1},
+  {&__pyx_n_s_j, __pyx_k_j, sizeof(__pyx_k_j), 0, 0, 1, 1},
+  {&__pyx_n_s_label_blocks, __pyx_k_label_blocks, sizeof(__pyx_k_label_blocks), 0, 0, 1, 1},
+  {&__pyx_n_s_labels, __pyx_k_labels, sizeof(__pyx_k_labels), 0, 0, 1, 1},
+  {&__pyx_n_s_last, __pyx_k_last, sizeof(__pyx_k_last), 0, 0, 1, 1},
+  {&__pyx_n_s_letter, __pyx_k_letter, sizeof(__pyx_k_letter), 0, 0, 1, 1},
+  {&__pyx_n_s_location, __pyx_k_location, sizeof(__pyx_k_location), 0, 0, 1, 1},
   {&__pyx_n_s_machine, __pyx_k_machine, sizeof(__pyx_k_machine), 0, 0, 1, 1},
   {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
+  {&__pyx_n_s_marked, __pyx_k_marked, sizeof(__pyx_k_marked), 0, 0, 1, 1},
+  {&__pyx_n_s_middle, __pyx_k_middle, sizeof(__pyx_k_middle), 0, 0, 1, 1},
+  {&__pyx_n_s_min, __pyx_k_min, sizeof(__pyx_k_min), 0, 0, 1, 1},
+  {&__pyx_n_s_minimise, __pyx_k_minimise, sizeof(__pyx_k_minimise), 0, 0, 1, 1},
+  {&__pyx_n_s_n, __pyx_k_n, sizeof(__pyx_k_n), 0, 0, 1, 1},
   {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
-  {&__pyx_n_s_put, __pyx_k_put, sizeof(__pyx_k_put), 0, 0, 1, 1},
+  {&__pyx_n_s_new, __pyx_k_new, sizeof(__pyx_k_new), 0, 0, 1, 1},
+  {&__pyx_n_s_new_block, __pyx_k_new_block, sizeof(__pyx_k_new_block), 0, 0, 1, 1},
+  {&__pyx_n_s_new_index, __pyx_k_new_index, sizeof(__pyx_k_new_index), 0, 0, 1, 1},
+  {&__pyx_n_s_new_machine, __pyx_k_new_machine, sizeof(__pyx_k_new_machine), 0, 0, 1, 1},
+  {&__pyx_n_s_np, __pyx_k_np, sizeof(__pyx_k_np), 0, 0, 1, 1},
+  {&__pyx_n_s_numpy, __pyx_k_numpy, sizeof(__pyx_k_numpy), 0, 0, 1, 1},
+  {&__pyx_n_s_order, __pyx_k_order, sizeof(__pyx_k_order), 0, 0, 1, 1},
+  {&__pyx_n_s_parent, __pyx_k_parent, sizeof(__pyx_k_parent), 0, 0, 1, 1},
+  {&__pyx_n_s_pickle, __pyx_k_pickle, sizeof(__pyx_k_pickle), 0, 0, 1, 1},
+  {&__pyx_n_s_preimage, __pyx_k_preimage, sizeof(__pyx_k_preimage), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_PickleError, __pyx_k_pyx_PickleError, sizeof(__pyx_k_pyx_PickleError), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_checksum, __pyx_k_pyx_checksum, sizeof(__pyx_k_pyx_checksum), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_result, __pyx_k_pyx_result, sizeof(__pyx_k_pyx_result), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_state, __pyx_k_pyx_state, sizeof(__pyx_k_pyx_state), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_type, __pyx_k_pyx_type, sizeof(__pyx_k_pyx_type), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_unpickle_StatePath, __pyx_k_pyx_unpickle_StatePath, sizeof(__pyx_k_pyx_unpickle_StatePath), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_unpickle_TransitionMap, __pyx_k_pyx_unpickle_TransitionMap, sizeof(__pyx_k_pyx_unpickle_TransitionMap), 0, 0, 1, 1},
   {&__pyx_n_s_pyx_vtable, __pyx_k_pyx_vtable, sizeof(__pyx_k_pyx_vtable), 0, 0, 1, 1},
-  {&__pyx_n_s_queue, __pyx_k_queue, sizeof(__pyx_k_queue), 0, 0, 1, 1},
   {&__pyx_n_s_range, __pyx_k_range, sizeof(__pyx_k_range), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce, __pyx_k_reduce, sizeof(__pyx_k_reduce), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce_cython, __pyx_k_reduce_cython, sizeof(__pyx_k_reduce_cython), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce_ex, __pyx_k_reduce_ex, sizeof(__pyx_k_reduce_ex), 0, 0, 1, 1},
+  {&__pyx_n_s_representatives, __pyx_k_representatives, sizeof(__pyx_k_representatives), 0, 0, 1, 1},
+  {&__pyx_n_s_reshape, __pyx_k_reshape, sizeof(__pyx_k_reshape), 0, 0, 1, 1},
+  {&__pyx_n_s_reverse_arrows, __pyx_k_reverse_arrows, sizeof(__pyx_k_reverse_arrows), 0, 0, 1, 1},
+  {&__pyx_n_s_reverse_starts, __pyx_k_reverse_starts, sizeof(__pyx_k_reverse_starts), 0, 0, 1, 1},
   {&__pyx_n_s_run, __pyx_k_run, sizeof(__pyx_k_run), 0, 0, 1, 1},
   {&__pyx_n_s_send, __pyx_k_send, sizeof(__pyx_k_send), 0, 0, 1, 1},
+  {&__pyx_n_s_setdefault, __pyx_k_setdefault, sizeof(__pyx_k_setdefault), 0, 0, 1, 1},
+  {&__pyx_n_s_setstate, __pyx_k_setstate, sizeof(__pyx_k_setstate), 0, 0, 1, 1},
+  {&__pyx_n_s_setstate_cython, __pyx_k_setstate_cython, sizeof(__pyx_k_setstate_cython), 0, 0, 1, 1},
+  {&__pyx_n_s_shape, __pyx_k_shape, sizeof(__pyx_k_shape), 0, 0, 1, 1},
+  {&__pyx_n_s_splitters, __pyx_k_splitters, sizeof(__pyx_k_splitters), 0, 0, 1, 1},
+  {&__pyx_n_s_start, __pyx_k_start, sizeof(__pyx_k_start), 0, 0, 1, 1},
   {&__pyx_n_s_state, __pyx_k_state, sizeof(__pyx_k_state), 0, 0, 1, 1},
+  {&__pyx_kp_s_stringsource, __pyx_k_stringsource, sizeof(__pyx_k_stringsource), 0, 0, 1, 0},
+  {&__pyx_n_s_target, __pyx_k_target, sizeof(__pyx_k_target), 0, 0, 1, 1},
+  {&__pyx_n_s_terminal, __pyx_k_terminal, sizeof(__pyx_k_terminal), 0, 0, 1, 1},
   {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
   {&__pyx_n_s_throw, __pyx_k_throw, sizeof(__pyx_k_throw), 0, 0, 1, 1},
+  {&__pyx_n_s_tile, __pyx_k_tile, sizeof(__pyx_k_tile), 0, 0, 1, 1},
+  {&__pyx_n_s_touched, __pyx_k_touched, sizeof(__pyx_k_touched), 0, 0, 1, 1},
+  {&__pyx_n_s_transitions, __pyx_k_transitions, sizeof(__pyx_k_transitions), 0, 0, 1, 1},
+  {&__pyx_n_s_update, __pyx_k_update, sizeof(__pyx_k_update), 0, 0, 1, 1},
+  {&__pyx_n_s_vstack, __pyx_k_vstack, sizeof(__pyx_k_vstack), 0, 0, 1, 1},
+  {&__pyx_n_s_waiting, __pyx_k_waiting, sizeof(__pyx_k_waiting), 0, 0, 1, 1},
   {&__pyx_n_s_word, __pyx_k_word, sizeof(__pyx_k_word), 0, 0, 1, 1},
+  {&__pyx_n_s_words, __pyx_k_words, sizeof(__pyx_k_words), 0, 0, 1, 1},
   {&__pyx_n_s_yield_states, __pyx_k_yield_states, sizeof(__pyx_k_yield_states), 0, 0, 1, 1},
   {0, 0, 0, 0, 0, 0, 0}
 };
 static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 31, __pyx_L1_error)
-  __pyx_builtin_enumerate = __Pyx_GetBuiltinName(__pyx_n_s_enumerate); if (!__pyx_builtin_enumerate) __PYX_ERR(0, 65, __pyx_L1_error)
-  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 78, __pyx_L1_error)
-  __pyx_builtin_MemoryError = __Pyx_GetBuiltinName(__pyx_n_s_MemoryError); if (!__pyx_builtin_MemoryError) __PYX_ERR(1, 109, __pyx_L1_error)
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 36, __pyx_L1_error)
+  __pyx_builtin_min = __Pyx_GetBuiltinName(__pyx_n_s_min); if (!__pyx_builtin_min) __PYX_ERR(0, 76, __pyx_L1_error)
+  __pyx_builtin_enumerate = __Pyx_GetBuiltinName(__pyx_n_s_enumerate); if (!__pyx_builtin_enumerate) __PYX_ERR(0, 134, __pyx_L1_error)
+  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 147, __pyx_L1_error)
+  __pyx_builtin_MemoryError = __Pyx_GetBuiltinName(__pyx_n_s_MemoryError); if (!__pyx_builtin_MemoryError) __PYX_ERR(2, 109, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -6996,15 +15894,100 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
 static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
+
+  /* "bundler/extensions/FSM.pyx":259
+ *         states = np.tile(starts, (words.shape[0], 1))
+ *         for i in range(words.shape[1]):
+ *             states = table[states, words[:, i, None]]             # <<<<<<<<<<<<<<
+ * 
+ *         return (states == starts).any(axis=1)
+ */
+  __pyx_slice_ = PySlice_New(Py_None, Py_None, Py_None); if (unlikely(!__pyx_slice_)) __PYX_ERR(0, 259, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_slice_);
+  __Pyx_GIVEREF(__pyx_slice_);
+
+  /* "bundler/extensions/FSM.pyx":440
+ *                 word.append(last[state])
+ *                 state = parent[state]
+ *             accepting_words[i] = tuple(word[::-1])             # <<<<<<<<<<<<<<
+ * 
+ *     return array.array('i', machine), accepting_words
+ */
+  __pyx_slice__2 = PySlice_New(Py_None, Py_None, __pyx_int_neg_1); if (unlikely(!__pyx_slice__2)) __PYX_ERR(0, 440, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_slice__2);
+  __Pyx_GIVEREF(__pyx_slice__2);
+
+  /* "(tree fragment)":4
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0x189366f, 0x709b8f0, 0x49815e4):             # <<<<<<<<<<<<<<
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x189366f, 0x709b8f0, 0x49815e4) = (hits, machine, states))" % __pyx_checksum)
+ */
+  __pyx_tuple__3 = PyTuple_Pack(3, __pyx_int_25769583, __pyx_int_118077680, __pyx_int_77075940); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__3);
+  __Pyx_GIVEREF(__pyx_tuple__3);
+  __pyx_tuple__4 = PyTuple_Pack(3, __pyx_int_84072958, __pyx_int_16663870, __pyx_int_20536404); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__4);
+  __Pyx_GIVEREF(__pyx_tuple__4);
+
+  /* "bundler/extensions/FSM.pyx":383
+ *         return [self.maps[i] for i in range(<int>self.maps.size() - self.width, self.maps.size())]
+ * 
+ * def aho_corasick(int alphabet_len, words):             # <<<<<<<<<<<<<<
+ *     ''' Return the transitions of the Aho-Corasick automaton that detects the given words, whose letters are in range(alphabet_len).
+ * 
+ */
+  __pyx_tuple__5 = PyTuple_Pack(16, __pyx_n_s_alphabet_len, __pyx_n_s_words, __pyx_n_s_machine, __pyx_n_s_parent, __pyx_n_s_last, __pyx_n_s_fail, __pyx_n_s_order, __pyx_n_s_terminal, __pyx_n_s_accepting, __pyx_n_s_state, __pyx_n_s_child, __pyx_n_s_letter, __pyx_n_s_i, __pyx_n_s_head, __pyx_n_s_word, __pyx_n_s_accepting_words); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(0, 383, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__5);
+  __Pyx_GIVEREF(__pyx_tuple__5);
+  __pyx_codeobj__6 = (PyObject*)__Pyx_PyCode_New(2, 0, 16, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__5, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_bundler_extensions_FSM_pyx, __pyx_n_s_aho_corasick, 383, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__6)) __PYX_ERR(0, 383, __pyx_L1_error)
+
+  /* "bundler/extensions/FSM.pyx":444
+ *     return array.array('i', machine), accepting_words
+ * 
+ * def minimise(int alphabet_len, machine, labels):             # <<<<<<<<<<<<<<
+ *     ''' Return the minimal machine equivalent to the given flat transition table, using Hopcroft's algorithm.
+ * 
+ */
+  __pyx_tuple__7 = PyTuple_Pack(34, __pyx_n_s_alphabet_len, __pyx_n_s_machine, __pyx_n_s_labels, __pyx_n_s_n, __pyx_n_s_N, __pyx_n_s_state, __pyx_n_s_target, __pyx_n_s_letter, __pyx_n_s_block, __pyx_n_s_new_block, __pyx_n_s_i, __pyx_n_s_j, __pyx_n_s_start, __pyx_n_s_middle, __pyx_n_s_blocks, __pyx_n_s_head, __pyx_n_s_transitions, __pyx_n_s_reverse_starts, __pyx_n_s_reverse_arrows, __pyx_n_s_elements, __pyx_n_s_location, __pyx_n_s_block_of, __pyx_n_s_block_start, __pyx_n_s_block_end, __pyx_n_s_marked, __pyx_n_s_splitters, __pyx_n_s_preimage, __pyx_n_s_touched, __pyx_n_s_new_machine, __pyx_n_s_new_index, __pyx_n_s_representatives, __pyx_n_s_waiting, __pyx_n_s_flat, __pyx_n_s_label_blocks); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(0, 444, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__7);
+  __Pyx_GIVEREF(__pyx_tuple__7);
+  __pyx_codeobj__8 = (PyObject*)__Pyx_PyCode_New(3, 0, 34, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__7, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_bundler_extensions_FSM_pyx, __pyx_n_s_minimise, 444, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__8)) __PYX_ERR(0, 444, __pyx_L1_error)
+
+  /* "(tree fragment)":1
+ * def __pyx_unpickle_StatePath(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+  __pyx_tuple__9 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__9);
+  __Pyx_GIVEREF(__pyx_tuple__9);
+  __pyx_codeobj__10 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__9, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_StatePath, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__10)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_tuple__11 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__11);
+  __Pyx_GIVEREF(__pyx_tuple__11);
+  __pyx_codeobj__12 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__11, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_TransitionMap, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__12)) __PYX_ERR(1, 1, __pyx_L1_error)
   __Pyx_RefNannyFinishContext();
   return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
 }
 
 static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
   __pyx_umethod_PyDict_Type_get.type = (PyObject*)&PyDict_Type;
+  __pyx_umethod_PyDict_Type_setdefault.type = (PyObject*)&PyDict_Type;
   if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_1 = PyInt_FromLong(1); if (unlikely(!__pyx_int_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_16663870 = PyInt_FromLong(16663870L); if (unlikely(!__pyx_int_16663870)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_20536404 = PyInt_FromLong(20536404L); if (unlikely(!__pyx_int_20536404)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_25769583 = PyInt_FromLong(25769583L); if (unlikely(!__pyx_int_25769583)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_77075940 = PyInt_FromLong(77075940L); if (unlikely(!__pyx_int_77075940)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_84072958 = PyInt_FromLong(84072958L); if (unlikely(!__pyx_int_84072958)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_118077680 = PyInt_FromLong(118077680L); if (unlikely(!__pyx_int_118077680)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_1073741824 = PyInt_FromLong(1073741824L); if (unlikely(!__pyx_int_1073741824)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_neg_1 = PyInt_FromLong(-1); if (unlikely(!__pyx_int_neg_1)) __PYX_ERR(0, 1, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
@@ -7053,25 +16036,61 @@ static int __Pyx_modinit_type_init_code(void) {
   __pyx_vtabptr_7bundler_10extensions_3FSM_FSM = &__pyx_vtable_7bundler_10extensions_3FSM_FSM;
   __pyx_vtable_7bundler_10extensions_3FSM_FSM.c_hit = (int (*)(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *, __pyx_t_7bundler_10extensions_3FSM_IWord &, struct __pyx_opt_args_7bundler_10extensions_3FSM_3FSM_c_hit *__pyx_optional_args))__pyx_f_7bundler_10extensions_3FSM_3FSM_c_hit;
   __pyx_vtable_7bundler_10extensions_3FSM_FSM.c_hits = (std::vector<std::pair<int,__pyx_t_7bundler_10extensions_3FSM_IWord> >  (*)(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *, __pyx_t_7bundler_10extensions_3FSM_IWord &, struct __pyx_opt_args_7bundler_10extensions_3FSM_3FSM_c_hits *__pyx_optional_args))__pyx_f_7bundler_10extensions_3FSM_3FSM_c_hits;
-  if (PyType_Ready(&__pyx_type_7bundler_10extensions_3FSM_FSM) < 0) __PYX_ERR(0, 17, __pyx_L1_error)
+  __pyx_vtable_7bundler_10extensions_3FSM_FSM.c_distance = (int (*)(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *, __pyx_t_7bundler_10extensions_3FSM_IWord &))__pyx_f_7bundler_10extensions_3FSM_3FSM_c_distance;
+  __pyx_vtable_7bundler_10extensions_3FSM_FSM.c_has_cycle = (int (*)(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *, __pyx_t_7bundler_10extensions_3FSM_IWord &, int))__pyx_f_7bundler_10extensions_3FSM_3FSM_c_has_cycle;
+  if (PyType_Ready(&__pyx_type_7bundler_10extensions_3FSM_FSM) < 0) __PYX_ERR(0, 51, __pyx_L1_error)
   #if PY_VERSION_HEX < 0x030800B1
   __pyx_type_7bundler_10extensions_3FSM_FSM.tp_print = 0;
   #endif
   if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_7bundler_10extensions_3FSM_FSM.tp_dictoffset && __pyx_type_7bundler_10extensions_3FSM_FSM.tp_getattro == PyObject_GenericGetAttr)) {
     __pyx_type_7bundler_10extensions_3FSM_FSM.tp_getattro = __Pyx_PyObject_GenericGetAttr;
   }
-  if (__Pyx_SetVtable(__pyx_type_7bundler_10extensions_3FSM_FSM.tp_dict, __pyx_vtabptr_7bundler_10extensions_3FSM_FSM) < 0) __PYX_ERR(0, 17, __pyx_L1_error)
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_FSM, (PyObject *)&__pyx_type_7bundler_10extensions_3FSM_FSM) < 0) __PYX_ERR(0, 17, __pyx_L1_error)
+  if (__Pyx_SetVtable(__pyx_type_7bundler_10extensions_3FSM_FSM.tp_dict, __pyx_vtabptr_7bundler_10extensions_3FSM_FSM) < 0) __PYX_ERR(0, 51, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_FSM, (PyObject *)&__pyx_type_7bundler_10extensions_3FSM_FSM) < 0) __PYX_ERR(0, 51, __pyx_L1_error)
   __pyx_ptype_7bundler_10extensions_3FSM_FSM = &__pyx_type_7bundler_10extensions_3FSM_FSM;
-  if (PyType_Ready(&__pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts) < 0) __PYX_ERR(0, 59, __pyx_L1_error)
+  __pyx_vtabptr_7bundler_10extensions_3FSM_StatePath = &__pyx_vtable_7bundler_10extensions_3FSM_StatePath;
+  __pyx_vtable_7bundler_10extensions_3FSM_StatePath.c_push = (void (*)(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *, int))__pyx_f_7bundler_10extensions_3FSM_9StatePath_c_push;
+  __pyx_vtable_7bundler_10extensions_3FSM_StatePath.c_truncate = (void (*)(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *, int))__pyx_f_7bundler_10extensions_3FSM_9StatePath_c_truncate;
+  __pyx_vtable_7bundler_10extensions_3FSM_StatePath.c_sync = (void (*)(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *, __pyx_t_7bundler_10extensions_3FSM_IWord &, int))__pyx_f_7bundler_10extensions_3FSM_9StatePath_c_sync;
+  __pyx_vtable_7bundler_10extensions_3FSM_StatePath.c_state = (int (*)(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *))__pyx_f_7bundler_10extensions_3FSM_9StatePath_c_state;
+  __pyx_vtable_7bundler_10extensions_3FSM_StatePath.c_hit = (int (*)(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *))__pyx_f_7bundler_10extensions_3FSM_9StatePath_c_hit;
+  __pyx_vtable_7bundler_10extensions_3FSM_StatePath.c_distance = (int (*)(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *))__pyx_f_7bundler_10extensions_3FSM_9StatePath_c_distance;
+  if (PyType_Ready(&__pyx_type_7bundler_10extensions_3FSM_StatePath) < 0) __PYX_ERR(0, 264, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_7bundler_10extensions_3FSM_StatePath.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_7bundler_10extensions_3FSM_StatePath.tp_dictoffset && __pyx_type_7bundler_10extensions_3FSM_StatePath.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_7bundler_10extensions_3FSM_StatePath.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  if (__Pyx_SetVtable(__pyx_type_7bundler_10extensions_3FSM_StatePath.tp_dict, __pyx_vtabptr_7bundler_10extensions_3FSM_StatePath) < 0) __PYX_ERR(0, 264, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_StatePath, (PyObject *)&__pyx_type_7bundler_10extensions_3FSM_StatePath) < 0) __PYX_ERR(0, 264, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_7bundler_10extensions_3FSM_StatePath) < 0) __PYX_ERR(0, 264, __pyx_L1_error)
+  __pyx_ptype_7bundler_10extensions_3FSM_StatePath = &__pyx_type_7bundler_10extensions_3FSM_StatePath;
+  __pyx_vtabptr_7bundler_10extensions_3FSM_TransitionMap = &__pyx_vtable_7bundler_10extensions_3FSM_TransitionMap;
+  __pyx_vtable_7bundler_10extensions_3FSM_TransitionMap.c_push = (void (*)(struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *, int))__pyx_f_7bundler_10extensions_3FSM_13TransitionMap_c_push;
+  __pyx_vtable_7bundler_10extensions_3FSM_TransitionMap.c_truncate = (void (*)(struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *, int))__pyx_f_7bundler_10extensions_3FSM_13TransitionMap_c_truncate;
+  __pyx_vtable_7bundler_10extensions_3FSM_TransitionMap.c_sync = (void (*)(struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *, __pyx_t_7bundler_10extensions_3FSM_IWord &, int))__pyx_f_7bundler_10extensions_3FSM_13TransitionMap_c_sync;
+  __pyx_vtable_7bundler_10extensions_3FSM_TransitionMap.c_has_fixed_point = (int (*)(struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *))__pyx_f_7bundler_10extensions_3FSM_13TransitionMap_c_has_fixed_point;
+  if (PyType_Ready(&__pyx_type_7bundler_10extensions_3FSM_TransitionMap) < 0) __PYX_ERR(0, 326, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_7bundler_10extensions_3FSM_TransitionMap.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_7bundler_10extensions_3FSM_TransitionMap.tp_dictoffset && __pyx_type_7bundler_10extensions_3FSM_TransitionMap.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_7bundler_10extensions_3FSM_TransitionMap.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  if (__Pyx_SetVtable(__pyx_type_7bundler_10extensions_3FSM_TransitionMap.tp_dict, __pyx_vtabptr_7bundler_10extensions_3FSM_TransitionMap) < 0) __PYX_ERR(0, 326, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_TransitionMap, (PyObject *)&__pyx_type_7bundler_10extensions_3FSM_TransitionMap) < 0) __PYX_ERR(0, 326, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_7bundler_10extensions_3FSM_TransitionMap) < 0) __PYX_ERR(0, 326, __pyx_L1_error)
+  __pyx_ptype_7bundler_10extensions_3FSM_TransitionMap = &__pyx_type_7bundler_10extensions_3FSM_TransitionMap;
+  if (PyType_Ready(&__pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct____init__) < 0) __PYX_ERR(0, 52, __pyx_L1_error)
   #if PY_VERSION_HEX < 0x030800B1
-  __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts.tp_print = 0;
+  __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct____init__.tp_print = 0;
   #endif
-  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts.tp_dictoffset && __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts.tp_getattro == PyObject_GenericGetAttr)) {
-    __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts.tp_getattro = __Pyx_PyObject_GenericGetAttrNoDict;
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct____init__.tp_dictoffset && __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct____init__.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct____init__.tp_getattro = __Pyx_PyObject_GenericGetAttrNoDict;
   }
-  __pyx_ptype_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts = &__pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct__from_dicts;
-  if (PyType_Ready(&__pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr) < 0) __PYX_ERR(0, 65, __pyx_L1_error)
+  __pyx_ptype_7bundler_10extensions_3FSM___pyx_scope_struct____init__ = &__pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct____init__;
+  if (PyType_Ready(&__pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr) < 0) __PYX_ERR(0, 76, __pyx_L1_error)
   #if PY_VERSION_HEX < 0x030800B1
   __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr.tp_print = 0;
   #endif
@@ -7079,22 +16098,54 @@ static int __Pyx_modinit_type_init_code(void) {
     __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr.tp_getattro = __Pyx_PyObject_GenericGetAttrNoDict;
   }
   __pyx_ptype_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr = &__pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_1_genexpr;
-  if (PyType_Ready(&__pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_2_genexpr) < 0) __PYX_ERR(0, 68, __pyx_L1_error)
+  if (PyType_Ready(&__pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield) < 0) __PYX_ERR(0, 86, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield.tp_dictoffset && __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield.tp_getattro = __Pyx_PyObject_GenericGetAttrNoDict;
+  }
+  __pyx_ptype_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield = &__pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_2_find_distance_to_yield;
+  if (PyType_Ready(&__pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_3_genexpr) < 0) __PYX_ERR(0, 125, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_3_genexpr.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_3_genexpr.tp_dictoffset && __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_3_genexpr.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_3_genexpr.tp_getattro = __Pyx_PyObject_GenericGetAttrNoDict;
+  }
+  __pyx_ptype_7bundler_10extensions_3FSM___pyx_scope_struct_3_genexpr = &__pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_3_genexpr;
+  if (PyType_Ready(&__pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts) < 0) __PYX_ERR(0, 128, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts.tp_dictoffset && __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts.tp_getattro = __Pyx_PyObject_GenericGetAttrNoDict;
+  }
+  __pyx_ptype_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts = &__pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_4_from_dicts;
+  if (PyType_Ready(&__pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_5_genexpr) < 0) __PYX_ERR(0, 134, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_5_genexpr.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_5_genexpr.tp_dictoffset && __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_5_genexpr.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_5_genexpr.tp_getattro = __Pyx_PyObject_GenericGetAttrNoDict;
+  }
+  __pyx_ptype_7bundler_10extensions_3FSM___pyx_scope_struct_5_genexpr = &__pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_5_genexpr;
+  if (PyType_Ready(&__pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_6_genexpr) < 0) __PYX_ERR(0, 137, __pyx_L1_error)
   #if PY_VERSION_HEX < 0x030800B1
-  __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_2_genexpr.tp_print = 0;
+  __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_6_genexpr.tp_print = 0;
   #endif
-  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_2_genexpr.tp_dictoffset && __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_2_genexpr.tp_getattro == PyObject_GenericGetAttr)) {
-    __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_2_genexpr.tp_getattro = __Pyx_PyObject_GenericGetAttrNoDict;
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_6_genexpr.tp_dictoffset && __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_6_genexpr.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_6_genexpr.tp_getattro = __Pyx_PyObject_GenericGetAttrNoDict;
   }
-  __pyx_ptype_7bundler_10extensions_3FSM___pyx_scope_struct_2_genexpr = &__pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_2_genexpr;
-  if (PyType_Ready(&__pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_3_hits) < 0) __PYX_ERR(0, 122, __pyx_L1_error)
+  __pyx_ptype_7bundler_10extensions_3FSM___pyx_scope_struct_6_genexpr = &__pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_6_genexpr;
+  if (PyType_Ready(&__pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_7_hits) < 0) __PYX_ERR(0, 211, __pyx_L1_error)
   #if PY_VERSION_HEX < 0x030800B1
-  __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_3_hits.tp_print = 0;
+  __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_7_hits.tp_print = 0;
   #endif
-  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_3_hits.tp_dictoffset && __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_3_hits.tp_getattro == PyObject_GenericGetAttr)) {
-    __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_3_hits.tp_getattro = __Pyx_PyObject_GenericGetAttrNoDict;
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_7_hits.tp_dictoffset && __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_7_hits.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_7_hits.tp_getattro = __Pyx_PyObject_GenericGetAttrNoDict;
   }
-  __pyx_ptype_7bundler_10extensions_3FSM___pyx_scope_struct_3_hits = &__pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_3_hits;
+  __pyx_ptype_7bundler_10extensions_3FSM___pyx_scope_struct_7_hits = &__pyx_type_7bundler_10extensions_3FSM___pyx_scope_struct_7_hits;
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -7133,11 +16184,11 @@ static int __Pyx_modinit_type_import_code(void) {
   __Pyx_ImportType_CheckSize_Warn);
    if (!__pyx_ptype_7cpython_7complex_complex) __PYX_ERR(5, 15, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyImport_ImportModule("array"); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 58, __pyx_L1_error)
+  __pyx_t_1 = PyImport_ImportModule("array"); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 58, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_ptype_7cpython_5array_array = __Pyx_ImportType(__pyx_t_1, "array", "array", sizeof(arrayobject), __PYX_GET_STRUCT_ALIGNMENT(arrayobject),
   __Pyx_ImportType_CheckSize_Warn);
-   if (!__pyx_ptype_7cpython_5array_array) __PYX_ERR(1, 58, __pyx_L1_error)
+   if (!__pyx_ptype_7cpython_5array_array) __PYX_ERR(2, 58, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_RefNannyFinishContext();
   return 0;
@@ -7379,85 +16430,124 @@ if (!__Pyx_RefNanny) {
   /* "bundler/extensions/FSM.pyx":14
  * from bundler.extensions.FSM cimport FSM
  * 
- * from collections import defaultdict, OrderedDict             # <<<<<<<<<<<<<<
- * from queue import Queue
+ * from collections import OrderedDict             # <<<<<<<<<<<<<<
  * 
+ * import numpy as np
  */
-  __pyx_t_1 = PyList_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 14, __pyx_L1_error)
+  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 14, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(__pyx_n_s_defaultdict);
-  __Pyx_GIVEREF(__pyx_n_s_defaultdict);
-  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_defaultdict);
   __Pyx_INCREF(__pyx_n_s_OrderedDict);
   __Pyx_GIVEREF(__pyx_n_s_OrderedDict);
-  PyList_SET_ITEM(__pyx_t_1, 1, __pyx_n_s_OrderedDict);
+  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_OrderedDict);
   __pyx_t_2 = __Pyx_Import(__pyx_n_s_collections, __pyx_t_1, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 14, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_defaultdict); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 14, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_defaultdict, __pyx_t_1) < 0) __PYX_ERR(0, 14, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_OrderedDict); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 14, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_OrderedDict, __pyx_t_1) < 0) __PYX_ERR(0, 14, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "bundler/extensions/FSM.pyx":15
+  /* "bundler/extensions/FSM.pyx":16
+ * from collections import OrderedDict
  * 
- * from collections import defaultdict, OrderedDict
- * from queue import Queue             # <<<<<<<<<<<<<<
+ * import numpy as np             # <<<<<<<<<<<<<<
  * 
- * cdef class FSM:
+ * UNREACHABLE = 2**30
  */
-  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 15, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_INCREF(__pyx_n_s_Queue);
-  __Pyx_GIVEREF(__pyx_n_s_Queue);
-  PyList_SET_ITEM(__pyx_t_2, 0, __pyx_n_s_Queue);
-  __pyx_t_1 = __Pyx_Import(__pyx_n_s_queue, __pyx_t_2, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 15, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_1, __pyx_n_s_Queue); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 15, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_Import(__pyx_n_s_numpy, 0, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 16, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Queue, __pyx_t_2) < 0) __PYX_ERR(0, 15, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_np, __pyx_t_2) < 0) __PYX_ERR(0, 16, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "bundler/extensions/FSM.pyx":59
+  /* "bundler/extensions/FSM.pyx":18
+ * import numpy as np
+ * 
+ * UNREACHABLE = 2**30             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline int step(FSM machine, int state, int letter):
+ */
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_UNREACHABLE, __pyx_int_1073741824) < 0) __PYX_ERR(0, 18, __pyx_L1_error)
+
+  /* "bundler/extensions/FSM.pyx":128
  * 
  *     @classmethod
  *     def from_dicts(cls, list alphabet, object machine, dict hits):             # <<<<<<<<<<<<<<
  *         ''' Build a cFSM from an ordered dictionary of dictionaries and a dictionary mapping states to hits. '''
  * 
  */
-  __Pyx_GetNameInClass(__pyx_t_1, (PyObject *)__pyx_ptype_7bundler_10extensions_3FSM_FSM, __pyx_n_s_from_dicts); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 59, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_GetNameInClass(__pyx_t_2, (PyObject *)__pyx_ptype_7bundler_10extensions_3FSM_FSM, __pyx_n_s_from_dicts); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 128, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
 
-  /* "bundler/extensions/FSM.pyx":58
- *                     to_check.put(adjacent)
+  /* "bundler/extensions/FSM.pyx":127
+ *         return dict((state, distances[state]) for state in range(self.machine_len) if distances[state] >= 0)
  * 
  *     @classmethod             # <<<<<<<<<<<<<<
  *     def from_dicts(cls, list alphabet, object machine, dict hits):
  *         ''' Build a cFSM from an ordered dictionary of dictionaries and a dictionary mapping states to hits. '''
  */
-  __pyx_t_2 = __Pyx_Method_ClassMethod(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 58, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (PyDict_SetItem((PyObject *)__pyx_ptype_7bundler_10extensions_3FSM_FSM->tp_dict, __pyx_n_s_from_dicts, __pyx_t_2) < 0) __PYX_ERR(0, 59, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_Method_ClassMethod(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 127, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (PyDict_SetItem((PyObject *)__pyx_ptype_7bundler_10extensions_3FSM_FSM->tp_dict, __pyx_n_s_from_dicts, __pyx_t_1) < 0) __PYX_ERR(0, 128, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   PyType_Modified(__pyx_ptype_7bundler_10extensions_3FSM_FSM);
 
+  /* "bundler/extensions/FSM.pyx":383
+ *         return [self.maps[i] for i in range(<int>self.maps.size() - self.width, self.maps.size())]
+ * 
+ * def aho_corasick(int alphabet_len, words):             # <<<<<<<<<<<<<<
+ *     ''' Return the transitions of the Aho-Corasick automaton that detects the given words, whose letters are in range(alphabet_len).
+ * 
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_7bundler_10extensions_3FSM_1aho_corasick, NULL, __pyx_n_s_bundler_extensions_FSM); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 383, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_aho_corasick, __pyx_t_1) < 0) __PYX_ERR(0, 383, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "bundler/extensions/FSM.pyx":444
+ *     return array.array('i', machine), accepting_words
+ * 
+ * def minimise(int alphabet_len, machine, labels):             # <<<<<<<<<<<<<<
+ *     ''' Return the minimal machine equivalent to the given flat transition table, using Hopcroft's algorithm.
+ * 
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_7bundler_10extensions_3FSM_3minimise, NULL, __pyx_n_s_bundler_extensions_FSM); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 444, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_minimise, __pyx_t_1) < 0) __PYX_ERR(0, 444, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "(tree fragment)":1
+ * def __pyx_unpickle_StatePath(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_7bundler_10extensions_3FSM_5__pyx_unpickle_StatePath, NULL, __pyx_n_s_bundler_extensions_FSM); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pyx_unpickle_StatePath, __pyx_t_1) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "(tree fragment)":11
+ *         __pyx_unpickle_StatePath__set_state(<StatePath> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_StatePath__set_state(StatePath __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_result.hits = __pyx_state[0]; __pyx_result.machine = __pyx_state[1]; __pyx_result.states = __pyx_state[2]
+ *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_7bundler_10extensions_3FSM_7__pyx_unpickle_TransitionMap, NULL, __pyx_n_s_bundler_extensions_FSM); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pyx_unpickle_TransitionMap, __pyx_t_1) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
   /* "bundler/extensions/FSM.pyx":1
  * # distutils: language = c++             # <<<<<<<<<<<<<<
  * 
  * from cpython cimport array
  */
-  __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_2) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_1) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
   /* "vector.from_py":45
  * 
@@ -7538,6 +16628,70 @@ static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
     return result;
 }
 
+/* PyErrFetchRestore */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    tmp_type = tstate->curexc_type;
+    tmp_value = tstate->curexc_value;
+    tmp_tb = tstate->curexc_traceback;
+    tstate->curexc_type = type;
+    tstate->curexc_value = value;
+    tstate->curexc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    *type = tstate->curexc_type;
+    *value = tstate->curexc_value;
+    *tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+}
+#endif
+
+/* WriteUnraisableException */
+static void __Pyx_WriteUnraisable(const char *name, CYTHON_UNUSED int clineno,
+                                  CYTHON_UNUSED int lineno, CYTHON_UNUSED const char *filename,
+                                  int full_traceback, CYTHON_UNUSED int nogil) {
+    PyObject *old_exc, *old_val, *old_tb;
+    PyObject *ctx;
+    __Pyx_PyThreadState_declare
+#ifdef WITH_THREAD
+    PyGILState_STATE state;
+    if (nogil)
+        state = PyGILState_Ensure();
+    else state = (PyGILState_STATE)0;
+#endif
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&old_exc, &old_val, &old_tb);
+    if (full_traceback) {
+        Py_XINCREF(old_exc);
+        Py_XINCREF(old_val);
+        Py_XINCREF(old_tb);
+        __Pyx_ErrRestore(old_exc, old_val, old_tb);
+        PyErr_PrintEx(1);
+    }
+    #if PY_MAJOR_VERSION < 3
+    ctx = PyString_FromString(name);
+    #else
+    ctx = PyUnicode_FromString(name);
+    #endif
+    __Pyx_ErrRestore(old_exc, old_val, old_tb);
+    if (!ctx) {
+        PyErr_WriteUnraisable(Py_None);
+    } else {
+        PyErr_WriteUnraisable(ctx);
+        Py_DECREF(ctx);
+    }
+#ifdef WITH_THREAD
+    if (nogil)
+        PyGILState_Release(state);
+#endif
+}
+
 /* RaiseArgTupleInvalid */
 static void __Pyx_RaiseArgtupleInvalid(
     const char* func_name,
@@ -7700,14 +16854,6 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg
 }
 #endif
 
-/* DivInt[Py_ssize_t] */
-static CYTHON_INLINE Py_ssize_t __Pyx_div_Py_ssize_t(Py_ssize_t a, Py_ssize_t b) {
-    Py_ssize_t q = a / b;
-    Py_ssize_t r = a - q*b;
-    q -= ((r != 0) & ((r ^ b) < 0));
-    return q;
-}
-
 /* UnpackUnboundCMethod */
 static int __Pyx_TryUnpackUnboundCMethod(__Pyx_CachedCFunction* target) {
     PyObject *method;
@@ -7857,13 +17003,87 @@ static PyObject* __Pyx_PyDict_GetItemDefault(PyObject* d, PyObject* key, PyObjec
         Py_INCREF(value);
     }
 #endif
-    else {
-        if (default_value == Py_None)
-            value = __Pyx_CallUnboundCMethod1(&__pyx_umethod_PyDict_Type_get, d, key);
-        else
-            value = __Pyx_CallUnboundCMethod2(&__pyx_umethod_PyDict_Type_get, d, key, default_value);
+    else {
+        if (default_value == Py_None)
+            value = __Pyx_CallUnboundCMethod1(&__pyx_umethod_PyDict_Type_get, d, key);
+        else
+            value = __Pyx_CallUnboundCMethod2(&__pyx_umethod_PyDict_Type_get, d, key, default_value);
+    }
+    return value;
+}
+
+/* None */
+static CYTHON_INLINE void __Pyx_RaiseClosureNameError(const char *varname) {
+    PyErr_Format(PyExc_NameError, "free variable '%s' referenced before assignment in enclosing scope", varname);
+}
+
+/* DivInt[Py_ssize_t] */
+static CYTHON_INLINE Py_ssize_t __Pyx_div_Py_ssize_t(Py_ssize_t a, Py_ssize_t b) {
+    Py_ssize_t q = a / b;
+    Py_ssize_t r = a - q*b;
+    q -= ((r != 0) & ((r ^ b) < 0));
+    return q;
+}
+
+/* PyDictVersioning */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
+    PyObject **dictptr = NULL;
+    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
+    if (offset) {
+#if CYTHON_COMPILING_IN_CPYTHON
+        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
+#else
+        dictptr = _PyObject_GetDictPtr(obj);
+#endif
+    }
+    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
+}
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
+        return 0;
+    return obj_dict_version == __Pyx_get_object_dict_version(obj);
+}
+#endif
+
+/* GetModuleGlobalName */
+#if CYTHON_USE_DICT_VERSIONS
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
+#else
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
+#endif
+{
+    PyObject *result;
+#if !CYTHON_AVOID_BORROWED_REFS
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1
+    result = _PyDict_GetItem_KnownHash(__pyx_d, name, ((PyASCIIObject *) name)->hash);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    } else if (unlikely(PyErr_Occurred())) {
+        return NULL;
+    }
+#else
+    result = PyDict_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+#endif
+#else
+    result = PyObject_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
     }
-    return value;
+    PyErr_Clear();
+#endif
+    return __Pyx_GetBuiltinName(name);
 }
 
 /* PyCFunctionFastCall */
@@ -7971,433 +17191,100 @@ static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args,
             Py_INCREF(k[i+1]);
             i += 2;
         }
-        nk = i / 2;
-    }
-    else {
-        kwtuple = NULL;
-        k = NULL;
-    }
-    closure = PyFunction_GET_CLOSURE(func);
-#if PY_MAJOR_VERSION >= 3
-    kwdefs = PyFunction_GET_KW_DEFAULTS(func);
-#endif
-    if (argdefs != NULL) {
-        d = &PyTuple_GET_ITEM(argdefs, 0);
-        nd = Py_SIZE(argdefs);
-    }
-    else {
-        d = NULL;
-        nd = 0;
-    }
-#if PY_MAJOR_VERSION >= 3
-    result = PyEval_EvalCodeEx((PyObject*)co, globals, (PyObject *)NULL,
-                               args, (int)nargs,
-                               k, (int)nk,
-                               d, (int)nd, kwdefs, closure);
-#else
-    result = PyEval_EvalCodeEx(co, globals, (PyObject *)NULL,
-                               args, (int)nargs,
-                               k, (int)nk,
-                               d, (int)nd, closure);
-#endif
-    Py_XDECREF(kwtuple);
-done:
-    Py_LeaveRecursiveCall();
-    return result;
-}
-#endif
-#endif
-
-/* PyObjectCallMethO */
-#if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
-    PyObject *self, *result;
-    PyCFunction cfunc;
-    cfunc = PyCFunction_GET_FUNCTION(func);
-    self = PyCFunction_GET_SELF(func);
-    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
-        return NULL;
-    result = cfunc(self, arg);
-    Py_LeaveRecursiveCall();
-    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
-        PyErr_SetString(
-            PyExc_SystemError,
-            "NULL result without error in PyObject_Call");
-    }
-    return result;
-}
-#endif
-
-/* PyObjectCallOneArg */
-#if CYTHON_COMPILING_IN_CPYTHON
-static PyObject* __Pyx__PyObject_CallOneArg(PyObject *func, PyObject *arg) {
-    PyObject *result;
-    PyObject *args = PyTuple_New(1);
-    if (unlikely(!args)) return NULL;
-    Py_INCREF(arg);
-    PyTuple_SET_ITEM(args, 0, arg);
-    result = __Pyx_PyObject_Call(func, args, NULL);
-    Py_DECREF(args);
-    return result;
-}
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
-#if CYTHON_FAST_PYCALL
-    if (PyFunction_Check(func)) {
-        return __Pyx_PyFunction_FastCall(func, &arg, 1);
-    }
-#endif
-    if (likely(PyCFunction_Check(func))) {
-        if (likely(PyCFunction_GET_FLAGS(func) & METH_O)) {
-            return __Pyx_PyObject_CallMethO(func, arg);
-#if CYTHON_FAST_PYCCALL
-        } else if (__Pyx_PyFastCFunction_Check(func)) {
-            return __Pyx_PyCFunction_FastCall(func, &arg, 1);
-#endif
-        }
-    }
-    return __Pyx__PyObject_CallOneArg(func, arg);
-}
-#else
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
-    PyObject *result;
-    PyObject *args = PyTuple_Pack(1, arg);
-    if (unlikely(!args)) return NULL;
-    result = __Pyx_PyObject_Call(func, args, NULL);
-    Py_DECREF(args);
-    return result;
-}
-#endif
-
-/* PyDictVersioning */
-#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
-static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
-    PyObject *dict = Py_TYPE(obj)->tp_dict;
-    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
-}
-static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
-    PyObject **dictptr = NULL;
-    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
-    if (offset) {
-#if CYTHON_COMPILING_IN_CPYTHON
-        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
-#else
-        dictptr = _PyObject_GetDictPtr(obj);
-#endif
-    }
-    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
-}
-static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
-    PyObject *dict = Py_TYPE(obj)->tp_dict;
-    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
-        return 0;
-    return obj_dict_version == __Pyx_get_object_dict_version(obj);
-}
-#endif
-
-/* GetModuleGlobalName */
-#if CYTHON_USE_DICT_VERSIONS
-static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
-#else
-static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
-#endif
-{
-    PyObject *result;
-#if !CYTHON_AVOID_BORROWED_REFS
-#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1
-    result = _PyDict_GetItem_KnownHash(__pyx_d, name, ((PyASCIIObject *) name)->hash);
-    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
-    if (likely(result)) {
-        return __Pyx_NewRef(result);
-    } else if (unlikely(PyErr_Occurred())) {
-        return NULL;
-    }
-#else
-    result = PyDict_GetItem(__pyx_d, name);
-    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
-    if (likely(result)) {
-        return __Pyx_NewRef(result);
-    }
-#endif
-#else
-    result = PyObject_GetItem(__pyx_d, name);
-    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
-    if (likely(result)) {
-        return __Pyx_NewRef(result);
-    }
-    PyErr_Clear();
-#endif
-    return __Pyx_GetBuiltinName(name);
-}
-
-/* PyObjectCall2Args */
-static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2) {
-    PyObject *args, *result = NULL;
-    #if CYTHON_FAST_PYCALL
-    if (PyFunction_Check(function)) {
-        PyObject *args[2] = {arg1, arg2};
-        return __Pyx_PyFunction_FastCall(function, args, 2);
-    }
-    #endif
-    #if CYTHON_FAST_PYCCALL
-    if (__Pyx_PyFastCFunction_Check(function)) {
-        PyObject *args[2] = {arg1, arg2};
-        return __Pyx_PyCFunction_FastCall(function, args, 2);
-    }
-    #endif
-    args = PyTuple_New(2);
-    if (unlikely(!args)) goto done;
-    Py_INCREF(arg1);
-    PyTuple_SET_ITEM(args, 0, arg1);
-    Py_INCREF(arg2);
-    PyTuple_SET_ITEM(args, 1, arg2);
-    Py_INCREF(function);
-    result = __Pyx_PyObject_Call(function, args, NULL);
-    Py_DECREF(args);
-    Py_DECREF(function);
-done:
-    return result;
-}
-
-/* PyObjectGetMethod */
-static int __Pyx_PyObject_GetMethod(PyObject *obj, PyObject *name, PyObject **method) {
-    PyObject *attr;
-#if CYTHON_UNPACK_METHODS && CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_PYTYPE_LOOKUP
-    PyTypeObject *tp = Py_TYPE(obj);
-    PyObject *descr;
-    descrgetfunc f = NULL;
-    PyObject **dictptr, *dict;
-    int meth_found = 0;
-    assert (*method == NULL);
-    if (unlikely(tp->tp_getattro != PyObject_GenericGetAttr)) {
-        attr = __Pyx_PyObject_GetAttrStr(obj, name);
-        goto try_unpack;
-    }
-    if (unlikely(tp->tp_dict == NULL) && unlikely(PyType_Ready(tp) < 0)) {
-        return 0;
-    }
-    descr = _PyType_Lookup(tp, name);
-    if (likely(descr != NULL)) {
-        Py_INCREF(descr);
-#if PY_MAJOR_VERSION >= 3
-        #ifdef __Pyx_CyFunction_USED
-        if (likely(PyFunction_Check(descr) || (Py_TYPE(descr) == &PyMethodDescr_Type) || __Pyx_CyFunction_Check(descr)))
-        #else
-        if (likely(PyFunction_Check(descr) || (Py_TYPE(descr) == &PyMethodDescr_Type)))
-        #endif
-#else
-        #ifdef __Pyx_CyFunction_USED
-        if (likely(PyFunction_Check(descr) || __Pyx_CyFunction_Check(descr)))
-        #else
-        if (likely(PyFunction_Check(descr)))
-        #endif
-#endif
-        {
-            meth_found = 1;
-        } else {
-            f = Py_TYPE(descr)->tp_descr_get;
-            if (f != NULL && PyDescr_IsData(descr)) {
-                attr = f(descr, obj, (PyObject *)Py_TYPE(obj));
-                Py_DECREF(descr);
-                goto try_unpack;
-            }
-        }
-    }
-    dictptr = _PyObject_GetDictPtr(obj);
-    if (dictptr != NULL && (dict = *dictptr) != NULL) {
-        Py_INCREF(dict);
-        attr = __Pyx_PyDict_GetItemStr(dict, name);
-        if (attr != NULL) {
-            Py_INCREF(attr);
-            Py_DECREF(dict);
-            Py_XDECREF(descr);
-            goto try_unpack;
-        }
-        Py_DECREF(dict);
+        nk = i / 2;
     }
-    if (meth_found) {
-        *method = descr;
-        return 1;
+    else {
+        kwtuple = NULL;
+        k = NULL;
     }
-    if (f != NULL) {
-        attr = f(descr, obj, (PyObject *)Py_TYPE(obj));
-        Py_DECREF(descr);
-        goto try_unpack;
+    closure = PyFunction_GET_CLOSURE(func);
+#if PY_MAJOR_VERSION >= 3
+    kwdefs = PyFunction_GET_KW_DEFAULTS(func);
+#endif
+    if (argdefs != NULL) {
+        d = &PyTuple_GET_ITEM(argdefs, 0);
+        nd = Py_SIZE(argdefs);
     }
-    if (descr != NULL) {
-        *method = descr;
-        return 0;
+    else {
+        d = NULL;
+        nd = 0;
     }
-    PyErr_Format(PyExc_AttributeError,
 #if PY_MAJOR_VERSION >= 3
-                 "'%.50s' object has no attribute '%U'",
-                 tp->tp_name, name);
-#else
-                 "'%.50s' object has no attribute '%.400s'",
-                 tp->tp_name, PyString_AS_STRING(name));
-#endif
-    return 0;
+    result = PyEval_EvalCodeEx((PyObject*)co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, kwdefs, closure);
 #else
-    attr = __Pyx_PyObject_GetAttrStr(obj, name);
-    goto try_unpack;
-#endif
-try_unpack:
-#if CYTHON_UNPACK_METHODS
-    if (likely(attr) && PyMethod_Check(attr) && likely(PyMethod_GET_SELF(attr) == obj)) {
-        PyObject *function = PyMethod_GET_FUNCTION(attr);
-        Py_INCREF(function);
-        Py_DECREF(attr);
-        *method = function;
-        return 1;
-    }
+    result = PyEval_EvalCodeEx(co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, closure);
 #endif
-    *method = attr;
-    return 0;
-}
-
-/* PyObjectCallMethod1 */
-static PyObject* __Pyx__PyObject_CallMethod1(PyObject* method, PyObject* arg) {
-    PyObject *result = __Pyx_PyObject_CallOneArg(method, arg);
-    Py_DECREF(method);
+    Py_XDECREF(kwtuple);
+done:
+    Py_LeaveRecursiveCall();
     return result;
 }
-static PyObject* __Pyx_PyObject_CallMethod1(PyObject* obj, PyObject* method_name, PyObject* arg) {
-    PyObject *method = NULL, *result;
-    int is_method = __Pyx_PyObject_GetMethod(obj, method_name, &method);
-    if (likely(is_method)) {
-        result = __Pyx_PyObject_Call2Args(method, obj, arg);
-        Py_DECREF(method);
-        return result;
-    }
-    if (unlikely(!method)) return NULL;
-    return __Pyx__PyObject_CallMethod1(method, arg);
-}
+#endif
+#endif
 
-/* append */
-static CYTHON_INLINE int __Pyx_PyObject_Append(PyObject* L, PyObject* x) {
-    if (likely(PyList_CheckExact(L))) {
-        if (unlikely(__Pyx_PyList_Append(L, x) < 0)) return -1;
-    } else {
-        PyObject* retval = __Pyx_PyObject_CallMethod1(L, __pyx_n_s_append, x);
-        if (unlikely(!retval))
-            return -1;
-        Py_DECREF(retval);
+/* PyObjectCallMethO */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
+    PyObject *self, *result;
+    PyCFunction cfunc;
+    cfunc = PyCFunction_GET_FUNCTION(func);
+    self = PyCFunction_GET_SELF(func);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = cfunc(self, arg);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
     }
-    return 0;
+    return result;
 }
+#endif
 
-/* GetItemInt */
-static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
-    PyObject *r;
-    if (!j) return NULL;
-    r = PyObject_GetItem(o, j);
-    Py_DECREF(j);
-    return r;
+/* PyObjectCallOneArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static PyObject* __Pyx__PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_New(1);
+    if (unlikely(!args)) return NULL;
+    Py_INCREF(arg);
+    PyTuple_SET_ITEM(args, 0, arg);
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
 }
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
-                                                              CYTHON_NCP_UNUSED int wraparound,
-                                                              CYTHON_NCP_UNUSED int boundscheck) {
-#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-    Py_ssize_t wrapped_i = i;
-    if (wraparound & unlikely(i < 0)) {
-        wrapped_i += PyList_GET_SIZE(o);
-    }
-    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyList_GET_SIZE(o)))) {
-        PyObject *r = PyList_GET_ITEM(o, wrapped_i);
-        Py_INCREF(r);
-        return r;
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, &arg, 1);
     }
-    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
-#else
-    return PySequence_GetItem(o, i);
 #endif
-}
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
-                                                              CYTHON_NCP_UNUSED int wraparound,
-                                                              CYTHON_NCP_UNUSED int boundscheck) {
-#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-    Py_ssize_t wrapped_i = i;
-    if (wraparound & unlikely(i < 0)) {
-        wrapped_i += PyTuple_GET_SIZE(o);
-    }
-    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyTuple_GET_SIZE(o)))) {
-        PyObject *r = PyTuple_GET_ITEM(o, wrapped_i);
-        Py_INCREF(r);
-        return r;
-    }
-    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
-#else
-    return PySequence_GetItem(o, i);
+    if (likely(PyCFunction_Check(func))) {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_O)) {
+            return __Pyx_PyObject_CallMethO(func, arg);
+#if CYTHON_FAST_PYCCALL
+        } else if (__Pyx_PyFastCFunction_Check(func)) {
+            return __Pyx_PyCFunction_FastCall(func, &arg, 1);
 #endif
-}
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i, int is_list,
-                                                     CYTHON_NCP_UNUSED int wraparound,
-                                                     CYTHON_NCP_UNUSED int boundscheck) {
-#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS && CYTHON_USE_TYPE_SLOTS
-    if (is_list || PyList_CheckExact(o)) {
-        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyList_GET_SIZE(o);
-        if ((!boundscheck) || (likely(__Pyx_is_valid_index(n, PyList_GET_SIZE(o))))) {
-            PyObject *r = PyList_GET_ITEM(o, n);
-            Py_INCREF(r);
-            return r;
-        }
-    }
-    else if (PyTuple_CheckExact(o)) {
-        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyTuple_GET_SIZE(o);
-        if ((!boundscheck) || likely(__Pyx_is_valid_index(n, PyTuple_GET_SIZE(o)))) {
-            PyObject *r = PyTuple_GET_ITEM(o, n);
-            Py_INCREF(r);
-            return r;
-        }
-    } else {
-        PySequenceMethods *m = Py_TYPE(o)->tp_as_sequence;
-        if (likely(m && m->sq_item)) {
-            if (wraparound && unlikely(i < 0) && likely(m->sq_length)) {
-                Py_ssize_t l = m->sq_length(o);
-                if (likely(l >= 0)) {
-                    i += l;
-                } else {
-                    if (!PyErr_ExceptionMatches(PyExc_OverflowError))
-                        return NULL;
-                    PyErr_Clear();
-                }
-            }
-            return m->sq_item(o, i);
         }
     }
-#else
-    if (is_list || PySequence_Check(o)) {
-        return PySequence_GetItem(o, i);
-    }
-#endif
-    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
-}
-
-/* ObjectGetItem */
-#if CYTHON_USE_TYPE_SLOTS
-static PyObject *__Pyx_PyObject_GetIndex(PyObject *obj, PyObject* index) {
-    PyObject *runerr = NULL;
-    Py_ssize_t key_value;
-    PySequenceMethods *m = Py_TYPE(obj)->tp_as_sequence;
-    if (unlikely(!(m && m->sq_item))) {
-        PyErr_Format(PyExc_TypeError, "'%.200s' object is not subscriptable", Py_TYPE(obj)->tp_name);
-        return NULL;
-    }
-    key_value = __Pyx_PyIndex_AsSsize_t(index);
-    if (likely(key_value != -1 || !(runerr = PyErr_Occurred()))) {
-        return __Pyx_GetItemInt_Fast(obj, key_value, 0, 1, 1);
-    }
-    if (PyErr_GivenExceptionMatches(runerr, PyExc_OverflowError)) {
-        PyErr_Clear();
-        PyErr_Format(PyExc_IndexError, "cannot fit '%.200s' into an index-sized integer", Py_TYPE(index)->tp_name);
-    }
-    return NULL;
+    return __Pyx__PyObject_CallOneArg(func, arg);
 }
-static PyObject *__Pyx_PyObject_GetItem(PyObject *obj, PyObject* key) {
-    PyMappingMethods *m = Py_TYPE(obj)->tp_as_mapping;
-    if (likely(m && m->mp_subscript)) {
-        return m->mp_subscript(obj, key);
-    }
-    return __Pyx_PyObject_GetIndex(obj, key);
+#else
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_Pack(1, arg);
+    if (unlikely(!args)) return NULL;
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
 }
 #endif
 
@@ -8419,9 +17306,30 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
             return __Pyx_PyObject_CallMethO(func, NULL);
         }
     }
-    return __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL);
+    return __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL);
+}
+#endif
+
+/* ArgTypeTest */
+static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact)
+{
+    if (unlikely(!type)) {
+        PyErr_SetString(PyExc_SystemError, "Missing type object");
+        return 0;
+    }
+    else if (exact) {
+        #if PY_MAJOR_VERSION == 2
+        if ((type == &PyBaseString_Type) && likely(__Pyx_PyBaseString_CheckExact(obj))) return 1;
+        #endif
+    }
+    else {
+        if (likely(__Pyx_TypeCheck(obj, type))) return 1;
+    }
+    PyErr_Format(PyExc_TypeError,
+        "Argument '%.200s' has incorrect type (expected %.200s, got %.200s)",
+        name, type->tp_name, Py_TYPE(obj)->tp_name);
+    return 0;
 }
-#endif
 
 /* PyIntBinop */
 #if !CYTHON_COMPILING_IN_PYPY
@@ -8547,56 +17455,6 @@ static PyObject* __Pyx_PyInt_AddObjC(PyObject *op1, PyObject *op2, CYTHON_UNUSED
 }
 #endif
 
-/* DictGetItem */
-#if PY_MAJOR_VERSION >= 3 && !CYTHON_COMPILING_IN_PYPY
-static PyObject *__Pyx_PyDict_GetItem(PyObject *d, PyObject* key) {
-    PyObject *value;
-    value = PyDict_GetItemWithError(d, key);
-    if (unlikely(!value)) {
-        if (!PyErr_Occurred()) {
-            if (unlikely(PyTuple_Check(key))) {
-                PyObject* args = PyTuple_Pack(1, key);
-                if (likely(args)) {
-                    PyErr_SetObject(PyExc_KeyError, args);
-                    Py_DECREF(args);
-                }
-            } else {
-                PyErr_SetObject(PyExc_KeyError, key);
-            }
-        }
-        return NULL;
-    }
-    Py_INCREF(value);
-    return value;
-}
-#endif
-
-/* ArgTypeTest */
-static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact)
-{
-    if (unlikely(!type)) {
-        PyErr_SetString(PyExc_SystemError, "Missing type object");
-        return 0;
-    }
-    else if (exact) {
-        #if PY_MAJOR_VERSION == 2
-        if ((type == &PyBaseString_Type) && likely(__Pyx_PyBaseString_CheckExact(obj))) return 1;
-        #endif
-    }
-    else {
-        if (likely(__Pyx_TypeCheck(obj, type))) return 1;
-    }
-    PyErr_Format(PyExc_TypeError,
-        "Argument '%.200s' has incorrect type (expected %.200s, got %.200s)",
-        name, type->tp_name, Py_TYPE(obj)->tp_name);
-    return 0;
-}
-
-/* None */
-static CYTHON_INLINE void __Pyx_RaiseClosureNameError(const char *varname) {
-    PyErr_Format(PyExc_NameError, "free variable '%s' referenced before assignment in enclosing scope", varname);
-}
-
 /* IterFinish */
 static CYTHON_INLINE int __Pyx_IterFinish(void) {
 #if CYTHON_FAST_THREAD_STATE
@@ -8632,6 +17490,102 @@ static CYTHON_INLINE int __Pyx_IterFinish(void) {
 #endif
 }
 
+/* PyObjectGetMethod */
+static int __Pyx_PyObject_GetMethod(PyObject *obj, PyObject *name, PyObject **method) {
+    PyObject *attr;
+#if CYTHON_UNPACK_METHODS && CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_PYTYPE_LOOKUP
+    PyTypeObject *tp = Py_TYPE(obj);
+    PyObject *descr;
+    descrgetfunc f = NULL;
+    PyObject **dictptr, *dict;
+    int meth_found = 0;
+    assert (*method == NULL);
+    if (unlikely(tp->tp_getattro != PyObject_GenericGetAttr)) {
+        attr = __Pyx_PyObject_GetAttrStr(obj, name);
+        goto try_unpack;
+    }
+    if (unlikely(tp->tp_dict == NULL) && unlikely(PyType_Ready(tp) < 0)) {
+        return 0;
+    }
+    descr = _PyType_Lookup(tp, name);
+    if (likely(descr != NULL)) {
+        Py_INCREF(descr);
+#if PY_MAJOR_VERSION >= 3
+        #ifdef __Pyx_CyFunction_USED
+        if (likely(PyFunction_Check(descr) || (Py_TYPE(descr) == &PyMethodDescr_Type) || __Pyx_CyFunction_Check(descr)))
+        #else
+        if (likely(PyFunction_Check(descr) || (Py_TYPE(descr) == &PyMethodDescr_Type)))
+        #endif
+#else
+        #ifdef __Pyx_CyFunction_USED
+        if (likely(PyFunction_Check(descr) || __Pyx_CyFunction_Check(descr)))
+        #else
+        if (likely(PyFunction_Check(descr)))
+        #endif
+#endif
+        {
+            meth_found = 1;
+        } else {
+            f = Py_TYPE(descr)->tp_descr_get;
+            if (f != NULL && PyDescr_IsData(descr)) {
+                attr = f(descr, obj, (PyObject *)Py_TYPE(obj));
+                Py_DECREF(descr);
+                goto try_unpack;
+            }
+        }
+    }
+    dictptr = _PyObject_GetDictPtr(obj);
+    if (dictptr != NULL && (dict = *dictptr) != NULL) {
+        Py_INCREF(dict);
+        attr = __Pyx_PyDict_GetItemStr(dict, name);
+        if (attr != NULL) {
+            Py_INCREF(attr);
+            Py_DECREF(dict);
+            Py_XDECREF(descr);
+            goto try_unpack;
+        }
+        Py_DECREF(dict);
+    }
+    if (meth_found) {
+        *method = descr;
+        return 1;
+    }
+    if (f != NULL) {
+        attr = f(descr, obj, (PyObject *)Py_TYPE(obj));
+        Py_DECREF(descr);
+        goto try_unpack;
+    }
+    if (descr != NULL) {
+        *method = descr;
+        return 0;
+    }
+    PyErr_Format(PyExc_AttributeError,
+#if PY_MAJOR_VERSION >= 3
+                 "'%.50s' object has no attribute '%U'",
+                 tp->tp_name, name);
+#else
+                 "'%.50s' object has no attribute '%.400s'",
+                 tp->tp_name, PyString_AS_STRING(name));
+#endif
+    return 0;
+#else
+    attr = __Pyx_PyObject_GetAttrStr(obj, name);
+    goto try_unpack;
+#endif
+try_unpack:
+#if CYTHON_UNPACK_METHODS
+    if (likely(attr) && PyMethod_Check(attr) && likely(PyMethod_GET_SELF(attr) == obj)) {
+        PyObject *function = PyMethod_GET_FUNCTION(attr);
+        Py_INCREF(function);
+        Py_DECREF(attr);
+        *method = function;
+        return 1;
+    }
+#endif
+    *method = attr;
+    return 0;
+}
+
 /* PyObjectCallMethod0 */
 static PyObject* __Pyx_PyObject_CallMethod0(PyObject* obj, PyObject* method_name) {
     PyObject *method = NULL, *result = NULL;
@@ -8849,33 +17803,178 @@ static CYTHON_INLINE int __Pyx_dict_iter_next(
     } else {
         *pvalue = next_item;
     }
-    return 1;
+    return 1;
+}
+
+/* DictGetItem */
+#if PY_MAJOR_VERSION >= 3 && !CYTHON_COMPILING_IN_PYPY
+static PyObject *__Pyx_PyDict_GetItem(PyObject *d, PyObject* key) {
+    PyObject *value;
+    value = PyDict_GetItemWithError(d, key);
+    if (unlikely(!value)) {
+        if (!PyErr_Occurred()) {
+            if (unlikely(PyTuple_Check(key))) {
+                PyObject* args = PyTuple_Pack(1, key);
+                if (likely(args)) {
+                    PyErr_SetObject(PyExc_KeyError, args);
+                    Py_DECREF(args);
+                }
+            } else {
+                PyErr_SetObject(PyExc_KeyError, key);
+            }
+        }
+        return NULL;
+    }
+    Py_INCREF(value);
+    return value;
+}
+#endif
+
+/* GetItemInt */
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
+    PyObject *r;
+    if (!j) return NULL;
+    r = PyObject_GetItem(o, j);
+    Py_DECREF(j);
+    return r;
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyList_GET_SIZE(o);
+    }
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyList_GET_SIZE(o)))) {
+        PyObject *r = PyList_GET_ITEM(o, wrapped_i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyTuple_GET_SIZE(o);
+    }
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyTuple_GET_SIZE(o)))) {
+        PyObject *r = PyTuple_GET_ITEM(o, wrapped_i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i, int is_list,
+                                                     CYTHON_NCP_UNUSED int wraparound,
+                                                     CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS && CYTHON_USE_TYPE_SLOTS
+    if (is_list || PyList_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyList_GET_SIZE(o);
+        if ((!boundscheck) || (likely(__Pyx_is_valid_index(n, PyList_GET_SIZE(o))))) {
+            PyObject *r = PyList_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    }
+    else if (PyTuple_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyTuple_GET_SIZE(o);
+        if ((!boundscheck) || likely(__Pyx_is_valid_index(n, PyTuple_GET_SIZE(o)))) {
+            PyObject *r = PyTuple_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    } else {
+        PySequenceMethods *m = Py_TYPE(o)->tp_as_sequence;
+        if (likely(m && m->sq_item)) {
+            if (wraparound && unlikely(i < 0) && likely(m->sq_length)) {
+                Py_ssize_t l = m->sq_length(o);
+                if (likely(l >= 0)) {
+                    i += l;
+                } else {
+                    if (!PyErr_ExceptionMatches(PyExc_OverflowError))
+                        return NULL;
+                    PyErr_Clear();
+                }
+            }
+            return m->sq_item(o, i);
+        }
+    }
+#else
+    if (is_list || PySequence_Check(o)) {
+        return PySequence_GetItem(o, i);
+    }
+#endif
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
 }
 
-/* PyErrFetchRestore */
-#if CYTHON_FAST_THREAD_STATE
-static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
-    PyObject *tmp_type, *tmp_value, *tmp_tb;
-    tmp_type = tstate->curexc_type;
-    tmp_value = tstate->curexc_value;
-    tmp_tb = tstate->curexc_traceback;
-    tstate->curexc_type = type;
-    tstate->curexc_value = value;
-    tstate->curexc_traceback = tb;
-    Py_XDECREF(tmp_type);
-    Py_XDECREF(tmp_value);
-    Py_XDECREF(tmp_tb);
+/* ObjectGetItem */
+#if CYTHON_USE_TYPE_SLOTS
+static PyObject *__Pyx_PyObject_GetIndex(PyObject *obj, PyObject* index) {
+    PyObject *runerr = NULL;
+    Py_ssize_t key_value;
+    PySequenceMethods *m = Py_TYPE(obj)->tp_as_sequence;
+    if (unlikely(!(m && m->sq_item))) {
+        PyErr_Format(PyExc_TypeError, "'%.200s' object is not subscriptable", Py_TYPE(obj)->tp_name);
+        return NULL;
+    }
+    key_value = __Pyx_PyIndex_AsSsize_t(index);
+    if (likely(key_value != -1 || !(runerr = PyErr_Occurred()))) {
+        return __Pyx_GetItemInt_Fast(obj, key_value, 0, 1, 1);
+    }
+    if (PyErr_GivenExceptionMatches(runerr, PyExc_OverflowError)) {
+        PyErr_Clear();
+        PyErr_Format(PyExc_IndexError, "cannot fit '%.200s' into an index-sized integer", Py_TYPE(index)->tp_name);
+    }
+    return NULL;
 }
-static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
-    *type = tstate->curexc_type;
-    *value = tstate->curexc_value;
-    *tb = tstate->curexc_traceback;
-    tstate->curexc_type = 0;
-    tstate->curexc_value = 0;
-    tstate->curexc_traceback = 0;
+static PyObject *__Pyx_PyObject_GetItem(PyObject *obj, PyObject* key) {
+    PyMappingMethods *m = Py_TYPE(obj)->tp_as_mapping;
+    if (likely(m && m->mp_subscript)) {
+        return m->mp_subscript(obj, key);
+    }
+    return __Pyx_PyObject_GetIndex(obj, key);
 }
 #endif
 
+/* PyObjectCall2Args */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2) {
+    PyObject *args, *result = NULL;
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyFunction_FastCall(function, args, 2);
+    }
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyCFunction_FastCall(function, args, 2);
+    }
+    #endif
+    args = PyTuple_New(2);
+    if (unlikely(!args)) goto done;
+    Py_INCREF(arg1);
+    PyTuple_SET_ITEM(args, 0, arg1);
+    Py_INCREF(arg2);
+    PyTuple_SET_ITEM(args, 1, arg2);
+    Py_INCREF(function);
+    result = __Pyx_PyObject_Call(function, args, NULL);
+    Py_DECREF(args);
+    Py_DECREF(function);
+done:
+    return result;
+}
+
 /* RaiseException */
 #if PY_MAJOR_VERSION < 3
 static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb,
@@ -8987,96 +18086,304 @@ static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject
                 goto bad;
             }
         }
-    } else {
-        PyErr_SetString(PyExc_TypeError,
-            "raise: exception class must be a subclass of BaseException");
-        goto bad;
-    }
-    if (cause) {
-        PyObject *fixed_cause;
-        if (cause == Py_None) {
-            fixed_cause = NULL;
-        } else if (PyExceptionClass_Check(cause)) {
-            fixed_cause = PyObject_CallObject(cause, NULL);
-            if (fixed_cause == NULL)
+    } else {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: exception class must be a subclass of BaseException");
+        goto bad;
+    }
+    if (cause) {
+        PyObject *fixed_cause;
+        if (cause == Py_None) {
+            fixed_cause = NULL;
+        } else if (PyExceptionClass_Check(cause)) {
+            fixed_cause = PyObject_CallObject(cause, NULL);
+            if (fixed_cause == NULL)
+                goto bad;
+        } else if (PyExceptionInstance_Check(cause)) {
+            fixed_cause = cause;
+            Py_INCREF(fixed_cause);
+        } else {
+            PyErr_SetString(PyExc_TypeError,
+                            "exception causes must derive from "
+                            "BaseException");
+            goto bad;
+        }
+        PyException_SetCause(value, fixed_cause);
+    }
+    PyErr_SetObject(type, value);
+    if (tb) {
+#if CYTHON_FAST_THREAD_STATE
+        PyThreadState *tstate = __Pyx_PyThreadState_Current;
+        PyObject* tmp_tb = tstate->curexc_traceback;
+        if (tb != tmp_tb) {
+            Py_INCREF(tb);
+            tstate->curexc_traceback = tb;
+            Py_XDECREF(tmp_tb);
+        }
+#else
+        PyObject *tmp_type, *tmp_value, *tmp_tb;
+        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
+        Py_INCREF(tb);
+        PyErr_Restore(tmp_type, tmp_value, tb);
+        Py_XDECREF(tmp_tb);
+#endif
+    }
+bad:
+    Py_XDECREF(owned_instance);
+    return;
+}
+#endif
+
+/* PyErrExceptionMatches */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        if (__Pyx_PyErr_GivenExceptionMatches(exc_type, PyTuple_GET_ITEM(tuple, i))) return 1;
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err) {
+    PyObject *exc_type = tstate->curexc_type;
+    if (exc_type == err) return 1;
+    if (unlikely(!exc_type)) return 0;
+    if (unlikely(PyTuple_Check(err)))
+        return __Pyx_PyErr_ExceptionMatchesTuple(exc_type, err);
+    return __Pyx_PyErr_GivenExceptionMatches(exc_type, err);
+}
+#endif
+
+/* GetAttr */
+static CYTHON_INLINE PyObject *__Pyx_GetAttr(PyObject *o, PyObject *n) {
+#if CYTHON_USE_TYPE_SLOTS
+#if PY_MAJOR_VERSION >= 3
+    if (likely(PyUnicode_Check(n)))
+#else
+    if (likely(PyString_Check(n)))
+#endif
+        return __Pyx_PyObject_GetAttrStr(o, n);
+#endif
+    return PyObject_GetAttr(o, n);
+}
+
+/* GetAttr3 */
+static PyObject *__Pyx_GetAttr3Default(PyObject *d) {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    if (unlikely(!__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
+        return NULL;
+    __Pyx_PyErr_Clear();
+    Py_INCREF(d);
+    return d;
+}
+static CYTHON_INLINE PyObject *__Pyx_GetAttr3(PyObject *o, PyObject *n, PyObject *d) {
+    PyObject *r = __Pyx_GetAttr(o, n);
+    return (likely(r)) ? r : __Pyx_GetAttr3Default(d);
+}
+
+/* DivInt[int] */
+static CYTHON_INLINE int __Pyx_div_int(int a, int b) {
+    int q = a / b;
+    int r = a - q*b;
+    q -= ((r != 0) & ((r ^ b) < 0));
+    return q;
+}
+
+/* PyObjectCallMethod1 */
+static PyObject* __Pyx__PyObject_CallMethod1(PyObject* method, PyObject* arg) {
+    PyObject *result = __Pyx_PyObject_CallOneArg(method, arg);
+    Py_DECREF(method);
+    return result;
+}
+static PyObject* __Pyx_PyObject_CallMethod1(PyObject* obj, PyObject* method_name, PyObject* arg) {
+    PyObject *method = NULL, *result;
+    int is_method = __Pyx_PyObject_GetMethod(obj, method_name, &method);
+    if (likely(is_method)) {
+        result = __Pyx_PyObject_Call2Args(method, obj, arg);
+        Py_DECREF(method);
+        return result;
+    }
+    if (unlikely(!method)) return NULL;
+    return __Pyx__PyObject_CallMethod1(method, arg);
+}
+
+/* append */
+static CYTHON_INLINE int __Pyx_PyObject_Append(PyObject* L, PyObject* x) {
+    if (likely(PyList_CheckExact(L))) {
+        if (unlikely(__Pyx_PyList_Append(L, x) < 0)) return -1;
+    } else {
+        PyObject* retval = __Pyx_PyObject_CallMethod1(L, __pyx_n_s_append, x);
+        if (unlikely(!retval))
+            return -1;
+        Py_DECREF(retval);
+    }
+    return 0;
+}
+
+/* dict_setdefault */
+static CYTHON_INLINE PyObject *__Pyx_PyDict_SetDefault(PyObject *d, PyObject *key, PyObject *default_value,
+                                                       CYTHON_UNUSED int is_safe_type) {
+    PyObject* value;
+#if PY_VERSION_HEX >= 0x030400A0
+    if ((1)) {
+        value = PyDict_SetDefault(d, key, default_value);
+        if (unlikely(!value)) return NULL;
+        Py_INCREF(value);
+#else
+    if (is_safe_type == 1 || (is_safe_type == -1 &&
+#if PY_MAJOR_VERSION >= 3 && !CYTHON_COMPILING_IN_PYPY
+            (PyUnicode_CheckExact(key) || PyString_CheckExact(key) || PyLong_CheckExact(key)))) {
+        value = PyDict_GetItemWithError(d, key);
+        if (unlikely(!value)) {
+            if (unlikely(PyErr_Occurred()))
+                return NULL;
+            if (unlikely(PyDict_SetItem(d, key, default_value) == -1))
+                return NULL;
+            value = default_value;
+        }
+        Py_INCREF(value);
+#else
+            (PyString_CheckExact(key) || PyUnicode_CheckExact(key) || PyInt_CheckExact(key) || PyLong_CheckExact(key)))) {
+        value = PyDict_GetItem(d, key);
+        if (unlikely(!value)) {
+            if (unlikely(PyDict_SetItem(d, key, default_value) == -1))
+                return NULL;
+            value = default_value;
+        }
+        Py_INCREF(value);
+#endif
+#endif
+    } else {
+        value = __Pyx_CallUnboundCMethod2(&__pyx_umethod_PyDict_Type_setdefault, d, key, default_value);
+    }
+    return value;
+}
+
+/* ModInt[int] */
+    static CYTHON_INLINE int __Pyx_mod_int(int a, int b) {
+    int r = a % b;
+    r += ((r != 0) & ((r ^ b) < 0)) * b;
+    return r;
+}
+
+/* Import */
+    static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
+    PyObject *empty_list = 0;
+    PyObject *module = 0;
+    PyObject *global_dict = 0;
+    PyObject *empty_dict = 0;
+    PyObject *list;
+    #if PY_MAJOR_VERSION < 3
+    PyObject *py_import;
+    py_import = __Pyx_PyObject_GetAttrStr(__pyx_b, __pyx_n_s_import);
+    if (!py_import)
+        goto bad;
+    #endif
+    if (from_list)
+        list = from_list;
+    else {
+        empty_list = PyList_New(0);
+        if (!empty_list)
+            goto bad;
+        list = empty_list;
+    }
+    global_dict = PyModule_GetDict(__pyx_m);
+    if (!global_dict)
+        goto bad;
+    empty_dict = PyDict_New();
+    if (!empty_dict)
+        goto bad;
+    {
+        #if PY_MAJOR_VERSION >= 3
+        if (level == -1) {
+            if ((1) && (strchr(__Pyx_MODULE_NAME, '.'))) {
+                module = PyImport_ImportModuleLevelObject(
+                    name, global_dict, empty_dict, list, 1);
+                if (!module) {
+                    if (!PyErr_ExceptionMatches(PyExc_ImportError))
+                        goto bad;
+                    PyErr_Clear();
+                }
+            }
+            level = 0;
+        }
+        #endif
+        if (!module) {
+            #if PY_MAJOR_VERSION < 3
+            PyObject *py_level = PyInt_FromLong(level);
+            if (!py_level)
                 goto bad;
-        } else if (PyExceptionInstance_Check(cause)) {
-            fixed_cause = cause;
-            Py_INCREF(fixed_cause);
-        } else {
-            PyErr_SetString(PyExc_TypeError,
-                            "exception causes must derive from "
-                            "BaseException");
-            goto bad;
-        }
-        PyException_SetCause(value, fixed_cause);
-    }
-    PyErr_SetObject(type, value);
-    if (tb) {
-#if CYTHON_FAST_THREAD_STATE
-        PyThreadState *tstate = __Pyx_PyThreadState_Current;
-        PyObject* tmp_tb = tstate->curexc_traceback;
-        if (tb != tmp_tb) {
-            Py_INCREF(tb);
-            tstate->curexc_traceback = tb;
-            Py_XDECREF(tmp_tb);
+            module = PyObject_CallFunctionObjArgs(py_import,
+                name, global_dict, empty_dict, list, py_level, (PyObject *)NULL);
+            Py_DECREF(py_level);
+            #else
+            module = PyImport_ImportModuleLevelObject(
+                name, global_dict, empty_dict, list, level);
+            #endif
         }
-#else
-        PyObject *tmp_type, *tmp_value, *tmp_tb;
-        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
-        Py_INCREF(tb);
-        PyErr_Restore(tmp_type, tmp_value, tb);
-        Py_XDECREF(tmp_tb);
-#endif
     }
 bad:
-    Py_XDECREF(owned_instance);
-    return;
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_import);
+    #endif
+    Py_XDECREF(empty_list);
+    Py_XDECREF(empty_dict);
+    return module;
 }
-#endif
 
-/* WriteUnraisableException */
-static void __Pyx_WriteUnraisable(const char *name, CYTHON_UNUSED int clineno,
-                                  CYTHON_UNUSED int lineno, CYTHON_UNUSED const char *filename,
-                                  int full_traceback, CYTHON_UNUSED int nogil) {
-    PyObject *old_exc, *old_val, *old_tb;
-    PyObject *ctx;
-    __Pyx_PyThreadState_declare
-#ifdef WITH_THREAD
-    PyGILState_STATE state;
-    if (nogil)
-        state = PyGILState_Ensure();
-    else state = (PyGILState_STATE)0;
-#endif
-    __Pyx_PyThreadState_assign
-    __Pyx_ErrFetch(&old_exc, &old_val, &old_tb);
-    if (full_traceback) {
-        Py_XINCREF(old_exc);
-        Py_XINCREF(old_val);
-        Py_XINCREF(old_tb);
-        __Pyx_ErrRestore(old_exc, old_val, old_tb);
-        PyErr_PrintEx(1);
+/* ImportFrom */
+    static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
+    PyObject* value = __Pyx_PyObject_GetAttrStr(module, name);
+    if (unlikely(!value) && PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Format(PyExc_ImportError,
+        #if PY_MAJOR_VERSION < 3
+            "cannot import name %.230s", PyString_AS_STRING(name));
+        #else
+            "cannot import name %S", name);
+        #endif
     }
-    #if PY_MAJOR_VERSION < 3
-    ctx = PyString_FromString(name);
-    #else
-    ctx = PyUnicode_FromString(name);
-    #endif
-    __Pyx_ErrRestore(old_exc, old_val, old_tb);
-    if (!ctx) {
-        PyErr_WriteUnraisable(Py_None);
+    return value;
+}
+
+/* ExtTypeTest */
+    static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
+    if (unlikely(!type)) {
+        PyErr_SetString(PyExc_SystemError, "Missing type object");
+        return 0;
+    }
+    if (likely(__Pyx_TypeCheck(obj, type)))
+        return 1;
+    PyErr_Format(PyExc_TypeError, "Cannot convert %.200s to %.200s",
+                 Py_TYPE(obj)->tp_name, type->tp_name);
+    return 0;
+}
+
+/* HasAttr */
+    static CYTHON_INLINE int __Pyx_HasAttr(PyObject *o, PyObject *n) {
+    PyObject *r;
+    if (unlikely(!__Pyx_PyBaseString_Check(n))) {
+        PyErr_SetString(PyExc_TypeError,
+                        "hasattr(): attribute name must be string");
+        return -1;
+    }
+    r = __Pyx_GetAttr(o, n);
+    if (unlikely(!r)) {
+        PyErr_Clear();
+        return 0;
     } else {
-        PyErr_WriteUnraisable(ctx);
-        Py_DECREF(ctx);
+        Py_DECREF(r);
+        return 1;
     }
-#ifdef WITH_THREAD
-    if (nogil)
-        PyGILState_Release(state);
-#endif
 }
 
 /* PyObject_GenericGetAttrNoDict */
-#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+    #if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
 static PyObject *__Pyx_RaiseGenericGetAttributeError(PyTypeObject *tp, PyObject *attr_name) {
     PyErr_Format(PyExc_AttributeError,
 #if PY_MAJOR_VERSION >= 3
@@ -9116,7 +18423,7 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj
 #endif
 
 /* PyObject_GenericGetAttr */
-#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+    #if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
 static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_name) {
     if (unlikely(Py_TYPE(obj)->tp_dictoffset)) {
         return PyObject_GenericGetAttr(obj, attr_name);
@@ -9126,7 +18433,7 @@ static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_nam
 #endif
 
 /* SetVTable */
-static int __Pyx_SetVtable(PyObject *dict, void *vtable) {
+    static int __Pyx_SetVtable(PyObject *dict, void *vtable) {
 #if PY_VERSION_HEX >= 0x02070000
     PyObject *ob = PyCapsule_New(vtable, 0, 0);
 #else
@@ -9143,8 +18450,134 @@ bad:
     return -1;
 }
 
+/* PyObjectGetAttrStrNoError */
+    static void __Pyx_PyObject_GetAttrStr_ClearAttributeError(void) {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    if (likely(__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
+        __Pyx_PyErr_Clear();
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name) {
+    PyObject *result;
+#if CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_TYPE_SLOTS && PY_VERSION_HEX >= 0x030700B1
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro == PyObject_GenericGetAttr)) {
+        return _PyObject_GenericGetAttrWithDict(obj, attr_name, NULL, 1);
+    }
+#endif
+    result = __Pyx_PyObject_GetAttrStr(obj, attr_name);
+    if (unlikely(!result)) {
+        __Pyx_PyObject_GetAttrStr_ClearAttributeError();
+    }
+    return result;
+}
+
+/* SetupReduce */
+    static int __Pyx_setup_reduce_is_named(PyObject* meth, PyObject* name) {
+  int ret;
+  PyObject *name_attr;
+  name_attr = __Pyx_PyObject_GetAttrStr(meth, __pyx_n_s_name);
+  if (likely(name_attr)) {
+      ret = PyObject_RichCompareBool(name_attr, name, Py_EQ);
+  } else {
+      ret = -1;
+  }
+  if (unlikely(ret < 0)) {
+      PyErr_Clear();
+      ret = 0;
+  }
+  Py_XDECREF(name_attr);
+  return ret;
+}
+static int __Pyx_setup_reduce(PyObject* type_obj) {
+    int ret = 0;
+    PyObject *object_reduce = NULL;
+    PyObject *object_getstate = NULL;
+    PyObject *object_reduce_ex = NULL;
+    PyObject *reduce = NULL;
+    PyObject *reduce_ex = NULL;
+    PyObject *reduce_cython = NULL;
+    PyObject *setstate = NULL;
+    PyObject *setstate_cython = NULL;
+    PyObject *getstate = NULL;
+#if CYTHON_USE_PYTYPE_LOOKUP
+    getstate = _PyType_Lookup((PyTypeObject*)type_obj, __pyx_n_s_getstate);
+#else
+    getstate = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_getstate);
+    if (!getstate && PyErr_Occurred()) {
+        goto __PYX_BAD;
+    }
+#endif
+    if (getstate) {
+#if CYTHON_USE_PYTYPE_LOOKUP
+        object_getstate = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_getstate);
+#else
+        object_getstate = __Pyx_PyObject_GetAttrStrNoError((PyObject*)&PyBaseObject_Type, __pyx_n_s_getstate);
+        if (!object_getstate && PyErr_Occurred()) {
+            goto __PYX_BAD;
+        }
+#endif
+        if (object_getstate != getstate) {
+            goto __PYX_GOOD;
+        }
+    }
+#if CYTHON_USE_PYTYPE_LOOKUP
+    object_reduce_ex = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
+#else
+    object_reduce_ex = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
+#endif
+    reduce_ex = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce_ex); if (unlikely(!reduce_ex)) goto __PYX_BAD;
+    if (reduce_ex == object_reduce_ex) {
+#if CYTHON_USE_PYTYPE_LOOKUP
+        object_reduce = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto __PYX_BAD;
+#else
+        object_reduce = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto __PYX_BAD;
+#endif
+        reduce = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce); if (unlikely(!reduce)) goto __PYX_BAD;
+        if (reduce == object_reduce || __Pyx_setup_reduce_is_named(reduce, __pyx_n_s_reduce_cython)) {
+            reduce_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_reduce_cython);
+            if (likely(reduce_cython)) {
+                ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce, reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+            } else if (reduce == object_reduce || PyErr_Occurred()) {
+                goto __PYX_BAD;
+            }
+            setstate = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_setstate);
+            if (!setstate) PyErr_Clear();
+            if (!setstate || __Pyx_setup_reduce_is_named(setstate, __pyx_n_s_setstate_cython)) {
+                setstate_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_setstate_cython);
+                if (likely(setstate_cython)) {
+                    ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate, setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                    ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                } else if (!setstate || PyErr_Occurred()) {
+                    goto __PYX_BAD;
+                }
+            }
+            PyType_Modified((PyTypeObject*)type_obj);
+        }
+    }
+    goto __PYX_GOOD;
+__PYX_BAD:
+    if (!PyErr_Occurred())
+        PyErr_Format(PyExc_RuntimeError, "Unable to initialize pickling for %s", ((PyTypeObject*)type_obj)->tp_name);
+    ret = -1;
+__PYX_GOOD:
+#if !CYTHON_USE_PYTYPE_LOOKUP
+    Py_XDECREF(object_reduce);
+    Py_XDECREF(object_reduce_ex);
+    Py_XDECREF(object_getstate);
+    Py_XDECREF(getstate);
+#endif
+    Py_XDECREF(reduce);
+    Py_XDECREF(reduce_ex);
+    Py_XDECREF(reduce_cython);
+    Py_XDECREF(setstate);
+    Py_XDECREF(setstate_cython);
+    return ret;
+}
+
 /* TypeImport */
-#ifndef __PYX_HAVE_RT_ImportType
+    #ifndef __PYX_HAVE_RT_ImportType
 #define __PYX_HAVE_RT_ImportType
 static PyTypeObject *__Pyx_ImportType(PyObject *module, const char *module_name, const char *class_name,
     size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize check_size)
@@ -9222,87 +18655,8 @@ bad:
 }
 #endif
 
-/* Import */
-static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
-    PyObject *empty_list = 0;
-    PyObject *module = 0;
-    PyObject *global_dict = 0;
-    PyObject *empty_dict = 0;
-    PyObject *list;
-    #if PY_MAJOR_VERSION < 3
-    PyObject *py_import;
-    py_import = __Pyx_PyObject_GetAttrStr(__pyx_b, __pyx_n_s_import);
-    if (!py_import)
-        goto bad;
-    #endif
-    if (from_list)
-        list = from_list;
-    else {
-        empty_list = PyList_New(0);
-        if (!empty_list)
-            goto bad;
-        list = empty_list;
-    }
-    global_dict = PyModule_GetDict(__pyx_m);
-    if (!global_dict)
-        goto bad;
-    empty_dict = PyDict_New();
-    if (!empty_dict)
-        goto bad;
-    {
-        #if PY_MAJOR_VERSION >= 3
-        if (level == -1) {
-            if ((1) && (strchr(__Pyx_MODULE_NAME, '.'))) {
-                module = PyImport_ImportModuleLevelObject(
-                    name, global_dict, empty_dict, list, 1);
-                if (!module) {
-                    if (!PyErr_ExceptionMatches(PyExc_ImportError))
-                        goto bad;
-                    PyErr_Clear();
-                }
-            }
-            level = 0;
-        }
-        #endif
-        if (!module) {
-            #if PY_MAJOR_VERSION < 3
-            PyObject *py_level = PyInt_FromLong(level);
-            if (!py_level)
-                goto bad;
-            module = PyObject_CallFunctionObjArgs(py_import,
-                name, global_dict, empty_dict, list, py_level, (PyObject *)NULL);
-            Py_DECREF(py_level);
-            #else
-            module = PyImport_ImportModuleLevelObject(
-                name, global_dict, empty_dict, list, level);
-            #endif
-        }
-    }
-bad:
-    #if PY_MAJOR_VERSION < 3
-    Py_XDECREF(py_import);
-    #endif
-    Py_XDECREF(empty_list);
-    Py_XDECREF(empty_dict);
-    return module;
-}
-
-/* ImportFrom */
-static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
-    PyObject* value = __Pyx_PyObject_GetAttrStr(module, name);
-    if (unlikely(!value) && PyErr_ExceptionMatches(PyExc_AttributeError)) {
-        PyErr_Format(PyExc_ImportError,
-        #if PY_MAJOR_VERSION < 3
-            "cannot import name %.230s", PyString_AS_STRING(name));
-        #else
-            "cannot import name %S", name);
-        #endif
-    }
-    return value;
-}
-
 /* ClassMethod */
-static PyObject* __Pyx_Method_ClassMethod(PyObject *method) {
+    static PyObject* __Pyx_Method_ClassMethod(PyObject *method) {
 #if CYTHON_COMPILING_IN_PYPY && PYPY_VERSION_NUM <= 0x05080000
     if (PyObject_TypeCheck(method, &PyWrapperDescr_Type)) {
         return PyClassMethod_New(method);
@@ -9342,33 +18696,8 @@ static PyObject* __Pyx_Method_ClassMethod(PyObject *method) {
     }
 }
 
-/* PyErrExceptionMatches */
-#if CYTHON_FAST_THREAD_STATE
-static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
-    Py_ssize_t i, n;
-    n = PyTuple_GET_SIZE(tuple);
-#if PY_MAJOR_VERSION >= 3
-    for (i=0; i<n; i++) {
-        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
-    }
-#endif
-    for (i=0; i<n; i++) {
-        if (__Pyx_PyErr_GivenExceptionMatches(exc_type, PyTuple_GET_ITEM(tuple, i))) return 1;
-    }
-    return 0;
-}
-static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err) {
-    PyObject *exc_type = tstate->curexc_type;
-    if (exc_type == err) return 1;
-    if (unlikely(!exc_type)) return 0;
-    if (unlikely(PyTuple_Check(err)))
-        return __Pyx_PyErr_ExceptionMatchesTuple(exc_type, err);
-    return __Pyx_PyErr_GivenExceptionMatches(exc_type, err);
-}
-#endif
-
 /* GetNameInClass */
-static PyObject *__Pyx_GetGlobalNameAfterAttributeLookup(PyObject *name) {
+    static PyObject *__Pyx_GetGlobalNameAfterAttributeLookup(PyObject *name) {
     PyObject *result;
     __Pyx_PyThreadState_declare
     __Pyx_PyThreadState_assign
@@ -9388,7 +18717,7 @@ static PyObject *__Pyx__GetNameInClass(PyObject *nmspace, PyObject *name) {
 }
 
 /* CLineInTraceback */
-#ifndef CYTHON_CLINE_IN_TRACEBACK
+    #ifndef CYTHON_CLINE_IN_TRACEBACK
 static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_line) {
     PyObject *use_cline;
     PyObject *ptype, *pvalue, *ptraceback;
@@ -9430,7 +18759,7 @@ static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_li
 #endif
 
 /* CodeObjectCache */
-static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
+    static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
     int start = 0, mid = 0, end = count - 1;
     if (end >= 0 && code_line > entries[end].code_line) {
         return count;
@@ -9510,7 +18839,7 @@ static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
 }
 
 /* AddTraceback */
-#include "compile.h"
+    #include "compile.h"
 #include "frameobject.h"
 #include "traceback.h"
 #if PY_VERSION_HEX >= 0x030b00a6
@@ -9617,7 +18946,7 @@ bad:
 }
 
 /* CIntFromPyVerify */
-#define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+    #define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
     __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
 #define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
     __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
@@ -9638,8 +18967,46 @@ bad:
         return (target_type) value;\
     }
 
+/* CIntToPy */
+    static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(int),
+                                     little, !is_unsigned);
+    }
+}
+
 /* CIntFromPy */
-static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
+    static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
 #ifdef __Pyx_HAS_GCC_DIAGNOSTIC
 #pragma GCC diagnostic push
 #pragma GCC diagnostic ignored "-Wconversion"
@@ -9658,7 +19025,203 @@ static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
             if (is_unsigned && unlikely(val < 0)) {
                 goto raise_neg_overflow;
             }
-            return (int) val;
+            return (int) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(int, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 2 * PyLong_SHIFT) {
+                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 3 * PyLong_SHIFT) {
+                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 4 * PyLong_SHIFT) {
+                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (int) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(int) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(int, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(int,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(int) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) ((((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) ((((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) ((((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(int) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            int val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (int) -1;
+        }
+    } else {
+        int val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (int) -1;
+        val = __Pyx_PyInt_As_int(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to int");
+    return (int) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to int");
+    return (int) -1;
+}
+
+/* CIntFromPy */
+    static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(long) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(long, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (long) val;
         }
     } else
 #endif
@@ -9667,32 +19230,32 @@ static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
 #if CYTHON_USE_PYLONG_INTERNALS
             const digit* digits = ((PyLongObject*)x)->ob_digit;
             switch (Py_SIZE(x)) {
-                case  0: return (int) 0;
-                case  1: __PYX_VERIFY_RETURN_INT(int, digit, digits[0])
+                case  0: return (long) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(long, digit, digits[0])
                 case 2:
-                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) >= 2 * PyLong_SHIFT) {
-                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 2 * PyLong_SHIFT) {
+                            return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
                         }
                     }
                     break;
                 case 3:
-                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) >= 3 * PyLong_SHIFT) {
-                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 3 * PyLong_SHIFT) {
+                            return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
                         }
                     }
                     break;
                 case 4:
-                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) >= 4 * PyLong_SHIFT) {
-                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 4 * PyLong_SHIFT) {
+                            return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
                         }
                     }
                     break;
@@ -9706,86 +19269,86 @@ static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
             {
                 int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
                 if (unlikely(result < 0))
-                    return (int) -1;
+                    return (long) -1;
                 if (unlikely(result == 1))
                     goto raise_neg_overflow;
             }
 #endif
-            if (sizeof(int) <= sizeof(unsigned long)) {
-                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
+            if (sizeof(long) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
 #ifdef HAVE_LONG_LONG
-            } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
-                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+            } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
 #endif
             }
         } else {
 #if CYTHON_USE_PYLONG_INTERNALS
             const digit* digits = ((PyLongObject*)x)->ob_digit;
             switch (Py_SIZE(x)) {
-                case  0: return (int) 0;
-                case -1: __PYX_VERIFY_RETURN_INT(int, sdigit, (sdigit) (-(sdigit)digits[0]))
-                case  1: __PYX_VERIFY_RETURN_INT(int,  digit, +digits[0])
+                case  0: return (long) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(long, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(long,  digit, +digits[0])
                 case -2:
-                    if (8 * sizeof(int) - 1 > 1 * PyLong_SHIFT) {
+                    if (8 * sizeof(long) - 1 > 1 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
-                            return (int) (((int)-1)*(((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
                         }
                     }
                     break;
                 case 2:
-                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
-                            return (int) ((((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) ((((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
                         }
                     }
                     break;
                 case -3:
-                    if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
-                            return (int) (((int)-1)*(((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
                         }
                     }
                     break;
                 case 3:
-                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
-                            return (int) ((((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) ((((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
                         }
                     }
                     break;
                 case -4:
-                    if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
-                            return (int) (((int)-1)*(((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
                         }
                     }
                     break;
                 case 4:
-                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
-                            return (int) ((((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) ((((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
                         }
                     }
                     break;
             }
 #endif
-            if (sizeof(int) <= sizeof(long)) {
-                __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
+            if (sizeof(long) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
 #ifdef HAVE_LONG_LONG
-            } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
-                __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
+            } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
 #endif
             }
         }
@@ -9794,7 +19357,7 @@ static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
             PyErr_SetString(PyExc_RuntimeError,
                             "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
 #else
-            int val;
+            long val;
             PyObject *v = __Pyx_PyNumber_IntOrLong(x);
  #if PY_MAJOR_VERSION < 3
             if (likely(v) && !PyLong_Check(v)) {
@@ -9814,66 +19377,28 @@ static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
                     return val;
             }
 #endif
-            return (int) -1;
+            return (long) -1;
         }
     } else {
-        int val;
+        long val;
         PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
-        if (!tmp) return (int) -1;
-        val = __Pyx_PyInt_As_int(tmp);
+        if (!tmp) return (long) -1;
+        val = __Pyx_PyInt_As_long(tmp);
         Py_DECREF(tmp);
         return val;
     }
 raise_overflow:
     PyErr_SetString(PyExc_OverflowError,
-        "value too large to convert to int");
-    return (int) -1;
+        "value too large to convert to long");
+    return (long) -1;
 raise_neg_overflow:
     PyErr_SetString(PyExc_OverflowError,
-        "can't convert negative value to int");
-    return (int) -1;
-}
-
-/* CIntToPy */
-static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
-#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
-#pragma GCC diagnostic push
-#pragma GCC diagnostic ignored "-Wconversion"
-#endif
-    const int neg_one = (int) -1, const_zero = (int) 0;
-#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
-#pragma GCC diagnostic pop
-#endif
-    const int is_unsigned = neg_one > const_zero;
-    if (is_unsigned) {
-        if (sizeof(int) < sizeof(long)) {
-            return PyInt_FromLong((long) value);
-        } else if (sizeof(int) <= sizeof(unsigned long)) {
-            return PyLong_FromUnsignedLong((unsigned long) value);
-#ifdef HAVE_LONG_LONG
-        } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
-            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
-#endif
-        }
-    } else {
-        if (sizeof(int) <= sizeof(long)) {
-            return PyInt_FromLong((long) value);
-#ifdef HAVE_LONG_LONG
-        } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
-            return PyLong_FromLongLong((PY_LONG_LONG) value);
-#endif
-        }
-    }
-    {
-        int one = 1; int little = (int)*(unsigned char *)&one;
-        unsigned char *bytes = (unsigned char *)&value;
-        return _PyLong_FromByteArray(bytes, sizeof(int),
-                                     little, !is_unsigned);
-    }
+        "can't convert negative value to long");
+    return (long) -1;
 }
 
 /* CIntToPy */
-static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
+    static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
 #ifdef __Pyx_HAS_GCC_DIAGNOSTIC
 #pragma GCC diagnostic push
 #pragma GCC diagnostic ignored "-Wconversion"
@@ -9911,26 +19436,26 @@ static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
 }
 
 /* CIntFromPy */
-static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
+    static CYTHON_INLINE size_t __Pyx_PyInt_As_size_t(PyObject *x) {
 #ifdef __Pyx_HAS_GCC_DIAGNOSTIC
 #pragma GCC diagnostic push
 #pragma GCC diagnostic ignored "-Wconversion"
 #endif
-    const long neg_one = (long) -1, const_zero = (long) 0;
+    const size_t neg_one = (size_t) -1, const_zero = (size_t) 0;
 #ifdef __Pyx_HAS_GCC_DIAGNOSTIC
 #pragma GCC diagnostic pop
 #endif
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
     if (likely(PyInt_Check(x))) {
-        if (sizeof(long) < sizeof(long)) {
-            __PYX_VERIFY_RETURN_INT(long, long, PyInt_AS_LONG(x))
+        if (sizeof(size_t) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(size_t, long, PyInt_AS_LONG(x))
         } else {
             long val = PyInt_AS_LONG(x);
             if (is_unsigned && unlikely(val < 0)) {
                 goto raise_neg_overflow;
             }
-            return (long) val;
+            return (size_t) val;
         }
     } else
 #endif
@@ -9939,32 +19464,32 @@ static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
 #if CYTHON_USE_PYLONG_INTERNALS
             const digit* digits = ((PyLongObject*)x)->ob_digit;
             switch (Py_SIZE(x)) {
-                case  0: return (long) 0;
-                case  1: __PYX_VERIFY_RETURN_INT(long, digit, digits[0])
+                case  0: return (size_t) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(size_t, digit, digits[0])
                 case 2:
-                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                    if (8 * sizeof(size_t) > 1 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) >= 2 * PyLong_SHIFT) {
-                            return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) >= 2 * PyLong_SHIFT) {
+                            return (size_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
                         }
                     }
                     break;
                 case 3:
-                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                    if (8 * sizeof(size_t) > 2 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) >= 3 * PyLong_SHIFT) {
-                            return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) >= 3 * PyLong_SHIFT) {
+                            return (size_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
                         }
                     }
                     break;
                 case 4:
-                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                    if (8 * sizeof(size_t) > 3 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) >= 4 * PyLong_SHIFT) {
-                            return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) >= 4 * PyLong_SHIFT) {
+                            return (size_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
                         }
                     }
                     break;
@@ -9978,86 +19503,86 @@ static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
             {
                 int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
                 if (unlikely(result < 0))
-                    return (long) -1;
+                    return (size_t) -1;
                 if (unlikely(result == 1))
                     goto raise_neg_overflow;
             }
 #endif
-            if (sizeof(long) <= sizeof(unsigned long)) {
-                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
+            if (sizeof(size_t) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(size_t, unsigned long, PyLong_AsUnsignedLong(x))
 #ifdef HAVE_LONG_LONG
-            } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
-                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+            } else if (sizeof(size_t) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(size_t, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
 #endif
             }
         } else {
 #if CYTHON_USE_PYLONG_INTERNALS
             const digit* digits = ((PyLongObject*)x)->ob_digit;
             switch (Py_SIZE(x)) {
-                case  0: return (long) 0;
-                case -1: __PYX_VERIFY_RETURN_INT(long, sdigit, (sdigit) (-(sdigit)digits[0]))
-                case  1: __PYX_VERIFY_RETURN_INT(long,  digit, +digits[0])
+                case  0: return (size_t) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(size_t, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(size_t,  digit, +digits[0])
                 case -2:
-                    if (8 * sizeof(long) - 1 > 1 * PyLong_SHIFT) {
+                    if (8 * sizeof(size_t) - 1 > 1 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
-                            return (long) (((long)-1)*(((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(size_t, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (size_t) (((size_t)-1)*(((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
                         }
                     }
                     break;
                 case 2:
-                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                    if (8 * sizeof(size_t) > 1 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
-                            return (long) ((((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (size_t) ((((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
                         }
                     }
                     break;
                 case -3:
-                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                    if (8 * sizeof(size_t) - 1 > 2 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
-                            return (long) (((long)-1)*(((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(size_t, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (size_t) (((size_t)-1)*(((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
                         }
                     }
                     break;
                 case 3:
-                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                    if (8 * sizeof(size_t) > 2 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
-                            return (long) ((((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (size_t) ((((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
                         }
                     }
                     break;
                 case -4:
-                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                    if (8 * sizeof(size_t) - 1 > 3 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
-                            return (long) (((long)-1)*(((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(size_t, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (size_t) (((size_t)-1)*(((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
                         }
                     }
                     break;
                 case 4:
-                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                    if (8 * sizeof(size_t) > 3 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
-                            return (long) ((((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (size_t) ((((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
                         }
                     }
                     break;
             }
 #endif
-            if (sizeof(long) <= sizeof(long)) {
-                __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
+            if (sizeof(size_t) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(size_t, long, PyLong_AsLong(x))
 #ifdef HAVE_LONG_LONG
-            } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
-                __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
+            } else if (sizeof(size_t) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(size_t, PY_LONG_LONG, PyLong_AsLongLong(x))
 #endif
             }
         }
@@ -10066,7 +19591,7 @@ static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
             PyErr_SetString(PyExc_RuntimeError,
                             "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
 #else
-            long val;
+            size_t val;
             PyObject *v = __Pyx_PyNumber_IntOrLong(x);
  #if PY_MAJOR_VERSION < 3
             if (likely(v) && !PyLong_Check(v)) {
@@ -10086,28 +19611,66 @@ static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
                     return val;
             }
 #endif
-            return (long) -1;
+            return (size_t) -1;
         }
     } else {
-        long val;
+        size_t val;
         PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
-        if (!tmp) return (long) -1;
-        val = __Pyx_PyInt_As_long(tmp);
+        if (!tmp) return (size_t) -1;
+        val = __Pyx_PyInt_As_size_t(tmp);
         Py_DECREF(tmp);
         return val;
     }
 raise_overflow:
     PyErr_SetString(PyExc_OverflowError,
-        "value too large to convert to long");
-    return (long) -1;
+        "value too large to convert to size_t");
+    return (size_t) -1;
 raise_neg_overflow:
     PyErr_SetString(PyExc_OverflowError,
-        "can't convert negative value to long");
-    return (long) -1;
+        "can't convert negative value to size_t");
+    return (size_t) -1;
+}
+
+/* CIntToPy */
+    static CYTHON_INLINE PyObject* __Pyx_PyInt_From_char(char value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const char neg_one = (char) -1, const_zero = (char) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(char) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(char) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(char) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(char) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(char) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(char),
+                                     little, !is_unsigned);
+    }
 }
 
 /* FastTypeChecks */
-#if CYTHON_COMPILING_IN_CPYTHON
+    #if CYTHON_COMPILING_IN_CPYTHON
 static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
     while (a) {
         a = a->tp_base;
@@ -10207,7 +19770,7 @@ static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObj
 #endif
 
 /* FetchCommonType */
-static PyTypeObject* __Pyx_FetchCommonType(PyTypeObject* type) {
+    static PyTypeObject* __Pyx_FetchCommonType(PyTypeObject* type) {
     PyObject* fake_module;
     PyTypeObject* cached_type = NULL;
     fake_module = PyImport_AddModule((char*) "_cython_" CYTHON_ABI);
@@ -10246,7 +19809,7 @@ bad:
 }
 
 /* GetTopmostException */
-#if CYTHON_USE_EXC_INFO_STACK
+    #if CYTHON_USE_EXC_INFO_STACK
 static _PyErr_StackItem *
 __Pyx_PyErr_GetTopmostException(PyThreadState *tstate)
 {
@@ -10261,7 +19824,7 @@ __Pyx_PyErr_GetTopmostException(PyThreadState *tstate)
 #endif
 
 /* SaveResetException */
-#if CYTHON_FAST_THREAD_STATE
+    #if CYTHON_FAST_THREAD_STATE
 static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
     #if CYTHON_USE_EXC_INFO_STACK
     _PyErr_StackItem *exc_info = __Pyx_PyErr_GetTopmostException(tstate);
@@ -10302,7 +19865,7 @@ static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject
 #endif
 
 /* SwapException */
-#if CYTHON_FAST_THREAD_STATE
+    #if CYTHON_FAST_THREAD_STATE
 static CYTHON_INLINE void __Pyx__ExceptionSwap(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
     PyObject *tmp_type, *tmp_value, *tmp_tb;
     #if CYTHON_USE_EXC_INFO_STACK
@@ -10337,7 +19900,7 @@ static CYTHON_INLINE void __Pyx_ExceptionSwap(PyObject **type, PyObject **value,
 #endif
 
 /* CoroutineBase */
-#include <structmember.h>
+    #include <structmember.h>
 #include <frameobject.h>
 #if PY_VERSION_HEX >= 0x030b00a6
   #ifndef Py_BUILD_CORE
@@ -11131,7 +20694,7 @@ static __pyx_CoroutineObject *__Pyx__Coroutine_NewInit(
 }
 
 /* PatchModuleWithCoroutine */
-static PyObject* __Pyx_Coroutine_patch_module(PyObject* module, const char* py_code) {
+    static PyObject* __Pyx_Coroutine_patch_module(PyObject* module, const char* py_code) {
 #if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
     int result;
     PyObject *globals, *result_obj;
@@ -11171,7 +20734,7 @@ ignore:
 }
 
 /* PatchGeneratorABC */
-#ifndef CYTHON_REGISTER_ABCS
+    #ifndef CYTHON_REGISTER_ABCS
 #define CYTHON_REGISTER_ABCS 1
 #endif
 #if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
@@ -11228,7 +20791,7 @@ static int __Pyx_patch_abc(void) {
 }
 
 /* Generator */
-static PyMethodDef __pyx_Generator_methods[] = {
+    static PyMethodDef __pyx_Generator_methods[] = {
     {"send", (PyCFunction) __Pyx_Coroutine_Send, METH_O,
      (char*) PyDoc_STR("send(arg) -> send 'arg' into generator,\nreturn next yielded value or raise StopIteration.")},
     {"throw", (PyCFunction) __Pyx_Coroutine_Throw, METH_VARARGS,
@@ -11331,7 +20894,7 @@ static int __pyx_Generator_init(void) {
 }
 
 /* CheckBinaryVersion */
-static int __Pyx_check_binary_version(void) {
+    static int __Pyx_check_binary_version(void) {
     char ctversion[5];
     int same=1, i, found_dot;
     const char* rt_from_call = Py_GetVersion();
@@ -11369,7 +20932,7 @@ static int __Pyx_check_binary_version(void) {
 }
 
 /* InitStrings */
-static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
+    static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
     while (t->p) {
         #if PY_MAJOR_VERSION < 3
         if (t->is_unicode) {
@@ -9,17 +9,45 @@ from libcpp.vector cimport vector
 ctypedef vector[int] IWord
 
 cdef class FSM:
-    cdef list alphabet
+    cdef readonly list alphabet
     cdef int alphabet_len
-    cdef array.array machine
+    cdef readonly array.array machine
+    cdef void* table
+    cdef int itemsize
     cdef int machine_len
-    cdef dict yield_states
-    cdef dict distance_to_yield
+    cdef readonly dict yield_states
+    cdef readonly dict distance_to_yield
+    cdef array.array distances
     cdef array.array has_yield
+    cdef array.array shortest_yield
     
     cdef vector[IWord] yield_states2
     cdef vector[int] yield_states2_starts
     
-    cdef bint c_hit(self, IWord& word, int run=*)
+    cdef bint c_hit(self, IWord& word, int run=*, int longest=*)
     cdef vector[pair[int, IWord]] c_hits(self, IWord& word, int run=*)
+    cdef int c_distance(self, IWord& word)
+    cdef bint c_has_cycle(self, IWord& word, int depth)
 
+
+cdef class StatePath:
+    cdef FSM machine
+    cdef vector[int] states
+    cdef vector[int] hits
+    
+    cdef void c_push(self, int letter)
+    cdef void c_truncate(self, int depth)
+    cdef void c_sync(self, IWord& word, int depth)
+    cdef int c_state(self)
+    cdef bint c_hit(self)
+    cdef int c_distance(self)
+
+cdef class TransitionMap:
+    cdef FSM machine
+    cdef int width
+    cdef vector[int] maps
+    
+    cdef void c_push(self, int letter)
+    cdef void c_truncate(self, int depth)
+    cdef void c_sync(self, IWord& word, int depth)
+    cdef bint c_has_fixed_point(self)
@@ -11,18 +11,55 @@ from libcpp.vector cimport vector
 
 from bundler.extensions.FSM cimport FSM
 
-from collections import defaultdict, OrderedDict
-from queue import Queue
+from collections import OrderedDict
+
+import numpy as np
+
+UNREACHABLE = 2**30
+
+cdef inline int step(FSM machine, int state, int letter):
+    ''' Return the state that machine moves to from state on reading letter. '''
+    cdef Py_ssize_t index = state * machine.alphabet_len + letter
+    if machine.itemsize == 1: return (<signed char*>machine.table)[index]
+    if machine.itemsize == 2: return (<short*>machine.table)[index]
+    return (<int*>machine.table)[index]
+
+# The loops that make the most transitions are specialised to each type of table, rather than calling step.
+ctypedef fused entry:
+    signed char
+    short
+    int
+
+cdef inline int follow(entry* table, int alphabet_len, int state, IWord& word):
+    ''' Return the state reached by reading word from state, or -1 if this walks off of the machine. '''
+    cdef int i
+    for i in range(<int>word.size()):
+        state = table[state * alphabet_len + word[i]]
+        if state < 0: break
+    return state
+
+cdef inline void compose(entry* table, int alphabet_len, vector[int]& maps, int width, int letter):
+    ''' Push the composition of the top width entries of maps with letter onto maps. '''
+    cdef int start = maps.size() - width
+    cdef int c, state
+    for c in range(width):
+        state = maps[start + c]
+        if state >= 0:
+            state = table[state * alphabet_len + letter]
+        maps.push_back(state)
 
 cdef class FSM:
-    def __init__(self, alphabet, machine, yield_states):
+    def __init__(self, alphabet, machine, yield_states, distance_to_yield=None):
         cdef int start
         cdef IWord x
         
         self.alphabet = alphabet
         self.alphabet_len = len(self.alphabet)
-        self.machine = array.array('i', machine)
-        self.machine_len = len(self.machine) // self.alphabet_len
+        self.machine_len = len(machine) // self.alphabet_len
+        # The transitions are stored in the narrowest signed type that holds every state (and -1) so that more of the table stays in cache.
+        self.machine = array.array('b' if self.machine_len <= 2**7 else 'h' if self.machine_len <= 2**15 else 'i', machine)
+        self.table = self.machine.data.as_voidptr
+        self.itemsize = self.machine.itemsize
         self.yield_states = yield_states
         self.has_yield = array.array('i', [1 if self.yield_states.get(state, []) else 0 for state in range(self.machine_len)])
         
@@ -35,25 +72,57 @@ cdef class FSM:
             start += len(yields)
             self.yield_states2_starts.push_back(start)
         
-        reverse_arrows = defaultdict(list)
+        # The length of the shortest word that each state yields, states that do not yield are given a length larger than any word.
+        self.shortest_yield = array.array('i', [min((len(x) for x in self.yield_states.get(state, [])), default=UNREACHABLE) for state in range(self.machine_len)])
+        
+        if distance_to_yield is not None:  # Already known, for example when loading from a cache.
+            self.distance_to_yield = dict(distance_to_yield)
+        else:
+            self.distance_to_yield = self.find_distance_to_yield()
+        
+        # States that cannot reach a yield are given a distance larger than any word.
+        self.distances = array.array('i', [self.distance_to_yield.get(state, UNREACHABLE) for state in range(self.machine_len)])
+    
+    def find_distance_to_yield(self):
+        ''' Return a dictionary mapping each state to the length of the shortest word that takes it to a yield state. '''
+        cdef int state, new_state, i, j
+        cdef size_t head = 0
+        cdef vector[int] reverse_starts, reverse_arrows, distances, to_check
+        
+        # The reverse arrows, with those into state in reverse_arrows[reverse_starts[state]:reverse_starts[state+1]].
+        reverse_starts.assign(self.machine_len + 1, 0)
         for state in range(self.machine_len):
             for i in range(self.alphabet_len):
-                new_state = self.machine.data.as_ints[state * self.alphabet_len + i]
-                reverse_arrows[new_state].append(state)
+                new_state = step(self, state, i)
+                if new_state >= 0: reverse_starts[new_state + 1] += 1
+        for state in range(self.machine_len):
+            reverse_starts[state + 1] += reverse_starts[state]
+        reverse_arrows.resize(reverse_starts[self.machine_len])
+        for state in range(self.machine_len):
+            for i in range(self.alphabet_len):
+                new_state = step(self, state, i)
+                if new_state >= 0:
+                    reverse_arrows[reverse_starts[new_state]] = state
+                    reverse_starts[new_state] += 1
+        for state in range(self.machine_len, 0, -1):  # Undo the shift caused by filling.
+            reverse_starts[state] = reverse_starts[state - 1]
+        reverse_starts[0] = 0
         
-        to_check = Queue()
-        self.distance_to_yield = dict()
+        distances.assign(self.machine_len, -1)
         for state in range(self.machine_len):
-            if self.yield_states.get(state, []):
-                self.distance_to_yield[state] = 0
-                to_check.put(state)
+            if self.has_yield.data.as_ints[state]:
+                distances[state] = 0
+                to_check.push_back(state)
+        
+        while head < to_check.size():
+            state = to_check[head]
+            head += 1
+            for j in range(reverse_starts[state], reverse_starts[state + 1]):
+                if distances[reverse_arrows[j]] < 0:
+                    distances[reverse_arrows[j]] = distances[state] + 1
+                    to_check.push_back(reverse_arrows[j])
         
-        while not to_check.empty():
-            current = to_check.get()
-            for adjacent in reverse_arrows[current]:
-                if adjacent not in self.distance_to_yield:
-                    self.distance_to_yield[adjacent] = self.distance_to_yield[current] + 1
-                    to_check.put(adjacent)
+        return dict((state, distances[state]) for state in range(self.machine_len) if distances[state] >= 0)
     
     @classmethod
     def from_dicts(cls, list alphabet, object machine, dict hits):
@@ -68,12 +137,12 @@ cdef class FSM:
         return cls(alphabet, flattened_machine, dict((state_names_index[state], hits[state]) for state in hits))
     
     def __reduce__(self):
-        return (self.__class__, (self.alphabet, self.machine, self.yield_states))
+        return (self.__class__, (self.alphabet, self.machine, self.yield_states, self.distance_to_yield))
     
     def __call__(self, tuple word, int state=0):
         cdef int letter
         for letter in word:
-            state = self.machine.data.as_ints[state * self.alphabet_len + letter]
+            state = step(self, state, letter)
             if state < 0:
                 raise ValueError('Invalid transition to state {}'.format(state))
         
@@ -82,15 +151,35 @@ cdef class FSM:
     def distance(self, tuple word):
         return self.distance_to_yield[self(word)]
     
-    cdef bint c_hit(self, IWord& word, int run=-1):
+    def path(self):
+        ''' Return a new StatePath for tracking the states of this machine one letter at a time. '''
+        return StatePath(self)
+    
+    def transition_map(self, int depth=-1):
+        ''' Return a new TransitionMap for tracking the action of a word on the first depth states. '''
+        return TransitionMap(self, depth)
+    
+    cdef int c_distance(self, IWord& word):
+        ''' Return the length of the shortest word that extends word to reach a yield state. '''
+        cdef int state = 0
+        cdef int i
+        for i in range(<int>word.size()):
+            state = step(self, state, word[i])
+            if state < 0:
+                raise ValueError('Invalid transition to state {}'.format(state))
+        
+        return self.distances.data.as_ints[state]
+    
+    cdef bint c_hit(self, IWord& word, int run=-1, int longest=-1):
+        ''' Return whether the first run letters of word (read cyclically) meet a state that yields, or one that yields a word of length at most longest if given. '''
         cdef int index = 0
         cdef int state = 0
         cdef int length = word.size()
         for _ in range(length if run < 0 else run):
-            state = self.machine.data.as_ints[state * self.alphabet_len + word[index]]
+            state = step(self, state, word[index])
             if state < 0:
                 raise ValueError('Invalid transition to state {}'.format(state))
-            if self.has_yield.data.as_ints[state]:
+            if self.has_yield.data.as_ints[state] and (longest < 0 or self.shortest_yield.data.as_ints[state] <= longest):
                 return True
             index += 1
             if index == length: index = 0
@@ -110,7 +199,7 @@ cdef class FSM:
         cdef int i = 0, j
         cdef vector[pair[int, IWord]] returns
         for _ in range(length if run < 0 else run):
-            state = self.machine.data.as_ints[state * self.alphabet_len + word[index]]
+            state = step(self, state, word[index])
             i += 1
             for j in range(self.yield_states2_starts[state], self.yield_states2_starts[state+1]):
                 returns.push_back(pair[int, IWord](i, self.yield_states2[j]))
@@ -127,7 +216,7 @@ cdef class FSM:
         cdef int i = 0
         for _ in range(length if run < 0 else run):
             i += 1
-            state = self.machine.data.as_ints[state * self.alphabet_len + word[index]]
+            state = step(self, state, word[index])
             if state < 0:
                 raise ValueError('Invalid transition to state {}'.format(state))
             for x in self.yield_states.get(state, []):
@@ -135,23 +224,354 @@ cdef class FSM:
             index += 1
             if index == length: index = 0
 
-    def has_cycle(self, tuple word, int depth=-1):
-        ''' Return whether there is a state such that self(word, state) == state. '''
-        cdef array.array converted_word = array.array('i', word)
-        cdef int l = len(word)
-        cdef int c, state, letter, i
+    cdef bint c_has_cycle(self, IWord& word, int depth):
+        ''' Return whether there is a state < depth such that self(word, state) == state. '''
+        cdef int c, state
         
-        if depth < 0: depth = self.machine_len
+        if depth < 0 or depth > self.machine_len: depth = self.machine_len
         
         for c in range(depth):
-            state = c
-            for i in range(l):
-                letter = converted_word.data.as_ints[i]
-                state = self.machine.data.as_ints[state * self.alphabet_len + letter]
-                if state < 0: break
+            if self.itemsize == 1: state = follow(<signed char*>self.table, self.alphabet_len, c, word)
+            elif self.itemsize == 2: state = follow(<short*>self.table, self.alphabet_len, c, word)
+            else: state = follow(<int*>self.table, self.alphabet_len, c, word)
             
             if state == c:
                 return True
         
         return False
+    
+    def has_cycle(self, tuple word, int depth=-1):
+        ''' Return whether there is a state such that self(word, state) == state. '''
+        return self.c_has_cycle(word, depth)
+    
+    def has_cycles(self, words, int depth=-1):
+        ''' Return a boolean array recording whether has_cycle(word, depth) for each row of the 2D array words.
+        
+        All words are processed together, one letter at a time, using numpy. '''
+        words = np.asarray(words, dtype=np.intp)
+        if depth < 0 or depth > self.machine_len: depth = self.machine_len
+        
+        # An extra row so that the invalid state -1 maps to itself.
+        table = np.vstack([np.asarray(self.machine, dtype=np.intc).reshape(self.machine_len, self.alphabet_len), np.full((1, self.alphabet_len), -1, dtype=np.intc)])
+        starts = np.arange(depth)
+        states = np.tile(starts, (words.shape[0], 1))
+        for i in range(words.shape[1]):
+            states = table[states, words[:, i, None]]
+        
+        return (states == starts).any(axis=1)
+
+
+cdef class StatePath:
+    ''' A stack of the states that an FSM passes through as it reads a word.
+    
+    Extending the word by a letter costs one table lookup and we can roll back to any earlier depth,
+    so following a depth-first traversal costs O(1) per vertex rather than O(length). '''
+    def __init__(self, FSM machine):
+        self.machine = machine
+        self.states.push_back(0)  # states[i] is the state after reading i letters.
+        self.hits.push_back(0)  # hits[i] records whether a yield state was met within the first i letters.
+    
+    cdef void c_push(self, int letter):
+        cdef int state = self.states.back()
+        if state >= 0:
+            state = step(self.machine, state, letter)
+        self.states.push_back(state)
+        self.hits.push_back(self.hits.back() or (state >= 0 and self.machine.has_yield.data.as_ints[state]))
+    
+    cdef void c_truncate(self, int depth):
+        if depth + 1 < <int>self.states.size():
+            self.states.resize(depth + 1)
+            self.hits.resize(depth + 1)
+    
+    cdef void c_sync(self, IWord& word, int depth):
+        ''' Update the path to follow word, assuming that only letters after word[:depth] have changed. '''
+        cdef int i
+        self.c_truncate(depth)
+        for i in range(<int>self.states.size() - 1, <int>word.size()):
+            self.c_push(word[i])
+    
+    cdef int c_state(self):
+        return self.states.back()
+    
+    cdef bint c_hit(self):
+        return self.hits.back()
+    
+    cdef int c_distance(self):
+        cdef int state = self.states.back()
+        return self.machine.distances.data.as_ints[state] if state >= 0 else UNREACHABLE
+    
+    def __len__(self):
+        return self.states.size() - 1
+    
+    def push(self, int letter):
+        ''' Extend the word by letter. '''
+        self.c_push(letter)
+    
+    def truncate(self, int depth):
+        ''' Roll the word back to its first depth letters. '''
+        self.c_truncate(depth)
+    
+    def state(self):
+        ''' Return the current state of the machine. '''
+        return self.c_state()
+    
+    def hit(self):
+        ''' Return whether the word read so far meets any state that yields. '''
+        return self.c_hit()
+    
+    def distance(self):
+        ''' Return the length of the shortest extension that reaches a yield state. '''
+        return self.c_distance()
+
+cdef class TransitionMap:
+    ''' A stack of the maps that a word induces on the first width states of an FSM.
+    
+    maps[i * width + c] is the state reached from state c after reading i letters or -1 if this
+    walks off of the machine. So has_cycle becomes a test for a fixed point of the top map. '''
+    def __init__(self, FSM machine, int depth=-1):
+        cdef int c
+        self.machine = machine
+        self.width = depth if 0 <= depth <= machine.machine_len else machine.machine_len
+        for c in range(self.width):
+            self.maps.push_back(c)
+    
+    cdef void c_push(self, int letter):
+        ''' Compose the top map with letter. '''
+        if self.machine.itemsize == 1: compose(<signed char*>self.machine.table, self.machine.alphabet_len, self.maps, self.width, letter)
+        elif self.machine.itemsize == 2: compose(<short*>self.machine.table, self.machine.alphabet_len, self.maps, self.width, letter)
+        else: compose(<int*>self.machine.table, self.machine.alphabet_len, self.maps, self.width, letter)
+    
+    cdef void c_truncate(self, int depth):
+        if (depth + 1) * self.width < <int>self.maps.size():
+            self.maps.resize((depth + 1) * self.width)
+    
+    cdef void c_sync(self, IWord& word, int depth):
+        ''' Update the maps to follow word, assuming that only letters after word[:depth] have changed. '''
+        cdef int i
+        if self.width == 0: return
+        self.c_truncate(depth)
+        for i in range(<int>self.maps.size() // self.width - 1, <int>word.size()):
+            self.c_push(word[i])
+    
+    cdef bint c_has_fixed_point(self):
+        cdef int start = self.maps.size() - self.width
+        cdef int c
+        for c in range(self.width):
+            if self.maps[start + c] == c:
+                return True
+        return False
+    
+    def __len__(self):
+        return self.maps.size() // self.width - 1 if self.width else 0
+    
+    def push(self, int letter):
+        ''' Extend the word by letter. '''
+        self.c_push(letter)
+    
+    def truncate(self, int depth):
+        ''' Roll the word back to its first depth letters. '''
+        self.c_truncate(depth)
+    
+    def has_fixed_point(self):
+        ''' Return whether the word read so far fixes any of the states. '''
+        return self.c_has_fixed_point()
+    
+    def image(self):
+        ''' Return the list of images of the states under the word read so far. '''
+        return [self.maps[i] for i in range(<int>self.maps.size() - self.width, self.maps.size())]
+
+def aho_corasick(int alphabet_len, words):
+    ''' Return the transitions of the Aho-Corasick automaton that detects the given words, whose letters are in range(alphabet_len).
+    
+    Returns (machine, accepting) where machine is the flat transition table and accepting is a dictionary mapping each
+    state that some word is a suffix of to the word that takes the start state to it. '''
+    cdef vector[int] machine, parent, last, fail, order
+    cdef vector[char] terminal, accepting
+    cdef int state, child, letter, i
+    cdef size_t head = 0
+    
+    # Build the trie of words, in which a missing child is -1.
+    machine.assign(alphabet_len, -1)
+    parent.push_back(-1)
+    last.push_back(-1)
+    terminal.push_back(0)
+    for word in words:
+        state = 0
+        for letter in word:
+            if not 0 <= letter < alphabet_len:
+                raise ValueError('Invalid letter {}'.format(letter))
+            child = machine[state * alphabet_len + letter]
+            if child < 0:
+                child = parent.size()
+                machine[state * alphabet_len + letter] = child
+                machine.resize(machine.size() + alphabet_len, -1)
+                parent.push_back(state)
+                last.push_back(letter)
+                terminal.push_back(0)
+            state = child
+        terminal[state] = 1
+    
+    # Fill in the missing children by following failure links, in breadth first order so that the states that
+    # these lead to are already complete.
+    fail.assign(parent.size(), 0)
+    accepting.assign(parent.size(), 0)
+    accepting[0] = terminal[0]
+    order.push_back(0)
+    while head < order.size():
+        state = order[head]
+        head += 1
+        if state: accepting[state] = terminal[state] or accepting[fail[state]]
+        for letter in range(alphabet_len):
+            child = machine[state * alphabet_len + letter]
+            if child < 0:
+                machine[state * alphabet_len + letter] = machine[fail[state] * alphabet_len + letter] if state else 0
+            else:
+                fail[child] = machine[fail[state] * alphabet_len + letter] if state else 0
+                order.push_back(child)
+    
+    accepting_words = dict()
+    for i in range(<int>parent.size()):
+        if accepting[i]:
+            word = []
+            state = i
+            while state:
+                word.append(last[state])
+                state = parent[state]
+            accepting_words[i] = tuple(word[::-1])
+    
+    return array.array('i', machine), accepting_words
 
+def minimise(int alphabet_len, machine, labels):
+    ''' Return the minimal machine equivalent to the given flat transition table, using Hopcroft's algorithm.
+    
+    Two states are equivalent if reading any word from them passes through states with equal labels, where a
+    transition to -1 is treated as one to a sink state with a label of its own. Returns (machine, states) where
+    machine only has the states reachable from 0, numbered in breadth first order, and the new state i comes from
+    the state states[i] of the given machine. '''
+    cdef int n = len(machine) // alphabet_len
+    cdef int N = n + 1  # Including the sink.
+    cdef int state, target, letter, block, new_block, i, j, start, middle
+    cdef int blocks = 0
+    cdef size_t head = 0
+    cdef vector[int] transitions, reverse_starts, reverse_arrows
+    cdef vector[int] elements, location, block_of, block_start, block_end, marked
+    cdef vector[int] splitters, preimage, touched, new_machine, new_index, representatives
+    cdef vector[char] waiting
+    cdef array.array flat = array.array('i', machine)
+    
+    transitions.resize(N * alphabet_len)
+    for i in range(n * alphabet_len):
+        target = flat.data.as_ints[i]
+        transitions[i] = target if target >= 0 else n
+    for letter in range(alphabet_len):
+        transitions[n * alphabet_len + letter] = n
+    
+    # The reverse arrows, with those into state along letter in reverse_arrows[reverse_starts[letter * N + state]:reverse_starts[letter * N + state + 1]].
+    reverse_starts.assign(N * alphabet_len + 1, 0)
+    for state in range(N):
+        for letter in range(alphabet_len):
+            reverse_starts[letter * N + transitions[state * alphabet_len + letter] + 1] += 1
+    for i in range(N * alphabet_len):
+        reverse_starts[i + 1] += reverse_starts[i]
+    reverse_arrows.resize(N * alphabet_len)
+    for state in range(N):
+        for letter in range(alphabet_len):
+            i = letter * N + transitions[state * alphabet_len + letter]
+            reverse_arrows[reverse_starts[i]] = state
+            reverse_starts[i] += 1
+    for i in range(N * alphabet_len, 0, -1):  # Undo the shift caused by filling.
+        reverse_starts[i] = reverse_starts[i - 1]
+    reverse_starts[0] = 0
+    
+    # The initial partition, by label. Each block is a contiguous range of elements.
+    label_blocks = dict()
+    block_of.resize(N)
+    for state in range(n):
+        block_of[state] = label_blocks.setdefault(labels[state], len(label_blocks))
+    block_of[n] = len(label_blocks)
+    blocks = len(label_blocks) + 1
+    block_start.assign(blocks, 0)
+    for state in range(N):
+        block_start[block_of[state]] += 1
+    start = 0
+    for block in range(blocks):
+        start, block_start[block] = start + block_start[block], start
+    block_end = block_start
+    elements.resize(N)
+    location.resize(N)
+    for state in range(N):
+        location[state] = block_end[block_of[state]]
+        elements[location[state]] = state
+        block_end[block_of[state]] += 1
+    marked.assign(blocks, 0)
+    
+    waiting.assign(N * alphabet_len, 0)  # waiting[block * alphabet_len + letter] records whether (block, letter) is in splitters.
+    for block in range(blocks):
+        for letter in range(alphabet_len):
+            splitters.push_back(block * alphabet_len + letter)
+            waiting[block * alphabet_len + letter] = 1
+    
+    while not splitters.empty():
+        block, letter = splitters.back() // alphabet_len, splitters.back() % alphabet_len
+        splitters.pop_back()
+        waiting[block * alphabet_len + letter] = 0
+        
+        # The states that letter takes into block.
+        preimage.clear()
+        for i in range(block_start[block], block_end[block]):
+            target = letter * N + elements[i]
+            for j in range(reverse_starts[target], reverse_starts[target + 1]):
+                preimage.push_back(reverse_arrows[j])
+        
+        # Move these to the front of their blocks.
+        for state in preimage:
+            block = block_of[state]
+            middle = block_start[block] + marked[block]
+            if location[state] < middle: continue  # Already moved.
+            if marked[block] == 0: touched.push_back(block)
+            i = elements[middle]
+            elements[middle], elements[location[state]] = state, i
+            location[i], location[state] = location[state], middle
+            marked[block] += 1
+        
+        # Split each block met into the states moved and the rest.
+        for block in touched:
+            if marked[block] < block_end[block] - block_start[block]:
+                new_block = blocks
+                blocks += 1
+                block_start.push_back(block_start[block])
+                block_end.push_back(block_start[block] + marked[block])
+                marked.push_back(0)
+                block_start[block] = block_end[new_block]
+                for i in range(block_start[new_block], block_end[new_block]):
+                    block_of[elements[i]] = new_block
+                
+                for letter in range(alphabet_len):
+                    if waiting[block * alphabet_len + letter] or block_end[new_block] - block_start[new_block] <= block_end[block] - block_start[block]:
+                        splitters.push_back(new_block * alphabet_len + letter)
+                        waiting[new_block * alphabet_len + letter] = 1
+                    else:
+                        splitters.push_back(block * alphabet_len + letter)
+                        waiting[block * alphabet_len + letter] = 1
+            marked[block] = 0
+        touched.clear()
+    
+    # Number the blocks reachable from the start in breadth first order.
+    new_index.assign(blocks, -1)
+    new_index[block_of[0]] = 0
+    representatives.push_back(0)
+    while head < representatives.size():
+        state = representatives[head]
+        head += 1
+        for letter in range(alphabet_len):
+            target = transitions[state * alphabet_len + letter]
+            if target == n:
+                new_machine.push_back(-1)
+                continue
+            block = block_of[target]
+            if new_index[block] < 0:
+                new_index[block] = representatives.size()
+                representatives.push_back(elements[block_start[block]])
+            new_machine.push_back(new_index[block])
+    
+    return array.array('i', new_machine), list(representatives)
@@ -1,11 +1,14 @@
 
-from queue import Queue
-from collections import OrderedDict
-
-from .FSM import FSM
+from .FSM import FSM, aho_corasick, minimise
 from .first import FirstInClass
+from .homology import Homology
+from .tree import WordTree
 
-EMPTY_TUPLE = tuple()
+def minimal_FSM(alphabet, machine, yield_states):
+    ''' Return the minimal FSM that yields the same things as the one with the given flat transition table and yields. '''
+    labels = dict()  # Yields |--> label, keeping their order since FirstInClass explores in this order.
+    machine, states = minimise(len(alphabet), machine, [labels.setdefault(tuple(yield_states.get(state, [])), len(labels)) for state in range(len(machine) // len(alphabet))])
+    return FSM(alphabet, machine, dict((new_state, yield_states[state]) for new_state, state in enumerate(states) if yield_states.get(state)))
 
 def word_accepting_FSM(alphabet, acceptable_words, transform=lambda x: x):
     ''' Given an alphabet and a list of acceptable_words in that alphabet, this
@@ -16,67 +19,47 @@ def word_accepting_FSM(alphabet, acceptable_words, transform=lambda x: x):
     if '' in acceptable_words:
         raise ValueError('Empty word cannot be acceptable.')
     
-    machine = OrderedDict()
-    tree = Queue()
-    tree.put(EMPTY_TUPLE)
-    all_states = set([EMPTY_TUPLE])
+    index = dict((letter, i) for i, letter in enumerate(alphabet))
     acceptable_words_set = set(acceptable_words)
-    acceptable_words_prefixes_set = set(w[:i+1] for w in acceptable_words for i in range(len(w)))
-    accepting_states = dict()
+    machine, accepting = aho_corasick(len(alphabet), [[index[letter] for letter in word] for word in acceptable_words_set])
     
     suffixes = lambda word: set(word[j:] for j in range(len(word)))
     
-    # Now grow the machine.
-    while not tree.empty():
-        word = tree.get()
-        accepting_states[word] = set(transform(item) for item in suffixes(word).intersection(acceptable_words_set))
-        
-        state = dict()
-        
-        for letter in alphabet:
-            state[letter] = EMPTY_TUPLE
-            next_word = word + (letter,)
-            
-            for i in range(len(next_word)-1, -1, -1):
-                if next_word[-i-1:] in acceptable_words_prefixes_set:
-                    state[letter] = next_word[-i-1:]
-                    
-                    if state[letter] not in all_states:
-                        tree.put(state[letter])
-                        all_states.add(state[letter])
-                    
-                    break
-        
-        machine[word] = state
+    accepting_states = dict()
+    for state, word in accepting.items():
+        word = tuple(alphabet[letter] for letter in word)
+        accepting_states[state] = set(transform(item) for item in suffixes(word).intersection(acceptable_words_set))
     
-    return FSM.from_dicts(alphabet, machine, accepting_states)
+    return minimal_FSM(alphabet, machine, accepting_states)
 
 def action_FSM(actions, seeds, max_depth):
     ''' Generates a FSM detailing how action moves about all states within max_depth of a seed. '''
     
-    machine = OrderedDict()
-    to_check = Queue()
-    depths = dict()
+    alphabet = sorted(actions)
+    states = []  # In the order that they are found.
+    index = dict()  # state |--> place in states.
+    depths = []
     for seed in seeds:
-        if seed not in depths:
-            to_check.put(seed)
-            depths[seed] = 0
+        if seed not in index:
+            index[seed] = len(states)
+            states.append(seed)
+            depths.append(0)
     
-    while not to_check.empty():
-        current = to_check.get()
-        current_depth = depths[current]
-        
+    images = []
+    for current, current_depth in zip(states, depths):  # states grows as we go.
         # Determine the result of each action on current.
         arrows = dict()
         for letter, action in actions.items():  # We explore in every direction.
             arrows[letter] = action(current)
-            if current_depth < max_depth and arrows[letter] not in depths:
-                depths[arrows[letter]] = current_depth + 1
-                to_check.put(arrows[letter])
+            if current_depth < max_depth and arrows[letter] not in index:
+                index[arrows[letter]] = len(states)
+                states.append(arrows[letter])
+                depths.append(current_depth + 1)
         
-        machine[current] = arrows
+        images.extend(arrows[letter] for letter in alphabet)
     
-    return FSM.from_dicts(sorted(actions), machine, dict())
+    # The states of this machine are the things acted on, rather than a language, so it must not be minimised.
+    return FSM(alphabet, [index.get(image, -1) for image in images], dict())
 
 def CNF_FSM(alphabet, clauses):
     ''' Generate an FSM that determines whether a CNF is satisfied. '''
@@ -86,14 +69,7 @@ def CNF_FSM(alphabet, clauses):
     
     flags = dict((letter, sum(2**i for i, clause in enumerate(clauses) if letter in clause)) for letter in alphabet)
     
-    machine = OrderedDict()
+    machine = [state | flags[letter] for state in states for letter in alphabet]
     accepting_states = {states[-1]: [tuple()]}  # Just need to return something to make this a yield state.
-    for state in states:
-        arrows = dict()
-        for letter in alphabet:
-            arrows[letter] = state | flags[letter]
-        
-        machine[state] = arrows
     
-    return FSM.from_dicts(alphabet, machine, accepting_states)
-
+    return minimal_FSM(alphabet, machine, accepting_states)
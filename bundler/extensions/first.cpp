@@ -769,12 +769,15 @@ static CYTHON_INLINE float __PYX_NAN() {
 #define __PYX_HAVE__bundler__extensions__first
 #define __PYX_HAVE_API__bundler__extensions__first
 /* Early includes */
-#include <string.h>
-#include <stdlib.h>
+#include <stdint.h>
 #include "ios"
 #include "new"
 #include "stdexcept"
 #include "typeinfo"
+#include <vector>
+#include <string.h>
+#include <stdio.h>
+#include "pythread.h"
 #include <utility>
 
     #if __cplusplus >= 201103L || (defined(_MSC_VER) && _MSC_VER >= 1600)
@@ -788,11 +791,9 @@ static CYTHON_INLINE float __PYX_NAN() {
 
     #endif
     
+#include <stdlib.h>
 #include <queue>
 #include <set>
-#include <vector>
-#include <stdio.h>
-#include "pythread.h"
 #ifdef _OPENMP
 #include <omp.h>
 #endif /* _OPENMP */
@@ -1017,6 +1018,8 @@ struct arrayobject;
 typedef struct arrayobject arrayobject;
 #endif
 struct __pyx_obj_7bundler_10extensions_3FSM_FSM;
+struct __pyx_obj_7bundler_10extensions_3FSM_StatePath;
+struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap;
 struct __pyx_obj_7bundler_10extensions_5first_FirstInClass;
 struct __pyx_opt_args_7bundler_10extensions_3FSM_3FSM_c_hit;
 struct __pyx_opt_args_7bundler_10extensions_3FSM_3FSM_c_hits;
@@ -1030,43 +1033,64 @@ struct __pyx_opt_args_7bundler_10extensions_3FSM_3FSM_c_hits;
  */
 typedef std::vector<int>  __pyx_t_7bundler_10extensions_3FSM_IWord;
 
-/* "bundler/extensions/FSM.pxd":23
+/* "bundler/extensions/FSM.pxd":27
  *     cdef vector[int] yield_states2_starts
  * 
- *     cdef bint c_hit(self, IWord& word, int run=*)             # <<<<<<<<<<<<<<
+ *     cdef bint c_hit(self, IWord& word, int run=*, int longest=*)             # <<<<<<<<<<<<<<
  *     cdef vector[pair[int, IWord]] c_hits(self, IWord& word, int run=*)
- * 
+ *     cdef int c_distance(self, IWord& word)
  */
 struct __pyx_opt_args_7bundler_10extensions_3FSM_3FSM_c_hit {
   int __pyx_n;
   int run;
+  int longest;
 };
 
-/* "bundler/extensions/FSM.pxd":24
+/* "bundler/extensions/FSM.pxd":28
  * 
- *     cdef bint c_hit(self, IWord& word, int run=*)
+ *     cdef bint c_hit(self, IWord& word, int run=*, int longest=*)
  *     cdef vector[pair[int, IWord]] c_hits(self, IWord& word, int run=*)             # <<<<<<<<<<<<<<
- * 
+ *     cdef int c_distance(self, IWord& word)
+ *     cdef bint c_has_cycle(self, IWord& word, int depth)
  */
 struct __pyx_opt_args_7bundler_10extensions_3FSM_3FSM_c_hits {
   int __pyx_n;
   int run;
 };
+struct __pyx_opt_args_7bundler_10extensions_5first_12FirstInClass_c_is_first;
+
+/* "bundler/extensions/first.pxd":9
+ * 
+ * # The ways that c_is_first can finish, in the order that it tests for them.
+ * cdef enum:             # <<<<<<<<<<<<<<
+ *     FIC_BAD_PREFIX
+ *     FIC_BEATEN_BY_AUTOMORPH  # The word itself is beaten by one of its automorphs.
+ */
+enum  {
+  __pyx_e_7bundler_10extensions_5first_FIC_BAD_PREFIX,
+  __pyx_e_7bundler_10extensions_5first_FIC_BEATEN_BY_AUTOMORPH,
+  __pyx_e_7bundler_10extensions_5first_FIC_SIMPLER,
+  __pyx_e_7bundler_10extensions_5first_FIC_BEATEN,
+  __pyx_e_7bundler_10extensions_5first_FIC_EXHAUSTED,
+  __pyx_e_7bundler_10extensions_5first_FIC_FIRST,
+  __pyx_e_7bundler_10extensions_5first_FIC_OUTCOMES
+};
 
-/* "bundler/extensions/first.pyx":11
- * from bundler.extensions.FSM cimport FSM
- * 
- * ctypedef vector[int] IWord             # <<<<<<<<<<<<<<
- * 
- * cdef bint is_cyclic_ordered(int* A, int* B, int l, int* S, int* f):
+/* "bundler/extensions/first.pxd":53
+ *     cdef void c_insert_seen(self, uint64_t slot, uint64_t key)
+ *     cdef bint c_before_automorphs(self, IWord& word, IWord& next_word, bint prefix, int* tmp)
+ *     cdef bint c_is_first(self, IWord& wrd, bint prefix, int max_tree_size, bint check_bad_prefix=*)             # <<<<<<<<<<<<<<
  */
-typedef std::vector<int>  __pyx_t_7bundler_10extensions_5first_IWord;
+struct __pyx_opt_args_7bundler_10extensions_5first_12FirstInClass_c_is_first {
+  int __pyx_n;
+  int check_bad_prefix;
+};
 
 /* "bundler/extensions/FSM.pxd":11
  * ctypedef vector[int] IWord
  * 
  * cdef class FSM:             # <<<<<<<<<<<<<<
- *     cdef list alphabet
+ *     cdef readonly list alphabet
  *     cdef int alphabet_len
  */
 struct __pyx_obj_7bundler_10extensions_3FSM_FSM {
@@ -1075,17 +1099,53 @@ struct __pyx_obj_7bundler_10extensions_3FSM_FSM {
   PyObject *alphabet;
   int alphabet_len;
   arrayobject *machine;
+  void *table;
+  int itemsize;
   int machine_len;
   PyObject *yield_states;
   PyObject *distance_to_yield;
+  arrayobject *distances;
   arrayobject *has_yield;
+  arrayobject *shortest_yield;
   std::vector<__pyx_t_7bundler_10extensions_3FSM_IWord>  yield_states2;
   std::vector<int>  yield_states2_starts;
 };
 
 
-/* "bundler/extensions/first.pyx":53
- *     return True  # A == cycled(B)
+/* "bundler/extensions/FSM.pxd":33
+ * 
+ * 
+ * cdef class StatePath:             # <<<<<<<<<<<<<<
+ *     cdef FSM machine
+ *     cdef vector[int] states
+ */
+struct __pyx_obj_7bundler_10extensions_3FSM_StatePath {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_7bundler_10extensions_3FSM_StatePath *__pyx_vtab;
+  struct __pyx_obj_7bundler_10extensions_3FSM_FSM *machine;
+  std::vector<int>  states;
+  std::vector<int>  hits;
+};
+
+
+/* "bundler/extensions/FSM.pxd":45
+ *     cdef int c_distance(self)
+ * 
+ * cdef class TransitionMap:             # <<<<<<<<<<<<<<
+ *     cdef FSM machine
+ *     cdef int width
+ */
+struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_7bundler_10extensions_3FSM_TransitionMap *__pyx_vtab;
+  struct __pyx_obj_7bundler_10extensions_3FSM_FSM *machine;
+  int width;
+  std::vector<int>  maps;
+};
+
+
+/* "bundler/extensions/first.pxd":18
+ *     FIC_OUTCOMES
  * 
  * cdef class FirstInClass:             # <<<<<<<<<<<<<<
  *     cdef list alphabet
@@ -1109,6 +1169,14 @@ struct __pyx_obj_7bundler_10extensions_5first_FirstInClass {
   int *any_missing;
   int *missing;
   int *automorphisms;
+  int letter_bits;
+  int max_packed_length;
+  std::vector<uint64_t>  seen_table;
+  uint64_t seen_mask;
+  int seen_count;
+  std::vector<uint64_t>  packed_queue;
+  long outcomes[(2 * __pyx_e_7bundler_10extensions_5first_FIC_OUTCOMES)];
+  long explored[2];
 };
 
 
@@ -1117,27 +1185,69 @@ struct __pyx_obj_7bundler_10extensions_5first_FirstInClass {
  * ctypedef vector[int] IWord
  * 
  * cdef class FSM:             # <<<<<<<<<<<<<<
- *     cdef list alphabet
+ *     cdef readonly list alphabet
  *     cdef int alphabet_len
  */
 
 struct __pyx_vtabstruct_7bundler_10extensions_3FSM_FSM {
   int (*c_hit)(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *, __pyx_t_7bundler_10extensions_3FSM_IWord &, struct __pyx_opt_args_7bundler_10extensions_3FSM_3FSM_c_hit *__pyx_optional_args);
   std::vector<std::pair<int,__pyx_t_7bundler_10extensions_3FSM_IWord> >  (*c_hits)(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *, __pyx_t_7bundler_10extensions_3FSM_IWord &, struct __pyx_opt_args_7bundler_10extensions_3FSM_3FSM_c_hits *__pyx_optional_args);
+  int (*c_distance)(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *, __pyx_t_7bundler_10extensions_3FSM_IWord &);
+  int (*c_has_cycle)(struct __pyx_obj_7bundler_10extensions_3FSM_FSM *, __pyx_t_7bundler_10extensions_3FSM_IWord &, int);
 };
 static struct __pyx_vtabstruct_7bundler_10extensions_3FSM_FSM *__pyx_vtabptr_7bundler_10extensions_3FSM_FSM;
 
 
-/* "bundler/extensions/first.pyx":53
- *     return True  # A == cycled(B)
+/* "bundler/extensions/FSM.pxd":33
+ * 
+ * 
+ * cdef class StatePath:             # <<<<<<<<<<<<<<
+ *     cdef FSM machine
+ *     cdef vector[int] states
+ */
+
+struct __pyx_vtabstruct_7bundler_10extensions_3FSM_StatePath {
+  void (*c_push)(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *, int);
+  void (*c_truncate)(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *, int);
+  void (*c_sync)(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *, __pyx_t_7bundler_10extensions_3FSM_IWord &, int);
+  int (*c_state)(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *);
+  int (*c_hit)(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *);
+  int (*c_distance)(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath *);
+};
+static struct __pyx_vtabstruct_7bundler_10extensions_3FSM_StatePath *__pyx_vtabptr_7bundler_10extensions_3FSM_StatePath;
+
+
+/* "bundler/extensions/FSM.pxd":45
+ *     cdef int c_distance(self)
+ * 
+ * cdef class TransitionMap:             # <<<<<<<<<<<<<<
+ *     cdef FSM machine
+ *     cdef int width
+ */
+
+struct __pyx_vtabstruct_7bundler_10extensions_3FSM_TransitionMap {
+  void (*c_push)(struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *, int);
+  void (*c_truncate)(struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *, int);
+  void (*c_sync)(struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *, __pyx_t_7bundler_10extensions_3FSM_IWord &, int);
+  int (*c_has_fixed_point)(struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap *);
+};
+static struct __pyx_vtabstruct_7bundler_10extensions_3FSM_TransitionMap *__pyx_vtabptr_7bundler_10extensions_3FSM_TransitionMap;
+
+
+/* "bundler/extensions/first.pyx":91
+ *         free(tmp)
  * 
  * cdef class FirstInClass:             # <<<<<<<<<<<<<<
- *     cdef list alphabet
- *     cdef list o_inverse
+ *     def __init__(self, list alphabet, list inverse, int longest_relator, FSM find_balanced_relators_FSM, FSM bad_prefix_FSM, FSM simpler_FSM, list automorphisms):
+ *         cdef list missing, auto
  */
 
 struct __pyx_vtabstruct_7bundler_10extensions_5first_FirstInClass {
-  int (*c_before_automorphs)(struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *, __pyx_t_7bundler_10extensions_5first_IWord &, __pyx_t_7bundler_10extensions_5first_IWord &, int, int *);
+  void (*c_reset_seen)(struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *, int);
+  uint64_t (*c_find_slot)(struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *, uint64_t);
+  void (*c_insert_seen)(struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *, uint64_t, uint64_t);
+  int (*c_before_automorphs)(struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *, __pyx_t_7bundler_10extensions_3FSM_IWord &, __pyx_t_7bundler_10extensions_3FSM_IWord &, int, int *);
+  int (*c_is_first)(struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *, __pyx_t_7bundler_10extensions_3FSM_IWord &, int, int, struct __pyx_opt_args_7bundler_10extensions_5first_12FirstInClass_c_is_first *__pyx_optional_args);
 };
 static struct __pyx_vtabstruct_7bundler_10extensions_5first_FirstInClass *__pyx_vtabptr_7bundler_10extensions_5first_FirstInClass;
 
@@ -1323,6 +1433,55 @@ static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject
 #define __Pyx_ExceptionReset(type, value, tb)  PyErr_SetExcInfo(type, value, tb)
 #endif
 
+/* DivInt[long].proto */
+static CYTHON_INLINE long __Pyx_div_long(long, long);
+
+/* UnaryNegOverflows.proto */
+#define UNARY_NEG_WOULD_OVERFLOW(x)\
+        (((x) < 0) & ((unsigned long)(x) == 0-(unsigned long)(x)))
+
+/* PyIntBinop.proto */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyInt_AddObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check);
+#else
+#define __Pyx_PyInt_AddObjC(op1, op2, intval, inplace, zerodivision_check)\
+    (inplace ? PyNumber_InPlaceAdd(op1, op2) : PyNumber_Add(op1, op2))
+#endif
+
+/* PyObjectFormatSimple.proto */
+#if CYTHON_COMPILING_IN_PYPY
+    #define __Pyx_PyObject_FormatSimple(s, f) (\
+        likely(PyUnicode_CheckExact(s)) ? (Py_INCREF(s), s) :\
+        PyObject_Format(s, f))
+#elif PY_MAJOR_VERSION < 3
+    #define __Pyx_PyObject_FormatSimple(s, f) (\
+        likely(PyUnicode_CheckExact(s)) ? (Py_INCREF(s), s) :\
+        likely(PyString_CheckExact(s)) ? PyUnicode_FromEncodedObject(s, NULL, "strict") :\
+        PyObject_Format(s, f))
+#elif CYTHON_USE_TYPE_SLOTS
+    #define __Pyx_PyObject_FormatSimple(s, f) (\
+        likely(PyUnicode_CheckExact(s)) ? (Py_INCREF(s), s) :\
+        likely(PyLong_CheckExact(s)) ? PyLong_Type.tp_str(s) :\
+        likely(PyFloat_CheckExact(s)) ? PyFloat_Type.tp_str(s) :\
+        PyObject_Format(s, f))
+#else
+    #define __Pyx_PyObject_FormatSimple(s, f) (\
+        likely(PyUnicode_CheckExact(s)) ? (Py_INCREF(s), s) :\
+        PyObject_Format(s, f))
+#endif
+
+/* IncludeStringH.proto */
+#include <string.h>
+
+/* JoinPyUnicode.proto */
+static PyObject* __Pyx_PyUnicode_Join(PyObject* value_tuple, Py_ssize_t value_count, Py_ssize_t result_ulength,
+                                      Py_UCS4 max_char);
+
+/* WriteUnraisableException.proto */
+static void __Pyx_WriteUnraisable(const char *name, int clineno,
+                                  int lineno, const char *filename,
+                                  int full_traceback, int nogil);
+
 /* PyObject_GenericGetAttrNoDict.proto */
 #if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
 static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj, PyObject* attr_name);
@@ -1414,6 +1573,9 @@ static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object);
 static void __Pyx_AddTraceback(const char *funcname, int c_line,
                                int py_line, const char *filename);
 
+/* None.proto */
+#include <new>
+
 /* GCCDiagnostics.proto */
 #if defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 6))
 #define __Pyx_HAS_GCC_DIAGNOSTIC
@@ -1576,9 +1738,6 @@ static CYTHON_INLINE int resize_smart(arrayobject *self, Py_ssize_t n) {
 }
 #endif
 
-/* None.proto */
-#include <new>
-
 /* CIntFromPy.proto */
 static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
 
@@ -1610,19 +1769,13 @@ static int __Pyx_check_binary_version(void);
 /* InitStrings.proto */
 static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
 
-static int __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_before_automorphs(struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *__pyx_v_self, __pyx_t_7bundler_10extensions_5first_IWord &__pyx_v_word, __pyx_t_7bundler_10extensions_5first_IWord &__pyx_v_next_word, int __pyx_v_prefix, int *__pyx_v_tmp); /* proto*/
-
-/* Module declarations from 'libc.string' */
-
-/* Module declarations from 'libc.stdlib' */
-
-/* Module declarations from 'libcpp.utility' */
-
-/* Module declarations from 'libcpp.pair' */
-
-/* Module declarations from 'libcpp.queue' */
+static int __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_before_automorphs(struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *__pyx_v_self, __pyx_t_7bundler_10extensions_3FSM_IWord &__pyx_v_word, __pyx_t_7bundler_10extensions_3FSM_IWord &__pyx_v_next_word, int __pyx_v_prefix, int *__pyx_v_tmp); /* proto*/
+static void __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_reset_seen(struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *__pyx_v_self, int __pyx_v_max_tree_size); /* proto*/
+static uint64_t __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_find_slot(struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *__pyx_v_self, uint64_t __pyx_v_key); /* proto*/
+static void __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_insert_seen(struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *__pyx_v_self, uint64_t __pyx_v_slot, uint64_t __pyx_v_key); /* proto*/
+static int __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_is_first(struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *__pyx_v_self, __pyx_t_7bundler_10extensions_3FSM_IWord &__pyx_v_wrd, int __pyx_v_prefix, int __pyx_v_max_tree_size, struct __pyx_opt_args_7bundler_10extensions_5first_12FirstInClass_c_is_first *__pyx_optional_args); /* proto*/
 
-/* Module declarations from 'libcpp.set' */
+/* Module declarations from 'libc.stdint' */
 
 /* Module declarations from 'libcpp.vector' */
 
@@ -1633,6 +1786,8 @@ static int __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_before_automorp
 /* Module declarations from 'cpython.type' */
 static PyTypeObject *__pyx_ptype_7cpython_4type_type = 0;
 
+/* Module declarations from 'libc.string' */
+
 /* Module declarations from 'libc.stdio' */
 
 /* Module declarations from 'cpython.object' */
@@ -1713,11 +1868,27 @@ static PyTypeObject *__pyx_ptype_7cpython_7complex_complex = 0;
 static PyTypeObject *__pyx_ptype_7cpython_5array_array = 0;
 static CYTHON_INLINE int __pyx_f_7cpython_5array_extend_buffer(arrayobject *, char *, Py_ssize_t); /*proto*/
 
+/* Module declarations from 'libcpp.utility' */
+
+/* Module declarations from 'libcpp.pair' */
+
 /* Module declarations from 'bundler.extensions.FSM' */
 static PyTypeObject *__pyx_ptype_7bundler_10extensions_3FSM_FSM = 0;
+static PyTypeObject *__pyx_ptype_7bundler_10extensions_3FSM_StatePath = 0;
+static PyTypeObject *__pyx_ptype_7bundler_10extensions_3FSM_TransitionMap = 0;
+
+/* Module declarations from 'libc.stdlib' */
+
+/* Module declarations from 'libcpp.queue' */
+
+/* Module declarations from 'libcpp.set' */
 
 /* Module declarations from 'bundler.extensions.first' */
 static PyTypeObject *__pyx_ptype_7bundler_10extensions_5first_FirstInClass = 0;
+static uint64_t __pyx_v_7bundler_10extensions_5first_EMPTY_SLOT;
+static CYTHON_INLINE uint64_t __pyx_f_7bundler_10extensions_5first_pack(__pyx_t_7bundler_10extensions_3FSM_IWord &, int); /*proto*/
+static CYTHON_INLINE void __pyx_f_7bundler_10extensions_5first_unpack(uint64_t, __pyx_t_7bundler_10extensions_3FSM_IWord &, int); /*proto*/
+static CYTHON_INLINE uint64_t __pyx_f_7bundler_10extensions_5first_hash_key(uint64_t); /*proto*/
 static int __pyx_f_7bundler_10extensions_5first_is_cyclic_ordered(int *, int *, int, int *, int *); /*proto*/
 static std::vector<int>  __pyx_convert_vector_from_py_int(PyObject *); /*proto*/
 #define __Pyx_MODULE_NAME "bundler.extensions.first"
@@ -1726,16 +1897,30 @@ int __pyx_module_is_main_bundler__extensions__first = 0;
 
 /* Implementation of 'bundler.extensions.first' */
 static PyObject *__pyx_builtin_range;
+static PyObject *__pyx_builtin_enumerate;
 static PyObject *__pyx_builtin_MemoryError;
+static const char __pyx_k_[] = ".";
+static const char __pyx_k_A[] = "A";
+static const char __pyx_k_B[] = "B";
+static const char __pyx_k_i[] = "i";
+static const char __pyx_k_l[] = "l";
+static const char __pyx_k_tmp[] = "tmp";
 static const char __pyx_k_main[] = "__main__";
 static const char __pyx_k_name[] = "__name__";
 static const char __pyx_k_test[] = "__test__";
 static const char __pyx_k_word[] = "word";
 static const char __pyx_k_class[] = "__class__";
+static const char __pyx_k_first[] = "first";
 static const char __pyx_k_range[] = "range";
+static const char __pyx_k_beaten[] = "beaten";
 static const char __pyx_k_prefix[] = "prefix";
 static const char __pyx_k_inverse[] = "inverse";
+static const char __pyx_k_simpler[] = "simpler";
 static const char __pyx_k_alphabet[] = "alphabet";
+static const char __pyx_k_explored[] = ".explored";
+static const char __pyx_k_enumerate[] = "enumerate";
+static const char __pyx_k_exhausted[] = "exhausted";
+static const char __pyx_k_bad_prefix[] = "bad_prefix";
 static const char __pyx_k_pyx_vtable[] = "__pyx_vtable__";
 static const char __pyx_k_MemoryError[] = "MemoryError";
 static const char __pyx_k_simpler_FSM[] = "simpler_FSM";
@@ -1743,39 +1928,248 @@ static const char __pyx_k_FirstInClass[] = "FirstInClass";
 static const char __pyx_k_automorphisms[] = "automorphisms";
 static const char __pyx_k_max_tree_size[] = "max_tree_size";
 static const char __pyx_k_bad_prefix_FSM[] = "bad_prefix_FSM";
+static const char __pyx_k_cyclic_ordered[] = "cyclic_ordered";
 static const char __pyx_k_longest_relator[] = "longest_relator";
 static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
+static const char __pyx_k_beaten_by_automorph[] = "beaten_by_automorph";
+static const char __pyx_k_bundler_extensions_first[] = "bundler.extensions.first";
 static const char __pyx_k_find_balanced_relators_FSM[] = "find_balanced_relators_FSM";
+static const char __pyx_k_bundler_extensions_first_pyx[] = "bundler/extensions/first.pyx";
+static PyObject *__pyx_kp_u_;
+static PyObject *__pyx_n_s_A;
+static PyObject *__pyx_n_s_B;
 static PyObject *__pyx_n_s_FirstInClass;
 static PyObject *__pyx_n_s_MemoryError;
 static PyObject *__pyx_n_s_alphabet;
 static PyObject *__pyx_n_s_automorphisms;
+static PyObject *__pyx_n_u_bad_prefix;
 static PyObject *__pyx_n_s_bad_prefix_FSM;
+static PyObject *__pyx_n_u_beaten;
+static PyObject *__pyx_n_u_beaten_by_automorph;
+static PyObject *__pyx_n_s_bundler_extensions_first;
+static PyObject *__pyx_kp_s_bundler_extensions_first_pyx;
 static PyObject *__pyx_n_s_class;
 static PyObject *__pyx_n_s_cline_in_traceback;
+static PyObject *__pyx_n_s_cyclic_ordered;
+static PyObject *__pyx_n_s_enumerate;
+static PyObject *__pyx_n_u_exhausted;
+static PyObject *__pyx_kp_u_explored;
 static PyObject *__pyx_n_s_find_balanced_relators_FSM;
+static PyObject *__pyx_n_u_first;
+static PyObject *__pyx_n_s_i;
 static PyObject *__pyx_n_s_inverse;
+static PyObject *__pyx_n_s_l;
 static PyObject *__pyx_n_s_longest_relator;
 static PyObject *__pyx_n_s_main;
 static PyObject *__pyx_n_s_max_tree_size;
 static PyObject *__pyx_n_s_name;
 static PyObject *__pyx_n_s_prefix;
+static PyObject *__pyx_n_u_prefix;
 static PyObject *__pyx_n_s_pyx_vtable;
 static PyObject *__pyx_n_s_range;
+static PyObject *__pyx_n_u_simpler;
 static PyObject *__pyx_n_s_simpler_FSM;
 static PyObject *__pyx_n_s_test;
+static PyObject *__pyx_n_s_tmp;
 static PyObject *__pyx_n_s_word;
+static PyObject *__pyx_n_u_word;
+static PyObject *__pyx_pf_7bundler_10extensions_5first_cyclic_ordered(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_A, PyObject *__pyx_v_B); /* proto */
 static int __pyx_pf_7bundler_10extensions_5first_12FirstInClass___init__(struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *__pyx_v_self, PyObject *__pyx_v_alphabet, PyObject *__pyx_v_inverse, int __pyx_v_longest_relator, struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_find_balanced_relators_FSM, struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_bad_prefix_FSM, struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_simpler_FSM, PyObject *__pyx_v_automorphisms); /* proto */
 static PyObject *__pyx_pf_7bundler_10extensions_5first_12FirstInClass_2__reduce__(struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_7bundler_10extensions_5first_12FirstInClass_4__del__(struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_7bundler_10extensions_5first_12FirstInClass_6is_first(struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *__pyx_v_self, PyObject *__pyx_v_word, int __pyx_v_prefix, int __pyx_v_max_tree_size); /* proto */
+static PyObject *__pyx_pf_7bundler_10extensions_5first_12FirstInClass_6statistics(struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7bundler_10extensions_5first_12FirstInClass_8reset_statistics(struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7bundler_10extensions_5first_12FirstInClass_10is_first(struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *__pyx_v_self, PyObject *__pyx_v_word, int __pyx_v_prefix, int __pyx_v_max_tree_size); /* proto */
 static int __pyx_pf_7cpython_5array_5array___getbuffer__(arrayobject *__pyx_v_self, Py_buffer *__pyx_v_info, CYTHON_UNUSED int __pyx_v_flags); /* proto */
 static void __pyx_pf_7cpython_5array_5array_2__releasebuffer__(CYTHON_UNUSED arrayobject *__pyx_v_self, Py_buffer *__pyx_v_info); /* proto */
 static PyObject *__pyx_tp_new_7bundler_10extensions_5first_FirstInClass(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_int_0;
+static PyObject *__pyx_int_1;
+static PyObject *__pyx_tuple__2;
+static PyObject *__pyx_codeobj__3;
 /* Late includes */
 
-/* "bundler/extensions/first.pyx":13
- * ctypedef vector[int] IWord
+/* "bundler/extensions/first.pyx":15
+ * cdef uint64_t EMPTY_SLOT = 0xFFFFFFFFFFFFFFFFULL  # Packed words use at most 63 bits so this never clashes.
+ * 
+ * cdef inline uint64_t pack(IWord& word, int bits):             # <<<<<<<<<<<<<<
+ *     ''' Return the word packed into a single integer using bits bits per letter. '''
+ *     cdef uint64_t key = 0
+ */
+
+static CYTHON_INLINE uint64_t __pyx_f_7bundler_10extensions_5first_pack(__pyx_t_7bundler_10extensions_3FSM_IWord &__pyx_v_word, int __pyx_v_bits) {
+  uint64_t __pyx_v_key;
+  int __pyx_v_i;
+  uint64_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  __Pyx_RefNannySetupContext("pack", 0);
+
+  /* "bundler/extensions/first.pyx":17
+ * cdef inline uint64_t pack(IWord& word, int bits):
+ *     ''' Return the word packed into a single integer using bits bits per letter. '''
+ *     cdef uint64_t key = 0             # <<<<<<<<<<<<<<
+ *     cdef int i
+ *     for i in range(<int>word.size()):
+ */
+  __pyx_v_key = 0;
+
+  /* "bundler/extensions/first.pyx":19
+ *     cdef uint64_t key = 0
+ *     cdef int i
+ *     for i in range(<int>word.size()):             # <<<<<<<<<<<<<<
+ *         key |= (<uint64_t>word[i]) << (bits * i)
+ *     return key
+ */
+  __pyx_t_1 = ((int)__pyx_v_word.size());
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_i = __pyx_t_3;
+
+    /* "bundler/extensions/first.pyx":20
+ *     cdef int i
+ *     for i in range(<int>word.size()):
+ *         key |= (<uint64_t>word[i]) << (bits * i)             # <<<<<<<<<<<<<<
+ *     return key
+ * 
+ */
+    __pyx_v_key = (__pyx_v_key | (((uint64_t)(__pyx_v_word[__pyx_v_i])) << (__pyx_v_bits * __pyx_v_i)));
+  }
+
+  /* "bundler/extensions/first.pyx":21
+ *     for i in range(<int>word.size()):
+ *         key |= (<uint64_t>word[i]) << (bits * i)
+ *     return key             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void unpack(uint64_t key, IWord& word, int bits):
+ */
+  __pyx_r = __pyx_v_key;
+  goto __pyx_L0;
+
+  /* "bundler/extensions/first.pyx":15
+ * cdef uint64_t EMPTY_SLOT = 0xFFFFFFFFFFFFFFFFULL  # Packed words use at most 63 bits so this never clashes.
+ * 
+ * cdef inline uint64_t pack(IWord& word, int bits):             # <<<<<<<<<<<<<<
+ *     ''' Return the word packed into a single integer using bits bits per letter. '''
+ *     cdef uint64_t key = 0
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bundler/extensions/first.pyx":23
+ *     return key
+ * 
+ * cdef inline void unpack(uint64_t key, IWord& word, int bits):             # <<<<<<<<<<<<<<
+ *     ''' Unpack key into word, which must already have the correct length. '''
+ *     cdef uint64_t mask = (1 << bits) - 1
+ */
+
+static CYTHON_INLINE void __pyx_f_7bundler_10extensions_5first_unpack(uint64_t __pyx_v_key, __pyx_t_7bundler_10extensions_3FSM_IWord &__pyx_v_word, int __pyx_v_bits) {
+  uint64_t __pyx_v_mask;
+  int __pyx_v_i;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  __Pyx_RefNannySetupContext("unpack", 0);
+
+  /* "bundler/extensions/first.pyx":25
+ * cdef inline void unpack(uint64_t key, IWord& word, int bits):
+ *     ''' Unpack key into word, which must already have the correct length. '''
+ *     cdef uint64_t mask = (1 << bits) - 1             # <<<<<<<<<<<<<<
+ *     cdef int i
+ *     for i in range(<int>word.size()):
+ */
+  __pyx_v_mask = ((1 << __pyx_v_bits) - 1);
+
+  /* "bundler/extensions/first.pyx":27
+ *     cdef uint64_t mask = (1 << bits) - 1
+ *     cdef int i
+ *     for i in range(<int>word.size()):             # <<<<<<<<<<<<<<
+ *         word[i] = (key >> (bits * i)) & mask
+ * 
+ */
+  __pyx_t_1 = ((int)__pyx_v_word.size());
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_i = __pyx_t_3;
+
+    /* "bundler/extensions/first.pyx":28
+ *     cdef int i
+ *     for i in range(<int>word.size()):
+ *         word[i] = (key >> (bits * i)) & mask             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline uint64_t hash_key(uint64_t key):
+ */
+    (__pyx_v_word[__pyx_v_i]) = ((__pyx_v_key >> (__pyx_v_bits * __pyx_v_i)) & __pyx_v_mask);
+  }
+
+  /* "bundler/extensions/first.pyx":23
+ *     return key
+ * 
+ * cdef inline void unpack(uint64_t key, IWord& word, int bits):             # <<<<<<<<<<<<<<
+ *     ''' Unpack key into word, which must already have the correct length. '''
+ *     cdef uint64_t mask = (1 << bits) - 1
+ */
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "bundler/extensions/first.pyx":30
+ *         word[i] = (key >> (bits * i)) & mask
+ * 
+ * cdef inline uint64_t hash_key(uint64_t key):             # <<<<<<<<<<<<<<
+ *     ''' A cheap mixing function (Fibonacci hashing) so consecutive keys spread across the table. '''
+ *     key *= 0x9E3779B97F4A7C15ULL
+ */
+
+static CYTHON_INLINE uint64_t __pyx_f_7bundler_10extensions_5first_hash_key(uint64_t __pyx_v_key) {
+  uint64_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("hash_key", 0);
+
+  /* "bundler/extensions/first.pyx":32
+ * cdef inline uint64_t hash_key(uint64_t key):
+ *     ''' A cheap mixing function (Fibonacci hashing) so consecutive keys spread across the table. '''
+ *     key *= 0x9E3779B97F4A7C15ULL             # <<<<<<<<<<<<<<
+ *     return key ^ (key >> 32)
+ * 
+ */
+  __pyx_v_key = (__pyx_v_key * 0x9E3779B97F4A7C15ULL);
+
+  /* "bundler/extensions/first.pyx":33
+ *     ''' A cheap mixing function (Fibonacci hashing) so consecutive keys spread across the table. '''
+ *     key *= 0x9E3779B97F4A7C15ULL
+ *     return key ^ (key >> 32)             # <<<<<<<<<<<<<<
+ * 
+ * cdef bint is_cyclic_ordered(int* A, int* B, int l, int* S, int* f):
+ */
+  __pyx_r = (__pyx_v_key ^ (__pyx_v_key >> 32));
+  goto __pyx_L0;
+
+  /* "bundler/extensions/first.pyx":30
+ *         word[i] = (key >> (bits * i)) & mask
+ * 
+ * cdef inline uint64_t hash_key(uint64_t key):             # <<<<<<<<<<<<<<
+ *     ''' A cheap mixing function (Fibonacci hashing) so consecutive keys spread across the table. '''
+ *     key *= 0x9E3779B97F4A7C15ULL
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bundler/extensions/first.pyx":35
+ *     return key ^ (key >> 32)
  * 
  * cdef bint is_cyclic_ordered(int* A, int* B, int l, int* S, int* f):             # <<<<<<<<<<<<<<
  *     ''' Return whether A is <= all cyclic perumtations of B.
@@ -1797,7 +2191,7 @@ static int __pyx_f_7bundler_10extensions_5first_is_cyclic_ordered(int *__pyx_v_A
   int __pyx_t_5;
   __Pyx_RefNannySetupContext("is_cyclic_ordered", 0);
 
-  /* "bundler/extensions/first.pyx":20
+  /* "bundler/extensions/first.pyx":42
  *     # Use Booths algorithm to find j, the best starting point. See:
  *     # https://en.wikipedia.org/wiki/Lexicographically_minimal_string_rotation#Booth's_Algorithm
  *     cdef int i, j = 0, last, ll = 2 * l             # <<<<<<<<<<<<<<
@@ -1807,7 +2201,7 @@ static int __pyx_f_7bundler_10extensions_5first_is_cyclic_ordered(int *__pyx_v_A
   __pyx_v_j = 0;
   __pyx_v_ll = (2 * __pyx_v_l);
 
-  /* "bundler/extensions/first.pyx":22
+  /* "bundler/extensions/first.pyx":44
  *     cdef int i, j = 0, last, ll = 2 * l
  * 
  *     for i in range(l):  # S = B + B             # <<<<<<<<<<<<<<
@@ -1819,7 +2213,7 @@ static int __pyx_f_7bundler_10extensions_5first_is_cyclic_ordered(int *__pyx_v_A
   for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
     __pyx_v_i = __pyx_t_3;
 
-    /* "bundler/extensions/first.pyx":23
+    /* "bundler/extensions/first.pyx":45
  * 
  *     for i in range(l):  # S = B + B
  *         S[i] = S[i+l] = B[i]             # <<<<<<<<<<<<<<
@@ -1830,7 +2224,7 @@ static int __pyx_f_7bundler_10extensions_5first_is_cyclic_ordered(int *__pyx_v_A
     (__pyx_v_S[(__pyx_v_i + __pyx_v_l)]) = (__pyx_v_B[__pyx_v_i]);
   }
 
-  /* "bundler/extensions/first.pyx":24
+  /* "bundler/extensions/first.pyx":46
  *     for i in range(l):  # S = B + B
  *         S[i] = S[i+l] = B[i]
  *     for i in range(ll):  # f = [-1] * len(S)             # <<<<<<<<<<<<<<
@@ -1842,7 +2236,7 @@ static int __pyx_f_7bundler_10extensions_5first_is_cyclic_ordered(int *__pyx_v_A
   for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
     __pyx_v_i = __pyx_t_3;
 
-    /* "bundler/extensions/first.pyx":25
+    /* "bundler/extensions/first.pyx":47
  *         S[i] = S[i+l] = B[i]
  *     for i in range(ll):  # f = [-1] * len(S)
  *         f[i] = -1             # <<<<<<<<<<<<<<
@@ -1852,7 +2246,7 @@ static int __pyx_f_7bundler_10extensions_5first_is_cyclic_ordered(int *__pyx_v_A
     (__pyx_v_f[__pyx_v_i]) = -1;
   }
 
-  /* "bundler/extensions/first.pyx":27
+  /* "bundler/extensions/first.pyx":49
  *         f[i] = -1
  * 
  *     for i in range(1, ll):             # <<<<<<<<<<<<<<
@@ -1864,7 +2258,7 @@ static int __pyx_f_7bundler_10extensions_5first_is_cyclic_ordered(int *__pyx_v_A
   for (__pyx_t_3 = 1; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
     __pyx_v_i = __pyx_t_3;
 
-    /* "bundler/extensions/first.pyx":28
+    /* "bundler/extensions/first.pyx":50
  * 
  *     for i in range(1, ll):
  *         si = S[i]             # <<<<<<<<<<<<<<
@@ -1873,7 +2267,7 @@ static int __pyx_f_7bundler_10extensions_5first_is_cyclic_ordered(int *__pyx_v_A
  */
     __pyx_v_si = (__pyx_v_S[__pyx_v_i]);
 
-    /* "bundler/extensions/first.pyx":29
+    /* "bundler/extensions/first.pyx":51
  *     for i in range(1, ll):
  *         si = S[i]
  *         last = f[i - j - 1]             # <<<<<<<<<<<<<<
@@ -1882,7 +2276,7 @@ static int __pyx_f_7bundler_10extensions_5first_is_cyclic_ordered(int *__pyx_v_A
  */
     __pyx_v_last = (__pyx_v_f[((__pyx_v_i - __pyx_v_j) - 1)]);
 
-    /* "bundler/extensions/first.pyx":30
+    /* "bundler/extensions/first.pyx":52
  *         si = S[i]
  *         last = f[i - j - 1]
  *         while last != -1 and si != S[j + last + 1]:             # <<<<<<<<<<<<<<
@@ -1901,7 +2295,7 @@ static int __pyx_f_7bundler_10extensions_5first_is_cyclic_ordered(int *__pyx_v_A
       __pyx_L11_bool_binop_done:;
       if (!__pyx_t_4) break;
 
-      /* "bundler/extensions/first.pyx":31
+      /* "bundler/extensions/first.pyx":53
  *         last = f[i - j - 1]
  *         while last != -1 and si != S[j + last + 1]:
  *             if si < S[j + last + 1]:             # <<<<<<<<<<<<<<
@@ -1911,7 +2305,7 @@ static int __pyx_f_7bundler_10extensions_5first_is_cyclic_ordered(int *__pyx_v_A
       __pyx_t_4 = ((__pyx_v_si < (__pyx_v_S[((__pyx_v_j + __pyx_v_last) + 1)])) != 0);
       if (__pyx_t_4) {
 
-        /* "bundler/extensions/first.pyx":32
+        /* "bundler/extensions/first.pyx":54
  *         while last != -1 and si != S[j + last + 1]:
  *             if si < S[j + last + 1]:
  *                 j = i - last - 1             # <<<<<<<<<<<<<<
@@ -1920,7 +2314,7 @@ static int __pyx_f_7bundler_10extensions_5first_is_cyclic_ordered(int *__pyx_v_A
  */
         __pyx_v_j = ((__pyx_v_i - __pyx_v_last) - 1);
 
-        /* "bundler/extensions/first.pyx":31
+        /* "bundler/extensions/first.pyx":53
  *         last = f[i - j - 1]
  *         while last != -1 and si != S[j + last + 1]:
  *             if si < S[j + last + 1]:             # <<<<<<<<<<<<<<
@@ -1929,7 +2323,7 @@ static int __pyx_f_7bundler_10extensions_5first_is_cyclic_ordered(int *__pyx_v_A
  */
       }
 
-      /* "bundler/extensions/first.pyx":33
+      /* "bundler/extensions/first.pyx":55
  *             if si < S[j + last + 1]:
  *                 j = i - last - 1
  *             last = f[last]             # <<<<<<<<<<<<<<
@@ -1939,7 +2333,7 @@ static int __pyx_f_7bundler_10extensions_5first_is_cyclic_ordered(int *__pyx_v_A
       __pyx_v_last = (__pyx_v_f[__pyx_v_last]);
     }
 
-    /* "bundler/extensions/first.pyx":34
+    /* "bundler/extensions/first.pyx":56
  *                 j = i - last - 1
  *             last = f[last]
  *         if si != S[j + last + 1]:             # <<<<<<<<<<<<<<
@@ -1949,7 +2343,7 @@ static int __pyx_f_7bundler_10extensions_5first_is_cyclic_ordered(int *__pyx_v_A
     __pyx_t_4 = ((__pyx_v_si != (__pyx_v_S[((__pyx_v_j + __pyx_v_last) + 1)])) != 0);
     if (__pyx_t_4) {
 
-      /* "bundler/extensions/first.pyx":35
+      /* "bundler/extensions/first.pyx":57
  *             last = f[last]
  *         if si != S[j + last + 1]:
  *             if si < S[j]:  # j+last+1 = j             # <<<<<<<<<<<<<<
@@ -1959,7 +2353,7 @@ static int __pyx_f_7bundler_10extensions_5first_is_cyclic_ordered(int *__pyx_v_A
       __pyx_t_4 = ((__pyx_v_si < (__pyx_v_S[__pyx_v_j])) != 0);
       if (__pyx_t_4) {
 
-        /* "bundler/extensions/first.pyx":36
+        /* "bundler/extensions/first.pyx":58
  *         if si != S[j + last + 1]:
  *             if si < S[j]:  # j+last+1 = j
  *                 j = i             # <<<<<<<<<<<<<<
@@ -1968,7 +2362,7 @@ static int __pyx_f_7bundler_10extensions_5first_is_cyclic_ordered(int *__pyx_v_A
  */
         __pyx_v_j = __pyx_v_i;
 
-        /* "bundler/extensions/first.pyx":35
+        /* "bundler/extensions/first.pyx":57
  *             last = f[last]
  *         if si != S[j + last + 1]:
  *             if si < S[j]:  # j+last+1 = j             # <<<<<<<<<<<<<<
@@ -1977,7 +2371,7 @@ static int __pyx_f_7bundler_10extensions_5first_is_cyclic_ordered(int *__pyx_v_A
  */
       }
 
-      /* "bundler/extensions/first.pyx":37
+      /* "bundler/extensions/first.pyx":59
  *             if si < S[j]:  # j+last+1 = j
  *                 j = i
  *             f[i - j] = -1             # <<<<<<<<<<<<<<
@@ -1986,7 +2380,7 @@ static int __pyx_f_7bundler_10extensions_5first_is_cyclic_ordered(int *__pyx_v_A
  */
       (__pyx_v_f[(__pyx_v_i - __pyx_v_j)]) = -1;
 
-      /* "bundler/extensions/first.pyx":34
+      /* "bundler/extensions/first.pyx":56
  *                 j = i - last - 1
  *             last = f[last]
  *         if si != S[j + last + 1]:             # <<<<<<<<<<<<<<
@@ -1996,7 +2390,7 @@ static int __pyx_f_7bundler_10extensions_5first_is_cyclic_ordered(int *__pyx_v_A
       goto __pyx_L14;
     }
 
-    /* "bundler/extensions/first.pyx":39
+    /* "bundler/extensions/first.pyx":61
  *             f[i - j] = -1
  *         else:
  *             f[i - j] = last + 1             # <<<<<<<<<<<<<<
@@ -2009,7 +2403,7 @@ static int __pyx_f_7bundler_10extensions_5first_is_cyclic_ordered(int *__pyx_v_A
     __pyx_L14:;
   }
 
-  /* "bundler/extensions/first.pyx":42
+  /* "bundler/extensions/first.pyx":64
  * 
  *     # Compare A to the (inplace) cycled B.
  *     for i in range(l):             # <<<<<<<<<<<<<<
@@ -2021,7 +2415,7 @@ static int __pyx_f_7bundler_10extensions_5first_is_cyclic_ordered(int *__pyx_v_A
   for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
     __pyx_v_i = __pyx_t_3;
 
-    /* "bundler/extensions/first.pyx":43
+    /* "bundler/extensions/first.pyx":65
  *     # Compare A to the (inplace) cycled B.
  *     for i in range(l):
  *         if A[i] < B[j]:             # <<<<<<<<<<<<<<
@@ -2031,7 +2425,7 @@ static int __pyx_f_7bundler_10extensions_5first_is_cyclic_ordered(int *__pyx_v_A
     __pyx_t_4 = (((__pyx_v_A[__pyx_v_i]) < (__pyx_v_B[__pyx_v_j])) != 0);
     if (__pyx_t_4) {
 
-      /* "bundler/extensions/first.pyx":44
+      /* "bundler/extensions/first.pyx":66
  *     for i in range(l):
  *         if A[i] < B[j]:
  *             return True  # A < cycled(B)             # <<<<<<<<<<<<<<
@@ -2041,7 +2435,7 @@ static int __pyx_f_7bundler_10extensions_5first_is_cyclic_ordered(int *__pyx_v_A
       __pyx_r = 1;
       goto __pyx_L0;
 
-      /* "bundler/extensions/first.pyx":43
+      /* "bundler/extensions/first.pyx":65
  *     # Compare A to the (inplace) cycled B.
  *     for i in range(l):
  *         if A[i] < B[j]:             # <<<<<<<<<<<<<<
@@ -2050,7 +2444,7 @@ static int __pyx_f_7bundler_10extensions_5first_is_cyclic_ordered(int *__pyx_v_A
  */
     }
 
-    /* "bundler/extensions/first.pyx":45
+    /* "bundler/extensions/first.pyx":67
  *         if A[i] < B[j]:
  *             return True  # A < cycled(B)
  *         elif A[i] > B[j]:             # <<<<<<<<<<<<<<
@@ -2060,7 +2454,7 @@ static int __pyx_f_7bundler_10extensions_5first_is_cyclic_ordered(int *__pyx_v_A
     __pyx_t_4 = (((__pyx_v_A[__pyx_v_i]) > (__pyx_v_B[__pyx_v_j])) != 0);
     if (__pyx_t_4) {
 
-      /* "bundler/extensions/first.pyx":46
+      /* "bundler/extensions/first.pyx":68
  *             return True  # A < cycled(B)
  *         elif A[i] > B[j]:
  *             return False  # A > cycled(B)             # <<<<<<<<<<<<<<
@@ -2070,7 +2464,7 @@ static int __pyx_f_7bundler_10extensions_5first_is_cyclic_ordered(int *__pyx_v_A
       __pyx_r = 0;
       goto __pyx_L0;
 
-      /* "bundler/extensions/first.pyx":45
+      /* "bundler/extensions/first.pyx":67
  *         if A[i] < B[j]:
  *             return True  # A < cycled(B)
  *         elif A[i] > B[j]:             # <<<<<<<<<<<<<<
@@ -2079,7 +2473,7 @@ static int __pyx_f_7bundler_10extensions_5first_is_cyclic_ordered(int *__pyx_v_A
  */
     }
 
-    /* "bundler/extensions/first.pyx":47
+    /* "bundler/extensions/first.pyx":69
  *         elif A[i] > B[j]:
  *             return False  # A > cycled(B)
  *         j += 1             # <<<<<<<<<<<<<<
@@ -2088,7 +2482,7 @@ static int __pyx_f_7bundler_10extensions_5first_is_cyclic_ordered(int *__pyx_v_A
  */
     __pyx_v_j = (__pyx_v_j + 1);
 
-    /* "bundler/extensions/first.pyx":48
+    /* "bundler/extensions/first.pyx":70
  *             return False  # A > cycled(B)
  *         j += 1
  *         if j == l:  # Wrap around.             # <<<<<<<<<<<<<<
@@ -2098,7 +2492,7 @@ static int __pyx_f_7bundler_10extensions_5first_is_cyclic_ordered(int *__pyx_v_A
     __pyx_t_4 = ((__pyx_v_j == __pyx_v_l) != 0);
     if (__pyx_t_4) {
 
-      /* "bundler/extensions/first.pyx":49
+      /* "bundler/extensions/first.pyx":71
  *         j += 1
  *         if j == l:  # Wrap around.
  *             j = 0             # <<<<<<<<<<<<<<
@@ -2107,7 +2501,7 @@ static int __pyx_f_7bundler_10extensions_5first_is_cyclic_ordered(int *__pyx_v_A
  */
       __pyx_v_j = 0;
 
-      /* "bundler/extensions/first.pyx":48
+      /* "bundler/extensions/first.pyx":70
  *             return False  # A > cycled(B)
  *         j += 1
  *         if j == l:  # Wrap around.             # <<<<<<<<<<<<<<
@@ -2117,18 +2511,18 @@ static int __pyx_f_7bundler_10extensions_5first_is_cyclic_ordered(int *__pyx_v_A
     }
   }
 
-  /* "bundler/extensions/first.pyx":51
+  /* "bundler/extensions/first.pyx":73
  *             j = 0
  * 
  *     return True  # A == cycled(B)             # <<<<<<<<<<<<<<
  * 
- * cdef class FirstInClass:
+ * def cyclic_ordered(tuple A, tuple B):
  */
   __pyx_r = 1;
   goto __pyx_L0;
 
-  /* "bundler/extensions/first.pyx":13
- * ctypedef vector[int] IWord
+  /* "bundler/extensions/first.pyx":35
+ *     return key ^ (key >> 32)
  * 
  * cdef bint is_cyclic_ordered(int* A, int* B, int l, int* S, int* f):             # <<<<<<<<<<<<<<
  *     ''' Return whether A is <= all cyclic perumtations of B.
@@ -2141,47 +2535,34 @@ static int __pyx_f_7bundler_10extensions_5first_is_cyclic_ordered(int *__pyx_v_A
   return __pyx_r;
 }
 
-/* "bundler/extensions/first.pyx":71
- *     cdef int* automorphisms
+/* "bundler/extensions/first.pyx":75
+ *     return True  # A == cycled(B)
+ * 
+ * def cyclic_ordered(tuple A, tuple B):             # <<<<<<<<<<<<<<
+ *     ''' Return whether A is <= all cyclic permutations of B, which must be the same length.
  * 
- *     def __init__(self, list alphabet, list inverse, int longest_relator, FSM find_balanced_relators_FSM, FSM bad_prefix_FSM, FSM simpler_FSM, list automorphisms):             # <<<<<<<<<<<<<<
- *         cdef list missing, auto
- *         cdef int i, j
  */
 
 /* Python wrapper */
-static int __pyx_pw_7bundler_10extensions_5first_12FirstInClass_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pw_7bundler_10extensions_5first_12FirstInClass_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_alphabet = 0;
-  PyObject *__pyx_v_inverse = 0;
-  int __pyx_v_longest_relator;
-  struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_find_balanced_relators_FSM = 0;
-  struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_bad_prefix_FSM = 0;
-  struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_simpler_FSM = 0;
-  PyObject *__pyx_v_automorphisms = 0;
+static PyObject *__pyx_pw_7bundler_10extensions_5first_1cyclic_ordered(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_7bundler_10extensions_5first_cyclic_ordered[] = " Return whether A is <= all cyclic permutations of B, which must be the same length.\n    \n    This exposes is_cyclic_ordered to Python so that it can be checked and benchmarked. ";
+static PyMethodDef __pyx_mdef_7bundler_10extensions_5first_1cyclic_ordered = {"cyclic_ordered", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_7bundler_10extensions_5first_1cyclic_ordered, METH_VARARGS|METH_KEYWORDS, __pyx_doc_7bundler_10extensions_5first_cyclic_ordered};
+static PyObject *__pyx_pw_7bundler_10extensions_5first_1cyclic_ordered(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_A = 0;
+  PyObject *__pyx_v_B = 0;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  int __pyx_r;
+  PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
+  __Pyx_RefNannySetupContext("cyclic_ordered (wrapper)", 0);
   {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_alphabet,&__pyx_n_s_inverse,&__pyx_n_s_longest_relator,&__pyx_n_s_find_balanced_relators_FSM,&__pyx_n_s_bad_prefix_FSM,&__pyx_n_s_simpler_FSM,&__pyx_n_s_automorphisms,0};
-    PyObject* values[7] = {0,0,0,0,0,0,0};
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_A,&__pyx_n_s_B,0};
+    PyObject* values[2] = {0,0};
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
       switch (pos_args) {
-        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
-        CYTHON_FALLTHROUGH;
-        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
-        CYTHON_FALLTHROUGH;
-        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
-        CYTHON_FALLTHROUGH;
-        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-        CYTHON_FALLTHROUGH;
-        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-        CYTHON_FALLTHROUGH;
         case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
         CYTHON_FALLTHROUGH;
         case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
@@ -2192,62 +2573,369 @@ static int __pyx_pw_7bundler_10extensions_5first_12FirstInClass_1__init__(PyObje
       kw_args = PyDict_Size(__pyx_kwds);
       switch (pos_args) {
         case  0:
-        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_alphabet)) != 0)) kw_args--;
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_A)) != 0)) kw_args--;
         else goto __pyx_L5_argtuple_error;
         CYTHON_FALLTHROUGH;
         case  1:
-        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_inverse)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 7, 7, 1); __PYX_ERR(0, 71, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  2:
-        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_longest_relator)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 7, 7, 2); __PYX_ERR(0, 71, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  3:
-        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_find_balanced_relators_FSM)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 7, 7, 3); __PYX_ERR(0, 71, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  4:
-        if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_bad_prefix_FSM)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 7, 7, 4); __PYX_ERR(0, 71, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  5:
-        if (likely((values[5] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_simpler_FSM)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 7, 7, 5); __PYX_ERR(0, 71, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  6:
-        if (likely((values[6] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_automorphisms)) != 0)) kw_args--;
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_B)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 7, 7, 6); __PYX_ERR(0, 71, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("cyclic_ordered", 1, 2, 2, 1); __PYX_ERR(0, 75, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 71, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "cyclic_ordered") < 0)) __PYX_ERR(0, 75, __pyx_L3_error)
       }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 7) {
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
       values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
-      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
-      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
     }
-    __pyx_v_alphabet = ((PyObject*)values[0]);
-    __pyx_v_inverse = ((PyObject*)values[1]);
-    __pyx_v_longest_relator = __Pyx_PyInt_As_int(values[2]); if (unlikely((__pyx_v_longest_relator == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 71, __pyx_L3_error)
+    __pyx_v_A = ((PyObject*)values[0]);
+    __pyx_v_B = ((PyObject*)values[1]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("cyclic_ordered", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 75, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("bundler.extensions.first.cyclic_ordered", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_A), (&PyTuple_Type), 1, "A", 1))) __PYX_ERR(0, 75, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_B), (&PyTuple_Type), 1, "B", 1))) __PYX_ERR(0, 75, __pyx_L1_error)
+  __pyx_r = __pyx_pf_7bundler_10extensions_5first_cyclic_ordered(__pyx_self, __pyx_v_A, __pyx_v_B);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7bundler_10extensions_5first_cyclic_ordered(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_A, PyObject *__pyx_v_B) {
+  int __pyx_v_l;
+  int __pyx_v_i;
+  int *__pyx_v_tmp;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_t_7;
+  char const *__pyx_t_8;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  PyObject *__pyx_t_12 = NULL;
+  PyObject *__pyx_t_13 = NULL;
+  PyObject *__pyx_t_14 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("cyclic_ordered", 0);
+
+  /* "bundler/extensions/first.pyx":79
+ * 
+ *     This exposes is_cyclic_ordered to Python so that it can be checked and benchmarked. '''
+ *     assert len(A) == len(B)             # <<<<<<<<<<<<<<
+ *     cdef int l = len(A)
+ *     cdef int i
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(!Py_OptimizeFlag)) {
+    if (unlikely(__pyx_v_A == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+      __PYX_ERR(0, 79, __pyx_L1_error)
+    }
+    __pyx_t_1 = PyTuple_GET_SIZE(__pyx_v_A); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 79, __pyx_L1_error)
+    if (unlikely(__pyx_v_B == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+      __PYX_ERR(0, 79, __pyx_L1_error)
+    }
+    __pyx_t_2 = PyTuple_GET_SIZE(__pyx_v_B); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 79, __pyx_L1_error)
+    if (unlikely(!((__pyx_t_1 == __pyx_t_2) != 0))) {
+      PyErr_SetNone(PyExc_AssertionError);
+      __PYX_ERR(0, 79, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "bundler/extensions/first.pyx":80
+ *     This exposes is_cyclic_ordered to Python so that it can be checked and benchmarked. '''
+ *     assert len(A) == len(B)
+ *     cdef int l = len(A)             # <<<<<<<<<<<<<<
+ *     cdef int i
+ *     cdef int* tmp = <int *> calloc(6*l + 1, sizeof(int))
+ */
+  if (unlikely(__pyx_v_A == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 80, __pyx_L1_error)
+  }
+  __pyx_t_2 = PyTuple_GET_SIZE(__pyx_v_A); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 80, __pyx_L1_error)
+  __pyx_v_l = __pyx_t_2;
+
+  /* "bundler/extensions/first.pyx":82
+ *     cdef int l = len(A)
+ *     cdef int i
+ *     cdef int* tmp = <int *> calloc(6*l + 1, sizeof(int))             # <<<<<<<<<<<<<<
+ *     try:
+ *         for i in range(l):
+ */
+  __pyx_v_tmp = ((int *)calloc(((6 * __pyx_v_l) + 1), (sizeof(int))));
+
+  /* "bundler/extensions/first.pyx":83
+ *     cdef int i
+ *     cdef int* tmp = <int *> calloc(6*l + 1, sizeof(int))
+ *     try:             # <<<<<<<<<<<<<<
+ *         for i in range(l):
+ *             tmp[i] = A[i]
+ */
+  /*try:*/ {
+
+    /* "bundler/extensions/first.pyx":84
+ *     cdef int* tmp = <int *> calloc(6*l + 1, sizeof(int))
+ *     try:
+ *         for i in range(l):             # <<<<<<<<<<<<<<
+ *             tmp[i] = A[i]
+ *             tmp[l + i] = B[i]
+ */
+    __pyx_t_3 = __pyx_v_l;
+    __pyx_t_4 = __pyx_t_3;
+    for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+      __pyx_v_i = __pyx_t_5;
+
+      /* "bundler/extensions/first.pyx":85
+ *     try:
+ *         for i in range(l):
+ *             tmp[i] = A[i]             # <<<<<<<<<<<<<<
+ *             tmp[l + i] = B[i]
+ *         return is_cyclic_ordered(tmp, tmp + l, l, tmp + 2*l, tmp + 4*l)
+ */
+      if (unlikely(__pyx_v_A == Py_None)) {
+        PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+        __PYX_ERR(0, 85, __pyx_L4_error)
+      }
+      __pyx_t_6 = __Pyx_GetItemInt_Tuple(__pyx_v_A, __pyx_v_i, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 85, __pyx_L4_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_t_7 = __Pyx_PyInt_As_int(__pyx_t_6); if (unlikely((__pyx_t_7 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 85, __pyx_L4_error)
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      (__pyx_v_tmp[__pyx_v_i]) = __pyx_t_7;
+
+      /* "bundler/extensions/first.pyx":86
+ *         for i in range(l):
+ *             tmp[i] = A[i]
+ *             tmp[l + i] = B[i]             # <<<<<<<<<<<<<<
+ *         return is_cyclic_ordered(tmp, tmp + l, l, tmp + 2*l, tmp + 4*l)
+ *     finally:
+ */
+      if (unlikely(__pyx_v_B == Py_None)) {
+        PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+        __PYX_ERR(0, 86, __pyx_L4_error)
+      }
+      __pyx_t_6 = __Pyx_GetItemInt_Tuple(__pyx_v_B, __pyx_v_i, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 86, __pyx_L4_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_t_7 = __Pyx_PyInt_As_int(__pyx_t_6); if (unlikely((__pyx_t_7 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 86, __pyx_L4_error)
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      (__pyx_v_tmp[(__pyx_v_l + __pyx_v_i)]) = __pyx_t_7;
+    }
+
+    /* "bundler/extensions/first.pyx":87
+ *             tmp[i] = A[i]
+ *             tmp[l + i] = B[i]
+ *         return is_cyclic_ordered(tmp, tmp + l, l, tmp + 2*l, tmp + 4*l)             # <<<<<<<<<<<<<<
+ *     finally:
+ *         free(tmp)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_6 = __Pyx_PyBool_FromLong(__pyx_f_7bundler_10extensions_5first_is_cyclic_ordered(__pyx_v_tmp, (__pyx_v_tmp + __pyx_v_l), __pyx_v_l, (__pyx_v_tmp + (2 * __pyx_v_l)), (__pyx_v_tmp + (4 * __pyx_v_l)))); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 87, __pyx_L4_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_r = __pyx_t_6;
+    __pyx_t_6 = 0;
+    goto __pyx_L3_return;
+  }
+
+  /* "bundler/extensions/first.pyx":89
+ *         return is_cyclic_ordered(tmp, tmp + l, l, tmp + 2*l, tmp + 4*l)
+ *     finally:
+ *         free(tmp)             # <<<<<<<<<<<<<<
+ * 
+ * cdef class FirstInClass:
+ */
+  /*finally:*/ {
+    __pyx_L4_error:;
+    /*exception exit:*/{
+      __Pyx_PyThreadState_declare
+      __Pyx_PyThreadState_assign
+      __pyx_t_9 = 0; __pyx_t_10 = 0; __pyx_t_11 = 0; __pyx_t_12 = 0; __pyx_t_13 = 0; __pyx_t_14 = 0;
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+      if (PY_MAJOR_VERSION >= 3) __Pyx_ExceptionSwap(&__pyx_t_12, &__pyx_t_13, &__pyx_t_14);
+      if ((PY_MAJOR_VERSION < 3) || unlikely(__Pyx_GetException(&__pyx_t_9, &__pyx_t_10, &__pyx_t_11) < 0)) __Pyx_ErrFetch(&__pyx_t_9, &__pyx_t_10, &__pyx_t_11);
+      __Pyx_XGOTREF(__pyx_t_9);
+      __Pyx_XGOTREF(__pyx_t_10);
+      __Pyx_XGOTREF(__pyx_t_11);
+      __Pyx_XGOTREF(__pyx_t_12);
+      __Pyx_XGOTREF(__pyx_t_13);
+      __Pyx_XGOTREF(__pyx_t_14);
+      __pyx_t_3 = __pyx_lineno; __pyx_t_4 = __pyx_clineno; __pyx_t_8 = __pyx_filename;
+      {
+        free(__pyx_v_tmp);
+      }
+      if (PY_MAJOR_VERSION >= 3) {
+        __Pyx_XGIVEREF(__pyx_t_12);
+        __Pyx_XGIVEREF(__pyx_t_13);
+        __Pyx_XGIVEREF(__pyx_t_14);
+        __Pyx_ExceptionReset(__pyx_t_12, __pyx_t_13, __pyx_t_14);
+      }
+      __Pyx_XGIVEREF(__pyx_t_9);
+      __Pyx_XGIVEREF(__pyx_t_10);
+      __Pyx_XGIVEREF(__pyx_t_11);
+      __Pyx_ErrRestore(__pyx_t_9, __pyx_t_10, __pyx_t_11);
+      __pyx_t_9 = 0; __pyx_t_10 = 0; __pyx_t_11 = 0; __pyx_t_12 = 0; __pyx_t_13 = 0; __pyx_t_14 = 0;
+      __pyx_lineno = __pyx_t_3; __pyx_clineno = __pyx_t_4; __pyx_filename = __pyx_t_8;
+      goto __pyx_L1_error;
+    }
+    __pyx_L3_return: {
+      __pyx_t_14 = __pyx_r;
+      __pyx_r = 0;
+      free(__pyx_v_tmp);
+      __pyx_r = __pyx_t_14;
+      __pyx_t_14 = 0;
+      goto __pyx_L0;
+    }
+  }
+
+  /* "bundler/extensions/first.pyx":75
+ *     return True  # A == cycled(B)
+ * 
+ * def cyclic_ordered(tuple A, tuple B):             # <<<<<<<<<<<<<<
+ *     ''' Return whether A is <= all cyclic permutations of B, which must be the same length.
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("bundler.extensions.first.cyclic_ordered", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bundler/extensions/first.pyx":92
+ * 
+ * cdef class FirstInClass:
+ *     def __init__(self, list alphabet, list inverse, int longest_relator, FSM find_balanced_relators_FSM, FSM bad_prefix_FSM, FSM simpler_FSM, list automorphisms):             # <<<<<<<<<<<<<<
+ *         cdef list missing, auto
+ *         cdef int i, j
+ */
+
+/* Python wrapper */
+static int __pyx_pw_7bundler_10extensions_5first_12FirstInClass_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_7bundler_10extensions_5first_12FirstInClass_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_alphabet = 0;
+  PyObject *__pyx_v_inverse = 0;
+  int __pyx_v_longest_relator;
+  struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_find_balanced_relators_FSM = 0;
+  struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_bad_prefix_FSM = 0;
+  struct __pyx_obj_7bundler_10extensions_3FSM_FSM *__pyx_v_simpler_FSM = 0;
+  PyObject *__pyx_v_automorphisms = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_alphabet,&__pyx_n_s_inverse,&__pyx_n_s_longest_relator,&__pyx_n_s_find_balanced_relators_FSM,&__pyx_n_s_bad_prefix_FSM,&__pyx_n_s_simpler_FSM,&__pyx_n_s_automorphisms,0};
+    PyObject* values[7] = {0,0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_alphabet)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_inverse)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__init__", 1, 7, 7, 1); __PYX_ERR(0, 92, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_longest_relator)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__init__", 1, 7, 7, 2); __PYX_ERR(0, 92, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_find_balanced_relators_FSM)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__init__", 1, 7, 7, 3); __PYX_ERR(0, 92, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_bad_prefix_FSM)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__init__", 1, 7, 7, 4); __PYX_ERR(0, 92, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  5:
+        if (likely((values[5] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_simpler_FSM)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__init__", 1, 7, 7, 5); __PYX_ERR(0, 92, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  6:
+        if (likely((values[6] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_automorphisms)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__init__", 1, 7, 7, 6); __PYX_ERR(0, 92, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 92, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 7) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+    }
+    __pyx_v_alphabet = ((PyObject*)values[0]);
+    __pyx_v_inverse = ((PyObject*)values[1]);
+    __pyx_v_longest_relator = __Pyx_PyInt_As_int(values[2]); if (unlikely((__pyx_v_longest_relator == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 92, __pyx_L3_error)
     __pyx_v_find_balanced_relators_FSM = ((struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)values[3]);
     __pyx_v_bad_prefix_FSM = ((struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)values[4]);
     __pyx_v_simpler_FSM = ((struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)values[5]);
@@ -2255,18 +2943,18 @@ static int __pyx_pw_7bundler_10extensions_5first_12FirstInClass_1__init__(PyObje
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 1, 7, 7, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 71, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__init__", 1, 7, 7, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 92, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("bundler.extensions.first.FirstInClass.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return -1;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_alphabet), (&PyList_Type), 1, "alphabet", 1))) __PYX_ERR(0, 71, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_inverse), (&PyList_Type), 1, "inverse", 1))) __PYX_ERR(0, 71, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_find_balanced_relators_FSM), __pyx_ptype_7bundler_10extensions_3FSM_FSM, 1, "find_balanced_relators_FSM", 0))) __PYX_ERR(0, 71, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_bad_prefix_FSM), __pyx_ptype_7bundler_10extensions_3FSM_FSM, 1, "bad_prefix_FSM", 0))) __PYX_ERR(0, 71, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_simpler_FSM), __pyx_ptype_7bundler_10extensions_3FSM_FSM, 1, "simpler_FSM", 0))) __PYX_ERR(0, 71, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_automorphisms), (&PyList_Type), 1, "automorphisms", 1))) __PYX_ERR(0, 71, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_alphabet), (&PyList_Type), 1, "alphabet", 1))) __PYX_ERR(0, 92, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_inverse), (&PyList_Type), 1, "inverse", 1))) __PYX_ERR(0, 92, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_find_balanced_relators_FSM), __pyx_ptype_7bundler_10extensions_3FSM_FSM, 1, "find_balanced_relators_FSM", 0))) __PYX_ERR(0, 92, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_bad_prefix_FSM), __pyx_ptype_7bundler_10extensions_3FSM_FSM, 1, "bad_prefix_FSM", 0))) __PYX_ERR(0, 92, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_simpler_FSM), __pyx_ptype_7bundler_10extensions_3FSM_FSM, 1, "simpler_FSM", 0))) __PYX_ERR(0, 92, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_automorphisms), (&PyList_Type), 1, "automorphisms", 1))) __PYX_ERR(0, 92, __pyx_L1_error)
   __pyx_r = __pyx_pf_7bundler_10extensions_5first_12FirstInClass___init__(((struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *)__pyx_v_self), __pyx_v_alphabet, __pyx_v_inverse, __pyx_v_longest_relator, __pyx_v_find_balanced_relators_FSM, __pyx_v_bad_prefix_FSM, __pyx_v_simpler_FSM, __pyx_v_automorphisms);
 
   /* function exit code */
@@ -2300,7 +2988,7 @@ static int __pyx_pf_7bundler_10extensions_5first_12FirstInClass___init__(struct
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__init__", 0);
 
-  /* "bundler/extensions/first.pyx":74
+  /* "bundler/extensions/first.pyx":95
  *         cdef list missing, auto
  *         cdef int i, j
  *         self.alphabet = alphabet             # <<<<<<<<<<<<<<
@@ -2313,7 +3001,7 @@ static int __pyx_pf_7bundler_10extensions_5first_12FirstInClass___init__(struct
   __Pyx_DECREF(__pyx_v_self->alphabet);
   __pyx_v_self->alphabet = __pyx_v_alphabet;
 
-  /* "bundler/extensions/first.pyx":75
+  /* "bundler/extensions/first.pyx":96
  *         cdef int i, j
  *         self.alphabet = alphabet
  *         self.o_inverse = inverse             # <<<<<<<<<<<<<<
@@ -2326,7 +3014,7 @@ static int __pyx_pf_7bundler_10extensions_5first_12FirstInClass___init__(struct
   __Pyx_DECREF(__pyx_v_self->o_inverse);
   __pyx_v_self->o_inverse = __pyx_v_inverse;
 
-  /* "bundler/extensions/first.pyx":76
+  /* "bundler/extensions/first.pyx":97
  *         self.alphabet = alphabet
  *         self.o_inverse = inverse
  *         self.longest_relator = longest_relator             # <<<<<<<<<<<<<<
@@ -2335,7 +3023,7 @@ static int __pyx_pf_7bundler_10extensions_5first_12FirstInClass___init__(struct
  */
   __pyx_v_self->longest_relator = __pyx_v_longest_relator;
 
-  /* "bundler/extensions/first.pyx":77
+  /* "bundler/extensions/first.pyx":98
  *         self.o_inverse = inverse
  *         self.longest_relator = longest_relator
  *         self.find_balanced_relators_FSM = find_balanced_relators_FSM             # <<<<<<<<<<<<<<
@@ -2348,7 +3036,7 @@ static int __pyx_pf_7bundler_10extensions_5first_12FirstInClass___init__(struct
   __Pyx_DECREF(((PyObject *)__pyx_v_self->find_balanced_relators_FSM));
   __pyx_v_self->find_balanced_relators_FSM = __pyx_v_find_balanced_relators_FSM;
 
-  /* "bundler/extensions/first.pyx":78
+  /* "bundler/extensions/first.pyx":99
  *         self.longest_relator = longest_relator
  *         self.find_balanced_relators_FSM = find_balanced_relators_FSM
  *         self.bad_prefix_FSM = bad_prefix_FSM             # <<<<<<<<<<<<<<
@@ -2361,7 +3049,7 @@ static int __pyx_pf_7bundler_10extensions_5first_12FirstInClass___init__(struct
   __Pyx_DECREF(((PyObject *)__pyx_v_self->bad_prefix_FSM));
   __pyx_v_self->bad_prefix_FSM = __pyx_v_bad_prefix_FSM;
 
-  /* "bundler/extensions/first.pyx":79
+  /* "bundler/extensions/first.pyx":100
  *         self.find_balanced_relators_FSM = find_balanced_relators_FSM
  *         self.bad_prefix_FSM = bad_prefix_FSM
  *         self.simpler_FSM = simpler_FSM             # <<<<<<<<<<<<<<
@@ -2374,7 +3062,7 @@ static int __pyx_pf_7bundler_10extensions_5first_12FirstInClass___init__(struct
   __Pyx_DECREF(((PyObject *)__pyx_v_self->simpler_FSM));
   __pyx_v_self->simpler_FSM = __pyx_v_simpler_FSM;
 
-  /* "bundler/extensions/first.pyx":80
+  /* "bundler/extensions/first.pyx":101
  *         self.bad_prefix_FSM = bad_prefix_FSM
  *         self.simpler_FSM = simpler_FSM
  *         self.o_automorphisms = automorphisms             # <<<<<<<<<<<<<<
@@ -2387,7 +3075,7 @@ static int __pyx_pf_7bundler_10extensions_5first_12FirstInClass___init__(struct
   __Pyx_DECREF(__pyx_v_self->o_automorphisms);
   __pyx_v_self->o_automorphisms = __pyx_v_automorphisms;
 
-  /* "bundler/extensions/first.pyx":82
+  /* "bundler/extensions/first.pyx":103
  *         self.o_automorphisms = automorphisms
  * 
  *         self.len_alphabet = len(self.alphabet)             # <<<<<<<<<<<<<<
@@ -2398,13 +3086,13 @@ static int __pyx_pf_7bundler_10extensions_5first_12FirstInClass___init__(struct
   __Pyx_INCREF(__pyx_t_1);
   if (unlikely(__pyx_t_1 == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
-    __PYX_ERR(0, 82, __pyx_L1_error)
+    __PYX_ERR(0, 103, __pyx_L1_error)
   }
-  __pyx_t_2 = PyList_GET_SIZE(__pyx_t_1); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 82, __pyx_L1_error)
+  __pyx_t_2 = PyList_GET_SIZE(__pyx_t_1); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 103, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_v_self->len_alphabet = __pyx_t_2;
 
-  /* "bundler/extensions/first.pyx":83
+  /* "bundler/extensions/first.pyx":104
  * 
  *         self.len_alphabet = len(self.alphabet)
  *         self.len_alphabet1 = self.len_alphabet + 1             # <<<<<<<<<<<<<<
@@ -2413,7 +3101,7 @@ static int __pyx_pf_7bundler_10extensions_5first_12FirstInClass___init__(struct
  */
   __pyx_v_self->len_alphabet1 = (__pyx_v_self->len_alphabet + 1);
 
-  /* "bundler/extensions/first.pyx":84
+  /* "bundler/extensions/first.pyx":105
  *         self.len_alphabet = len(self.alphabet)
  *         self.len_alphabet1 = self.len_alphabet + 1
  *         self.stop = self.len_alphabet             # <<<<<<<<<<<<<<
@@ -2423,7 +3111,7 @@ static int __pyx_pf_7bundler_10extensions_5first_12FirstInClass___init__(struct
   __pyx_t_3 = __pyx_v_self->len_alphabet;
   __pyx_v_self->stop = __pyx_t_3;
 
-  /* "bundler/extensions/first.pyx":85
+  /* "bundler/extensions/first.pyx":106
  *         self.len_alphabet1 = self.len_alphabet + 1
  *         self.stop = self.len_alphabet
  *         self.inverse = <int *> calloc(self.len_alphabet1, sizeof(int))  # +1 for stop character.             # <<<<<<<<<<<<<<
@@ -2432,7 +3120,7 @@ static int __pyx_pf_7bundler_10extensions_5first_12FirstInClass___init__(struct
  */
   __pyx_v_self->inverse = ((int *)calloc(__pyx_v_self->len_alphabet1, (sizeof(int))));
 
-  /* "bundler/extensions/first.pyx":86
+  /* "bundler/extensions/first.pyx":107
  *         self.stop = self.len_alphabet
  *         self.inverse = <int *> calloc(self.len_alphabet1, sizeof(int))  # +1 for stop character.
  *         for i in range(self.len_alphabet):             # <<<<<<<<<<<<<<
@@ -2444,7 +3132,7 @@ static int __pyx_pf_7bundler_10extensions_5first_12FirstInClass___init__(struct
   for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
     __pyx_v_i = __pyx_t_5;
 
-    /* "bundler/extensions/first.pyx":87
+    /* "bundler/extensions/first.pyx":108
  *         self.inverse = <int *> calloc(self.len_alphabet1, sizeof(int))  # +1 for stop character.
  *         for i in range(self.len_alphabet):
  *             self.inverse[i] = inverse[i]             # <<<<<<<<<<<<<<
@@ -2453,16 +3141,16 @@ static int __pyx_pf_7bundler_10extensions_5first_12FirstInClass___init__(struct
  */
     if (unlikely(__pyx_v_inverse == Py_None)) {
       PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-      __PYX_ERR(0, 87, __pyx_L1_error)
+      __PYX_ERR(0, 108, __pyx_L1_error)
     }
-    __pyx_t_1 = __Pyx_GetItemInt_List(__pyx_v_inverse, __pyx_v_i, int, 1, __Pyx_PyInt_From_int, 1, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 87, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_GetItemInt_List(__pyx_v_inverse, __pyx_v_i, int, 1, __Pyx_PyInt_From_int, 1, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 108, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_6 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 87, __pyx_L1_error)
+    __pyx_t_6 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 108, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     (__pyx_v_self->inverse[__pyx_v_i]) = __pyx_t_6;
   }
 
-  /* "bundler/extensions/first.pyx":88
+  /* "bundler/extensions/first.pyx":109
  *         for i in range(self.len_alphabet):
  *             self.inverse[i] = inverse[i]
  *         self.inverse[self.len_alphabet] = self.stop             # <<<<<<<<<<<<<<
@@ -2472,7 +3160,7 @@ static int __pyx_pf_7bundler_10extensions_5first_12FirstInClass___init__(struct
   __pyx_t_3 = __pyx_v_self->stop;
   (__pyx_v_self->inverse[__pyx_v_self->len_alphabet]) = __pyx_t_3;
 
-  /* "bundler/extensions/first.pyx":90
+  /* "bundler/extensions/first.pyx":111
  *         self.inverse[self.len_alphabet] = self.stop
  * 
  *         self.num_automorphisms = len(self.o_automorphisms)             # <<<<<<<<<<<<<<
@@ -2483,13 +3171,13 @@ static int __pyx_pf_7bundler_10extensions_5first_12FirstInClass___init__(struct
   __Pyx_INCREF(__pyx_t_1);
   if (unlikely(__pyx_t_1 == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
-    __PYX_ERR(0, 90, __pyx_L1_error)
+    __PYX_ERR(0, 111, __pyx_L1_error)
   }
-  __pyx_t_2 = PyList_GET_SIZE(__pyx_t_1); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 90, __pyx_L1_error)
+  __pyx_t_2 = PyList_GET_SIZE(__pyx_t_1); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 111, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_v_self->num_automorphisms = __pyx_t_2;
 
-  /* "bundler/extensions/first.pyx":91
+  /* "bundler/extensions/first.pyx":112
  * 
  *         self.num_automorphisms = len(self.o_automorphisms)
  *         self.any_missing = <bint *> calloc(self.num_automorphisms, sizeof(bint))             # <<<<<<<<<<<<<<
@@ -2498,7 +3186,7 @@ static int __pyx_pf_7bundler_10extensions_5first_12FirstInClass___init__(struct
  */
   __pyx_v_self->any_missing = ((int *)calloc(__pyx_v_self->num_automorphisms, (sizeof(int))));
 
-  /* "bundler/extensions/first.pyx":92
+  /* "bundler/extensions/first.pyx":113
  *         self.num_automorphisms = len(self.o_automorphisms)
  *         self.any_missing = <bint *> calloc(self.num_automorphisms, sizeof(bint))
  *         self.missing = <bint *> calloc(self.num_automorphisms * self.len_alphabet1, sizeof(bint))             # <<<<<<<<<<<<<<
@@ -2507,7 +3195,7 @@ static int __pyx_pf_7bundler_10extensions_5first_12FirstInClass___init__(struct
  */
   __pyx_v_self->missing = ((int *)calloc((__pyx_v_self->num_automorphisms * __pyx_v_self->len_alphabet1), (sizeof(int))));
 
-  /* "bundler/extensions/first.pyx":93
+  /* "bundler/extensions/first.pyx":114
  *         self.any_missing = <bint *> calloc(self.num_automorphisms, sizeof(bint))
  *         self.missing = <bint *> calloc(self.num_automorphisms * self.len_alphabet1, sizeof(bint))
  *         self.automorphisms = <int *> calloc(self.num_automorphisms * self.len_alphabet1, sizeof(int*))             # <<<<<<<<<<<<<<
@@ -2516,7 +3204,7 @@ static int __pyx_pf_7bundler_10extensions_5first_12FirstInClass___init__(struct
  */
   __pyx_v_self->automorphisms = ((int *)calloc((__pyx_v_self->num_automorphisms * __pyx_v_self->len_alphabet1), (sizeof(int *))));
 
-  /* "bundler/extensions/first.pyx":94
+  /* "bundler/extensions/first.pyx":115
  *         self.missing = <bint *> calloc(self.num_automorphisms * self.len_alphabet1, sizeof(bint))
  *         self.automorphisms = <int *> calloc(self.num_automorphisms * self.len_alphabet1, sizeof(int*))
  *         for i in range(self.num_automorphisms):             # <<<<<<<<<<<<<<
@@ -2528,7 +3216,7 @@ static int __pyx_pf_7bundler_10extensions_5first_12FirstInClass___init__(struct
   for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
     __pyx_v_i = __pyx_t_5;
 
-    /* "bundler/extensions/first.pyx":95
+    /* "bundler/extensions/first.pyx":116
  *         self.automorphisms = <int *> calloc(self.num_automorphisms * self.len_alphabet1, sizeof(int*))
  *         for i in range(self.num_automorphisms):
  *             if self.o_automorphisms[i][0]: self.any_missing[i] = 1             # <<<<<<<<<<<<<<
@@ -2537,20 +3225,20 @@ static int __pyx_pf_7bundler_10extensions_5first_12FirstInClass___init__(struct
  */
     if (unlikely(__pyx_v_self->o_automorphisms == Py_None)) {
       PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-      __PYX_ERR(0, 95, __pyx_L1_error)
+      __PYX_ERR(0, 116, __pyx_L1_error)
     }
-    __pyx_t_1 = __Pyx_GetItemInt_List(__pyx_v_self->o_automorphisms, __pyx_v_i, int, 1, __Pyx_PyInt_From_int, 1, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 95, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_GetItemInt_List(__pyx_v_self->o_automorphisms, __pyx_v_i, int, 1, __Pyx_PyInt_From_int, 1, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 116, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_7 = __Pyx_GetItemInt(__pyx_t_1, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 95, __pyx_L1_error)
+    __pyx_t_7 = __Pyx_GetItemInt(__pyx_t_1, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 116, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_7);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_8 = __Pyx_PyObject_IsTrue(__pyx_t_7); if (unlikely(__pyx_t_8 < 0)) __PYX_ERR(0, 95, __pyx_L1_error)
+    __pyx_t_8 = __Pyx_PyObject_IsTrue(__pyx_t_7); if (unlikely(__pyx_t_8 < 0)) __PYX_ERR(0, 116, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
     if (__pyx_t_8) {
       (__pyx_v_self->any_missing[__pyx_v_i]) = 1;
     }
 
-    /* "bundler/extensions/first.pyx":96
+    /* "bundler/extensions/first.pyx":117
  *         for i in range(self.num_automorphisms):
  *             if self.o_automorphisms[i][0]: self.any_missing[i] = 1
  *             for j in self.o_automorphisms[i][0]:             # <<<<<<<<<<<<<<
@@ -2559,20 +3247,20 @@ static int __pyx_pf_7bundler_10extensions_5first_12FirstInClass___init__(struct
  */
     if (unlikely(__pyx_v_self->o_automorphisms == Py_None)) {
       PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-      __PYX_ERR(0, 96, __pyx_L1_error)
+      __PYX_ERR(0, 117, __pyx_L1_error)
     }
-    __pyx_t_7 = __Pyx_GetItemInt_List(__pyx_v_self->o_automorphisms, __pyx_v_i, int, 1, __Pyx_PyInt_From_int, 1, 1, 1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 96, __pyx_L1_error)
+    __pyx_t_7 = __Pyx_GetItemInt_List(__pyx_v_self->o_automorphisms, __pyx_v_i, int, 1, __Pyx_PyInt_From_int, 1, 1, 1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 117, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_7);
-    __pyx_t_1 = __Pyx_GetItemInt(__pyx_t_7, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 96, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_GetItemInt(__pyx_t_7, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 117, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
     if (likely(PyList_CheckExact(__pyx_t_1)) || PyTuple_CheckExact(__pyx_t_1)) {
       __pyx_t_7 = __pyx_t_1; __Pyx_INCREF(__pyx_t_7); __pyx_t_2 = 0;
       __pyx_t_9 = NULL;
     } else {
-      __pyx_t_2 = -1; __pyx_t_7 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 96, __pyx_L1_error)
+      __pyx_t_2 = -1; __pyx_t_7 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 117, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_7);
-      __pyx_t_9 = Py_TYPE(__pyx_t_7)->tp_iternext; if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 96, __pyx_L1_error)
+      __pyx_t_9 = Py_TYPE(__pyx_t_7)->tp_iternext; if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 117, __pyx_L1_error)
     }
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     for (;;) {
@@ -2580,17 +3268,17 @@ static int __pyx_pf_7bundler_10extensions_5first_12FirstInClass___init__(struct
         if (likely(PyList_CheckExact(__pyx_t_7))) {
           if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_7)) break;
           #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-          __pyx_t_1 = PyList_GET_ITEM(__pyx_t_7, __pyx_t_2); __Pyx_INCREF(__pyx_t_1); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 96, __pyx_L1_error)
+          __pyx_t_1 = PyList_GET_ITEM(__pyx_t_7, __pyx_t_2); __Pyx_INCREF(__pyx_t_1); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 117, __pyx_L1_error)
           #else
-          __pyx_t_1 = PySequence_ITEM(__pyx_t_7, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 96, __pyx_L1_error)
+          __pyx_t_1 = PySequence_ITEM(__pyx_t_7, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 117, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_1);
           #endif
         } else {
           if (__pyx_t_2 >= PyTuple_GET_SIZE(__pyx_t_7)) break;
           #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-          __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_7, __pyx_t_2); __Pyx_INCREF(__pyx_t_1); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 96, __pyx_L1_error)
+          __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_7, __pyx_t_2); __Pyx_INCREF(__pyx_t_1); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 117, __pyx_L1_error)
           #else
-          __pyx_t_1 = PySequence_ITEM(__pyx_t_7, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 96, __pyx_L1_error)
+          __pyx_t_1 = PySequence_ITEM(__pyx_t_7, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 117, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_1);
           #endif
         }
@@ -2600,17 +3288,17 @@ static int __pyx_pf_7bundler_10extensions_5first_12FirstInClass___init__(struct
           PyObject* exc_type = PyErr_Occurred();
           if (exc_type) {
             if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-            else __PYX_ERR(0, 96, __pyx_L1_error)
+            else __PYX_ERR(0, 117, __pyx_L1_error)
           }
           break;
         }
         __Pyx_GOTREF(__pyx_t_1);
       }
-      __pyx_t_6 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 96, __pyx_L1_error)
+      __pyx_t_6 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 117, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
       __pyx_v_j = __pyx_t_6;
 
-      /* "bundler/extensions/first.pyx":97
+      /* "bundler/extensions/first.pyx":118
  *             if self.o_automorphisms[i][0]: self.any_missing[i] = 1
  *             for j in self.o_automorphisms[i][0]:
  *                 self.missing[self.len_alphabet1 * i + j] = 1             # <<<<<<<<<<<<<<
@@ -2619,7 +3307,7 @@ static int __pyx_pf_7bundler_10extensions_5first_12FirstInClass___init__(struct
  */
       (__pyx_v_self->missing[((__pyx_v_self->len_alphabet1 * __pyx_v_i) + __pyx_v_j)]) = 1;
 
-      /* "bundler/extensions/first.pyx":96
+      /* "bundler/extensions/first.pyx":117
  *         for i in range(self.num_automorphisms):
  *             if self.o_automorphisms[i][0]: self.any_missing[i] = 1
  *             for j in self.o_automorphisms[i][0]:             # <<<<<<<<<<<<<<
@@ -2629,7 +3317,7 @@ static int __pyx_pf_7bundler_10extensions_5first_12FirstInClass___init__(struct
     }
     __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
 
-    /* "bundler/extensions/first.pyx":98
+    /* "bundler/extensions/first.pyx":119
  *             for j in self.o_automorphisms[i][0]:
  *                 self.missing[self.len_alphabet1 * i + j] = 1
  *             for j in range(self.len_alphabet):             # <<<<<<<<<<<<<<
@@ -2641,7 +3329,7 @@ static int __pyx_pf_7bundler_10extensions_5first_12FirstInClass___init__(struct
     for (__pyx_t_11 = 0; __pyx_t_11 < __pyx_t_10; __pyx_t_11+=1) {
       __pyx_v_j = __pyx_t_11;
 
-      /* "bundler/extensions/first.pyx":99
+      /* "bundler/extensions/first.pyx":120
  *                 self.missing[self.len_alphabet1 * i + j] = 1
  *             for j in range(self.len_alphabet):
  *                 self.automorphisms[i * self.len_alphabet1 + j] = self.o_automorphisms[i][1][j]             # <<<<<<<<<<<<<<
@@ -2650,35 +3338,82 @@ static int __pyx_pf_7bundler_10extensions_5first_12FirstInClass___init__(struct
  */
       if (unlikely(__pyx_v_self->o_automorphisms == Py_None)) {
         PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-        __PYX_ERR(0, 99, __pyx_L1_error)
+        __PYX_ERR(0, 120, __pyx_L1_error)
       }
-      __pyx_t_7 = __Pyx_GetItemInt_List(__pyx_v_self->o_automorphisms, __pyx_v_i, int, 1, __Pyx_PyInt_From_int, 1, 1, 1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 99, __pyx_L1_error)
+      __pyx_t_7 = __Pyx_GetItemInt_List(__pyx_v_self->o_automorphisms, __pyx_v_i, int, 1, __Pyx_PyInt_From_int, 1, 1, 1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 120, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_7);
-      __pyx_t_1 = __Pyx_GetItemInt(__pyx_t_7, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 99, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_GetItemInt(__pyx_t_7, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 120, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-      __pyx_t_7 = __Pyx_GetItemInt(__pyx_t_1, __pyx_v_j, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 99, __pyx_L1_error)
+      __pyx_t_7 = __Pyx_GetItemInt(__pyx_t_1, __pyx_v_j, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 120, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_7);
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __pyx_t_12 = __Pyx_PyInt_As_int(__pyx_t_7); if (unlikely((__pyx_t_12 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 99, __pyx_L1_error)
+      __pyx_t_12 = __Pyx_PyInt_As_int(__pyx_t_7); if (unlikely((__pyx_t_12 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 120, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
       (__pyx_v_self->automorphisms[((__pyx_v_i * __pyx_v_self->len_alphabet1) + __pyx_v_j)]) = __pyx_t_12;
     }
 
-    /* "bundler/extensions/first.pyx":100
+    /* "bundler/extensions/first.pyx":121
  *             for j in range(self.len_alphabet):
  *                 self.automorphisms[i * self.len_alphabet1 + j] = self.o_automorphisms[i][1][j]
  *             self.automorphisms[i * self.len_alphabet1 + self.len_alphabet] = self.stop             # <<<<<<<<<<<<<<
  * 
- *     def __reduce__(self):
+ *         self.letter_bits = 1
  */
     __pyx_t_6 = __pyx_v_self->stop;
     (__pyx_v_self->automorphisms[((__pyx_v_i * __pyx_v_self->len_alphabet1) + __pyx_v_self->len_alphabet)]) = __pyx_t_6;
   }
 
-  /* "bundler/extensions/first.pyx":71
- *     cdef int* automorphisms
+  /* "bundler/extensions/first.pyx":123
+ *             self.automorphisms[i * self.len_alphabet1 + self.len_alphabet] = self.stop
+ * 
+ *         self.letter_bits = 1             # <<<<<<<<<<<<<<
+ *         while (1 << self.letter_bits) < self.len_alphabet:
+ *             self.letter_bits += 1
+ */
+  __pyx_v_self->letter_bits = 1;
+
+  /* "bundler/extensions/first.pyx":124
+ * 
+ *         self.letter_bits = 1
+ *         while (1 << self.letter_bits) < self.len_alphabet:             # <<<<<<<<<<<<<<
+ *             self.letter_bits += 1
+ *         self.max_packed_length = 63 // self.letter_bits
+ */
+  while (1) {
+    __pyx_t_8 = (((1 << __pyx_v_self->letter_bits) < __pyx_v_self->len_alphabet) != 0);
+    if (!__pyx_t_8) break;
+
+    /* "bundler/extensions/first.pyx":125
+ *         self.letter_bits = 1
+ *         while (1 << self.letter_bits) < self.len_alphabet:
+ *             self.letter_bits += 1             # <<<<<<<<<<<<<<
+ *         self.max_packed_length = 63 // self.letter_bits
+ * 
+ */
+    __pyx_v_self->letter_bits = (__pyx_v_self->letter_bits + 1);
+  }
+
+  /* "bundler/extensions/first.pyx":126
+ *         while (1 << self.letter_bits) < self.len_alphabet:
+ *             self.letter_bits += 1
+ *         self.max_packed_length = 63 // self.letter_bits             # <<<<<<<<<<<<<<
+ * 
+ *     def __reduce__(self):
+ */
+  if (unlikely(__pyx_v_self->letter_bits == 0)) {
+    PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
+    __PYX_ERR(0, 126, __pyx_L1_error)
+  }
+  else if (sizeof(long) == sizeof(long) && (!(((int)-1) > 0)) && unlikely(__pyx_v_self->letter_bits == (int)-1)  && unlikely(UNARY_NEG_WOULD_OVERFLOW(63))) {
+    PyErr_SetString(PyExc_OverflowError, "value too large to perform division");
+    __PYX_ERR(0, 126, __pyx_L1_error)
+  }
+  __pyx_v_self->max_packed_length = __Pyx_div_long(63, __pyx_v_self->letter_bits);
+
+  /* "bundler/extensions/first.pyx":92
  * 
+ * cdef class FirstInClass:
  *     def __init__(self, list alphabet, list inverse, int longest_relator, FSM find_balanced_relators_FSM, FSM bad_prefix_FSM, FSM simpler_FSM, list automorphisms):             # <<<<<<<<<<<<<<
  *         cdef list missing, auto
  *         cdef int i, j
@@ -2697,8 +3432,8 @@ static int __pyx_pf_7bundler_10extensions_5first_12FirstInClass___init__(struct
   return __pyx_r;
 }
 
-/* "bundler/extensions/first.pyx":102
- *             self.automorphisms[i * self.len_alphabet1 + self.len_alphabet] = self.stop
+/* "bundler/extensions/first.pyx":128
+ *         self.max_packed_length = 63 // self.letter_bits
  * 
  *     def __reduce__(self):             # <<<<<<<<<<<<<<
  *         return (self.__class__, (self.alphabet, self.o_inverse, self.longest_relator, self.find_balanced_relators_FSM, self.bad_prefix_FSM, self.simpler_FSM, self.o_automorphisms))
@@ -2729,7 +3464,7 @@ static PyObject *__pyx_pf_7bundler_10extensions_5first_12FirstInClass_2__reduce_
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__reduce__", 0);
 
-  /* "bundler/extensions/first.pyx":103
+  /* "bundler/extensions/first.pyx":129
  * 
  *     def __reduce__(self):
  *         return (self.__class__, (self.alphabet, self.o_inverse, self.longest_relator, self.find_balanced_relators_FSM, self.bad_prefix_FSM, self.simpler_FSM, self.o_automorphisms))             # <<<<<<<<<<<<<<
@@ -2737,11 +3472,11 @@ static PyObject *__pyx_pf_7bundler_10extensions_5first_12FirstInClass_2__reduce_
  *     def __del__(self):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_class); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 103, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_class); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 129, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_self->longest_relator); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 103, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_self->longest_relator); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 129, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = PyTuple_New(7); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 103, __pyx_L1_error)
+  __pyx_t_3 = PyTuple_New(7); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 129, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_INCREF(__pyx_v_self->alphabet);
   __Pyx_GIVEREF(__pyx_v_self->alphabet);
@@ -2764,7 +3499,7 @@ static PyObject *__pyx_pf_7bundler_10extensions_5first_12FirstInClass_2__reduce_
   __Pyx_GIVEREF(__pyx_v_self->o_automorphisms);
   PyTuple_SET_ITEM(__pyx_t_3, 6, __pyx_v_self->o_automorphisms);
   __pyx_t_2 = 0;
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 103, __pyx_L1_error)
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 129, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_1);
   PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
@@ -2776,95 +3511,434 @@ static PyObject *__pyx_pf_7bundler_10extensions_5first_12FirstInClass_2__reduce_
   __pyx_t_2 = 0;
   goto __pyx_L0;
 
-  /* "bundler/extensions/first.pyx":102
- *             self.automorphisms[i * self.len_alphabet1 + self.len_alphabet] = self.stop
+  /* "bundler/extensions/first.pyx":128
+ *         self.max_packed_length = 63 // self.letter_bits
+ * 
+ *     def __reduce__(self):             # <<<<<<<<<<<<<<
+ *         return (self.__class__, (self.alphabet, self.o_inverse, self.longest_relator, self.find_balanced_relators_FSM, self.bad_prefix_FSM, self.simpler_FSM, self.o_automorphisms))
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("bundler.extensions.first.FirstInClass.__reduce__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bundler/extensions/first.pyx":131
+ *         return (self.__class__, (self.alphabet, self.o_inverse, self.longest_relator, self.find_balanced_relators_FSM, self.bad_prefix_FSM, self.simpler_FSM, self.o_automorphisms))
+ * 
+ *     def __del__(self):             # <<<<<<<<<<<<<<
+ *         free(self.inverse)
+ *         free(self.any_missing)
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7bundler_10extensions_5first_12FirstInClass_5__del__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_7bundler_10extensions_5first_12FirstInClass_5__del__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_7bundler_10extensions_5first_12FirstInClass_4__del__(((struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7bundler_10extensions_5first_12FirstInClass_4__del__(struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__", 0);
+
+  /* "bundler/extensions/first.pyx":132
+ * 
+ *     def __del__(self):
+ *         free(self.inverse)             # <<<<<<<<<<<<<<
+ *         free(self.any_missing)
+ *         free(self.missing)
+ */
+  free(__pyx_v_self->inverse);
+
+  /* "bundler/extensions/first.pyx":133
+ *     def __del__(self):
+ *         free(self.inverse)
+ *         free(self.any_missing)             # <<<<<<<<<<<<<<
+ *         free(self.missing)
+ *         free(self.automorphisms)
+ */
+  free(__pyx_v_self->any_missing);
+
+  /* "bundler/extensions/first.pyx":134
+ *         free(self.inverse)
+ *         free(self.any_missing)
+ *         free(self.missing)             # <<<<<<<<<<<<<<
+ *         free(self.automorphisms)
+ * 
+ */
+  free(__pyx_v_self->missing);
+
+  /* "bundler/extensions/first.pyx":135
+ *         free(self.any_missing)
+ *         free(self.missing)
+ *         free(self.automorphisms)             # <<<<<<<<<<<<<<
+ * 
+ *     def statistics(self):
+ */
+  free(__pyx_v_self->automorphisms);
+
+  /* "bundler/extensions/first.pyx":131
+ *         return (self.__class__, (self.alphabet, self.o_inverse, self.longest_relator, self.find_balanced_relators_FSM, self.bad_prefix_FSM, self.simpler_FSM, self.o_automorphisms))
+ * 
+ *     def __del__(self):             # <<<<<<<<<<<<<<
+ *         free(self.inverse)
+ *         free(self.any_missing)
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bundler/extensions/first.pyx":137
+ *         free(self.automorphisms)
+ * 
+ *     def statistics(self):             # <<<<<<<<<<<<<<
+ *         ''' Return a dictionary counting how often is_first has finished in each way, and the number of equivalent words it has visited. '''
+ *         cdef int i
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7bundler_10extensions_5first_12FirstInClass_7statistics(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_7bundler_10extensions_5first_12FirstInClass_6statistics[] = " Return a dictionary counting how often is_first has finished in each way, and the number of equivalent words it has visited. ";
+static PyObject *__pyx_pw_7bundler_10extensions_5first_12FirstInClass_7statistics(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("statistics (wrapper)", 0);
+  __pyx_r = __pyx_pf_7bundler_10extensions_5first_12FirstInClass_6statistics(((struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7bundler_10extensions_5first_12FirstInClass_6statistics(struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *__pyx_v_self) {
+  int __pyx_v_i;
+  PyObject *__pyx_v_stats = NULL;
+  PyObject *__pyx_v_kind = NULL;
+  PyObject *__pyx_v_j = NULL;
+  PyObject *__pyx_v_name = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  Py_ssize_t __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  Py_ssize_t __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  Py_ssize_t __pyx_t_9;
+  Py_UCS4 __pyx_t_10;
+  PyObject *__pyx_t_11 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("statistics", 0);
+
+  /* "bundler/extensions/first.pyx":140
+ *         ''' Return a dictionary counting how often is_first has finished in each way, and the number of equivalent words it has visited. '''
+ *         cdef int i
+ *         stats = dict()             # <<<<<<<<<<<<<<
+ *         for i, kind in enumerate(['word', 'prefix']):
+ *             for j, name in enumerate(['bad_prefix', 'beaten_by_automorph', 'simpler', 'beaten', 'exhausted', 'first']):
+ */
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 140, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_stats = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "bundler/extensions/first.pyx":141
+ *         cdef int i
+ *         stats = dict()
+ *         for i, kind in enumerate(['word', 'prefix']):             # <<<<<<<<<<<<<<
+ *             for j, name in enumerate(['bad_prefix', 'beaten_by_automorph', 'simpler', 'beaten', 'exhausted', 'first']):
+ *                 stats[f'{kind}.{name}'] = self.outcomes[i * FIC_OUTCOMES + j]
+ */
+  __pyx_t_2 = 0;
+  __pyx_t_1 = PyList_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 141, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_n_u_word);
+  __Pyx_GIVEREF(__pyx_n_u_word);
+  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_u_word);
+  __Pyx_INCREF(__pyx_n_u_prefix);
+  __Pyx_GIVEREF(__pyx_n_u_prefix);
+  PyList_SET_ITEM(__pyx_t_1, 1, __pyx_n_u_prefix);
+  __pyx_t_3 = __pyx_t_1; __Pyx_INCREF(__pyx_t_3); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  for (;;) {
+    if (__pyx_t_4 >= 2) break;
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    __pyx_t_1 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_4); __Pyx_INCREF(__pyx_t_1); __pyx_t_4++; if (unlikely(0 < 0)) __PYX_ERR(0, 141, __pyx_L1_error)
+    #else
+    __pyx_t_1 = PySequence_ITEM(__pyx_t_3, __pyx_t_4); __pyx_t_4++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 141, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    #endif
+    __Pyx_XDECREF_SET(__pyx_v_kind, __pyx_t_1);
+    __pyx_t_1 = 0;
+    __pyx_v_i = __pyx_t_2;
+    __pyx_t_2 = (__pyx_t_2 + 1);
+
+    /* "bundler/extensions/first.pyx":142
+ *         stats = dict()
+ *         for i, kind in enumerate(['word', 'prefix']):
+ *             for j, name in enumerate(['bad_prefix', 'beaten_by_automorph', 'simpler', 'beaten', 'exhausted', 'first']):             # <<<<<<<<<<<<<<
+ *                 stats[f'{kind}.{name}'] = self.outcomes[i * FIC_OUTCOMES + j]
+ *             stats[f'{kind}.explored'] = self.explored[i]
+ */
+    __Pyx_INCREF(__pyx_int_0);
+    __pyx_t_1 = __pyx_int_0;
+    __pyx_t_5 = PyList_New(6); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 142, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_INCREF(__pyx_n_u_bad_prefix);
+    __Pyx_GIVEREF(__pyx_n_u_bad_prefix);
+    PyList_SET_ITEM(__pyx_t_5, 0, __pyx_n_u_bad_prefix);
+    __Pyx_INCREF(__pyx_n_u_beaten_by_automorph);
+    __Pyx_GIVEREF(__pyx_n_u_beaten_by_automorph);
+    PyList_SET_ITEM(__pyx_t_5, 1, __pyx_n_u_beaten_by_automorph);
+    __Pyx_INCREF(__pyx_n_u_simpler);
+    __Pyx_GIVEREF(__pyx_n_u_simpler);
+    PyList_SET_ITEM(__pyx_t_5, 2, __pyx_n_u_simpler);
+    __Pyx_INCREF(__pyx_n_u_beaten);
+    __Pyx_GIVEREF(__pyx_n_u_beaten);
+    PyList_SET_ITEM(__pyx_t_5, 3, __pyx_n_u_beaten);
+    __Pyx_INCREF(__pyx_n_u_exhausted);
+    __Pyx_GIVEREF(__pyx_n_u_exhausted);
+    PyList_SET_ITEM(__pyx_t_5, 4, __pyx_n_u_exhausted);
+    __Pyx_INCREF(__pyx_n_u_first);
+    __Pyx_GIVEREF(__pyx_n_u_first);
+    PyList_SET_ITEM(__pyx_t_5, 5, __pyx_n_u_first);
+    __pyx_t_6 = __pyx_t_5; __Pyx_INCREF(__pyx_t_6); __pyx_t_7 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    for (;;) {
+      if (__pyx_t_7 >= 6) break;
+      #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+      __pyx_t_5 = PyList_GET_ITEM(__pyx_t_6, __pyx_t_7); __Pyx_INCREF(__pyx_t_5); __pyx_t_7++; if (unlikely(0 < 0)) __PYX_ERR(0, 142, __pyx_L1_error)
+      #else
+      __pyx_t_5 = PySequence_ITEM(__pyx_t_6, __pyx_t_7); __pyx_t_7++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 142, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      #endif
+      __Pyx_XDECREF_SET(__pyx_v_name, __pyx_t_5);
+      __pyx_t_5 = 0;
+      __Pyx_INCREF(__pyx_t_1);
+      __Pyx_XDECREF_SET(__pyx_v_j, __pyx_t_1);
+      __pyx_t_5 = __Pyx_PyInt_AddObjC(__pyx_t_1, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 142, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_1);
+      __pyx_t_1 = __pyx_t_5;
+      __pyx_t_5 = 0;
+
+      /* "bundler/extensions/first.pyx":143
+ *         for i, kind in enumerate(['word', 'prefix']):
+ *             for j, name in enumerate(['bad_prefix', 'beaten_by_automorph', 'simpler', 'beaten', 'exhausted', 'first']):
+ *                 stats[f'{kind}.{name}'] = self.outcomes[i * FIC_OUTCOMES + j]             # <<<<<<<<<<<<<<
+ *             stats[f'{kind}.explored'] = self.explored[i]
+ *         return stats
+ */
+      __pyx_t_5 = __Pyx_PyInt_From_int((__pyx_v_i * __pyx_e_7bundler_10extensions_5first_FIC_OUTCOMES)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 143, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_8 = PyNumber_Add(__pyx_t_5, __pyx_v_j); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 143, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_t_9 = __Pyx_PyIndex_AsSsize_t(__pyx_t_8); if (unlikely((__pyx_t_9 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 143, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __pyx_t_8 = __Pyx_PyInt_From_long((__pyx_v_self->outcomes[__pyx_t_9])); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 143, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __pyx_t_5 = PyTuple_New(3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 143, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_9 = 0;
+      __pyx_t_10 = 127;
+      __pyx_t_11 = __Pyx_PyObject_FormatSimple(__pyx_v_kind, __pyx_empty_unicode); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 143, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_11);
+      __pyx_t_10 = (__Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_11) > __pyx_t_10) ? __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_11) : __pyx_t_10;
+      __pyx_t_9 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_11);
+      __Pyx_GIVEREF(__pyx_t_11);
+      PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_11);
+      __pyx_t_11 = 0;
+      __Pyx_INCREF(__pyx_kp_u_);
+      __pyx_t_9 += 1;
+      __Pyx_GIVEREF(__pyx_kp_u_);
+      PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_kp_u_);
+      __pyx_t_11 = __Pyx_PyObject_FormatSimple(__pyx_v_name, __pyx_empty_unicode); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 143, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_11);
+      __pyx_t_10 = (__Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_11) > __pyx_t_10) ? __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_11) : __pyx_t_10;
+      __pyx_t_9 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_11);
+      __Pyx_GIVEREF(__pyx_t_11);
+      PyTuple_SET_ITEM(__pyx_t_5, 2, __pyx_t_11);
+      __pyx_t_11 = 0;
+      __pyx_t_11 = __Pyx_PyUnicode_Join(__pyx_t_5, 3, __pyx_t_9, __pyx_t_10); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 143, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_11);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (unlikely(PyDict_SetItem(__pyx_v_stats, __pyx_t_11, __pyx_t_8) < 0)) __PYX_ERR(0, 143, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+
+      /* "bundler/extensions/first.pyx":142
+ *         stats = dict()
+ *         for i, kind in enumerate(['word', 'prefix']):
+ *             for j, name in enumerate(['bad_prefix', 'beaten_by_automorph', 'simpler', 'beaten', 'exhausted', 'first']):             # <<<<<<<<<<<<<<
+ *                 stats[f'{kind}.{name}'] = self.outcomes[i * FIC_OUTCOMES + j]
+ *             stats[f'{kind}.explored'] = self.explored[i]
+ */
+    }
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "bundler/extensions/first.pyx":144
+ *             for j, name in enumerate(['bad_prefix', 'beaten_by_automorph', 'simpler', 'beaten', 'exhausted', 'first']):
+ *                 stats[f'{kind}.{name}'] = self.outcomes[i * FIC_OUTCOMES + j]
+ *             stats[f'{kind}.explored'] = self.explored[i]             # <<<<<<<<<<<<<<
+ *         return stats
+ * 
+ */
+    __pyx_t_1 = __Pyx_PyInt_From_long((__pyx_v_self->explored[__pyx_v_i])); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 144, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_6 = __Pyx_PyObject_FormatSimple(__pyx_v_kind, __pyx_empty_unicode); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 144, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_8 = __Pyx_PyUnicode_Concat(__pyx_t_6, __pyx_kp_u_explored); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 144, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (unlikely(PyDict_SetItem(__pyx_v_stats, __pyx_t_8, __pyx_t_1) < 0)) __PYX_ERR(0, 144, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "bundler/extensions/first.pyx":141
+ *         cdef int i
+ *         stats = dict()
+ *         for i, kind in enumerate(['word', 'prefix']):             # <<<<<<<<<<<<<<
+ *             for j, name in enumerate(['bad_prefix', 'beaten_by_automorph', 'simpler', 'beaten', 'exhausted', 'first']):
+ *                 stats[f'{kind}.{name}'] = self.outcomes[i * FIC_OUTCOMES + j]
+ */
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "bundler/extensions/first.pyx":145
+ *                 stats[f'{kind}.{name}'] = self.outcomes[i * FIC_OUTCOMES + j]
+ *             stats[f'{kind}.explored'] = self.explored[i]
+ *         return stats             # <<<<<<<<<<<<<<
  * 
- *     def __reduce__(self):             # <<<<<<<<<<<<<<
- *         return (self.__class__, (self.alphabet, self.o_inverse, self.longest_relator, self.find_balanced_relators_FSM, self.bad_prefix_FSM, self.simpler_FSM, self.o_automorphisms))
+ *     def reset_statistics(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_stats);
+  __pyx_r = __pyx_v_stats;
+  goto __pyx_L0;
+
+  /* "bundler/extensions/first.pyx":137
+ *         free(self.automorphisms)
  * 
+ *     def statistics(self):             # <<<<<<<<<<<<<<
+ *         ''' Return a dictionary counting how often is_first has finished in each way, and the number of equivalent words it has visited. '''
+ *         cdef int i
  */
 
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("bundler.extensions.first.FirstInClass.__reduce__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_AddTraceback("bundler.extensions.first.FirstInClass.statistics", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_stats);
+  __Pyx_XDECREF(__pyx_v_kind);
+  __Pyx_XDECREF(__pyx_v_j);
+  __Pyx_XDECREF(__pyx_v_name);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "bundler/extensions/first.pyx":105
- *         return (self.__class__, (self.alphabet, self.o_inverse, self.longest_relator, self.find_balanced_relators_FSM, self.bad_prefix_FSM, self.simpler_FSM, self.o_automorphisms))
+/* "bundler/extensions/first.pyx":147
+ *         return stats
  * 
- *     def __del__(self):             # <<<<<<<<<<<<<<
- *         free(self.inverse)
- *         free(self.any_missing)
+ *     def reset_statistics(self):             # <<<<<<<<<<<<<<
+ *         cdef int i
+ *         for i in range(2 * FIC_OUTCOMES):
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7bundler_10extensions_5first_12FirstInClass_5__del__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pw_7bundler_10extensions_5first_12FirstInClass_5__del__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_7bundler_10extensions_5first_12FirstInClass_9reset_statistics(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_7bundler_10extensions_5first_12FirstInClass_9reset_statistics(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__del__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_7bundler_10extensions_5first_12FirstInClass_4__del__(((struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *)__pyx_v_self));
+  __Pyx_RefNannySetupContext("reset_statistics (wrapper)", 0);
+  __pyx_r = __pyx_pf_7bundler_10extensions_5first_12FirstInClass_8reset_statistics(((struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_7bundler_10extensions_5first_12FirstInClass_4__del__(struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *__pyx_v_self) {
+static PyObject *__pyx_pf_7bundler_10extensions_5first_12FirstInClass_8reset_statistics(struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *__pyx_v_self) {
+  int __pyx_v_i;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__del__", 0);
-
-  /* "bundler/extensions/first.pyx":106
- * 
- *     def __del__(self):
- *         free(self.inverse)             # <<<<<<<<<<<<<<
- *         free(self.any_missing)
- *         free(self.missing)
- */
-  free(__pyx_v_self->inverse);
+  long __pyx_t_1;
+  long __pyx_t_2;
+  int __pyx_t_3;
+  __Pyx_RefNannySetupContext("reset_statistics", 0);
 
-  /* "bundler/extensions/first.pyx":107
- *     def __del__(self):
- *         free(self.inverse)
- *         free(self.any_missing)             # <<<<<<<<<<<<<<
- *         free(self.missing)
- *         free(self.automorphisms)
+  /* "bundler/extensions/first.pyx":149
+ *     def reset_statistics(self):
+ *         cdef int i
+ *         for i in range(2 * FIC_OUTCOMES):             # <<<<<<<<<<<<<<
+ *             self.outcomes[i] = 0
+ *         self.explored[0] = self.explored[1] = 0
  */
-  free(__pyx_v_self->any_missing);
+  __pyx_t_1 = (2 * __pyx_e_7bundler_10extensions_5first_FIC_OUTCOMES);
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_i = __pyx_t_3;
 
-  /* "bundler/extensions/first.pyx":108
- *         free(self.inverse)
- *         free(self.any_missing)
- *         free(self.missing)             # <<<<<<<<<<<<<<
- *         free(self.automorphisms)
+    /* "bundler/extensions/first.pyx":150
+ *         cdef int i
+ *         for i in range(2 * FIC_OUTCOMES):
+ *             self.outcomes[i] = 0             # <<<<<<<<<<<<<<
+ *         self.explored[0] = self.explored[1] = 0
  * 
  */
-  free(__pyx_v_self->missing);
+    (__pyx_v_self->outcomes[__pyx_v_i]) = 0;
+  }
 
-  /* "bundler/extensions/first.pyx":109
- *         free(self.any_missing)
- *         free(self.missing)
- *         free(self.automorphisms)             # <<<<<<<<<<<<<<
+  /* "bundler/extensions/first.pyx":151
+ *         for i in range(2 * FIC_OUTCOMES):
+ *             self.outcomes[i] = 0
+ *         self.explored[0] = self.explored[1] = 0             # <<<<<<<<<<<<<<
  * 
  *     cdef bint c_before_automorphs(self, IWord& word, IWord& next_word, bint prefix, int* tmp):
  */
-  free(__pyx_v_self->automorphisms);
+  (__pyx_v_self->explored[0]) = 0;
+  (__pyx_v_self->explored[1]) = 0;
 
-  /* "bundler/extensions/first.pyx":105
- *         return (self.__class__, (self.alphabet, self.o_inverse, self.longest_relator, self.find_balanced_relators_FSM, self.bad_prefix_FSM, self.simpler_FSM, self.o_automorphisms))
+  /* "bundler/extensions/first.pyx":147
+ *         return stats
  * 
- *     def __del__(self):             # <<<<<<<<<<<<<<
- *         free(self.inverse)
- *         free(self.any_missing)
+ *     def reset_statistics(self):             # <<<<<<<<<<<<<<
+ *         cdef int i
+ *         for i in range(2 * FIC_OUTCOMES):
  */
 
   /* function exit code */
@@ -2874,15 +3948,15 @@ static PyObject *__pyx_pf_7bundler_10extensions_5first_12FirstInClass_4__del__(s
   return __pyx_r;
 }
 
-/* "bundler/extensions/first.pyx":111
- *         free(self.automorphisms)
+/* "bundler/extensions/first.pyx":153
+ *         self.explored[0] = self.explored[1] = 0
  * 
  *     cdef bint c_before_automorphs(self, IWord& word, IWord& next_word, bint prefix, int* tmp):             # <<<<<<<<<<<<<<
  *         ''' Return whether word is before all cyclic permutations of all automorphs of next_word and next_word^-1.
  * 
  */
 
-static int __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_before_automorphs(struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *__pyx_v_self, __pyx_t_7bundler_10extensions_5first_IWord &__pyx_v_word, __pyx_t_7bundler_10extensions_5first_IWord &__pyx_v_next_word, int __pyx_v_prefix, int *__pyx_v_tmp) {
+static int __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_before_automorphs(struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *__pyx_v_self, __pyx_t_7bundler_10extensions_3FSM_IWord &__pyx_v_word, __pyx_t_7bundler_10extensions_3FSM_IWord &__pyx_v_next_word, int __pyx_v_prefix, int *__pyx_v_tmp) {
   int __pyx_v_l0;
   int __pyx_v_i;
   int __pyx_v_j;
@@ -2907,7 +3981,7 @@ static int __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_before_automorp
   int __pyx_t_9;
   __Pyx_RefNannySetupContext("c_before_automorphs", 0);
 
-  /* "bundler/extensions/first.pyx":115
+  /* "bundler/extensions/first.pyx":157
  * 
  *         Requires memory for 8*l temporary integers. '''
  *         cdef int l0 = word.size()             # <<<<<<<<<<<<<<
@@ -2916,7 +3990,7 @@ static int __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_before_automorp
  */
   __pyx_v_l0 = __pyx_v_word.size();
 
-  /* "bundler/extensions/first.pyx":116
+  /* "bundler/extensions/first.pyx":158
  *         Requires memory for 8*l temporary integers. '''
  *         cdef int l0 = word.size()
  *         cdef int i, j, l = l0 + (1 if prefix else 0)             # <<<<<<<<<<<<<<
@@ -2930,7 +4004,7 @@ static int __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_before_automorp
   }
   __pyx_v_l = (__pyx_v_l0 + __pyx_t_1);
 
-  /* "bundler/extensions/first.pyx":119
+  /* "bundler/extensions/first.pyx":161
  *         cdef bint bad
  * 
  *         cdef int* wd = tmp + 0*l             # <<<<<<<<<<<<<<
@@ -2939,7 +4013,7 @@ static int __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_before_automorp
  */
   __pyx_v_wd = (__pyx_v_tmp + (0 * __pyx_v_l));
 
-  /* "bundler/extensions/first.pyx":120
+  /* "bundler/extensions/first.pyx":162
  * 
  *         cdef int* wd = tmp + 0*l
  *         cdef int* nxt_wd = tmp + 1*l             # <<<<<<<<<<<<<<
@@ -2948,7 +4022,7 @@ static int __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_before_automorp
  */
   __pyx_v_nxt_wd = (__pyx_v_tmp + (1 * __pyx_v_l));
 
-  /* "bundler/extensions/first.pyx":121
+  /* "bundler/extensions/first.pyx":163
  *         cdef int* wd = tmp + 0*l
  *         cdef int* nxt_wd = tmp + 1*l
  *         cdef int* nxt_wd_inv = tmp + 2*l             # <<<<<<<<<<<<<<
@@ -2957,7 +4031,7 @@ static int __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_before_automorp
  */
   __pyx_v_nxt_wd_inv = (__pyx_v_tmp + (2 * __pyx_v_l));
 
-  /* "bundler/extensions/first.pyx":122
+  /* "bundler/extensions/first.pyx":164
  *         cdef int* nxt_wd = tmp + 1*l
  *         cdef int* nxt_wd_inv = tmp + 2*l
  *         cdef int* automorphed = tmp + 3*l             # <<<<<<<<<<<<<<
@@ -2966,7 +4040,7 @@ static int __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_before_automorp
  */
   __pyx_v_automorphed = (__pyx_v_tmp + (3 * __pyx_v_l));
 
-  /* "bundler/extensions/first.pyx":125
+  /* "bundler/extensions/first.pyx":167
  * 
  *         # Scratch memory for Booth's algorithm.
  *         cdef int *tmp1 = tmp + 4*l             # <<<<<<<<<<<<<<
@@ -2975,7 +4049,7 @@ static int __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_before_automorp
  */
   __pyx_v_tmp1 = (__pyx_v_tmp + (4 * __pyx_v_l));
 
-  /* "bundler/extensions/first.pyx":126
+  /* "bundler/extensions/first.pyx":168
  *         # Scratch memory for Booth's algorithm.
  *         cdef int *tmp1 = tmp + 4*l
  *         cdef int *tmp2 = tmp + 6*l             # <<<<<<<<<<<<<<
@@ -2984,7 +4058,7 @@ static int __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_before_automorp
  */
   __pyx_v_tmp2 = (__pyx_v_tmp + (6 * __pyx_v_l));
 
-  /* "bundler/extensions/first.pyx":129
+  /* "bundler/extensions/first.pyx":171
  * 
  *         # Map word into a C array. Add a stop character to the end if required.
  *         for i in range(l0):             # <<<<<<<<<<<<<<
@@ -2996,7 +4070,7 @@ static int __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_before_automorp
   for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
     __pyx_v_i = __pyx_t_4;
 
-    /* "bundler/extensions/first.pyx":130
+    /* "bundler/extensions/first.pyx":172
  *         # Map word into a C array. Add a stop character to the end if required.
  *         for i in range(l0):
  *             wd[i] = word[i]             # <<<<<<<<<<<<<<
@@ -3006,7 +4080,7 @@ static int __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_before_automorp
     (__pyx_v_wd[__pyx_v_i]) = (__pyx_v_word[__pyx_v_i]);
   }
 
-  /* "bundler/extensions/first.pyx":131
+  /* "bundler/extensions/first.pyx":173
  *         for i in range(l0):
  *             wd[i] = word[i]
  *         if prefix:             # <<<<<<<<<<<<<<
@@ -3016,7 +4090,7 @@ static int __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_before_automorp
   __pyx_t_5 = (__pyx_v_prefix != 0);
   if (__pyx_t_5) {
 
-    /* "bundler/extensions/first.pyx":132
+    /* "bundler/extensions/first.pyx":174
  *             wd[i] = word[i]
  *         if prefix:
  *             wd[l0] = self.stop             # <<<<<<<<<<<<<<
@@ -3026,7 +4100,7 @@ static int __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_before_automorp
     __pyx_t_2 = __pyx_v_self->stop;
     (__pyx_v_wd[__pyx_v_l0]) = __pyx_t_2;
 
-    /* "bundler/extensions/first.pyx":131
+    /* "bundler/extensions/first.pyx":173
  *         for i in range(l0):
  *             wd[i] = word[i]
  *         if prefix:             # <<<<<<<<<<<<<<
@@ -3035,7 +4109,7 @@ static int __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_before_automorp
  */
   }
 
-  /* "bundler/extensions/first.pyx":135
+  /* "bundler/extensions/first.pyx":177
  * 
  *         # Map next_word into a C array. Add a stop character to the end if required.
  *         for i in range(l0):             # <<<<<<<<<<<<<<
@@ -3047,7 +4121,7 @@ static int __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_before_automorp
   for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
     __pyx_v_i = __pyx_t_4;
 
-    /* "bundler/extensions/first.pyx":136
+    /* "bundler/extensions/first.pyx":178
  *         # Map next_word into a C array. Add a stop character to the end if required.
  *         for i in range(l0):
  *             nxt_wd[i] = next_word[i]             # <<<<<<<<<<<<<<
@@ -3057,7 +4131,7 @@ static int __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_before_automorp
     (__pyx_v_nxt_wd[__pyx_v_i]) = (__pyx_v_next_word[__pyx_v_i]);
   }
 
-  /* "bundler/extensions/first.pyx":137
+  /* "bundler/extensions/first.pyx":179
  *         for i in range(l0):
  *             nxt_wd[i] = next_word[i]
  *         if prefix:             # <<<<<<<<<<<<<<
@@ -3067,7 +4141,7 @@ static int __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_before_automorp
   __pyx_t_5 = (__pyx_v_prefix != 0);
   if (__pyx_t_5) {
 
-    /* "bundler/extensions/first.pyx":138
+    /* "bundler/extensions/first.pyx":180
  *             nxt_wd[i] = next_word[i]
  *         if prefix:
  *             nxt_wd[l0] = self.stop             # <<<<<<<<<<<<<<
@@ -3077,7 +4151,7 @@ static int __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_before_automorp
     __pyx_t_2 = __pyx_v_self->stop;
     (__pyx_v_nxt_wd[__pyx_v_l0]) = __pyx_t_2;
 
-    /* "bundler/extensions/first.pyx":137
+    /* "bundler/extensions/first.pyx":179
  *         for i in range(l0):
  *             nxt_wd[i] = next_word[i]
  *         if prefix:             # <<<<<<<<<<<<<<
@@ -3086,7 +4160,7 @@ static int __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_before_automorp
  */
   }
 
-  /* "bundler/extensions/first.pyx":141
+  /* "bundler/extensions/first.pyx":183
  * 
  *         # Map next_word^-1 into a C array. Since nxt_wd already contains this, we reverse and inverse it.
  *         for i in range(l):             # <<<<<<<<<<<<<<
@@ -3098,7 +4172,7 @@ static int __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_before_automorp
   for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
     __pyx_v_i = __pyx_t_4;
 
-    /* "bundler/extensions/first.pyx":142
+    /* "bundler/extensions/first.pyx":184
  *         # Map next_word^-1 into a C array. Since nxt_wd already contains this, we reverse and inverse it.
  *         for i in range(l):
  *             nxt_wd_inv[i] = self.inverse[nxt_wd[l-i-1]]             # <<<<<<<<<<<<<<
@@ -3108,7 +4182,7 @@ static int __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_before_automorp
     (__pyx_v_nxt_wd_inv[__pyx_v_i]) = (__pyx_v_self->inverse[(__pyx_v_nxt_wd[((__pyx_v_l - __pyx_v_i) - 1)])]);
   }
 
-  /* "bundler/extensions/first.pyx":144
+  /* "bundler/extensions/first.pyx":186
  *             nxt_wd_inv[i] = self.inverse[nxt_wd[l-i-1]]
  * 
  *         for i in range(self.num_automorphisms):             # <<<<<<<<<<<<<<
@@ -3120,7 +4194,7 @@ static int __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_before_automorp
   for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
     __pyx_v_i = __pyx_t_4;
 
-    /* "bundler/extensions/first.pyx":145
+    /* "bundler/extensions/first.pyx":187
  * 
  *         for i in range(self.num_automorphisms):
  *             if prefix and self.any_missing[i]: continue             # <<<<<<<<<<<<<<
@@ -3140,7 +4214,7 @@ static int __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_before_automorp
       goto __pyx_L11_continue;
     }
 
-    /* "bundler/extensions/first.pyx":147
+    /* "bundler/extensions/first.pyx":189
  *             if prefix and self.any_missing[i]: continue
  *             # if any(letter in next_word for letter in self.missing[i]): continue
  *             bad = False             # <<<<<<<<<<<<<<
@@ -3149,7 +4223,7 @@ static int __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_before_automorp
  */
     __pyx_v_bad = 0;
 
-    /* "bundler/extensions/first.pyx":148
+    /* "bundler/extensions/first.pyx":190
  *             # if any(letter in next_word for letter in self.missing[i]): continue
  *             bad = False
  *             for j in range(l):             # <<<<<<<<<<<<<<
@@ -3161,7 +4235,7 @@ static int __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_before_automorp
     for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
       __pyx_v_j = __pyx_t_9;
 
-      /* "bundler/extensions/first.pyx":149
+      /* "bundler/extensions/first.pyx":191
  *             bad = False
  *             for j in range(l):
  *                 if self.missing[self.len_alphabet1 * i + nxt_wd[j]]:             # <<<<<<<<<<<<<<
@@ -3171,7 +4245,7 @@ static int __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_before_automorp
       __pyx_t_5 = ((__pyx_v_self->missing[((__pyx_v_self->len_alphabet1 * __pyx_v_i) + (__pyx_v_nxt_wd[__pyx_v_j]))]) != 0);
       if (__pyx_t_5) {
 
-        /* "bundler/extensions/first.pyx":150
+        /* "bundler/extensions/first.pyx":192
  *             for j in range(l):
  *                 if self.missing[self.len_alphabet1 * i + nxt_wd[j]]:
  *                     bad = True             # <<<<<<<<<<<<<<
@@ -3180,7 +4254,7 @@ static int __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_before_automorp
  */
         __pyx_v_bad = 1;
 
-        /* "bundler/extensions/first.pyx":151
+        /* "bundler/extensions/first.pyx":193
  *                 if self.missing[self.len_alphabet1 * i + nxt_wd[j]]:
  *                     bad = True
  *                     break             # <<<<<<<<<<<<<<
@@ -3189,7 +4263,7 @@ static int __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_before_automorp
  */
         goto __pyx_L17_break;
 
-        /* "bundler/extensions/first.pyx":149
+        /* "bundler/extensions/first.pyx":191
  *             bad = False
  *             for j in range(l):
  *                 if self.missing[self.len_alphabet1 * i + nxt_wd[j]]:             # <<<<<<<<<<<<<<
@@ -3200,7 +4274,7 @@ static int __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_before_automorp
     }
     __pyx_L17_break:;
 
-    /* "bundler/extensions/first.pyx":152
+    /* "bundler/extensions/first.pyx":194
  *                     bad = True
  *                     break
  *             if bad: continue             # <<<<<<<<<<<<<<
@@ -3212,7 +4286,7 @@ static int __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_before_automorp
       goto __pyx_L11_continue;
     }
 
-    /* "bundler/extensions/first.pyx":155
+    /* "bundler/extensions/first.pyx":197
  * 
  *             # Construct and test automorph(next_word).
  *             for j in range(l):             # <<<<<<<<<<<<<<
@@ -3224,7 +4298,7 @@ static int __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_before_automorp
     for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
       __pyx_v_j = __pyx_t_9;
 
-      /* "bundler/extensions/first.pyx":156
+      /* "bundler/extensions/first.pyx":198
  *             # Construct and test automorph(next_word).
  *             for j in range(l):
  *                 automorphed[j] = self.automorphisms[i * self.len_alphabet1 + nxt_wd[j]]             # <<<<<<<<<<<<<<
@@ -3234,7 +4308,7 @@ static int __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_before_automorp
       (__pyx_v_automorphed[__pyx_v_j]) = (__pyx_v_self->automorphisms[((__pyx_v_i * __pyx_v_self->len_alphabet1) + (__pyx_v_nxt_wd[__pyx_v_j]))]);
     }
 
-    /* "bundler/extensions/first.pyx":157
+    /* "bundler/extensions/first.pyx":199
  *             for j in range(l):
  *                 automorphed[j] = self.automorphisms[i * self.len_alphabet1 + nxt_wd[j]]
  *             if not is_cyclic_ordered(wd, automorphed, l, tmp1, tmp2): return False             # <<<<<<<<<<<<<<
@@ -3247,7 +4321,7 @@ static int __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_before_automorp
       goto __pyx_L0;
     }
 
-    /* "bundler/extensions/first.pyx":160
+    /* "bundler/extensions/first.pyx":202
  * 
  *             # Construct and test automorph(next_word^-1).
  *             for j in range(l):             # <<<<<<<<<<<<<<
@@ -3259,7 +4333,7 @@ static int __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_before_automorp
     for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
       __pyx_v_j = __pyx_t_9;
 
-      /* "bundler/extensions/first.pyx":161
+      /* "bundler/extensions/first.pyx":203
  *             # Construct and test automorph(next_word^-1).
  *             for j in range(l):
  *                 automorphed[j] = self.automorphisms[i * self.len_alphabet1 + nxt_wd_inv[j]]             # <<<<<<<<<<<<<<
@@ -3269,7 +4343,7 @@ static int __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_before_automorp
       (__pyx_v_automorphed[__pyx_v_j]) = (__pyx_v_self->automorphisms[((__pyx_v_i * __pyx_v_self->len_alphabet1) + (__pyx_v_nxt_wd_inv[__pyx_v_j]))]);
     }
 
-    /* "bundler/extensions/first.pyx":162
+    /* "bundler/extensions/first.pyx":204
  *             for j in range(l):
  *                 automorphed[j] = self.automorphisms[i * self.len_alphabet1 + nxt_wd_inv[j]]
  *             if not is_cyclic_ordered(wd, automorphed, l, tmp1, tmp2): return False             # <<<<<<<<<<<<<<
@@ -3284,18 +4358,18 @@ static int __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_before_automorp
     __pyx_L11_continue:;
   }
 
-  /* "bundler/extensions/first.pyx":164
+  /* "bundler/extensions/first.pyx":206
  *             if not is_cyclic_ordered(wd, automorphed, l, tmp1, tmp2): return False
  * 
  *         return True             # <<<<<<<<<<<<<<
  * 
- *     def is_first(self, tuple word, bint prefix, int max_tree_size):
+ *     cdef void c_reset_seen(self, int max_tree_size):
  */
   __pyx_r = 1;
   goto __pyx_L0;
 
-  /* "bundler/extensions/first.pyx":111
- *         free(self.automorphisms)
+  /* "bundler/extensions/first.pyx":153
+ *         self.explored[0] = self.explored[1] = 0
  * 
  *     cdef bint c_before_automorphs(self, IWord& word, IWord& next_word, bint prefix, int* tmp):             # <<<<<<<<<<<<<<
  *         ''' Return whether word is before all cyclic permutations of all automorphs of next_word and next_word^-1.
@@ -3308,18 +4382,353 @@ static int __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_before_automorp
   return __pyx_r;
 }
 
-/* "bundler/extensions/first.pyx":166
+/* "bundler/extensions/first.pyx":208
+ *         return True
+ * 
+ *     cdef void c_reset_seen(self, int max_tree_size):             # <<<<<<<<<<<<<<
+ *         ''' Empty the seen set and queue, making room for max_tree_size words without growing. '''
+ *         cdef uint64_t capacity = 64
+ */
+
+static void __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_reset_seen(struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *__pyx_v_self, int __pyx_v_max_tree_size) {
+  uint64_t __pyx_v_capacity;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("c_reset_seen", 0);
+
+  /* "bundler/extensions/first.pyx":210
+ *     cdef void c_reset_seen(self, int max_tree_size):
+ *         ''' Empty the seen set and queue, making room for max_tree_size words without growing. '''
+ *         cdef uint64_t capacity = 64             # <<<<<<<<<<<<<<
+ *         while max_tree_size > 0 and capacity < 2 * <uint64_t>(max_tree_size + 1):
+ *             capacity *= 2
+ */
+  __pyx_v_capacity = 64;
+
+  /* "bundler/extensions/first.pyx":211
+ *         ''' Empty the seen set and queue, making room for max_tree_size words without growing. '''
+ *         cdef uint64_t capacity = 64
+ *         while max_tree_size > 0 and capacity < 2 * <uint64_t>(max_tree_size + 1):             # <<<<<<<<<<<<<<
+ *             capacity *= 2
+ *         self.seen_table.assign(capacity, EMPTY_SLOT)
+ */
+  while (1) {
+    __pyx_t_2 = ((__pyx_v_max_tree_size > 0) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L5_bool_binop_done;
+    }
+    __pyx_t_2 = ((__pyx_v_capacity < (2 * ((uint64_t)(__pyx_v_max_tree_size + 1)))) != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L5_bool_binop_done:;
+    if (!__pyx_t_1) break;
+
+    /* "bundler/extensions/first.pyx":212
+ *         cdef uint64_t capacity = 64
+ *         while max_tree_size > 0 and capacity < 2 * <uint64_t>(max_tree_size + 1):
+ *             capacity *= 2             # <<<<<<<<<<<<<<
+ *         self.seen_table.assign(capacity, EMPTY_SLOT)
+ *         self.seen_mask = capacity - 1
+ */
+    __pyx_v_capacity = (__pyx_v_capacity * 2);
+  }
+
+  /* "bundler/extensions/first.pyx":213
+ *         while max_tree_size > 0 and capacity < 2 * <uint64_t>(max_tree_size + 1):
+ *             capacity *= 2
+ *         self.seen_table.assign(capacity, EMPTY_SLOT)             # <<<<<<<<<<<<<<
+ *         self.seen_mask = capacity - 1
+ *         self.seen_count = 0
+ */
+  try {
+    __pyx_v_self->seen_table.assign(__pyx_v_capacity, __pyx_v_7bundler_10extensions_5first_EMPTY_SLOT);
+  } catch(...) {
+    __Pyx_CppExn2PyErr();
+    __PYX_ERR(0, 213, __pyx_L1_error)
+  }
+
+  /* "bundler/extensions/first.pyx":214
+ *             capacity *= 2
+ *         self.seen_table.assign(capacity, EMPTY_SLOT)
+ *         self.seen_mask = capacity - 1             # <<<<<<<<<<<<<<
+ *         self.seen_count = 0
+ *         self.packed_queue.clear()
+ */
+  __pyx_v_self->seen_mask = (__pyx_v_capacity - 1);
+
+  /* "bundler/extensions/first.pyx":215
+ *         self.seen_table.assign(capacity, EMPTY_SLOT)
+ *         self.seen_mask = capacity - 1
+ *         self.seen_count = 0             # <<<<<<<<<<<<<<
+ *         self.packed_queue.clear()
+ * 
+ */
+  __pyx_v_self->seen_count = 0;
+
+  /* "bundler/extensions/first.pyx":216
+ *         self.seen_mask = capacity - 1
+ *         self.seen_count = 0
+ *         self.packed_queue.clear()             # <<<<<<<<<<<<<<
+ * 
+ *     cdef uint64_t c_find_slot(self, uint64_t key):
+ */
+  __pyx_v_self->packed_queue.clear();
+
+  /* "bundler/extensions/first.pyx":208
  *         return True
  * 
+ *     cdef void c_reset_seen(self, int max_tree_size):             # <<<<<<<<<<<<<<
+ *         ''' Empty the seen set and queue, making room for max_tree_size words without growing. '''
+ *         cdef uint64_t capacity = 64
+ */
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_WriteUnraisable("bundler.extensions.first.FirstInClass.c_reset_seen", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "bundler/extensions/first.pyx":218
+ *         self.packed_queue.clear()
+ * 
+ *     cdef uint64_t c_find_slot(self, uint64_t key):             # <<<<<<<<<<<<<<
+ *         ''' Return the slot of the seen set that contains key or the empty slot where it should go. '''
+ *         cdef uint64_t slot = hash_key(key) & self.seen_mask
+ */
+
+static uint64_t __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_find_slot(struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *__pyx_v_self, uint64_t __pyx_v_key) {
+  uint64_t __pyx_v_slot;
+  uint64_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  __Pyx_RefNannySetupContext("c_find_slot", 0);
+
+  /* "bundler/extensions/first.pyx":220
+ *     cdef uint64_t c_find_slot(self, uint64_t key):
+ *         ''' Return the slot of the seen set that contains key or the empty slot where it should go. '''
+ *         cdef uint64_t slot = hash_key(key) & self.seen_mask             # <<<<<<<<<<<<<<
+ *         while self.seen_table[slot] != EMPTY_SLOT and self.seen_table[slot] != key:
+ *             slot = (slot + 1) & self.seen_mask  # Linear probing.
+ */
+  __pyx_v_slot = (__pyx_f_7bundler_10extensions_5first_hash_key(__pyx_v_key) & __pyx_v_self->seen_mask);
+
+  /* "bundler/extensions/first.pyx":221
+ *         ''' Return the slot of the seen set that contains key or the empty slot where it should go. '''
+ *         cdef uint64_t slot = hash_key(key) & self.seen_mask
+ *         while self.seen_table[slot] != EMPTY_SLOT and self.seen_table[slot] != key:             # <<<<<<<<<<<<<<
+ *             slot = (slot + 1) & self.seen_mask  # Linear probing.
+ *         return slot
+ */
+  while (1) {
+    __pyx_t_2 = (((__pyx_v_self->seen_table[__pyx_v_slot]) != __pyx_v_7bundler_10extensions_5first_EMPTY_SLOT) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L5_bool_binop_done;
+    }
+    __pyx_t_2 = (((__pyx_v_self->seen_table[__pyx_v_slot]) != __pyx_v_key) != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L5_bool_binop_done:;
+    if (!__pyx_t_1) break;
+
+    /* "bundler/extensions/first.pyx":222
+ *         cdef uint64_t slot = hash_key(key) & self.seen_mask
+ *         while self.seen_table[slot] != EMPTY_SLOT and self.seen_table[slot] != key:
+ *             slot = (slot + 1) & self.seen_mask  # Linear probing.             # <<<<<<<<<<<<<<
+ *         return slot
+ * 
+ */
+    __pyx_v_slot = ((__pyx_v_slot + 1) & __pyx_v_self->seen_mask);
+  }
+
+  /* "bundler/extensions/first.pyx":223
+ *         while self.seen_table[slot] != EMPTY_SLOT and self.seen_table[slot] != key:
+ *             slot = (slot + 1) & self.seen_mask  # Linear probing.
+ *         return slot             # <<<<<<<<<<<<<<
+ * 
+ *     cdef void c_insert_seen(self, uint64_t slot, uint64_t key):
+ */
+  __pyx_r = __pyx_v_slot;
+  goto __pyx_L0;
+
+  /* "bundler/extensions/first.pyx":218
+ *         self.packed_queue.clear()
+ * 
+ *     cdef uint64_t c_find_slot(self, uint64_t key):             # <<<<<<<<<<<<<<
+ *         ''' Return the slot of the seen set that contains key or the empty slot where it should go. '''
+ *         cdef uint64_t slot = hash_key(key) & self.seen_mask
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bundler/extensions/first.pyx":225
+ *         return slot
+ * 
+ *     cdef void c_insert_seen(self, uint64_t slot, uint64_t key):             # <<<<<<<<<<<<<<
+ *         ''' Insert key into the given slot (from c_find_slot), growing the table if it gets too full. '''
+ *         cdef vector[uint64_t] old_table
+ */
+
+static void __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_insert_seen(struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *__pyx_v_self, uint64_t __pyx_v_slot, uint64_t __pyx_v_key) {
+  std::vector<uint64_t>  __pyx_v_old_table;
+  uint64_t __pyx_v_old_key;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  std::vector<uint64_t> ::iterator __pyx_t_2;
+  uint64_t __pyx_t_3;
+  __Pyx_RefNannySetupContext("c_insert_seen", 0);
+
+  /* "bundler/extensions/first.pyx":229
+ *         cdef vector[uint64_t] old_table
+ *         cdef uint64_t old_key
+ *         self.seen_table[slot] = key             # <<<<<<<<<<<<<<
+ *         self.seen_count += 1
+ *         if 2 * <uint64_t>self.seen_count > self.seen_mask:
+ */
+  (__pyx_v_self->seen_table[__pyx_v_slot]) = __pyx_v_key;
+
+  /* "bundler/extensions/first.pyx":230
+ *         cdef uint64_t old_key
+ *         self.seen_table[slot] = key
+ *         self.seen_count += 1             # <<<<<<<<<<<<<<
+ *         if 2 * <uint64_t>self.seen_count > self.seen_mask:
+ *             old_table.swap(self.seen_table)
+ */
+  __pyx_v_self->seen_count = (__pyx_v_self->seen_count + 1);
+
+  /* "bundler/extensions/first.pyx":231
+ *         self.seen_table[slot] = key
+ *         self.seen_count += 1
+ *         if 2 * <uint64_t>self.seen_count > self.seen_mask:             # <<<<<<<<<<<<<<
+ *             old_table.swap(self.seen_table)
+ *             self.seen_table.assign(2 * old_table.size(), EMPTY_SLOT)
+ */
+  __pyx_t_1 = (((2 * ((uint64_t)__pyx_v_self->seen_count)) > __pyx_v_self->seen_mask) != 0);
+  if (__pyx_t_1) {
+
+    /* "bundler/extensions/first.pyx":232
+ *         self.seen_count += 1
+ *         if 2 * <uint64_t>self.seen_count > self.seen_mask:
+ *             old_table.swap(self.seen_table)             # <<<<<<<<<<<<<<
+ *             self.seen_table.assign(2 * old_table.size(), EMPTY_SLOT)
+ *             self.seen_mask = self.seen_table.size() - 1
+ */
+    __pyx_v_old_table.swap(__pyx_v_self->seen_table);
+
+    /* "bundler/extensions/first.pyx":233
+ *         if 2 * <uint64_t>self.seen_count > self.seen_mask:
+ *             old_table.swap(self.seen_table)
+ *             self.seen_table.assign(2 * old_table.size(), EMPTY_SLOT)             # <<<<<<<<<<<<<<
+ *             self.seen_mask = self.seen_table.size() - 1
+ *             for old_key in old_table:
+ */
+    __pyx_v_self->seen_table.assign((2 * __pyx_v_old_table.size()), __pyx_v_7bundler_10extensions_5first_EMPTY_SLOT);
+
+    /* "bundler/extensions/first.pyx":234
+ *             old_table.swap(self.seen_table)
+ *             self.seen_table.assign(2 * old_table.size(), EMPTY_SLOT)
+ *             self.seen_mask = self.seen_table.size() - 1             # <<<<<<<<<<<<<<
+ *             for old_key in old_table:
+ *                 if old_key != EMPTY_SLOT:
+ */
+    __pyx_v_self->seen_mask = (__pyx_v_self->seen_table.size() - 1);
+
+    /* "bundler/extensions/first.pyx":235
+ *             self.seen_table.assign(2 * old_table.size(), EMPTY_SLOT)
+ *             self.seen_mask = self.seen_table.size() - 1
+ *             for old_key in old_table:             # <<<<<<<<<<<<<<
+ *                 if old_key != EMPTY_SLOT:
+ *                     self.seen_table[self.c_find_slot(old_key)] = old_key
+ */
+    __pyx_t_2 = __pyx_v_old_table.begin();
+    for (;;) {
+      if (!(__pyx_t_2 != __pyx_v_old_table.end())) break;
+      __pyx_t_3 = *__pyx_t_2;
+      ++__pyx_t_2;
+      __pyx_v_old_key = __pyx_t_3;
+
+      /* "bundler/extensions/first.pyx":236
+ *             self.seen_mask = self.seen_table.size() - 1
+ *             for old_key in old_table:
+ *                 if old_key != EMPTY_SLOT:             # <<<<<<<<<<<<<<
+ *                     self.seen_table[self.c_find_slot(old_key)] = old_key
+ * 
+ */
+      __pyx_t_1 = ((__pyx_v_old_key != __pyx_v_7bundler_10extensions_5first_EMPTY_SLOT) != 0);
+      if (__pyx_t_1) {
+
+        /* "bundler/extensions/first.pyx":237
+ *             for old_key in old_table:
+ *                 if old_key != EMPTY_SLOT:
+ *                     self.seen_table[self.c_find_slot(old_key)] = old_key             # <<<<<<<<<<<<<<
+ * 
+ *     def is_first(self, tuple word, bint prefix, int max_tree_size):
+ */
+        (__pyx_v_self->seen_table[((struct __pyx_vtabstruct_7bundler_10extensions_5first_FirstInClass *)__pyx_v_self->__pyx_vtab)->c_find_slot(__pyx_v_self, __pyx_v_old_key)]) = __pyx_v_old_key;
+
+        /* "bundler/extensions/first.pyx":236
+ *             self.seen_mask = self.seen_table.size() - 1
+ *             for old_key in old_table:
+ *                 if old_key != EMPTY_SLOT:             # <<<<<<<<<<<<<<
+ *                     self.seen_table[self.c_find_slot(old_key)] = old_key
+ * 
+ */
+      }
+
+      /* "bundler/extensions/first.pyx":235
+ *             self.seen_table.assign(2 * old_table.size(), EMPTY_SLOT)
+ *             self.seen_mask = self.seen_table.size() - 1
+ *             for old_key in old_table:             # <<<<<<<<<<<<<<
+ *                 if old_key != EMPTY_SLOT:
+ *                     self.seen_table[self.c_find_slot(old_key)] = old_key
+ */
+    }
+
+    /* "bundler/extensions/first.pyx":231
+ *         self.seen_table[slot] = key
+ *         self.seen_count += 1
+ *         if 2 * <uint64_t>self.seen_count > self.seen_mask:             # <<<<<<<<<<<<<<
+ *             old_table.swap(self.seen_table)
+ *             self.seen_table.assign(2 * old_table.size(), EMPTY_SLOT)
+ */
+  }
+
+  /* "bundler/extensions/first.pyx":225
+ *         return slot
+ * 
+ *     cdef void c_insert_seen(self, uint64_t slot, uint64_t key):             # <<<<<<<<<<<<<<
+ *         ''' Insert key into the given slot (from c_find_slot), growing the table if it gets too full. '''
+ *         cdef vector[uint64_t] old_table
+ */
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "bundler/extensions/first.pyx":239
+ *                     self.seen_table[self.c_find_slot(old_key)] = old_key
+ * 
  *     def is_first(self, tuple word, bint prefix, int max_tree_size):             # <<<<<<<<<<<<<<
  *         ''' Determines if a word is lex first in its class.
  * 
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7bundler_10extensions_5first_12FirstInClass_7is_first(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_7bundler_10extensions_5first_12FirstInClass_6is_first[] = " Determines if a word is lex first in its class.\n        \n        Uses relators and automorphs to find alternative representatives. Gives up after finding\n        max_tree_size alternatives, if max_tree_size <= 0 this will run until it has found all\n        equivalent words of the same length in which case the result returned is absolutely correct.\n        \n        If prefix == True, only prefix stable stable moves are performed, i.e. if it is discovered\n        that u ~ v then uw ~ vw for all words w.\n        \n        This function is the heart of the grow phase, speed is critical here.";
-static PyObject *__pyx_pw_7bundler_10extensions_5first_12FirstInClass_7is_first(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_7bundler_10extensions_5first_12FirstInClass_11is_first(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_7bundler_10extensions_5first_12FirstInClass_10is_first[] = " Determines if a word is lex first in its class.\n        \n        Uses relators and automorphs to find alternative representatives. Gives up after finding\n        max_tree_size alternatives, if max_tree_size <= 0 this will run until it has found all\n        equivalent words of the same length in which case the result returned is absolutely correct.\n        \n        If prefix == True, only prefix stable stable moves are performed, i.e. if it is discovered\n        that u ~ v then uw ~ vw for all words w.\n        \n        This function is the heart of the grow phase, speed is critical here.";
+static PyObject *__pyx_pw_7bundler_10extensions_5first_12FirstInClass_11is_first(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_word = 0;
   int __pyx_v_prefix;
   int __pyx_v_max_tree_size;
@@ -3354,17 +4763,17 @@ static PyObject *__pyx_pw_7bundler_10extensions_5first_12FirstInClass_7is_first(
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_prefix)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("is_first", 1, 3, 3, 1); __PYX_ERR(0, 166, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("is_first", 1, 3, 3, 1); __PYX_ERR(0, 239, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_max_tree_size)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("is_first", 1, 3, 3, 2); __PYX_ERR(0, 166, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("is_first", 1, 3, 3, 2); __PYX_ERR(0, 239, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "is_first") < 0)) __PYX_ERR(0, 166, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "is_first") < 0)) __PYX_ERR(0, 239, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
       goto __pyx_L5_argtuple_error;
@@ -3374,19 +4783,19 @@ static PyObject *__pyx_pw_7bundler_10extensions_5first_12FirstInClass_7is_first(
       values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
     }
     __pyx_v_word = ((PyObject*)values[0]);
-    __pyx_v_prefix = __Pyx_PyObject_IsTrue(values[1]); if (unlikely((__pyx_v_prefix == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 166, __pyx_L3_error)
-    __pyx_v_max_tree_size = __Pyx_PyInt_As_int(values[2]); if (unlikely((__pyx_v_max_tree_size == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 166, __pyx_L3_error)
+    __pyx_v_prefix = __Pyx_PyObject_IsTrue(values[1]); if (unlikely((__pyx_v_prefix == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 239, __pyx_L3_error)
+    __pyx_v_max_tree_size = __Pyx_PyInt_As_int(values[2]); if (unlikely((__pyx_v_max_tree_size == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 239, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("is_first", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 166, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("is_first", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 239, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("bundler.extensions.first.FirstInClass.is_first", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_word), (&PyTuple_Type), 1, "word", 1))) __PYX_ERR(0, 166, __pyx_L1_error)
-  __pyx_r = __pyx_pf_7bundler_10extensions_5first_12FirstInClass_6is_first(((struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *)__pyx_v_self), __pyx_v_word, __pyx_v_prefix, __pyx_v_max_tree_size);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_word), (&PyTuple_Type), 1, "word", 1))) __PYX_ERR(0, 239, __pyx_L1_error)
+  __pyx_r = __pyx_pf_7bundler_10extensions_5first_12FirstInClass_10is_first(((struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *)__pyx_v_self), __pyx_v_word, __pyx_v_prefix, __pyx_v_max_tree_size);
 
   /* function exit code */
   goto __pyx_L0;
@@ -3397,15 +4806,67 @@ static PyObject *__pyx_pw_7bundler_10extensions_5first_12FirstInClass_7is_first(
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_7bundler_10extensions_5first_12FirstInClass_6is_first(struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *__pyx_v_self, PyObject *__pyx_v_word, int __pyx_v_prefix, int __pyx_v_max_tree_size) {
-  __pyx_t_7bundler_10extensions_5first_IWord __pyx_v_wrd;
+static PyObject *__pyx_pf_7bundler_10extensions_5first_12FirstInClass_10is_first(struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *__pyx_v_self, PyObject *__pyx_v_word, int __pyx_v_prefix, int __pyx_v_max_tree_size) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __pyx_t_7bundler_10extensions_3FSM_IWord __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("is_first", 0);
+
+  /* "bundler/extensions/first.pyx":251
+ *         This function is the heart of the grow phase, speed is critical here.'''
+ * 
+ *         return self.c_is_first(word, prefix, max_tree_size)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef bint c_is_first(self, IWord& wrd, bint prefix, int max_tree_size, bint check_bad_prefix=True):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_convert_vector_from_py_int(__pyx_v_word); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 251, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyBool_FromLong(((struct __pyx_vtabstruct_7bundler_10extensions_5first_FirstInClass *)__pyx_v_self->__pyx_vtab)->c_is_first(__pyx_v_self, __pyx_t_1, __pyx_v_prefix, __pyx_v_max_tree_size, NULL)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 251, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "bundler/extensions/first.pyx":239
+ *                     self.seen_table[self.c_find_slot(old_key)] = old_key
+ * 
+ *     def is_first(self, tuple word, bint prefix, int max_tree_size):             # <<<<<<<<<<<<<<
+ *         ''' Determines if a word is lex first in its class.
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("bundler.extensions.first.FirstInClass.is_first", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bundler/extensions/first.pyx":253
+ *         return self.c_is_first(word, prefix, max_tree_size)
+ * 
+ *     cdef bint c_is_first(self, IWord& wrd, bint prefix, int max_tree_size, bint check_bad_prefix=True):             # <<<<<<<<<<<<<<
+ *         ''' The C-level implementation of is_first.
+ * 
+ */
+
+static int __pyx_f_7bundler_10extensions_5first_12FirstInClass_c_is_first(struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *__pyx_v_self, __pyx_t_7bundler_10extensions_3FSM_IWord &__pyx_v_wrd, int __pyx_v_prefix, int __pyx_v_max_tree_size, struct __pyx_opt_args_7bundler_10extensions_5first_12FirstInClass_c_is_first *__pyx_optional_args) {
+  int __pyx_v_check_bad_prefix = ((int)1);
   int __pyx_v_len_word;
-  std::queue<__pyx_t_7bundler_10extensions_5first_IWord>  __pyx_v_to_do;
-  std::set<__pyx_t_7bundler_10extensions_5first_IWord>  __pyx_v_seen;
-  __pyx_t_7bundler_10extensions_5first_IWord __pyx_v_next_wrd;
-  __pyx_t_7bundler_10extensions_5first_IWord __pyx_v_replace;
-  __pyx_t_7bundler_10extensions_5first_IWord __pyx_v_reached;
-  std::vector<std::pair<int,__pyx_t_7bundler_10extensions_5first_IWord> >  __pyx_v_returns;
+  std::queue<__pyx_t_7bundler_10extensions_3FSM_IWord>  __pyx_v_to_do;
+  std::set<__pyx_t_7bundler_10extensions_3FSM_IWord>  __pyx_v_seen;
+  __pyx_t_7bundler_10extensions_3FSM_IWord __pyx_v_next_wrd;
+  __pyx_t_7bundler_10extensions_3FSM_IWord __pyx_v_replace;
+  __pyx_t_7bundler_10extensions_3FSM_IWord __pyx_v_reached;
+  std::vector<std::pair<int,__pyx_t_7bundler_10extensions_3FSM_IWord> >  __pyx_v_returns;
   int __pyx_v_a;
   int __pyx_v_b;
   int __pyx_v_i;
@@ -3413,99 +4874,151 @@ static PyObject *__pyx_pf_7bundler_10extensions_5first_12FirstInClass_6is_first(
   int __pyx_v_k;
   int __pyx_v_s;
   int __pyx_v_len_replace;
+  int __pyx_v_packed;
+  size_t __pyx_v_head;
+  uint64_t __pyx_v_key;
+  uint64_t __pyx_v_slot;
   int __pyx_v_l;
   int __pyx_v_nl;
   int __pyx_v_len_word_relators;
+  int __pyx_v_outcome;
+  long __pyx_v_processed;
   int *__pyx_v_tmp;
-  PyObject *__pyx_r = NULL;
+  int __pyx_r;
   __Pyx_RefNannyDeclarations
-  __pyx_t_7bundler_10extensions_5first_IWord __pyx_t_1;
-  long __pyx_t_2;
+  long __pyx_t_1;
+  int __pyx_t_2;
   int __pyx_t_3;
   int __pyx_t_4;
   std::vector<std::pair<int,__pyx_t_7bundler_10extensions_3FSM_IWord> >  __pyx_t_5;
   struct __pyx_opt_args_7bundler_10extensions_3FSM_3FSM_c_hits __pyx_t_6;
   long __pyx_t_7;
   int __pyx_t_8;
-  int __pyx_t_9;
+  __pyx_t_7bundler_10extensions_3FSM_IWord __pyx_t_9;
   int __pyx_t_10;
-  __Pyx_FakeReference<int> __pyx_t_11;
-  struct __pyx_opt_args_7bundler_10extensions_3FSM_3FSM_c_hit __pyx_t_12;
-  int __pyx_t_13;
-  char const *__pyx_t_14;
-  PyObject *__pyx_t_15 = NULL;
+  int __pyx_t_11;
+  __Pyx_FakeReference<int> __pyx_t_12;
+  struct __pyx_opt_args_7bundler_10extensions_3FSM_3FSM_c_hit __pyx_t_13;
+  size_t __pyx_t_14;
+  char const *__pyx_t_15;
   PyObject *__pyx_t_16 = NULL;
   PyObject *__pyx_t_17 = NULL;
   PyObject *__pyx_t_18 = NULL;
   PyObject *__pyx_t_19 = NULL;
   PyObject *__pyx_t_20 = NULL;
+  PyObject *__pyx_t_21 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("is_first", 0);
-
-  /* "bundler/extensions/first.pyx":178
- *         This function is the heart of the grow phase, speed is critical here.'''
- * 
- *         cdef IWord wrd = word             # <<<<<<<<<<<<<<
- *         cdef int len_word = wrd.size()  # Let's save some highly used data.
- *         cdef queue[IWord] to_do  # This is a deque of all words that have yet to be processed.
- */
-  __pyx_t_1 = __pyx_convert_vector_from_py_int(__pyx_v_word); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 178, __pyx_L1_error)
-  __pyx_v_wrd = __pyx_t_1;
+  __Pyx_RefNannySetupContext("c_is_first", 0);
+  if (__pyx_optional_args) {
+    if (__pyx_optional_args->__pyx_n > 0) {
+      __pyx_v_check_bad_prefix = __pyx_optional_args->check_bad_prefix;
+    }
+  }
 
-  /* "bundler/extensions/first.pyx":179
+  /* "bundler/extensions/first.pyx":258
+ *         The bad prefix test can be skipped by callers that already track bad_prefix_FSM along wrd. '''
  * 
- *         cdef IWord wrd = word
  *         cdef int len_word = wrd.size()  # Let's save some highly used data.             # <<<<<<<<<<<<<<
  *         cdef queue[IWord] to_do  # This is a deque of all words that have yet to be processed.
  *         cdef set[IWord] seen  # This records all words that we have seen.
  */
   __pyx_v_len_word = __pyx_v_wrd.size();
 
-  /* "bundler/extensions/first.pyx":188
- *         cdef int len_replace
+  /* "bundler/extensions/first.pyx":268
+ * 
+ *         # Short words are packed into integers and tracked in self.seen_table / self.packed_queue instead.
+ *         cdef bint packed = len_word <= self.max_packed_length             # <<<<<<<<<<<<<<
+ *         cdef size_t head = 0
+ *         cdef uint64_t key, slot = 0
+ */
+  __pyx_v_packed = (__pyx_v_len_word <= __pyx_v_self->max_packed_length);
+
+  /* "bundler/extensions/first.pyx":269
+ *         # Short words are packed into integers and tracked in self.seen_table / self.packed_queue instead.
+ *         cdef bint packed = len_word <= self.max_packed_length
+ *         cdef size_t head = 0             # <<<<<<<<<<<<<<
+ *         cdef uint64_t key, slot = 0
+ * 
+ */
+  __pyx_v_head = 0;
+
+  /* "bundler/extensions/first.pyx":270
+ *         cdef bint packed = len_word <= self.max_packed_length
+ *         cdef size_t head = 0
+ *         cdef uint64_t key, slot = 0             # <<<<<<<<<<<<<<
+ * 
+ *         cdef int l = len_word + (1 if prefix else 0)
+ */
+  __pyx_v_slot = 0;
+
+  /* "bundler/extensions/first.pyx":272
+ *         cdef uint64_t key, slot = 0
  * 
  *         cdef int l = len_word + (1 if prefix else 0)             # <<<<<<<<<<<<<<
  *         cdef int nl = len_word + (1 if not prefix else 0)
  *         cdef int len_word_relators = len_word if prefix else len_word + self.longest_relator
  */
   if ((__pyx_v_prefix != 0)) {
-    __pyx_t_2 = 1;
+    __pyx_t_1 = 1;
   } else {
-    __pyx_t_2 = 0;
+    __pyx_t_1 = 0;
   }
-  __pyx_v_l = (__pyx_v_len_word + __pyx_t_2);
+  __pyx_v_l = (__pyx_v_len_word + __pyx_t_1);
 
-  /* "bundler/extensions/first.pyx":189
+  /* "bundler/extensions/first.pyx":273
  * 
  *         cdef int l = len_word + (1 if prefix else 0)
  *         cdef int nl = len_word + (1 if not prefix else 0)             # <<<<<<<<<<<<<<
  *         cdef int len_word_relators = len_word if prefix else len_word + self.longest_relator
+ *         cdef int outcome = FIC_OUTCOMES if prefix else 0  # Offset into self.outcomes.
+ */
+  if (((!(__pyx_v_prefix != 0)) != 0)) {
+    __pyx_t_1 = 1;
+  } else {
+    __pyx_t_1 = 0;
+  }
+  __pyx_v_nl = (__pyx_v_len_word + __pyx_t_1);
+
+  /* "bundler/extensions/first.pyx":274
+ *         cdef int l = len_word + (1 if prefix else 0)
+ *         cdef int nl = len_word + (1 if not prefix else 0)
+ *         cdef int len_word_relators = len_word if prefix else len_word + self.longest_relator             # <<<<<<<<<<<<<<
+ *         cdef int outcome = FIC_OUTCOMES if prefix else 0  # Offset into self.outcomes.
+ *         cdef long processed = 0
+ */
+  if ((__pyx_v_prefix != 0)) {
+    __pyx_t_2 = __pyx_v_len_word;
+  } else {
+    __pyx_t_2 = (__pyx_v_len_word + __pyx_v_self->longest_relator);
+  }
+  __pyx_v_len_word_relators = __pyx_t_2;
+
+  /* "bundler/extensions/first.pyx":275
+ *         cdef int nl = len_word + (1 if not prefix else 0)
+ *         cdef int len_word_relators = len_word if prefix else len_word + self.longest_relator
+ *         cdef int outcome = FIC_OUTCOMES if prefix else 0  # Offset into self.outcomes.             # <<<<<<<<<<<<<<
+ *         cdef long processed = 0
  * 
  */
-  if (((!(__pyx_v_prefix != 0)) != 0)) {
-    __pyx_t_2 = 1;
+  if ((__pyx_v_prefix != 0)) {
+    __pyx_t_2 = __pyx_e_7bundler_10extensions_5first_FIC_OUTCOMES;
   } else {
     __pyx_t_2 = 0;
   }
-  __pyx_v_nl = (__pyx_v_len_word + __pyx_t_2);
+  __pyx_v_outcome = __pyx_t_2;
 
-  /* "bundler/extensions/first.pyx":190
- *         cdef int l = len_word + (1 if prefix else 0)
- *         cdef int nl = len_word + (1 if not prefix else 0)
- *         cdef int len_word_relators = len_word if prefix else len_word + self.longest_relator             # <<<<<<<<<<<<<<
+  /* "bundler/extensions/first.pyx":276
+ *         cdef int len_word_relators = len_word if prefix else len_word + self.longest_relator
+ *         cdef int outcome = FIC_OUTCOMES if prefix else 0  # Offset into self.outcomes.
+ *         cdef long processed = 0             # <<<<<<<<<<<<<<
  * 
  *         # Scratch memory for automorphism testing.
  */
-  if ((__pyx_v_prefix != 0)) {
-    __pyx_t_3 = __pyx_v_len_word;
-  } else {
-    __pyx_t_3 = (__pyx_v_len_word + __pyx_v_self->longest_relator);
-  }
-  __pyx_v_len_word_relators = __pyx_t_3;
+  __pyx_v_processed = 0;
 
-  /* "bundler/extensions/first.pyx":193
+  /* "bundler/extensions/first.pyx":279
  * 
  *         # Scratch memory for automorphism testing.
  *         cdef int* tmp = <int *> calloc(8*l, sizeof(int))             # <<<<<<<<<<<<<<
@@ -3514,146 +5027,303 @@ static PyObject *__pyx_pf_7bundler_10extensions_5first_12FirstInClass_6is_first(
  */
   __pyx_v_tmp = ((int *)calloc((8 * __pyx_v_l), (sizeof(int))));
 
-  /* "bundler/extensions/first.pyx":195
+  /* "bundler/extensions/first.pyx":281
  *         cdef int* tmp = <int *> calloc(8*l, sizeof(int))
  * 
  *         try:             # <<<<<<<<<<<<<<
  *             # If it contains any bad prefix or simplification then it can be (trivially) made better.
- *             if self.bad_prefix_FSM.c_hit(wrd):
+ *             if check_bad_prefix and self.bad_prefix_FSM.c_hit(wrd):
  */
   /*try:*/ {
 
-    /* "bundler/extensions/first.pyx":197
+    /* "bundler/extensions/first.pyx":283
  *         try:
  *             # If it contains any bad prefix or simplification then it can be (trivially) made better.
- *             if self.bad_prefix_FSM.c_hit(wrd):             # <<<<<<<<<<<<<<
+ *             if check_bad_prefix and self.bad_prefix_FSM.c_hit(wrd):             # <<<<<<<<<<<<<<
+ *                 self.outcomes[outcome + FIC_BAD_PREFIX] += 1
  *                 return False
- * 
  */
-    __pyx_t_4 = (((struct __pyx_vtabstruct_7bundler_10extensions_3FSM_FSM *)__pyx_v_self->bad_prefix_FSM->__pyx_vtab)->c_hit(__pyx_v_self->bad_prefix_FSM, __pyx_v_wrd, NULL) != 0);
+    __pyx_t_4 = (__pyx_v_check_bad_prefix != 0);
     if (__pyx_t_4) {
+    } else {
+      __pyx_t_3 = __pyx_t_4;
+      goto __pyx_L7_bool_binop_done;
+    }
+    __pyx_t_4 = (((struct __pyx_vtabstruct_7bundler_10extensions_3FSM_FSM *)__pyx_v_self->bad_prefix_FSM->__pyx_vtab)->c_hit(__pyx_v_self->bad_prefix_FSM, __pyx_v_wrd, NULL) != 0);
+    __pyx_t_3 = __pyx_t_4;
+    __pyx_L7_bool_binop_done:;
+    if (__pyx_t_3) {
 
-      /* "bundler/extensions/first.pyx":198
+      /* "bundler/extensions/first.pyx":284
  *             # If it contains any bad prefix or simplification then it can be (trivially) made better.
- *             if self.bad_prefix_FSM.c_hit(wrd):
+ *             if check_bad_prefix and self.bad_prefix_FSM.c_hit(wrd):
+ *                 self.outcomes[outcome + FIC_BAD_PREFIX] += 1             # <<<<<<<<<<<<<<
+ *                 return False
+ * 
+ */
+      __pyx_t_2 = (__pyx_v_outcome + __pyx_e_7bundler_10extensions_5first_FIC_BAD_PREFIX);
+      (__pyx_v_self->outcomes[__pyx_t_2]) = ((__pyx_v_self->outcomes[__pyx_t_2]) + 1);
+
+      /* "bundler/extensions/first.pyx":285
+ *             if check_bad_prefix and self.bad_prefix_FSM.c_hit(wrd):
+ *                 self.outcomes[outcome + FIC_BAD_PREFIX] += 1
  *                 return False             # <<<<<<<<<<<<<<
  * 
  *             # There is no point in testing whether simpler_FSM hits word already since word ended in next_good_suffix.
  */
-      __Pyx_XDECREF(__pyx_r);
-      __Pyx_INCREF(Py_False);
-      __pyx_r = Py_False;
+      __pyx_r = 0;
       goto __pyx_L3_return;
 
-      /* "bundler/extensions/first.pyx":197
+      /* "bundler/extensions/first.pyx":283
  *         try:
  *             # If it contains any bad prefix or simplification then it can be (trivially) made better.
- *             if self.bad_prefix_FSM.c_hit(wrd):             # <<<<<<<<<<<<<<
+ *             if check_bad_prefix and self.bad_prefix_FSM.c_hit(wrd):             # <<<<<<<<<<<<<<
+ *                 self.outcomes[outcome + FIC_BAD_PREFIX] += 1
  *                 return False
- * 
  */
     }
 
-    /* "bundler/extensions/first.pyx":202
+    /* "bundler/extensions/first.pyx":289
  *             # There is no point in testing whether simpler_FSM hits word already since word ended in next_good_suffix.
  *             # Check to see if our original word beats itself.
  *             if not self.c_before_automorphs(wrd, wrd, prefix, tmp):             # <<<<<<<<<<<<<<
+ *                 self.outcomes[outcome + FIC_BEATEN_BY_AUTOMORPH] += 1
  *                 return False
- * 
  */
-    __pyx_t_4 = ((!(((struct __pyx_vtabstruct_7bundler_10extensions_5first_FirstInClass *)__pyx_v_self->__pyx_vtab)->c_before_automorphs(__pyx_v_self, __pyx_v_wrd, __pyx_v_wrd, __pyx_v_prefix, __pyx_v_tmp) != 0)) != 0);
-    if (__pyx_t_4) {
+    __pyx_t_3 = ((!(((struct __pyx_vtabstruct_7bundler_10extensions_5first_FirstInClass *)__pyx_v_self->__pyx_vtab)->c_before_automorphs(__pyx_v_self, __pyx_v_wrd, __pyx_v_wrd, __pyx_v_prefix, __pyx_v_tmp) != 0)) != 0);
+    if (__pyx_t_3) {
 
-      /* "bundler/extensions/first.pyx":203
+      /* "bundler/extensions/first.pyx":290
  *             # Check to see if our original word beats itself.
  *             if not self.c_before_automorphs(wrd, wrd, prefix, tmp):
+ *                 self.outcomes[outcome + FIC_BEATEN_BY_AUTOMORPH] += 1             # <<<<<<<<<<<<<<
+ *                 return False
+ * 
+ */
+      __pyx_t_2 = (__pyx_v_outcome + __pyx_e_7bundler_10extensions_5first_FIC_BEATEN_BY_AUTOMORPH);
+      (__pyx_v_self->outcomes[__pyx_t_2]) = ((__pyx_v_self->outcomes[__pyx_t_2]) + 1);
+
+      /* "bundler/extensions/first.pyx":291
+ *             if not self.c_before_automorphs(wrd, wrd, prefix, tmp):
+ *                 self.outcomes[outcome + FIC_BEATEN_BY_AUTOMORPH] += 1
  *                 return False             # <<<<<<<<<<<<<<
  * 
- *             seen.insert(wrd)
+ *             if packed:
  */
-      __Pyx_XDECREF(__pyx_r);
-      __Pyx_INCREF(Py_False);
-      __pyx_r = Py_False;
+      __pyx_r = 0;
       goto __pyx_L3_return;
 
-      /* "bundler/extensions/first.pyx":202
+      /* "bundler/extensions/first.pyx":289
  *             # There is no point in testing whether simpler_FSM hits word already since word ended in next_good_suffix.
  *             # Check to see if our original word beats itself.
  *             if not self.c_before_automorphs(wrd, wrd, prefix, tmp):             # <<<<<<<<<<<<<<
+ *                 self.outcomes[outcome + FIC_BEATEN_BY_AUTOMORPH] += 1
  *                 return False
- * 
  */
     }
 
-    /* "bundler/extensions/first.pyx":205
+    /* "bundler/extensions/first.pyx":293
  *                 return False
  * 
- *             seen.insert(wrd)             # <<<<<<<<<<<<<<
- *             to_do.push(wrd)
+ *             if packed:             # <<<<<<<<<<<<<<
+ *                 self.c_reset_seen(max_tree_size)
+ *                 key = pack(wrd, self.letter_bits)
+ */
+    __pyx_t_3 = (__pyx_v_packed != 0);
+    if (__pyx_t_3) {
+
+      /* "bundler/extensions/first.pyx":294
  * 
+ *             if packed:
+ *                 self.c_reset_seen(max_tree_size)             # <<<<<<<<<<<<<<
+ *                 key = pack(wrd, self.letter_bits)
+ *                 self.c_insert_seen(self.c_find_slot(key), key)
  */
-    try {
-      __pyx_v_seen.insert(__pyx_v_wrd);
-    } catch(...) {
-      __Pyx_CppExn2PyErr();
-      __PYX_ERR(0, 205, __pyx_L4_error)
+      ((struct __pyx_vtabstruct_7bundler_10extensions_5first_FirstInClass *)__pyx_v_self->__pyx_vtab)->c_reset_seen(__pyx_v_self, __pyx_v_max_tree_size);
+
+      /* "bundler/extensions/first.pyx":295
+ *             if packed:
+ *                 self.c_reset_seen(max_tree_size)
+ *                 key = pack(wrd, self.letter_bits)             # <<<<<<<<<<<<<<
+ *                 self.c_insert_seen(self.c_find_slot(key), key)
+ *                 self.packed_queue.push_back(key)
+ */
+      __pyx_v_key = __pyx_f_7bundler_10extensions_5first_pack(__pyx_v_wrd, __pyx_v_self->letter_bits);
+
+      /* "bundler/extensions/first.pyx":296
+ *                 self.c_reset_seen(max_tree_size)
+ *                 key = pack(wrd, self.letter_bits)
+ *                 self.c_insert_seen(self.c_find_slot(key), key)             # <<<<<<<<<<<<<<
+ *                 self.packed_queue.push_back(key)
+ *                 reached.resize(len_word)
+ */
+      ((struct __pyx_vtabstruct_7bundler_10extensions_5first_FirstInClass *)__pyx_v_self->__pyx_vtab)->c_insert_seen(__pyx_v_self, ((struct __pyx_vtabstruct_7bundler_10extensions_5first_FirstInClass *)__pyx_v_self->__pyx_vtab)->c_find_slot(__pyx_v_self, __pyx_v_key), __pyx_v_key);
+
+      /* "bundler/extensions/first.pyx":297
+ *                 key = pack(wrd, self.letter_bits)
+ *                 self.c_insert_seen(self.c_find_slot(key), key)
+ *                 self.packed_queue.push_back(key)             # <<<<<<<<<<<<<<
+ *                 reached.resize(len_word)
+ *             else:
+ */
+      try {
+        __pyx_v_self->packed_queue.push_back(__pyx_v_key);
+      } catch(...) {
+        __Pyx_CppExn2PyErr();
+        __PYX_ERR(0, 297, __pyx_L4_error)
+      }
+
+      /* "bundler/extensions/first.pyx":298
+ *                 self.c_insert_seen(self.c_find_slot(key), key)
+ *                 self.packed_queue.push_back(key)
+ *                 reached.resize(len_word)             # <<<<<<<<<<<<<<
+ *             else:
+ *                 seen.insert(wrd)
+ */
+      try {
+        __pyx_v_reached.resize(__pyx_v_len_word);
+      } catch(...) {
+        __Pyx_CppExn2PyErr();
+        __PYX_ERR(0, 298, __pyx_L4_error)
+      }
+
+      /* "bundler/extensions/first.pyx":293
+ *                 return False
+ * 
+ *             if packed:             # <<<<<<<<<<<<<<
+ *                 self.c_reset_seen(max_tree_size)
+ *                 key = pack(wrd, self.letter_bits)
+ */
+      goto __pyx_L10;
     }
 
-    /* "bundler/extensions/first.pyx":206
+    /* "bundler/extensions/first.pyx":300
+ *                 reached.resize(len_word)
+ *             else:
+ *                 seen.insert(wrd)             # <<<<<<<<<<<<<<
+ *                 to_do.push(wrd)
  * 
- *             seen.insert(wrd)
- *             to_do.push(wrd)             # <<<<<<<<<<<<<<
+ */
+    /*else*/ {
+      try {
+        __pyx_v_seen.insert(__pyx_v_wrd);
+      } catch(...) {
+        __Pyx_CppExn2PyErr();
+        __PYX_ERR(0, 300, __pyx_L4_error)
+      }
+
+      /* "bundler/extensions/first.pyx":301
+ *             else:
+ *                 seen.insert(wrd)
+ *                 to_do.push(wrd)             # <<<<<<<<<<<<<<
  * 
  *             next_wrd.resize(len_word)
  */
-    __pyx_v_to_do.push(__pyx_v_wrd);
+      __pyx_v_to_do.push(__pyx_v_wrd);
+    }
+    __pyx_L10:;
 
-    /* "bundler/extensions/first.pyx":208
- *             to_do.push(wrd)
+    /* "bundler/extensions/first.pyx":303
+ *                 to_do.push(wrd)
  * 
  *             next_wrd.resize(len_word)             # <<<<<<<<<<<<<<
  * 
- *             while not to_do.empty():  # Keep going while there are still unprocessed words in the queue.
+ *             while (head < self.packed_queue.size()) if packed else (not to_do.empty()):  # Keep going while there are still unprocessed words in the queue.
  */
     try {
       __pyx_v_next_wrd.resize(__pyx_v_len_word);
     } catch(...) {
       __Pyx_CppExn2PyErr();
-      __PYX_ERR(0, 208, __pyx_L4_error)
+      __PYX_ERR(0, 303, __pyx_L4_error)
     }
 
-    /* "bundler/extensions/first.pyx":210
+    /* "bundler/extensions/first.pyx":305
  *             next_wrd.resize(len_word)
  * 
- *             while not to_do.empty():  # Keep going while there are still unprocessed words in the queue.             # <<<<<<<<<<<<<<
- *                 reached = to_do.front()
- *                 to_do.pop()  # Get the next equivalent word to check.
+ *             while (head < self.packed_queue.size()) if packed else (not to_do.empty()):  # Keep going while there are still unprocessed words in the queue.             # <<<<<<<<<<<<<<
+ *                 if packed:
+ *                     unpack(self.packed_queue[head], reached, self.letter_bits)
  */
     while (1) {
-      __pyx_t_4 = ((!(__pyx_v_to_do.empty() != 0)) != 0);
+      if ((__pyx_v_packed != 0)) {
+        __pyx_t_3 = (__pyx_v_head < __pyx_v_self->packed_queue.size());
+      } else {
+        __pyx_t_3 = (!(__pyx_v_to_do.empty() != 0));
+      }
+      __pyx_t_4 = (__pyx_t_3 != 0);
       if (!__pyx_t_4) break;
 
-      /* "bundler/extensions/first.pyx":211
+      /* "bundler/extensions/first.pyx":306
+ * 
+ *             while (head < self.packed_queue.size()) if packed else (not to_do.empty()):  # Keep going while there are still unprocessed words in the queue.
+ *                 if packed:             # <<<<<<<<<<<<<<
+ *                     unpack(self.packed_queue[head], reached, self.letter_bits)
+ *                     head += 1
+ */
+      __pyx_t_4 = (__pyx_v_packed != 0);
+      if (__pyx_t_4) {
+
+        /* "bundler/extensions/first.pyx":307
+ *             while (head < self.packed_queue.size()) if packed else (not to_do.empty()):  # Keep going while there are still unprocessed words in the queue.
+ *                 if packed:
+ *                     unpack(self.packed_queue[head], reached, self.letter_bits)             # <<<<<<<<<<<<<<
+ *                     head += 1
+ *                 else:
+ */
+        __pyx_f_7bundler_10extensions_5first_unpack((__pyx_v_self->packed_queue[__pyx_v_head]), __pyx_v_reached, __pyx_v_self->letter_bits);
+
+        /* "bundler/extensions/first.pyx":308
+ *                 if packed:
+ *                     unpack(self.packed_queue[head], reached, self.letter_bits)
+ *                     head += 1             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     reached = to_do.front()
+ */
+        __pyx_v_head = (__pyx_v_head + 1);
+
+        /* "bundler/extensions/first.pyx":306
  * 
- *             while not to_do.empty():  # Keep going while there are still unprocessed words in the queue.
- *                 reached = to_do.front()             # <<<<<<<<<<<<<<
- *                 to_do.pop()  # Get the next equivalent word to check.
+ *             while (head < self.packed_queue.size()) if packed else (not to_do.empty()):  # Keep going while there are still unprocessed words in the queue.
+ *                 if packed:             # <<<<<<<<<<<<<<
+ *                     unpack(self.packed_queue[head], reached, self.letter_bits)
+ *                     head += 1
+ */
+        goto __pyx_L13;
+      }
+
+      /* "bundler/extensions/first.pyx":310
+ *                     head += 1
+ *                 else:
+ *                     reached = to_do.front()             # <<<<<<<<<<<<<<
+ *                     to_do.pop()  # Get the next equivalent word to check.
+ *                 processed += 1
+ */
+      /*else*/ {
+        __pyx_v_reached = __pyx_v_to_do.front();
+
+        /* "bundler/extensions/first.pyx":311
+ *                 else:
+ *                     reached = to_do.front()
+ *                     to_do.pop()  # Get the next equivalent word to check.             # <<<<<<<<<<<<<<
+ *                 processed += 1
  *                 returns = self.find_balanced_relators_FSM.c_hits(reached, run=len_word_relators)
  */
-      __pyx_v_reached = __pyx_v_to_do.front();
+        __pyx_v_to_do.pop();
+      }
+      __pyx_L13:;
 
-      /* "bundler/extensions/first.pyx":212
- *             while not to_do.empty():  # Keep going while there are still unprocessed words in the queue.
- *                 reached = to_do.front()
- *                 to_do.pop()  # Get the next equivalent word to check.             # <<<<<<<<<<<<<<
+      /* "bundler/extensions/first.pyx":312
+ *                     reached = to_do.front()
+ *                     to_do.pop()  # Get the next equivalent word to check.
+ *                 processed += 1             # <<<<<<<<<<<<<<
  *                 returns = self.find_balanced_relators_FSM.c_hits(reached, run=len_word_relators)
  *                 for i in range(int(returns.size())):
  */
-      __pyx_v_to_do.pop();
+      __pyx_v_processed = (__pyx_v_processed + 1);
 
-      /* "bundler/extensions/first.pyx":213
- *                 reached = to_do.front()
- *                 to_do.pop()  # Get the next equivalent word to check.
+      /* "bundler/extensions/first.pyx":313
+ *                     to_do.pop()  # Get the next equivalent word to check.
+ *                 processed += 1
  *                 returns = self.find_balanced_relators_FSM.c_hits(reached, run=len_word_relators)             # <<<<<<<<<<<<<<
  *                 for i in range(int(returns.size())):
  *                     b = returns[i].first
@@ -3663,19 +5333,19 @@ static PyObject *__pyx_pf_7bundler_10extensions_5first_12FirstInClass_6is_first(
       __pyx_t_5 = ((struct __pyx_vtabstruct_7bundler_10extensions_3FSM_FSM *)__pyx_v_self->find_balanced_relators_FSM->__pyx_vtab)->c_hits(__pyx_v_self->find_balanced_relators_FSM, __pyx_v_reached, &__pyx_t_6); 
       __pyx_v_returns = __pyx_t_5;
 
-      /* "bundler/extensions/first.pyx":214
- *                 to_do.pop()  # Get the next equivalent word to check.
+      /* "bundler/extensions/first.pyx":314
+ *                 processed += 1
  *                 returns = self.find_balanced_relators_FSM.c_hits(reached, run=len_word_relators)
  *                 for i in range(int(returns.size())):             # <<<<<<<<<<<<<<
  *                     b = returns[i].first
  *                     replace = returns[i].second
  */
-      __pyx_t_2 = ((long)__pyx_v_returns.size());
-      __pyx_t_7 = __pyx_t_2;
-      for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_7; __pyx_t_3+=1) {
-        __pyx_v_i = __pyx_t_3;
+      __pyx_t_1 = ((long)__pyx_v_returns.size());
+      __pyx_t_7 = __pyx_t_1;
+      for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_7; __pyx_t_2+=1) {
+        __pyx_v_i = __pyx_t_2;
 
-        /* "bundler/extensions/first.pyx":215
+        /* "bundler/extensions/first.pyx":315
  *                 returns = self.find_balanced_relators_FSM.c_hits(reached, run=len_word_relators)
  *                 for i in range(int(returns.size())):
  *                     b = returns[i].first             # <<<<<<<<<<<<<<
@@ -3685,17 +5355,17 @@ static PyObject *__pyx_pf_7bundler_10extensions_5first_12FirstInClass_6is_first(
         __pyx_t_8 = (__pyx_v_returns[__pyx_v_i]).first;
         __pyx_v_b = __pyx_t_8;
 
-        /* "bundler/extensions/first.pyx":216
+        /* "bundler/extensions/first.pyx":316
  *                 for i in range(int(returns.size())):
  *                     b = returns[i].first
  *                     replace = returns[i].second             # <<<<<<<<<<<<<<
  *                     len_replace = replace.size()
  *                     if len_replace > len_word: continue
  */
-        __pyx_t_1 = (__pyx_v_returns[__pyx_v_i]).second;
-        __pyx_v_replace = __pyx_t_1;
+        __pyx_t_9 = (__pyx_v_returns[__pyx_v_i]).second;
+        __pyx_v_replace = __pyx_t_9;
 
-        /* "bundler/extensions/first.pyx":217
+        /* "bundler/extensions/first.pyx":317
  *                     b = returns[i].first
  *                     replace = returns[i].second
  *                     len_replace = replace.size()             # <<<<<<<<<<<<<<
@@ -3704,7 +5374,7 @@ static PyObject *__pyx_pf_7bundler_10extensions_5first_12FirstInClass_6is_first(
  */
         __pyx_v_len_replace = __pyx_v_replace.size();
 
-        /* "bundler/extensions/first.pyx":218
+        /* "bundler/extensions/first.pyx":318
  *                     replace = returns[i].second
  *                     len_replace = replace.size()
  *                     if len_replace > len_word: continue             # <<<<<<<<<<<<<<
@@ -3713,10 +5383,10 @@ static PyObject *__pyx_pf_7bundler_10extensions_5first_12FirstInClass_6is_first(
  */
         __pyx_t_4 = ((__pyx_v_len_replace > __pyx_v_len_word) != 0);
         if (__pyx_t_4) {
-          goto __pyx_L10_continue;
+          goto __pyx_L14_continue;
         }
 
-        /* "bundler/extensions/first.pyx":219
+        /* "bundler/extensions/first.pyx":319
  *                     len_replace = replace.size()
  *                     if len_replace > len_word: continue
  *                     a = b - len_replace  # There is a replacement to be made between a & b.             # <<<<<<<<<<<<<<
@@ -3725,7 +5395,7 @@ static PyObject *__pyx_pf_7bundler_10extensions_5first_12FirstInClass_6is_first(
  */
         __pyx_v_a = (__pyx_v_b - __pyx_v_len_replace);
 
-        /* "bundler/extensions/first.pyx":220
+        /* "bundler/extensions/first.pyx":320
  *                     if len_replace > len_word: continue
  *                     a = b - len_replace  # There is a replacement to be made between a & b.
  *                     if a >= len_word: continue             # <<<<<<<<<<<<<<
@@ -3734,10 +5404,10 @@ static PyObject *__pyx_pf_7bundler_10extensions_5first_12FirstInClass_6is_first(
  */
         __pyx_t_4 = ((__pyx_v_a >= __pyx_v_len_word) != 0);
         if (__pyx_t_4) {
-          goto __pyx_L10_continue;
+          goto __pyx_L14_continue;
         }
 
-        /* "bundler/extensions/first.pyx":223
+        /* "bundler/extensions/first.pyx":323
  * 
  *                     # next_wrd = reached[:a] + replace + reached[b:] if b <= len_word else replace[len_word-a:] + reached[b-len_word:a] + replace[:len_word-a]
  *                     k = 0 if a == 0 else len_word - a  # k = -a % len_word.             # <<<<<<<<<<<<<<
@@ -3751,7 +5421,7 @@ static PyObject *__pyx_pf_7bundler_10extensions_5first_12FirstInClass_6is_first(
         }
         __pyx_v_k = __pyx_t_8;
 
-        /* "bundler/extensions/first.pyx":224
+        /* "bundler/extensions/first.pyx":324
  *                     # next_wrd = reached[:a] + replace + reached[b:] if b <= len_word else replace[len_word-a:] + reached[b-len_word:a] + replace[:len_word-a]
  *                     k = 0 if a == 0 else len_word - a  # k = -a % len_word.
  *                     for j in range(len_word):  # k = (j - a) % len_word             # <<<<<<<<<<<<<<
@@ -3759,11 +5429,11 @@ static PyObject *__pyx_pf_7bundler_10extensions_5first_12FirstInClass_6is_first(
  *                         k += 1
  */
         __pyx_t_8 = __pyx_v_len_word;
-        __pyx_t_9 = __pyx_t_8;
-        for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
-          __pyx_v_j = __pyx_t_10;
+        __pyx_t_10 = __pyx_t_8;
+        for (__pyx_t_11 = 0; __pyx_t_11 < __pyx_t_10; __pyx_t_11+=1) {
+          __pyx_v_j = __pyx_t_11;
 
-          /* "bundler/extensions/first.pyx":225
+          /* "bundler/extensions/first.pyx":325
  *                     k = 0 if a == 0 else len_word - a  # k = -a % len_word.
  *                     for j in range(len_word):  # k = (j - a) % len_word
  *                         next_wrd[j] = replace[k] if k < len_replace else reached[j]             # <<<<<<<<<<<<<<
@@ -3771,13 +5441,13 @@ static PyObject *__pyx_pf_7bundler_10extensions_5first_12FirstInClass_6is_first(
  *                         if k == len_word: k = 0
  */
           if (((__pyx_v_k < __pyx_v_len_replace) != 0)) {
-            __pyx_t_11 = (__pyx_v_replace[__pyx_v_k]);
+            __pyx_t_12 = (__pyx_v_replace[__pyx_v_k]);
           } else {
-            __pyx_t_11 = (__pyx_v_reached[__pyx_v_j]);
+            __pyx_t_12 = (__pyx_v_reached[__pyx_v_j]);
           }
-          (__pyx_v_next_wrd[__pyx_v_j]) = __pyx_t_11;
+          (__pyx_v_next_wrd[__pyx_v_j]) = __pyx_t_12;
 
-          /* "bundler/extensions/first.pyx":226
+          /* "bundler/extensions/first.pyx":326
  *                     for j in range(len_word):  # k = (j - a) % len_word
  *                         next_wrd[j] = replace[k] if k < len_replace else reached[j]
  *                         k += 1             # <<<<<<<<<<<<<<
@@ -3786,12 +5456,12 @@ static PyObject *__pyx_pf_7bundler_10extensions_5first_12FirstInClass_6is_first(
  */
           __pyx_v_k = (__pyx_v_k + 1);
 
-          /* "bundler/extensions/first.pyx":227
+          /* "bundler/extensions/first.pyx":327
  *                         next_wrd[j] = replace[k] if k < len_replace else reached[j]
  *                         k += 1
  *                         if k == len_word: k = 0             # <<<<<<<<<<<<<<
  * 
- *                     if seen.count(next_wrd) != 0: continue  # Only consider new words.
+ *                     if packed:
  */
           __pyx_t_4 = ((__pyx_v_k == __pyx_v_len_word) != 0);
           if (__pyx_t_4) {
@@ -3799,166 +5469,302 @@ static PyObject *__pyx_pf_7bundler_10extensions_5first_12FirstInClass_6is_first(
           }
         }
 
-        /* "bundler/extensions/first.pyx":229
+        /* "bundler/extensions/first.pyx":329
+ *                         if k == len_word: k = 0
+ * 
+ *                     if packed:             # <<<<<<<<<<<<<<
+ *                         key = pack(next_wrd, self.letter_bits)
+ *                         slot = self.c_find_slot(key)
+ */
+        __pyx_t_4 = (__pyx_v_packed != 0);
+        if (__pyx_t_4) {
+
+          /* "bundler/extensions/first.pyx":330
+ * 
+ *                     if packed:
+ *                         key = pack(next_wrd, self.letter_bits)             # <<<<<<<<<<<<<<
+ *                         slot = self.c_find_slot(key)
+ *                         if self.seen_table[slot] == key: continue  # Only consider new words.
+ */
+          __pyx_v_key = __pyx_f_7bundler_10extensions_5first_pack(__pyx_v_next_wrd, __pyx_v_self->letter_bits);
+
+          /* "bundler/extensions/first.pyx":331
+ *                     if packed:
+ *                         key = pack(next_wrd, self.letter_bits)
+ *                         slot = self.c_find_slot(key)             # <<<<<<<<<<<<<<
+ *                         if self.seen_table[slot] == key: continue  # Only consider new words.
+ *                     elif seen.count(next_wrd) != 0: continue  # Only consider new words.
+ */
+          __pyx_v_slot = ((struct __pyx_vtabstruct_7bundler_10extensions_5first_FirstInClass *)__pyx_v_self->__pyx_vtab)->c_find_slot(__pyx_v_self, __pyx_v_key);
+
+          /* "bundler/extensions/first.pyx":332
+ *                         key = pack(next_wrd, self.letter_bits)
+ *                         slot = self.c_find_slot(key)
+ *                         if self.seen_table[slot] == key: continue  # Only consider new words.             # <<<<<<<<<<<<<<
+ *                     elif seen.count(next_wrd) != 0: continue  # Only consider new words.
+ * 
+ */
+          __pyx_t_4 = (((__pyx_v_self->seen_table[__pyx_v_slot]) == __pyx_v_key) != 0);
+          if (__pyx_t_4) {
+            goto __pyx_L14_continue;
+          }
+
+          /* "bundler/extensions/first.pyx":329
  *                         if k == len_word: k = 0
  * 
- *                     if seen.count(next_wrd) != 0: continue  # Only consider new words.             # <<<<<<<<<<<<<<
+ *                     if packed:             # <<<<<<<<<<<<<<
+ *                         key = pack(next_wrd, self.letter_bits)
+ *                         slot = self.c_find_slot(key)
+ */
+          goto __pyx_L21;
+        }
+
+        /* "bundler/extensions/first.pyx":333
+ *                         slot = self.c_find_slot(key)
+ *                         if self.seen_table[slot] == key: continue  # Only consider new words.
+ *                     elif seen.count(next_wrd) != 0: continue  # Only consider new words.             # <<<<<<<<<<<<<<
  * 
- *                     # Test for trivial simplifications.
+ *                     # Test for trivial simplifications. Simpler words longer than the word would overlap themselves when read cyclically.
  */
         __pyx_t_4 = ((__pyx_v_seen.count(__pyx_v_next_wrd) != 0) != 0);
         if (__pyx_t_4) {
-          goto __pyx_L10_continue;
+          goto __pyx_L14_continue;
         }
+        __pyx_L21:;
 
-        /* "bundler/extensions/first.pyx":232
+        /* "bundler/extensions/first.pyx":336
  * 
- *                     # Test for trivial simplifications.
- *                     if self.simpler_FSM.c_hit(next_wrd, run=nl):             # <<<<<<<<<<<<<<
+ *                     # Test for trivial simplifications. Simpler words longer than the word would overlap themselves when read cyclically.
+ *                     if self.simpler_FSM.c_hit(next_wrd, run=nl, longest=len_word):             # <<<<<<<<<<<<<<
+ *                         self.outcomes[outcome + FIC_SIMPLER] += 1
+ *                         return False
+ */
+        __pyx_t_13.__pyx_n = 2;
+        __pyx_t_13.run = __pyx_v_nl;
+        __pyx_t_13.longest = __pyx_v_len_word;
+        __pyx_t_4 = ((struct __pyx_vtabstruct_7bundler_10extensions_3FSM_FSM *)__pyx_v_self->simpler_FSM->__pyx_vtab)->c_hit(__pyx_v_self->simpler_FSM, __pyx_v_next_wrd, &__pyx_t_13); 
+        __pyx_t_3 = (__pyx_t_4 != 0);
+        if (__pyx_t_3) {
+
+          /* "bundler/extensions/first.pyx":337
+ *                     # Test for trivial simplifications. Simpler words longer than the word would overlap themselves when read cyclically.
+ *                     if self.simpler_FSM.c_hit(next_wrd, run=nl, longest=len_word):
+ *                         self.outcomes[outcome + FIC_SIMPLER] += 1             # <<<<<<<<<<<<<<
  *                         return False
  * 
  */
-        __pyx_t_12.__pyx_n = 1;
-        __pyx_t_12.run = __pyx_v_nl;
-        __pyx_t_4 = ((struct __pyx_vtabstruct_7bundler_10extensions_3FSM_FSM *)__pyx_v_self->simpler_FSM->__pyx_vtab)->c_hit(__pyx_v_self->simpler_FSM, __pyx_v_next_wrd, &__pyx_t_12); 
-        __pyx_t_13 = (__pyx_t_4 != 0);
-        if (__pyx_t_13) {
+          __pyx_t_8 = (__pyx_v_outcome + __pyx_e_7bundler_10extensions_5first_FIC_SIMPLER);
+          (__pyx_v_self->outcomes[__pyx_t_8]) = ((__pyx_v_self->outcomes[__pyx_t_8]) + 1);
 
-          /* "bundler/extensions/first.pyx":233
- *                     # Test for trivial simplifications.
- *                     if self.simpler_FSM.c_hit(next_wrd, run=nl):
+          /* "bundler/extensions/first.pyx":338
+ *                     if self.simpler_FSM.c_hit(next_wrd, run=nl, longest=len_word):
+ *                         self.outcomes[outcome + FIC_SIMPLER] += 1
  *                         return False             # <<<<<<<<<<<<<<
  * 
  *                     if not self.c_before_automorphs(wrd, next_wrd, prefix, tmp):
  */
-          __Pyx_XDECREF(__pyx_r);
-          __Pyx_INCREF(Py_False);
-          __pyx_r = Py_False;
+          __pyx_r = 0;
           goto __pyx_L3_return;
 
-          /* "bundler/extensions/first.pyx":232
+          /* "bundler/extensions/first.pyx":336
  * 
- *                     # Test for trivial simplifications.
- *                     if self.simpler_FSM.c_hit(next_wrd, run=nl):             # <<<<<<<<<<<<<<
+ *                     # Test for trivial simplifications. Simpler words longer than the word would overlap themselves when read cyclically.
+ *                     if self.simpler_FSM.c_hit(next_wrd, run=nl, longest=len_word):             # <<<<<<<<<<<<<<
+ *                         self.outcomes[outcome + FIC_SIMPLER] += 1
  *                         return False
- * 
  */
         }
 
-        /* "bundler/extensions/first.pyx":235
+        /* "bundler/extensions/first.pyx":340
  *                         return False
  * 
  *                     if not self.c_before_automorphs(wrd, next_wrd, prefix, tmp):             # <<<<<<<<<<<<<<
+ *                         self.outcomes[outcome + FIC_BEATEN] += 1
  *                         return False
- * 
  */
-        __pyx_t_13 = ((!(((struct __pyx_vtabstruct_7bundler_10extensions_5first_FirstInClass *)__pyx_v_self->__pyx_vtab)->c_before_automorphs(__pyx_v_self, __pyx_v_wrd, __pyx_v_next_wrd, __pyx_v_prefix, __pyx_v_tmp) != 0)) != 0);
-        if (__pyx_t_13) {
+        __pyx_t_3 = ((!(((struct __pyx_vtabstruct_7bundler_10extensions_5first_FirstInClass *)__pyx_v_self->__pyx_vtab)->c_before_automorphs(__pyx_v_self, __pyx_v_wrd, __pyx_v_next_wrd, __pyx_v_prefix, __pyx_v_tmp) != 0)) != 0);
+        if (__pyx_t_3) {
 
-          /* "bundler/extensions/first.pyx":236
+          /* "bundler/extensions/first.pyx":341
+ * 
+ *                     if not self.c_before_automorphs(wrd, next_wrd, prefix, tmp):
+ *                         self.outcomes[outcome + FIC_BEATEN] += 1             # <<<<<<<<<<<<<<
+ *                         return False
  * 
+ */
+          __pyx_t_8 = (__pyx_v_outcome + __pyx_e_7bundler_10extensions_5first_FIC_BEATEN);
+          (__pyx_v_self->outcomes[__pyx_t_8]) = ((__pyx_v_self->outcomes[__pyx_t_8]) + 1);
+
+          /* "bundler/extensions/first.pyx":342
  *                     if not self.c_before_automorphs(wrd, next_wrd, prefix, tmp):
+ *                         self.outcomes[outcome + FIC_BEATEN] += 1
  *                         return False             # <<<<<<<<<<<<<<
  * 
- *                     s = seen.size()
+ *                     s = self.seen_count if packed else seen.size()
  */
-          __Pyx_XDECREF(__pyx_r);
-          __Pyx_INCREF(Py_False);
-          __pyx_r = Py_False;
+          __pyx_r = 0;
           goto __pyx_L3_return;
 
-          /* "bundler/extensions/first.pyx":235
+          /* "bundler/extensions/first.pyx":340
  *                         return False
  * 
  *                     if not self.c_before_automorphs(wrd, next_wrd, prefix, tmp):             # <<<<<<<<<<<<<<
+ *                         self.outcomes[outcome + FIC_BEATEN] += 1
  *                         return False
- * 
  */
         }
 
-        /* "bundler/extensions/first.pyx":238
+        /* "bundler/extensions/first.pyx":344
  *                         return False
  * 
- *                     s = seen.size()             # <<<<<<<<<<<<<<
+ *                     s = self.seen_count if packed else seen.size()             # <<<<<<<<<<<<<<
  *                     if s == max_tree_size:  # If we've hit the max_tree_size then give up.
- *                         return True
+ *                         self.outcomes[outcome + FIC_EXHAUSTED] += 1
  */
-        __pyx_v_s = __pyx_v_seen.size();
+        if ((__pyx_v_packed != 0)) {
+          __pyx_t_14 = __pyx_v_self->seen_count;
+        } else {
+          __pyx_t_14 = __pyx_v_seen.size();
+        }
+        __pyx_v_s = __pyx_t_14;
 
-        /* "bundler/extensions/first.pyx":239
+        /* "bundler/extensions/first.pyx":345
  * 
- *                     s = seen.size()
+ *                     s = self.seen_count if packed else seen.size()
  *                     if s == max_tree_size:  # If we've hit the max_tree_size then give up.             # <<<<<<<<<<<<<<
+ *                         self.outcomes[outcome + FIC_EXHAUSTED] += 1
+ *                         return True
+ */
+        __pyx_t_3 = ((__pyx_v_s == __pyx_v_max_tree_size) != 0);
+        if (__pyx_t_3) {
+
+          /* "bundler/extensions/first.pyx":346
+ *                     s = self.seen_count if packed else seen.size()
+ *                     if s == max_tree_size:  # If we've hit the max_tree_size then give up.
+ *                         self.outcomes[outcome + FIC_EXHAUSTED] += 1             # <<<<<<<<<<<<<<
  *                         return True
  * 
  */
-        __pyx_t_13 = ((__pyx_v_s == __pyx_v_max_tree_size) != 0);
-        if (__pyx_t_13) {
+          __pyx_t_8 = (__pyx_v_outcome + __pyx_e_7bundler_10extensions_5first_FIC_EXHAUSTED);
+          (__pyx_v_self->outcomes[__pyx_t_8]) = ((__pyx_v_self->outcomes[__pyx_t_8]) + 1);
 
-          /* "bundler/extensions/first.pyx":240
- *                     s = seen.size()
+          /* "bundler/extensions/first.pyx":347
  *                     if s == max_tree_size:  # If we've hit the max_tree_size then give up.
+ *                         self.outcomes[outcome + FIC_EXHAUSTED] += 1
  *                         return True             # <<<<<<<<<<<<<<
  * 
  *                     # Add it to the reachable word list.
  */
-          __Pyx_XDECREF(__pyx_r);
-          __Pyx_INCREF(Py_True);
-          __pyx_r = Py_True;
+          __pyx_r = 1;
           goto __pyx_L3_return;
 
-          /* "bundler/extensions/first.pyx":239
+          /* "bundler/extensions/first.pyx":345
  * 
- *                     s = seen.size()
+ *                     s = self.seen_count if packed else seen.size()
  *                     if s == max_tree_size:  # If we've hit the max_tree_size then give up.             # <<<<<<<<<<<<<<
+ *                         self.outcomes[outcome + FIC_EXHAUSTED] += 1
  *                         return True
- * 
  */
         }
 
-        /* "bundler/extensions/first.pyx":243
+        /* "bundler/extensions/first.pyx":350
  * 
  *                     # Add it to the reachable word list.
- *                     seen.insert(next_wrd)             # <<<<<<<<<<<<<<
- *                     to_do.push(next_wrd)
+ *                     if packed:             # <<<<<<<<<<<<<<
+ *                         self.c_insert_seen(slot, key)
+ *                         self.packed_queue.push_back(key)
+ */
+        __pyx_t_3 = (__pyx_v_packed != 0);
+        if (__pyx_t_3) {
+
+          /* "bundler/extensions/first.pyx":351
+ *                     # Add it to the reachable word list.
+ *                     if packed:
+ *                         self.c_insert_seen(slot, key)             # <<<<<<<<<<<<<<
+ *                         self.packed_queue.push_back(key)
+ *                     else:
+ */
+          ((struct __pyx_vtabstruct_7bundler_10extensions_5first_FirstInClass *)__pyx_v_self->__pyx_vtab)->c_insert_seen(__pyx_v_self, __pyx_v_slot, __pyx_v_key);
+
+          /* "bundler/extensions/first.pyx":352
+ *                     if packed:
+ *                         self.c_insert_seen(slot, key)
+ *                         self.packed_queue.push_back(key)             # <<<<<<<<<<<<<<
+ *                     else:
+ *                         seen.insert(next_wrd)
+ */
+          try {
+            __pyx_v_self->packed_queue.push_back(__pyx_v_key);
+          } catch(...) {
+            __Pyx_CppExn2PyErr();
+            __PYX_ERR(0, 352, __pyx_L4_error)
+          }
+
+          /* "bundler/extensions/first.pyx":350
  * 
+ *                     # Add it to the reachable word list.
+ *                     if packed:             # <<<<<<<<<<<<<<
+ *                         self.c_insert_seen(slot, key)
+ *                         self.packed_queue.push_back(key)
  */
-        try {
-          __pyx_v_seen.insert(__pyx_v_next_wrd);
-        } catch(...) {
-          __Pyx_CppExn2PyErr();
-          __PYX_ERR(0, 243, __pyx_L4_error)
+          goto __pyx_L26;
         }
 
-        /* "bundler/extensions/first.pyx":244
- *                     # Add it to the reachable word list.
- *                     seen.insert(next_wrd)
- *                     to_do.push(next_wrd)             # <<<<<<<<<<<<<<
+        /* "bundler/extensions/first.pyx":354
+ *                         self.packed_queue.push_back(key)
+ *                     else:
+ *                         seen.insert(next_wrd)             # <<<<<<<<<<<<<<
+ *                         to_do.push(next_wrd)
  * 
- *             return True
  */
-        __pyx_v_to_do.push(__pyx_v_next_wrd);
-        __pyx_L10_continue:;
+        /*else*/ {
+          try {
+            __pyx_v_seen.insert(__pyx_v_next_wrd);
+          } catch(...) {
+            __Pyx_CppExn2PyErr();
+            __PYX_ERR(0, 354, __pyx_L4_error)
+          }
+
+          /* "bundler/extensions/first.pyx":355
+ *                     else:
+ *                         seen.insert(next_wrd)
+ *                         to_do.push(next_wrd)             # <<<<<<<<<<<<<<
+ * 
+ *             self.outcomes[outcome + FIC_FIRST] += 1
+ */
+          __pyx_v_to_do.push(__pyx_v_next_wrd);
+        }
+        __pyx_L26:;
+        __pyx_L14_continue:;
       }
     }
 
-    /* "bundler/extensions/first.pyx":246
- *                     to_do.push(next_wrd)
+    /* "bundler/extensions/first.pyx":357
+ *                         to_do.push(next_wrd)
+ * 
+ *             self.outcomes[outcome + FIC_FIRST] += 1             # <<<<<<<<<<<<<<
+ *             return True
+ *         finally:
+ */
+    __pyx_t_2 = (__pyx_v_outcome + __pyx_e_7bundler_10extensions_5first_FIC_FIRST);
+    (__pyx_v_self->outcomes[__pyx_t_2]) = ((__pyx_v_self->outcomes[__pyx_t_2]) + 1);
+
+    /* "bundler/extensions/first.pyx":358
  * 
+ *             self.outcomes[outcome + FIC_FIRST] += 1
  *             return True             # <<<<<<<<<<<<<<
  *         finally:
- *             free(tmp)
+ *             self.explored[1 if prefix else 0] += processed
  */
-    __Pyx_XDECREF(__pyx_r);
-    __Pyx_INCREF(Py_True);
-    __pyx_r = Py_True;
+    __pyx_r = 1;
     goto __pyx_L3_return;
   }
 
-  /* "bundler/extensions/first.pyx":248
+  /* "bundler/extensions/first.pyx":360
  *             return True
  *         finally:
- *             free(tmp)             # <<<<<<<<<<<<<<
+ *             self.explored[1 if prefix else 0] += processed             # <<<<<<<<<<<<<<
+ *             free(tmp)
  * 
  */
   /*finally:*/ {
@@ -3966,57 +5772,88 @@ static PyObject *__pyx_pf_7bundler_10extensions_5first_12FirstInClass_6is_first(
     /*exception exit:*/{
       __Pyx_PyThreadState_declare
       __Pyx_PyThreadState_assign
-      __pyx_t_15 = 0; __pyx_t_16 = 0; __pyx_t_17 = 0; __pyx_t_18 = 0; __pyx_t_19 = 0; __pyx_t_20 = 0;
-      if (PY_MAJOR_VERSION >= 3) __Pyx_ExceptionSwap(&__pyx_t_18, &__pyx_t_19, &__pyx_t_20);
-      if ((PY_MAJOR_VERSION < 3) || unlikely(__Pyx_GetException(&__pyx_t_15, &__pyx_t_16, &__pyx_t_17) < 0)) __Pyx_ErrFetch(&__pyx_t_15, &__pyx_t_16, &__pyx_t_17);
-      __Pyx_XGOTREF(__pyx_t_15);
+      __pyx_t_16 = 0; __pyx_t_17 = 0; __pyx_t_18 = 0; __pyx_t_19 = 0; __pyx_t_20 = 0; __pyx_t_21 = 0;
+      if (PY_MAJOR_VERSION >= 3) __Pyx_ExceptionSwap(&__pyx_t_19, &__pyx_t_20, &__pyx_t_21);
+      if ((PY_MAJOR_VERSION < 3) || unlikely(__Pyx_GetException(&__pyx_t_16, &__pyx_t_17, &__pyx_t_18) < 0)) __Pyx_ErrFetch(&__pyx_t_16, &__pyx_t_17, &__pyx_t_18);
       __Pyx_XGOTREF(__pyx_t_16);
       __Pyx_XGOTREF(__pyx_t_17);
       __Pyx_XGOTREF(__pyx_t_18);
       __Pyx_XGOTREF(__pyx_t_19);
       __Pyx_XGOTREF(__pyx_t_20);
-      __pyx_t_3 = __pyx_lineno; __pyx_t_8 = __pyx_clineno; __pyx_t_14 = __pyx_filename;
+      __Pyx_XGOTREF(__pyx_t_21);
+      __pyx_t_2 = __pyx_lineno; __pyx_t_8 = __pyx_clineno; __pyx_t_15 = __pyx_filename;
       {
+        if ((__pyx_v_prefix != 0)) {
+          __pyx_t_1 = 1;
+        } else {
+          __pyx_t_1 = 0;
+        }
+        (__pyx_v_self->explored[__pyx_t_1]) = ((__pyx_v_self->explored[__pyx_t_1]) + __pyx_v_processed);
+
+        /* "bundler/extensions/first.pyx":361
+ *         finally:
+ *             self.explored[1 if prefix else 0] += processed
+ *             free(tmp)             # <<<<<<<<<<<<<<
+ * 
+ */
         free(__pyx_v_tmp);
       }
       if (PY_MAJOR_VERSION >= 3) {
-        __Pyx_XGIVEREF(__pyx_t_18);
         __Pyx_XGIVEREF(__pyx_t_19);
         __Pyx_XGIVEREF(__pyx_t_20);
-        __Pyx_ExceptionReset(__pyx_t_18, __pyx_t_19, __pyx_t_20);
+        __Pyx_XGIVEREF(__pyx_t_21);
+        __Pyx_ExceptionReset(__pyx_t_19, __pyx_t_20, __pyx_t_21);
       }
-      __Pyx_XGIVEREF(__pyx_t_15);
       __Pyx_XGIVEREF(__pyx_t_16);
       __Pyx_XGIVEREF(__pyx_t_17);
-      __Pyx_ErrRestore(__pyx_t_15, __pyx_t_16, __pyx_t_17);
-      __pyx_t_15 = 0; __pyx_t_16 = 0; __pyx_t_17 = 0; __pyx_t_18 = 0; __pyx_t_19 = 0; __pyx_t_20 = 0;
-      __pyx_lineno = __pyx_t_3; __pyx_clineno = __pyx_t_8; __pyx_filename = __pyx_t_14;
+      __Pyx_XGIVEREF(__pyx_t_18);
+      __Pyx_ErrRestore(__pyx_t_16, __pyx_t_17, __pyx_t_18);
+      __pyx_t_16 = 0; __pyx_t_17 = 0; __pyx_t_18 = 0; __pyx_t_19 = 0; __pyx_t_20 = 0; __pyx_t_21 = 0;
+      __pyx_lineno = __pyx_t_2; __pyx_clineno = __pyx_t_8; __pyx_filename = __pyx_t_15;
       goto __pyx_L1_error;
     }
     __pyx_L3_return: {
-      __pyx_t_20 = __pyx_r;
-      __pyx_r = 0;
+      __pyx_t_3 = __pyx_r;
+
+      /* "bundler/extensions/first.pyx":360
+ *             return True
+ *         finally:
+ *             self.explored[1 if prefix else 0] += processed             # <<<<<<<<<<<<<<
+ *             free(tmp)
+ * 
+ */
+      if ((__pyx_v_prefix != 0)) {
+        __pyx_t_1 = 1;
+      } else {
+        __pyx_t_1 = 0;
+      }
+      (__pyx_v_self->explored[__pyx_t_1]) = ((__pyx_v_self->explored[__pyx_t_1]) + __pyx_v_processed);
+
+      /* "bundler/extensions/first.pyx":361
+ *         finally:
+ *             self.explored[1 if prefix else 0] += processed
+ *             free(tmp)             # <<<<<<<<<<<<<<
+ * 
+ */
       free(__pyx_v_tmp);
-      __pyx_r = __pyx_t_20;
-      __pyx_t_20 = 0;
+      __pyx_r = __pyx_t_3;
       goto __pyx_L0;
     }
   }
 
-  /* "bundler/extensions/first.pyx":166
- *         return True
+  /* "bundler/extensions/first.pyx":253
+ *         return self.c_is_first(word, prefix, max_tree_size)
  * 
- *     def is_first(self, tuple word, bint prefix, int max_tree_size):             # <<<<<<<<<<<<<<
- *         ''' Determines if a word is lex first in its class.
+ *     cdef bint c_is_first(self, IWord& wrd, bint prefix, int max_tree_size, bint check_bad_prefix=True):             # <<<<<<<<<<<<<<
+ *         ''' The C-level implementation of is_first.
  * 
  */
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_AddTraceback("bundler.extensions.first.FirstInClass.is_first", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
+  __Pyx_WriteUnraisable("bundler.extensions.first.FirstInClass.c_is_first", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __pyx_r = 0;
   __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
@@ -4807,6 +6644,8 @@ static PyObject *__pyx_tp_new_7bundler_10extensions_5first_FirstInClass(PyTypeOb
   if (unlikely(!o)) return 0;
   p = ((struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *)o);
   p->__pyx_vtab = __pyx_vtabptr_7bundler_10extensions_5first_FirstInClass;
+  new((void*)&(p->seen_table)) std::vector<uint64_t> ();
+  new((void*)&(p->packed_queue)) std::vector<uint64_t> ();
   p->alphabet = ((PyObject*)Py_None); Py_INCREF(Py_None);
   p->o_inverse = ((PyObject*)Py_None); Py_INCREF(Py_None);
   p->find_balanced_relators_FSM = ((struct __pyx_obj_7bundler_10extensions_3FSM_FSM *)Py_None); Py_INCREF(Py_None);
@@ -4824,6 +6663,8 @@ static void __pyx_tp_dealloc_7bundler_10extensions_5first_FirstInClass(PyObject
   }
   #endif
   PyObject_GC_UnTrack(o);
+  __Pyx_call_destructor(p->seen_table);
+  __Pyx_call_destructor(p->packed_queue);
   Py_CLEAR(p->alphabet);
   Py_CLEAR(p->o_inverse);
   Py_CLEAR(p->find_balanced_relators_FSM);
@@ -4884,7 +6725,9 @@ static int __pyx_tp_clear_7bundler_10extensions_5first_FirstInClass(PyObject *o)
 static PyMethodDef __pyx_methods_7bundler_10extensions_5first_FirstInClass[] = {
   {"__reduce__", (PyCFunction)__pyx_pw_7bundler_10extensions_5first_12FirstInClass_3__reduce__, METH_NOARGS, 0},
   {"__del__", (PyCFunction)__pyx_pw_7bundler_10extensions_5first_12FirstInClass_5__del__, METH_NOARGS, 0},
-  {"is_first", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_7bundler_10extensions_5first_12FirstInClass_7is_first, METH_VARARGS|METH_KEYWORDS, __pyx_doc_7bundler_10extensions_5first_12FirstInClass_6is_first},
+  {"statistics", (PyCFunction)__pyx_pw_7bundler_10extensions_5first_12FirstInClass_7statistics, METH_NOARGS, __pyx_doc_7bundler_10extensions_5first_12FirstInClass_6statistics},
+  {"reset_statistics", (PyCFunction)__pyx_pw_7bundler_10extensions_5first_12FirstInClass_9reset_statistics, METH_NOARGS, 0},
+  {"is_first", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_7bundler_10extensions_5first_12FirstInClass_11is_first, METH_VARARGS|METH_KEYWORDS, __pyx_doc_7bundler_10extensions_5first_12FirstInClass_10is_first},
   {0, 0, 0, 0}
 };
 
@@ -5006,29 +6849,49 @@ static struct PyModuleDef __pyx_moduledef = {
 #endif
 
 static __Pyx_StringTabEntry __pyx_string_tab[] = {
+  {&__pyx_kp_u_, __pyx_k_, sizeof(__pyx_k_), 0, 1, 0, 0},
+  {&__pyx_n_s_A, __pyx_k_A, sizeof(__pyx_k_A), 0, 0, 1, 1},
+  {&__pyx_n_s_B, __pyx_k_B, sizeof(__pyx_k_B), 0, 0, 1, 1},
   {&__pyx_n_s_FirstInClass, __pyx_k_FirstInClass, sizeof(__pyx_k_FirstInClass), 0, 0, 1, 1},
   {&__pyx_n_s_MemoryError, __pyx_k_MemoryError, sizeof(__pyx_k_MemoryError), 0, 0, 1, 1},
   {&__pyx_n_s_alphabet, __pyx_k_alphabet, sizeof(__pyx_k_alphabet), 0, 0, 1, 1},
   {&__pyx_n_s_automorphisms, __pyx_k_automorphisms, sizeof(__pyx_k_automorphisms), 0, 0, 1, 1},
+  {&__pyx_n_u_bad_prefix, __pyx_k_bad_prefix, sizeof(__pyx_k_bad_prefix), 0, 1, 0, 1},
   {&__pyx_n_s_bad_prefix_FSM, __pyx_k_bad_prefix_FSM, sizeof(__pyx_k_bad_prefix_FSM), 0, 0, 1, 1},
+  {&__pyx_n_u_beaten, __pyx_k_beaten, sizeof(__pyx_k_beaten), 0, 1, 0, 1},
+  {&__pyx_n_u_beaten_by_automorph, __pyx_k_beaten_by_automorph, sizeof(__pyx_k_beaten_by_automorph), 0, 1, 0, 1},
+  {&__pyx_n_s_bundler_extensions_first, __pyx_k_bundler_extensions_first, sizeof(__pyx_k_bundler_extensions_first), 0, 0, 1, 1},
+  {&__pyx_kp_s_bundler_extensions_first_pyx, __pyx_k_bundler_extensions_first_pyx, sizeof(__pyx_k_bundler_extensions_first_pyx), 0, 0, 1, 0},
   {&__pyx_n_s_class, __pyx_k_class, sizeof(__pyx_k_class), 0, 0, 1, 1},
   {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
+  {&__pyx_n_s_cyclic_ordered, __pyx_k_cyclic_ordered, sizeof(__pyx_k_cyclic_ordered), 0, 0, 1, 1},
+  {&__pyx_n_s_enumerate, __pyx_k_enumerate, sizeof(__pyx_k_enumerate), 0, 0, 1, 1},
+  {&__pyx_n_u_exhausted, __pyx_k_exhausted, sizeof(__pyx_k_exhausted), 0, 1, 0, 1},
+  {&__pyx_kp_u_explored, __pyx_k_explored, sizeof(__pyx_k_explored), 0, 1, 0, 0},
   {&__pyx_n_s_find_balanced_relators_FSM, __pyx_k_find_balanced_relators_FSM, sizeof(__pyx_k_find_balanced_relators_FSM), 0, 0, 1, 1},
+  {&__pyx_n_u_first, __pyx_k_first, sizeof(__pyx_k_first), 0, 1, 0, 1},
+  {&__pyx_n_s_i, __pyx_k_i, sizeof(__pyx_k_i), 0, 0, 1, 1},
   {&__pyx_n_s_inverse, __pyx_k_inverse, sizeof(__pyx_k_inverse), 0, 0, 1, 1},
+  {&__pyx_n_s_l, __pyx_k_l, sizeof(__pyx_k_l), 0, 0, 1, 1},
   {&__pyx_n_s_longest_relator, __pyx_k_longest_relator, sizeof(__pyx_k_longest_relator), 0, 0, 1, 1},
   {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
   {&__pyx_n_s_max_tree_size, __pyx_k_max_tree_size, sizeof(__pyx_k_max_tree_size), 0, 0, 1, 1},
   {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
   {&__pyx_n_s_prefix, __pyx_k_prefix, sizeof(__pyx_k_prefix), 0, 0, 1, 1},
+  {&__pyx_n_u_prefix, __pyx_k_prefix, sizeof(__pyx_k_prefix), 0, 1, 0, 1},
   {&__pyx_n_s_pyx_vtable, __pyx_k_pyx_vtable, sizeof(__pyx_k_pyx_vtable), 0, 0, 1, 1},
   {&__pyx_n_s_range, __pyx_k_range, sizeof(__pyx_k_range), 0, 0, 1, 1},
+  {&__pyx_n_u_simpler, __pyx_k_simpler, sizeof(__pyx_k_simpler), 0, 1, 0, 1},
   {&__pyx_n_s_simpler_FSM, __pyx_k_simpler_FSM, sizeof(__pyx_k_simpler_FSM), 0, 0, 1, 1},
   {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
+  {&__pyx_n_s_tmp, __pyx_k_tmp, sizeof(__pyx_k_tmp), 0, 0, 1, 1},
   {&__pyx_n_s_word, __pyx_k_word, sizeof(__pyx_k_word), 0, 0, 1, 1},
+  {&__pyx_n_u_word, __pyx_k_word, sizeof(__pyx_k_word), 0, 1, 0, 1},
   {0, 0, 0, 0, 0, 0, 0}
 };
 static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 22, __pyx_L1_error)
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 19, __pyx_L1_error)
+  __pyx_builtin_enumerate = __Pyx_GetBuiltinName(__pyx_n_s_enumerate); if (!__pyx_builtin_enumerate) __PYX_ERR(0, 141, __pyx_L1_error)
   __pyx_builtin_MemoryError = __Pyx_GetBuiltinName(__pyx_n_s_MemoryError); if (!__pyx_builtin_MemoryError) __PYX_ERR(1, 109, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
@@ -5038,12 +6901,29 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
 static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
+
+  /* "bundler/extensions/first.pyx":75
+ *     return True  # A == cycled(B)
+ * 
+ * def cyclic_ordered(tuple A, tuple B):             # <<<<<<<<<<<<<<
+ *     ''' Return whether A is <= all cyclic permutations of B, which must be the same length.
+ * 
+ */
+  __pyx_tuple__2 = PyTuple_Pack(5, __pyx_n_s_A, __pyx_n_s_B, __pyx_n_s_l, __pyx_n_s_i, __pyx_n_s_tmp); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(0, 75, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__2);
+  __Pyx_GIVEREF(__pyx_tuple__2);
+  __pyx_codeobj__3 = (PyObject*)__Pyx_PyCode_New(2, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__2, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_bundler_extensions_first_pyx, __pyx_n_s_cyclic_ordered, 75, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__3)) __PYX_ERR(0, 75, __pyx_L1_error)
   __Pyx_RefNannyFinishContext();
   return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
 }
 
 static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
   if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_1 = PyInt_FromLong(1); if (unlikely(!__pyx_int_1)) __PYX_ERR(0, 1, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -5089,16 +6969,20 @@ static int __Pyx_modinit_type_init_code(void) {
   __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
   /*--- Type init code ---*/
   __pyx_vtabptr_7bundler_10extensions_5first_FirstInClass = &__pyx_vtable_7bundler_10extensions_5first_FirstInClass;
-  __pyx_vtable_7bundler_10extensions_5first_FirstInClass.c_before_automorphs = (int (*)(struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *, __pyx_t_7bundler_10extensions_5first_IWord &, __pyx_t_7bundler_10extensions_5first_IWord &, int, int *))__pyx_f_7bundler_10extensions_5first_12FirstInClass_c_before_automorphs;
-  if (PyType_Ready(&__pyx_type_7bundler_10extensions_5first_FirstInClass) < 0) __PYX_ERR(0, 53, __pyx_L1_error)
+  __pyx_vtable_7bundler_10extensions_5first_FirstInClass.c_reset_seen = (void (*)(struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *, int))__pyx_f_7bundler_10extensions_5first_12FirstInClass_c_reset_seen;
+  __pyx_vtable_7bundler_10extensions_5first_FirstInClass.c_find_slot = (uint64_t (*)(struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *, uint64_t))__pyx_f_7bundler_10extensions_5first_12FirstInClass_c_find_slot;
+  __pyx_vtable_7bundler_10extensions_5first_FirstInClass.c_insert_seen = (void (*)(struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *, uint64_t, uint64_t))__pyx_f_7bundler_10extensions_5first_12FirstInClass_c_insert_seen;
+  __pyx_vtable_7bundler_10extensions_5first_FirstInClass.c_before_automorphs = (int (*)(struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *, __pyx_t_7bundler_10extensions_3FSM_IWord &, __pyx_t_7bundler_10extensions_3FSM_IWord &, int, int *))__pyx_f_7bundler_10extensions_5first_12FirstInClass_c_before_automorphs;
+  __pyx_vtable_7bundler_10extensions_5first_FirstInClass.c_is_first = (int (*)(struct __pyx_obj_7bundler_10extensions_5first_FirstInClass *, __pyx_t_7bundler_10extensions_3FSM_IWord &, int, int, struct __pyx_opt_args_7bundler_10extensions_5first_12FirstInClass_c_is_first *__pyx_optional_args))__pyx_f_7bundler_10extensions_5first_12FirstInClass_c_is_first;
+  if (PyType_Ready(&__pyx_type_7bundler_10extensions_5first_FirstInClass) < 0) __PYX_ERR(0, 91, __pyx_L1_error)
   #if PY_VERSION_HEX < 0x030800B1
   __pyx_type_7bundler_10extensions_5first_FirstInClass.tp_print = 0;
   #endif
   if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_7bundler_10extensions_5first_FirstInClass.tp_dictoffset && __pyx_type_7bundler_10extensions_5first_FirstInClass.tp_getattro == PyObject_GenericGetAttr)) {
     __pyx_type_7bundler_10extensions_5first_FirstInClass.tp_getattro = __Pyx_PyObject_GenericGetAttr;
   }
-  if (__Pyx_SetVtable(__pyx_type_7bundler_10extensions_5first_FirstInClass.tp_dict, __pyx_vtabptr_7bundler_10extensions_5first_FirstInClass) < 0) __PYX_ERR(0, 53, __pyx_L1_error)
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_FirstInClass, (PyObject *)&__pyx_type_7bundler_10extensions_5first_FirstInClass) < 0) __PYX_ERR(0, 53, __pyx_L1_error)
+  if (__Pyx_SetVtable(__pyx_type_7bundler_10extensions_5first_FirstInClass.tp_dict, __pyx_vtabptr_7bundler_10extensions_5first_FirstInClass) < 0) __PYX_ERR(0, 91, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_FirstInClass, (PyObject *)&__pyx_type_7bundler_10extensions_5first_FirstInClass) < 0) __PYX_ERR(0, 91, __pyx_L1_error)
   __pyx_ptype_7bundler_10extensions_5first_FirstInClass = &__pyx_type_7bundler_10extensions_5first_FirstInClass;
   __Pyx_RefNannyFinishContext();
   return 0;
@@ -5150,6 +7034,14 @@ static int __Pyx_modinit_type_import_code(void) {
   __Pyx_ImportType_CheckSize_Warn);
    if (!__pyx_ptype_7bundler_10extensions_3FSM_FSM) __PYX_ERR(6, 11, __pyx_L1_error)
   __pyx_vtabptr_7bundler_10extensions_3FSM_FSM = (struct __pyx_vtabstruct_7bundler_10extensions_3FSM_FSM*)__Pyx_GetVtable(__pyx_ptype_7bundler_10extensions_3FSM_FSM->tp_dict); if (unlikely(!__pyx_vtabptr_7bundler_10extensions_3FSM_FSM)) __PYX_ERR(6, 11, __pyx_L1_error)
+  __pyx_ptype_7bundler_10extensions_3FSM_StatePath = __Pyx_ImportType(__pyx_t_1, "bundler.extensions.FSM", "StatePath", sizeof(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_7bundler_10extensions_3FSM_StatePath),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_7bundler_10extensions_3FSM_StatePath) __PYX_ERR(6, 33, __pyx_L1_error)
+  __pyx_vtabptr_7bundler_10extensions_3FSM_StatePath = (struct __pyx_vtabstruct_7bundler_10extensions_3FSM_StatePath*)__Pyx_GetVtable(__pyx_ptype_7bundler_10extensions_3FSM_StatePath->tp_dict); if (unlikely(!__pyx_vtabptr_7bundler_10extensions_3FSM_StatePath)) __PYX_ERR(6, 33, __pyx_L1_error)
+  __pyx_ptype_7bundler_10extensions_3FSM_TransitionMap = __Pyx_ImportType(__pyx_t_1, "bundler.extensions.FSM", "TransitionMap", sizeof(struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_7bundler_10extensions_3FSM_TransitionMap),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_7bundler_10extensions_3FSM_TransitionMap) __PYX_ERR(6, 45, __pyx_L1_error)
+  __pyx_vtabptr_7bundler_10extensions_3FSM_TransitionMap = (struct __pyx_vtabstruct_7bundler_10extensions_3FSM_TransitionMap*)__Pyx_GetVtable(__pyx_ptype_7bundler_10extensions_3FSM_TransitionMap->tp_dict); if (unlikely(!__pyx_vtabptr_7bundler_10extensions_3FSM_TransitionMap)) __PYX_ERR(6, 45, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_RefNannyFinishContext();
   return 0;
@@ -5375,6 +7267,27 @@ if (!__Pyx_RefNanny) {
   if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #endif
 
+  /* "bundler/extensions/first.pyx":13
+ * from bundler.extensions.FSM cimport FSM, IWord
+ * 
+ * cdef uint64_t EMPTY_SLOT = 0xFFFFFFFFFFFFFFFFULL  # Packed words use at most 63 bits so this never clashes.             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline uint64_t pack(IWord& word, int bits):
+ */
+  __pyx_v_7bundler_10extensions_5first_EMPTY_SLOT = 0xFFFFFFFFFFFFFFFFULL;
+
+  /* "bundler/extensions/first.pyx":75
+ *     return True  # A == cycled(B)
+ * 
+ * def cyclic_ordered(tuple A, tuple B):             # <<<<<<<<<<<<<<
+ *     ''' Return whether A is <= all cyclic permutations of B, which must be the same length.
+ * 
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_7bundler_10extensions_5first_1cyclic_ordered, NULL, __pyx_n_s_bundler_extensions_first); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 75, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_cyclic_ordered, __pyx_t_1) < 0) __PYX_ERR(0, 75, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
   /* "bundler/extensions/first.pyx":1
  * # distutils: language = c++             # <<<<<<<<<<<<<<
  * 
@@ -5902,6 +7815,240 @@ static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject
 }
 #endif
 
+/* DivInt[long] */
+static CYTHON_INLINE long __Pyx_div_long(long a, long b) {
+    long q = a / b;
+    long r = a - q*b;
+    q -= ((r != 0) & ((r ^ b) < 0));
+    return q;
+}
+
+/* PyIntBinop */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyInt_AddObjC(PyObject *op1, PyObject *op2, CYTHON_UNUSED long intval, int inplace, int zerodivision_check) {
+    (void)inplace;
+    (void)zerodivision_check;
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_CheckExact(op1))) {
+        const long b = intval;
+        long x;
+        long a = PyInt_AS_LONG(op1);
+            x = (long)((unsigned long)a + b);
+            if (likely((x^a) >= 0 || (x^b) >= 0))
+                return PyInt_FromLong(x);
+            return PyLong_Type.tp_as_number->nb_add(op1, op2);
+    }
+    #endif
+    #if CYTHON_USE_PYLONG_INTERNALS
+    if (likely(PyLong_CheckExact(op1))) {
+        const long b = intval;
+        long a, x;
+#ifdef HAVE_LONG_LONG
+        const PY_LONG_LONG llb = intval;
+        PY_LONG_LONG lla, llx;
+#endif
+        const digit* digits = ((PyLongObject*)op1)->ob_digit;
+        const Py_ssize_t size = Py_SIZE(op1);
+        if (likely(__Pyx_sst_abs(size) <= 1)) {
+            a = likely(size) ? digits[0] : 0;
+            if (size == -1) a = -a;
+        } else {
+            switch (size) {
+                case -2:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        a = -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 2:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        a = (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case -3:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        a = -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 3:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        a = (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case -4:
+                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                        a = -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 4:
+                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                        a = (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                default: return PyLong_Type.tp_as_number->nb_add(op1, op2);
+            }
+        }
+                x = a + b;
+            return PyLong_FromLong(x);
+#ifdef HAVE_LONG_LONG
+        long_long:
+                llx = lla + llb;
+            return PyLong_FromLongLong(llx);
+#endif
+        
+        
+    }
+    #endif
+    if (PyFloat_CheckExact(op1)) {
+        const long b = intval;
+        double a = PyFloat_AS_DOUBLE(op1);
+            double result;
+            PyFPE_START_PROTECT("add", return NULL)
+            result = ((double)a) + (double)b;
+            PyFPE_END_PROTECT(result)
+            return PyFloat_FromDouble(result);
+    }
+    return (inplace ? PyNumber_InPlaceAdd : PyNumber_Add)(op1, op2);
+}
+#endif
+
+/* JoinPyUnicode */
+static PyObject* __Pyx_PyUnicode_Join(PyObject* value_tuple, Py_ssize_t value_count, Py_ssize_t result_ulength,
+                                      CYTHON_UNUSED Py_UCS4 max_char) {
+#if CYTHON_USE_UNICODE_INTERNALS && CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    PyObject *result_uval;
+    int result_ukind;
+    Py_ssize_t i, char_pos;
+    void *result_udata;
+#if CYTHON_PEP393_ENABLED
+    result_uval = PyUnicode_New(result_ulength, max_char);
+    if (unlikely(!result_uval)) return NULL;
+    result_ukind = (max_char <= 255) ? PyUnicode_1BYTE_KIND : (max_char <= 65535) ? PyUnicode_2BYTE_KIND : PyUnicode_4BYTE_KIND;
+    result_udata = PyUnicode_DATA(result_uval);
+#else
+    result_uval = PyUnicode_FromUnicode(NULL, result_ulength);
+    if (unlikely(!result_uval)) return NULL;
+    result_ukind = sizeof(Py_UNICODE);
+    result_udata = PyUnicode_AS_UNICODE(result_uval);
+#endif
+    char_pos = 0;
+    for (i=0; i < value_count; i++) {
+        int ukind;
+        Py_ssize_t ulength;
+        void *udata;
+        PyObject *uval = PyTuple_GET_ITEM(value_tuple, i);
+        if (unlikely(__Pyx_PyUnicode_READY(uval)))
+            goto bad;
+        ulength = __Pyx_PyUnicode_GET_LENGTH(uval);
+        if (unlikely(!ulength))
+            continue;
+        if (unlikely(char_pos + ulength < 0))
+            goto overflow;
+        ukind = __Pyx_PyUnicode_KIND(uval);
+        udata = __Pyx_PyUnicode_DATA(uval);
+        if (!CYTHON_PEP393_ENABLED || ukind == result_ukind) {
+            memcpy((char *)result_udata + char_pos * result_ukind, udata, (size_t) (ulength * result_ukind));
+        } else {
+            #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030300F0 || defined(_PyUnicode_FastCopyCharacters)
+            _PyUnicode_FastCopyCharacters(result_uval, char_pos, uval, 0, ulength);
+            #else
+            Py_ssize_t j;
+            for (j=0; j < ulength; j++) {
+                Py_UCS4 uchar = __Pyx_PyUnicode_READ(ukind, udata, j);
+                __Pyx_PyUnicode_WRITE(result_ukind, result_udata, char_pos+j, uchar);
+            }
+            #endif
+        }
+        char_pos += ulength;
+    }
+    return result_uval;
+overflow:
+    PyErr_SetString(PyExc_OverflowError, "join() result is too long for a Python string");
+bad:
+    Py_DECREF(result_uval);
+    return NULL;
+#else
+    result_ulength++;
+    value_count++;
+    return PyUnicode_Join(__pyx_empty_unicode, value_tuple);
+#endif
+}
+
+/* WriteUnraisableException */
+static void __Pyx_WriteUnraisable(const char *name, CYTHON_UNUSED int clineno,
+                                  CYTHON_UNUSED int lineno, CYTHON_UNUSED const char *filename,
+                                  int full_traceback, CYTHON_UNUSED int nogil) {
+    PyObject *old_exc, *old_val, *old_tb;
+    PyObject *ctx;
+    __Pyx_PyThreadState_declare
+#ifdef WITH_THREAD
+    PyGILState_STATE state;
+    if (nogil)
+        state = PyGILState_Ensure();
+    else state = (PyGILState_STATE)0;
+#endif
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&old_exc, &old_val, &old_tb);
+    if (full_traceback) {
+        Py_XINCREF(old_exc);
+        Py_XINCREF(old_val);
+        Py_XINCREF(old_tb);
+        __Pyx_ErrRestore(old_exc, old_val, old_tb);
+        PyErr_PrintEx(1);
+    }
+    #if PY_MAJOR_VERSION < 3
+    ctx = PyString_FromString(name);
+    #else
+    ctx = PyUnicode_FromString(name);
+    #endif
+    __Pyx_ErrRestore(old_exc, old_val, old_tb);
+    if (!ctx) {
+        PyErr_WriteUnraisable(Py_None);
+    } else {
+        PyErr_WriteUnraisable(ctx);
+        Py_DECREF(ctx);
+    }
+#ifdef WITH_THREAD
+    if (nogil)
+        PyGILState_Release(state);
+#endif
+}
+
 /* PyObject_GenericGetAttrNoDict */
 #if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
 static PyObject *__Pyx_RaiseGenericGetAttributeError(PyTypeObject *tp, PyObject *attr_name) {
@@ -0,0 +1,53 @@
+# distutils: language = c++
+
+from libc.stdint cimport uint64_t
+from libcpp.vector cimport vector
+
+from bundler.extensions.FSM cimport FSM, IWord
+
+# The ways that c_is_first can finish, in the order that it tests for them.
+cdef enum:
+    FIC_BAD_PREFIX
+    FIC_BEATEN_BY_AUTOMORPH  # The word itself is beaten by one of its automorphs.
+    FIC_SIMPLER
+    FIC_BEATEN
+    FIC_EXHAUSTED  # Gave up after max_tree_size words, so assumed to be first.
+    FIC_FIRST
+    FIC_OUTCOMES
+
+cdef class FirstInClass:
+    cdef list alphabet
+    cdef list o_inverse
+    cdef int longest_relator
+    cdef FSM find_balanced_relators_FSM
+    cdef FSM bad_prefix_FSM
+    cdef FSM simpler_FSM
+    cdef list o_automorphisms
+    
+    cdef int len_alphabet
+    cdef int len_alphabet1
+    cdef int stop
+    cdef int* inverse
+    cdef int num_automorphisms
+    cdef bint* any_missing
+    cdef bint* missing
+    cdef int* automorphisms
+    
+    # Words of length at most max_packed_length are packed into a uint64_t, letter_bits bits per letter, and
+    # is_first tracks them in an open addressing hash set and a flat queue that are reused between calls.
+    cdef int letter_bits
+    cdef int max_packed_length
+    cdef vector[uint64_t] seen_table
+    cdef uint64_t seen_mask
+    cdef int seen_count
+    cdef vector[uint64_t] packed_queue
+    
+    # How often c_is_first finishes in each way and how many equivalent words it visits, for words then prefixes.
+    cdef long outcomes[2 * FIC_OUTCOMES]
+    cdef long explored[2]
+    
+    cdef void c_reset_seen(self, int max_tree_size)
+    cdef uint64_t c_find_slot(self, uint64_t key)
+    cdef void c_insert_seen(self, uint64_t slot, uint64_t key)
+    cdef bint c_before_automorphs(self, IWord& word, IWord& next_word, bint prefix, int* tmp)
+    cdef bint c_is_first(self, IWord& wrd, bint prefix, int max_tree_size, bint check_bad_prefix=*)
@@ -6,9 +6,31 @@ from libcpp.queue cimport queue
 from libcpp.set cimport set
 from libcpp.vector cimport vector
 
-from bundler.extensions.FSM cimport FSM
+from libc.stdint cimport uint64_t
 
-ctypedef vector[int] IWord
+from bundler.extensions.FSM cimport FSM, IWord
+
+cdef uint64_t EMPTY_SLOT = 0xFFFFFFFFFFFFFFFFULL  # Packed words use at most 63 bits so this never clashes.
+
+cdef inline uint64_t pack(IWord& word, int bits):
+    ''' Return the word packed into a single integer using bits bits per letter. '''
+    cdef uint64_t key = 0
+    cdef int i
+    for i in range(<int>word.size()):
+        key |= (<uint64_t>word[i]) << (bits * i)
+    return key
+
+cdef inline void unpack(uint64_t key, IWord& word, int bits):
+    ''' Unpack key into word, which must already have the correct length. '''
+    cdef uint64_t mask = (1 << bits) - 1
+    cdef int i
+    for i in range(<int>word.size()):
+        word[i] = (key >> (bits * i)) & mask
+
+cdef inline uint64_t hash_key(uint64_t key):
+    ''' A cheap mixing function (Fibonacci hashing) so consecutive keys spread across the table. '''
+    key *= 0x9E3779B97F4A7C15ULL
+    return key ^ (key >> 32)
 
 cdef bint is_cyclic_ordered(int* A, int* B, int l, int* S, int* f):
     ''' Return whether A is <= all cyclic perumtations of B.
@@ -50,24 +72,23 @@ cdef bint is_cyclic_ordered(int* A, int* B, int l, int* S, int* f):
     
     return True  # A == cycled(B)
 
-cdef class FirstInClass:
-    cdef list alphabet
-    cdef list o_inverse
-    cdef int longest_relator
-    cdef FSM find_balanced_relators_FSM
-    cdef FSM bad_prefix_FSM
-    cdef FSM simpler_FSM
-    cdef list o_automorphisms
-    
-    cdef int len_alphabet
-    cdef int len_alphabet1
-    cdef int stop
-    cdef int* inverse
-    cdef int num_automorphisms
-    cdef bint* any_missing
-    cdef bint* missing
-    cdef int* automorphisms
+def cyclic_ordered(tuple A, tuple B):
+    ''' Return whether A is <= all cyclic permutations of B, which must be the same length.
     
+    This exposes is_cyclic_ordered to Python so that it can be checked and benchmarked. '''
+    assert len(A) == len(B)
+    cdef int l = len(A)
+    cdef int i
+    cdef int* tmp = <int *> calloc(6*l + 1, sizeof(int))
+    try:
+        for i in range(l):
+            tmp[i] = A[i]
+            tmp[l + i] = B[i]
+        return is_cyclic_ordered(tmp, tmp + l, l, tmp + 2*l, tmp + 4*l)
+    finally:
+        free(tmp)
+
+cdef class FirstInClass:
     def __init__(self, list alphabet, list inverse, int longest_relator, FSM find_balanced_relators_FSM, FSM bad_prefix_FSM, FSM simpler_FSM, list automorphisms):
         cdef list missing, auto
         cdef int i, j
@@ -98,6 +119,11 @@ cdef class FirstInClass:
             for j in range(self.len_alphabet):
                 self.automorphisms[i * self.len_alphabet1 + j] = self.o_automorphisms[i][1][j]
             self.automorphisms[i * self.len_alphabet1 + self.len_alphabet] = self.stop
+        
+        self.letter_bits = 1
+        while (1 << self.letter_bits) < self.len_alphabet:
+            self.letter_bits += 1
+        self.max_packed_length = 63 // self.letter_bits
     
     def __reduce__(self):
         return (self.__class__, (self.alphabet, self.o_inverse, self.longest_relator, self.find_balanced_relators_FSM, self.bad_prefix_FSM, self.simpler_FSM, self.o_automorphisms))
@@ -108,6 +134,22 @@ cdef class FirstInClass:
         free(self.missing)
         free(self.automorphisms)
     
+    def statistics(self):
+        ''' Return a dictionary counting how often is_first has finished in each way, and the number of equivalent words it has visited. '''
+        cdef int i
+        stats = dict()
+        for i, kind in enumerate(['word', 'prefix']):
+            for j, name in enumerate(['bad_prefix', 'beaten_by_automorph', 'simpler', 'beaten', 'exhausted', 'first']):
+                stats[f'{kind}.{name}'] = self.outcomes[i * FIC_OUTCOMES + j]
+            stats[f'{kind}.explored'] = self.explored[i]
+        return stats
+    
+    def reset_statistics(self):
+        cdef int i
+        for i in range(2 * FIC_OUTCOMES):
+            self.outcomes[i] = 0
+        self.explored[0] = self.explored[1] = 0
+    
     cdef bint c_before_automorphs(self, IWord& word, IWord& next_word, bint prefix, int* tmp):
         ''' Return whether word is before all cyclic permutations of all automorphs of next_word and next_word^-1.
         
@@ -163,6 +205,37 @@ cdef class FirstInClass:
         
         return True
 
+    cdef void c_reset_seen(self, int max_tree_size):
+        ''' Empty the seen set and queue, making room for max_tree_size words without growing. '''
+        cdef uint64_t capacity = 64
+        while max_tree_size > 0 and capacity < 2 * <uint64_t>(max_tree_size + 1):
+            capacity *= 2
+        self.seen_table.assign(capacity, EMPTY_SLOT)
+        self.seen_mask = capacity - 1
+        self.seen_count = 0
+        self.packed_queue.clear()
+    
+    cdef uint64_t c_find_slot(self, uint64_t key):
+        ''' Return the slot of the seen set that contains key or the empty slot where it should go. '''
+        cdef uint64_t slot = hash_key(key) & self.seen_mask
+        while self.seen_table[slot] != EMPTY_SLOT and self.seen_table[slot] != key:
+            slot = (slot + 1) & self.seen_mask  # Linear probing.
+        return slot
+    
+    cdef void c_insert_seen(self, uint64_t slot, uint64_t key):
+        ''' Insert key into the given slot (from c_find_slot), growing the table if it gets too full. '''
+        cdef vector[uint64_t] old_table
+        cdef uint64_t old_key
+        self.seen_table[slot] = key
+        self.seen_count += 1
+        if 2 * <uint64_t>self.seen_count > self.seen_mask:
+            old_table.swap(self.seen_table)
+            self.seen_table.assign(2 * old_table.size(), EMPTY_SLOT)
+            self.seen_mask = self.seen_table.size() - 1
+            for old_key in old_table:
+                if old_key != EMPTY_SLOT:
+                    self.seen_table[self.c_find_slot(old_key)] = old_key
+    
     def is_first(self, tuple word, bint prefix, int max_tree_size):
         ''' Determines if a word is lex first in its class.
         
@@ -174,8 +247,14 @@ cdef class FirstInClass:
         that u ~ v then uw ~ vw for all words w.
         
         This function is the heart of the grow phase, speed is critical here.'''
-
-        cdef IWord wrd = word
+        
+        return self.c_is_first(word, prefix, max_tree_size)
+    
+    cdef bint c_is_first(self, IWord& wrd, bint prefix, int max_tree_size, bint check_bad_prefix=True):
+        ''' The C-level implementation of is_first.
+        
+        The bad prefix test can be skipped by callers that already track bad_prefix_FSM along wrd. '''
+        
         cdef int len_word = wrd.size()  # Let's save some highly used data.
         cdef queue[IWord] to_do  # This is a deque of all words that have yet to be processed.
         cdef set[IWord] seen  # This records all words that we have seen.
@@ -185,31 +264,52 @@ cdef class FirstInClass:
         cdef int i, j, k, s
         cdef int len_replace
         
+        # Short words are packed into integers and tracked in self.seen_table / self.packed_queue instead.
+        cdef bint packed = len_word <= self.max_packed_length
+        cdef size_t head = 0
+        cdef uint64_t key, slot = 0
+        
         cdef int l = len_word + (1 if prefix else 0)
         cdef int nl = len_word + (1 if not prefix else 0)
         cdef int len_word_relators = len_word if prefix else len_word + self.longest_relator
+        cdef int outcome = FIC_OUTCOMES if prefix else 0  # Offset into self.outcomes.
+        cdef long processed = 0
         
         # Scratch memory for automorphism testing.
         cdef int* tmp = <int *> calloc(8*l, sizeof(int))
         
         try:
             # If it contains any bad prefix or simplification then it can be (trivially) made better.
-            if self.bad_prefix_FSM.c_hit(wrd):
+            if check_bad_prefix and self.bad_prefix_FSM.c_hit(wrd):
+                self.outcomes[outcome + FIC_BAD_PREFIX] += 1
                 return False
             
             # There is no point in testing whether simpler_FSM hits word already since word ended in next_good_suffix.
             # Check to see if our original word beats itself.
             if not self.c_before_automorphs(wrd, wrd, prefix, tmp):
+                self.outcomes[outcome + FIC_BEATEN_BY_AUTOMORPH] += 1
                 return False
             
-            seen.insert(wrd)
-            to_do.push(wrd)
+            if packed:
+                self.c_reset_seen(max_tree_size)
+                key = pack(wrd, self.letter_bits)
+                self.c_insert_seen(self.c_find_slot(key), key)
+                self.packed_queue.push_back(key)
+                reached.resize(len_word)
+            else:
+                seen.insert(wrd)
+                to_do.push(wrd)
             
             next_wrd.resize(len_word)
             
-            while not to_do.empty():  # Keep going while there are still unprocessed words in the queue.
-                reached = to_do.front()
-                to_do.pop()  # Get the next equivalent word to check.
+            while (head < self.packed_queue.size()) if packed else (not to_do.empty()):  # Keep going while there are still unprocessed words in the queue.
+                if packed:
+                    unpack(self.packed_queue[head], reached, self.letter_bits)
+                    head += 1
+                else:
+                    reached = to_do.front()
+                    to_do.pop()  # Get the next equivalent word to check.
+                processed += 1
                 returns = self.find_balanced_relators_FSM.c_hits(reached, run=len_word_relators)
                 for i in range(int(returns.size())):
                     b = returns[i].first
@@ -226,24 +326,37 @@ cdef class FirstInClass:
                         k += 1
                         if k == len_word: k = 0
                     
-                    if seen.count(next_wrd) != 0: continue  # Only consider new words.
+                    if packed:
+                        key = pack(next_wrd, self.letter_bits)
+                        slot = self.c_find_slot(key)
+                        if self.seen_table[slot] == key: continue  # Only consider new words.
+                    elif seen.count(next_wrd) != 0: continue  # Only consider new words.
                     
-                    # Test for trivial simplifications.
-                    if self.simpler_FSM.c_hit(next_wrd, run=nl):
+                    # Test for trivial simplifications. Simpler words longer than the word would overlap themselves when read cyclically.
+                    if self.simpler_FSM.c_hit(next_wrd, run=nl, longest=len_word):
+                        self.outcomes[outcome + FIC_SIMPLER] += 1
                         return False
                     
                     if not self.c_before_automorphs(wrd, next_wrd, prefix, tmp):
+                        self.outcomes[outcome + FIC_BEATEN] += 1
                         return False
                     
-                    s = seen.size()
+                    s = self.seen_count if packed else seen.size()
                     if s == max_tree_size:  # If we've hit the max_tree_size then give up.
+                        self.outcomes[outcome + FIC_EXHAUSTED] += 1
                         return True
                     
                     # Add it to the reachable word list.
-                    seen.insert(next_wrd)
-                    to_do.push(next_wrd)
+                    if packed:
+                        self.c_insert_seen(slot, key)
+                        self.packed_queue.push_back(key)
+                    else:
+                        seen.insert(next_wrd)
+                        to_do.push(next_wrd)
             
+            self.outcomes[outcome + FIC_FIRST] += 1
             return True
         finally:
+            self.explored[1 if prefix else 0] += processed
             free(tmp)
 
@@ -0,0 +1,192 @@
+# distutils: language = c++
+
+cimport cython
+from libc.math cimport sqrt
+from libc.stdint cimport int64_t
+from libcpp.vector cimport vector
+
+from bundler.extensions.FSM cimport IWord
+
+cdef extern from *:
+    ctypedef long long int128 "__int128"
+
+# Entries, and the minors met while taking determinants, are only computed in int64 while they are known to stay below this.
+cdef double EXACT_BOUND = 2.0**62
+
+@cython.cdivision(True)
+cdef int64_t bareiss(int64_t* M, int n):
+    ''' Return the determinant of the n x n matrix M, overwriting M, by fraction-free Gaussian elimination.
+    
+    Every entry met is a minor of M, so this is exact provided these are all less than 2**63. '''
+    cdef int64_t sign = 1, previous = 1, tmp
+    cdef int i, j, k, pivot
+    if n == 0: return 1
+    for k in range(n - 1):
+        if M[k * n + k] == 0:
+            pivot = k + 1
+            while pivot < n and M[pivot * n + k] == 0: pivot += 1
+            if pivot == n: return 0
+            for j in range(n):
+                tmp = M[k * n + j]
+                M[k * n + j] = M[pivot * n + j]
+                M[pivot * n + j] = tmp
+            sign = -sign
+        for i in range(k + 1, n):
+            for j in range(k + 1, n):
+                M[i * n + j] = <int64_t>((<int128>M[i * n + j] * M[k * n + k] - <int128>M[i * n + k] * M[k * n + j]) // previous)
+        previous = M[k * n + k]
+    return sign * M[n * n - 1]
+
+def exact_product(list matrices, word):
+    ''' Return the product of matrices along word, using Python integers. '''
+    n = len(matrices[0]) if matrices else 0
+    A = [[int(i == j) for j in range(n)] for i in range(n)]
+    for letter in word:
+        H = matrices[letter]
+        A = [[sum(int(H[i][k]) * A[k][j] for k in range(n)) for j in range(n)] for i in range(n)]
+    return A
+
+def exact_torsion(list matrices, word):
+    ''' Return |det(A - I)|, where A is the product of matrices along word, using Python integers throughout. '''
+    n = len(matrices[0]) if matrices else 0
+    A = exact_product(matrices, word)
+    M = [[A[i][j] - int(i == j) for j in range(n)] for i in range(n)]
+    sign, previous = 1, 1
+    for k in range(n - 1):
+        if M[k][k] == 0:
+            pivot = next((i for i in range(k + 1, n) if M[i][k] != 0), None)
+            if pivot is None: return 0
+            M[k], M[pivot] = M[pivot], M[k]
+            sign = -sign
+        for i in range(k + 1, n):
+            for j in range(k + 1, n):
+                M[i][j] = (M[i][j] * M[k][k] - M[i][k] * M[k][j]) // previous
+        previous = M[k][k]
+    return abs(sign * M[n - 1][n - 1]) if n else 1
+
+def characteristic_polynomial(A):
+    ''' Return the coefficients of det(xI - A), from the leading 1 down, by the Faddeev-LeVerrier algorithm.
+    
+    Each division is exact, so this stays in the integers when A does. '''
+    n = len(A)
+    coefficients = [1]
+    M = [[0] * n for _ in range(n)]
+    for k in range(1, n + 1):
+        M = [[sum(A[i][l] * M[l][j] for l in range(n)) + (coefficients[-1] if i == j else 0) for j in range(n)] for i in range(n)]
+        coefficients.append(-sum(A[i][l] * M[l][i] for i in range(n) for l in range(n)) // k)
+    return tuple(coefficients)
+
+cdef class Homology:
+    ''' The action of words on homology, for filtering words by the torsion of the homology of their mapping tori.
+    
+    The products of the matrices along every prefix of the last word are kept, like a StatePath, so words that
+    arrive in depth-first order, which share most of their letters with the word before, cost about one matrix
+    product each. The torsion |det(A - I)| is then found exactly with integer arithmetic. '''
+    cdef readonly list matrices
+    cdef int dim
+    cdef int alphabet_len
+    cdef vector[int64_t] letters  # letters[letter * dim * dim:(letter + 1) * dim * dim] is the matrix of letter.
+    cdef vector[double] growth  # The largest absolute row sum of the matrix of each letter.
+    cdef IWord word
+    cdef vector[int64_t] products  # products[k * dim * dim:(k + 1) * dim * dim] is the product along word[:k].
+    cdef vector[double] bounds  # bounds[k] bounds the entries of the kth product, which are only computed while this is below EXACT_BOUND.
+    cdef vector[int64_t] scratch
+    
+    def __init__(self, list matrices):
+        cdef int letter, i, j
+        self.matrices = [[[int(entry) for entry in row] for row in matrix] for matrix in matrices]
+        self.alphabet_len = len(self.matrices)
+        self.dim = len(self.matrices[0]) if self.matrices else 0
+        for letter in range(self.alphabet_len):
+            for i in range(self.dim):
+                for j in range(self.dim):
+                    self.letters.push_back(self.matrices[letter][i][j])
+            self.growth.push_back(max([sum(abs(entry) for entry in row) for row in self.matrices[letter]], default=0))
+        
+        for i in range(self.dim):
+            for j in range(self.dim):
+                self.products.push_back(i == j)
+        self.bounds.push_back(1)
+        self.scratch.resize(self.dim * self.dim)
+    
+    def __reduce__(self):
+        return (self.__class__, (self.matrices,))
+    
+    cdef void c_push(self, int letter):
+        ''' Extend the word by letter, so the new product is the matrix of letter times the last one. '''
+        cdef int d = self.dim, i, j, k
+        cdef size_t start = self.products.size() - d * d
+        cdef double bound = self.bounds.back() * self.growth[letter]
+        cdef int64_t total
+        self.word.push_back(letter)
+        self.bounds.push_back(bound)
+        for i in range(d):
+            for j in range(d):
+                total = 0
+                if bound < EXACT_BOUND:
+                    for k in range(d):
+                        total += self.letters[(letter * d + i) * d + k] * self.products[start + k * d + j]
+                self.products.push_back(total)
+    
+    cdef void c_sync(self, IWord& word):
+        ''' Update the products to follow word, keeping those of the prefix that it shares with the last word. '''
+        cdef int depth = 0, i
+        while depth < <int>word.size() and depth < <int>self.word.size() and word[depth] == self.word[depth]:
+            depth += 1
+        self.word.resize(depth)
+        self.bounds.resize(depth + 1)
+        self.products.resize((depth + 1) * self.dim * self.dim)
+        for i in range(depth, <int>word.size()):
+            self.c_push(word[i])
+    
+    cdef object c_torsion(self, IWord& word):
+        cdef int d = self.dim, i, j
+        cdef size_t start
+        cdef double hadamard = 1, norm
+        
+        self.c_sync(word)
+        if self.bounds.back() + 1 < EXACT_BOUND:
+            start = self.products.size() - d * d
+            for i in range(d):
+                norm = 0
+                for j in range(d):
+                    self.scratch[i * d + j] = self.products[start + i * d + j] - (i == j)
+                    norm += <double>self.scratch[i * d + j] * self.scratch[i * d + j]
+                hadamard *= max(sqrt(norm), 1)
+            if hadamard < EXACT_BOUND:
+                return abs(bareiss(self.scratch.data(), d))
+        
+        return exact_torsion(self.matrices, [word[i] for i in range(<int>word.size())])
+    
+    def torsion(self, tuple word):
+        ''' Return |det(A - I)|, where A is the action of word on homology. This is the order of the torsion of the homology of its mapping torus when non-zero. '''
+        return self.c_torsion(word)
+    
+    def characteristic_polynomial(self, tuple word):
+        ''' Return the coefficients of the characteristic polynomial of the action of word on homology, from the leading 1 down. '''
+        cdef IWord w = word
+        cdef int d = self.dim, i, j
+        cdef size_t start
+        self.c_sync(w)
+        if self.bounds.back() < EXACT_BOUND:
+            start = self.products.size() - d * d
+            A = [[self.products[start + i * d + j] for j in range(d)] for i in range(d)]
+        else:
+            A = exact_product(self.matrices, word)
+        return characteristic_polynomial(A)
+    
+    def torsions(self, words):
+        ''' Return the list of torsion(word) for each word of words.
+        
+        Words may also be the rows of a 2D array, such as those of storage.load_words, in which any letter
+        past the generators is padding. Words are best given in sorted order, so that each shares most of
+        its prefix with the one before. '''
+        cdef IWord word
+        results = []
+        for row in words:
+            word.clear()
+            for letter in row:
+                if letter >= self.alphabet_len: break
+                word.push_back(letter)
+            results.append(self.c_torsion(word))
+        return results
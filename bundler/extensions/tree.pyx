@@ -0,0 +1,409 @@
+# distutils: language = c++
+
+from cpython cimport array
+import array
+
+from libcpp.vector cimport vector
+from posix.time cimport clock_gettime, timespec, CLOCK_MONOTONIC
+
+import random
+
+from bundler.extensions.FSM cimport FSM, IWord, StatePath, TransitionMap
+from bundler.extensions.first cimport FirstInClass
+
+cdef enum:
+    VALID_WORD = 1
+    VALID_PREFIX = 2
+
+# Counters of how c_classify decided each word, in the order that it applies its tests.
+cdef enum:
+    COUNT_VISITED
+    COUNT_NOT_PRENECKLACE
+    COUNT_BAD_PREFIX
+    COUNT_WORD_NOT_NECKLACE
+    COUNT_WORD_NOT_CNF
+    COUNT_WORD_CYCLE
+    COUNT_WORD_FILTERED
+    COUNT_WORD_NOT_FIRST
+    COUNT_WORD_VALID
+    COUNT_PREFIX_NOT_STARTING
+    COUNT_PREFIX_TOO_FAR  # Too far from a cnf word to reach one by word_depth.
+    COUNT_PREFIX_NOT_FIRST
+    COUNT_PREFIX_VALID
+    NUM_COUNTS
+
+COUNT_NAMES = ['visited', 'not_prenecklace', 'bad_prefix', 'word.not_necklace', 'word.not_cnf', 'word.cycle', 'word.filtered', 'word.not_first', 'word.valid', 'prefix.not_starting', 'prefix.too_far', 'prefix.not_first', 'prefix.valid']
+
+# Timers of the expensive tests, only run when WordTree.timing is set.
+cdef enum:
+    TIME_CYCLE
+    TIME_FILTER
+    TIME_WORD_FIRST
+    TIME_PREFIX_FIRST
+    NUM_TIMES
+
+TIME_NAMES = ['word.cycle', 'word.filter', 'word.is_first', 'prefix.is_first']
+
+cdef inline double now():
+    cdef timespec t
+    clock_gettime(CLOCK_MONOTONIC, &t)
+    return t.tv_sec + 1e-9 * t.tv_nsec
+
+cdef bint in_subtree(IWord& word, IWord& prefix):
+    ''' Return whether word is a proper descendant of prefix. '''
+    cdef int i
+    if word.size() <= prefix.size(): return False
+    for i in range(<int>prefix.size()):
+        if word[i] != prefix[i]: return False
+    return True
+
+cdef class WordTree
+
+cdef class Tracker:
+    ''' The states of the machines that WordTree needs along a word, so extending the word by a letter costs O(1). '''
+    cdef StatePath cnf_path
+    cdef StatePath bad_prefix_path
+    cdef TransitionMap loop_map  # This one is updated lazily as it costs O(basic_search_range) per letter.
+    cdef int loop_stable  # The length of the prefix of the current word that loop_map follows.
+    # period[i] is the period of word[:i+1] as a prenecklace (the length of its longest Lyndon prefix), or 0 if it is not one.
+    cdef vector[int] period
+    
+    def __init__(self, WordTree tree):
+        self.cnf_path = StatePath(tree.cnf_FSM)
+        self.bad_prefix_path = StatePath(tree.FIC.bad_prefix_FSM)
+        self.loop_map = TransitionMap(tree.loop_invariant_FSM, tree.basic_search_range)
+        self.loop_stable = 0
+    
+    cdef void c_sync(self, IWord& word, int stable):
+        ''' Update the paths to follow word, assuming that only letters after word[:stable] have changed. '''
+        cdef int i, p
+        self.cnf_path.c_sync(word, stable)
+        self.bad_prefix_path.c_sync(word, stable)
+        if stable < self.loop_stable: self.loop_stable = stable
+        
+        # Extend the periods as in the FKM algorithm: a letter equal to word[i-p] keeps the period, a larger one makes
+        # word[:i+1] a Lyndon word and a smaller one means that it is not a prenecklace, and nor are its extensions.
+        if stable > <int>self.period.size(): stable = self.period.size()
+        self.period.resize(word.size())
+        for i in range(stable, <int>word.size()):
+            p = self.period[i-1] if i > 0 else 0
+            if i == 0 or (p > 0 and word[i] > word[i-p]):
+                p = i + 1
+            elif p > 0 and word[i] < word[i-p]:
+                p = 0
+            self.period[i] = p
+    
+    cdef bint c_prenecklace(self):
+        ''' Return whether the word is a prenecklace, that is, a prefix of a word that is no later than any of its rotations. '''
+        return self.period.empty() or self.period.back() > 0
+    
+    cdef bint c_necklace(self):
+        ''' Return whether the word is no later than any of its rotations. '''
+        return self.period.empty() or (self.period.back() > 0 and self.period.size() % self.period.back() == 0)
+    
+    cdef bint c_has_cycle(self, IWord& word):
+        ''' Return whether word has a cycle in the loop invariant FSM. '''
+        self.loop_map.c_sync(word, self.loop_stable)
+        self.loop_stable = word.size()
+        return self.loop_map.c_has_fixed_point()
+
+cdef class WordTree:
+    ''' Walks the tree of words described by a suffix tree, testing each word for validity.
+    
+    A suffix (a word of length at most suffix_depth) is encoded as the number whose base
+    (len(alphabet) + 1) digits are its letters + 1. This lets us store first_child and sibling as flat arrays. '''
+    cdef int alphabet_len
+    cdef int suffix_depth
+    cdef FSM cnf_FSM
+    cdef FSM loop_invariant_FSM
+    cdef FirstInClass FIC
+    cdef int basic_search_range
+    cdef int largest_class
+    cdef int largest_class_prefix
+    cdef bint necklaces  # Whether only necklaces can be first, because the identity is one of the automorphisms.
+    cdef object o_args
+    cdef readonly long visited  # The number of words visited by the last call to valid_suffixes.
+    cdef public bint timing  # Whether to time the tests in c_classify, which costs a little per test.
+    cdef long counts[NUM_COUNTS]
+    cdef double times[NUM_TIMES]
+    
+    cdef array.array valid_starting
+    cdef array.array first_child  # code |--> letter.
+    cdef array.array sibling  # code |--> letters, stored in blocks of suffix_depth.
+    cdef array.array sibling_len  # code |--> number of letters of sibling.
+    cdef array.array last_child  # code |--> whether suffix is a last child.
+    
+    def __init__(self, int alphabet_len, int suffix_depth, dict first_child, dict sibling, set last_children, FSM cnf_FSM, FSM loop_invariant_FSM, FirstInClass FIC, valid_starting_characters, int basic_search_range, int largest_class, int largest_class_prefix, bint necklaces):
+        cdef int size = (alphabet_len + 1)**suffix_depth
+        cdef int code, i
+        self.o_args = (alphabet_len, suffix_depth, first_child, sibling, last_children, cnf_FSM, loop_invariant_FSM, FIC, valid_starting_characters, basic_search_range, largest_class, largest_class_prefix, necklaces)
+        
+        self.alphabet_len = alphabet_len
+        self.suffix_depth = suffix_depth
+        self.cnf_FSM = cnf_FSM
+        self.loop_invariant_FSM = loop_invariant_FSM
+        self.FIC = FIC
+        self.basic_search_range = basic_search_range
+        self.largest_class = largest_class
+        self.largest_class_prefix = largest_class_prefix
+        self.necklaces = necklaces
+        
+        self.valid_starting = array.array('i', [1 if letter in valid_starting_characters else 0 for letter in range(alphabet_len)])
+        self.first_child = array.array('i', [-1] * size)
+        self.sibling = array.array('i', [-1] * (size * suffix_depth))
+        self.sibling_len = array.array('i', [0] * size)
+        self.last_child = array.array('i', [0] * size)
+        
+        for node, child in first_child.items():
+            self.first_child.data.as_ints[self.encode(node)] = child[0]
+        for node, next_node in sibling.items():
+            code = self.encode(node)
+            self.sibling_len.data.as_ints[code] = len(next_node)
+            for i in range(len(next_node)):
+                self.sibling.data.as_ints[code * suffix_depth + i] = next_node[i]
+        for node in last_children:
+            self.last_child.data.as_ints[self.encode(node)] = 1
+    
+    def __reduce__(self):
+        return (self.__class__, self.o_args, self.timing)
+    
+    def __setstate__(self, timing):
+        self.timing = timing
+    
+    def statistics(self):
+        ''' Return a dictionary of how many words each test of c_classify has decided (and, if timing, how long
+        the expensive tests took) since the last call to reset_statistics, including those of is_first. '''
+        stats = dict((name, self.counts[i]) for i, name in enumerate(COUNT_NAMES))
+        if self.timing:
+            stats.update((f'time.{name}', self.times[i]) for i, name in enumerate(TIME_NAMES))
+        stats.update((f'is_first.{name}', value) for name, value in self.FIC.statistics().items())
+        return stats
+    
+    def reset_statistics(self):
+        cdef int i
+        for i in range(NUM_COUNTS):
+            self.counts[i] = 0
+        for i in range(NUM_TIMES):
+            self.times[i] = 0
+        self.FIC.reset_statistics()
+    
+    def encode(self, tuple suffix):
+        cdef int code = 0
+        for letter in suffix:
+            code = code * (self.alphabet_len + 1) + letter + 1
+        return code
+    
+    cdef int c_encode(self, IWord& word):
+        ''' Return the code of the last (at most) suffix_depth letters of word. '''
+        cdef int code = 0
+        cdef int length = word.size()
+        cdef int i
+        for i in range(length - self.suffix_depth if length > self.suffix_depth else 0, length):
+            code = code * (self.alphabet_len + 1) + word[i] + 1
+        return code
+    
+    cdef int descend(self, IWord& word):
+        ''' Move word to its first child. Returns the length of the prefix of word that is unchanged. '''
+        word.push_back(self.first_child.data.as_ints[self.c_encode(word)])
+        return word.size() - 1
+    
+    cdef int backtrack(self, IWord& word):
+        ''' Move word to the next feasible vertex in the tree of words after its descendants (DFT).
+        Returns the length of the prefix of word that is unchanged. '''
+        cdef int code, i, k, start
+        cdef int stable = word.size()
+        while not word.empty():
+            code = self.c_encode(word)
+            k = self.suffix_depth if <int>word.size() > self.suffix_depth else word.size()
+            start = word.size() - k
+            if start < stable: stable = start
+            word.resize(start + self.sibling_len.data.as_ints[code])
+            for i in range(self.sibling_len.data.as_ints[code]):
+                word[start + i] = self.sibling.data.as_ints[code * self.suffix_depth + i]
+            if not self.last_child.data.as_ints[code]: break
+        
+        return stable
+    
+    cdef bint c_valid_prefix(self, IWord& word, int depth, Tracker tracker):
+        ''' Return whether the given word is a valid prefix.
+        
+        Assumes that tracker follows word and that word does not contain a bad prefix. '''
+        
+        cdef double start
+        cdef bint first
+        
+        if not self.valid_starting.data.as_ints[word[0]]:
+            self.counts[COUNT_PREFIX_NOT_STARTING] += 1
+            return False
+        if tracker.cnf_path.c_distance() > depth - <int>word.size():
+            self.counts[COUNT_PREFIX_TOO_FAR] += 1
+            return False
+        
+        if self.timing: start = now()
+        first = self.FIC.c_is_first(word, True, self.largest_class_prefix, False)
+        if self.timing: self.times[TIME_PREFIX_FIRST] += now() - start
+        if not first:
+            self.counts[COUNT_PREFIX_NOT_FIRST] += 1
+            return False
+        
+        self.counts[COUNT_PREFIX_VALID] += 1
+        return True
+    
+    cdef bint c_valid_word(self, IWord& word, object word_filter, Tracker tracker):
+        ''' Return whether the given word is valid.
+        
+        Assumes that tracker follows word and that word does not contain a bad prefix. '''
+        
+        cdef double start
+        cdef bint passed
+        
+        if not tracker.cnf_path.c_hit():
+            self.counts[COUNT_WORD_NOT_CNF] += 1
+            return False
+        
+        if self.timing: start = now()
+        passed = not tracker.c_has_cycle(word)
+        if self.timing: self.times[TIME_CYCLE] += now() - start
+        if not passed:
+            self.counts[COUNT_WORD_CYCLE] += 1
+            return False
+        
+        if word_filter is not None:
+            if self.timing: start = now()
+            passed = word_filter(tuple(word))
+            if self.timing: self.times[TIME_FILTER] += now() - start
+            if not passed:
+                self.counts[COUNT_WORD_FILTERED] += 1
+                return False
+        
+        if self.timing: start = now()
+        passed = self.FIC.c_is_first(word, False, self.largest_class, False)
+        if self.timing: self.times[TIME_WORD_FIRST] += now() - start
+        if not passed:
+            self.counts[COUNT_WORD_NOT_FIRST] += 1
+            return False
+        
+        self.counts[COUNT_WORD_VALID] += 1
+        return True
+    
+    cdef int c_classify(self, IWord& word, int word_depth, object word_filter, Tracker tracker):
+        ''' Return VALID_WORD and / or VALID_PREFIX (as flags) depending on whether word is a valid word and / or prefix. '''
+        cdef bint valid_word
+        
+        self.counts[COUNT_VISITED] += 1
+        # A word that is later than one of its rotations is beaten by itself under the identity automorphism. If it
+        # is not even a prenecklace then it is not a valid prefix either, and none of its descendants are necklaces.
+        if self.necklaces and not tracker.c_prenecklace():
+            self.counts[COUNT_NOT_PRENECKLACE] += 1
+            return 0
+        if tracker.bad_prefix_path.c_hit():  # Then word cannot be first in its class, nor can any of its descendants.
+            self.counts[COUNT_BAD_PREFIX] += 1
+            return 0
+        
+        if self.necklaces and not tracker.c_necklace():  # So skip straight to the (cheaper) prefix tests.
+            self.counts[COUNT_WORD_NOT_NECKLACE] += 1
+            valid_word = False
+        else:
+            valid_word = self.c_valid_word(word, word_filter, tracker)
+        if valid_word or self.c_valid_prefix(word, word_depth, tracker):
+            return (VALID_WORD if valid_word else 0) | VALID_PREFIX
+        
+        return 0
+    
+    def valid_suffixes(self, tuple prefix, int prefix_depth, int word_depth, word_filter=None, progress=None, int progress_rate=0, long max_nodes=-1):
+        ''' Returns two lists of words all of which begin with `prefix`:
+        - The first is the list of all valid words of length at most `prefix_depth`.
+        - The second is the list of all words of length `prefix_depth` that are valid prefixes of words of length `word_depth`.
+        
+        Words are returned as tuples of letters. If given, word_filter(word) must also be True for a
+        word to be valid and progress(word) is called once every progress_rate words visited.
+        
+        If max_nodes >= 0 then after visiting that many words we stop going deeper. Instead, every valid
+        prefix that we would have gone deeper from is added to the second list. So the remainder of the
+        subtree is exactly the union of the subtrees below the (now shorter) prefixes in the second list.
+        
+        Note we require that len(prefix) < depth <= word_depth. '''
+        
+        cdef IWord word = prefix
+        cdef IWord c_prefix = prefix
+        cdef int length, stable, flags
+        cdef long count = 0
+        cdef bint splitting = False
+        cdef Tracker tracker = Tracker(self)
+        
+        output_words = []
+        output_prefixes = []
+        
+        word.reserve(word_depth + self.suffix_depth)
+        stable = self.descend(word)
+        while not word.empty() and in_subtree(word, c_prefix):
+            tracker.c_sync(word, stable)
+            
+            count += 1
+            if progress is not None and progress_rate > 0 and count % progress_rate == 0: progress(tuple(word))
+            if count == max_nodes: splitting = True
+            
+            # Testing validity is the slowest bit.
+            length = word.size()
+            flags = self.c_classify(word, word_depth, word_filter, tracker)
+            
+            if flags & VALID_WORD: output_words.append(tuple(word))
+            if flags & VALID_PREFIX and (length == prefix_depth or (splitting and length < prefix_depth)): output_prefixes.append(tuple(word))
+            
+            if flags & VALID_PREFIX and length < prefix_depth and not splitting:  # Go deeper.
+                stable = self.descend(word)
+            else:
+                stable = self.backtrack(word)
+        
+        self.visited = count
+        return output_words, output_prefixes
+    
+    def estimate(self, tuple prefix, int word_depth, int samples, word_filter=None, rng=None):
+        ''' Estimate the shape of the subtree of words below prefix that valid_suffixes(prefix, word_depth, word_depth) visits.
+        
+        Uses Knuth's estimator: each sample walks a random path down the tree, choosing uniformly among the
+        children that valid_suffixes would go deeper from, and weights what it sees at each level by the
+        product of the numbers of choices made above it.
+        
+        Returns two lists, indexed by length, of the expected number of words visited and of valid prefixes. '''
+        
+        cdef IWord word
+        cdef IWord parent
+        cdef int length, stable, flags, choices
+        cdef double weight
+        cdef Tracker tracker
+        cdef vector[int] expandable  # The last letters of the children that we could go deeper from.
+        
+        if rng is None: rng = random.Random()
+        nodes = [0.0] * (word_depth + 1)
+        prefixes = [0.0] * (word_depth + 1)
+        
+        for _ in range(samples):
+            parent = prefix
+            tracker = Tracker(self)
+            weight = 1.0
+            while <int>parent.size() < word_depth:
+                length = parent.size() + 1
+                expandable.clear()
+                
+                # Visit all of the children of parent, in the same way that valid_suffixes does.
+                word = parent
+                stable = self.descend(word)
+                while in_subtree(word, parent) and <int>word.size() == length:
+                    tracker.c_sync(word, stable)
+                    flags = self.c_classify(word, word_depth, word_filter, tracker)
+                    nodes[length] += weight
+                    if flags & VALID_PREFIX:
+                        prefixes[length] += weight
+                        if length < word_depth: expandable.push_back(word[length - 1])
+                    stable = self.backtrack(word)
+                
+                choices = expandable.size()
+                if choices == 0: break
+                
+                # Go deeper from a random expandable child.
+                parent.push_back(expandable[rng.randrange(choices)])
+                weight *= choices
+                tracker.c_sync(parent, length - 1)
+        
+        return [count / samples for count in nodes], [count / samples for count in prefixes]
@@ -0,0 +1,146 @@
+''' Finding words that are beaten by an equal, but better, word of the mapping class group.
+
+Two words are taken to be the same mapping class when they send the triangulation, as a lamination, to the same
+place and act in the same way on homology. find_bad searches outwards from the identity, a level of words at a
+time, and records which words are beaten. Applying the actions is the slow part, so each level can be spread
+over a Pool, while the (cheap) comparisons are made in the same order as a serial search would, so the result
+does not depend on the number of workers.
+
+WordGenerator uses this to build its pruning FSMs to a small length. mine_relators goes deeper, offline, and
+saves the words and relators it finds so that WordGenerator can load them (see Options.relators). '''
+
+import hashlib
+import json
+import os
+
+import curver
+
+EMPTY_TUPLE = tuple()
+
+class MappingClasses():
+    ''' The actions of the generators of a surface on (lamination, homology) states. '''
+    def __init__(self, surface_name, letter_generators):
+        self.surface_name = surface_name
+        self.letter_generators = letter_generators
+        self.surface = curver.load(surface_name)
+        self.actions = [self.surface(generator) for generator in letter_generators]
+        self.homology = [action.homology_matrix() for action in self.actions]
+    
+    def __reduce__(self):
+        return (self.__class__, (self.surface_name, self.letter_generators))
+    
+    def identity(self):
+        return (self.surface.triangulation.as_lamination(), self.surface('').homology_matrix())
+    
+    def apply(self, letter, state):
+        ''' Return the state reached by applying the given letter to state. '''
+        lamination, homology = state
+        return (self.actions[letter](lamination), self.homology[letter].dot(homology))
+
+def key(state):
+    ''' Return a short digest of state, so that the table of best words stays small. '''
+    lamination, homology = state
+    return hashlib.blake2b(repr((lamination.geometric, homology.flatten().tolist())).encode(), digest_size=16).digest()
+
+# Pool workers are given the MappingClasses once, when they start.
+WORKER_CLASSES = None
+
+def initialise_worker(classes):
+    global WORKER_CLASSES
+    WORKER_CLASSES = classes
+
+def expand(classes, tasks):
+    ''' Return [(word, key, state)] for word = (letter,) + g, for each (g, state, letters) of tasks and letter of letters. '''
+    return [((letter,) + g, key(child), child) for g, state, letters in tasks for letter in letters for child in [classes.apply(letter, state)]]
+
+def expand_in_worker(tasks):
+    return expand(WORKER_CLASSES, tasks)
+
+def find_bad(classes, length, comparison, pool=None, chunksize=1000):
+    ''' Return the words of length at most length that are beaten, under comparison, by an equal word, and the balanced relators found.
+    
+    comparison(a, b) must be True only when len(a) <= len(b), as it is for shortlex orders. Words are only extended
+    while they are the best of their mapping class. The balanced relators map a beaten word to a word of the same
+    length that beat it. If given, the actions are applied over pool. '''
+    letters = list(range(len(classes.letter_generators)))
+    best = {key(classes.identity()): EMPTY_TUPLE}  # mapping class |--> best word.
+    bad = set()  # word such that comparison(best[word], word)
+    balanced = dict()
+    level = [(EMPTY_TUPLE, classes.identity())]
+    while level:
+        # A word (letter,) + g is never extended, nor compared, if one of its proper prefixes is bad. Only words of the
+        # next length can become bad while this level is processed, so this can be decided for the whole level now.
+        tasks = [(g, state, [letter for letter in letters if not any((letter,) + g[:i] in bad for i in range(len(g)))]) for g, state in level]
+        tasks = [task for task in tasks if task[2]]
+        if pool is None:
+            children = expand(classes, tasks)
+        else:
+            blocks = [tasks[start:start + chunksize] for start in range(0, len(tasks), chunksize)]
+            children = [child for block in pool.map(expand_in_worker, blocks) for child in block]
+        
+        next_level = []
+        for word, word_key, state in children:
+            if word_key in best:
+                # Can be neither, but can't be both.
+                if comparison(best[word_key], word):
+                    bad.add(word)
+                    if len(best[word_key]) == len(word): balanced[word] = best[word_key]
+                elif comparison(word, best[word_key]):
+                    bad.add(best[word_key])
+                    if len(best[word_key]) == len(word): balanced[best[word_key]] = word
+                    best[word_key] = word
+                    if len(word) < length: next_level.append((word, state))  # Search deeper.
+            else:  # Element not seen yet.
+                best[word_key] = word
+                if len(word) < length: next_level.append((word, state))  # Search deeper.
+        
+        level = [(word, state) for word, state in next_level if word not in bad]
+    
+    return bad, balanced
+
+def shorter(a, b):
+    return len(a) < len(b)
+
+def shortlex(a, b):
+    return (len(a), a) < (len(b), b)
+
+def mine_relators(surface_name, letter_generators, length, pool=None, chunksize=1000):
+    ''' Return a dictionary of the words that simpler_FSM and bad_prefix_FSM should detect, and the balanced relators, to the given length. '''
+    classes = MappingClasses(surface_name, letter_generators)
+    simpler, _ = find_bad(classes, length, shorter, pool, chunksize)
+    bad_prefix, balanced = find_bad(classes, length, shortlex, pool, chunksize)
+    return {'simpler': simpler, 'bad_prefix': bad_prefix, 'balanced': balanced}
+
+def save_relators(path, surface_name, letter_generators, length, relators):
+    ''' Save the output of mine_relators to path, with words written in letter_generators. '''
+    str_word = lambda word: ''.join(letter_generators[letter] for letter in word)
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w') as handle:
+        json.dump({
+            'surface': surface_name,
+            'generators': letter_generators,
+            'length': length,
+            'simpler': sorted(str_word(word) for word in relators['simpler']),
+            'bad_prefix': sorted(str_word(word) for word in relators['bad_prefix']),
+            'balanced': sorted([str_word(a), str_word(b)] for a, b in relators['balanced'].items()),
+            }, handle, indent=0)
+
+def load_relators(path, surface_name, letter_generators):
+    ''' Return the relators saved at path, which must have been mined for the given surface and generators. '''
+    with open(path) as handle:
+        saved = json.load(handle)
+    if (saved['surface'], saved['generators']) != (surface_name, letter_generators):
+        raise ValueError(f'{path} holds relators of {saved["surface"]} with generators {saved["generators"]}, not of {surface_name} with generators {letter_generators}')
+    
+    lookup = dict((generator, letter) for letter, generator in enumerate(letter_generators))
+    repr_word = lambda word: tuple(lookup[generator] for generator in word)
+    return {
+        'simpler': set(repr_word(word) for word in saved['simpler']),
+        'bad_prefix': set(repr_word(word) for word in saved['bad_prefix']),
+        'balanced': dict((repr_word(a), repr_word(b)) for a, b in saved['balanced']),
+        }
+
+def relators_digest(path):
+    ''' Return a digest of the file at path, so that tables built from it can be cached. '''
+    with open(path, 'rb') as handle:
+        return hashlib.sha1(handle.read()).hexdigest()
@@ -0,0 +1,138 @@
+''' Compact binary formats for word lists and tables of properties.
+
+A word list is a single .npy file holding a (number of words) x (longest word) array of uint8 letters,
+using the indices of WordGenerator.letter_lookup and padded with PAD. A table is a directory holding one
+.npy file per column, with strings stored as fixed width bytes. Both are read back memory-mapped, so
+taking a block of rows neither parses nor copies the rest of the file. '''
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+PAD = 255
+WORD_DTYPE = np.uint8
+
+def pack_words(words, letter_lookup):
+    ''' Return the array of letters of the given list of str words. '''
+    lengths = np.fromiter((len(word) for word in words), dtype=np.int64, count=len(words))
+    width = int(lengths.max()) if len(words) else 0
+    table = np.full(256, PAD, dtype=WORD_DTYPE)
+    for generator, letter in letter_lookup.items():
+        table[ord(generator)] = letter
+    
+    packed = np.full((len(words), width), PAD, dtype=WORD_DTYPE)
+    packed[np.arange(width) < lengths[:, None]] = table[np.frombuffer(''.join(words).encode('ascii'), dtype=np.uint8)]  # Row major, like the join.
+    return packed
+
+def unpack_words(packed, generators):
+    ''' Return the list of str words in the given array of letters. '''
+    packed = np.asarray(packed)
+    if not packed.size:
+        return [''] * len(packed)
+    table = np.zeros(256, dtype=np.uint8)
+    table[:len(generators)] = np.frombuffer(generators.encode('ascii'), dtype=np.uint8)  # PAD |--> '\0', which bytes strips.
+    return [word.decode('ascii') for word in np.ascontiguousarray(table[packed]).view(f'S{packed.shape[1]}')[:, 0]]
+
+def save_array(path, array):
+    ''' Atomically save array to path, so that a file that exists is always complete. '''
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as handle:
+        np.save(handle, array)
+    os.replace(tmp_path, path)
+
+def save_words(path, words, letter_lookup):
+    save_array(path, pack_words(words, letter_lookup))
+
+def load_words(path):
+    ''' Return the array of letters stored at path, memory-mapped. '''
+    return np.load(path, mmap_mode='r')
+
+def concatenate_words(output_path, paths):
+    ''' Write the word lists at paths into a single word list at output_path, one block at a time. '''
+    parts = [load_words(path) for path in paths]
+    shape = (sum(len(part) for part in parts), max((part.shape[1] for part in parts), default=0))
+    tmp_path = f'{output_path}.{os.getpid()}.tmp'
+    output = np.lib.format.open_memmap(tmp_path, mode='w+', dtype=WORD_DTYPE, shape=shape)
+    output[:] = PAD
+    start = 0
+    for part in parts:
+        output[start:start + len(part), :part.shape[1]] = part
+        start += len(part)
+    output.flush()
+    del output
+    os.replace(tmp_path, output_path)
+    return shape[0]
+
+def column_array(column, dtype=None):
+    ''' Return a numpy array of the given dtype holding the given column of a DataFrame.
+    
+    Strings are encoded as fixed width bytes, with missing values as empty strings. '''
+    if dtype is None or np.dtype(dtype).kind == 'S':
+        array = column.fillna('').astype(str).str.encode('utf-8').to_numpy(dtype=bytes)
+        return array.astype(dtype) if dtype is not None else array
+    return column.to_numpy(dtype=dtype)
+
+def string_width(column):
+    ''' Return the number of bytes needed to store the longest string in the given column of a DataFrame. '''
+    return max(column_array(column).dtype.itemsize, 1)
+
+class TableWriter():
+    ''' Write a table, one block of rows at a time, into a directory of columns.
+    
+    The number of rows and the dtypes of the columns (including the widths of string columns) must be given
+    up front, so callers make a first pass over their blocks to find them. '''
+    def __init__(self, directory, dtypes, rows):
+        self.directory = directory
+        self.tmp_directory = f'{directory}.{os.getpid()}.tmp'
+        os.makedirs(self.tmp_directory, exist_ok=True)
+        self.columns = dict((name, np.lib.format.open_memmap(os.path.join(self.tmp_directory, f'{name}.npy'), mode='w+', dtype=dtype, shape=(rows,))) for name, dtype in dtypes.items())
+        self.start = 0
+    
+    def write(self, table):
+        for name, column in self.columns.items():
+            column[self.start:self.start + len(table)] = column_array(table[name], column.dtype)
+        self.start += len(table)
+    
+    def close(self):
+        for column in self.columns.values():
+            column.flush()
+        with open(os.path.join(self.tmp_directory, 'columns.json'), 'w') as handle:
+            json.dump(list(self.columns), handle)
+        self.columns = dict()
+        
+        if os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                os.remove(os.path.join(self.directory, name))
+            os.rmdir(self.directory)
+        os.replace(self.tmp_directory, self.directory)
+
+def table_columns(directory):
+    with open(os.path.join(directory, 'columns.json')) as handle:
+        return json.load(handle)
+
+def save_column(directory, name, column):
+    ''' Add (or replace) a single column of the table in directory. '''
+    save_array(os.path.join(directory, f'{name}.npy'), column_array(pd.Series(column)) if not isinstance(column, np.ndarray) else column)
+    names = table_columns(directory)
+    if name not in names:
+        with open(os.path.join(directory, 'columns.json'), 'w') as handle:
+            json.dump(names + [name], handle)
+
+def load_column(directory, name):
+    ''' Return the given column of the table in directory, memory-mapped. Strings come back as bytes. '''
+    return np.load(os.path.join(directory, f'{name}.npy'), mmap_mode='r')
+
+def load_table(directory, columns=None, rows=slice(None)):
+    ''' Return a DataFrame of the given columns (default all) and rows of the table in directory.
+    
+    Empty strings are read back as missing, as they would be from a csv. '''
+    table = dict()
+    for name in columns if columns is not None else table_columns(directory):
+        column = load_column(directory, name)[rows]
+        if column.dtype.kind == 'S':
+            column = pd.Series(column).str.decode('utf-8').replace('', np.nan)
+        table[name] = column
+    return pd.DataFrame(table)
@@ -0,0 +1,103 @@
+''' A persistent store of the properties of surface bundles that is shared between experiments and runs.
+
+Entries are keyed by the surface and the least cyclic rotation of the word, since conjugate monodromies give
+the same bundle. Properties that have not been computed yet are stored as NULL. The store is an SQLite database in WAL mode so that every worker of a Pool can read and
+write it at once: lookups only read it, and only the writes wait for each other. When it grows past max_size
+entries the (approximately) least recently used ones are evicted. The number of
+entries is kept up to date by triggers, so that checking it does not scan the table. '''
+
+import os
+import sqlite3
+import time
+
+STORE_VERSION = 2  # Bump this whenever FIELDS change.
+FIELDS = ('hyperbolic', 'loadable', 'volume', 'homology', 'tri_isosig', 'isom_sig', 'num_sym', 'ab_sym')
+BOOLEAN_FIELDS = ('hyperbolic', 'loadable')  # SQLite gives these back as integers.
+TABLE = f'properties_v{STORE_VERSION}'
+BUSY_TIMEOUT = 600  # Seconds to wait for another process to finish writing.
+
+def canonical(word):
+    ''' Return the least cyclic rotation of word. '''
+    return min((word[i:] + word[:i] for i in range(len(word))), default=word)
+
+class PropertiesStore():
+    def __init__(self, path, max_size=0):
+        self.path = path
+        self.max_size = max_size  # 0 for unlimited.
+        self._connection = None  # Opened lazily so that the store can be handed to worker processes.
+        self._used = set()  # (surface, key) of the entries found by get that have not been marked as used yet.
+    
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state['_connection'] = None
+        return state
+    
+    @property
+    def connection(self):
+        if self._connection is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            self._connection = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT, isolation_level=None)
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute('PRAGMA synchronous=NORMAL')
+            self._connection.execute(f'CREATE TABLE IF NOT EXISTS {TABLE} (surface TEXT, word TEXT, {", ".join(FIELDS)}, last_used REAL, PRIMARY KEY (surface, word))')
+            self._connection.execute(f'CREATE INDEX IF NOT EXISTS {TABLE}_last_used ON {TABLE} (last_used)')
+            with self._connection:
+                self._connection.execute('BEGIN IMMEDIATE')
+                self._connection.execute(f'CREATE TABLE IF NOT EXISTS {TABLE}_size (size INTEGER)')
+                if self._connection.execute(f'SELECT COUNT(*) FROM {TABLE}_size').fetchone()[0] == 0:  # Only counted once, when the store is made.
+                    self._connection.execute(f'INSERT INTO {TABLE}_size SELECT COUNT(*) FROM {TABLE}')
+                self._connection.execute(f'CREATE TRIGGER IF NOT EXISTS {TABLE}_insert AFTER INSERT ON {TABLE} BEGIN UPDATE {TABLE}_size SET size = size + 1; END')
+                self._connection.execute(f'CREATE TRIGGER IF NOT EXISTS {TABLE}_delete AFTER DELETE ON {TABLE} BEGIN UPDATE {TABLE}_size SET size = size - 1; END')
+        return self._connection
+    
+    def get(self, surface, words):
+        ''' Return a dictionary mapping each of the given words that is in the store to a dictionary of its properties.
+        
+        The lookups only read the store, so they never wait for a writer. The entries found are marked as used if the
+        store is not locked right now and otherwise by the next put, so the order they are evicted in is approximate. '''
+        keys = dict((word, canonical(word)) for word in words)
+        
+        found = dict()
+        with self.connection:
+            self.connection.execute('BEGIN')  # A read transaction, so that every lookup sees the same snapshot.
+            for word, key in keys.items():
+                row = self.connection.execute(f'SELECT {", ".join(FIELDS)} FROM {TABLE} WHERE surface = ? AND word = ?', (surface, key)).fetchone()
+                if row is not None:
+                    found[word] = dict((field, bool(value) if field in BOOLEAN_FIELDS else value) for field, value in zip(FIELDS, row))
+        
+        self._used.update((surface, keys[word]) for word in found)
+        if self._used:
+            self.connection.execute('PRAGMA busy_timeout = 0')
+            try:
+                with self.connection:
+                    self.connection.execute('BEGIN IMMEDIATE')
+                    self.mark_used(time.time())
+            except sqlite3.OperationalError:  # Another process is writing, so leave them for the next put.
+                pass
+            finally:
+                self.connection.execute(f'PRAGMA busy_timeout = {BUSY_TIMEOUT * 1000}')
+        
+        return found
+    
+    def mark_used(self, now):
+        ''' Set the last_used time of the entries found by get since they were last marked, inside a write transaction. '''
+        self.connection.executemany(f'UPDATE {TABLE} SET last_used = ? WHERE surface = ? AND word = ?', ((now, surface, key) for surface, key in self._used))
+        self._used.clear()
+    
+    def put(self, surface, items):
+        ''' Store the properties of each (word, properties) pair in items and then evict old entries if needed.
+        
+        Properties may contain only some of FIELDS, the others keep any value that they already have. '''
+        now = time.time()
+        with self.connection:
+            self.connection.execute('BEGIN IMMEDIATE')
+            self.mark_used(now)
+            self.connection.executemany(
+                f'INSERT INTO {TABLE} VALUES (?, ?, {", ".join("?" for _ in FIELDS)}, ?) '
+                f'ON CONFLICT (surface, word) DO UPDATE SET {", ".join(f"{field} = COALESCE(excluded.{field}, {field})" for field in FIELDS)}, last_used = excluded.last_used',
+                ((surface, canonical(word)) + tuple(properties.get(field) for field in FIELDS) + (now,) for word, properties in items),
+                )
+            if self.max_size > 0:
+                excess = self.connection.execute(f'SELECT size FROM {TABLE}_size').fetchone()[0] - self.max_size
+                if excess > 0:
+                    self.connection.execute(f'DELETE FROM {TABLE} WHERE rowid IN (SELECT rowid FROM {TABLE} ORDER BY last_used LIMIT ?)', (excess,))
@@ -1,14 +1,17 @@
 from collections import deque
 from itertools import permutations, product
-from queue import Queue
-from random import randint
+import random
 
 import curver
+import numpy as np
 
+from . import cache
+from .relators import MappingClasses, find_bad, load_relators, relators_digest, shorter, shortlex
 from .extensions import word_accepting_FSM, action_FSM, CNF_FSM
-from .extensions import FirstInClass
+from .extensions import FirstInClass, Homology, WordTree
 
 EMPTY_TUPLE = tuple()
+CACHED_FSMS = ['find_balanced_relators_FSM', 'simpler_FSM', 'bad_prefix_FSM', 'loop_invariant_FSM', 'cnf_FSM']
 
 class WordGenerator():
     # A generator is a string (of length one).
@@ -31,6 +34,48 @@ class WordGenerator():
         
         self.valid_starting_characters = set(letter for letter in self.generators if not any(all(term < letter for term in clause) for clause in self.MCG_must_contain))
         
+        self.curver_action = {letter: self.surfaces.curver(self.letter_generators[letter]) for letter in self.generators}
+        # For word filters that need the action on homology, see Homology.torsion.
+        self.homology = Homology([self.curver_action[letter].homology_matrix() for letter in self.generators])
+        
+        # Building the tables is slow so we try to load them from the cache first.
+        key = cache.cache_key(self.surfaces.name, self.letter_generators, self.letter_inverse_generators, MCG_automorphisms, MCG_must_contain, self.options.suffix_depth, self.options.loop_invariant_fsm_depth, *([relators_digest(self.options.relators)] if self.options.relators else []))
+        path = self.options.cache.format(key) if self.options.cache else None
+        arrays = cache.load(path, key) if path is not None else None
+        if arrays is not None:
+            if self.options.show_progress: print('Loading tables from cache.')
+            self.unpack_tables(arrays)
+        else:
+            self.build_tables()
+            if path is not None: cache.save(path, key, self.pack_tables())
+        
+        # Now construct a machine for determining whether a word is first in its class.
+        MCG_automorphisms = [automorphism.rpartition(':') for automorphism in MCG_automorphisms.split('|')]
+        self.FIC = FirstInClass(self.generators, self.inverse_lookup, self.longest_relator, self.find_balanced_relators_FSM, self.bad_prefix_FSM, self.simpler_FSM, [(list(self.repr_word(missing)), list(self.repr_word(output))) for missing, _, output in MCG_automorphisms])
+        # When the identity is an automorphism, a word is only first if it is first among its rotations.
+        necklaces = any(not missing and list(self.repr_word(output)) == self.generators for missing, _, output in MCG_automorphisms)
+        
+        # And the native engine that walks the suffix tree using all of these machines.
+        self.word_tree = WordTree(len(self.generators), self.options.suffix_depth, self.first_child, self.sibling, self.last_children, self.cnf_FSM, self.loop_invariant_FSM, self.FIC, self.valid_starting_characters, self.options.basic_search_range, self.options.largest_class, self.options.largest_class_prefix, necklaces)
+    
+    def pack_tables(self):
+        ''' Return a dictionary of flat arrays describing the tables built by build_tables. '''
+        arrays = {'longest_relator': np.array(self.longest_relator)}
+        for name in CACHED_FSMS:
+            arrays.update(cache.pack_FSM(name, getattr(self, name)))
+        arrays.update(cache.pack_suffix_tables(self.options.suffix_depth, self.first_child, self.sibling, self.last_children))
+        return arrays
+    
+    def unpack_tables(self, arrays):
+        ''' Restore the tables built by build_tables from the output of pack_tables. '''
+        self.longest_relator = int(arrays['longest_relator'])
+        for name in CACHED_FSMS:
+            setattr(self, name, cache.unpack_FSM(name, arrays))
+        self.first_child, self.sibling, self.last_children = cache.unpack_suffix_tables(arrays)
+    
+    def build_tables(self):
+        ''' Build the relator FSMs, pruning FSMs and the suffix tree tables. '''
+        
         # We find (some of) the major relators:
         if self.options.show_progress: print('Listing relators.')
         relators = []
@@ -73,63 +118,32 @@ class WordGenerator():
 
         relators = shuffle_relators(relators)
         balanced_relators = dict(relator for relator in relators if len(relator[0]) == len(relator[1]))
+        if self.options.relators:  # Mined, to a greater length, by scripts/mine_relators.py.
+            bad = load_relators(self.options.relators, self.surfaces.name, self.letter_generators)
+            for a, b in bad['balanced'].items():  # Every direction of these is a relator too, but the hand picked ones take precedence.
+                for x, y in [(a, b), (b, a), (self.inverse(a), self.inverse(b)), (self.inverse(b), self.inverse(a))]:
+                    balanced_relators.setdefault(x, y)
         self.find_balanced_relators_FSM = word_accepting_FSM(self.generators, balanced_relators, transform=balanced_relators.get)
         self.longest_relator = max(len(a) for a in balanced_relators)
         
         # Let's build some FSM to help us search for these faster.
-        self.curver_action = {letter: self.surfaces.curver(self.letter_generators[letter]) for letter in self.generators}
-        
-        def find_bad(length, comparison):
-            apply_action = lambda action, element: (action(element[0]), action.homology_matrix().dot(element[1]))
-            convert = lambda X: (X[0], tuple(X[1].flatten()))  # Since numpy.ndarrays are not hashable we need a converter.
-            
-            image = {EMPTY_TUPLE: (self.surfaces.curver.triangulation.as_lamination(), self.surfaces.curver('').homology_matrix())}  # word |--> image
-            best = {convert(image[EMPTY_TUPLE]): EMPTY_TUPLE}  # mapping class |--> best word.
-            bad = set()  # word such that comparison(best[word], word)
-            Q = Queue()
-            Q.put(EMPTY_TUPLE)
-            while not Q.empty():
-                g = Q.get()
-                if g in bad: continue
-                
-                for generator in self.generators:
-                    word = (generator,) + g
-                    if any(word[:i] in bad for i in range(1, len(word))): continue
-                    
-                    neighbour = apply_action(self.curver_action[generator], image[g])
-                    key = convert(neighbour)
-                    if key in best:
-                        # Can be neither, but can't be both.
-                        if comparison(best[key], word):
-                            bad.add(word)
-                            # best[key] = best[key]
-                        elif comparison(word, best[key]):
-                            bad.add(best[key])
-                            best[key] = word
-                            if len(word) < length:  # Seach deeper.
-                                image[word] = neighbour
-                                Q.put(word)
-                    else:  # element not seen yet.
-                        best[key] = word
-                        if len(word) < length:  # Seach deeper.
-                            image[word] = neighbour
-                            Q.put(word)
-            
-            return bad
+        if not self.options.relators:
+            if self.options.show_progress: print('Finding bad words')
+            classes = MappingClasses(self.surfaces.name, self.letter_generators)
+            bad = {
+                'simpler': find_bad(classes, length=5, comparison=shorter)[0],
+                'bad_prefix': find_bad(classes, length=5, comparison=shortlex)[0],
+                }
         
         # Firstly, the simpler FSM detects relations whose output is shorter than its input.
         # Any word which contains one such input cannot be first_in_class.
         if self.options.show_progress: print('Building simpler FSM')
-        self.simpler_FSM = word_accepting_FSM(self.generators, find_bad(length=5, comparison=lambda a, b: len(a) < len(b)))
+        self.simpler_FSM = word_accepting_FSM(self.generators, bad['simpler'])
         
         # Secondly, the bad_prefix FSM detects relations whose output is earlier than its input.
         # These cannot appear in any first_in_class word or prefix.
         if self.options.show_progress: print('Building bad_prefix FSM')
-        self.bad_prefix_FSM = word_accepting_FSM(self.generators, find_bad(length=5, comparison=lambda a, b: (len(a), a) < (len(b), b)))
-        
-        # Now construct a machine for determining whether a word is first in its class.
-        MCG_automorphisms = [automorphism.rpartition(':') for automorphism in MCG_automorphisms.split('|')]
-        self.FIC = FirstInClass(self.generators, self.inverse_lookup, self.longest_relator, self.find_balanced_relators_FSM, self.bad_prefix_FSM, self.simpler_FSM, [(list(self.repr_word(missing)), list(self.repr_word(output))) for missing, _, output in MCG_automorphisms])
+        self.bad_prefix_FSM = word_accepting_FSM(self.generators, bad['bad_prefix'])
         
         if self.options.show_progress: print('Building loop_invariant FSM')
         seeds = self.surfaces.curver.triangulation.edge_curves()
@@ -196,50 +210,37 @@ class WordGenerator():
         if not self.cnf_FSM.hit(word): return False
         if self.loop_invariant_FSM.has_cycle(word, self.options.basic_search_range): return False
         
-        if not self.word_filter(self, word): return False
+        if self.word_filter is not None and not self.word_filter(self, word): return False
         if not self.FIC.is_first(word, False, self.options.largest_class): return False
         
         return True
     
-    def valid_suffixes(self, prefix, prefix_depth, word_depth):
+    def valid_suffixes(self, prefix, prefix_depth, word_depth, max_nodes=-1):
         ''' Returns two lists of words all of which begin with `prefix`:
         - The first is the list of all valid words of length at most `prefix_depth`.
         - The second is the list of all words of length `prefix_depth` that are valid prefixes of words of length `word_depth`.
         
+        If max_nodes >= 0 then once that many words have been visited the rest of the subtree is split off
+        and the second list also contains the shorter valid prefixes that we did not go deeper from.
+        
         Note we require that len(prefix) < depth <= word_depth. '''
         
         prefix = self.repr_word(prefix)
         assert len(prefix) < prefix_depth <= word_depth
         
-        def backtrack(word):
-            ''' Gets the next feasible vertex in the tree of words based on suffix (DFT). '''
-            
-            while word:
-                suffix = word[-self.options.suffix_depth:]
-                word = word[:-self.options.suffix_depth] + self.sibling[suffix]
-                if suffix not in self.last_children: break
-            
-            return word
+        word_filter = (lambda word: self.word_filter(self, word)) if self.word_filter is not None else None
+        progress = (lambda word: print('\rTraversing word tree: %s          ' % self.str_word(word), end='')) if self.options.show_progress else None
         
-        output_words = []
-        output_prefixes = []
+        output_words, output_prefixes = self.word_tree.valid_suffixes(prefix, prefix_depth, word_depth, word_filter, progress, self.options.progress_rate, max_nodes)
         
-        prefix_len = len(prefix)
-        strn = prefix + self.first_child[prefix[-self.options.suffix_depth:]]
-        while strn and strn[:prefix_len] == prefix:
-            if self.options.show_progress and not randint(0, self.options.progress_rate): print('\rTraversing word tree: %s          ' % self.str_word(strn), end='')
-            
-            # Testing validity is the slowest bit.
-            strn_valid_word = self.valid_word(strn)
-            strn_valid_prefix = strn_valid_word or self.valid_prefix(strn, word_depth)
-            
-            if strn_valid_word: output_words.append(self.str_word(strn))
-            if strn_valid_prefix and len(strn) == prefix_depth: output_prefixes.append(self.str_word(strn))
-            
-            if strn_valid_prefix and len(strn) < prefix_depth:  # Go deeper.
-                strn += self.first_child[strn[-self.options.suffix_depth:]]
-            else:
-                strn = backtrack(strn)
+        return [self.str_word(word) for word in output_words], [self.str_word(word) for word in output_prefixes]
+    
+    def estimate(self, prefix, word_depth, samples, seed=None):
+        ''' Estimate, by random probes down the word tree, the work of finding all valid words of length at most word_depth that begin with `prefix`.
         
-        return output_words, output_prefixes
-
+        Returns two lists, indexed by length, of the expected number of words visited and of valid prefixes of each length. '''
+        
+        prefix = self.repr_word(prefix)
+        word_filter = (lambda word: self.word_filter(self, word)) if self.word_filter is not None else None
+        
+        return self.word_tree.estimate(prefix, word_depth, samples, word_filter, random.Random(seed))
@@ -0,0 +1 @@
+''' Makes generate and bundler importable by the tests in tests/ however py.test is run. '''
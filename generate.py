@@ -53,25 +53,37 @@ EXPERIMENTS = {
         }
 }
 
-def setup(**kwargs):
+def parse_bool(value):
+    ''' Since bool('False') == True. '''
+    return value.lower() in ('true', 't', 'yes', 'y', '1')
+
+def argument_parser():
+    ''' Return the parser of the experiment, depth and an option for each attribute of Options. '''
     parser = argparse.ArgumentParser(formatter_class=argparse.ArgumentDefaultsHelpFormatter)
     parser.add_argument('name', type=str, help='name of experiment to load')
     parser.add_argument('depth', type=int, help='depth to generate to')
-    parser.add_argument('--prebuilt', '-p', type=int, default=0, help='The amount of steps that have already been completed')
     for key, value in vars(Options()).items():
-        parser.add_argument('--{}'.format(key), default=value, type=value.__class__, help=' ')
-    args = parser.parse_args()
-    options = Options(**vars(args))
-    
+        parser.add_argument('--{}'.format(key), default=value, type=parse_bool if isinstance(value, bool) else value.__class__, help=' ')
+    return parser
+
+def census_generator(args, **kwargs):
+    ''' Return the CensusGenerator of the experiment named by args, with the options given by args. '''
     experiment = EXPERIMENTS[args.name]
-    G = CensusGenerator(
+    return CensusGenerator(
         experiment['surface'],
         experiment['generators'],
         experiment['automorphisms'],
         experiment['MCG_must_contain'],
         **kwargs,
-        options=options,
+        options=Options(**vars(args)),
         )
+
+def setup(**kwargs):
+    parser = argument_parser()
+    parser.add_argument('--prebuilt', '-p', type=int, default=0, help='The amount of steps that have already been completed')
+    args = parser.parse_args()
+    
+    G = census_generator(args, **kwargs)
     G.build_census(args.depth, args.prebuilt)
 
 if __name__ == '__main__':
@@ -0,0 +1,168 @@
+''' Benchmark the grow phase on every surface of generate.EXPERIMENTS.
+
+Each case walks the word tree below a fixed prefix to a fixed depth and times WordGenerator.valid_suffixes
+and the kernels that it spends its time in. Results are saved as JSON so that two commits can be compared:
+    $ python scripts/benchmark.py --output before.json
+    $ git checkout other && python setup.py build_ext --inplace
+    $ python scripts/benchmark.py --output after.json --compare before.json
+The comparison fails if any rate drops (or peak memory grows) by more than --threshold or if the words found
+for any case change, since a speedup must not change the census. '''
+
+from multiprocessing import get_context
+import argparse
+import hashlib
+import json
+import platform
+import resource
+import subprocess
+import sys
+import time
+import traceback
+
+from bundler.census_generator import CensusGenerator, Options
+from bundler.extensions.first import cyclic_ordered
+import generate
+
+# Experiment |--> (prefix, depth). Each grow takes a few seconds, once the tables of the larger surfaces are cached.
+CASES = {
+    'S_1_1': ('', 14),
+    'S_1_2': ('', 9),
+    'S_1_2p': ('', 10),
+    'S_1_3': ('', 6),
+    'S_2_1': ('', 8),
+    'S_3_1': ('', 7),
+    'S_4_1': ('ab', 9),
+    'S_5_1': ('abcd', 10),
+    }
+KERNEL_SAMPLE = 2000  # Max number of words that each kernel is timed on.
+KERNEL_SECONDS = 0.2  # Min time of each timing of a kernel, so that they are not lost in the noise.
+
+def best_time(function, repeat):
+    ''' Return the fastest of repeat runs of function() and its result. '''
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def best_rate(function, calls, repeat):
+    ''' Return the fastest number of calls per second of function(), which makes calls calls, over repeat timings of at least KERNEL_SECONDS. '''
+    best = 0
+    for _ in range(repeat):
+        start, runs = time.perf_counter(), 0
+        while time.perf_counter() - start < KERNEL_SECONDS:
+            function()
+            runs += 1
+        best = max(best, runs * calls / (time.perf_counter() - start))
+    return best
+
+def run_case(name, prefix, depth, repeat):
+    ''' Return the results of the benchmark of the given experiment.
+    
+    This runs in a fresh process so that the peak memory is that of this case alone. '''
+    experiment = generate.EXPERIMENTS[name]
+    options = Options(show_progress=False, report='', properties_store='')
+    start = time.perf_counter()
+    G = CensusGenerator(experiment['surface'], experiment['generators'], experiment['automorphisms'], experiment['MCG_must_contain'], options=options)
+    setup_time = time.perf_counter() - start
+    WG = G.word_generator
+    
+    seconds, (words, _) = best_time(lambda: WG.valid_suffixes(prefix, depth, depth), repeat)
+    nodes = WG.word_tree.visited
+    
+    # The kernels are timed on the words found, or as many of them as KERNEL_SAMPLE allows.
+    sample = [tuple(WG.letter_lookup[letter] for letter in word) for word in words[::max(len(words) // KERNEL_SAMPLE, 1)]]
+    kernels = {
+        'FSM.hit': lambda: [WG.bad_prefix_FSM.hit(word) for word in sample],
+        'FSM.hits': lambda: [WG.find_balanced_relators_FSM.hits(word, len(word) + WG.longest_relator) for word in sample],
+        'FSM.has_cycle': lambda: [WG.loop_invariant_FSM.has_cycle(word, options.basic_search_range) for word in sample],
+        'is_first.word': lambda: [WG.FIC.is_first(word, False, options.largest_class) for word in sample],
+        'is_first.prefix': lambda: [WG.FIC.is_first(word, True, options.largest_class_prefix) for word in sample],
+        'is_cyclic_ordered': lambda: [cyclic_ordered(word, word[1:] + word[:1]) for word in sample],
+        }
+    kernel_rates = dict((kernel, best_rate(function, len(sample), repeat)) for kernel, function in kernels.items()) if sample else dict()
+    
+    return {
+        'prefix': prefix,
+        'depth': depth,
+        'setup_seconds': setup_time,
+        'seconds': seconds,
+        'nodes': nodes,
+        'words': len(words),
+        'nodes_per_second': nodes / seconds,
+        'words_per_second': len(words) / seconds,
+        'peak_memory_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,  # ru_maxrss is in KiB on Linux.
+        'word_hash': hashlib.sha256('\n'.join(sorted(words)).encode('ascii')).hexdigest(),
+        'kernels_per_second': kernel_rates,
+        }
+
+def run_case_safely(name, prefix, depth, repeat):
+    try:
+        return run_case(name, prefix, depth, repeat)
+    except Exception:  # So that one surface that cannot be loaded does not stop the others.
+        return {'prefix': prefix, 'depth': depth, 'error': traceback.format_exc(limit=1).strip().splitlines()[-1]}
+
+def commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare(results, baseline, threshold):
+    ''' Return the list of problems with results when compared to baseline. '''
+    problems = []
+    for name, result in results.items():
+        old = baseline.get(name)
+        if old is None or 'error' in old or 'error' in result: continue
+        if (old['prefix'], old['depth']) != (result['prefix'], result['depth']):
+            print(f'{name}: skipped, the baseline is of a different case')
+            continue
+        if old['word_hash'] != result['word_hash']:
+            problems.append(f'{name}: the words found changed ({old["words"]} words --> {result["words"]} words)')
+        
+        rates = [(metric, old[metric], result[metric]) for metric in ['nodes_per_second', 'words_per_second']]
+        rates += [(kernel, old['kernels_per_second'].get(kernel), rate) for kernel, rate in result['kernels_per_second'].items()]
+        for metric, before, after in rates:
+            if not before or not after: continue
+            print(f'{name}: {metric:<20} {before:12.0f} --> {after:12.0f} ({after / before - 1:+.1%})')
+            if after < before * (1 - threshold):
+                problems.append(f'{name}: {metric} regressed by {1 - after / before:.1%}')
+        
+        before, after = old['peak_memory_mb'], result['peak_memory_mb']
+        print(f'{name}: {"peak_memory_mb":<20} {before:12.1f} --> {after:12.1f} ({after / before - 1:+.1%})')
+        if after > before * (1 + threshold):
+            problems.append(f'{name}: peak memory grew by {after / before - 1:.1%}')
+    
+    return problems
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    parser.add_argument('--output', type=str, default='benchmark.json', help='where to save the results')
+    parser.add_argument('--compare', type=str, default='', help='results of an earlier run to compare against')
+    parser.add_argument('--threshold', type=float, default=0.1, help='largest allowed relative regression')
+    parser.add_argument('--repeat', type=int, default=3, help='number of times to time each benchmark, the best is kept')
+    parser.add_argument('--only', type=str, nargs='*', default=list(CASES), help='the experiments to run')
+    args = parser.parse_args()
+    
+    results = dict()
+    for name in args.only:
+        prefix, depth = CASES.get(name, ('', 6))
+        with get_context('spawn').Pool(processes=1) as P:
+            results[name] = P.apply(run_case_safely, (name, prefix, depth, args.repeat))
+        result = results[name]
+        if 'error' in result:
+            print(f'{name}: failed, {result["error"]}')
+        else:
+            print(f'{name}: {result["nodes"]} nodes and {result["words"]} words in {result["seconds"]:.2f}s, {result["nodes_per_second"]:.0f} nodes/s, {result["words_per_second"]:.0f} words/s, {result["peak_memory_mb"]:.0f}MB')
+    
+    with open(args.output, 'w') as handle:
+        json.dump({'commit': commit(), 'python': platform.python_version(), 'repeat': args.repeat, 'results': results}, handle, indent=4)
+    
+    if args.compare:
+        with open(args.compare) as handle:
+            baseline = json.load(handle)['results']
+        problems = compare(results, baseline, args.threshold)
+        for problem in problems:
+            print(problem)
+        if problems: sys.exit(1)
@@ -1,16 +1,11 @@
 from math import gcd
-import numpy as np
 import argparse
-from sympy import Matrix
 
 import generate
 
 def presetup():
     def word_filter(self, word):
-        A = np.linalg.multi_dot([self.curver_action[letter].homology_matrix() for letter in word[::-1]])
-        M = Matrix(A - np.eye(A.shape[0], dtype=object))
-        homology_torsion = int(abs(M.det()))
-        return homology_torsion == 1
+        return self.homology.torsion(word) == 1
     
     def manifold_filter(self, M):
         M.set_peripheral_curves('shortest')
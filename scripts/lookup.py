@@ -0,0 +1,38 @@
+''' Find which census words give the given SnapPy manifolds.
+
+The index is built over the censuses folder (and any --add census.csv files) on first use and only the sources
+that have changed since are reread on later runs:
+    $ python scripts/lookup.py m140 s254
+    $ python scripts/lookup.py m140 --add output/census.csv --surface S_1_2 '''
+
+import argparse
+import os
+import time
+
+from snappy import Manifold
+
+from bundler.census_index import CensusIndex, census_sources
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    parser.add_argument('manifolds', type=str, nargs='*', help='names of snappy manifolds to look up')
+    parser.add_argument('--index', type=str, default='./cache/census_index', help='directory of the index')
+    parser.add_argument('--censuses', type=str, default=os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'censuses'), help='folder of published censuses to index')
+    parser.add_argument('--add', type=str, nargs='*', default=[], help='census.csv files written by generate.py to also index')
+    parser.add_argument('--surface', type=str, default=None, help='the surface of the --add censuses')
+    parser.add_argument('--volume_tolerance', type=float, default=1e-6, help='largest difference between volumes that match')
+    args = parser.parse_args()
+    
+    index = CensusIndex(args.index, args.volume_tolerance)
+    start = time.time()
+    rebuilt = index.update()
+    rebuilt += sum(index.add(path) for path in census_sources(args.censuses))
+    rebuilt += sum(index.add(path, args.surface) for path in args.add)
+    if rebuilt: print(f'Indexed {rebuilt} sources in {time.time() - start:.2f}s')
+    
+    for name in args.manifolds:
+        start = time.perf_counter()
+        matches = index.identify(Manifold(name))
+        print(f'{name}: {len(matches)} matches in {1000 * (time.perf_counter() - start):.1f}ms')
+        for row in matches.itertuples():
+            print(f'\t{row.surface}\t{row.word}\t{row.volume}\t{row.homology}\t{os.path.relpath(row.source)}')
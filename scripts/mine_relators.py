@@ -0,0 +1,25 @@
+from multiprocessing import Pool, cpu_count
+import argparse
+import time
+
+from bundler.relators import MappingClasses, initialise_worker, mine_relators, save_relators
+import generate
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    parser.add_argument('name', type=str, help='name of experiment to mine relators for')
+    parser.add_argument('length', type=int, help='longest words to search')
+    parser.add_argument('--output', type=str, default='./cache/relators_{}_{}.json', help='where to save the relators, formatted with the name and length')
+    parser.add_argument('--cores', type=int, default=0, help='number of processes to use, 0 for all of them')
+    parser.add_argument('--chunksize', type=int, default=200, help='number of words sent to a process at once')
+    args = parser.parse_args()
+    
+    experiment = generate.EXPERIMENTS[args.name]
+    start = time.time()
+    with Pool(processes=args.cores or cpu_count(), initializer=initialise_worker, initargs=(MappingClasses(experiment['surface'], experiment['generators']),)) as P:
+        relators = mine_relators(experiment['surface'], experiment['generators'], args.length, P, args.chunksize)
+    
+    path = args.output.format(args.name, args.length)
+    save_relators(path, experiment['surface'], experiment['generators'], args.length, relators)
+    print(f'Found {len(relators["simpler"])} simpler, {len(relators["bad_prefix"])} bad prefix words and {len(relators["balanced"])} balanced relators in {time.time() - start:.0f}s')
+    print(f'Saved to {path}, use it with: python generate.py {args.name} <depth> --relators {path}')
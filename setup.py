@@ -4,6 +4,8 @@ from Cython.Build import cythonize
 extensions = [
     Extension('bundler.extensions.FSM', ['./bundler/extensions/FSM.pyx']),
     Extension('bundler.extensions.first', ['./bundler/extensions/first.pyx']),
+    Extension('bundler.extensions.tree', ['./bundler/extensions/tree.pyx']),
+    Extension('bundler.extensions.homology', ['./bundler/extensions/homology.pyx']),
     ]
 
 setup(
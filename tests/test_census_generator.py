@@ -0,0 +1,60 @@
+''' Checks of the stages of CensusGenerator that run without growing a census. '''
+
+import time
+
+import pandas as pd
+import pytest
+
+import generate
+from bundler import storage
+from bundler.census_generator import CensusGenerator, Options, determine_properties_map
+from bundler.store import PropertiesStore
+
+WORDS = ['abC', 'aaaabc', 'aBc', 'abbC']
+
+class SlowStore(PropertiesStore):
+    ''' A PropertiesStore whose calls wait as if another worker held its lock. '''
+    def __init__(self, path, delay):
+        super().__init__(path)
+        self.delay = delay
+    
+    def get(self, surface, words):
+        time.sleep(self.delay)
+        return super().get(surface, words)
+    
+    def put(self, surface, items):
+        time.sleep(self.delay)
+        return super().put(surface, items)
+
+def census_generator(tmp_path, name='S_1_2p', **kwargs):
+    experiment = generate.EXPERIMENTS[name]
+    options = Options(
+        show_progress=False,
+        cache='',
+        word_parts=str(tmp_path / 'parts' / 'word_{}.npy'),
+        prefix_parts=str(tmp_path / 'parts' / 'prefixes_{}.csv'),
+        properties_parts=str(tmp_path / 'parts' / 'properties_{}.csv'),
+        thin_parts=str(tmp_path / 'parts' / 'thin_{}.bin'),
+        word=str(tmp_path / 'words.npy'),
+        new_word=str(tmp_path / 'new_words.npy'),
+        retry_word=str(tmp_path / 'retry_words.npy'),
+        unique_word=str(tmp_path / 'unique_words.npy'),
+        properties=str(tmp_path / 'properties'),
+        census=str(tmp_path / 'census.csv'),
+        report='',
+        **kwargs,
+        )
+    return CensusGenerator(experiment['surface'], experiment['generators'], experiment['automorphisms'], experiment['MCG_must_contain'], options=options)
+
+def test_slow_store_is_not_killed(tmp_path):
+    G = census_generator(tmp_path, kill_after=2.0)
+    timeout = 0.5  # So a word is killed after 1s, but each store call takes 1.5s.
+    G.properties_store = SlowStore(str(tmp_path / 'store.sqlite'), delay=1.5)
+    path = str(tmp_path / 'block.npy')
+    storage.save_words(path, WORDS, G.word_generator.letter_lookup)
+    
+    statistics = determine_properties_map(G, '0', path, 0, timeout)
+    assert statistics.get('load.killed', 0) == 0
+    table = pd.read_csv(G.options.properties_parts.format('0'), dtype={'word': str})
+    assert sorted(table.word) == sorted(WORDS)
+    assert set(G.properties_store.get(G.surface_name, WORDS)) == set(WORDS)
@@ -0,0 +1,66 @@
+''' Checks of CensusIndex lookups against the censuses it was built from. '''
+
+import os
+from types import SimpleNamespace
+
+import pandas as pd
+
+from bundler.census_index import CensusIndex
+
+def manifold(volume, homology, isom_sig):
+    ''' A stand in for a SnapPy manifold with the given invariants, that records whether its isom_sig was needed. '''
+    M = SimpleNamespace(asked=False)
+    def isometry_signature():
+        M.asked = True
+        return isom_sig
+    M.volume, M.homology, M.isometry_signature = lambda: volume, lambda: homology, isometry_signature
+    return M
+
+def build(tmp_path):
+    directory = tmp_path / 'censuses' / 'S_1_2'
+    directory.mkdir(parents=True)
+    (directory / 'S_1_2.txt').write_text('aB\t2.029883212819\tZ/5 + Z\nabC\t3.663862376709\tZ + Z\n')
+    (directory / 'matches.txt').write_text('m003\t2.029883212819\tZ/5 + Z\taB\nm004\t2.029883212819\tZ\n')
+    pd.DataFrame({
+        'word': ['abC', 'aaaabc', 'abbc', 'ab'],
+        'acceptable': [True, True, True, False],
+        'volume': [3.663862376708876, 3.663862376708877, 5.0, 3.663862376708876],
+        'homology': ['Z + Z', 'Z + Z', 'Z', 'Z + Z'],
+        'isom_sig': ['sigA', 'sigB', '', ''],
+        }).to_csv(tmp_path / 'census.csv', index=False)
+    
+    index = CensusIndex(str(tmp_path / 'index'))
+    assert index.add(str(directory / 'S_1_2.txt'))
+    assert index.add(str(directory / 'matches.txt'))
+    assert index.add(str(tmp_path / 'census.csv'), 'S_1_2p')
+    return index
+
+def test_lookup(tmp_path):
+    index = build(tmp_path)
+    found = index.by_volume(3.663862376709, 'Z + Z')
+    assert sorted(zip(found.surface, found.word)) == [('S_1_2', 'abC'), ('S_1_2p', 'aaaabc'), ('S_1_2p', 'abC')]  # Not ab, which is not acceptable.
+    assert list(index.by_volume(2.029883212819).word) == ['aB', 'aB']  # m004 has no word.
+    assert list(index.by_isom_sig('sigB').word) == ['aaaabc']
+    assert index.by_isom_sig('sigC').empty
+    
+    M = manifold(3.663862376709, 'Z + Z', 'sigB')
+    found = index.identify(M)
+    assert M.asked and sorted(zip(found.surface, found.word)) == [('S_1_2', 'abC'), ('S_1_2p', 'aaaabc')]
+    
+    M = manifold(5.0, 'Z', 'sigD')
+    assert list(index.identify(M).word) == ['abbc'] and not M.asked  # Nothing to tell apart, so the isom_sig is not needed.
+    assert index.identify(manifold(5.0, 'Z/2', 'sigD')).empty
+
+def test_update(tmp_path):
+    index = build(tmp_path)
+    assert not index.add(str(tmp_path / 'census.csv'), 'S_1_2p')  # Unchanged.
+    
+    census = tmp_path / 'censuses' / 'S_1_2' / 'S_1_2.txt'
+    census.write_text('aB\t2.029883212819\tZ/5 + Z\n')
+    os.utime(census, ns=(0, 0))
+    os.remove(tmp_path / 'census.csv')
+    reopened = CensusIndex(str(tmp_path / 'index'))
+    assert reopened.update() == 1
+    assert len(reopened.manifest) == 2
+    assert list(reopened.by_volume(3.663862376709).word) == []
+    assert list(reopened.by_volume(2.029883212819).word) == ['aB', 'aB']
@@ -0,0 +1,56 @@
+''' Checks of the compiled extensions against plain Python and sympy. '''
+
+import random
+
+import pytest
+import sympy
+
+from bundler.extensions import FSM, Homology, aho_corasick, word_accepting_FSM
+
+def random_matrices(rng, count, dim):
+    return [[[rng.randint(-2, 2) for _ in range(dim)] for _ in range(dim)] for _ in range(count)]
+
+def product(matrices, word):
+    A = sympy.eye(len(matrices[0]))
+    for letter in word:
+        A = sympy.Matrix(matrices[letter]) * A
+    return A
+
+@pytest.mark.parametrize('dim', [1, 2, 4, 5])
+def test_homology_matches_sympy(dim):
+    rng = random.Random(dim)
+    matrices = random_matrices(rng, 4, dim)
+    homology = Homology(matrices)
+    # Short words stay in int64 and long ones overflow it, so this covers both Bareiss and the exact fallback.
+    words = [tuple(rng.randrange(4) for _ in range(rng.randint(0, 40))) for _ in range(60)]
+    for word in words:
+        A = product(matrices, word)
+        assert homology.torsion(word) == abs((A - sympy.eye(dim)).det())
+        assert homology.characteristic_polynomial(word) == tuple(A.charpoly().all_coeffs())
+    
+    assert homology.torsions(sorted(words)) == [abs((product(matrices, word) - sympy.eye(dim)).det()) for word in sorted(words)]
+
+def unminimised_FSM(alphabet, words):
+    ''' The FSM that word_accepting_FSM builds, before it is minimised. '''
+    index = dict((letter, i) for i, letter in enumerate(alphabet))
+    machine, accepting = aho_corasick(len(alphabet), [[index[letter] for letter in word] for word in words])
+    yields = dict()
+    for state, word in accepting.items():
+        word = tuple(alphabet[letter] for letter in word)
+        yields[state] = set(word[j:] for j in range(len(word))).intersection(words)
+    return FSM(alphabet, machine, yields)
+
+@pytest.mark.parametrize('seed', range(5))
+def test_word_accepting_FSM_matches_unminimised(seed):
+    rng = random.Random(seed)
+    alphabet = list(range(6))  # Letters are indices, as in WordGenerator.
+    words = set(tuple(rng.choice(alphabet) for _ in range(rng.randint(1, 5))) for _ in range(40))
+    minimal, unminimised = word_accepting_FSM(alphabet, words), unminimised_FSM(alphabet, words)
+    assert len(minimal.machine) <= len(unminimised.machine)
+    
+    for _ in range(300):
+        word = tuple(rng.choice(alphabet) for _ in range(rng.randint(1, 12)))
+        expected = sorted((i, x) for i in range(1, len(word) + 1) for x in words if word[:i][-len(x):] == x)
+        assert sorted(minimal.hits(word)) == sorted(unminimised.hits(word)) == expected
+        assert minimal.hit(word) == unminimised.hit(word) == bool(expected)
+        assert minimal.distance(word) == unminimised.distance(word)
@@ -0,0 +1,60 @@
+''' Checks of the properties store against the behaviour it promises. '''
+
+import sqlite3
+import time
+
+from bundler.store import PropertiesStore, TABLE
+
+def properties(volume):
+    return {'hyperbolic': True, 'loadable': True, 'volume': volume, 'homology': 'Z'}
+
+def test_get_does_not_wait_for_a_writer(tmp_path):
+    path = str(tmp_path / 'store.sqlite')
+    store = PropertiesStore(path)
+    store.put('S_1_1', [('ab', properties(2.0))])
+    
+    writer = sqlite3.connect(path, isolation_level=None)
+    writer.execute('BEGIN IMMEDIATE')  # Hold the write lock, as another worker in the middle of a put would.
+    start = time.perf_counter()
+    assert store.get('S_1_1', ['ba', 'aab'])['ba']['volume'] == 2.0
+    assert time.perf_counter() - start < 1
+    assert store._used == {('S_1_1', 'ab')}  # Left for the next put.
+    writer.execute('COMMIT')
+    
+    before = store.connection.execute(f'SELECT last_used FROM {TABLE}').fetchone()[0]
+    store.put('S_1_1', [('aab', properties(3.0))])
+    assert store._used == set()
+    assert store.connection.execute(f'SELECT last_used FROM {TABLE} WHERE word = ?', ('ab',)).fetchone()[0] > before
+
+def test_put_and_get(tmp_path):
+    store = PropertiesStore(str(tmp_path / 'store.sqlite'))
+    store.put('S_1_1', [('ab', properties(2.0)), ('aab', properties(3.0))])
+    store.put('S_1_1', [('ba', {'isom_sig': 'sig'})])  # Another rotation of ab, filling in a field that was NULL.
+    store.put('S_1_2', [('ab', properties(4.0))])
+    
+    found = store.get('S_1_1', ['ba', 'aba', 'bb'])
+    assert set(found) == {'ba', 'aba'}
+    assert found['ba'] == dict(properties(2.0), tri_isosig=None, isom_sig='sig', num_sym=None, ab_sym=None)
+    assert found['aba']['volume'] == 3.0 and found['aba']['hyperbolic'] is True
+    assert store.get('S_1_2', ['ab'])['ab']['volume'] == 4.0
+
+def test_eviction_counts(tmp_path):
+    store = PropertiesStore(str(tmp_path / 'store.sqlite'), max_size=5)
+    size = lambda: store.connection.execute(f'SELECT size FROM {TABLE}_size').fetchone()[0]
+    count = lambda: store.connection.execute(f'SELECT COUNT(*) FROM {TABLE}').fetchone()[0]
+    
+    words = ['a' * length + 'b' for length in range(1, 8)]
+    store.put('S_1_1', [(word, properties(float(i))) for i, word in enumerate(words[:4])])
+    assert size() == count() == 4
+    time.sleep(0.01)
+    assert set(store.get('S_1_1', words[:2])) == set(words[:2])  # So words[2:4] are now the least recently used.
+    time.sleep(0.01)
+    store.put('S_1_1', [(word, properties(float(i))) for i, word in enumerate(words[4:])])
+    assert size() == count() == 5
+    assert set(store.get('S_1_1', words)) == set(words[:2] + words[4:])  # The 2 least recently used are evicted.
+    
+    store.put('S_1_1', [(words[0], {'isom_sig': 'sig'})])  # An update does not change the number of entries.
+    assert size() == count() == 5
+    
+    reopened = PropertiesStore(store.path, max_size=5)
+    assert reopened.connection.execute(f'SELECT size FROM {TABLE}_size').fetchone()[0] == 5